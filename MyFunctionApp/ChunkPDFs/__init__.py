@@ -1,59 +1,348 @@
+import gc
 import os
-import PyPDF2
 import logging
+import threading
 from azure.functions import InputStream, Out
-from azure.storage.blob import BlobServiceClient
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
+from common import chunking, clients, dedup, indexing, largepdf, manifest, search_backend, telemetry, workqueue
+
+_split_pool = None
+_split_pool_lock = threading.Lock()
+
+def split_pdf_into_chunks(input_pdf_stream, output_blob_name, output_container_client, n, only=None):
+    """
+    Writes each window of `n` pages as a PDF of its own. With `only`, a set of chunk
+    file names, just those chunks are written; all of them are still returned.
+    """
+    import PyPDF2  # Only PDF-mode chunking needs it
 
-def split_pdf_into_chunks(input_pdf_stream, output_blob_name, output_container_client, n):
     try:
         # Convert InputStream to BytesIO
         input_pdf_bytes = BytesIO(input_pdf_stream.read())
-        reader = PyPDF2.PdfReader(input_pdf_bytes)
-        num_pages = len(reader.pages)
-        chunks = []
-        overlap = n // 2
-
-        for start in range(0, num_pages, overlap):
-            end = min(start + n, num_pages)
-            if start >= num_pages:
-                break
-            chunk = {
-                'start_page': start,
-                'end_page': end
-            }
-            chunks.append(chunk)
+        with telemetry.span(telemetry.PDF_PARSE, blob=output_blob_name, bytes=len(input_pdf_bytes.getbuffer())) as span:
+            reader = PyPDF2.PdfReader(input_pdf_bytes)
+            num_pages = len(reader.pages)
+            span.set(pages=num_pages)
+        chunks = [
+            {'start_page': start, 'end_page': end}
+            for start, end in chunking.page_windows(num_pages, n)
+        ]
 
         for i, chunk in enumerate(chunks):
+            # Create a chunk file name without directories
+            chunk_blob_name = chunking.chunk_blob_name(output_blob_name, i + 1, chunk['start_page'] + 1, chunk['end_page'])
+            if only is not None and chunk_blob_name not in only:
+                continue
+
             output_pdf_writer = PyPDF2.PdfWriter()
             for j in range(chunk['start_page'], chunk['end_page']):
                 output_pdf_writer.add_page(reader.pages[j])
-
-            # Create a chunk file name without directories
-            chunk_blob_name = f"{os.path.basename(output_blob_name)}_chunk_{i + 1}_pages_{chunk['start_page'] + 1}_to_{chunk['end_page']}.pdf"
             output_blob_path = os.path.join("/tmp", chunk_blob_name)  # Ensure /tmp directory is used
             with open(output_blob_path, 'wb') as output_pdf:
                 output_pdf_writer.write(output_pdf)
 
-            with open(output_blob_path, 'rb') as data:
+            with open(output_blob_path, 'rb') as data, \
+                    telemetry.span(telemetry.BLOB_WRITE, blob=chunk_blob_name, bytes=os.path.getsize(output_blob_path)):
                 output_container_client.upload_blob(name=chunk_blob_name, data=data, overwrite=True)
             os.remove(output_blob_path)
             logging.info(f"Chunk {i + 1} saved as {chunk_blob_name}")
 
+        return [
+            {'chunk': i + 1, 'start_page': chunk['start_page'] + 1, 'end_page': chunk['end_page'],
+             'file_name': chunking.chunk_blob_name(output_blob_name, i + 1, chunk['start_page'] + 1, chunk['end_page'])}
+            for i, chunk in enumerate(chunks)
+        ]
+
     except Exception as e:
         logging.error(f"Error splitting PDF: {e}")
         raise
 
+def split_pdf_into_text_chunks(input_pdf_stream, output_blob_name, output_container_client, strategy="pages", **params):
+    """
+    Extracts the text of every page once and writes all chunks of the PDF as a single
+    JSONL artifact, instead of one re-serialized PDF per chunk.
+
+    Chunks are cut by the named strategy from common.chunking ('pages' windows or
+    'tokens' budgets). Each line carries the chunk number, 1-based page range, the name
+    the equivalent PDF chunk would have had, and the chunk's text, so EmbeddingSummaries
+    can index the chunks without parsing any PDF.
+    """
+    import fitz  # PyMuPDF, matching the text EmbeddingSummaries extracts from PDF chunks
+
+    try:
+        pdf_bytes = input_pdf_stream.read()
+        with telemetry.span(telemetry.PDF_PARSE, blob=output_blob_name, bytes=len(pdf_bytes)) as span:
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_document:
+                page_texts = [page.get_text() for page in pdf_document]
+            span.set(pages=len(page_texts))
+        return write_text_chunks(page_texts, output_blob_name, output_container_client, strategy, **params)
+
+    except Exception as e:
+        logging.error(f"Error extracting PDF text: {e}")
+        raise
+
+def write_text_chunks(page_texts, output_blob_name, output_container_client, strategy="pages", **params):
+    """
+    Cuts the page texts into chunks and uploads them as the PDF's JSONL text artifact.
+    """
+    chunks = []
+    for i, chunk in enumerate(chunking.chunk_pages(page_texts, strategy, **params)):
+        chunks.append({
+            'chunk': i + 1,
+            'start_page': chunk['start_page'],
+            'end_page': chunk['end_page'],
+            'file_name': chunking.chunk_blob_name(output_blob_name, i + 1, chunk['start_page'], chunk['end_page']),
+            'text': chunk['text']
+        })
+
+    artifact_name = chunking.text_artifact_name(output_blob_name)
+    artifact = chunking.dump_text_artifact(chunks)
+    with telemetry.span(telemetry.BLOB_WRITE, blob=artifact_name, bytes=len(artifact)):
+        output_container_client.upload_blob(name=artifact_name, data=artifact, overwrite=True)
+    logging.info(f"{len(chunks)} '{strategy}' chunks from {len(page_texts)} pages saved as {artifact_name}")
+    return chunks
+
+def get_split_pool(processes):
+    """
+    Process pool that serializes chunks of large PDFs, created once per worker.
+    """
+    global _split_pool
+    with _split_pool_lock:
+        if _split_pool is None:
+            _split_pool = ProcessPoolExecutor(max_workers=processes)
+        return _split_pool
+
+def serialize_windows(pdf_path, windows):
+    """
+    Writes each (start, end) page window of the PDF at `pdf_path` as a PDF of its own.
+    The reader is opened here and dropped on return, so the pages it parsed do not
+    accumulate across batches, and pool processes can call it with just the path.
+
+    Returns:
+        list: The bytes of each window's PDF, in order.
+    """
+    import PyPDF2
+
+    serialized = []
+    with open(pdf_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        for start, end in windows:
+            writer = PyPDF2.PdfWriter()
+            for j in range(start, end):
+                writer.add_page(reader.pages[j])
+            buffer = BytesIO()
+            writer.write(buffer)
+            serialized.append(buffer.getvalue())
+    # PyPDF2's objects reference their parents; without a collection here, the parsed
+    # pages of earlier batches would pile up until the cycle collector happens to run
+    del reader, writer
+    gc.collect()
+    return serialized
+
+def serialize_windows_in_pool(pdf_path, windows):
+    """
+    serialize_windows for a pool process, which also reports its peak RSS for the task.
+
+    Returns:
+        tuple: (bytes of each window's PDF, peak RSS in MB)
+    """
+    largepdf.reset_peak_rss()
+    serialized = serialize_windows(pdf_path, windows)
+    return serialized, largepdf.peak_rss_mb()
+
+def upload_chunk(output_container_client, chunk_blob_name, data):
+    with telemetry.span(telemetry.BLOB_WRITE, blob=chunk_blob_name, bytes=len(data)):
+        output_container_client.upload_blob(name=chunk_blob_name, data=data, overwrite=True)
+
+def split_large_pdf_into_chunks(pdf_path, output_blob_name, output_container_client, n, settings, only=None):
+    """
+    PDF-mode chunking for PDFs too large to parse in memory. The source is read from
+    `pdf_path`; page windows are serialized in batches sized against the RSS budget,
+    across the split pool when LARGE_PDF_PROCESSES is set, and each batch is uploaded
+    concurrently from memory before the next one is built. `only` limits the chunks
+    written as in split_pdf_into_chunks.
+
+    Returns:
+        list: The same chunk descriptions as split_pdf_into_chunks.
+    """
+    import PyPDF2
+
+    with telemetry.span(telemetry.PDF_PARSE, blob=output_blob_name, bytes=os.path.getsize(pdf_path), mode='large') as span:
+        with open(pdf_path, 'rb') as file:
+            num_pages = len(PyPDF2.PdfReader(file).pages)
+        windows = list(chunking.page_windows(num_pages, n))
+        chunks = [
+            {'chunk': i + 1, 'start_page': start + 1, 'end_page': end,
+             'file_name': chunking.chunk_blob_name(output_blob_name, i + 1, start + 1, end)}
+            for i, (start, end) in enumerate(windows)
+        ]
+        selected = [(chunk, window) for chunk, window in zip(chunks, windows) if only is None or chunk['file_name'] in only]
+
+        processes = settings['processes']
+        pool = get_split_pool(processes) if processes > 0 else None
+        budget_mb = settings['memory_mb']
+        batch_size = largepdf.windows_per_batch(os.path.getsize(pdf_path), num_pages, n, budget_mb)
+        batches = 0
+        pool_peak_mb = 0
+        with ThreadPoolExecutor(max_workers=max(1, settings['upload_concurrency'])) as uploader:
+            position = 0
+            while position < len(selected):
+                batch = [window for _, window in selected[position:position + batch_size]]
+                if pool is None:
+                    serialized = serialize_windows(pdf_path, batch)
+                else:
+                    # Contiguous slices, so each process parses neighbouring pages only
+                    step = -(-len(batch) // processes)
+                    futures = [pool.submit(serialize_windows_in_pool, pdf_path, batch[i:i + step]) for i in range(0, len(batch), step)]
+                    serialized = []
+                    for future in futures:
+                        window_pdfs, peak_mb = future.result()
+                        serialized.extend(window_pdfs)
+                        pool_peak_mb = max(pool_peak_mb, peak_mb)
+
+                uploads = [
+                    uploader.submit(upload_chunk, output_container_client, chunk['file_name'], data)
+                    for (chunk, _), data in zip(selected[position:position + len(batch)], serialized)
+                ]
+                del serialized
+                for upload in uploads:
+                    upload.result()
+                logging.info(f"Chunks {position + 1} to {position + len(batch)} of {len(selected)} saved")
+
+                position += len(batch)
+                batches += 1
+                # The estimate is per window on average; back off if a dense batch overshot the budget
+                if batch_size > 1 and largepdf.rss_mb() > budget_mb:
+                    batch_size = max(1, batch_size // 2)
+                    logging.warning(f"RSS above the {budget_mb:.0f} MB budget; reducing batches to {batch_size} windows")
+        span.set(pages=num_pages, batches=batches, peak_rss_mb=round(largepdf.peak_rss_mb()), pool_peak_rss_mb=round(pool_peak_mb) if pool else None)
+        if pool is not None:
+            logging.info(f"Split pool processes peaked at {pool_peak_mb:.0f} MB RSS")
+    return chunks
+
+def extract_large_page_texts(pdf_path, output_blob_name):
+    """
+    Page texts of the PDF at `pdf_path`, read by PyMuPDF from the file. The document
+    store is emptied as pages are read, so only the text accumulates.
+    """
+    import fitz  # PyMuPDF, matching the text EmbeddingSummaries extracts from PDF chunks
+
+    with telemetry.span(telemetry.PDF_PARSE, blob=output_blob_name, bytes=os.path.getsize(pdf_path), mode='large') as span:
+        page_texts = []
+        with fitz.open(pdf_path) as pdf_document:
+            for page in pdf_document:
+                page_texts.append(page.get_text())
+                if len(page_texts) % 50 == 0:
+                    fitz.TOOLS.store_shrink(100)
+        span.set(pages=len(page_texts), peak_rss_mb=round(largepdf.peak_rss_mb()))
+    return page_texts
+
+def remove_orphans(previous_manifest, chunks, output_container_client):
+    """
+    Deletes search documents and intermediate blobs of chunks that an earlier version of
+    the PDF produced but the current one no longer does.
+    """
+    orphans = manifest.orphaned_chunks(previous_manifest, chunks)
+    if not orphans:
+        return
+
+    deleted = manifest.delete_documents(search_backend.get_search_backend(), orphans.keys())
+    logging.info(f"Deleted {deleted} orphaned chunks from the search index")
+    signature_index = dedup.get_signature_index() if dedup.dedup_settings()[0] != "off" else None
+    if signature_index is not None:
+        signature_index.remove(orphans.keys())
+
+    # Text-mode chunk names are virtual; only PDF-mode chunks exist as blobs
+    if previous_manifest.get('settings', {}).get('chunking', {}).get('output_mode') != 'pdf':
+        return
+    for file_name in set(orphans.values()):
+        try:
+            output_container_client.delete_blob(file_name)
+        except Exception as e:
+            logging.info(f"Orphaned chunk blob {file_name} not deleted: {e}")
+
+def enqueue_chunks(work_queue, chunks, output_blob_name, output_mode):
+    """
+    Sends a work item per chunk to the chunk queue. Items of text-mode chunks point at
+    the PDF's text artifact and name their chunk within it.
+    """
+    artifact_name = chunking.text_artifact_name(output_blob_name)
+    for chunk in chunks:
+        blob_name = artifact_name if output_mode == 'text' else chunk['file_name']
+        work_queue.send({'blob': f"intermediate/{blob_name}", 'chunk': chunk['chunk']})
+    logging.info(f"{len(chunks)} chunk work items of {output_blob_name} queued")
+
 def main(inputBlob: InputStream, outputBlob: Out[bytes]):
     try:
         logging.info(f"Processing blob\nName: {inputBlob.name}\nBlob Size: {inputBlob.length} bytes")
 
-        connect_str = os.getenv('SECONDARY_STORAGE_ACCOUNT_CONNECTION_STRING')
-        blob_service_client = BlobServiceClient.from_connection_string(connect_str)
+        blob_service_client = clients.get_blob_service_client()
         output_container_client = blob_service_client.get_container_client("intermediate")
 
-        split_pdf_into_chunks(inputBlob, inputBlob.name, output_container_client, 10)
-        logging.info(f"Processing completed for blob {inputBlob.name}")
+        # CHUNK_OUTPUT_MODE=text hands chunks to EmbeddingSummaries as extracted text.
+        # Token-budgeted chunks cut inside pages, so they are only available as text.
+        strategy, params = chunking.chunk_strategy_from_env()
+        output_mode = 'text' if strategy != 'pages' or os.getenv('CHUNK_OUTPUT_MODE', 'pdf').lower() == 'text' else 'pdf'
+
+        # PDFs above LARGE_PDF_THRESHOLD_MB are copied to a temporary file and split from
+        # there, in batches sized against LARGE_PDF_MEMORY_MB
+        large_settings = largepdf.large_pdf_settings()
+        large = largepdf.is_large(inputBlob.length or 0, large_settings)
+        pdf_path = None
+        if large:
+            largepdf.reset_peak_rss()
+            with telemetry.span(telemetry.BLOB_READ, blob=inputBlob.name, mode='large') as span:
+                pdf_path, size, source_hash = largepdf.spool_to_file(inputBlob, int(large_settings['range_mb'] * 1024 * 1024))
+                span.set(bytes=size)
+        else:
+            with telemetry.span(telemetry.BLOB_READ, blob=inputBlob.name) as span:
+                pdf_bytes = inputBlob.read()
+                span.set(bytes=len(pdf_bytes))
+            source_hash = manifest.content_hash(pdf_bytes)
+
+        try:
+            # Skip PDFs whose content and ingestion settings match what was last ingested
+            source_name = os.path.basename(inputBlob.name)
+            settings = manifest.ingestion_settings(strategy, params, output_mode)
+            manifest_store = manifest.get_manifest_store(blob_service_client)
+            previous_manifest = manifest_store.get(source_name)
+            if manifest.is_unchanged(previous_manifest, source_hash, settings):
+                logging.info(f"Skipping {inputBlob.name}: unchanged since {previous_manifest.get('updated')}")
+                return
+            # Same PDF and settings, but some chunks never made it into the index: only
+            # those are emitted again (text mode rewrites its one artifact)
+            retry = None
+            if manifest.is_same_source(previous_manifest, source_hash, settings):
+                retry = set(manifest.unindexed_chunks(previous_manifest).values())
+                logging.info(f"{inputBlob.name} is unchanged; re-emitting {len(retry)} chunks that were not indexed")
+
+            if output_mode == 'text' and large:
+                chunks = write_text_chunks(extract_large_page_texts(pdf_path, inputBlob.name), inputBlob.name, output_container_client, strategy, **params)
+            elif output_mode == 'text':
+                chunks = split_pdf_into_text_chunks(BytesIO(pdf_bytes), inputBlob.name, output_container_client, strategy, **params)
+            elif large:
+                chunks = split_large_pdf_into_chunks(pdf_path, inputBlob.name, output_container_client, params['pages_per_chunk'], large_settings, retry)
+            else:
+                chunks = split_pdf_into_chunks(BytesIO(pdf_bytes), inputBlob.name, output_container_client, params['pages_per_chunk'], retry)
+
+            emitted = {
+                indexing.document_key(source_name, chunking.file_name_chunk(chunk['chunk'], chunk['start_page'], chunk['end_page'])): chunk['file_name']
+                for chunk in chunks
+            }
+            remove_orphans(previous_manifest, emitted, output_container_client)
+            # Queued before the manifest is updated, so a failure here reprocesses the PDF on retry
+            if workqueue.handoff_mode() == 'queue':
+                enqueue_chunks(workqueue.get_work_queue(), [chunk for chunk in chunks if retry is None or chunk['file_name'] in retry], inputBlob.name, output_mode)
+            manifest_store.update(source_name, lambda current: manifest.build_manifest(source_name, source_hash, settings, emitted, previous=current))
+            logging.info(f"Processing completed for blob {inputBlob.name}")
+        finally:
+            if pdf_path is not None:
+                os.remove(pdf_path)
+                logging.info(
+                    f"Large PDF mode for {inputBlob.name}: peak RSS {largepdf.peak_rss_mb():.0f} MB "
+                    f"(budget {large_settings['memory_mb']:.0f} MB)"
+                )
 
     except Exception as e:
         logging.error(f"Error in main function: {e}")
@@ -4,26 +4,86 @@ import json
 import requests
 from azure.functions import HttpRequest, HttpResponse
 
-def create_index():
+API_VERSION = "2024-05-01-preview"
+
+def build_index_schema(profile="full", compression="scalar", dimensions=None, name=None):
+    """
+    Loads index.json and applies the requested storage profile.
+
+    - "full": the schema as checked in, full-precision float32 vectors returned with documents.
+    - "compact": vectors are quantized ("scalar" int8 or "binary") with rescoring against
+      the original vectors, and are neither stored for retrieval nor returned.
+
+    `dimensions` overrides the vector size, for embeddings requested with EMBEDDING_DIMENSIONS.
+    """
+    index_schema_path = os.path.join(os.path.dirname(__file__), 'index.json')
+    with open(index_schema_path) as file:
+        body = json.load(file)
+
+    if name:
+        body["name"] = name
+
+    vector_field = next(field for field in body["fields"] if field["name"] == "vector")
+    if dimensions:
+        vector_field["dimensions"] = int(dimensions)
+
+    if profile == "compact":
+        if compression not in ("scalar", "binary"):
+            raise ValueError(f"Unknown compression '{compression}'; expected 'scalar' or 'binary'")
+        compression_config = {
+            "name": f"vector-{compression}-compression",
+            "kind": f"{compression}Quantization",
+            # Candidates are over-fetched from the quantized index and re-ranked with the
+            # full-precision vectors, which keeps recall close to the uncompressed index
+            "rerankWithOriginalVectors": True,
+            "defaultOversampling": 10 if compression == "scalar" else 20
+        }
+        if compression == "scalar":
+            compression_config["scalarQuantizationParameters"] = {"quantizedDataType": "int8"}
+
+        vector_search = body["vectorSearch"]
+        vector_search["compressions"] = [compression_config]
+        vector_profile = next(p for p in vector_search["profiles"] if p["name"] == vector_field["vectorSearchProfile"])
+        vector_profile["compression"] = compression_config["name"]
+
+        # Searchable only: no retrievable copy of the vectors is kept or sent back
+        vector_field["retrievable"] = False
+        vector_field["stored"] = False
+    elif profile != "full":
+        raise ValueError(f"Unknown index profile '{profile}'; expected 'full' or 'compact'")
+
+    return body
+
+def create_index(profile=None, compression=None, dimensions=None, name=None):
     search_endpoint = os.getenv('SEARCH_SERVICE_ENDPOINT')
     search_key = os.getenv('SEARCH_SERVICE_ADMIN_KEY')
 
-    base_url = f"{search_endpoint}/indexes?api-version=2024-05-01-preview"
+    base_url = f"{search_endpoint}/indexes?api-version={os.getenv('SEARCH_API_VERSION', API_VERSION)}"
     headers = {
         "Content-Type": "application/json",
         "api-key": search_key
     }
 
-    index_schema_path = os.path.join(os.path.dirname(__file__), 'index.json')
-    with open(index_schema_path) as file:
-        body = json.load(file)
+    body = build_index_schema(
+        profile or os.getenv('INDEX_PROFILE', 'full'),
+        compression or os.getenv('VECTOR_COMPRESSION', 'scalar'),
+        dimensions or os.getenv('EMBEDDING_DIMENSIONS'),
+        name
+    )
 
     response = requests.post(url=base_url, headers=headers, json=body)
     return response.status_code, response.json()
 
 def main(req: HttpRequest) -> HttpResponse:
     try:
-        status_code, response_json = create_index()
+        # Optional JSON body: {"profile": "compact", "compression": "binary", "dimensions": 512, "name": "..."}
+        try:
+            options = req.get_json() or {}
+        except ValueError:
+            options = {}
+        status_code, response_json = create_index(
+            options.get("profile"), options.get("compression"), options.get("dimensions"), options.get("name")
+        )
         if status_code == 201 or status_code == 204:
             return HttpResponse("Index created successfully.", status_code=200)
         else:
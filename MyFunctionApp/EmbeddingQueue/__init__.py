@@ -0,0 +1,96 @@
+import logging
+import azure.functions as func
+import EmbeddingSummaries
+from common import chunking, clients, indexing, telemetry, workqueue
+
+def load_chunks(items):
+    """
+    Reads the chunks named by {"blob", "chunk"} work items. Each blob is downloaded once
+    per batch, however many chunks of a text artifact point at it.
+
+    Returns:
+        list: The item's (file_name, file_name_chunk, text) chunks, or None if its blob
+        could not be read, per item.
+    """
+    blobs = {}
+    loaded = []
+    for item in items:
+        blob_name = item["blob"]
+        if blob_name not in blobs:
+            container_name, _, name = blob_name.partition("/")
+            try:
+                with telemetry.span(telemetry.BLOB_READ, blob=blob_name) as span:
+                    content = clients.get_container_client(container_name).download_blob(name).readall()
+                    span.set(bytes=len(content))
+                blobs[blob_name] = EmbeddingSummaries.read_chunks(content, blob_name)
+            except Exception as e:
+                logging.error(f"Could not read {blob_name}: {e}")
+                blobs[blob_name] = None
+        chunks = blobs[blob_name]
+        if chunks is not None and item.get("chunk") is not None and len(chunks) > 1:
+            chunks = [chunk for chunk in chunks if (chunking.parse_chunk_name(chunk[0]) or (None,))[0] == item["chunk"]]
+        loaded.append(chunks)
+    return loaded
+
+def process_batch(items):
+    """
+    Embeds and indexes the chunks of a batch of work items together. If the batch fails
+    as a whole, each item is retried on its own, so one bad chunk only fails its own item.
+
+    Returns:
+        list: Whether each item succeeded.
+    """
+    settings = EmbeddingSummaries.aoai_settings()
+    loaded = load_chunks(items)
+    keys = [
+        {indexing.document_key(indexing.source_file_name(file_name), file_name_chunk) for file_name, file_name_chunk, _ in chunks}
+        if chunks is not None else None
+        for chunks in loaded
+    ]
+    readable = [chunks for chunks in loaded if chunks]
+    label = f"a batch of {len(items)} work items"
+    try:
+        failed_keys = EmbeddingSummaries.index_chunks([chunk for chunks in readable for chunk in chunks], label, settings) if readable else set()
+        return [item_keys is not None and not (item_keys & failed_keys) for item_keys in keys]
+    except Exception as e:
+        if len(readable) <= 1:
+            logging.error(f"Error processing {label}: {e}")
+            return [False for _ in items]
+        logging.warning(f"Error processing {label}, retrying its items one by one: {e}")
+
+    results = []
+    for item, chunks, item_keys in zip(items, loaded, keys):
+        if chunks is None:
+            results.append(False)
+            continue
+        try:
+            failed_keys = EmbeddingSummaries.index_chunks(chunks, item["blob"], settings) if chunks else set()
+            results.append(not (item_keys & failed_keys))
+        except Exception as e:
+            logging.error(f"Error processing work item {item}: {e}")
+            results.append(False)
+    return results
+
+def main(msg: func.QueueMessage):
+    """
+    Triggered by one chunk work item; receives up to EMBEDDING_BATCH_SIZE - 1 more from
+    the queue and processes them as one batch. The runtime retries and poisons the
+    triggering message, so this raises only if that one failed; the others are settled
+    here with the same retry and poison rules.
+    """
+    settings = workqueue.queue_settings()
+    work_queue = workqueue.get_work_queue()
+    messages = work_queue.receive(settings["batch_size"] - 1, settings["visibility_timeout"])
+    items = [msg.get_json()] + [message.body for message in messages]
+    logging.info(f"Processing {len(items)} chunk work items")
+
+    try:
+        results = process_batch(items)
+    except Exception as e:
+        logging.error(f"Error in main function: {e}")
+        results = [False for _ in items]
+    for message, succeeded in zip(messages, results[1:]):
+        workqueue.settle(work_queue, message, succeeded, settings["max_dequeue_count"])
+    logging.info(f"{sum(results)} of {len(items)} chunk work items processed")
+    if not results[0]:
+        raise RuntimeError(f"Work item {items[0]} failed")
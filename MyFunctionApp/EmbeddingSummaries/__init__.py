@@ -1,70 +1,236 @@
 import logging
 import os
-import fitz  # PyMuPDF
-import uuid
 from azure.functions import InputStream
-from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
-from azure.storage.blob import BlobServiceClient
-from common import embedding, summary
+from common import bibliography, cache as aoai_cache, chunking, dedup, extractive, indexing, manifest, search_backend, telemetry, workqueue
 
-def generate_embeddings_and_summaries(blob_content, blob_name):
-    search_endpoint = os.getenv('SEARCH_SERVICE_ENDPOINT')
-    search_key = os.getenv('SEARCH_SERVICE_ADMIN_KEY')
-    index_name = os.getenv('SEARCH_INDEX_NAME')
-    aoai_url = os.getenv('AOAI_URL')
-    aoai_key = os.getenv('AOAI_KEY')
-    embedding_model = os.getenv('EMBEDDING_MODEL')
-    aoai_version_embedding = os.getenv('AOAI_VERSION_EMBEDDING')
-    aoai_version_completion = os.getenv('AOAI_VERSION_COMPLETION')
-    model = os.getenv('MODEL')
-
-    if not all([search_endpoint, search_key, index_name, aoai_url, aoai_key, embedding_model, aoai_version_embedding, aoai_version_completion, model]):
-        raise ValueError("One or more required environment variables are missing.")
+SUMMARY_SYSTEM_MESSAGE = "You are an advanced AI assistant specialized in producing detailed, comprehensive, and well-structured summaries of academic or informational texts. Your summaries should emulate the style and depth of scholarly abstracts"
 
-    search_client = SearchClient(endpoint=search_endpoint, index_name=index_name, credential=AzureKeyCredential(search_key))
+def read_chunks(blob_content, blob_name):
+    """
+    Returns the chunks held by an intermediate blob as (file_name, file_name_chunk, text) tuples.
 
-    try:
-        logging.info(f"Processing blob: {blob_name}")
+    A `.chunks.jsonl` text artifact from ChunkPDFs yields all of its windows without any PDF
+    parsing; a PDF chunk yields a single entry with its text extracted by PyMuPDF.
+    """
+    if blob_name.endswith(".jsonl"):
+        folder = os.path.dirname(blob_name)
+        return [
+            (f"{folder}/{chunk['file_name']}" if folder else chunk['file_name'],
+             chunking.file_name_chunk(chunk['chunk'], chunk['start_page'], chunk['end_page']),
+             chunk['text'])
+            for chunk in chunking.load_text_artifact(blob_content)
+        ]
+
+    import fitz  # PyMuPDF, only needed for PDF chunks
 
-        data = ""
-        pdf_document = fitz.open(stream=blob_content, filetype="pdf")
-        for page in pdf_document:
-            data += page.get_text()
+    with fitz.open(stream=blob_content, filetype="pdf") as pdf_document:
+        data = "".join(page.get_text() for page in pdf_document)
 
+    parsed = chunking.parse_chunk_name(blob_name)
+    if parsed:
+        file_name_chunk = chunking.file_name_chunk(*parsed)
+    else:
         parts = blob_name.split('_')
-        chunk_number = parts[1]
-        page_range = parts[3].split('.')[0]
-        file_name_chunk = f"{chunk_number}_{page_range}"
+        file_name_chunk = f"{parts[1]}_{parts[3].split('.')[0]}"
+    return [(blob_name, file_name_chunk, data)]
 
-        embedding_vec = embedding.get_new_embedding(data, aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+def canonical_documents(backend, duplicates, batch_keys):
+    """
+    Fetches the vector and summary of the indexed canonical chunk of each near-duplicate
+    whose canonical chunk is not part of this batch. Duplicates whose canonical chunk is
+    no longer indexed are removed from `duplicates` and processed as unique chunks.
+    """
+    documents = {}
+    for key, (canonical_id, _) in list(duplicates.items()):
+        if canonical_id in batch_keys:
+            continue
+        document = backend.get(canonical_id, select=["vector", "summary"])
+        if document is None or document.get("summary") is None:
+            del duplicates[key]
+            continue
+        documents[key] = document
+    return documents
 
-        with open('common/summary-prompt.txt', 'r') as file:
-            prompt_template = file.read()
+def aoai_settings():
+    settings = {
+        "aoai_url": os.getenv('AOAI_URL'),
+        "aoai_key": os.getenv('AOAI_KEY'),
+        "embedding_model": os.getenv('EMBEDDING_MODEL'),
+        "aoai_version_embedding": os.getenv('AOAI_VERSION_EMBEDDING'),
+        "aoai_version_completion": os.getenv('AOAI_VERSION_COMPLETION'),
+        "model": os.getenv('MODEL'),
+    }
+    if not all(settings.values()):
+        raise ValueError("One or more required environment variables are missing.")
+    return settings
 
-        prompt = prompt_template + data
-        summary_str = summary.generate_prompt(prompt, "You are an advanced AI assistant specialized in producing detailed, comprehensive, and well-structured summaries of academic or informational texts. Your summaries should emulate the style and depth of scholarly abstracts", aoai_key, aoai_url, model, aoai_version_completion)
+def generate_embeddings_and_summaries(blob_content, blob_name):
+    settings = aoai_settings()
 
-        document = {
-            "id": str(uuid.uuid4()),  # Generate a unique ID for each document
-            "file_name": blob_name,
-            "file_name_chunk": file_name_chunk,
-            "content_text": data,
-            "summary": summary_str,
-            "vector": embedding_vec['data'][0]['embedding']
-        }
+    try:
+        logging.info(f"Processing blob: {blob_name}")
 
-        result = search_client.upload_documents(documents=[document])
-        logging.info(f"Uploaded document {blob_name} to the search index with result: {result}")
-        for res in result:
-            logging.info(f"Indexing result: {res}")
+        with telemetry.span(telemetry.PDF_PARSE, blob=blob_name, bytes=len(blob_content)) as span:
+            chunks = read_chunks(blob_content, blob_name)
+            span.set(chunks=len(chunks))
+        if not chunks:
+            return
+        index_chunks(chunks, blob_name, settings)
 
     except Exception as e:
         logging.error(f"Error processing blob {blob_name}: {e}")
 
+def index_chunks(chunks, label, settings):
+    """
+    Embeds, summarizes and indexes (file_name, file_name_chunk, text) chunks, which may
+    come from several source PDFs. Embeddings are requested and documents uploaded for
+    the whole batch at once; the manifest and bibliography are handled per source PDF.
+
+    Returns:
+        set: Keys of the chunks the search index rejected.
+    """
+    aoai_url = settings["aoai_url"]
+    aoai_key = settings["aoai_key"]
+    embedding_model = settings["embedding_model"]
+    aoai_version_embedding = settings["aoai_version_embedding"]
+    aoai_version_completion = settings["aoai_version_completion"]
+    model = settings["model"]
+    backend = search_backend.get_search_backend()
+
+    # Skip chunks the manifest says were already indexed with the same text and models,
+    # unless they were indexed with a fallback summary
+    manifest_store = manifest.get_manifest_store()
+    models = manifest.model_settings()
+    indexed = {}
+    pending = []
+    for file_name, file_name_chunk, data in chunks:
+        source_name = indexing.source_file_name(file_name)
+        if source_name not in indexed:
+            source_manifest = manifest_store.get(source_name) or {}
+            indexed[source_name] = (source_manifest.get("indexed", {}), set(source_manifest.get("fallback", [])))
+        key = indexing.document_key(source_name, file_name_chunk)
+        fingerprint = manifest.chunk_fingerprint(data, models)
+        source_indexed, source_fallback = indexed[source_name]
+        if source_indexed.get(key) != fingerprint or key in source_fallback:
+            pending.append((key, fingerprint, file_name, file_name_chunk, data))
+    logging.info(f"{len(chunks) - len(pending)} of {len(chunks)} chunks in {label} are unchanged and skipped")
+    if not pending:
+        return set()
+
+    # Near-duplicates of indexed chunks (reissued reports, translations with an English
+    # appendix) reuse the vector and summary of their canonical chunk
+    mode, threshold = dedup.dedup_settings()
+    signature_index = dedup.get_signature_index() if mode != "off" else None
+    signatures, duplicates, reused = {}, {}, {}
+    if mode != "off":
+        signatures, duplicates = dedup.match_chunks(signature_index, [(chunk[0], chunk[4]) for chunk in pending], threshold)
+        if mode == "reuse":
+            reused = canonical_documents(backend, duplicates, {chunk[0] for chunk in pending})
+        logging.info(f"{len(duplicates)} of {len(pending)} chunks in {label} are near-duplicates of other chunks")
+
+    # Unchanged chunks (overlapping windows, re-uploaded PDFs) are served from the cache
+    cache = aoai_cache.get_cache()
+    to_embed = [
+        chunk for chunk in pending
+        if chunk[0] not in duplicates or (chunk[0] in reused and reused[chunk[0]].get("vector") is None)
+    ]
+    embedding_vecs = dict(zip(
+        [chunk[0] for chunk in to_embed],
+        aoai_cache.cached_embeddings(cache, [chunk[4] for chunk in to_embed], aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+    ))
+
+    with open('common/summary-prompt.txt', 'r') as file:
+        prompt_template = file.read()
+
+    # The bibliography of each source PDF is extracted once, from its first chunk, and
+    # stored on the chunks indexed with it so knowledge scans only need an index read
+    bibliography_fields = {}
+    for file_name, _, data in chunks:
+        if (chunking.parse_chunk_name(file_name) or (None,))[0] == 1:
+            bibliography_entry = bibliography.cached_bibliography(cache, data, aoai_key, aoai_url, model, aoai_version_completion)
+            bibliography_fields[indexing.source_file_name(file_name)] = bibliography.to_index_fields(bibliography_entry)
+
+    summary_settings = extractive.summary_settings()
+    summaries = {}
+    canonical_ids = {}
+    # Chunks summarized locally while the model was throttled are recorded as pending
+    # in the manifest, so the next ingestion of their PDF asks the model again
+    fallback_keys = set()
+    with indexing.BufferedIndexWriter(backend) as writer:
+        for key, _, file_name, file_name_chunk, data in pending:
+            canonical_id = duplicates.get(key, (key,))[0]
+            if canonical_id != key and mode == "skip":
+                canonical_ids[key] = canonical_id
+                continue
+            canonical = reused.get(key)
+            if canonical is None and canonical_id in summaries:
+                canonical = {"vector": embedding_vecs.get(canonical_id), "summary": summaries[canonical_id]}
+            if canonical is None:
+                # Not a duplicate, or its canonical chunk comes later in this batch
+                canonical_id = key
+                embedding_vec = embedding_vecs.get(key) or aoai_cache.cached_embedding(cache, data, aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+                summary_str, summary_source = aoai_cache.tiered_summary(
+                    cache, prompt_template, data, SUMMARY_SYSTEM_MESSAGE, aoai_key, aoai_url, model, aoai_version_completion, summary_settings
+                )
+                if summary_source == extractive.FALLBACK:
+                    fallback_keys.add(key)
+            else:
+                # A canonical chunk in a compact index has no retrievable vector; that one is embedded
+                embedding_vec = embedding_vecs.get(key) or canonical["vector"]
+                summary_str = canonical["summary"]
+                if canonical_id in fallback_keys:
+                    fallback_keys.add(key)
+            summaries[key] = summary_str
+            canonical_ids[key] = canonical_id
+
+            source_name = indexing.source_file_name(file_name)
+            document = {
+                # Same chunk, same key: retried triggers merge instead of duplicating
+                "id": key,
+                "file_name": file_name,
+                "file_name_chunk": file_name_chunk,
+                "content_text": data,
+                "summary": summary_str,
+                "vector": embedding_vec,
+                "source_file": source_name,
+                **bibliography_fields.get(source_name, {})
+            }
+            if mode != "off":
+                document["canonical_id"] = canonical_id
+            writer.add(document)
+
+    logging.info(f"Uploaded {writer.stats['documents']} documents from {label} to the search index: {writer.stats}")
+    failed_keys = {key for key, _ in writer.failed}
+    for source_name in indexed:
+        succeeded = [
+            (key, fingerprint) for key, fingerprint, file_name, *_ in pending
+            if key not in failed_keys and indexing.source_file_name(file_name) == source_name
+        ]
+        fingerprints = {key: fingerprint for key, fingerprint in succeeded if key not in fallback_keys}
+        fallback = [key for key, _ in succeeded if key in fallback_keys]
+        if fingerprints or fallback:
+            manifest.record_indexed(manifest_store, source_name, fingerprints, fallback)
+    if signature_index is not None:
+        for key, signature in signatures.items():
+            if key not in failed_keys and key in canonical_ids:
+                signature_index.add(key, signature, canonical_ids[key])
+        logging.info(f"{sum(1 for key, canonical_id in canonical_ids.items() if key != canonical_id)} near-duplicate chunks of {label} linked to a canonical chunk ({mode})")
+    if fallback_keys:
+        logging.warning(f"{len(fallback_keys)} chunks of {label} were summarized extractively while Azure OpenAI was throttled")
+    logging.info(f"Azure OpenAI cache stats: {cache.report()}")
+    return failed_keys
+
 def main(myblob: InputStream):
+    if workqueue.handoff_mode() == "queue":
+        # EmbeddingQueue processes the chunk through its work item; disable this
+        # function (AzureWebJobs.EmbeddingSummaries.Disabled) to save the invocations
+        logging.info(f"Skipping {myblob.name}: chunks are handed off through the chunk queue")
+        return
     try:
-        generate_embeddings_and_summaries(myblob.read(), myblob.name)
+        with telemetry.span(telemetry.BLOB_READ, blob=myblob.name) as span:
+            blob_content = myblob.read()
+            span.set(bytes=len(blob_content))
+        generate_embeddings_and_summaries(blob_content, myblob.name)
     except Exception as e:
         logging.error(f"Error in main function: {e}")
         raise
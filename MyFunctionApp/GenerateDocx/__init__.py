@@ -1,17 +1,18 @@
 import os
-import base64
 from io import BytesIO
 import uuid
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import azure.functions as func
-from docx import Document
-from docx.oxml import OxmlElement
-from docx.shared import Inches, RGBColor, Pt
-from docx.enum.section import WD_ORIENT
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.enum.section import WD_SECTION
 from datetime import datetime
+from common import clients, telemetry
+from . import template
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
 
 def fetch_scan_data_from_cosmos(scan_data):
     return scan_data
@@ -37,37 +38,29 @@ def remove_prefix(pdf_name):
         return pdf_name
 
 def generate_docx_from_knowledge_scan(scan_data):
+    """
+    Renders the knowledge scan into a copy of the prebuilt template, in memory.
 
-    base64_image = """ iVBORw0KGgoAAAANSUhEUgAAA/wAAAEECAYAAACV/z+mAAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAAEnQAABJ0Ad5mH3gAAP+lSURBVHhe7L0FYxzH1oa5/3xvbLFsJw4bJJmZLWa2xcw0mhEzjGaEfvc81VNSW7ZDN/mS3J0jH3d3MU13PVXV1f/PwsKC0prWtKY1rWlNa1rTmta0pjWtaU3r/5b+P62trUprWtOa1rSmNa1pTWta05rWtKY1rf9b6oB/ZmZGsVhMy8vLWllZOdXz12lNa1rTmta0pjWtaU3rmS5reWXJdNHpitMlZ479sumS9SeXlsyMfqXTFc0vrmhoMqrWgTE19gybjqip17QPHVVz/1hIuR41c3NrbgK3Zt43ruaBCbUMTKlpYFKNfei0qV33T6l1eFotg+Oq7xlUQ++Q3g1PqHNsRv1TcxqemdeY6eh0TMOTEQ1NTGtoakYjkahGZ+fNfkG947PqGJnSewuj0fw39g5bOsYt7AlTi8u0weJs6LVrp2bXM+bS1mBpbbB8NPRZ3vqG1Gx+W3tHnbagPZYn8mLhNvRY2Kbkv9n8cGzsHlaDaZMpfnHbZPl43z+iselZLfo+ujtSB2hQ3ihlHJQ1dRFoUE+c+7r7bzSI9/P6sdtf4wnax9zcvCKRWU1NTmliYsJ00ulk6nheJ83d9NS0MUxEs7NR45g5LS4uuHaG/h6Gwa3Xz9n/I9TV59l1uK6Duv81Tf0myeO5sH5RfTtasjAoV3Qx9VsmPKfeXUjNjLQtLi8oujCjydkRjUz12W+sS4PTHRqaMY10aNBp5zn15u2f6kxKpzmaG8KZ6UxpKlyzP9M2iwe1c3dMnTs77z4cRhD/wEeaivsLGoQdVh+fVwv/b9RT4J+entbq6qpOTk6UlrSkJS1pSUta0pKWtPx2of94YLqfOh6bnsnJhw+pPuYH9w9Z3T1RaU9UV4rblPmiVdmv3iv3bZvyStqVX96lS5U9ulTVo8toZbeuVHTrclm3coo7lPW6XdlvOu28RzmlfcqtGFR22ZAuFA/rwttJZRRPKLNkWLmVA8oq69DF4mZdrulWQceUHvXNq2R4VXVj63o3sa62sWW1jsTUPDKrpvGYmqYW1TC9quqxNb3tX9TjrohuvRvR15XtynzVrOy3HS7OzNJBXbA4/vPW4n09aHb9yn7RreznHZaXTmW+7Tb7TmWUvlN2aYsul7zT95b2H4q79Z2l+5u3nbr09r3lodX8NinrRaP5a1H2S7t+3qqLz1p08XmLcp43K/eFxfuiSRcfV+lmxXsNxNZ0YGV6Xj41QSh36uMwdfy8q79DyMLR0bF2d/YMtleNRyIaGhhRX9+A+vsHNTAwrEG7HhgY0kD/kDPr7zN1dkMaGRkz8J824I9pbg7YXzaeWdPm5qZ2dna0t7eng4MDi+PItb8Pnymzf7uQoy/px1ep398fFdeM7D+rLx0eWVAY/Loc2v1g42BBMxt96onVqGXqueon7ql2qkh1kULVzhapava2qmfvOK2J3ja9pdpYkWmB05roTbO7bnrD3Nv1rPkzvzUzRaa3VTttase6yC0XZl3E/EVumt5Q3cx1O15XnflH693xpurNTb25rY8Uqd781s/cMbd3zC1puaUKi78yVpjSAlWltDrq1dJkWuvS9CXF3tJCev9G/WiGn5GY88D/v/jDSEta0pKWtKQlLWlJy58l9BWP7f8w8BsQpODC2Z4CfyD7Rx80El3XvdpeXXrdqm/Ku/VjzYB+rh3QtYYhXW8e1c3WcRW+C7QIteuC5jGzHzZ3w/qusl+XSnuUh5b3K8+gP7diRHmVY6Yjyi3rU5YB9TeVnbrbOaGXI4sqHl9R+cSqKuy8dmReLWPz6pxcVG9kWf3RVXXPruidXdcPz6lmaEG1o6uqGl1W6eiiXg3EVNg8rG9KO3XZ4swvH1RO2bByyoftfESXSgaU/6pLlw32r1rc39UO6WrdgL5v7Ne1pn4VNQ3pftOYHjZN2nFStxvHdLNxyPLTp59quvVdhYX7tlU5Du5blfemXVdKOvX12zZdegX41yvrYYWetvRpKX4YoPuJlW5qIMVwVkeUs7tKCf34Dx72D8380Oz/LOgnDJQYvXqzM/kSaJ8YPO7uxLW4uKzpqYjGRic0NHgG+4MG+0NDI+4I7AP47tyODvzRgZQ78zc0hN2A+e+38yGNj4+7Cc1oNKq5OWb/F90M/sbGhhsMiMfjSiaTbjDg+Pj4NJ3/loEBX9JByQf1f5L681cf3O8y0OA3aUfXJlKef4s496a0NQf8KOH4+g4JlyGjD/Z3bH+HHxKKn6xqOTmpifU29cxX6V3klZpmnhpoP1TN1F1VT99VzbQBfwq862cNwlGD/7pZg/+ZggDmDcYxb4jdMb1rwB5onamD/hmgH/gPBgBqDehrZ1CDX9N6M2uwMBoi5t/p3ZTec1o/a2H5gYfYLae1aNTCOFWuLZ5U2uo/UdIYpDNQ8vP3aRr405KWtKQlLWlJS1rS8l8K/UWAArBMgUWq509X8tgUXkDoaa7sHKimZ1LfvWrSpTdtutY4qtvvpnT3/ZTutc/oYWdEj7ujetIb09PeOT1De+b0qDOqe20R3e+IqqBlUlerB3Wpol85FQb3lf3KrR1UnmlOZa/yyjv0Y12/nvfHVDm5porxZVWMLaluelUt0TW1z60YeKxowHRkYVXjSxsaW9zS8NyWBqLb6pvdVfvUppomVlQxGFW1+a+d2dK9d5OW5g5dLjPAN9jPqxjR5UrT0gFdet2pb4u7db12WEXmrvDdhG69H7M0j+lJ25Rets/qdUdML0yftFs+2iZ0592I5XtMRU3D+qGiW1fevFfe6/fKf9uhSwb8lwz4c180Ke95nS49q1FFz6j2fH/dFS6zrQasVt6fAj+KCXUSaODizxAXuCnhefVmZ/I5ljg+PNHO9q5i0XkND486aB8cDGDeA/zw0GhgFzLn/CP1AwBu1p+BggEH/f39/WY/YDrolAEAlPORkRFNTk5qdnZW8/PzbkMzBgNY6cxAAAMA/yYJStz/BaB/Vh/8DsNqZtTHp9X0kVBnXk/lEz+/EEBKcBEMOxzZX1L72tH2yZKW9qc0vdWvkdX36p6vVGvkhZojj9Vk8F9n8F87abA+acA8ZToNnBepEYB2s/eAOzP4BaqPFhr031LTnAF77I6qzV2VAX2NwX6NwTxa6wD+nul9p/UpqPcDBfXmJgBjAB0tMpC3eJwWnFPMsE/pJ4Af1r8f9L2mgT8taUlLWtKSlrSkJS1/gtBnDIFFSuhK0r10k9F2vXf0Qf2zq3pY06NvXrfox5pB3TX4fdRlgN85q6fdMT03uH/Zt6DX/Qt607+otwNL7vi8K6anAHPfkh50zel684S+bRhVfu2QMiv7lF3TpxwLN6eyXZfK2/SgY1r1M9uqHV9T1dCCWmfW1bW4o56lLfWvbGhweV2DCysajC1pOLqisblNTSzsamJxT8PzOxpa2NHw6p4ax2Mq751S8/SGqsbWdLtpQl+X9btZ/rwKZvgHdcWuvy3t1bXKAd21dD3qjLiBi0edU3raNa2XlrfizpiKu+b1xtLO9ZPOabOf1JOOST0y+L9t0H+9xsIp63HAn/2mTVmv3yn3VYuuvGrQzbJ3ej85p6QfPaFwQ8DvSz5lG5wA/G6WP9D/a+BHwjxBcna399wyfD+jz3FkeMwBPkd/jrpZ/hTce+j/yN1Q4IYZ/kBZDRBAv1euvQL9w8PDDvxxi31fX5/GxsYc/DPzz4z/v0WCkvXlHq4Lr2d1766pC+/c6zn5BPbPyXnvX3ZpMVo4R9b+QP7g/wMD/z3tfdjR5tGKVg6mNb/fr+ndNg2t1qkzVqKWyWdqGH9oel8Nk/fVOHVPTTN31Dhz28E/6kDbILw+Giyfr2H5vMF/dZQl+f4VgbsB8MceqD722PSRQfoD1UYM/g3861Kz+XXmHnivmy20cC1MlvxHTTk6Ndg/VVYZnMF+cM5M/5nWRwz2T1cZ/P2aBv60pCUtaUlLWtKSlrT8SfIpAjjeRO2c+f/5nUNV9kzrRlm7fq7t1x2D/cfd8wHk98T0qnfO1KDYAL/YgB8t6Vt0+qbb3Bj0vxlY0fP+Jd01gL5h/q82jxvs9+tiZZcyKgz2a7p1o3lEL/vmVTm6qprhZb2f2tTQyr4BfNJAf0eDBv1Di5santvQSGxD47FtTcYM9qM7Go1tamzJ7JbXDELW1Lu4otbpOVUNzKh6ZEllo+v6sWZYeeUDyjHNLul1AwDXzOxe04SetEX0wtL5oiuqVz1RvemNqtTSXm6wX2Z5Lemx/HVjZ+5Mn3dN6Vn7pB6/n9S9lkldrxvV1+W9DvgzmfF/+07fvGzQy5ZBzawllIDxT4vaUP/EQN4MQlh3Jjj0leBszurmvxOfAB+uD/vL4ZPGRCKpudiCA/feHmCc2XfgO6UG/6ez94Nndn4230O/W8bv3XIeAn6g/jzkezN/3tvb6xTgZ5NAZvmZ4T88PPyEh/4J4kv286Ubtg3Xh1drFW7Qx85de7BTxHv5BfFOwpoK8aP25u0+EjNw0dl/fu0Br/ewEoWhJ4YADpTQvjaV+LCqnaN5rSVnNL87rMm1Dg3M16tjtkzvZ16pZfqZmqYeqmHqruqnDLanCw38bxpg847+NdVEr6l2vlDVc0WqiRUZ+AfwXwP4R+/Z8b7pg+BowF9rwM9gQK3Z1zrgD5bne+hv8ODv3vX3yisBrDKw+FMa7BuAfgra/xRNA39a0pKWtKQlLWlJS1r+O/G9/Y+6jVwAGMEphz277J/f1sPmIV2r7tVdA+PHPYt6ZgD8um9Bbw3Q3zrIn1exnZeiBv9lphX9i6ow6C82t2/7lvTKgP9x76JuG0j/9H5al+qHDPa7lFnWru8ahvRyaEUVY5uqGDDYn97W0PKBAX7c4t8ykDD4X9jS6LzB/VxcY3N7mphLaHI+oTED/uG5NY2urWp4Y1Gd81N6PzupVusr141OGXAsGyxsq7BlQper2BSwT1nFPfq2eli3W6YN3A3kO2N63TWnNwb9pL/c8lFu6a4w2C/DrDtm+ZjV217Tvlm97pnWq44pPW+fdoMFd1qn9VP9iC6V9Sj7bbvy3rTq6ot6NfRPKn4oHcBvlCnvVBvsU87M8R+ZmQcwJxQ6F86xM/kThQB9BF692ZnAEp4n2ECPjfVGRsbV1wuMD7lZeo68p+9B38O9V2/m7d0Sfr95n3+/f5AjUP/pMv4w/PsZf+xY2g/oM6vPUv5/Mvf4kvYl/HFKUyaunlPqzMJ14xXz3y4+JB9aAOpnL+54/a0hu9U+KXVJtT9m/q31upDZC+RQce19WNfG/pyW96YU3R7Q2No79S/WqG32jYH/Y9VN3jPwv636mWDGnw3yKiPXVTF7Q1XRAlXHClPv4N92mwJWGviiNbMG+lED/qjBvlfAP2rgHzVANvBvMPBvtDAbDP45P1Xe//9Imcn/dAn9P03TwJ+WtKQlLWlJS1rSkpb/TjwRfNRtpE9pKMDyc/vH1VL8WLVDCyqqH1RRy7ge9SzomUH7y97UTL6BfmlKy/rnVAYom1aYVhng1xjEl9ux2Py9MZB/Prii++b3ZmdU37dOKL+6373TX9A8rZLRHdVOxg0OdtRvsD+6fqCBhU0D/g0NxDY0Mr+r8YV9jc8fajS6r+HZuFvGP7K0raHVVfWszaptZVR1M11609dkaWtXS2RGjTPs8h/T27Fl/WTQn1nWq7zKAf3YOKEHHQb63Ysq6bb8mJYY9Jcxs+9m92Mq74ypxC3tj+ht94zeGui/7Z1WaW9Epd0Rve6Y1XML41F7TIUtU/q2elC5xR3uHf6bpa3qn1k4K2bKlffNUzO3/AUzp0FZnwoX3pPz+GeJD5AIvH4aCcvjA+iXtrd3NDExpd4UrLv39FmSn5qpZybfv7vvl+qHBwO8Owf5KdB3M/1u+f+IhcmmfX2nwM8xvKwfM5bzM6PP8v3z7+yTTljon8g/vqR9CX82haeWYVfnNZCzs18X3Poa9sDvQd+rT9vHYiaU6bG1TgancHBO3eITc/OBlSoWChoMXx1aPAd2Frz7v3O8rNX9iGZ3h+y33Ka+pXp1RMvVOv1aDRNPVD1+V1WThaqaMdiPGOwboNcYvAPxHKvtGuXaw/3ZeUhTkBxs6McrBP78MxqC6kB5bz+s5+3/Hk0Df1rSkpa0pCUtaUlLWv578Z34UwnwwAP/geno4p6eGugXNIzofve8Hpm+MHgv6V9WSa+BdO9coH3AvkGygX9F/4IqnS6qemBJVaYsiS8x2H8zvKqHBvx3euZ002D5as2wfqwZ04u+Nb3pX1fV6Ja6lw/Vv5ow6N/S8LrpyoaGF5ndZ2Z/X6OxQ43EDjS0kNDA0o76VtfUvjqj6miXXo3W6XFvue69L9aTtmrVjg+pemxKrwem1bicVEHHjLIr+vQNO+63zVp+FvS6a0GlPYsq710y2F9QGdAP7DvlPKriLg/8kyrunlB5z4zZRVRseXjdOadnFsad97P6oXZIl4rbdellk16/G9PCZiIoYv5zs/uGXqiDpC8t6T+nf5r4AInN66eRBDD3QYeHR8YaqxodHXez88zUe9g/XbbPDH4Y/E2dmbn1ZmF3Zxos6WeHftQDP6Dvl+3zzj679vON/u3tbbfaICykEQ7yAxT/NPEl7Uv4F1PoLMOuzlx707DtJ3LOIuyeNPg2FlZvH0jINSDPVxDY3T/sIaWMV/G1CQf8jv5pyR79adPM/bMG4ND+9pXQrrY/bGj9cEELezOa2rD6X2pTZ6xardGXapp9pLqZ+6qdvqPqKQP9KYP8meA9+3pm8N3u+nbtNBgQOAP/YLafTf7c5n6nG/uZWUrdhn+oOw+DNYAf3rQP/WdAfxr405KWtKQlLWlJS1rS8ofltKeY6uPTZw+EE4A0MNg14n8/tqpbNQMqaBzX475lPTEgfmPAX24wX9IdM5A37Y2p1GC/tD/mZvkrHPTPO/j34F9qkF86tKrSkXU961vUEzN70DOv7yoHdc2Av2oyoZLBNVWPrmtg/VB9K1vqWlhQz+Kc3k1PqDMyq/7YiobmtjVs4D+ynNDIxp561lZUHxvVm/FWPegv1+2u17rT/kqPusr0oqtOVcO9apqJGlCsqm4+YZA/7VYV/NQ2o9vd83rs8mPpY/m+pavC0ulm900relCW9lveeqOWzxkV906qtHtSZZ1TKmufUklHVMXdi3rWOa87rTO60Tiqq6Ud+v5tq96PLygJaSEMorCxHMv5U5v2UfxYox/15lP18pH+KeIDIzavn48AnmB2f3Y26r6dD6TzvX0H6ymYB/yZsffL9P0SfmfnIT/k1s322/XZbH+wnD+8bB/wB/QjkYj7JN/W1ta/bhd+L75kP1/CQRl/bBG+AKHPauiXa8vEhZVSLlOK+PPzeiZh03AsqP0P3LvPdtjFqbWdBORvUaY0ZYUT2jQflAwW/h/bOcoX/veV/BDXzvG6lpOzimz3aWzznQZX69U5X6bWyEs1Tj5SHd/9nzDYZ9d/vrnP+/ezAfAH0G9qgM5KALfDv7mpjTDbD/ybRu+dqZnzXvwZUH8K+u6zf6fXfz/0p4E/LWlJS1rSkpa0pCUtf0CAiA86ts75ieuw2z/4k86866oDosyi0l0PPsVX2R3V9cp+A9kJPepdcsvyHbw7COZ9dzv2zatswHQwdRyYC5b3m5Yb8Lt3+c1f2cCqyofW9aZ/Ra8N7p9aeN9X9Ot6zbAqJ3ZVNbahxplN9a/tGfRvqGtxVrWj3XrTUa/irmY1TQyrb3FRw2sbZr+m9uU5VUX69XiwRgUdr1TQ/lJ3uor1bLBaVdPtaokOqyMWUdf8ilqjW2a2pVvtM7pSO6hCA/oH/Ut6xKDFwJLlh139UUuz5Y3399Ey1MxLeiMq7pux47RdT6mia1oVFlZZJ+/3L+lJW1R3mif14P2Mfizr1O2qLo0vbrpSdf+h9Nkp91NyOjtDnVvEuw/rnyI+sGAe9izWswg8R8AXcAbL7gcM6B3AA/Qe6lMA78H+FOJNMWeJvwd+B/3evakzt+PH7/EPONCHb/jcXiKR+Me/o/9bJfjVfZwP8kUZcwznMdwe2C2fDfP8NTWGS68fyXmL02v7z+tvllPPX9AA5z/+pCcpxC4QzsLpDs7JC4v/+WP+P1j6v/dhTVvH81ran1Bku1cjK83qjlWobea1WqaeqMHgv97gP3j/34CcZfsG5XXM8vMqgHsdgAGAO3bke/wG+DGDfqcMAtxSNd/09wMGHN1Gfmz257VI9WbHioI08KclLWlJS1rSkpa0pOVfK3S5gw23gv4j/Om6kvQfTw7tmk58ABmRtaRevpvSj+UG/E1TboafWfiKPoN4oBjQ5919g/zSgQWVGvCXOJ0ziDbgN/NyMy8z6Oc9/lLzX2b+39jxzcCanvcs6qfqAd1oGFbF1JbqZrbVGtlS38qOhg34O+amzF+LnraW6EHTa73urlHjTJ+B/qSaF0b0dqRVdztLdPP9M4P957rfXabXI83Wae9T59Kk+lfnNba2oaHlHbVOb6hidF13O2b1bf2w7g8s69noqh6yLH9wUeUMVvTNmkbdaoUyBjUsf5yX9MUM9iN2jKjUgL+8Z1rVPbOqpQy65vS2a95t/PegxcqobUo3y9pV0TWpdbbmR+iau+45per1rL/+qYmJ9+P1TxEf2Pl0fBrB/v6+5ubmUkAeQHwA6AHwfzSrn1LsvTIQEF7i7/x6t87/kFvKD+yPjIyecs3e3t5Hn9j7X+Ga86Xsr72e1ohdoIg3927OK8KRwTt//ZGEHTu1/8L6hwR/1A9tOwz7XxZ8BEMewUDTmQbz/7z7f2Lwf6RdJQz+tw3+V/YntZAY0vRWh/rmKtUx+1rvIs/VNMmu//fVMH1PjRHT2btqNLBvnL+vurm7BvsG95Hg/f9gTwCUQYECg/4Cd6xl9/6oQb5Xs68zMzcI4Gb4Pw/h/5eaBv60pCUtaUlLWtKSlrT8IQnm2Ohgp/qPQW/c+o9mcnRgffdgqfme9eUHYnE9bJ7Q9xWDutkc0ZO+FYP5VVUZwFexbH/AQNkU2C8xuC8G9E+h32AZiE4Bf2n/oop7zS2z+z1Lem1hPbfjjzX9+rmhTxWzW9bR3VbT1Lp65rc1srKl/sV5NYx360V7ue42PdPd1md61lem0slGvRmp0/321ypqeaq77S/0tLdClWOdBvoz6l2ZU9/SnEaX1zSxsqOh+V21Te+odnxbD9pjulo7pAcDS3oxtq77HZN60z+rilEGLQzogfr+YNVCaR/QP2ewD/DPBsDfN2PAP6OqnqjqGPjglQAD/ucdUT18N6EnrWO6V9mpvsiSwyEnp11zh3QpPZNUFaTk7OzUImT034kPLJyOTyOAJTY3NzU5OeWA3H06D+BPAf7prH4K7k9BPqXOnNl+wN/88UoAyjl7AfT2GuizAeAwM/os3V/5ZDO+/0UJoDcYTPuoFuwirA7lwvoLEvgHpEMOw359JA7y7eQjTbn5S8Unwg8SMKDIKiL00JJ1Nv+Pmw8p+GfX/6Q2tadVbR/Nazk5pqnNTvUv1Ko9UqzW6edu9r95+pGaZh6oIXpP9bHbbjbfaep9/7rY2Yx+rQF/APtokRpiaAD9DQ78eW0gvaQ/LWlJS1rSkpa0pCUt/2IJgJ9PadG5PuszfrD+5IlbQm3dbeuXRzcP1Ti2pqJGA/7qEd1sjepRz7LB8ZKB/oKqBxdVObikcjuWDRrwmxYb4BcPGew7NTPTMuxZMs/GfX0cV/W6d1mvDPif9Szqh9p+fd/Yq5LZDZVNrKpuYk19CwkNL+1qdHVDfctRVQy1Guw/N7h/oHudT/Sw54Vutz5SYd09PW57paqxZr2PDavfIH98Y1NjKxsanFvWUHRNY/M7Bt87ej+5o5boge4Z8F+q6NOt7piejazoQeeUpSWisuGYgf6MpdHUgL+kn40JLU8e+PsD4C9zwG/HToP+7jlVWp7e8g5/e0T3W0b1oHFAxa1Diq1tp0rWiwcf9Jf66n9lP56ww+n4fHr4rv38/LxBPe/nDzgwD8/wu5n74dRmfGHYN7tTTZnhzy3vt3NAv6enz/mbjcS0trbuvvF/fuk+bPNP3Yjvd4kr7iAP7tQ0WNb+aekHrkzOHKYm0e0i7OijEYFAgqvgz11563Akzp+dnAf+c+K9hvW8/BY3gWBD5EC9V/8qAGrXnw2Ee1Sw7P9I+6YMAOxo78Tg/2Beq8kpRXf7NLrcoq7ZCrVOvVJT5JHYtK9u5o7qpm/bkeX/LP1nZ347j5iZ+wa/qZvRZzYfLXDql/YH3/bH7d+raeBPS1rSkpa0pCUtaUnLH5Lwslp20/a9RjbmAgq4Xkseqzu2oxcGxT/WjembmnFdfxfTAwP+F33BbH6FwXy5AX+Z08UU8Juewv6iSk0d8Ds3K8GmfUPrAewbKN/vmtMPDcP6oXVUT0aX9WpoSfVTOxpcPtHw4r6GFnc0urGh9rlxveyp0u3mhypsvK1bTXd0q/6OnjQ9U91gowYWJjS1saJpg+yR2IYml3Y1vritodkNTSztqyeyq+qBFTUa8Be9n1FWaZd+bJnQ/d55PemNWXoA+pjlZ06lAzEDfctDCvhLyK/Zl/RH7ciS/1kD/lmVGvCXdEZV1r+k16aP7fpu04BuV7erZWhWmwmA5kwCHAtwLyjllHzSbccgrH+mWMyAnqXhY/04nt3dXU1NTRmc97pl9w7uzwE/12Gw5xwzYN4dsTdzZvoB/d5ePrHHrvsR45c17e0lP2EYL7CM13+zsNM9ahkJrk2/VOpuY7xDaxsHZoP6ifAUFzt1Hs2Xg3c7DwmXXj+68JE5P3byC8Af9obi7ZyTU8HOt+RAg7+P5cz2y3p2cHJqdPbn4f/YCiRY+h/X/odN7Rwtai0R0dzOoIZWGtS1UKK26Es1Tz1Vw8RD1Y/fV/3kAzVOB9owc08NkbtuECAAaz/7X6Rag372A0gDf1rSkpa0pCUtaUlLWv7lEnTVg3l+/jcJdR2ZUJzdPlTV+LJuNI8rt3xQOVVjBuVR3TPgf2oADCC/HWD5Pu/tL9kxpQbsJcC/AX8pdgMLKjezcgN9tGx4TcXDG3pu8M0n/greR/Rd05iuWjyFXTG9Ht1S/XRSndEjDS8Z9C8nrCO/reGNVb2LDurJuze6UV6guzW3VdZVoo7xdk3MTSqyuKDIwppmFnY1MrOlsTkD1uWkwX5S4ytHapvZca8SlE7s6sfmaWWU9epK3YgK2mb0tH9Rry1Pb3vmVDG47AYxeP0A0HdL+h34z9t1sEkhG/hVOJ1Xcael2fy9MDePuiO63dKvOzXvNTK/6srRC2UcDLGALiBMSLg4NQjqxutH7v4UMXjiKwGn4fvzs5iYbYcv2EDvDPgN3ofOwB51S/ZZ4g/opyB/gPf9zYz3+9G+vgG3hJ8Bg+mpWa2urithoH/M5wlNzkP95xjmX8s1JBtGO89pppiwGd+RQfjh0bH2E/uKb+5qe2lDW7FV7c5taH95Vx/W92VUK+1ZPSXN16Eps/4EECoWf+n1I/GW7mgnHvadwZl4Ez+28GnL+FhoPdw9zgaxzvQXfWLs1Zx9sLbA6iI34BHy5pLq3aUkmPcP9vwPXks6MGu++29ldxjTSmJMsd1+ja+918B8nToj5Xo/9UZN489VP/pI9eOmk/dVN/3xJ/qA/Jpo8L4/rwMA/OHl9X+HpoE/LWlJS1rSkpa0pCUtf1CCXnQA/IZ8dsnkn7eBL/qX4nrSM6tL1YP6T0m/LpSP6OuGGRV0zOuBAe6T3lmD/qjeGAgXs+x9gBn+JZUNLZumZv3NjKX8FYMrBtEG26bFBv0vh9b0oHdRN9sj+sFA/0r9qHKrR/R9U0RvxuKqnEioZmRLvQsHGl0/dt/ZH93Y0tDavGoHW/S66ZWqO8s0ONOj+ZVZ6wsva3FuRdGIAf/sjsH/voZntzQ8v6vx1UN1RXdVN7auMt7f71ux+MaVWT2knJphi3NSD7sW9KpnWW+7LM19a6roN7f9K3bONbpgyoZ+bOSHGuxbGVT2s5R/Tk87Z/XIzO51TepWS69etPVqYWvntDxReuoAVPAiRXCeKvIzR04ApmBYIICpU4s/SQBsUhMo708HgBaAN0wRj8fdJ/HYNT/4Pj5QH7yn72ftHfCn3s8H5t3GfGbuIR8dsGu+3z8zPavlpVXtxRMfMUsAdB/n73+SYSjX42P3isIRenKsA9P9w0Ml9w+U3NvX7saO1mJLmhud0WzPqGJdo1runtR2f1R7Yws6jK7reHlLJxtxfdg9kPatBQH/9uNlAOfQlAGEYFDJ12hIuPD6kQQtLGh1n2rQAsOevQb/p1pO6C8I6WzI4Lw/9Eyo7pMU8AcNImXhhGsLEz31e07t34m14ZMPh3bK7H9Ch9p2S/8392Na3J3Q1HqPBheb1TVbpebJVwb9Twz6H6l26p5qpm+b8lm/QlXPmvKefxr405KWtKQlLWlJS1rS8u+WoBPNp/nokjMTzYQrvUd6lMt7J9YpXtW1xmFlVgzoq+oxXaiZVHb1hK42TqmwfUaP+mJ60T+nlwa+bwyIi3lH32C/fNjgnqNdl/Wzod+SKodXVWagz7v/z00f9S7oVldMP7RO6FL9sPJqDfirJvR1zbRB86pKxg36x7YcpHfOxQ30kxpaZRO/ZQ3EJjUwOaCJyJAWFqe1tjyntblFrcyuaiG6pRmD+5nlA40tJjQwv6O2yLpqRhdVNbWpl+Ob+r5lStl1o8p00D+iS6bXm6b1tGNZbzrX9Lp9RSWWhvJ+0wGD/v5llfYtpjbvC3bsLzetsPNig/0XHbN63BXVve5Z3WgZ1I36DjWMR7V5ECznp0x9ubqytqswCjnxjpwEwBSsvQC5Ti3+RPEpoh0Q39k57+6vr6+72f2+vj6D+WGnvMcP5A+7d/YD+PfL+917/HYE8t1mfGY3Njah2UjUwtp0S/ePDi0vqaww3sAig3P48j8pJ0cG44mE9nZ2tbO9o934rvb2k0ocHNhxX3uJpPaTBv07Ce0a0G9GlrQyHNFi15jm3w0r1jiguaZ+LbePaKN/UjvjMe3H1nS8vmPgn9QH83tkbe3A6m3/yPT4SMmTIzegcOTq1hd6Sj8RXNACgiGmoNWd/QWmtFYqK6xnQZ5pENJZC3cbEKQ0HIb3EcjZWVgw9e59eKap7/6f+rKD23uEQYPUwIBPA18AOJaV9YdNbR4vaGl/UpMbnRp0S/8r1BJ5rtqJ+6oav62qySJVz9wOlvJ/Br5/q37sl0GDsH7qhvMv6d8P/IxOWaM9XFnTyarX9XOK2aqOV1Z1tGbXu3Hn77SCvJzVV8gmuOLvbITp1Pis/u3mcby9qwOLjziOVzdM7bjCOcdQ+uz8eHk1SHPc0sKd5iM5i/23SjKZdDdFdhUNfz7kc/K5OnEN8xfqyo+y8lmUX5JwGPjx7eG3tAPc8vkTvnWK4Od8ewrLL4X5OTvMeHgQB+XEjq9bW1vunPL7rUIY29vbv6msw/JbygDB3e9x64XzXyqv/1YIm3z779H+FXJgDx3e1aOMvfzWsvitQhv+td13/5s4KScfB+3Lt7Pzn/ZBiAe3uOH3FY6XMiYMyuS8/Fr6sCcuwkB9u8CM8t3Y2HBt/r/JZ1rSkpa0/BnCbej4xLrD1nF2nXy7Zmkxd8uknY+tJPXcoP5yeY8yKgeV0TitCw0RXTDgz60Z1w/Nk7rdaaDbO6fnvfN6YQDPkvhivrNvYF/plFn9JZUMLBjom72B/4v+RT0eWNSdnjlda5vR101jyq0dUn7dhK7URZQH9Nv5k+EtVUcPVTq8qqqRFXUu7Kl/Oa7h1U1NWL8ysjivublZrZhuzM9pIzZvwL+guei6Juf2NLq4r5GVfXXMrqtyOKrqqTWVR+Iq6Igpp2ZEWXXjyqqfUGbNqLIsf5erhnWzJarHBv3P25YM5Ff1pmdJL3tI+7KKB1dVMsjXCSw//fN62xPVKwP8Z53mp2tO9ztjKnw/qe+qOlVY266hlS3DDHs2UdYp5ZzyDfq1wfWpeEdOsPHAEgK2P1V8hL7vE8ThNmu05xSb9fX39zvgB/zPgJ9P7bGsP5jxB/idmh0rAZjdZyf+SIRVF2v27Ivbcx8Qc8F/Kilz0vA/9Wx0RWq1Z3k/2EsqvrmtDWORFWu7K2trWt2ya+ufbCf3A8XN3oH29450uGPHtbj25ja0NT6vpd5Jxd4PKtrQa+DfpyUD//X+aW1PzJubdR2u7urY/JwkDPITB1Z/+0paHyZ5aLqfNE1o/yCpo+MDS5K1PF/MHxU3rQzk93j/8V8A/Oc1aJkfB8f/Qfv91L1Xb49+lAgnLkzaw0fuQkoe6F/RXpzjT5XxgMDa/wXgf6AdJcT3/ue0mNrxf2CpQZ2xMr2feaOW6Rfu3f+66Qeqnb6r2hmD8sgZnAfKgAArAAJlR/+z1QB37dw0YjqTel0gZnZ82599AkLuz8I4G2T4PwZ+X2L+/zPxph/ie9po79byqxLtlVRoP6XJ4nIlUueJ4lLFi4u1/aZYm2WVSthN4EMSYLFQfCWxfixVKW45GUbufyqHZsEbGuzNaNCIPY5oK36gaGNHOx09WnhbqnWLc6esWjulVdopqdROcYV2i8ssfWVKmh6Ym/jLt1q1457duJTYC+InTCJLxZu6+ERIEZ+88EIZj46O6tGjR6qpqXHg4M0/J5hTT2F7zr/kHuGmy3IqNk35EuTiHzvfBjj6eM6H7c0Au6WlJQdD6ODgoIsDf4T1S3F9LkzkfLzenLii0aiam5tVVVWl2tpa1dXVqampSV1dXQ7KvFt/9OKvSQ9ljV/SGh4A+ZIfL+Frzs/bI5gRx+fskC/5QfAHHJL3v0IAR/J99+5de8gO/WJa/ojgl8EE6mJ5efnULBzm+fB/LT7fjgBc7k+4X1xcVGdnp9bsQfcl8e3ncxJuW0jYHee0Yzok1dXV7vdImVVWVqqxsdHdJ/3uvyi/K9oR7ZAliz4sQL+9vV0tLS2uTM7L+TScF8wJY3x8XJOTky5NCGXw7t07d+MmXO//c+F8Key0pCUtafkzhTsN3R+WFh+f8B4sPa5gf7CV/RPVjy7penWf8sp6lGkwfKFuUl/Vz+hC/bTB8pQu147r2+oRFbZO67FB8ROWtXfP62XvoooNkFm+z/v6FSOrem2w/7BzRo965/RwcFG3e2P68f2ULtWPuiX1ebVjBvyTumxhX7JjlgH51ZYZPR3dVVXkSDWTcdWMbaglsq2+tYRB/7amFlYMShe0GjPYj8a0HgX+o4otrGlsKakug/7G8WVVj8bUENlQTWxP93uXdblmQrnVExbnlPIsrlzAv3bELe/Pt+NPzVN63GlAP7CqpwbyDwzkn/av6PnQul4MrbkNBV8OkNcZ3W+f1JP+Rd3vW3H+vq0e0LelbXr5blBLiX1Xnr6L+SU9lU8uzuufKzxr3Mz+uX4tz26eYxMTEw746YPyvPxUAX8P/YB+sIs/n9fjOcfzj6Xr/9RnWpD/L6fN2fPMhxN+Zx5cOR4afBt471sfbn93T/s7e9rZ2LY+0IYWV9c1t7Kuhc0dLceTmt+JK7qxpWVzs5U80m6SiYNDg3/T7YR2lje0Pjmn9Z5prb+f0ErLqBaah7XQOqKlriltjMwrEds08I/rcMOgdmdfRxbOwf6hY5PNrQ1tbK9pJ7Glw+OE8bJBlOcpsuaUfFpboE3Y3xn0+2MwTOWUV0BOLIxQ2/lYTgP9jfol+ZzblLr02ul5CTkJC3myXpz9z72OHf/37GxX+yebih8taz0xq7n1EU3Mdap3uk4tk29UN8WS//uqnTR4d+/7s9O/aRSAN3iPsvS/wGnw3j/Qfs+OD1Qbua8aA/66qAH/nEE9bqM3zR1fAzC35t/pbKFq2CwwyicEb5veSeldp/8HwB9U+GmoqeBOXAFbRVtHfq2yVgvXi7R7844SN24reaNIe3Ydt2Pi5i0lrt9U/Np1bV+/oY3b97XX8s4NFHxJXBT8d3igD8A4R2tMR1YlyQ+HbksGfncuUe4uajq3oi0D/NnrhVq1dGwX3td2wT1t37xrels7BbcsfYWWrpvav1ao+A83tGxp221r04edbQvDAjmigfuAvX5OiD+AdoRjR0eH8vLydP/+fQcylDvwxw+MGT0gA+AF2oBUbqReMfd2AIg/5ybJOYIfIGZsbOzU7LwfDyGc4x4lDcRB/LgjTB8/srCwoNevX7ubNbOc3NRpS+4mlfJHHojH59fnBSVM8scRP6hPhz/3gMWREeLCwkI9efLEgQ8KbJEGznm4IPgj7aSXsH3ctHHc4n96evo0Ldj7svTxIZiTX19G4bzjxsdB/jD36UZxS95x48NDCBP35+28P+zD7v9b8WER37Nnz5SZmekGSXzdkjfKzeeNtKHk16eJMsE9brHz5ebzgV+ENgCMA+VesKOOvT/iQPHvy5SwfVnj1j3gzS1mrEpoaGhQeXm5i4sOQHd39ynwn68jhDRzTrgocft2gJ1Pw+eE+Orr6/XgwQMH/IA71y9fvnRtBwDHL+HQnkgXA1Cs0EGIl07MnTt3VFFR4cxxT9wo+fLlgBAO6fdtFf/YUZYe+DHHD7MjZWVlrowpCy+EQT7Dv0/cY56WtKQlLX+lONi3I5MsdILpVHF3o5c2vpnU845JXS3rVF5FvwPwr+om9J/6KX3VMKNMA/+8mkl9XTWi7+rGdP3dtG4ZGN838H9kwP+kx9Tg3w0C9C0YFC/oQf+cbvfFdL1jxmB+zEB/UBkVA8qsHDbwnzLYNviuGtPXzRHlNE7qq8pBXWWZ/fCOKqb3VTG2o6qJDTXFttU+t66h6LIi0SUtz85pzSBzZXpci5EJzc4tqN/cVA/z6b9Z66ivqGJmXbe7I/q6fkz5NdMW16zpjC4Z9Oc3TFp8Y7pYN6yLNUPKqx3STw2jut06pYeWh0f9y7rXt6rbPcuWxznd7Zy1fEb0qG9WD3piKuqK6fvmGX1dO6JLxV26Vt6pdxOL2j6m/2rl+y+6nfPo4ZnEhFAA8wHc00f08I+5t+MaZUKGwXOe83Hr5/tnbRDmv+t5Rnq9BmByTjDzdil7uPf4yJ7f1g84svI73D9woB/fsX7R9o4O4tY327O+JUC/tatNO24k9rW5f6TFnYTGlpY1uriiqbVNRbd3tbAT14r1C7boHxxaf5y+xpb1rxZ3dDy9ocTgotY7pw34RzXXMqL5tnEtdc9obSCq7YllJeYM/tf2dLJj/UWL98D1d3cVT+wosb9r6bO+u8UdzKSm8oFaY2WAA9axGkxpqm/v7hTBH+cfPvgXU/6BEqqbT4W8kDN+nV65/9EHs37xwZa2EguKbPZrcKVZXQuVap15rYbJp6pnx//J+2ow+G9w8A/gB9/15/1/995/zCA/dt/0nkH+XQP8Ww7ya2ZTsB8rMsWd+UVPQf888HP+l+/S72rdFclpqKng3IHRn/UNbVTXaunGLe0ZaCdTwJ8w8EYPbhZp/8YNJW5c044D/ocG/AbZ1ugRwqWZoMTkfjzkwX4kJ/MLivcP6GBiWtq1R481qqNjA4MT5vqDNLj2yctmsQVtl1Ro3mB+8zppuav4jTumtxU3sI9bOvZuFLjBh8PrdvzxptYKzd5g4MOuQSZxuuFXH6rXzwluzoQyByoA/sePH7vlT8AonXrAjPoB1LkRvn//3g0OANrcTDliDggz840dYM+R2UVuoAAMIAAsAA+AANeESbzMyPb29jpIAxa40XITxo4jMMgNmLgx6+npcWkEooDsH3/8UcXFxYrFYu7GzWgugj3x4QZ/zPwDLqTbL/EineSP9JPO8A3St0WOXJNuQO+GtQcgnzygc3NzDqwePnzo0oAAg6Slra3NxY0b8kZ+CgoKXDlTHpQzUEU4hE8ZkE7yzIOGa/JLHignypOVBNjxICMOwqeuiANz0uvLEH/YUU/Y+bwTFvkmPNz6vPq8/5niwwMQX7x4oaysLAewpJe2Q5kye039Uhak17c5/FA21L8vT9xRdqSda+qQcgRUyQv+OSLUA3VLeLjDHwDMCgDaBu2O+CkTZvFxS5unTH38xH3r1i2npBe31IkfGKMeCCNcnpQ1R9wTB78F0u3rCH/+eF78AMObN2/cfZF2zCAEcRYVFbmZf8yoS9oKwI+SXtwRL+3x559/disDcENeub8SH+2H8pqdnXVhUL78Zsk3v2HiIc+457eEWz+gQf4Afto/dvil7VAWPp/4p3xpz2lJS1rS8leLB/7gbhr0yPh/y/5rn11XYf2A8ks7DcIHlVU7mprhn3Yz/Jl1U8qpnTBgHnWz4rn1o7rUPKGrrdP6sS2in9uj+vm9Hd/ZtYHzDy1T+t7svmnhff1R5dWNmP9RN7ueZ2Hl189YOFMW3rgB+ISyTbOA87oxXTU3vF//pHdFZZPbKp1YUflITE1DM+ofjSg2PqvVCesLjw5rdqhXg/2DejcUVcvMtmqnNvSoe0LfN/XpUuOg8hotbEt/dvW05cvirZ60uCeVm4ovo25UWTXDyrc8X6ke0Hd2/X3TlOVhVj+9tzy9i+h666TpqH5uGtb3dYNuQ8OcykHlVw7o0ts23W/oU2SbpcOp3uSf2zX4S4VnXTy+656hHvLpE9EH4HlHf8Kbc445zz2e57vWpz5m5vh/Sb5Ud5ib0hXhdYWkwfv21rbW19a1YXzEedz4JbmX1L7pQdyOuwnFDfbjdtwz2N49PNb2wZGWzd3U8oqGjX2GrZ80bP3OsaVFTa+uaG57SyvJuLYOk4ofHugoaWC6c2gMZn2ZeYtjelWbw/Na6ZrW/LtRxZqHtPB+TKs9M9oy86T9jk9W4+bHWmPiUCe8659KDwMQR5aOo8MTYyzrq1tezriM/JkBo1WnSp8+AH5Q/x+M+78ilheXQ1LvYT+s5Mzq68OWto+XtZyc1szmgIYX36tntlbvp0qC3f7HDP4nAvivmzZY57v+zPrPFal2vlA1sZuqjt5QjZvZB+6Z6b9j9sz631Xt7B3VmNZGbgfHWcyY1T+DfQYB6CP/zcC/rvWqWi0C/AX3lCy4q4Mi08Lb2i8o0qF1sA+LCrVfWKCdgkKt33moeFObTlLA71eSMMbCYhEd8skJA3Dr8B739Grt5VttV9brw3RMHwDK5G5qyVmQBpcO8jy3qN2yKi1fL3SQf2hpOTDoTzIIUXDb9JaShUWWrls6suv9a0VaZ7WBwc2HOMBPQkxdeRG6188JJeJidkKZA0nffvut3r596zryzCSy9BqQePXqlTsHQJhJfPr0qYMOIJK6Y1UA7oEMZq6ZmcQtYTErCQwBwvgBugAO4AD70tJS5xeYAvpoA7i5d++eCwN4YBk9AIR/oIkwAQ7cAhgAP2a0IdKHG+APv6QVQCkpKXFADhRhhz9mQJlBxQ/pJl5Aijb3udlJoIe8MMOPH2ZAAR0giPiZvSafABug7Zdhk0/OSR9ASbzPnz9354Av6fPvRAPi5JMHD+6xoxxIP+UMMGMOdOKXMqcsGPBg6TcDBMAW8EY4xE/5Uo/AJuH6Msc9+QBu/eywz/v53+F/Iz4s4Jlyys/Pd+VO26GtkBbSRLlwTZ7JD4MiPJh5AGPPtbejLnkFhXxxjT1gS/1SXtQDZUS5c40/6hg/uGFggfpi8IYw/MAL5UF54o+2QweBcCl72ih1TceAegCYSRv+yRdpoF6pE6CbTgTpJBzqDzvCxR9lQlkD/R6MucactkD98bsj/7Rz6o36Jh3UF+2UNJNezKlnygE78k6abt686eqYNkv8tDeENkIecUvY/PYpC/JAWvnt4Y/y4LeEPb9B8sPvkLQRL/mlLInPD1Dgj3ZH3VI2f2Y7Skta0pKWz0nQB/P9Kfvf7jtcLyZOVDEY0/dVPcqt6DEwHzbAB4bHddHg/GIdwD+pbINzoB1Qvtgwqv8YHF8AmBsM2pundaU1ost2zKufMHdjyqpm2bxpzYjzm9swZQAeseOMXRt8W9jfNBr4WzzZFl9u46TyGiyeqhHlVQzrRzu/1cEqgphe9EVVMxxT7/i8ouMxrY9MaX1wSCtD/Zq2509L15hKuyO6925MV6s7lVvbrZxmi5uZ/BqW8M8ot9rir7I4aiaV4+IE+lNxWxpzq4eVWzmsvMoR5ddM6DJ7DFg+vq4d0jc1/bps5ZNX3qPsin7TAeWX9+pqSZuKO8e0eci2Z6my/bhL9I8S31/jGH6W8hzj2YfyPOeZxTOc55k34xlPf9ZPvPiwEML50uD8v0Ys6W45/2eEbDGrf2L2BweHhi+71i9Y1cL8ohZNV1fWtLW5rd2duPYc+Ccc/POFAjbnS+wfatvO163s1uy4aGAfWV/V+PKiQX9MQ3OzdoxqdHFeE2tLimyvaTG+rU2Dfzb7O9g/0HHCdDupo6UdJQz8t4fsd2Dgv9gyoljDgOabrR/YPq6Nwaj2zP5oaVcWgLRrLGV6uHvg3vc/MOhPHh4rcXyipGXsbBDQhBMasoM2Mg2zBbDPgNa/c3jnNFOmQU6C3Hjg9+fkLnjvf/9k14ptTauJqCKbQxpeeKeuSJVaJ1+rcfyJ6ibvq2bKwH2GpfkFqp27YdB/zfS6gT+z+wbvKaAH7msid9zmgDWonZ/CvgN/3KK3TIv+ZuA/sR+xAdtaZbXmWdJvsA9g7xeY3mSmv8AAu9CAv0D7ptsG/Gu3Dfgb31sjC5b0s5MiS0YcQJ8c6GRzVYmxUe00tyrxukSbRfe19eCldisbtdnercRcVB+OqQCfN/xZZc0tKF5WqVVWFhjwHxvwHxrw77v03NZBCviTDELctPNrhVq/dU977R0p4Lcc/k7gp6y90qn/5ptvHJwCGYAR58AJYHD9+nUHTUAjgAE8MTIKwABNzAxywwQ6AGLAiIEDwgAAuOkCSYAJs57AD5BA+Nx8GVAgLGAEmCAM3AHVwAZxEgdpAUiIH7Cl3dy+fdsBNuABFOKOc+IALD3oAjXkgTgBIgCT+AgfWAGwyANCmfiHhheAnwcEM/SAHDAEOBEn5UPegH3KhTQCWQxsAEb4Ib88WAAroNDDN/5p+8zOMhBB/sk7YEUeKB/yQ17IA4MCzGx74GWgAmgGlikH0kX6qAsGPcgb8WPnYdXv10D6AUIejDzUvIbz/d+K/w2zaoG4L1++7PJIXVDv5Ad4pVyod8qPa+CW9FFfpBdlppoHNvnBPeVCWZB32jAPcc4pP8qB8qLOqGfKk7bqH/60G8qIMMi/n+WmjQGuzJATP4MhlDNppc0RNue0b+KmrKln2g5xYke5cw50U87E7wegaJ90LBDKxg+wcI4yIEZboQ1RTtwfSSez+/inDIBpflfklfBoA6SD3wXlQ53ilrLkt8g5Zgi/B8KlPZBnD+r8DigX2iO/W/JEOnyZ0MYoT/JMWyd9lAvuaM/YUV7+t0oafd2nJS1pSctfJb6342439IPsgq7u+Nq+Hr2f1OXKXgPfIQfAmQbEgU442M+sNTgG4mvZ/G5MGQ0TymADPGdvdqbZ9Qbr9dMO6PNMc+um7XrKvf+fUTupDAsnw+wvNkyb/ynlmPsrQL/pZZb3G2Rn2TGvMaorLfNuKX5O+aiuNs7oevOUHjaPqfrdqAbbRjTX2qelxhZF62s0aPffqto2FZS80zelbbpSP6C8+kFdrB1QRrOF2zqrzJopC3/KhZlnxxyLK9vylM1AhqWDtORY3HyRwGnVuHKqRpVTOaS8yn7lVvY5zakcsHBGlVc9qktl3bpR1a13bKTGClQvlO8/9JbunzU8S1FWr/EMok/gn4Oof/5jTn+MZzP9Ntx/Tnx46L9Zzj+Kg6X7fMXgSIcHvDLJa7NserynDQP89fUNpxvrTGxtaHlpxcpz2fpKW4onEtpL7hvs79sxqR3rz+we7IuZ+41EXOumSwb1EeOhidVFjSzG1D8fUd/cjAYWrM+/HNP05pLmd4y/9ra0m9wLwH/vUMebCZ2s7Ol4zsB0ZFFrXTNabptwy/1jLUNaaBvTRl9Ee2PLOpi1fuvynj5s7OuYd/3Nv4f+PevH0nb36dP6zHOgGlE7h4MCVA6Q+d8njuRSuQjnJAD8M9gns2Q+VQ7mh3f/kyfb2jlY1koiYvVhv4mlJnXNl6tl5rnqpu6rerrIQN6gP3pDdbGbduQauA9AvyZyW9XM6psyux+8938G+W7zPjOvi3D+d8/wY2MN2r/DH3dL+g2mgX2g+kahA+19g5BEYYG2bhYY8D8IgH8nHgTCzZA0f7BCPUrqZH1FOx3tWnj4WJs3irR//bZ2Cx5q+fYTrbwpU3JsVB/2k1YPuLeKwa81SMXmtFdaofVrBQb8t3RScFdHBvyHliYA/9DScVBQaOmyNPHKwc8FAfAb5AjgRxjBc+VFbr1+WcI3Mjr0zLwCvYx40uEHEAATQMDDI249QAAZQAd2QBmgyDUgBrwCeIAEEACEEDawQLgemBButIAvEMGMOTCCWwCbMPHLYAAgQVsBBIkft9zQARTSDIxhDmhxg8cd4IjQjggfgMYOQCHdCPEAi6SbB0BYfPkgpBO/gBfwwyCGh0Ty42d2ASmAlDTzUAF+gCGOzDozEABIkV6AibwysEFZ45cypIx8npnNRXy9MCiAOQBM+fLw4kh+CBeQBgQJmzqj/Mk3YVNPADb+Mcct5UW6AU/K+6+CNNoEwH/lyhWXN+qcNAK4vq2QHtLCagfcUGfUCWVGmlklgFvyTltAuHdQhuTLt03KBP+Ex8McYYCFcqFOgFTqmzpECJf2TB3SRn0dEifxAe24pw3gh3Bolz7N+Ee4h+EO94RBfmkj3o46wo93T1l79eLLgjz6wRDyQ3kB9NSpHyChjZNeD924oZ0wsAPI8xsjftxihvB7xi1ppHz9wB5COyRuwiFM7D3004YIh98KZc9vgLwTB2HTblEfrn99IS1pSUta/krxvR4gxvWDTHaPPqh9ZkvXag30y/sd7DPrzefr3K72tSggDvyPmo4Y/I8GM/YG87kG70BzpgF0RjVuMZs14J41gI4Y9M8qt9HOzSyzYUYXAf6mKQPxGWU3TrvN9K4YgH9Tx/v2UQPvWYsfP3PKq5s3ezOrnNKl8mH9VNarJ+Wdailr02hxg6ZfFmvk2WO1vXhuz4waFZW91/c1fcpvGHHv5v+/1UO6aPHkv7Mw6qYc6Lv3+U1zmeW3fOUA/KjZZVZP2XFGWaaZ1WZWNe5WG+RUDSq70rRq2OxGlcugRJUBf3GHHjUPa2ItblgQEgr4L+of/Lfin6H+ecozlmc+zzEP/P7IoD3PJ/oePNPDz98viQ/3nyi/J11U4REgnDzUXjxp5cR+W0klDPaZteca3eVo5hw3N7e1urKuRQP+eeu3Lq+van17S1tx3uHfsusVrWysajuxo539uOLH+9o5TmrdzpcM6KMG9hPrixoy0O9fmtXAUsR0RiMrs5ox8F+Kb2pzP6HEwaEODdiPE8Ztu9b3Xj/Q0aK1wciGtg3+V7pntPBuzG3wt/xuXKvtk9oejCkxuaz92IaO1vZ0vHugw+Sx9g+OlTw4UcJYi/y6m4RXd7MwTYk3+ndJkBm3WeUp73llzbmHfrv2GUSdtzODD+IVc2sDJxvaOJzTQmJME1sd6l+pUfvcGzVHnhj831XNRFFqs78HBvD37XhP9bP31BA1M3bud4BvbmYLU8q5mTngv2P6N27a5w5s2scoVnWdFg3y9wrvad9Ae7+QWXWD7YJ7Oi56YNe3FTfg3zTgZxl9orFVH7YNsgF2Nu+zME4WF/VhaUFaWtShwdra/UfaNig/5h38a7e1UfBAybIaaWRMH+YWdDw7L61uSPaDsl8evXAD/jKtX7/pBh2Oid+A/8CA/8DSdmDQf1BQ5PSI2f7rRW4DwYQHfsrpN87wUx7hcqXMgYZLly45SACIOAIWQBo3TT8AwHJ4IAQYARQBAzr5wCt2gAQgALwCD1xjDxAADPjxM6QAMKOrzFgyWwhY+NlUAI7wCAeAALAAKNKGW0AHMGRWlbBIP+cerIFEZjwBDwYGAG3STNjM6Pp0AiTAJbBH+kgLDwCgiyPiy8oPDLC0m7RQbtgBlMAz6cA/aWT1AMAJHJJnyoB8k1/gFYCivTO4Qd5IL78Bypm8Ew9+uAbuyBvlAMxiB/TjjzgAPPJP+QGGHCkfHz925JeHHdf4Jy08+ABSwiTdPp8+X3+W+LBoS+Tt66+/dmkDfsk/dUwdAY8esFGuyQtASfopRwY/aCPkjzpAKDfaK4NWtE0GgMgbfqhzwJyyxj/+qB/KgrxTdggPf2CasqCtEharNnzbpuxxT9z49wNWHuopV9o75U/8lLlfeUH8CGng90JYdDRw71dWIL6cMKdcyBMDWgiDMYA7bZ+yoz3QjkgH8ZBmyop7KXakkbwQN+3Hz75jR5r5bfBb8CCPGXVAHLil7ClD4mIAwOeF9kjYtCHSSD5pu+SbsscOP5QlZvyG05KWtKTlrxTunO7umTrhjjq/e6yy/gV9bbB/sWxQGQbBGW7G3mC3lo32xhzcnwJ/vQFww4TygX0DZYCZY56Bf27jjHLZ3K9uxvwZ0FdPK8+g/3JjTJebYg78s8xNZtO0MpunlWMw7lYDGIBfrp3R1w1RcxN1ewZk1BqYN8zp68Z5XTIYv2KAfb16UM9qetRS/l4jb2sN+N9o8uUTdb19pZLSGt2qaNc3VX0G7SPKaJrRxRbCMpCvCfYNyDOIz60yNbDPYWAitaoA+M+umlJWpaW5LmYaNT+894/dqHKqR+x8xGCf5f/4tXyXD+qbkk6V9U5rbf/YIUNQsNafZDWqG1X5Z8n5/grPS/qH9HMAfp5LPOt5ZvMM5PlLvy/MG+EwOD8f5j9ZPtdn83lwG9c55f12A30DYUB+a3vX0GXbzeZv78QN7NkUe/8U8gMNznd295xu7exqaWNd0ZVFza0uaWXTzhdiau/pUGNrgwZG+rS4tmDQv6P4kUHkh33tniS1cZzQcnJb0d11TW4ua3R1TkOLs6YG/ctRTawuaGaD9/w3tRKPa8vqJs7O/MkPOuZ7kHHL39qBDmKW1rFFt8P/8nsD/5ZhLTQPavH9sNatvcbHl3Qwv+U2+TvcPtBRwmDf4P/YwP/Doan7XqepxyOKzOu/TsKJ9xngCOyf6ITP/bk7oZnRzhn0MHV7xnF92l5wze/8wNA/oaS2tfNhWWuHEc3F7Tez0aa+hRq1RYrdZ/4ap56ofuqhW/rPO/9Ns3fUFLujxugtNczeNL2hhqgdowWqjxa6z/cF3+z/u4GfH8la+B1+v4T+jpIspzdIPyx6pKRdxwsLtVVQqI27Bu6NzfqwabAe39XB+IQS7Z3aqW9SvLZex+0dOm5q1e7Dp9orNFBnYz3Cvv1AH0qrpJY27dc2aausTnstXToYm9aJpcGoWnHrwK9cv2HuAXvSctfg39Jzw8JB2UAwtaQ/ca1Qa7fuKc6S/t+5aR9lGr5BcA4MsZkanX3gARjgRslNkdk/4AzgB4KBJT+jCkQAGsAC4VGX+AXYADzsAHCgA0ABpIAcwI7ZQvwT9g8//ODgCqDCDjNu2kA214AbbvHPObPs3My5qQMXgAhwA6jghrhJiwcdIARA5qYPNBIm6SEOD/zAGA8DIIvBDuA83B79kn6AjrLwQpkAR+SHBwr+gSHyAJh7sCU88kc+fRopYyDOw5SHeMqchxTQR57wwyACwEq+gSzSix/K2M+qEgczuPghfwAZwEYZMHCDX8In/5QP4XNNvr2E28afIT4s2gRwmZ2d7cqDNJM2yoFy4ZryYgDAAz9pJN3YUebUAXVOWdP+EOyBe+qG+qUsKT/ySv6wwz9wzKy9f/hTPtSXDwNAxq8fbOH1AmDer4qgzfE7wT/uKGf8kRbi8bPltH/qgTg4p+0j5JG6wh158JBMXhFfTnRG/CoOfldeiI+4qC9+Q/wOiZcyJMzwb5QBCNLIfZWZDvJP26HN0H45J58MdOCXcEgb+f3pp59cHJQN6eC3QRnQlojDtzfCIh7saF8o+cGcuBlESs/wpyUtafmrhXtn+JmVsMf20BLL+WeVVz6ki1Xjumgg7IDfAJ/38AFegN9Bv1vqP2qQbsDP7Dyb39UbFDdMKt8g/lJzRJcMtPMM2PMN2C/XzeoKWjurS3URA+ypYDadVwFYRWB+cppjbgl/Pu/XV1p8hNcyZeFN6FL1qL6uGtZ3dSP6vrpf1yq79LS6Te+q32uqokmx0jJNFj9Xe4k9W0qrdbO0VVfKe4NZ++Y503llN8wGUF81ppwqAN7SzYBEnR2Zqa8eV36Vpb8yoryqqIF9VBnVs262H/t8S08erzbUjOkC5WPmWdXmz4D/p8peNY/Pu3ehnQAPTj/fp/yniG8Dvt/qZ/d5lvGs47nJ8zHcVhDf5zlv/m+Rz6UbM56/QT/6QHsJg/nEgYP4TYP9ldUNLS6tOl1aXtPq+paZx1NwD+QntM1O/Dtxd9wxfzt7Bu97ca3ubGlxc9XAf0Gd/dZ2Xz1Vwe0bevrykRqaawz8ezQds77w+oI2E5vaPrQwDPo3jd5X9nc1t7Oh6NaqpjeWNb4yb+Af1cDcrAYWYhpdXdTU5pqiO9tatr76lqU9uW/QzlKTPQNZPtUX29Kuwf3mQFTLbaOabzLoZ9a/bVyr3dPaHIopPr3i9gTQ1gHLfXQcP3Tf9teBlVVq4vtXUOkfKNTzx/rr7dbsPhxaHq0AT6ztu08QpgYCUsJr6YcfjtxcP3/BR+StnLWj+IdVre/HtLA7rsn1LoP/Wr2ftX7gxFPVjd1X/YTB/oxBf+SWGiMB8DdGA3XgPwv0873+/5Pv8P8C8LMUwjrhDviZ4WfTPrec/7YSBv6Jmw+UKHhketfB+07RLW3ff6CDpgD4T0w3DABW3hRr6eEzLRbe086Dpzp8+krxOw+0V2ThmJ/923d1cOe+jh480dHj59q580TLhY+18OCVlqqbtD8372b4dw1wlm/c1G4hrxGQlnsG/SirDSwMNu+7WWjAX/Qx8P/uTftwFtwM/DmQz8w1oAOs0JEHXLlZMOMItDDTyTX2zAQCiR56gBbC4ybrZ8mBM+xwA+Bgzk0XAAFYqXcGA4iTd6uBCGCHtgC8Ex5pI14AGUhkJhK4BkS4mRMvaQGO8Ee6iQ9/zLwDVdgBK9iTJvJAWoiD9ubzRB5JG+akBffh9si5BzXy6YV0UhaYkz/iCKcZQOKBw2wn5QII4p80Eh/pxw0KhBEv5n7ggbwCrQArM7M+f8RJHJQf5UiYvsz4LQFqgBvlzKoG0uXzR1x+AIU0kzb8oX+VAPLECUgDhtQV7YA0Y0ed0F4oI9LDNemmTeCW/GJHvZIHyof00j5xS5mjlC9+aBu0FSAdZfCHd+rxS33jhw4AYVA21D9lBUCTPuqTGXDKlXr37YjVIvxeiNe3eeoIf9QXcWNOWogL0Pf5978H8kB4lAfhhIU84oayob68cE45kG4GrejU4Ia4aQPAPmHRTv1sPXFzTX5pW7QT/xui/AiT9oYZaQHUaWO0D9oQ/mgfpJ00U7a4I690pPBP+JQJYWDOkXz6V1HSkpa0pOWvlPCziyf22uEHNU9v6EaDwXDlqDIMhi/WzijTQNcBv1u+HgB/jsE+y/2dMvNfZ/AM8Bv8M+PPYEA2O/HbMc/MLxn0M2t/qWbGYH7aKUvqWQ2QnXplINP8ZTawyd+UvjG4/65qQN/W9evbxl79VN+lG1XtKqxsU1Hle92qaNXdyka9qW1SZ22LItWNmquq0Ez1W/XUlqmsukF3a7r0Q92oG3DIqJ21vMwqpz6qywb4bMKXb5Cf18CmgbNuJUJurcF81ZjB/oQuG/BfMuDPqYkZ3AfAn8O3+w32cy2/mVYWF+2aMmIvgEvlA7rbNKKB+U0duNcjTIEE1Heg/4FC/fMsQnlW8WzkecVzneeh7+P8koTb0b9FvpReysH3w/f2gPcA5reZqTewXzPAX1xe1dzCkmZj84rGFtw58I8dgwJbBvq4B/g5bloY69av2jkwEE/saHYxptaOVj15+ViFd64b9F9Twa2fdf/RLb0pe6Gmd3XqHe7SVGxKy5sr2j3c096xYeRhUpuHCa3uxzUftz6/wf/YmnHF8rwGl+c0yCDAyoLG15c1a5y1HN/VdvJAB4dWv/tWR3sGp4C/Af3ezKq2h+e13jOjhfejmjX4jzYNaLl9zG3+t2/gf8in/ZZ2dby+pw+7Br9AP/jz66j0Nwt1+8v6pTaLUWDMf2SW1Zb2GzCUD975P/MTLoZAgz/c8R2DY0N/lv0nP2xq8yiqaHxQI8ut6opVqm3mtd5NPVHT1D3VjxvcT9408C9Qg4P/mwb6BabBLP/fC/zYbGxqvfpsl363pN/A2gF/wUMD/Udu5n/PIHzHdMvAfd8g4MOWgYLprgHT4uMXWjA3mzfuae/mAyULHihRiJ8ixYsKlLhVqH0Df/YDYKY+ef2edm480kLhE82VVCsZm5P1mLVdXqbFmwXaKWJnfjYQvK/kDZQd+01ZeRCe4b9twN+ZAn7K6Xds2kc5+7LlHHjgpggkAcDcKDjiBntulh4mvT3XmKO4QbE7f+3deT9ABCAFOABWfjaVc+8f9XGjAAcww42cGxgwAWwQHtekm/DxRxgI/jHDDveE483xQ545RwkHf6hf0u1BDXsvPj6fPoQj/oiD+LgmLtJHmjn6NGGOf+8OIUzcMNNNPn1YDGgwQ8zvg/JiJQCzpz5d3h+ASbn4OAgXJSzc4sbnHSHtxIU/H59Piz964Rq/PkzEX/8ewT3xUBe0M+KlDMJpDtc74q/JJ0fcck78+OUc8fb+6MPlYc+MNLAPvDODz+oQ4B173PlwfTi+nfm6pOxoJ7jBjnLz9efLFH+48/4Qn1/vjmuOmHn3gDHQTHjej3fn04ZbXx6Y+7bn4yY8X5fh9owSBvacEw72xEsafdhAP4NbrKZg4IBVD5QR7R93+CUMhDgxo62RV9KCvbfzZUA5+fQh3k1a0pKWtPwlErrF8CJeLHGskqEFfWOgnVk5ZjAbMaidMdg3KK8JgJ9d+T3wA755wL4ps/RODdqzG8aVVc/u/cMG/aMG0+Pu03eXWK5fCyAb8LPU367ZIC+zfkxZTRZm04QB+ai+rhnWzZoB3avp1p3qFt2pqdeLhgZVNzWrvrFJNXX1qjYtqaxQZUWZ+qprFK2p03xtlabqy9VVV6ny2gbdq+7QjzVDbrAhC+Cvjlh6DOQN9POBe5bjmx0bC7IKIM/ylV89pstVBvxV5qYqYnmeVZaVQzbL/2tSKxxMeS3ggoF+himrAi4V9+hN94yWkyzztWcH9/LU7P4//V5O+ni2MZDPIDRMwfOIZ90/TUhr+Dn5ZwhhkleezTyr6W/xvN7e3rE+wq42tradbto1AwCcr6ytO9CPzhn0mwL/cwuLWlhaNrsNc7NjoA/87zp/m9tb2k3samdvR6sG8dOzk+rseW/tuEyvi5/pweNbBv8/m17TnfuFevjkrkrL36qju10z0Wmtb28ofmD9d97z/3CgrZMDrR8ltXSwa+C/pnED//H1JYN/A/+FqEaX5jW9tqK5rU0tW19nk37MwaESvKOfMF6IW59w81D7i5amqRWt9Ue13DGhpXcjWm4d1vK7Ya11jGurL6Ld8QXtzzFZa/20pJW9515Td+Bo/3n9LUId0uZ8v+zX/GLn3Xnxfrx+LLgNNJXKlAb+/PknEjK2UO3PwnDq/w+cnFckfH52hS/m/5OymtPu0YpW92cU3RnQ6HKLumdL1DL5RI0T99U4ecfAv0i1UwWqmzbgjxSp4W//LB82G1vBO/wp4HdL6Q349wyu9wrvG7CbGqgnDEh3DLY3DbKTdrPWzpY+7G5ps71D0UfPtFRw3/w8MjB/pP1rd5W4fsv8FSp5x46FBdq9ft3NzH+w8I8N4uPXHmrllvmrqtd+bFaai2rLbvgLBea2ENhHHyhx46HpA3fOYMRHu/RbWvb+EPCbjTUeOvLnG96X5EvuwubcaHz9cc4PIOwHM64BD5Zb+xlOoJYjM7jYo4TjQeO8eDefE5+ez7kJm3H0D4Hz5sATUAgweflc/rnG/Hw+zwt2nytrzkmD17Ad18xus9ya2X1fRoxaU36fE+8fv8TlBXOvvybeTdjtebPPlcWvCe6/5OfXwgrbc+7z96V8YoZyPwGqgVmW2gOzzGyHyy/sJ1wH3vxzgrl3+zk3hOVBG+EYTid+SYMfjAm7w1+4PXH0/s+H4d2cF+x44HP08jm3mNHWWZVAG2N2n6X9rGKg/fsHmJcvxXc+bZ8T/KK4+1I4aUlLWtLyh8VuQUxI8/2T8e19PekxEC/rdcDPu+tZBrzZzG474Gc23wP/uPLs+pIBcr5ds/T+DPjNXcOoclgpYACfY0CPPRvl8c57NtBvsJ/TaCBu7jPMbVbjsC41DumHun7dqevT28Y+1TR1qqqhUZUG8M0NFeprrNKQ6UBDlXobqvWuslhNJa81UF6qWGWV5moqNVlfoe76alXWNOp+xTv9WNGjK5bGHIsz0zTbDTRYfviKgFtdMKUsU85zAX6XJ2b6p5RbzXv7Mwb4DFKYWfWIlQHv7gfAf9EB/6TyKof1fXmf6scWtUt5Wlm6Dc9SfWg34f8PFf9c4RkD7PJsDffh/g3in5O/9xmJe/oOPPeZAADyebYz8EE/g+MmsL9pvLMZQD+6urHpgN/r0vKKA32APzYP/M9pdm5e84tLWl5d05q52Vhb0/bGurY21rQDvMfZj2jZ3MxoamZEvYMdqm2s1CuD/7sPCnX95g8qLLqup88eqbq6Ut3dnZqYGlfUgH51b0vxD4eGkCeK61CrBv2LiU0t7G0qsrnilvuPLccM+mMaWZzT+PKCptdXFLW8LVj9rvFVAQP/g/0POjDwP9g60P5yXInIunZH5rXZPaW1tjEttwxpkXf93w1puWdCm+NzSixt6mh3P3ivP/hn5fj764A2RlmzopN+E4Ms1IPvA54P59fC/9Qct/Sbgt9hoL9P8IFveoSo+y2n9PeEaKlI/VmfLwX/CWb9U5v9RXZ6NbzcqE6D/3cR3vd/qPqpu6qdZvO+v/uzfNh8EfhvO/DeLTLwd+/OFyhux63bBuFNrQbZcV7q1n4kqs2GVq0+eq01g/PtnwzKrwfhJG4WKsEn/W4RdqH2bxTpiJUD1+9qu+Cpdt9UKzk4opPNdWkhZsBfrgXzw4qCA2b1AX0Lc8+Oe6lVA598lq/j9wM/ZXq+k47Z5yDCX3P8nD/OvRvOudlwc+Fm68ElbM8PgRsQS5OZeQXIgH9mBnGPX7/8ih+MhxaOtA9uZEg4DV58+nx8XjDzIOX9ebeEex5sEMxRwIwfsB8lRr1bfuj8wMmPNwun2QtxYR62w4x8Ug4s92eZNgMepAUhPNyTX8xZVk3ZEOf5/Plrn7bz6vNK2GG/hE++eDji17tDOEcxD+cHe+/2t4h37+WX/GMXNvdp8EI6GQRhmTxKmfn2QF582wmXEe2RJfcs62M2+/zsM0J68BNOl487XGf44xpzzs+H48Xbe/Fhef+E58Px4t1g7v369JBHlviH74/ezitC3mgntCdWN9C2KA+ffu/Oi/eLPx5WlJNfvo/gz/sNn3t/n1N+L8RJuZNWb+7l/DVhhq/Tkpa0pOV3i91CuI1wd9y2flDn3LqKrIOfW95jYMuu9cB+JNjUziAY4Hef4nMb+AH84w74L1VPGvTzjjtL9NEJUzbGYyBg3ICfwYBJ82eA72bUZxxks/s/AwLZ9cMWV6++q+7Qw7p2VTd1qPNdl4bed2igtdFAv1KDNSWaqClWpLZMU7Xlmqir0EBVmTqLDfhfv1KkuFTRigpNVJerr65a9VUNelrerJtlbfq2st/SOGJQb2lvtHw1Wdzu9YFJpwxE+DTzygIrF7IN8LNZ2WB5yuHVA8srwM8GgFlWDgB/Bm6qLP+lfbrTOKL+hS23Oz/lCeRzh+acJ0DwBPrnyS89Z/6J8qU0hs05+ufoefHusKdvx3Mb8KQ/itKn9n0i+qkrTu3coH1tfcMdl1cCc67XzT1Qv2T9jAXrK0WtLzA5Na0x60eMW19reiaieet/rVl/dN3slmYjWpmPamdzTXtxVrJuaINP7S3Namp2TN397SqvKtaDh7dVWHhdN278rJs3runenVt68eKpqusM/oe6ND0/peWtZW0mN7V7HNfeh4R2T/a0vm8QbeA/t7OmmfUlTawsum/7jywtaHhxUaOWzukNs9/e1SpfEkgcaO+A1ZHWj4of6WB9T8m5TSUml7TVb2ltH9Vi66CiLf2KtRv8D01qI7ak5Pae3EZ2f1BgGvqW9ElZHcykHP1Uzyv0ic73986Lr8svuQnbezfh818TXLnfckgx+1jDf5/aI0Tno/QurSds4H9g9wtjCW1r82hRc3vs9M/7/vV6H3nrNvrjM3//XOA3qOZd+p2iIju/aeYFBt6FAfC3vDfItk4xaU0e6GR+RfvverT9rEzrNx9p+8Z9g/N7it8sULzwppJ372r31h1tmv8d4rnzVPulDToZnJQ2t+wuarfWpTkD/goD/iIl2J2fQYOPgJ8wA+A/8sBfFAL+3/UOv+U7VQ40RGDnfLl7OV/+4Ubm/YTdsFyfGUJgzDdyb88NyW94xuZtvF/OzKvfNwB3gBnLnP0ILT8e/HHNEnfCDaf1S+kOC+ECFuH0+jRhFk7n+fBok+SH96H9zLB3w4+ZH/j595V92AjnHmrw5+PDD7OqbKBGebAJIrOrxEN9fEl8GJ+Tz6XfSzgdXhjIIP0sd+eB4P2G3WDmBwp8+GjYzS+J94f6+MPnXihb2gDqyxk3KEL58g46GzSysRxL9Vmi7zdDJI20HSAXt9QbABuul18S6uRzZRdOI/I5N+flvB8v+PVtLSz+mrT6ZYi+fCgL4J1XOmgz3q1Ph7/mt8IrMZQJexWwmoFyYlUI4f1RCdeTP35JsCf9DORxPw+XFXZew/JbyjMtaUlLWn5RQreV9f0D1Vpn/ruyVuVX9uhyg8F51bQyKibdTPdHwG+wn+1m+AF+1ICfd/OdTjn4zzeAzmPWnBl9D/kNs8pxn+SbMcDH/7Cu1A3q24YBfV/bqVuVTW4pfo/dt6da3ynW2qzZ5jpN1ZdpsvKNIpVvNV9TrtnKMkWqKzVZU6XB4rfqe/pM4y9ea/ptsUZLi9VfVal31Q0qrWzWo4p3Kqjq1HfVvZa2ATe4kNk4pgwD/0w0DPysVDDgz6obVUY9ytcIzN4B/9jpDL+DfXPLMbvS8lDSqdedM5rbZfYuKFbu0ChPYnt6fbFX+U+WX3t2/R1Cmnj+fS5t/lnp9bz4vgR9RfoN9OWAe571DN5z9KDPNc9l+g9T01OunxSNzmp+YV6LS4sOVnGzvLykBTObm59TzIAeNxGD+umZaQP/SY2PjWt6fEILk1OKDAxqwJ7z3e9aNNDdqdHBPo0M96qnr0PvO5r1zrSmoVLPXvFu/039dO17ffvtFV3Kz9GV/Fx9e/Wyfr52VfcfFaq47Lka31VrYLxHC6uz2tpb097xrhIG/nED/83DuFYS25rf2dTs1oaB/7KGFxY1ODevoXkDf0v/xNqKItubWkzuacP6grvWb0kcHuuA7/pvJ3W4uKXE9LL2xua03jep+c4hRToHFBue0Mb8so4SxmCfKeffItQD5UxfmtWScAorScPwT/lSP7CM72uer1euMUd935evK3yu/pHA/W9LM65+XQNWDv4CM//bR53ZmeOPxLsJ7hHHBv/WJo/XtbxvbWh3UCNrrepeCPYT+8cCP0v4dwsBcID/5inw7zW3GWSnQIIC37db4+K6Dtv6tPL4jeau39HyjSKtGfBv3b6l9du3tVh0WzGD+UVm5cuqpbFZWcs2/5ayEwO8FPAvmj+W8x9eZ5Yf4Lf4bvC6wD0D/uAd/j8D+N3/5hZQ8kDHjYPZZGYTuVlgTn0wUkjdoNwcsGNUywvu/M2Gxg7AAmdhcCUcwAXA5R1hNg/jB8HmYOw+D/QzOsmPA3Pi4Z1idhMHSAmfwQIgjvTQXrhxcfSQ5OPjBwUEEpafrUSAIm6MjH76GXPfvvhxMSuJH+w8dHJNfnjPmR8vP2wfD8DPbCo3Us4pP+IgfNLjy4i8h9sxeSBM/9lA8sdKBwZBGAAhT7gnTZQ19UF+CB8zwiXtpAUNx4XgBnviIf2kLRw/bilr4Jjl7n6XftKJW+Lz/vzvkaO/USGEFw7z1wS33q8HW+L0Zck16SA9foNDHwduGASiLTAwAlDSzoBgvmrAqyG0CfLLgBBtBzuAlxuvjwM35IuyIS2UEzdiyphrFLf496s2UMqKNhF259sSZqSdsAkPIX/UC3b+YerTgJAn2hr5x433R77JH+VAfAjt12/aSDsjbsSXpy8fNmhkU0dgn/Lht0abZYCEa+JDCI/0Usek2YdDXXNN2dDWOPdxkT78Y04avpQf8kxc5IH4qUPc0T6pG/JL2XjBX1rSkpa0/Lfywfo+bsWryWoiqYruQV19U6dLZZ26wox81WQK+IMZft7jd7vz17IcPgBkoD+vhuXwbHqH8um9qVPYZ/f7YEY/YiDNpnkR5Zvdleph/VA9oNv1g3raPKDXTV0G+/VqrS7TcEOFZppqFG2s0mxDlaZqyzRWUawJA/2ZmmpNVplW12i6rl5DJWXqevxM/U+fa/i13UOLX2uwskLd1fVqrm5WZc07vaht1+0aoL/L8tKrzDqg//PAz34EmQb7FxtM2VuAb/OTP8tnbnXw/n5GCvizqseUVzGg78va1TAyry3r0vJUoki9Bp15e/75TvS/QHjGeP2nCWnyz/Dz8iU7zOiH0Yfjmctzmr6K7wfS3/B9Do48s3nuzlm/ZybCbP2oPZsHNDw8pPGJcetrTtuzecae6zPuGIvNWt8goqidz3K065mZKY2Ojai/r0ddbW3qsD57fXGx3jx8oEdFhXp4u0iPH9zVwwd3dOt2ga7d+Ek/Xf9B3/90VVeuXlLupWzTLOXl2zEnQ3mm+bkZys3+j65cuqgff7yk23d/1utidvivUFdfqyajo1qPr2rnaMfAMe4+7bd9vK+1ZEKL9FHXNjS1tKLx+QWNWF9pZH5Ow4vzGl1Z1MTmqkGmh/8D9x3+QyZmd6xPv2196OUt7UYWtTw6o6XxGW0B/Ltm9xvgmfL3/SIv1BH9KvpU9DeBfvqrXjGDXVgBQD/Iwz/9RzjD9/+8EB5mgRLf59NF0zjXPH634D1Q/vhl+7/APPz7d7l2FvafU38dHLAnJ4d2wcAg9wpe1mDWf+vE2uX+5D98ht/gOm7AnzTgP0wB/+YtA/AWA/69RBAGTxnSuJvQ/uiUVirrtPS6RBsl5dqxH8Wu3bg337zRelm5lovLtGS629GjD2vbVjKkjRk0u7suLWi7vFIr14u0f+Oujhzw31fipsH+zbuWtrsG/Lf/FOA/fzPhyI2Dxsku27wvDoh78KWxAhxAOfaABGbYAT6AI+4x57NhQBgA4qEZoaNPuEAu7oEBhB8Ks9q458YF9PgfBwMB3377rduojvaBGw+jpIf4SBOQwzk/Im6CDBgAgeEd6gEP4mHG0++ojgIwpJMbIz9U8oEC4cAYfgEYvyKBGWV2QweQ/Aw5cEO6gHbCxz/umHH1sO3Lm7j8QAb58eDEkbQAsoRFPigLwiNvDAxQP5QXdUW+iIN8UgbYERflyk2FARXSSzmxARvQShp4CJBP7JkFJh2ETZj8/hioITz8srIB99x4SDsPGt9mCOv8b/VL4v0QDnkj374dcTMkXuqGr0Tw7XugkXx64YFFu2L22tclafFtkzIjDMqLvFEfwD6feqT8qFvKhDKjDZI/2hdlTF2SDm7CCOGQd8KgPTKAgD/MSDNx0JYZbGJQwbdB6hy3pJs04h5z7Kkn8ocd6caeMqDuCJO4KH/K+/vvv9ft27dduyJ9pBP//AaIg3h9m/HlSpppnwymUb7enN8D5UMZkxfaAO2aNBGvv+8SD2knfJ9ezrEjLtLmfxveL6/h0OnwZUHbx47fPr9bn1/S79soR/LKPQP5PW0oLWlJS1q+JA746f+YbO8fqm0soqKq97pS8l455f1uo7qsGgP2Gpa1A/wsc58wYGZ5/qSDfmb6ef89WKqPAvmB+pn9bIP8zDoD/tqIgfO0vq4a1Y+VA7pX1auShj41tfap6323ehob1FP9RqP1bzXVYP2XegN8A/4J0+Fqe77YPXaktk5j9Y2aqG/SZEOThsqr1PHkqToePVbvi2caNOAfNeAfqKxRT02DOuqa1VjXqre173W7qk3fVHQop9ry1sBXAVLv75u6b/C7gQy+GDBmsM8M/8fA7zbrqx0z2J9wwM+3+C9X9OhWbbf6o6tu40NKk26lO5paL8A06E//08Q/8xDOvfpnTNj+3yLhNNN34nnLs5N+3gabjdsznWe/B/uPAN/67vQzUPoE8wbE8/MG/QbvY2PD9nzm08QGokN9GuhnRtqOpv123tdr7be70/qC7Wp916z6Ojb1LdHrVy/0/PEDPSwq0K0fv9fPX1/W1ZxsXcnN0teX8nTZNMfOM7IznGbZeVZeljKzLyrLID83L1N5prl2nZv1lfKyv9KlnP/omysZ+vmny7p1+0c9eFSgx8/vqLjypd71NGtsdljz63PaSFjf/mhPu4dJ7R7sm1q/xMpicW1dsZVVzdL/W17U0OKc+hdj6l+Z0/DGkqZ21zW/t631ZFxxK79D83cC/BuvHWxuK7m2pcPNXeO5feMxw9VfaSZf6rNQP/SvmBSkz0U/x/e9vHr4p29E/4k+F/XDYA19MPpavq/thVOPmC5tKXXmKf3vJBWg+4X7849NwxqYgvWonXuHoVNuw07tPIB+/oKN/uhz/kOBP3iPP1HI7voFOixkSX+BNgyy483vdBLfc2EwjvGBHUwNPg7tB5cYn9Dh5LRO5ub1YWJMRx1tOhkc0ElsTkcGdImxcR1E54IGZok6tNo8wf/yknbLKrV2rUgHN+/o8EawU3+80JR0mCYZfPgS8FNOvxH4fe69AIkABh15DzFANPVCnXDN58wARMyACyCYOqNRsxQdkMIO6OBb5wBNGPi5AWEHCHlzGrc/+tlAD6L8IIAcdu8HhPghAXwAmgcZQA+w++abb1y4gAmQzawmacYM/8ymA+/kjXxgTvoID//86PAH/JIPABlQZGCCGyiDFNiRP8JlJhUwBhJxB8wARIRNfICNX65PWOHZd9IIUFFmAP7HP+5gZI/fAOklHGa8yT9pBnrxQ5qoH8CKNGFHnZAHyoZyIQ7sKENWVHAD4sZC+VIepNsPwFDvzPr6gRLKifRTPgxOkOawkM7f87v0bgmH/FAulCPL8ilXv48DeSCt1K2HWoQbJO5IM4MsXgiXdgNEc8MkHMInH+QNcKYsCJv2Sr4ZTKB9kW/gnZswXz+gXVHuXHtgBY4pZ9JJGeGHOvDthQEK/xUAwqdOaaeEwWcmaVvUHW7wxw2e3xPX5JWBFtJE/ITHw4B8Yk99AMvUAde4pWxID23A/3YoA4Abd9RbuNwQ7HFLGfF7pX4Ji3aAH8qCDgJlTtzkgzonL7QdBkrIL7CPP+z4feEPc8oad35AAjvKnbzQhsk/de3DJP3UB+lBSNvvaUtpSUta0vKJcAtJ3UYOjVJjm3FVDczo5+ouZb3tVFYVG/ex2Z2BsUF/toEv8M91pkFyZj0b7gHOwSf1shrYBM+gOfXOPrCf2WCw3zBrGjXInlWewfLVqiHdNNh/Udul+sYO9be2afJdq6Zaag32i03fGNCXaLqhXLNNNYo01dl1rQF/hYaqGQBoMLsGReoaNFFRpd5nz/Xe7sMdjx5q4PVLjdh9dbikXKNmN1Jdq/7aejXXtuh11XvdrGjXlap+975+tgG/G5SoZZd+OzdlCT97FPCVAb4wEGxWSL4ng4366iZ0wdxdtHxkVQ7p64ouvWwfVXQjWA3myjM1u0gv2nqq9j/PnS/1K/8++RyEITxb/s3PF56P9B/9akIP9YuLwUw+Rw/4Xnlmz1gfgec9yuw9oD89Na6J8RGNDAOfPWpva7U+VZXKy4pVUvxab16/0NNnj/Xk8UM9fnhf9+7e0s0bP+uH76/qm68v6esreQbnpgbxlw3aLxvU52UB7xeVl5Ol3Nxsg/sMZeZkmmYpJz/HDQBkmn0WkJ8bAD+z+5dML3OefUGX8zP0/feXjBt+0L0HN/TgcaHuPLyhe48L9Kr0iRrf12hgtEcz81NaWlvQ1t6WDo72TQ8UT+5pe29PG3sG/9tbmllf0cjKvPqXY+pbiWlg1cB/fV5T2yuaj29qxeB/2/wcHO5bm7E+iPVDPuwf6CiR0LGV84mVN23pS20Gu3BbC7cv+qL07+hX0t/26gGfI/0i+qT0LTkfGhp0dvQbGZiBKahr6tz1kT6TDAYASMLf06yJlL4babN7gR+NCCWGM6/HZn5k7vjeB+gPk/zFwG8VYn+noaaCCw5mY8C/ZsC/kAJ+dsLn83cJA26+v5804D406D80kIvfKAqAv6nFgJ+bIpWftEbCcpADfbBGqGTCbeanA2s8y4vaHejXgf0AGRDQoXXG9wN7RqPZJ4KiY8d8LSwqXlKp9RTw7zPgUHjH7SPgdvtn0z+32sB/lq/IgP++AX+n9LuBPxBfttxUgAs65TRGIJWOO6ABXHgwxA1AAdwCBhyxwx2dfxq8B+fwkn7iAUqY/QNOPQCHfyiMjjFbCIgAQwAPaQG+OOdmh3/aCkLY/ICAR5bB+x8K5ww4EA5uSQtpJx8AC+BFWyNO8gmc8AMlLtySH/LFgADxclMF3AA+RlYZVSV9AA4/UsCaPAGMpJU4yAdwCzRTTmFgxj/mhEk6wu3b3zDIB+5IHzAJjPk64CZBWQOKxMvgCTd58kVa/A0H+CUfuCFfhMPNh7g5Jy88OLDHjPqhfrHDH+WHP/JJGXjh9/lHIA1/pAu4pW1RvgDizz//7OKgfjyMEl84fKCSsqUO/OywF/8wJN/4Jz/4BzTJl4dzQJP8+TKmLAmPeAFRoJQHJwMGlC3+8M+KA8KkPVNnpJ+bNeVEPrhZEybthzioH5Syo96wo50SJnnGrqioyLklDAYxaIMMGlE+pIO0+/wwqED8tAXaHX5JC20MoS4YmCIt54GfMqS8aH+4p52QBsqD+qUM/OAC6Sd/pBm3XNN2Gbzw/lDaOe743XFNGqk/2jL+8M9vEH/8Jikr8sORuPwgDOWSlrSkJS1/ivC48Gqyb8epzX297Yvqm+oBXawY1EWDXAf8p9BvoF83rQwD/osG9hcM9jMaxgz22ZE/UDbq45v8zJxnNsyYfcQU6Ofd/VFdre7XLYP9koY2vbd+4UhznYF9pWItlYq0VmqsoUxjdWWaaqhSzGB/rqVBUTuO1ZRpqPyNJqvLNFtT6b67P1dhYP/yhd7fua0Wu+93PnqsvmcvNPzytcbeFmuypFgT5WUaqGlQY22bnlZ06sfyPl2uGlUe7+enViUwsOEU+Ge2n3f2a0btyAx/MNiRaecZdZP6KgX82ZX9+qa8Q7UjMW0f0G+0ArRniz1EXHkGwA/sux6rM/snie8vcPQavv6nSpC+1EVK2I2d5yPPU57d9AXom9AniUZjmosxWz/vlGczoEg/hj7c1OSk6w+MpQCT525PT7c9g9+rualedbXWX60oUfGbl3r6+IFuFd7Qjz9c1dVvLhnU5zuo//oys/W5BuYG7cB6xlfKzrygXIN5YD0vh/OvlMeyfIP27JwMZZvb7LwcZRn0A/pZOcB/loE+9pnmLsuFl597UZfyLurKpSxdys9WtoWZzQDA5Wz9+PNVvXj1UPWN5aqsea0nz2+r6O5Puvvwpl4WP1JFzRs1ttaob7BTUYP/zZ1VJQ/i2mfZvvUDt4291ozLFrY3NbOxovH1RY2sLWgoBf2j6wsa21hQxOB/aW9DW+Y3cZQ0/0nDtrghG8vrg02V6a9+rt349hTm1LBb6oy6oq9JX4j+Hkfqgn4sx/BgAPb0lainvr5+Z+/hf2nJmGY7bmljUos+t4vibxYSQd65N3A/8EfMUveNsFpbDug70P9D4Of/lJETEmOFuL5pwF+veQPsXQPo/cJ7AXAb8O/fvGfX9w327+iImfYbt7V+64EBf6tOdgF+8y/eNTa14+moBzdK+8HuLy9pcWhQm7NRfUgY8AP25pL/D432Dw3QXXKskSm2YMBfZcB/y+K964CfWf09A/4EsG96UMBgwC0D/jvau35Lq7fuK9FuwL/Lkn4LlREEGqTLbZDjcHZPNSW+bIEEIABoBHIARwCLjj03ESDEzwQiNGYgCagENOjwM3uMAEDADIASnuFnBhboAWA8JCG4odETJ+Ez6ADYAG2AAbPpgCnA78EVYRSTeIAIwIK8cPMDyJhdJTyU9OGOfABEpBX3CD848skNEr+ETf4BFj+gQbsEAn1+SDdxkhdmbIFGD2TMmPLjRhidA+aYlfVlg1AOwB3lADx5QOMmQ1z4oTxIL+knHZhR3gAaNwfsqA9ACmGwhDBJB2FgTl1yjX8GSkgfNxXMiZfy4vdGfvGLP9zgHn/kmYET4sUd4tsLR3/+WwUwpzwpb2CROBnEoBwoQ+qTI8BPXSM+Dm5+1D3+aAuUFcLNlbwCnb4uKDPSSzsib7Qp6p024MOlDvwACWXn4Z12zpE6xC1+AH7aDOmlXVLH5IN7FmVFuhHaEO4pY+qIMuchjADylCNppYx/+uknF5b/XeGW9Po653dF/H7AwQ9IkGaU3wV5RygL2i5xo/43StkxqENayT9hky7STLkTL/BNWycPpJt6p6wJ06+SIC7OaQ/4oX4oI+qRdokf3FEvxEnZ8dsgPMLCnvsI5Yc/fp881H7poZqWtKQlLb9HuI24WwldICY+TPbsfGgloee9UYPiPmUYHAefoZsw8J904J9hwAv4ZrgZ/jEDeT7Dx477425nfpRzZvpZNp+Rgn4GCnKqhvVdZY/u13WourFVnQ21Gq0rV6S+RPMtVZprq9dEU5XGass0WWf31sZaLTTXa66pzkC/VEPFLzRa8lIzZW8VKy/VYmW5pt6+VtudW2q4eV3NhUV6d+uO+h490diLl5p8/VJTJW/dO/+99e/sWdGuu2Vd+r68X5ctX3x/330xIDXD72DfYD745v64aTDI4VY3uKX8kwb7wWx/dkWfvjPg74isuJ6s608eWd8k1R8PipZznr3/3Hs2zxT/bEF4vvz9zxniDkrwTO36tNF64bXJQ8X3drW+sarFpXnF5qKaTW2ex/v2wbv2EXecnJywvvSIPdf71NnZ4aC+paVZjU2N1icKns2vre9Av+n+vTsqKrypn3/6Xt8a3H99OVeXL+cYdBuEG4zzbn2uwbmbqc8yQM8INC/T7LNMnXmGckyzsi4qM/OCwXqmA3pm9bPyDN4v5ynnSr7yr36tK999q+9+/NH64jd1985d1w++d/e2fvzxqvLzM5Rn4J9ncecY9OfkEc4F5V/Ksj7MffUPdGhmdlz9BvblVW/17NUDPXp2W7fuX1OR6ZOX9w38rc8aHddOfFNJA/WE8dWeadx0x8B/w8pwOb6t2M6mAf66wf6SBldiplENr0Y1vhbTzMai5ndWtRbf0vZ+XHsG/vvW5g+Mx46M1U5SdXNaQ/76JFg16SXcvjjS76K/BV/QD6I/zzn9HvpHKGYDAyzx55rl/0NWj5ibOjfmfmjEWGtSM9Mx61+tWl911+Cf11ktPmtCLsrTxP1F4uP4KC5Owm35MwpboyccMQsC+IuBnyjO8Pc0ZBLglnMYqPM5itpGRQ2iNwruGdTfUfJng+prdrxhkH/dwNv0qPCBdm7e03LhQwP+9/pwCvzsSRgcxbv4lkG3DMqAL7G5oWXr9G6trusoychRkAanli+3GQN6YH5ii9opqdayxZ1gh/7rpKNIiWvB5/yS1wuU/KlAR9du6/DGfW2Z/SL7Cbxrh/iCeGmElrcgz0E8p6V3GrGpGdJovbAMHKgBZmigHsz8UnA663T46dQjADvAAsAAKHTogUjsgS8/w+5n8hEAmBlBlrwDJjR4QIWBBiCA8BnNxD9gQFjYERbAwTXACxgBEqSV2U7cANQAEiAP0JB2/ABapB0wYQABWAFa/Iw1acAteURJH4MZ5AUII01+cANoYrYUQAeSgBogDygDeEgHfihH0oc/brT45QbgBf/EhR1lSBoYqeVmQNoBOs6pAw/GlDfppiyAU65JA2WBUH/c3FH8ESdKXQKK+ONIuAxWkF5+b8AcdUyaOeeIP9LEb5KBE9IAEIZ/h+EH6m8V/ADl1C1p56ZHWkkzdUXdUd6UK6AcvqFS7sA8r0xQl/7dJ/LvwdO3PcIAelk9QLtktJR6pe0A29iRV9oc8ZMPbs7kk9UGuKMdUk+UEwMN1C1tifBR6pd6oA0SPkJ9U5/MvqOE7wcDsCNfpIO6I0zyQ/shbNoQdcPvgfqhHmgThEP+aHvkmSOKu3D5AP/kl3omLOqWuDHjt+aBn7ImXYRLWhhMI7++vWGPXwa1qBPaHGVMWqk32gRuOadtEC6DE7RZ7gXESfy0KX5Dvhxoe34gAH+UHe/306b+2/t7WtKSlrTQnTm9k/g+jh32rM81ur6n512Tbsl6Rlm3LlYNBfDeGNEFA98L7NhfZ1BsoM/n9S7WGwQbPPMufL7BcB7L4etHDPqZ/Tdgrp81s6iuVI3pWkW3nla/U11NndoM3DtfP9NwebFmGqoVaapVpLlW0/VVGq8sNVAv12xdlWZrqjRRXqLRt/asf/Vc429eKlJarGhZiSYN+PuePNK720VquH5NdfZM6rh7T2PWN4hWlCtWXalp6xOM2XOoq/GdymradNtAnZUGfBaQd/VZrcAXCHIYBGBzvmo28Zt2qxoyqjjnPf9xZVaZvRsQGFFeea9u1vZqZNmvRrTnC5tJ06f96B4dPv/niX+m/F89V3xc9CNO3AZr5/tFpAMznteU5aGpHd31WRpPrH+8u71l/ZOYwf2kItFJTUXGNDVjOj2usXGDxSFmgrvt2crKz2br99RYH6XU+o0v9PDRfd2+U6SCwhu6WXBD129c0/fff6fLVy4bWOcZ1Oc4oM8B1LO+Uk62ac5XyjXwZql9LrPwBvo5Fw3yL2br0sU8XcowvZij/AvZyr0QDADkZGYqw84zzE1uTr4uX/5G3xrYX7tVpFvPHumBtenn1rbLrM/wrr1T/X2W7v5R6wNNWfqH9abktS5fzVNW/kXlXDbgv5ytfNO8SxZ+3lf68aev1WC/l7X1Fe0l9wyL5tQ/av3Rzma9rXqpu08KdfvhTZXXvFV0blrJJDPgBvx7+3bc10HSdP/AzA8VTx5oy5Rv9fPN/oiV7/TWqsH+nEZXIhpdntH4SlRTa4uKbKxqfmtDa3s72j20MKzOgloyuE/BP3/Ir7Uv+mas0KV/Rx+cZfv0p4Ys//SfArgH+IF7Y4/BYaeDKR0YYObftB93QxocGNbI8JiFN63IDBt4r1gfdcfl2cH/59JiRl9OYSC/lo+PBGcfuXUGv6C0ea9cB/J/APxEyZtHQHAqIW4W3n54AOnyipZrGzRadFfRwrtavnlb6wb42wb/bNC3UnBHK9duaf3mfS1cv6vIrUfabGk7XdLPuwk0DkMguyRcjmZlp0DunnXG9xIHOjj84Gb0GXzmp+5yycADHfeDI51E5rRSbB3uG3e0WvhAmzfvac3gf+16kcVdpBUD/jUD/q1rd7RV8EAL5mb2wRNtv+/Qhw27SR/bzZk8UYkur0Ecp6XnDXzkoXIFGAAAYA9Q9zPEwAIgACjT8acRI9QVHXsasQcLQAUzP9MI1Pr3dKlT6hEwJ2yAxkMz8AA4ASSABgABYADJwBQgRvzECfwCSAApUAFgAQ+ESToBX35QgBppAgQZkAA2gEb8kj/cIfwggRriwR/xeqjCHGgBrvDjZ1VJI2WBG8CUtksa+GEzmAFEkU7yRh4pI7+agTKgLJhhJjzKDDccKTMAFXPsyS/1QVn5MvNlwUwt+cMtYVMvlBtASzmSb8LFjHP8AXOAJ+VE3igj4JhBBsLHH/nAHKglfOqFfGAXBkzOP32wfV5w592SL+ICAAmf9kKZU8Ysy8eOtFG/uPXtBvEDNpQV5UK6gVXySRukbigP6sa3A9zQrkk/9UR+fb5pF34Ai4Ep0nH16lVXd8A+8dI+SCtliD11AMSSNm9H2hHqC3fBDX3wdOABYXCCtAP71BXtCb+kiSN23PsoA9oV6eb3Q9i4IVzKizTTzvxrDb5sOPoBD34TlCFlRPlQxqQDwKZ8aWfER1uh7IiLPKGki4EG2hS/Ca5JB3a4JR20EdopbYowGIggXuxJH+HTZigf7CgH0oBbytYP7pEmn/60pCUtaflvhH6V9X3tmZEycJMpwemunQ8sbutJ+7iuVHYrq7JPFw1yL7CMv25cGalZfAA5w+D/IjP+BshsypdfY0BcN2L2wwb6o8oyP7kG/Jdr5/Vt1aQKyrv1uqpVTZVVanv9VC2P7uqd3Rv7i99qysAl2lyniB3HyqwvYLAzWVGqmapyzVSWabz4tfqfPdbgi2cG/a818faNxt7Yvd+uex49UPu923p355barU8x9PKVInZ/jdRWa7qmQjP1NRprblKbQf+r2ve6VtOtvNpBg33yFQxgsIw/x6DezejXRZRpecqo5nN9E86Oz/DlVY8pv3JIV8p69KRtQhG+HOXEnvcfmOEHUu0yrP8/l3CfhmfYqVo7Cz/TcHHKHA4fKUv6ghxR4wZ71u5ubmk+GtXw4IA9J1vV1tGszu5WtXc1q7m1zp67laqssH7P62d6+uSh7lu7KCq8rmvM1l+9oq+v5OvK5TzlsQQfqM/OcDP22SzHd4BvUM9yfAP6PDeLb26wz7mgTIP+TDtmmVm2A36D74xc5V/Md5p3IU/5dv11zmV9d+Wqrv14TffustryuV69pM9v/ZcW63tan61/ZlKjSwbQqwua31jTxk5c27tJbVib4rhu/ZvugV7dul+kXIP9rFyLj1n+PEvTJQYe/qNLlzKsb8+E3ZCbtT+2Mk0agG9sr2k6Oq7OXusPNVeqzcpn1SD90H70SeOnvf0jJZJs5Hyg/cSh9jnfP1Zi/0Tx/Q/aPjAI3z/QSjKuhb11RXcWNb05pwkH//MaWV7QuOns2rKWdja1dbCnpPEca7d5Dx39taYftt+3PqSfyKO/Tj9qeHjEwT5QD/wPDnJ9BvrB9acK/Pf3DVrfb0AD/QwejGlyYlqzkZjFsaSN9S3Fd/csTr6qdi6V1vSCT/ulrkNCW/V97HC7/aL8Bie/JvRn/wLgx8+Z8n/w40NS5kA/QGrgvm0d8aXmFm21vtPuuzYlWtuUfG9H69zG35tZix1b2rXd1KYtg/3kxJRO9pMWCg2CrQhSgwmk1RG9aarg3U/dzI/sOvWTd+7xx2DBB26oBuoftra0a5W+3vzO4uzQXmu74k123tKquIFb3MoobmlMmFmi+b12LE0bbe1KTE3qw54BwImFgVq4xHnK9aYfCWk05eZEWXsoBzYAEj8LCSRxBLSY0aTx+hl7lkFTX0A58IcbP2PLERDGztdl+AisEBY/AoAUqAaIPEQSFjBAulhCTzzAAzP4pAN72gnw6qGCHxVHoIY0Ej5wD/yRB59OzFG/jJ6ZXJ8PII5ZXPJP2oiLtBImMIVb0odyjeKHtJBeQIwl0kAS6SJfgKiPCwlDM+ECdJQXEAVUUW5+qTZ55xqIxQ3pBMJII/6IH7ClnPDDNQMq+OOcPJAm0oI/6pO0klfCCtcVZUt68E954Y94fBlT3+Q7/Fv8rb/L8M2EMEgzcVI+foCCcqZs/KgoZU96cO/bBWHQRn3aaTukk7wCqLjzbYdrwiQvuKdMqD8GX/CLOXnFnS8/gJrXC0gPQny+LKkD4qO8KCviIjzqlzaAcE29cCQfPl8IeSFdvr4Iww++oJQH7ZZ8Ukekj7CIn7KnfQPrpJ8wfJl4Ia1cUz7ES5h+EIoywT3iB0Kw5/dCOVPPxE98pNGXO+0Ev4SJ0oZoU6QBP9QT/rBjdQZlgz1pxy3ppnz5vVHXPPBwzxGljHy7SEta0pKW/0a4Gx7a/YSOud0R7R/AGtwjufttWZ+sf2lXL7oiulrdp4ySbmVUDSkntUFfpgHyhZph01E3u89yfz7hl8d777UGxwbSvNufVc+n72YNlKP6pmJMRZXdKql9p/fVVeopfq7OZw/U+vCe2p4+1lDZG03UlLv39EdL32jg9XMNv32pKYP+2eoKTZS8Ve+TR+ozt8z0jxrsj7x+oYHnT9RjYNdjdt2mHffvqffpU42UFGusolzjlWWasnDHG2rV3dikqvp3ul3TocuWr6yaIWVYXngFIb8OsLf08ynC1BcK2Mgv2yA/t2ok0MoR5ZX167uKXlWNLGvVACkQyo8JJI4po7Q44bnln13hcyd26lbv2qnv79P+PqaQIx0eJLS2vKgxex63W9+ioqxcz58/0+MnD/Tk+QM9fnFX9x4VqrDwJ9346Vv99O0VfctO+LnZygfaswzqMy8q8yuD9Yu8U88GeFm6ZOCen3Mx2Awv94Ku5AXHywb4V7Jz7GgQb0fgnt3zM8ztxdwMZfHJPAs/L/+yrlz5Vj98d003rxXqbtF9PTW4LykuVS2TFO9bNTA2qLGZCU3HIpqnP279ijXrB63v72ntMK71oz1tHSW0sR83822tWh9hbdfMjVNi1p9iguDnH3+09GcrJzMnteHfRQP/r5Rr6f3+h8sqLXmtWeujHNKHog99mNRR0vrpW6vWT4lqdj6qzXhCe1a4O4cG9Ab3Owb9O8lD7SbYzO9Qewb9AH/S7BMHxh4GxLtH+9o+srQcbGs5aX22XeuPbm1oyvpkkytLmlya14yB//zmqjaSu9pndt/Vn9dQXZ+TMzem1gbo/9FHDPri/dZHYuY+WK4/MjKqIYB+4AugPzDi7IeHx0zP3DLr72f/ucZ8dGTc+n2z1tcy+N/Ysj5cworsDP7DzdOLb7cftd0vyO9x+2vyfwL8nxXCJa4T6zwn9vRhe1OyxskAgHsnfmfDdM2utwKzHWt4W3bcNDe7BmXWiWapB4jNj/o0FgrZzfKbugeOTwNNhSGCAPb37ezAfPI6gL8tfEgmDPxJh8WzTRqI244J1OLdMyWd1kC1vaEPm9Zpxo4NAy2MYJ1BcLPxepoud0YKvAu7sjLwsIQAIzRSP8NJXXDEHvV1gXm4nrwb/Hs779dL+Bw74gVy8HNesA+b49bDGeFgT3zhcHxYPl5gibz4cDAjXz6vCGY+bAQ7gOc8pIfj9UfUC8AIvLL8GpBCCBO3CEfv77wQNmn1cSA+HoR8Eb737/Pg7RFvh7nPH/Hjz4fr84FwTZyEzXnYP2bEwTVKOOfjQ7A7b/Y5Cbvx8XAkDuLi2os3D5edT4cXzEkPecO/F9zgL+yW/Po8Y07Yvvy8AP7APLPWzK4TLhKOn7JCfdjYEZePz5ct5ihmXHP04XDEnQ8D+3BZh4XrcBnghnT5dGOOfTgfXrAj3PPuw/HyuyA/iI8Lt7gLu+XItT8nTNLi3YTrL5wXwvLljltfV5xj7usAt95/WtKSlrT8UeEuxd3O7ljBlXt/1O7Jdn+h14Pdjv03tLSnp++ndLW0S7llfcoD5msN9u34Vd2oLhosu2/z10wa8LPhHZ+3Y2Z/xL3fH7wjH1FW9bQuVw7rdnW3Khreq6u+RqNVbzVe/lKDxS/U9eKxOp4ZzL95odGKYo1XlGjQzvtePnPQP176ViNvXqrn8QN1P7qvPoP8kbevNGagM2Dw3/X0oTpNe54Z/D97qv6XLzRkwD9cXmbhlWqiskRjNRXqq69TU2OLHte16/uaHkvzoFulkFU7rXzTSwxaVFo+qgB/y4vlLbOSmX8D/epR5VYMKa+kVz9X9alrYVvB/D7lZ/dvB/zB/TlVqmk5JzzTvHpxCGBHnoCp+XzX47YW6XaVj0Qjamtvc6vwWBF64/oNfffdd/r6myuml/T1t5d0+RuD8ryLbvl9XsZ/lHvhP8pxalB8MSN4t96AGc3LyNalLGA+V1dyzCzrotn/x+z+o0vZplmB/+z/ZJp5vnKz+HxersXzjX68+bMK7hfp4YsnemFt8kVJiYqrqlTb0qL27l4NDI9rYjqi2Ny8lozPlrdM95a1kljWxt66tvd2tJOIa9Ngfs1YZZnv3++um5sNO65qfntZC8ZRiwbWq8YvW9b3mJ6c0dtnb/Rt7lX36sCVvHzl8y5/vuU33/KY/5Vu3vhezbVVWhgbU9LiPllZDtiHjfWS1r8x2I8bzG8dfDAwP9amwb7TgyNt7R+6T3PumjLzz0z/gZ3TB9k/3FfyyNjgOGHgnzDwT2rVwltOJDW/s+Nm+GcM+iMG/Utb69o1e97n9+2fe8mXxLvxQh+HyR0mQVjC74Gf2f3RUTb1Y/begP8TDYAf+6FBg/2hMVNeCQgGAdxqAHN3uuy/b9DN/A8PjWp8fNJYelYLC0va3NgO3vn/lc8Nfq4N/1XyFwA/7gkD5fwL/s34gwNzTlJ66g9zOvOAdPAYsYvUr9jcsXbM3DOShxGKb/ef+7Wb8qDhocMIaShc82XueT/EOsVOAzNnz82VeFx6MCNAmhh/3o3dQni3ituInVvX384Jkb/AVeArUH+GTRBz4JY4iIZG6TvfYcHsc40gfO3Pz3fcMffXPoxweOfdeg0L1x6aEI6fcxMOi3P8nHeHedgdghuvvwRPPt3I+XLyfvDPrCbg6DcERPCH+3AYCOfh67B4P1799S+JD4sjaTnvPhxeWHzY3j9yPo/I59Jw3t8viXfr9bz48MN2XPvy/ZyEwzrvn2O4Hfg8eXdeOOeew2ANKzu4OYfDCp974fx8fXL9ubT6MLzbz/kNC+bEF44/LP6aI/k739bD5+F0e/c+jf467N4LZuE0ht1wft4PbokLCdv9Uj4QzMJ+05KWtKTljwp3GO4kdscJ/rf+04nrw9l9zvV+Avsd678Nzsf1uiOiHyt6lVfabfA76N7dz2ycdMv7s2pY3g8gT7ojy+Mz60fdN+35Zn8WO+DXTOrr6iHdrTPgb2xVd12lJmveKlJToqnqEvW/fa73j+6p/ckDA/XXmqgq00jpGwN+4P2ZRkveaIxrA/32B3fVadA/xOy/uRste6sec9dlEDbw9pVdG9xXmP/KCo1UVWqsqtzCK7VjiYYMit43NupV/XvdqO02wB9QZrXloXra4N+gv2pSlyrGDfrHLJ9jlm7LS+WIsk3zq82sbFCXint0u35QE5tx6x0iVoZuZp8+ZurentK0WDmce6Z9cm3Kil7fIwAJNnZ3NDwxrurGOt2xur783VVl5ucqw8A700A9Mzsn2NU+i6X1GW5X/EwD/azM4H37bN65Z6l+Nu/aZxm4B6Cfl5HjNPdCtrIvZCrrQoYyv7qojAsXlJ3BjvjZ+uaby25A4dpPBbp797EeP32p18zYNzWpra9bPWMDGp+bMdhd1MzKoh1X3Sfu1uJ87i5hMI/uacugfmNvy6CeZe9LWtle1eqWgfzWlqnBvgHz0u6W6YbpmlYT61rZ39TKwbaWkmaeMOA3gF4zEO1q69W963d1NfOKvsnN16XLlofLGcq5fEE5ef/RN5cz9bToprp5JbG9U9s9fUqOjOpkbo6litKutdUkEyH7ipvuHRwobn3f3aNj7Rjg7jCb74Cf5f0HOjTYP3KTEkklDxJKHBr0Hx3Y/eDQ1Nwb022Z/7VEXIsG+vPrK1pYX7V62za3B27lEPV6VsufStjetwcmVlglyox+sClfsLQ/WN4PtJ+HfTQF/HbuZvRTs/mnav48+LtVAAb6HHHHsn8UO+CfZf+LC8va2txxaYEPwm0V4ZrVAMHS/1/K4X8vfxnwB7d4zr/s37/b4DJsGvzhgx8rKG0dY3dlpvxq+QU7xVNgZP8CPT1JXRCe3TRP7KbpoP8U5gkgSN+Zeo+pQ+qUHKAgPWnB5bGFd+xAP/izx5oz925TXlPCVWAD6PshhiML4+iEHJ65DirdQnLpPuuM+86/Vy/ejT9+DiDCbsJQzTVK+Of9YebbAO7P+wlL2Cx89PnwEr7m6N34tPlrfzzvHwlfe3f4D/v7XB69nD8PXyP+OnykbAjXS9gP5+f9+Pxw9D9sNJwuxJsjmKOfy7MXzMPpQL7k9nOC33D8iDfz4XAMh0neSbeP19ufd+fTHY7jc2FzjXr3COGjxOXdezsv3izsNxw24s85ejdevXn42svn6ten01+H0xtOg7fz4s38OXbhcLx6P/7aSzheJGwXPsd/OAz8eHvOw79nbxd2k5a0pCUtf7Zwf3Ga6vPYXcf6XkEPzl2bse/Cxe2/iZWkSjpn9VNlr/LLew3shwz6DYZrx5VtwMxsOEvhswz4We4P8GPvvmtfxzL/cV2tHdC9hk5VNjSrs5ql9q81U82n9gzES1+5Wf62J/fVbeA+WPxK/W+eu1n77meP3Dv9MzUG8CWv1fH4vt4/uKPeV081VlmikXID/jfP1PP2uYbtetKgfrKuWqM11RqpqdKYxTVhsD9e+VZDFld7bbWK65p1q7ZTX1cZ8FeyId+UciqnlF8RAH8+s/qVw5a3EbO3vNp1Pvks7deVkm69aJvQ/G5qxRyFRX/VqfuX6kWmBfFtzcv5ay98LWLPoHkmMquqmhpdK7hhkJ+t/2Rd1Fe52foqL0cXcnN00aA/A+jPMmg3mGdjvNyLLMu389wMs//K3F3QhRzTLNOLF5RxMcOAPlu5mbm6nHtZV/Ov6uv8b3T1ynf66ccbKii8o7v3H+rpy9cqqaxWfet7dfWNaGQqqhkDwLm1dQN6A/hk3M28rxqMrx8mtJLcde+5rxj4rhjgL+/uanl72+A+WJq/usNxQ2vb61rf3jTd0dqOhRFPGCwn3Yz5enLPrnkPflebR3GtHe1oxXT5cFdrFsdmIqHZ6Lyqiqv185UflJvBe/wZyvs6WzlXMpSbzysIF1T49SXV3L6jseIyLVTVaq2uXtvvWpQc6NFJdNrAf0Uf4ls6sTSfGMQfs8P+yZGS1t+IHx4Z8B8oAewn93XMCs39pEE/K1sN+C2d8YMD7Vr/L9Aj7Zm/PfO/bWGxy//a7pYD/t1kQofHwdTsbxXfHjjy2id862f5gX1m5IH/j0D+VM+AfygF8w7ww24M6D3oc+7Vz/gD/RwH+4NBgfGxCUtDRIuLS9ra2jb4tzI51y/z7Thk9KfLXwL81q1N/eH3M/69ccqKKHgYOLVr/2DgUYE6Z/zn73qov3aWwTE1GGqCIekgJRaSh323oiB1fU5cQXtjwrID4wqk49COLCxwaTJHRwwk2DmKmVP84OkjwSBwSTo88B9boz52wB/IWUUHQODL3B8RGsd5WAjreQmHg3ioCgv25+MLn3s71Mfv7ZHwOfa+AZ+PC7OwX879NUdvFg4jbIeE4ey8O9SLt/MSDivs7vy5tw+74+g1bP8lNx62iN+nl2uOXry9N/P2vsy4RsPi8xS2O+/mlwS3Pi3n/YXDO+/O2yGYezuO3ixcL96Pd+fPSbuHey+Yew2L9+fzi+AmXJ5hu7Bgj104XO8OczQs59Pujz4eH975+Hz45/1+TsLhha8Rn1bE1z/i3Xp/Yf+cn0+PF+wo47A9ZoTNdVi9hM/Tkpa0pOUPieu8cS+z+4vr79g9x/XeuKelzM2N72MlzXhqNamK/gVdrxlQbnGHAXF/aqM7ZsMnlFU96b7bz3fq2f0+i+X/dWyCN2pAPaivq7t1p/69Khqb1FNXpanqUkVqSjVdV6Gp+kqNV5WqzyC/49lDdZq2Gdi33CtS6/1b6nn5RKNlbzT09pXaHt1Tk5m/f3LfIP+F+kpeqqf4hfrL32i0tlyTDTWarK/VmOmIxcM3/BlUGK96q8GqYr2rqtDb6gbdqm7XN5aHLAP+DIP97Iop5ZVP6FL5mC5XjiinYkDZfKHAwD+Ld/cN+nOL+/RDea/qR5a04b6/b0IhuUmq1D3c1JdiWj4Wnl/h5yPCNa+GRgz0a2vrVFBQ6JbQf3XxP7qQcUEXszMM4LP0VU6mLhjUXzTNMNDPNNAH+LMyMpR54YI7Xsy8qP9kXDTQz1QmO+1fvqQrV6/qx59/VtGt23rw6JFevHyl4uJSlZSWq6auQW2d3RoYGdPoVERTsXnNrW4YtO+53eo3j461eXBoUJ7QesLMEsEy/BUDZ6B/cYcl+czS72iJJfpxPm+3awBv4G552tgLlu+zNH/bzfrvaZPP4BGegfQGmjQ3Ft6OgfjW/o5Wk1taP9zRxon5PzR/+2a/va3hviE9vvNQudnZlv+vlHclW7lXMpWXd0FXci7qWk6WXn3/vboePlbkbYmW2Oy3rEQLlSXaet+og7E+Hc9PSavz0uaKFN82qGdjbQP9A97fZxn/gY73DW55xdHSemRHZvuTVgZ7QL71V+IH+6ZJOz9Q0tgocWJ2RwfaNfDfsTIC+A/oq/3Bvgr9oeVl9mZiaT5gzkx8fwD0Dtg/owb82LE7P5v0ebg/1aHAjvf7HeSnBhBOl/1b2Fw7c2cffBWAlQaTk3znP+ZWI29v7wRllOr7hYXsBvppv+2Pyl8O/MEfpiGxi1PuxoJjWL1d6No9O/zzw2sqYFcodorTwOgsBfw5wY2dus/hBY4+UmeXOvqVBydG8c4srO4v5ceU4nJqbgP3zjYlnKOUhHXCT9Ul5NQtlf25Tny4Ls7f1BCuz3fuw244D+t5M3/tj4T1ufr35t4t4s05fk5x7/2g3k/YPnweDivs1p+fzycaFu/ezxj7a/x58f7QMGCFxceBhN37+Dme9+fjOq/eDv/+3B/Pm3PuzX3a/LV3Ez7H3vv/reLDCMflr71w7uP+kng779eH48Vfkw/e2/L14d1yxPx8PFz7vIfz58Pz5+E4w+bnr5Hz4XgJuzvv5nz5+8EKf416tyh+vX8k7AYJn3vxfrydP2IWjhv53Lm/Rnw4XsNh+2t/JOy0pCUtaflTxe4vdoPhxKndVV0/hz/OXYcNN2hKknY6u3WsmqFFFdT06Zuybl0pH1R+JZvaTRrwTynDgD+jLpjl513/XKC/Bmju0+WqdhVWN6mkvkG9jfWKNNQqyuf4mus021xv4F+lEYP6boN7lvZ3PH3gju8e3tH7x/fcNectD26rld39n5mbN0/VW/5aQzWlGmuo1ERTtSYaDfibajVl4bpzN6BQponaMg1Ul6mpskLPymp0o6xVVyxd2VVjbkl/ThXv74/rUsWIpXVIuZX9yqk26K8eVmb5kHIsr3nFPSows8GFXVceTihH10EOSjNVevQa0xISWpl7xrlSCp6DbHY7NT1t4F2nwjt3lH/lsv7zn//X9D/KNGjPzc1WtoF+hoH/ha/+o4sXv3LnGRlfKdOOmdl2nnVBF01z8nN09dvv9PPPRbp167GePn1tUF+pusZGtXV1anBsSJMxg7flqEH9nOm8lgx8t/a2FTfw3U0mtRPf07bpusHu0t6uFvZ2tGhgDNgvbW9oeWvd6crOhilmm1re3daKuV1lQGA/aSCfNIhPas2u1w2Ytw0QWTK/Y32o7QMD/oNdbRxsm5stg/9tbSUs/sSOduM72nHv7Rvw721qY39Tm4lNbe9uKG5pWFpaVENDo3689pMyczIsv1Y+lzKVn3tR3+Rl6YfsLN3Nz1dtQZHG377VWn2tVmsqFSt+qfnSF1qpeautlmrtdbXqYLhXR7NTOllbNbA3qLf0HRj0cwT4Af2jeFyHiaSZHyppfaw9p4dKHO4rYXC/hx7tO+g/+HCs5LG32zfgt3BcXf8x4YsDbIoM9APfwWy/n5k/B/shdfDu1Nx9boY/BfhO3asCqVn/FPAHn/1j2X/wGgEDDoA/itvJqSm3YfPKyqp2d9m/7Yxf/gr5C4AfCX6EZ3/BjSsckgvWGxClv6uhHu7RYD392R0PPRcgYblPN9h5oNZpZxbeLd8PxW//nWbn1NCU6flUtskv3+vHnA1nTt34eBFnZ0apAYFTN97+E8GCAM70xG7ovmJ9GYfL+pfK/byf8/6+ZEdnP9zhD0MB5v4aCfvzbsJmiDcLN1AfBsfzceGOI+LdIP7ohevzZl8Snwaft/B52B4hzPA5wrU/D9t7OX/tJWxOXB4IEY7n84qcDz/s3tvhz6edow+D83A5/x7BTzgOJBy2twvL+Xh8GGHx4XH0aUYw8/nALhwPZmENi48jHGbYrzcP24fNvXCNeLdeEX9+vr7C4t34OMLh+Hz5ay/e/Xk578arD8PL59z5c9yG3ROPb18+bd4s7MZL2F1YEX9MS1rSkpY/LPS1QrM43FU4s7uWda+4d9kVblJ9Mv5xBuQu7B6rZWxZ9+v69W1Jpy6XGQjzzjsz/DV8om9cmQb7DvhrRlOf6RvSpeoO/VTRoBfVteo0cJluMuivr7FjnaYbazVZW6nx6lINl75W/9sXGjb4Hy1/q77Xz9xsf/O9W2oybX/+yM3q95W9Vm+FwX5dmcZbajTRWquxxmqN1lcZ6Ft4TTUab7AwsTcdqS1Xh8F+hUHgvbc1+qGkRZd4PYFd+Gv4ysCk8gz+8yuHLa1Dlqd+5VYNKM+AP8tgP6e0T5ffdupefb9i/nN8bqUEZUl5uX+n/drgjo7J/78l/Pzysm9QGJuLqb6hXgW3bin/8hVdzMzS//ufr/TVVwbydp6VlWWAf1EX7TqbZfvZ2bqUl6uvv76sb7/7Rj/+9L2uF1xT0d1CPbI2UVpZpqbW9+rsYuZ2RpHIgpaXVrWxvqbt7XXFd9cNJNcN0jbt2bul/f01A2kD/s1FbW4s2XFVWwbzGxsG9Ftrmt9ZV8x0wYCbWf01A3GWrG/u7QRqgL7JBnypmXp23WfWftNAePMwaUdTg+eN5IHpvsG9uTXI30humN26tg83tGPgHz9gU+A97e7sGvjvKU44vDawZ+4M/Hfim5bWuHbNbmRyUk9evlD+N5eUlZuh3LwMXTbw//ZStq5mX9SPmRl6/tOP6isu1lZ3l46GB7T9vkVrdZVatN/LQskrLZa81nJ1uba7OnUQjerD9q5O9q2/emh9ksMjHbkl/ftmxnv8B1ZXR0ocHStu/RUH/ED+YUIJyytL/QH9faD/+MjMWS3AZn8Gwva7sF5MqsZ/WXwbCfd7WNo/NTWdgv3g+/tfBv5Rdwxm59nsb+gU9MPw780d1BvAOw0t9T87mhrsuxUGQ8HmgWebCA5pxPyRtlgsgP8dqzv6qH+2/EXAfyb49krI4WvUibf06u9w4Vn9U8cfnToJvNuDxam/OYY6tSl14i/CGsoyj6rAn6l7SHH0595NYPSFxQIf6ZeEwYTzZf1b5dfq5Ev2vvF7+dL575VwuOHj+fDPuwvbh+WX7L4kYT+/13/Y3x8R/J2vS67Pm30p/LB52A/m3u5zcfwWCYd9/vxLdr9VvJ/zYSEA6uck7Pa8n/PyuXDDfsN2590hnzNDMKcsv2TvBfvzbny9fs7u18JDvJvf4tbL+bg4P5+GsNl5+a1maUlLWtLyx8Tu9w7mQ8+vlPr9mQI778buV9yz7Iwu3nriWD1T63rSNKqv33Ypr6Rfl2rGlVc/qYvVo/qqckiZdsxxO+Ab/DeMKK+2Wz9UtuhRZYOaahsMzhsVaW7QTEuDA/4pg5Kp2gq3Yd9YRYl7Px8F/AfevlDv6+fuXf2B0lcarizWcE2phg3kRxsrNWbAj442VVu4zPCjZl5v9jVs1lemnpoqNVTU6GVJrW4WN+lqaYfyK/rEDvwO+qtGlWuwD+SjOZW9yi7vtXyN6hJ5Ke7R1eJOvXw3qlW+PIXYPdwensHRioxSo8TOShaT/2Ehe169uOvgWefVSyKZ0MzsjBqaGnX3/j1dusyM/le68B8+mWeQ/1W2cjPylJ9zWZd4x/7r73XtWqHuPXikl6/fqrS8ShU1dWpoeaeOnj71GZgNj00oYuC1tLZu9bKr9aSBtsWza0C6n9zVkUHz8faKjtdiOlqcVjI6qvjMkHamB7U80q2Z3vea6m/X/MyItlYXDN7WtGWwvW5wvpZkJt4gP7mjLQtrx8B8x8J2mjDdT2rboJfN9Rzouxn8uLYO99yu9luH+1o7ONCqQfD6/o79bgzik2vmx+I4NOg/2NKu+dlj9p/N/iztG+ZnxQB/0eJcjlv8ewb7Bt7xoxOt7MTV2Naua4U3lZOXo8ysr5Rv0H8l38A/5ytdybmga9/kq/TJA8329ehkeUUflpd1ZHC629Or1YZGLVdWabG8QqutbTqYXdCHHQCfCSomK050zKw10G9xHpq67/Yb8LPBXzw1w5889Jv5cW5uzBzIT1peUb6rv2/mR0x8WL2Hmwfypf5MuL3QJ11b23CfNfYz/Kdw7qHdrgOYT52b2enGfub+I/XmKTv8h/VjtwwMmOLOrQoIzN0qALTfwD9lN2btb3p6RvPzi1q39O7ZveHI6upLefycfMntXw78XrjhW5I/UWxOlbic2iXJ8OqMPvbHX+Aw0DP7Uy+BnJ6E5GOvITfnDX1oZ7dbb/Jb1IfiJBzsqWFa0pKWtKQlLWlJy79Z6PHQGef4JaHjQ1/Kz+JYjy3VF+Kwk/yg3tltPX0/qe8rDIxLupVXmVoCbxCdXcPu9+PuW/0Xau26tk9Xq9t1t7pF1TWN6qur10RDMLs/01SriEH6TEO1W9o/VVPh3uk/BX87HzUdrijWUMVbDVeXaKSu3MH+aFOVA/3RFoP95hqNW1gTbna/XCO1bzVY81bd1WVqMdApKavT3ZJG/Vj2XlcqehzYZ1UNKbtq0AAf7Vc2oG8K8OcY8OeZfR6f43vTqZ/Lu9UwNGfwl5rN+wzwU6Je/+cl1R5OhesUF4RZhB3PZyIzampuNni/r/xLl9xsPhvqZWVl6+rl73Tj+5u6feOenjx4obevylRV3ajW913qNRgbm44osrCoOQPYBdP1zS237DsRN1g2CD5K7OvQgHkXQE6sa213SWsbMa0vTWkjOqL1sR6t9r3TUnuDFltrtPS+TssdzZprb9ZUW4OmDfqXZscU3175/9g7D4a4kaxr//PvHZucMxhjG+eEA5ick20MmJxz7JyD1BHOd0+pBQJjj2d2dtczq/KckVSKLZVEPXVv3UJCwDyeErhPRQXIY4gkZV6JsJ9Qovt/RIA/FI9JWRAgT8u5BfAjGQH+dBThZET2jSr49wn4+kXBtCaQH0E0HZL1AYF/P+jWH5FtVMMBYZ/dAlIiOZYvq8MrYM1uAn56COSG1duX+9DR3YPyqgqUlBagTGC/vCwPpaW3UCTQX8T+/M0NGB8Zgv/UKTdfymo8gXNvAOmDE6TWthGbWUBsZRNn3hDOtSySOoeYPkcqnUVKBe5LqL77KQF+9u+PXwC/0Y+fkK+G7KNykH9duuzPRgCjAfFqUmXjeqYk5l8tN0mcnjqUpZ3961VQvhzYm/MEfIpj8BvrLOD+b5YB/0bffxP+Genf7fKqxgpNysjZOb+bV3/s7y2b6d8D/NzF1EXigvXTxQ/+pS5t85R1OwPjs/IvkxP/WW35hszjX0vqOuR/amqRdTf1G29aeWUj9S+jZL1Ss6HBqssjMZnTi8yLDDvZyU52spOd7GSnv29irceopXGaq+Lwf9erUcpdXYCBQ86pmhRXGIlVz1AKWPPp6Fo8xt3+eVR0TqO0d8Gwio/vo3BkF7cGt/HbkED/0CrKBudwf3AavcOfMTs0jtXBQeyM9ONIAP34I6FfND6M/TGBflr7GWFfYH17uBebMlXAPyCwP9Kr+uxvfxxS7vzbn0eUtj6PSp5onK79vVgb6cLCcLfAfh/6eofwonsMd7umUN07J7C/LLAvwM9++nTfZ5/9foH9wXmB/QUB/SWUyzYlvUso6VlE+YdpPBpaVP33tYv7IzNW19HcxLL4j09nWSlH7J7GINvXfjX5hMHOPk9N4dXrV7h7r0UF0GtoasS91gd49bYNXQKvY+OfMPt1GUurW9jcPVKR8Z3BMPwMepfQVQT7mIB0QoA5mRBw1XzIRpzIeA6QONpE8mAD8e1l+Dfn4NyawdH6J+wvj2N3bhi7s0M4mB3Bydw4HPOT8KxMI7i9hLDsEzraRuBkDwH3MSIhD+J6GDEB/mhCRGiXeQJ/RGA/THd9gjeVEgmcBzVjfVxgXksL+LORQI4R1oPGlG78As2hZFp5AcQyAveZmMA/vQeCCMrxaeHXExpSegwpLQRdCwifB2W7KMJZDQGBfremwavpiKgh9DKYX17BvQcPUFFZhvLyIgH/PBSX3kZRST4Ki/NRVlmqPCgW5uehRSPy6sqLmowLQceAcBhnp25kXQGcx1JqlSawH0sI0CcE5gX4UwLstO4T+JWFXwXsOzMk4K+nskiqfv/GthSt+hfAT6t/+l/vy5+W84ZCYRXQUbnjC1zTkm9a9gnbnK4xSr+y0l+z1P9pWY93s64E/Mtdh7oWyWPjA4MEHh0dw+djlxIpt8nkN7zO9CNm/88BvzoOj22isvnBN0SM5h+Myz8aBjobyybsm8hv2dfsF3bNnexK4rkv+pBxel03XfC3iWt5pWZzg1Hsbtb1HJW+ybCTnexkJzvZyU52+nsmVmdYe5OquBq+2Kgb5f4n1Ssls3qmgJZ1N2ZY629GPYybRGW/vVAC42sOPB5eQOWHzyjrmRfo30Ixo/YP7eHW8B5+G95Eft8C6vtm0D70BVMjH7E6NIRdAv/EoIL+g4mclZ/APzqAnWEBftE2oV9EK//GUA+2RiVf9tn9KECngF/0aQQ7ot0c8G+M9WFVoH9Wjj/UP4C27hHc7/qEup6vypW/cHBVjR5QqKz6AvUC+8X9CzIvwC/TMsnjdoT9qv5lVHfO4PnoPJwCSfzdqq5t1kfVDfwfTPK7FfALmBnAbyQG2w4Gg1haWsKbN29QWVWl9LqtDZ+/fMHC0iJWN9ZxeHwEt98PfzQGv56EX8CY1myvrsNPN/msjkAiBHfYAW9gHwGfALpDwH5/Gt61MXjnBuCf7kFoqgu+yQ64Rc4v3XDM9sExNwTn4ijc659l+wVETjcR9x1CjzihxbzQBcq1RERgNyaQrwngxxEhoLN/vi7gLvMGsNNNn330E3JNdNGndARFHJIuxv71orgcKyqQH9XCiDEQn8B1TPaJCxxHEhmE9QQYcT+cjiOYiSNA8KcngWyvBdzIeE8B7yHOPbtIe3egBQ8QjbnkGsJyfg1+ua6onJvw7fB41NCFNbXVKC4pVFZ9WvvLK0pRWl4q0F+M6toadHZ9wMHhFvSET+DZi0zWh/NMFNA1nMv9zmbOkMqeq+4CUbnOOCP1ZzjEc0Zg37DwM0K/bgF+PXWulExmZb1Af65h4Ar0C/BzPH5a+NMsH/KefPOKMONC36xViQHZ2bDg9wewtbmtwFq54OeAXw2lp9z5twwQz0H3f0LmdVzKaABY4/qLa+GwguvY29tTQQj5TnBECvb3vwn+mfhdMfXvAX4zWXflcdTHzPzAW6A9JxOlDcw37eVmI4CB/WdqO8t+qsU4J3V8yc4lzhqL/L+sV+Lvuy7LTj9I5lF4VZdIL/ur81qUO6a5BaXSNxl2spOd7GQnO9nJTn/PxOqMAfzU7wC/msoKVU+SBdYFafHP0urPmp8Ro5kj0nviWczsuPFyYgXVXdMo+jCDYka3F+gvGD1A3sgu8vqWUdE9g5cD05gYncLyyCho4T8QgD8QyN8fF3FK4B8b+Ab66drPYfZ2RvsN4Gdffbrx051/cgjbssyAfZsC/Ktj/ZiXY3waHUHXwCged02gQc5d1ScQP7AisG+IwF9MsGc+g/j1z8t0HmV05+9eQKVcc51sX9PxGe8mF5TFVqWLOiTvj5H1P5dUmbn8/YT/UCCAzY0NdHV2oba2Frdu3cL/+7//h4qqSgwMDcLl9SggjHC4Oo7bnjTg2SOA7NHjcEXDcAYZDT8If9gPj/sUx3sb2Fufw+HqFxwuT+Lg6xD2v/ThaLof7rlhBJcmEJL88NpnxHZnoZ8uISvQfBY5xlnchYzuRVL3K8t5LCVgTlf9nMt9lO74acK4JnAt+RSt+oR9EYPxEfB9qQQ8sh3d7H0C4EER96W7f4SWfgK5gHRMWfJTiAo4h9NZ2e4cgYRMBaCDAvx+Oa8/E0EwK+dPhhD0HsOzNo/g7Dj0mSFkZvuRmutDbGkIke3P0F2byGhy/bJfjNekovlr2Ds4xItXr1BUUozi4kKUl5WgorwMFWVlKCosQnFRIe7fb8Tkxx44XMuIJrZl/00kEsfIpIICnTGkznR5d5PQhe/i2ZQaco8R+VMK+E0LP/vmC/SnaNk3gD9hAX7TE+A68JvisVQAv+tsykUllp+r66yLnFeu/ScOBfYG5BvQzQB9JvCbjQD/cRHuCfrXGgDohbCywjH+l+Q6lyVvFVtbW4rdXS4XwuGw6upyU3Bvcv2/H/jNxEPwOOpjxg88P/QC60r8C2CK5zZB35i/mmfdNre/Ffh57ZbL5Z7ckntaGxOu/jOOrC7xO7JeCZeNJHMXv+maLra8PO5F+ibDTnayk53sZCc72envmViTMs0xrHNdVHE4Y1aJuMKokInkfxd1pcuVrItJre4iN5w4w/JpEG+/bKCuZxplXV8V9BcObKFoeBdFgxso71vAo95p9A18wtfBUWwMCsBzrHwCvgn9OdHar4L5iegJsEXozwH/rgL+ITUU35bMb44PYFMgf1O2XZVt54f7MDU8KJA5ild9E7jb9Rk19DxQffUF9gX0lXWfgfsE6ktEpb0C+b0C+1TPAsq7l1Ddt4LyjhnUvB3H8OKO6sdsJP7iGyqH/0N1RlrylWVf/ksLlB3u7qGnqwv1dXXIz8/H7dscQi9fQX9BYaFyM19eXRHwNILq+cMhBGJh+OJBuON+eGXqi/gRCAQQDQQR9/kRPDzB6eoaTpeX4FlfhX9nHcGDTYRPBGA9R9ACDmghF+JhF/SYGwndLTDqFQANQE/LMQSqlZU8ScCPISSQzmB6bGQICszTSh9N08JPYGcDBN3s2Tc/ptYbsK/DI/t5MgR+5sUREIXYOKBFROzjn0BU7kVE7oU3c45jgfydSBIbgTj2o2wsSAvkc/8IvALcQQbt070IO7fhnhmFu+cVAm9boL9pQupDM+K99xAZfor4bA/Shws4l23pRcBzMchfOBrH7NwCmppbUFxSgrJSgX1RZXEpKopKUF5QgOryfLx83oDlxU74g58QCH+ELzSNcHxDnsEB4ulTJM59gvwR6NkoNPltCYF+RuY3ZQI/XfsTAv0Jgf5kDvjTPwH8DOiXzmaQJcRefzHUuyL/u559jWPJueFwFPt7hwrylQu9ADanqv++AL8ZtO9GKP93SAG+AftcNmMJXFmvugfwGjm04LLS6uoqNjcZ5Z/j+x/D7XYjFAopy//14Nn/FuBX99yYvUzXgZ9uXQr4mcdz3riXJZnruS3Fj6TICvvqj4hkS+KEP5VbGcWC/wzEN9DfKm5zeQYzmctcx20o63pjA56TkrW5xgse0TiTeeZcMg945SB2spOd7GQnO9nJTn+/ZFRprP8sVRxzwcwwK1qqUiUzKt/YgP9YZ2KjAWtO/I8pJrCz5Yuhf+UY90ZX1FB2RZ20nK+jZGgTlf0raOmextuucUz0DGGlvw9bAv3bIwL1Av37AvkHE0M4mhzB8cdRHE4MKxH+d2ntF5hnw8CebEPg387B/vpIrxqPf22wB4sD3fjS34Ohvn686x1Fa9dH1HdOo1wgvrRfgL/fAH0D9pdQ0ivA37OCsu5FVHTPoaJnTmB/EZW9K6gS6C9pm8S93hmsnAaRZPVR6pDnqv54Lalbk7sXufvxT01kDdOVPxHXsLa0jKcPH6MovwC3frulhtQj7BcVFaFA4PP/BPrLqyrRM9CPE5dTQT+t1cF4BAGN/fVDCMpUjYsfiyEV15GNaUgFQ4g5ndDdp0gGnEiGnbLOhUTCBS3lQSTpln2dCCQ9AvMBgfogwik5jiiUkmMLwAeTAvopBs1LKNjnkHnBhKYs+LTsG+78dOOPyLxAP13t1bo4goT7dBy+jCF/mo0GMYTluBxDP6rHERfIjcr74ZMicSgwvBjOYNwVR8+hD53bDkw4/NjWU/DJ2+LLavAleZ0BxJN+6P4jRNdm4Bt8C/eLBoSeVCDRVoPE+3pEPzQh3P8YUVr93bvQ43IvGLVf12Wqw+HyoKd/EKUVFWoYw4rSUlSWlKJGplXFBSgt+A2NtXkY7GvGwX4HPL4+OD09cPuH4I98lPv/Va59A6n0scC5B0la/TOEdhPuOdSeEaTP6J9vwD8bAtLJjBq2jzKh/0o/fkr2Swrwsy+/gv4LdsxNvvOesGzRnd+Ks7SEez0+bG3u5GDbAHxCtmFR31JW9pv75P9R5UD+O+J5VD/9DaOhgW78V4A/dwwVd0AAn0P50bWf4jIbAEwxj5Z/wr/P50M8Hr9w+f+3Ar8pI3GOx75Jl1v9KJnHu4Tpa8dRD99InKNrGIFfHd3cOTex7GVmX13xO9vnVkkyrsOAfKON24g2wCnz2AAgW5sH4TfdPIid7GQnO9nJTnay0985KSjNyajxqGqOVWqNsVrJrK6Z27JqxDobuwYwErVhxDGOxfH6T+NpfNzz4OXnLdQTqrsWUMSx7AW2m7pm8LRjHP2dQ/ja04+Vvh5l6d8a6ctB//AF8HN6xEj+AvyGq/+g0dd/kmP404VfgH+0D2tD3Vgd7MLqQBcW+rvxsbcX3d0DePphBHc+fEZ11xzKehiEbxmlfYvKbZ8u/Absr6Kkew3lXcuo6pxHVddXVEl+edcSyt7Poql3DkOrDrh0doPgz5RfnwP+3O0xkrqnuXtxZcU/NMnzJuyvzC/i2cNHKCkoVMBfWlyMQpmnhZ/gT+C/LfBfXFqCJy+eY2F1GYEox6BPKGCOJgVgU0nDSp5IIJ5ICswnwXHedYHQuEB8POMRyD6BJ76Nk/Aidn1fsO7+iFXnhNJ+eAn+jBORLEE/KjDP4fQiCCuQNwCew+rFOLReiue7FKGf0fIZHJCitT8u+8VECuyV+39U4F+Omcw1CsixY3JcTcA2JuDilYKxKTMTHg1vDoJo2fKiTspM3dIRnm478ckXw1HqTK4xJdclx5bjJjIxJON+xI634Pg0hJ0397H3pBqul7XwvamH500DnO+a4RhoQ3BnBfEogV+uPybXHNMQCEextrWJ1qePUFBaiMKSApSUFqG8tBgVJYUoLbyNypLf8Ky1ELOfW+FxdiHga4fP+xJB/1uEAt2IhsYRj8xBi+0gnQogk2Xfe7rvnxt99gU+9XRC4D0hQE/RA8CAfCvwUzcBPy38CvzlOMp93cqsP3g/Lj5PucR5TUvg9NSJTYF+5UJPAGfAPpEB+5QJ3P+KzGOxUeFmreWktpPzryznpK6H+caxCPtWmaC/urpysUy3fzYEEPxp+T89PYXf7//3A//VxGPfpJ9L5jFNxCb033QcYxsD9tUn1NzR1E3Jut48nGVb6ypz3lhtXok10oAh085/BfhvOLad7GQnO9nJTnay098ymbVpVV9kjcc0g1zaODICc7SyXU/MSosyIm6bFsDNsl8/PTfp3i3i8djTPSDgsOqOomNmH/Xdsyhu/4LK7q9o6p7Bww+TeC8wPtI5gKnuHiwp6O9WEfl3Rwn9gypiv2ndN9z8h4xI/ozon4vqvyf5bChYl33XOD7/oBxrsB+T/YNo7x5C64dx1HXNoLJ3CeV9qygl8Cu3/Tnlwl/cs4wiAf5iAf6yrhVUfZhHbedXud55VLz7jIq3k+ic28exloYmv4n1VFUhVC0gRgMHpZK6p5KvxGUj+x+b5Hc6jw7R9f6tgGUxigXuK0tLUVJUiPzbeSgsLFCW58KiIhQWF6JApnWNDegfGsSJ2wk9m1aB7aKaLoAt83paYDol8J1CMMmAfVH4BPZ9GR8Oo3tSlmYxfzKBmYMBfN7txKftDnzcasdnmW54PsKXPIaWEaiXfdUweqK4zOtUQldu03EtDk2gX1MB9QScZT6s05qvI5zR1fB5oSQbCAyojwjchwX0lddAklH8w3KtolxgPlr32U9/Ly6w74zg5ZYbdcsOlCy7ULTqRsm6LK+eov3Ag5VIAh4G8RNwjjM6v5xLl98YD7rh2JjH+nAHltsfYv19CzbftWDr7V1svr2Hzd7XcG+uIBKW88flt1EMAij37djjwujncdTcqUNeSR6Ky4tQWl6CsrIiVJRyfP7fUF/xGzrf1OBw+wPi4X4B/HZEAu8Q8rYj6OlHwD2JkH8FSc2NlNwTIzK/Afwchu9i7H0F/SbwC8DnZLj2M2o/rf+GLrwB0pfdAhgM8Mo35co78vsvy1n2HOFQRKD44ALwOb1qWf8rZAK/VTm4vyYT/C/675vzamoCP6eU1bpPyz+9AlaVq7/RCGB4A2xsbGBnZ+cS+Pf399VwF9eB305/LJnl7Uq5s5Od7GQnO9nJTnb6RRPrfn/UwMN91H6q37Xsm9udFnq625qwz2w1fvYNhzfWXTYM0CfSsHjzmDlx39y2umx8GNAwsnSIh/2zaOiYRJOopWMCrR3jeNU5hoHeIXzt68W6APsWoV+gnWPx07J/8nlMwb0RpE/AX+YPTE0MY3e0H5tDxhj9FD0FloYGMNY/hDddI2jpnECNAH9570IO9pdQKjBfJirpWUJBt6hnBUW9ayiVaWWXAH/7FGpfDeF+xygGZjfk+uOqAcPocmqmm26O5CnY51Y3rP8bputlzLqox4L4OjWGF49a0FhdLtBfgLKiPJQUigoKFPiXlhSjoECgX8C/uLhIWfkfPX6M5TX25RfwFoCMc0x9BfwpAVla+pMC2IyMH4U3GYQ35cdOYAdf96cxtT2B6Z0JLBxNYc01i033PHa8i3BEdgXOA0gIyOt6WmA8JcdLQosnoMUkLyrAKtJiujpfXM4R4xB7DB4YZyMB++CnEc5KXprWfoF8gX12CzBkAH+U0E/gV9Z9DhmYEog/w0Ykhd59H+7OH6Ji7gSlqz6UbgYE+F0o/bqNe4tbGDv14jiZQUTekahAf5iB/jQ5ph5EIOiA41jK2s4cDjencbQ2heO1zzhe/YyTrXn4PadynTFE5NrDOhsqjPvkj4axub+DNx1vUVJZhrzCfBWpv7S0GMUFt1FenIfq8gLcbyrDx7HXCPpnkM0uIqnPIh6dRSgwC59nHqHgNhIJBgdkjAC5TwLoHBFAzwiwU3TtV+DOvv0ct599+A3XfiolSgr0G7qMAaDG9s8prSTfGQF35SBz+TJJYsH6/XeGx/B6GRhyWwXwYz96utVzLHxGxb8Z4P+srgO+mXd1nQH3MlWgbzRCGA0Sst0F7Jv7GW7+xrXSwm9MKfb557bcjuB/xcJPf38GSqCbhCl2+jc/6hSXbdmyZcuWLVu2bP39ZNblrMM5EcRMGOOU+d/C2dVls16o8i3rVL5AqoHpP5+49eUeuWMqXeQoCQ8hoKWwdODF+4kF3O0YQ0P7GJo6P+Fu1ye86R7BVI+Aenc71ro7sDPQg8OxQRxPjuLo0ygOP49if2pUDbu383EYe6J9amIQOyN92BroxnpfpwC/aLAb80P9GOkbwuvOYTR/GEdV97TA/TyKexdRRuDvnEdF9yLKe5cF+BeRJyrqX1bD8JV/mEF12yiedI7i09dluHwh5c3AxDtvaSe5IXGN2iqn72/5qyez7HyvTJ2fpeE83sFA1ys8ba3Ho5YaNFQXC/DfQnkRLcsC9wUCnwL6RQL/hSJGj8/Pz0NtbQ1Gxobh9bPfeBK6QKJG4CfECtASvlXkfA5hJ7AdzITh0bw49B9hz7OPI/8hPHGPQHgQoWQQ4URI9olB13ToYYH8cArhUAIBfwx+dxh+VwhBmYa9UUTCmkA2YTkl+6RUF4KoADQhN5oh7OsICPQG03LeayL40+JPl35G+mfXAH9Ch1sgdk8/x+hpGI+WjlE7d4yqZTfKlxwont5C+ecltC5uYszhw2H6HAG5h95EDI6QG8cBBw7kd+0HTnAQdmAvfIrdoCzLbzwJncAXdyPEMfsTEQR0Ds8n1ydTKizn5vW7hAW/fJ3F3Qf3kMd7XlqC8vIy1eBC9/7K8hJUlhXh+ZN7WJgfxfHpvGgOLs8qvIFtBML7iOkuZM6iUtYTSGV1Afyk6n9PcVg+XSBeE8hXQ/KlCN4iebFTKlo/YZ/Qz2UR83ONAokE18k2Ku9M7ZORe6A+Y1eKlvWduVrmriddS+Dw8DgHy+tqzHsCv7n875UV+K+v+ytlAf7Dw0MlWvq3t7eVdnd3lf8/p8ynOE/XgB9p16Kr67jvdV3f5se6PPau0pVj7d60nSwz36rcNld0fRtTlm2sx7w4du46fqSLa/vBsW3ZsmXLli1btv4Ksa72I5nbsSsnDT3XQewm4P/ZxP3+7L7fJB5HWbmNRbrwZrLsMiAV9Syw6w5iYG4TT/q/oOnDBOrfj+Dpu16MdXZhvkuAv6cLuwLsB6NDAv2GK/+BwP3BFMfZH8T25AB2RHuTgwr4GcF/e6gHa/0fsNLTgdX+LiwM9mNMgL+tcwjNHaOo6vqM0t45lBD4ewTquwT2PyygrFvEyPx9Cyjsmkbh+4+oav+E50PzWNg+ERCKqL7HTPxZhP3rwcQuEzMpE1xM3bjxL58uwP475ULXIlhbmkb7m4d49rABTx804G59BarKCgX2Cfp5KMq7LdBfgLLiYgX9ebfzcPvWLRQJiL548Rxb25sCkbTyC6AL6IdEEVreBTYjKQbVY8A9gfR0zJDMs3+9loojIbBNN/1oNCpwH0IoQKAXKHdG4XdG4HGG4DwNwHHshUvkOfXB6wwgEJTj8TxyjmiG/e+TyrWfgfoYxT/AYfPScl45X/BiaojrOWQfh+JjoD/GBQhocfiSaZwKxM77NLSvn6JpahNl46soHVtB/cdlvFzcweixD2uxpGx3htOEhr2QB6vOXcwerWH6eBXTjnVMOTfx0bGBycNVTB2uYcW1i9OYV43bz+CBfp0i9Ms543KtIgJ/WNOwf3yMnv4+VNfWopCgX1aKyopylAn8lxQWKvivr6vGyxeteN/xFO2dTzEw9A5Ts8NY3/qKY8eWlHen6q6gy+/U5f4n04T/LNJS5lOZcyTo5i/AziH6kvI7UpQsJ3Mwn8kAadkuLdsR8ulpkUhQRoOA8gpQFn6Wq1xBukjX35nvvzeZTBaBQFC+i/uGK7/oilX9H6IrwM/Q/pOTkxgeHsbQ0BBGRkYwOjqq5gcHB1W+LVu2bNmyZcuWrV9XrL99T+Y2rO8R/hnJ+WcB/Wdg3rT8/yWJ5zLd2tV5jfNnKFkiPrviSXzZOkXb2Bzutw/j6esO9L15g6/dndgcIsAPYLOvB1v93dhVffp7sT3ag50JmY73iXqxM96P3fEBBf3sw78iwL/Y/R4rfR+wPNSHTwODAjUDaHk/hJrOjyjvnlWu/CUC+2WdC6j4MCfQP4uKrhmUdn5G4dthVLSPoe3TmhpaMCIAY941K4Z8Pxm/9XJrU3/vZC07F/MyDfo9+Dw5gLYXd/H6KdWC1ru1qK8qQWUpXfvzUZyfh8K8PBXEr4hB/G7dVrp16zdUV1dibHwEHr9XAX5IQD+YFOgniGdTAtc6grrAuYBuLG1E0meQvLhAdiwWRSgYhN8jEO/wwHvqhudYdOSF9ygg80G4HUG4BPo9rhB8nhACvrBAYgTBGN31EwLwmoC0hnBGYDoZEYiW/XQ5XjqIAK35AvVhOWcoyT79sm1uGmbQP463z+j8Mo0KfIcSSYH+DPYiCXw8cOHV13U0j83i/vgcOhd2MH8SxGEsA0cii71gSED/GF+PhN92FzG4PYPBvTn0H8yha2cWHzan0b3xBaPbC1hwbONEgD+UlXOkOYwgxREGdAP6o3KduaCH/nAQS2srePbyBYrZjaJQnoFAf0lxIYoK8wX8i1FdWYaGhko0NpWhprYA1aLmliq8fNWKzu43GJX36evCF6xvLmN3bwsnjmP4g375rQL/QvOprIA9JcDNBgA2BCjAzzDvTE0Z8I+u/Foipbpp0JVfDe+XFPCnuz/d+rPnKtwHi5NRoq6/N1w2vhumrifGC3A7vcqdf2lp5bIPv9mf/x+gC+BnFD9a8CcmJq78YRgfH1fiPOHfli1btmzZsmXL1q+rsbGx78rc5suXL3A6ncq9n8msCF+fWtP3KszWZAL/7233c4k1+ZxyPf157IzU8LlEqYB+qSy2XEFMLGzgQ/cgPrx4hfG3b7HQw774dNPvVcC/1d+JzYEObA1/EMDvFtDvEfjvEnVjd6wPewL82wIqywOdmOt+K8DfgfXhPswMD6K7ux+t7/tR1zEuYP9FwP4rigX0yzrmUNM5j+qOaZS8Hkbx6z7cHfiEvuU9bPoEoOTSeZ28G1b9OJlb8Xeb+v29/k7JLB98nm7nCcaGuwT476H99SO8f/0YT1ub0FxXgZryYpQXE/oLBfhvC+znC3QWoCA/X7n23/rtNxW9/9nzp1jbWFdB82LZjIB4Ug2dR9d6Rs4P6THl2q8i6bO/eyyGSCQKvy8Ax4kTp0cOuE888DkCCDiDym0/5Iki5BdADgucx+Q48SSi8YRMdYQ0uuBrcCejONWDONH8OIl6cBB0YNd7hJ3AEQ7jLniS7CrAsfhN4BfQTiQE7HXDjV4XaRo0gW6NQ+SpPvUC4gKhR1FNQN2Dyb0jfN47xYYzBHcsi2AaOA5FMbezhaH5KfR8HceHuRG8mx/Gm8URvF4aw+vlCbSvfcbg7jxmHFvYkuty6SHZ99LCH5DrDwn0K/f+eEwkv1eLIRSLqECIoxNjaLzTKMAv91xgn1H7CfsV5aXKtb+uthxNTVWorS1Gaekt2eY3lJXlo7KyGDWyrvluAx4+uocXL5+io7Mdo+MjmF+cx+7+LhxuF4IRBizUoDMqfzqj4J0BPik2BOhyD9hFwwzYxzzOswFASxjdNy6gX4qT7MYSdU3M/DHwMysajeNg/0i58rM/v3LpvwGc/666AP6TkxPl3sU/BgR88w/Dx48f8enTJ9UQYMK/LVu2bNmyZcuWrV9TZh3uJpkNAl+/flWxm6zgZYV1c8pknVrnzbgA1sR8677/WjIr7Sbei85VaD9W4VUln5Z+iuAf1BLY2NrBxMAgBt+0YaztNea7PgjgD2B7sA8bvQL7Avy7Y93YI/CPEfY7sT3SiZ3RHuxODmBrQoB/0AT+99gY6cW8AP9gTz9edPTjTvsoqjo+oaRdAL9jFhXtX1H5dgoVr0dR/34UryfmMH3ghEO/jMR/CSM3p2/vFZdv0j8nmb+ZZYXAPzrUhdfPBfjfPEbH22d48eQe7t+pRV1lqQL+8lw//oLbApYyLS4qVO787MdPK39NTTWGR4bh9HmhCfBHCfwC1wxoR6s1I+gbQ/dpAvwcf17mYwK6gQicbj/cXoHhkAB3LI04JXCva0mBcAF9uroTwgXMfQLF7mgIp5EgDiM+bIWcWA+cYM13hFXvIZad+1g62ZbpHjYl/zTul+ugu3xcWfQJ+iEeK3dMdgkg8MdFKkigbEOLv8buAednCKRTcMi+Lp0W+QziUqDCqQwOvR5MrS6i98so2j8N4O3nfrydGUD74hi61qcwvL+Aadc21sIOHCYCcGeiCGRiKnhhIBGDT4uKZFlBP6+JYsNIHCH5jf5ICOtbG3jb/g6V1ZUK+MsYsZ8S6Ke1v6KsCPW1FWisr0RNFfM5jGKePBuRTEvLClFSUoBiUYU8x8bGOjx89ABtb1+jt78HHz9PYHZuBsury9jZ25Pn4EYkHhewJ/zT8m9AfjprNPKlBPo5RJ+elOciwE9x2RifP4PsmXwb5J4ZY4T8PPAzZeTYDOC3vbWrrPwry/9Q4Ocg/XTp5x8Bwj2ntOpb/0CYFn8b/m3ZsmXLli1btn5NmXW3m2QC/+LiIsLhsKrs3lQZtuaZ+dZ5gpoamkwq6GpM7Fz+X5IuDmUFfhPteS4GHOSUlXtrtR5ICqA5D4+w8uULPvd043P7eyx2d2JjoBtbQwL5I93YH+vF7rgAvoA/gZ8W/23J353oN4B/uBvzPe+w0vsOGwKiS8N9mOzvR3vXAFo/DKP2/RjK331CWfsXlLyaROWrMbT2TGN4aQ/7AYE7gZOEXEtaLkj9AvkfgZ/XZyZ1vcyz3NPLpNbeoH9e4m/3+zyYHOtD24v7ePf6kQL+188f4NG9JjQJUFaWClyWFKK8pBiFAvgE/pLiImXp53B9eWwEkOnLVy+wurEuwMoh7mjZF+AXcWi9mAAto/hHBPgZST/KoH4iNhL5ojr8AvihZFbgXCBbTyMQZ14cnmhY4D6Ag6AXe34Xtr2n2PAcY9V1gCXXHhbc1D4WPQdYEa15DrHhPcJ24BQHEQ/cWsjoqy+QHUkK9BOu2d1AoDUs52eE/Ait/KKE5BH4IzFG749CyyYQOzMC/wVS8VysAHovJOCJBbHnPcbK8Q4WDjewcLyBRcc2luV6NoIn2Nf9cArke880+LJx+AX2g3IcehuwSwFh30uwJ+DLckTujYr2L8uGYnDJc5mamcLDx60oKStGkTwDWvkZtb+UY/MXF6CqvAQNtdWor6lEpWzDPKq8pAgV5cVqSD9Cf6k8QyUO8SfwX1NXicY7dWi534TWR/fx4uUL9PX3Ynp2FlvbWzg5PYHH60UoElbxFVLplCiNtMA9vzfpLKP207VfoF/uJ5WS+8NhPc9Vo6AJ/Zfvjvm+mcn62nFel2+H49SF9fVNA5Sv9YP/O+tG4L9JZiPATX9YbNmyZcuWLVu2bP36MutyHKs5FovlKruWmu+1dDOQCnZLpTsQCMDhcKjgf7oAy/XtfnTcGxM3N6WSwmVRzroPVuaNQe1YqSf0G+7+uSRUzXOeCQxo4SAcmxtYmRjDfF8XVgfovj+g+utvsx+/AL/h0t+tgH9zqFOWe7Ez2Y81gf/FvndY7mnDWv97LAv0Tw/2YqBvAC87B9H0dhBVb0ZR+W4SNW8/4tXYqkBXAD49g6Rchnm11636f/BuXEv/2t7/zfQ9jw8zTxPAXZybEtB/KsD/EO1vngj8t+JJ6x0011ejuqIYFQKTlWUlKC7MV335Cf2FRfkoKqJ7fx7y826joaEeQ8PDOHE5VV/xuICiKbUscEi4VsPnEbgFIoMibzIFl2xzKtscyjuxFw4JsPuw5XML3Duw4j7BsusIywLzK54j0aGAtQC/Zx/L/kOsh06xHXbiIOrFadwHtx6EPxlBIB0TOCfsRxXAE/yNvvy01jPOgBFvQLn3yzXR+yAqoB2OR+Q6Gb2fkJ8L/peDfr/SZfA/v6zzJcMyjah5Ng6EMzqiWfmtmQRCsn1AjuXXwjKNGudPMTK/HEeg36/JPjJV3hBpdjWQeVE0oamh/vaP9tE30Iu6xjoUFuejWEC/TJ4F3frLSooV2NdWVijor6sW6K8oUdH8y+n+X8xGAQb9K0I5u2awAYBj+5cWoFhUQo+AMqMRoLyiDHV1tbh3rwVPnz3B23dv0NfXg4+T4/j6dUYYdR2npyfw+72Ix2NIy3PLyvtP8X0/O5PvwTlHl0tfQL/x7WAZ+513J/cJYRDNSCSmXPvXVjb+UdB/AfymSz//CDCYiwn5ZkswXftty74tW7Zs2bJly9avLdbXvidzPcdvpnWeieBlinBmTWb+9cTo/i6XSx1nfX39IuK/mazH/Ol0Y92c10OxAm9Y93M4rYCfVn6VcvsquMxtn6W11HGKk6V5bH8cx8bYEDbHBmTajy0G7JsQ+BfI3xjmmPuGW/+e5G+OdWO5/x0Wu15jubtN5tsxN9iNiYE+vOvsxb033ah91Yc7Hz6i++uhQCEDtplXxan87twFnV837f8PJrNMWcsC583uIBkBzYO9DQz1teO9wP77tid49YzA34yWphrUVZWiSmCxgpZlAXz25S/Mv41imWcQuQKZz+dycRGev3yB9e0t5bYfTyaUZZ8W/ogAbowu/SkBbSkXAckLpJPwZZJwCATvRQNY9bux6DnFggD+ousES0rHAvYnWA04sBVxY0/z4SARUG7yB7oPh8kATjMR5TLvU5H4Bdyzcs4zWuPpYRBTsE/oN4CfVnYD+g0lFGyrRgiB/UiCgfME/AXKCedBQryAfSgryyJa6X0MDCj5oTTLnZRxOQ9HIojJfpr8RjZwROXdDscE8BmUMB6R48u1Efpl3i/ycip5nPdFwwjy3IwxIHnqOnRecwzBaBDLa8t48eoZyitLDQu/AD/d+hXYC/BXlZWioaYaTQLsNVUVKp+wX1yQh5KifAP4ZR8T+g1LPxsOCPqSV1GiGhHYgFAqxyuVKUcFqK+tRnNTI1ru3sHjR614++Y1hgb7MT83i/29XXjcToSCfsRjESR0TcpRUgG/8V34eeA/y7KR0NgmncrA7fKqse7/M0Pz/Wd0BfgZrZV/BExXfv5R4NSct2XLli1btmzZsvVrywr21/NpyKERh8MvJxJ0PL8EMSuEWdNN0E6LPuuOy8vLWFhYwNbWFtxu942W/n8tsdJ+KaurrnLpN891MZEtzlOyBRsfZNuzNNLRECLHBzhdluucmsSyQP/SSB/WZLo1PoDN0V5sjtDFv1cBPwP5rQrwf/3wAvNdr7Ay+AErI7341N+N9+/e4dm7TrwdncanzVM4YhnVV98YcM9MvBi5Ruv1/cMSywkbeChrIxF/7/Xf/L17YOYTzkIC23Mzk+jqeI23r2nhf4QnD++ipbkWTfVVqK0qE7ikxbhAQJ+B+/IU7BcKVNLNv7AgH3l5t1ElkDj8cQLuUEBF7I+LGKyPbuoEaUJtQKDaL/IJUHtTcTgFoPeiXqz6BPA9hwL+J9gKuXEQEaCP+nCiBeBMh+E5l+0h+8nUlP9MIPxcR/AsIWBO93uB93QKkTRd79OG5VzOY8pw6xfJdheSbRjAj3EG2A0hItAekWsOCsT703IOgfogGw8I9oRygrgSI/4bQQBVPABRjF0ENLmGaEwUUcAfEYBXMQQE4oMagT8Mn0AyLftBWvgF+jkl6HObiLLwi2SZIxm4vS5MTI6huaUJRcrKz6j9BH4BdgH0SgH8Gnk+TXU1aG6sl+dVq6z91RVlqCgrUVZ+PrNiuvvzGdL6T9f+co7xL5JtKstL1baqsUCOWVYs4lTEPB6DeXU1VXj44B7etr1CT2cHhgf6MCXPe3H+K3a2N+HzupGWZ36ZjO8Ep2rphrLIrEtHoXPVVenw4EhZ+BnAj/DP8fm5rPr2C0BfBPW7Btb/TVmvyRxa0Bxe8EYLP/8YWP84cGqDvy1btmzZsmXL1t9D1jqbdZ51PNb7jo6OpGJ8FVOZrlv4zXS9okzvAB6D1n1CP8WuoXTx5zprwwH3NWWmK8ucXD28JRmV9W//XUu5DKNJIC1TNmYY7v8K/DMCp0E/fPu72F+cw8qncSyPD2N1fEig34jOvzXSjc3BDuyMdKk+/kv97zHb+Rpfu9qw0NeB2cEeTI4MYmr2K3ZdfkTOzi/OoO7axUX98Af9rRPLBxuKzO4c5AcGfyQkmbEczOd65Rn/MMkzEwg+3tvEyEAX3rx6gtcC/E8fteB+SwPuNtaioZqWY/YPzxcILFCW48ICw9Jv9uvPk+lvsvzo1XOs7G0LCMcRP0vnXNXjKlI/gZdD9BGY/QnDKu9NRXCqB3AQ8+BI88KVCQvEC3wL0IfPBJwF9v3JIFxxD/b9R9hx7+Mw6FCu9LS6R7IC3JmkwH5CjklX/SxCqXOEkmdy3rRAusB4rrGBClMC87TKK8mysuoT9tW2cjx6IqR1gX1DnI9JvpZMKs+FKLskyJRD6wX4PHRjqkYAYLcFWvjpqk9rvfxWKqQL5OfgnuL9YCMDGwPoHWBIl+PHofF8kq9JXlzu1+bWOtrevFD974tN6Bd4rygtVEEVOW2sq8Kzx63o7HiH/t4u9HR/wJvXr/Cw9R4aG+pRVVmBEgF4xltgwMWS0hKBf8NboEqA31RlmcC/5FHsxsG8aq5jgwAbAETMry4vQ11VJZrl2A/vteDli2cY6O+Vb9Ei3B4nknJvjK4/RjA/VdJ+ojxyk0AghK2tHWOYPgHmzfVtBdTLy6sGYP+i7v5snLjQHwF+Uzbw27Jly5YtW7Zs/T30I+CfmppS9b6bgP97kHY9j1B/eHgoFcs1qVAabv2ccvng4AChUEgBIJN5zJuOy6TWXe/wrhLzZJ3lH6vtRhPApayJ67KC4GdIyjrBcXYBoHsvre3ye7MCQ1owAOfeLrYXvmL14xhWxwaxPtqP9aEurDOK/2gP9j8OYGnwAz5/eIXP719iaaAThwsz8J4cIhKNQM9eg32miwsyZszrvEzXr/bXT9ZnRthn3AcO50hm4PNeWlpS8SDoJcxGAOsz5/bfe+ZXk2xznkE04MH87Ge0v32BF09bRQ/wuLUZ9+/Salwl4EeLbz5KBTaVld+07ueAnxH7f8u7hYqGWgxMjsER8CKeTSlXflrOw3GBXlqyBfTpWq+Uohu+gH8qDLfug0v3wp3wwal5cBI+xZ53D+uHq5jfmMXHuXH0TfRg4GO/LM/DGXAKeEcREzhWXQWSKYHuNIKEfSkcgcQ5/DoDAWbk/MmcjGsx4d8AfQO0o8rKT9HNn/3vBeBp6c/IcjopEJ6CnkohnhDY1+V8WgJ+Bh2UZTY0+OX4Cv5p+RfYJ9ArbwIRuxGwDz+B3wD9OKLs5kCgT+nQ5TxUQs6l0+sgFobH54ZLwPn49BDzC7N4+/YV6htq1P0vLLilphXsi194G2XF+aitLsPTxw/waXIURwd7cDlPsL+3jaXFeUxOjKOrsxMvnj9Dy90WNDQ0yrEaUFtbi6qKCoF4gfligfniQlQI0FeVlqCmokxBPUG/RsF9hQH9ajvDs6BStjNVJdvX1lShpaUZPT1d2NvbUYH8mAzo//n3jwH8ThnAb23zwqqvLPwC/YRpBvYzYfpXEa+Vngicqmtjo0SuYeIPA78tW7Zs2bJly5atX1dmvc3qpWnOs443PT19ZQx+azIrxT+qHHNdNBrF/v6+VCYNyKdo5Wf0fwIg1/n9fmUNvulYzFMyIVhN+D+rjGTNMYHfquvrs/KPLv2EfoKkAn6r54LMp7Q4gm4XTjbWsDH1Ubn4Lw91Y43QL1oW2J/pa8dXmd/6PAbv5jJSfhfOBYp4Jh7timXfPDmnuQnv7tU7bG5o1a+drB4ffJaM20BeMLtyEPjN6d7enoL+mxqSfpx4H85wJrB5fLCFof4uvHr+CC+fP8Szp/fxWLn21wlQ0u27QODSsPAzgB+hv4jAT/AX6L8tebdl/eNXz7G+u62s5nomlYvQL5Cbs2hHBX5j7F+fjiGelWVGtI95sOvcwezGDEZmR9D3uR9dE11oH3iL9z2v8K77Jd50PEP3wDssrE7D6z+FroXlvtASnpDjCoTrtPIT/M8QlOIXTJ4LcIsSWYHstCgl29H1XiBf9qPLPKVxqkueJuCvgvdpBvwL9EdVt4SUXC9HFhD4F8hXsB8XyNdTAvppBFJpBOW+sztBUICdQ+8FElE5Pz0UBPqV5HiiuNxn9vU3rPdyTjYACOD7Al44XKc4ONrH8uoSpr58km/GCPr7e/Du3Ws8fHgP9XVVqGRffAX7haoBhmJjTEVZIRrqq9Db8wFHh/tyb2JIym+IRSPw+bw4OT5RXX8W5hfw6fMUhofHBMz70PbqNVpbWnCnvk5BfkVJsRJjA9CST4u+uWxdx0aA6opy1XVANQzIlB4DBVImqqsr0dPbBa/XrUoYv3V/pFzy2xQJ5wL4CTybln0F+6sC1DJVoG1C9a8i85py12pa+W3gt2XLli1btmzZ+gfJrLdZ629W4J+dnVVB9m5y3zfh/CZIN5OqDEciyqpL4KcI+RTnCYOcZ+XedPFXcG85Jue/tQBz3qpv0/Utrou/iMB/rnrVE8kN675aKUltJ/9jRO7zM4GAuIDR8QF2vn7BwnAfFgQ2V4d7sPFxGPuL03DvbSDpdeBci8ihLhsQBE/ln/WgohuA37jD5gY36fvp57b6zyQCExtwyAps3OHz5XOmZwdlLrNMBIPBGxuTvp/kF7JRRu5YNOTD4twXdLx7hedPH+DFs1a8evEIDx/cQUNdBaorBfgY2b04HyUC9wwMZwJ/UUEBCosKcSv/Nmoa6jA2MQ6P34ekgB7HbmcgOwa00wSaFfSzn7pAcSwl4J8S4A+7sbK9jJ6xbjzpeI7HnQL4A+/ROdyJ0U8DmFv8hNW1WWxvLcDj3EUq5sO5HsFZPIyMlI8kLeYC8gzAF4wT2NNy3DOZZgX4Oc38APhz8E3g1wzgZ+NETOA9npbtRRyOzxzSL5RMIZRinAB2HxDYl2Oqvvxs2BCoNwBfriErx8vK7xUxaj+7EtDLIRAOwuPz4NRxgr39XawI4H8WwO8f6EN7+1u8fv0Sz58/waNH93H/XjPut9zBvbuNaGyoQU2lgHgO8MvLCpQqKwzvC47F3/rgLj59moDL7YAm90KT+07PkLjck7j8vkg0jkAoDK8/CKfTjb2dPSwtzGFyfBQd79/h2ZPHaL13Fy13mtCoAgFWory0BCXybBnYjy7/lQL4hut/ier7zxgAVVVSPqqNbgMFhXloamrAzMw0dLmX/M6Y3ic/m1Jyf33eAHa295SVnzIt52wAuOgz/4tIXVPuGpUHggC/6oawtGoDvy1btmzZsmXL1j9J1vob63TMI/BzyuX5+Xllif1RugriVxPX0WWf9UYT8jklCJqu/bT4EgA3NjZwenqqGgiSAirW43L+6nk4T0Q2xeXvX8dNiR4DZwL6l8H9zONcHt1Ay1wur0EgKe5zw7G5hoOFr3CuLyHqOEA6GsC5wBOyaRKv7CzKgSnPYtj5RfwN5mmMU6mJkZXb5orMDXMb35CsW/x4y/9MIrCxqwafM8XnzOfNZ23O07uDy3zeZvDGq8/3e4mNL0bjTFag1HFygNHhXgG/+6J7ePP6ibL0371Ti7oaAb1yBnYrQFlRAUoJ/YT9vDyZMmp/gRGxX+Dw+bOnqvxp7MYhMByJCXjKfEwBP4E8LvAbETgPyzzd3YM4cB5genkGw7OT+Lg2h+WjbeydHsDlOUE86kc2EUIm5kU66MRZwIGM+xjxox1EjneQ8DuQ1oNIyDbxeEBgN5Kz/NOyT7f+lCipvA5iSTYOMCieERjPAH7JF3FMftPKr/rVC6RHMwLqAu+BDAMDMvAgI/xz7PwMNAFZXaTRkyGdQFzWsxEjyiH6EgzSF4Ir5MWhAPjeyRHWtzYwNy+APTmOvr5uvHv3Bi9fPseTJw/x4EEL7gngtzQ34W5zI5oa69BYX4M7Mm25Uy/z1eCICbTwM2hfRW6YvRLGVpBpuSzX1VXhfftb+T5sSbmJKuiPypSNGXFdru9CbISR5xCRey/fI6fzFHu7O1hfW5WyNI8vU58xNDiA9vZ3cm2PFMDX0wugukrOW6ai+ZeyK0CpgH9FOSory1FRWYYqgf6KijKUV5TK73qBXTnmH2uAyiUpurpc5+mp07DyCzibFvRfEfgpE/Ypwv/iAr2ulu0+/LZs2bJly5YtW/9UmSMvWYGfYEYA/1H6EajRMk8rLi34hHor6JvWfeZR5jzdvelV8D3oP2Mfe/XPAtKscSv9fOK+2XP24WcF3zyGkTjHHK4hXrJZwLDSi7IZZPQ4UvGITKOykq773Mpcn5O6dnUW+ZeWudx5rl2uudXVhgdT5oa5jW9I1i1+vOW/J5nPhYmu0ByBgc+R7vtWy775nK2NPOQJBvJjBH/rs/5+km1UnAXeqyx0AdTlhRm0vXqCp48F+Nue4OWLVrTebxLwrEZNFa26hcrVm9BfnJ+fA36O0X9bufnn591CbW21lPtx+PwC34mkgLWhsAA1A9ux3z3703NIulAuij8B2RPywRl0S34QyawmkB9FWoA543Mi6zlF+mQX8a1l+BemcDQ+hI3+TmyO9sG5Ng89KNCfCks5D0OXY8UF5OnqT8s+++8T9o2I/TGjSwElwE+LP/vwW2UM0RdHJBVV4/FHzhOInCXUOPt09Y+nU0iks0gJ7KfYv1+uPxINwhd04dR1iO39DSyszOHj9EcMjAyio7sLb96/x6u213j+/BkePXyAey3NuHunCc13GpXu3mlAs4A1Ab+poRb1tVUqAn+1wHN1RQkqy2jJZ7eKfOXSz3H3OY5+UVEeSiS/RA25V4wnTx9hfWMFsThBP4ZwLIJITH5DPI5QNJpTDAH5DnE0gaisC0VC8l0JIBgKIBQOIiDzLrcLxydHWF1bxcTkBPoH+vGOI2U8e4oHD+6j+W4z6hvqUVFVgdLSXBBAWvwF/osYTLCiHAOyD79XfyadZfmtC2N3Z9+AfEt/fiXO/yJS3Q3Yf5+WfcK+gD6DDm5sbNnAb8uWLVu2bNmy9U+VCfyTk5MX1n5CuDkG//fSj0CN1jJa5Gg9JeQR/DhP8FtaWhQZQMio/QRBs18/65kER57b6l5L2M8qN3kisvF/SoGgkmX2QpYFy7w6wkVU7tw6BgTkWNsyT6QkpifkfIKjiuHVfuxeINCv3P+5nxXUzUURe0Gow0k+gwNeAX5KHY+JC+xWQOV2vrKRqZuTdQtzr/9k4vM3+z0TlvjsCPN83kYjzqp65mz04XNfkefMZ811nO7v7/9uo9JlMn+lcY/Oz9JwOQ4xMtSD1y8fCfg/xutXj/D0SQvuNdehvqYc1eVGFPeyosIrwF9wW4C/KB/5BTItKRS4bcPm7g4iegK6wFsskxWQZ1/7JKICy1EOn5dMCegnEKOnh/zehMB0MuJH2nOIzMk2MgL32vwX+D8OwyXXdNLbgb2ONuy8e4XNtpdYev0KK92dyjsk6HEgnhKAz3JoPjku++Arj4JL0I8mBXCTYYH2iKw3A+vpCMn5w9xHFEnTNZ8u+LJObReRa48jLtIkT9NlXiA5HAjC7XDgQH7jxtoSZmY+ChgPon+oE+8/vMKLV0/w+EkrWlvv497de7jb3IKWZoH85jtobmxAU30dGuoI9jVq3Pv6mkoVHK9WgLmmkn3jBZ7lPhLwywrz5H7nGVH5Cf2Sz/H1y2Qbjs9fJHkcto/A/+Llc2xsrQvkc2jAsOpCEAwL0EfC8IeC8HNeQJ8KSF5ItgtFjWlEYyOIJpJ7Jr8zwm43kRDcPi+OnafY2d/D6uY65pcX8Wl6Cr0DfXgm52u5fw937jSipqZKWfk55B9HA3j4sFWVSzY2/pmUSkp5dHqwuWFE6jfhWrn3X4Pu/6as3Q3ojUAr//7+ITwenw38tmzZsmXLli1b/yRZ62vXgZ8ikNHl+nqyQv7vAT/7cxPql5eX1PEM0drLyrBh+WWeOWWFm8BISDw+PkY4HL6M6C7/CP2XwG/8M0DQIl6TksDhdV2Bam6fm5jiZsZEIXhS9qHScjx1XiH5M/ld7NfP384GgzM2Qpj3QSY8jTL0y6LyIZD13NtYaUyUVOJWPJM1ln9u22/0/fRzW/17Eu8DA/XRRd+AfXpzGM+Xz9q08hvP+XKejQJ8zm635w9a+Xl/jOeY0CJYXf6KzvbXAv0P8eb1Y7x88QCt9xrRWEcg5VBudC0X4BfYLxLQZ7R+uvOz/3aeiH35axvrMfbpEzyRCDR5xhwbP5jKCExnZT6LkMBcUCfwpxCVa43I+rgmwH68B8/UCI6623D4/jmO3z3HQdsT7L9+guP3r+Dqbod/uA+RTxMIfZ1GaGMVkdMDRMIeAXeB2Kymxs8PCJwzGr9pzWdU/6isN2BfIFeAn0H1QikB/oxAfjaNyJmh6JksyzEisk0kKdvG/PD5nTg9OcTulsDd4gJmP3/C2OAAujve4u2rZ3j65J4A7h3ce9CA5pZaAeA63GluUFb8lkYB/YY7cv/qUFdTjbrqKrmPFUbAO0a6Z0C8YgbFM6LlMziignuB+PIiAflCmcpyJV356U6vxtcn5BepfvME/cqqCmV5Hx2Ve3dypICfIB+MBBEi2BPwBfYV5MejSgFZ75fnE5BtgzHmcZ8ogpLPddyWU26rhhrkCARsBJA8TzCAQ8cp1uR+zM5/xcTkuBGHoOM92t68xsNHrWhuvoMPHzoU616m3y+T2ax8GXJlNxbTcHBwKN8xWvmlvN8A3D8vs6Hg+vR766zrryvncUCxv77yQmBj3JZ8Z0/lOxtFOp2xgd+WLVu2bNmyZeufJNbX6MJPyLfW30wLPyGcIPdHkhXaCPx0zzeAnxZduu4b0Lexwf6jrKAaFU8FhmtcNqL408WU1rGDgyP4/QEkkwRi49hW1L+aJI8WeJrXc8tyQSJZNnUFqHPp2wOpLHPLjBwjK+L8TYmwfwH8ucQl4xjc79o5r2yqzpCTuY2pn09/bq+/JjGwYSgUwc72LhYXlhRQbLB/MJ+n6r9sAAbLgAH8tHoaZYLLe3sHCASCqjHlelKP79q9Vb9SPUs+7wz8XiemJkfw5uVjtL14KGrF00d30dIksFpVgqqyQsPFnGPy591SrvwEUFr38wT282S5QGD02cuX2NjdVUBPi35UoJ7TUCIJv6YJ8OsC3wL9SVr+dUQJk3t7OBwdwmb7W2yJjgd74ZkcRWDmE+IrC8jubwGOA8AvEBlxApoTZ4kTxPUDOcYufElK5lMuOV84Z92P5/rk64hlEohlTSWhCeDHMwL6aQbli8MbC8ERdOPIdYK9o31sbq9jbnEak59HMdDfjQ/v3+LVsyd40nofD+/fxf27jWgRuL93px7NDbVorK9CQ4PcJ1GNcsuvFLivRm1FtUB7icA6x7OX+yeqKS1GTYnczyLey2KUyJQAXyJAz+CIlYR+1XXC6D5RwtgJsn9pcTHKS8tRV1uHu3eb8fjRI7xv7xC4/IKD/QOE5P2OCbjTnZ+gH4nIPYhqCEcF2AXsI6KwgH4wRA8AAXz25VeNAUH4g374Az5ZDiAo98IfDcEn+YGYgH+uC4YaXpDxAUQccpGeA24GInQ5sH+4j529XfVd6u7uwaOHjzAxNo64XI+RVAFUjXyUKnOXxU9N+Z1jQyST6dW0tbWtvmOqkesCug2Lvyr/6t3IDd8noH7pBcCpVZd5a6t8pwytrTDQnrFuTeVt5eaZZzaeGg2rxneXDamG+Ft5Dfty790eL+IxTX6b8Y7ZwG/Lli1btmzZsvUPEutrJvCb0fnNehyX6Yb9Z9xbTUBj5Zeu+bTiGi7crHz+vpQbrMhoCFjH7s4eXC6PQIH2uxG0CfuX4GhchzG9ST9OP7fVX5H+c2f6K9J1/qZl0OlwKYBZWlxRQMJxvgkohJCV5dyzJfyr52uI4MFlWhlPjk+RUo06knLHN8GKDQo3JyM/K/C7t7WGng9vBG5b0fa8Fa+e3sPDlno0VJcK8BegpoJR24sE9gX4OR68AGwhQZ99+VUAvzzU1FRjZHxMAWFCylmcwe5EHO8+pOeAP8ko9zp8Ao8RTaDc50d4T6B1YxOh7S1ojiOkQy6kY16k4l5kEqKUR37bKZLaLuLxNYHXOfhCn+AKjMMZHIUn/BlBbRORlF/E8e45lj4D7J1By54hmmG/fl1Zst1eF45Pj7C1t4nF1Xl8nv2E4Ylh9Arcd7a3423bKzx9/gj3HxpB9e4138GdRrkP9TVobKxFUxMhvxp36mpQL3Bfw+HqqhjErhRFpYUoUhb7UoH9UgP2S6kCgfk81Mo9qy0sQlUBLftlsi33KUah7FfMvvpFVKHat7K8UvWZv3uvBQ9bH+HNq3cY7BvAR/muzH39im15p33eIPRwHFooiqhAfJiWfJlGQnJvQ3K/IwLsAv0Rge+ogH5ItguFjTw/Xf8jAcnzCfB7EAz75f4E4Zc8PxsC4gL/WlieUwS+aM5TIGo0KITZqKDJeeR8akQGea6xuKYA+cnjJ3jy6DG2N9ZxlqHnjVEIs9kMshkBfrNMGuyfK5tsBOA3x/ju0FuFvGxANxu1zPgVBoAbjZ1GsDzlBcDvXQ7qV9U7Y5WZz29oDvzl/eK6Zb5XkkfYX1/fVnkm7KuGBjmX0bgg7+XSkhLzt7e3LwKkZvibLMkGflu2bNmyZcuWrX+IWFcz63Em7FvXffr0SQ2dxsrrH00m8LNfN8fxp4XfgDtWWC/B/rpY6aVV2IwezTxWwgmQW1s7qp+pTwCLx/3W6ns1cf2Ptvm9/e30/XT91ul6UnliLAvAsE+weo4EfgERq1XSfMYm4CjgUVbIDSlr+wgFwxdwzzYb1W6TO9dNj8uMv6Cs/O5TfJkcwfvXTxTwv3zSgsf3G9DcQIt1seHaX1GEkiIC/i0UMkJ/oTFMX75Af56oROD1VdtLbO1sK2twXEXJN/rsR2UaFtAn7Ic47J0K5JdEUk/gPBZDJuxFMnKKhH6MRPpA9tlGILEq0LkEb3wervA0Tv2TOPEO49jdjyNXH048/XD6huAJfVTAH8sGERXgD2uE+zg8gRBOXB5s7+9jZX0N07MzGB4eRE9PJ969f43nLx+j9XELWh7cwd27TbjX2IS7jY25KPW1AvkC+ALdnNbSel9biaqaMpSXFRnD1DG2gYpgX6x+e7GI0zJl2ZdlZcHnelrp81FakI+S3+T+/ZYn964EhSVlyJP1BRWlqJDjNzbW4/7du3j++Bk62zsxPDKMiY8fMTu3gI3NXRwcHsLhPIXH60YwGEE8piMRSyIeias++j7Vhz+CKIE/qMl8XGCdwfsYZFDuS1gUkfsf1eFVrv103891AxCoD0YE8sME/oCsD8ATkynBX7YLyvbsKhAMyzlCjAsgkvywPDsOb8ghAFkOnz55itrqagz29yEc5AglLHg5mJfZC9hnkmXVuCiZjNFhxOlgTIuMCiq4pzwHjFgVBH5+B43Grhzg00Iv4jdPLSsZMH9dfI+W5N1aWjS+owr6lZXf2JfreVyjUe3yfGxsNRsAGCuFI2jQ64pdtdggez3ZwG/Lli1btmzZsvUP0feA36zHsc7HgGr/CvDTO4CWJFqd6KL/e8BPGZXXSxEKzajXbDTY2dmFx+NVQ3iZlvyb4N7MM/KvrmO6vr2dfj7x1llvXyQSE5jYVs9YuRkriDHcjAkiDGJmWPwJJLnnLHCyQmukLJuNOuxLbHTdIEgRnIyT8FwXThu5xGdPsDKhP5OM4WB7DYM97Xj97AGePGwS4G/Cg7v1aKwrF+AvQZVAf1lpvsDqLRTk/SYQW6jGbM+/fUtBP1VXX4eJyUl4fD5jyDsOg0fXegI+g+MlEjJNISbUF89y3H7NGGIvfopIbAP+6AzckVGcRvtwHP6Ag+A7HAbbcRzsxJG/E8f+HjhCw/BEPgrMzgi0LgjsryOg7cMVceDQdYKNnW3MLS5h8vMUBoeG0PGhA69evcDjxw9x//5dgftG3GmuQ+OdGtTfMdzx6+tr0FBXjYYauuNXorqsXMQ+92WoLC2V380o+SUoKStGYXGBCpxXXC5AL8vFqm89I9cb25XIMocrLMjLR35+gWxfhCLJL5ZtCgvZJ78M1dV1qGloQp0A/t3nz/C6sxP9wyP4/GkKqwtLONzewenxEU4cJ3AH/AiofvgC85qAvkwpNea+gDaHQfTLelrj2edei8RFCQHypEB7Aj5RkIpoAu263LME3GwQict+Aq5Bdrdg9P5oREF/ICqgH/bJ/fTJ/kF1bq5nY0KAgQCDkke3f4F+xgBg14FgKKLK5PNnz1FUUKCGG1xemENani/Ll5QwVRBVucwQ8lUxVIllkLB/dm6M58HE7ya9m4zGTsPKb1rbWd75PeP7wHKvQP3ad/Cq+N4Yw/0tLxnviulBo7xn1DvHY2yofBPyzeCZPDcbb3k9vOdsMP1e+sPAb8uWLVu2bNmyZevXFettpju/1aWf9TvW+WgN+qPAbwVp9v9nvZEVXgX8ORj8ni4qwDkwZMX4m6lA4ubmljouA/rx+qznvIT8y3nrejPdlGenn0/m7SOI+3xB9WxogVSWR4EZo3HHsEBuCPDzuVqfJZ+xCTpmtPCtzR0EAiEF80zWR6TmLcvchqMsyFxOGcRCPizMfMLbl4/xsKUBTx7cwdNWurXXoq66FDUC/BVlBQL5eSjMv4Uyuq+XFCnX/sKCfOQJ+NOlve3NG9WvO6as/GbkfJGy6gv0M4/96JmnR6ElAgKyx/CEF3HsHcWBT+A+9B4n0Q4lZ6wHHk0gPzYOb2wKfm0B/tgKnP4l7J18xdruNGaWPmFocgidA9148/4Nnj5/isePWvHwwT3c55B4AqB3murR0CBg31iNxiZjWt9QiZq6clRxCEIBeAbKqy4pRVVRGSqKSlBeVIRS1d9egF7ySwTci8rkN8t9KKooRDG7OXAEAwH54oJiFBHwC24L1DPontyzCnoGyP2704Sme/fw4NETvG57g/7eHoyPjeLjzDSmBShX9g+xd+qC2+lCzOVEwu2CHvAJ0IcR0wWoEwLkWhRxgfpELAQ97IcmijPavq4hkIgjwICFAuepYAipMIfmS8KrUTr8OSinW38gEodLgN8Z1+HWEvDJVLn+R9g1IIRwJCDb+OCW43uUe7/sG5PjK+AP5Sz8uQB/AvzsRsAhGZflO/X8uQH8bAx68+oFHCcHqmzRi+RMxELIsni1PBpl0LDwm2X3XMH14eGhgu/VVSNehdGf3mjANMGd78PPie8MGwgMjxn1neR7pN4lI4/dY9iwQNjnqCeEfV4D4wpYhzr93vfPBn5btmzZsmXLlq1/kFhvI/Bb63Gs21FTU1MqSv6PrEE3JWtFkm6jR0dHUsFdEaD7MfATBAmAynIlU6MyK+tEqkKbE5dZYWblmdZ+Rnhnw4K1ImsCIxOzTdnpr0vqnso0nc6q+Arsu0+XfrryG94YfE6EecPaz2fHZ6zWqQYB9i+WfIET5hP4mXd4eKwinVufl5oX8bGa2QySyH/KnVqB2BnOMkmcHu2i98NbPLzXiKcP7+LlU4Hm+02orylDtQB/pUAx+6SXFOYbEthlcDk1Jn/+baU7zXfweeqzgKFAUjatgJ+WZwI+FWD0d0KqTAPxCMLJsMgjIL8nkLkIZ+gL3NEpAdFpAc4ZOHzT2HdMYXN/EksbE/i6NIZPs4MYHP2A950v8fTlQ7Q+eYB7D++h+d4dAfk61eee/ewZWO9OPfvd16C2znDJr6wqRUWlwLz8lrJSNlrkC8znybwxFF55fhEqCgj7HI6QLvqlMi1DaWGZAnta+AtLbqOg9BYKiunxUCTrSlBWUKr2qZFj32usQdujVnS9bkNfVyeGx4bx8csXzC8tYWt9DafbG/Ad7cHnc8lvDMMjzywQ1REXWE+fHkHb3YAm69PhAHS5T0Hev5jAPPuNB31IeRxIeh0C/SEjmJ5uDEOoheR9PtlD0nmMSDgs95BW/DhCsTDi8jz0YAAxBu/TdHgSSbjYIBCT5yLH1WR9POhBNORGJOrNWfoF+KN0/zct/CEBfPblZ9R/DgXIsf9jcLm9mJn5iscPH8n9LJHykI+aqnJ8nBhBPBZS5eucFnzlUSJLwvbqM8MiqEDf2vhkFFjGtvD5fMqVnt9Ao1sT3w1DfC9UX/7ce3HTd9Eq4/vH98V4t7jM943fTKMLDdcZln2CPj20PB6PGt70Jvd9fiuvg/8fBv7r+bZs2bJly5YtW7Z+HZn1NWu9zazHTU9Pw+Fw3FhRvCndVHnUNO0S+FUAvkuI/0YXFdqrgG/qYhup1NJNlh4DjDhNa//pqQMhgYDr1n4zMcuUnf6aZN7PRCKFk2OH4c4v0KKAXwEJIYbAT9dl9kM28y7hxrRw8vla85xOj2pIuDgPQV+mhCy1rNYY6ZxDIgqUc8o1WjSE2akJtL14jJfPWvHq+UM8EfBvbqxGbTWDyRWioox90guMgH3sl07gz6eV34D+0tJivH33Frv7e4jTui9AymHgCP507Wdf/mgqgYgonNQQycRFIQR0B1zBLRy5FrB3NI317U+YWxzFxKde9Pa/x7uOV6rf/cPH99HSKtfUcgeNdxrR0CRqbECdgH5tvVxnTaVcaznqBDjrK8tQwz7yFQLucu3FtMoL6BcL5BcV5cn130YJvRWKbsvvykdlqfy+gmJUCMDTul9cUCCSaX4pim6XoDiPcJ+PsmLZR4C/So7bVFeH1ub7eP7gGdpfvcZQ1ztMDXVjbXIMh3PzONlid4sDFdXe7/ci7D6BdryDtOsQ6ZhAdpLBDNOI6WmB+SBSm8vwfhyCY2oc4YMd6JGQ8pbQBLQTHjdiO5sIrc4htrsG3edRDTwcRz8WDyB6LOvmPyK0MougQL+fkfv1mECrHDfgQsZ1BM3N7hMC/YkEPPKN8UVjiAb8arjD4OGWXN++nMuNqAC/T4DfJ+cNyDYqwr9AvwH8khfJ9eEXIHa6PJic/IS7zXelbLCRhPEe8vH00X3s7WxIGaSnExuXjHLJUBPZTM7abwF+5d6faxTgOk3TVcPpZRwTNnblyjpjlUh5N7ssmV4x35PynpGpeofUt5ANBgL7zFcu/2w4W1FBAcnrRlC+q0FO+X282iB6+TZx3gZ+W7Zs2bJly5atf5DMOhvrc2bdzZx+/fpV9fm0Vg5/lFhZvA7bBH5WdunSalR2WXG9BvoWEQhV5VemXFawb7X2q0ouXcRZ0eW6y0q01drPfraU9XI4b8pO/3oynrcx7vj+3uEFsBNCFPDnoMTsW8x15jM01ln7Il+up6WfAfwYF4BDhSl2MoE/N7U+QoK+YXk1oOvsLInT4z1MjA7g/ZvnAvyP8PzpfWNc/voKFbiPkMuh5gpu/ya6LUAs8CywT/gvkGmeAHRjUwM+T31CUKAwkU5BS6Wgy1SnxZ+Wfiln4YQGV8iDPcce1vdX8XX5s8B9PwaH3qG7+yXev3uKly9a8fjRXdy714Am9rlvqEJdAyPYy7S+BnV1tairEdCvrkVVZSUqK8pQWS7ATnAX4CwvzhMAzUdxqVyjKL8kD/ml7INfaAyHR3jPl20KBOALb8nybQF92VegtVT2L8i/Lb+JkF8hx6tCfVk1Wmtr8eZBEzqe3EXv2xcY6+vH1NhnLE4vYE/ep5P1OQH9SZxMTSKytoaUxyXQHoAmkJ2IBBE92kVwcQrx1VlkPSdICsxHtaS87ymceT1Izn3GaedL7Pe1I7S5oqz8qUQcKYFvbX8Hzk8jOBp8j8DcBFJuF1Kyry7fCi3gRlCO6Rp4C+9EL4IHWwLnQcT0uJw3gOTxNuKLn+BfmkJA4D7MIH3RsAqQF3McwbM4jaMvI/Buz0EPHEGPBQTwg/CGw6pLQEDKlAH8xtj9frr/E/jl3G63FxMTH9HU1IRiuacVZSVqJIfqyhIMD/UgHPSytEk5M76HRnk0vnmXrvwG7BtdTYzEBlN2PeIQeKY7/8W3LPd9M795xnfu++L7ouCe+4u4r/k+ccp3iYFNGZSP396bvt3Xv9HWZc7bwG/Lli1btmzZsvUPE/vuW+ttrNtRs7Ozyh30rwB+WrfMIdl+JCvos2LLCi3zTEDkOhP0TbESbY4vTWv/8fFJztqfVhVya+LlXbtEO/1kugkUmMXx0YqnWIAAAP/0SURBVHe29y7AQ0F+DlCMfsUG0KtnmrNoclvl8SFT8zmbz5zHILg4nW4kEpfdSaynN+d5DWY/fkL/WZZW2CySSU2OsYSuD2/w4tlDpWdP7uPunVrl1l9VIUBMt36B+2JKwJhWfoIeATkv/zfVl//N2zYcHB1ATyXU0G0c+90lQLtzsI/ljXXMLMxjZHIUnX0f0Nb+Eo+f3ceD+42439KA+831aMmNdd/cUIOmRgJ+GWrqSlBbX4Ka2lJU0TWfgfKKSlFSWGK41hdx3PsCBfq02pcIxBfJVLnhC/DnyTzd8EsERrltWYFsmyfQn3db5n9TqpTfU1tRirqacjlnFZrv3sXjR8/x9ukb9L1+jy8fPmBtsBO7E/04XpT3XGDU5/Ag7A0hFfQjtruM3ZEP2O5pR3h+Duc+N870KLJ6DOmQH8H1RTiGOuGf6EP6cAfpaBRaPIlELIHz01MkPw/jtO0RjnreQd/bRDYaRFqL4pzQvr0Kx2A79tsfIDjVh6zbgYyWRjKqI+F1Ifh1HI53rfAMtCGyv454NARd15D0e6CtfYVf8o/72+Bem0NU8riejRDpkz24Jgaw3vUSxzND0F3bSMf8AtsBeEMcmz+moN8vwM8RATi+P/vwM3o/Lfxen19g9wtamu+qslBRXqI8QcpK8vDk8T1sSnnKZhIsdaq8mYnlz2hsYhlkgxOXzUYBw5rOblEejzE8Kb9X5neN5V9Bu+Ub+COZ75F6X3L7GZ5Oa+od5DsTjcaVVd/6vhrv6rff5+uJ623gt2XLli1btmzZ+gfJGqzPFOtwJvD/KxZ+zhP4WW9kf9ILy9YPxErsBQDmpIA/J2sF2cgzrPtran+uN7Szs6csdqz8qrGzc4mXZ1qJr6ebrt+6/L+ebroXzAoEQwrQzUYZw6rP58Hndw34c8/28vkZVk0ryKiyIPvv7uwjGAgjm82VvxseBcsmZTwrwhYbCIztfQKP7H/d9uoZngvwP3/aitb7TWisr0R1hWFBL89ZyAn9CvhlSuDPz7uFvLzf0HSnEcMjQ1heW8HSyjKmpr9gcGQY77s+4Hnbazx4/Agt9++hpaVZtjX63bOvfXN9He6KmupqUV8joF9djtqaUlRWFaKsXCC+7JYAu5xTIL4kvwSl+RUozi9DQV6hio7PGAPlAveEzRJa99n9oLAAeYV5KORQggW3UXhbjiGgXyH7VxeVob68HM21lXh8twFvHt1H58un6H7/CgN9HzD5cRJfvy5ic3ENDnlO7ulpnA53wzXeB21nHWeREJLxBNK63D8tAn1rDnvdL7Df9Q7a8pI8ZB+yAuxUWiDbP/8Fxx0v4RNwz+xvCdDHoGspJOQY2eNDaKM9cArwu0f6kDo5QlKAXBe4hsB3ensFzj6B9vf3EZ8ZVMCfiqYE+BNIupwIfB7E6esmAfvn0A5X5biybyKOhNcJbX4SgfZWODoeI7A8g2TALVAfxnk0iPODbfiGOrH5/jGOP/cg4dhEOiLfAPbhVxb+OPwcDUAAn8uEfhW4T+bDkk/gn5r6gnstLSgtLroEfnkOjQ1Vysrv97mknLF8XX4buGzkGcBvrjfWXW4XDkewu7tnfK9y37a1Ffm+qe+W9X3Iufqrhk2zMUC2ye3HZTaWGTFR1rC1uQ2ObsFgl4nEZVC+P5O4rw38tmzZsmXLli1b/1BZ626c/zMu/dbEZQbtM136lUVXoM6owP57pSrOUjne2zsQ8AsgmUjhPGftZ31cyXK5vFZTNy3bybgn1xPLhtfrU+CxtHwtKKOCeAF8JT73n3j2sh+3NRsCTk4cUoZoVf02WZ+RIbOc8jrPkE0nsL+7id6eDgH+VgH+B3j6+B4etDSgvroUVQJzhP6SHEAbYvT+2wLetxT4l5WVqDHtnzx9hOcvn6P10UNlLW9svqNU18Dx7gXsRQ211QL3HBavBvVVVaipqEBVeZlAe5EAu4B76W0Ul95CYdFvyC/8TfW/L+EQdwL7Jfk1KCmokrzSXMR8XtMtQwryC1FYUICivDxUyLS2uBj1paW4V1OPx80P8PrxC3S+eY/hni7Mjg1i4/Motr+MY3tuCoc7q3AJVPv8QcQFCrMuF8KzAuztL3Da1YbE5goQF8iXd5VCxIf06me4e17CPdyN1O625AWRURZ+kd+NwNfPOHzzFL6+dpztbyMbj0PTkgL8GtIHuwgNdMDx9gnCMx+R9XmQiEWhxWIAgyCuL+CkU8794TFSS7LeI+ujtPDL/qfH8I534/RVLYLDz6A7VqAl/aIwdN8JtNkRhN7cRfDDE+jr86rxISXXlpVpZn0Rvp43OOyQ6/o6jIx7F6mQB3EBekbwD8i1+WMiRuSnxT/EYfkiCvg5Br9HyvGnT59wV56vCfzsWsGGl7racrxpe6a8RpKJuCpfl99FljejzBkyl6nLxPgiHE6UXkhsqDQbv1jWjffFgHoD7A1PJgX962zkvFzPfZeWlpVHExsQfF7/Hx5J5UfJBn5btmzZsmXLlq1/qP5JwE9YXM8FiuNQb6cnTsSkUn9mWotziZfM62Q/W+vvNCHSTpfppvvB+0aIIbCYLvoXkmfwR4FfwQ+nOW8BNtgEg2HVl5/p+iWYz+nq8zrHmXKxPkckEsDM9Ee0vX564dbf0lyH+toyFYmeQ9iVClCXCOwr135RkYA+oZ8B/PIE/IuKBLAF5psYWK+hXg1RV1NH1cl8DWqqKlEjYF9VWowKgXvlNUDLvUyLRQT4wsICAX0B9+LbAvu3kEfgL2ZXAllfUIrCvFKZL0dJSSkK8uW8t/4PBXn/p4YOLKAHQlExaitqBPAb8Ly+EV0PH2Ps7XtM9w/j6/gUlr8uYWdjC0cC566tVZxMjeN4YhDOxRlEnIdIaDHEdQ0pge5zlxPR6QmcvnsGb+8bAfpVnHNc/KSOWELDmd+B1MwgPO2P4B3pQepoD+daBGkBXQX83hMEvozhuO0RwgMfcHa4i4wWhZ6IIa2HkT3eEuB/j+M3j+Cb/YhUQKBcjp2UYyPoRXJ5VmD/OZzdz5BZm0E2EIQeyyAZ0ZE4PoRnrBOnr+sRHHkBTYA/lvTJtQWR8B0h/mUIwZfNCMv+qa0VnIWDyAi0Z3xuZFbm4Ot8hWMB/tDiBM68h0iHZN9cn31l3ZffzwB+vnAIfhGt/IzcbwX+FgK/PEf24aeF3wT+588e4MuXcfj9tPIb5cuQCfqmzHyzPF4mNl6xy9GyAPviIsfHz3m98HulLPoc2tJYZ4zdv34Rr4Swz3yC/vb2tvD4qbwbISSTNwcq/bPJBn5btmzZsmXLlq1/qP5ewG8C5M1iBVoFjyM4ijY3tnF4eAKv1w8triOTkd+Uu1xepw38v59uuh/sm+x0uATwjWCLfwnwy758ZgzeR9fm01MnNJ2uyrwGOemVyzBh31inVstMNmuMl85x04+P99Df+wEvn9Ot/4Gy8N9prEJDTbmy8pex/34h+8oLgFus/Zwn+LN/PwPp1dRUoqq6EuUyX1ZeaqisFOWEfNmmVO33GwpFBUUigfsCuuIXFykVcag3jvlfnC8Qf0um1G3ks0++7M+YAXTdZ4C+ypIC1FYWoaGuGs137uBJ6xN0v/mAqa5+LHf3YbNvEPuTn+Fe4dB4p/B7OfZ8DFosAu3kAK6xfhx1vYN35pMa/i4jwK0J8NP9PevYR2CiH853jxEZIbBvCbBHEMtw5IEYUq59aKMd8Ly+C99YN9LOfZwno0jKuoweQNa5C//HftVHPz7WCzh2BfQD0BI+OY4TZ0dLCPW/xuGbVrjnPkIPe5DMxJFIhnEm0K4zGKBAuauvDdmdJZxH5dhaRsA9joxcu3+iB+63LYhOtkNzbyIix40lAtC9B4h9GUag7QEive1I7+/iTCA+FZf9fF5klucR/NAGx4eXiK58wXngFOlwUAF/UAG/wL4Avi8ShD8SRiByCfxhObc7B/z3BPjplVFexjgP+agoL1DBHp8+acHQUDcODral3Bt9+U1X/t8DfvPbwrJJSKeVn8NYspybbvq03BPyTev9RXelnHVfeQUI+DMon8/nV+77F91d/sL0h4Hf1rcavza1ZcuWLVu2bNn6b+l6/c06/9cD/4/H4f+rpYatUtCZg01Z3hDwPxJACgTCSFksY9Zr5zx/8/Xf87+ebrofymJ5dCL3+ieA37ruB7Ja+RmQbGtrRwAngExumL7riZdFsZTSEYA6ExCjZA00LYrFha940/YcTx614MnDFjUuf1N9JWoqSlAhcH1p5RdozxcQJ+irBgCOUW8E9KObd0lJsbLa02JfJCpmXmEhSvKNcf0LBeQJ+3klIgH6WwLztwrykV/APvgC/UUC/LT205OA/fPL8lFaVYTqunI0NtbgXnMDXrS24MOLRyp6fn9Pp7DWGOam53G4uoPQ+h6CU19xJNC/1z+IgABgIhRGIpVGIi3QnBYI5FB2g90C9C8QnvmMc7q7JwT4tRiyWligehueIbrcP4L+qR8QoE8moohmEoilotAO1xHqeQnXyzsITPYi7TlENh0TYI8iE5NjHa3CO9IOx5tHSE0NA74D2d+FaGwPyeAK0tvjCPQ+xtG7VniXPkGPOhFPuRCJ7iJ5OifQ3o2T961wD71B9nBVeQ+k9DiyER+yRxsIjnfB9+Ep9JkhpALHck1hxBNBpHxH0GbGEHz3FJHBHiQPD5GKadDjMdnOizSBv+MNXF1vEN2YQzbkRjIcRpRD8TFgXywKX4x9+QX0OdSfKMix+E3g93gx+fEjWu42G8BfWijTfFQK8LfcrcHLFw/Q19cu35Alge2YKlvW6PyX4ntiykjW7wlB3eP2qDgjLOOLi8uqnCu4Xzcs+ibkq6EuBfSZR/d9l4tB+WJqfH9r4rFveD3/VLKB/1/U+Jh5bzi175MtW7Zs2bJl67+r6/U36/zfHfgJnKxQm0PEMZI1p4T+vb1DOB2sPAvE3DBO9fXfYqebUywWx8G+MSTfvwz8AvnmdrR6moEAaek/ODhCLKpdg5rLBc6xlBK/TATLnmVzrv1nAlgODA304KkA/7PH9/Cc4+DfqUV9dTmqyjnmumHlLxbYL8r7zVDBLQXxBH5jyD42AAjoc+i+fAb2o9t/oezDoHvlati7wqJi5BXlC/Dn4VbxbfxW8Btucdt8BgQsREVJKWrKyuS8VWhuqsf9B3fx5PkTvO14hwGB+4nuD/jS3YGl4V5sTU9ib2MVp3TdZvT8QFzgPIDU7CIO37zDdns7QmsrOBOQT8lv1dIppOJRpA+2ERYwDbx/idTSHBAOCZDrSAhUn+sC14cbcPS24fhNKxIzozj3niiAjWWS8r5GEd9Zhr/9Kdwv7yI0PYK0/1QAMw6NwB92ILU9DWfPc5y+eYj013E5/gH0xCEC/q+InA5DW3oLf+ddODseIrw+jWT8CGFtDT7fGGL7PYh+fArH+ya4R18jc7yMs7gTiagc17uN5OZn+AbfwNsh1z43JdDug57U5PrDOPMfQ5Pz+TteIDjSj9jRgZS/KKLxMHS/C6nFWfjev4Kj+y0i20tIh73Q2D8/HBOwZx/+iEB/WGA/jJDcJ4rAHwxHEZFy7BSYJp81N99RwF+WA/6Ksnzca6nF61eP0NvbjuWVr3LekJQrs9RdF/NNXSbzu0KrPGOK0NuI0M/3RgH/Cq35hkWfkL+8vCxTuu/vCOi71Jj67KtvHXnEPN7PfqN/Jv1h4L+e/78sE/INy37uHo1e/sG175ctW7Zs2bJl678pa12E87+uS//PHYPwSFikCP3sK8t+/ZxnHrc5OjpS0G/+RrNSbqfvJ/P2cMrhD3d2do3GlJw7/iXA/zGXfm5jBjHjdHNzW+UtLCwp136Px6e6EBgcdfmMOEfxCVqB/0wuMHvGxpwzpFMa1lbm8bbtmQL+188f4vGDZjTX16C+qhyVhDsBdWXhZ799AX41L5BfKFNa/An6JUWFytrP+cJ89vcvRNHtEhTfLhfwrxSwL8XtgiLklxSjoKwYhewyUF6CpvpaPG5pwcv7D/D20SN0v3qFoe5ujI+M4vPUDJaW13GwvoHD6S9Y7enAem8HXIvTiHkYtFBHJim/Spff4hbg/zyNk9evcNLdAX1rVYA5BD2bgJZKIB2R+bVF+N89Q+jtU2RXlwCB4oQcIyViBP7kzhJOPjzD8duHSCx9xnnQJcAvQJ9OIhmLIM7gd++fwPumFfGlL8hEvEhlEgLecWSDp0isjOO4/YEB/IsfgaiAt74Ft2sU/u1XCE3dg/d9HXzdj5HcnUNG3xew/izQ+kZA/CmiE81wtNfAPf4K6eMFpCLbCPuXETv+iOiC/O7uh3C/f4Hk/JycLwBNj0CPOZF2ryM6MwDfhxcITQwh7jiS8wrwJ0JIhE6RXv4Cf/tLOHreIryzgmTY6L9vBf6AgDqBP2wF/giBX8Opw4mRkRHcaWrKWfipPNFt3G2uwatXD9Hd/Q7z81+k3PtypcwseVaZJZK6TPyuGOP2c56W/jSCwQhOT1zY3d1Xbv4cto9DmHJK1iZzB4NBBfo3fZf43aLMdX/Ft8sG/n9BY5xagJ/TK/Bv6tp+tmzZsmXLli1b/wlZ626c/zv34VdaMYCTw8JtrG+rKWF/SWB/cYGusms4ODhUw2WxD795zX9FpfmfnMzbw/vk9weUu/FfDfxcpoWfeYsL7NO8CvZdZv9ns3+++Zz4f4ql1Ar8zKOV3wiwlkUw4MKnyWG8e/0EbS8e4cWTB3h4744aI7+ukkH3BPoZSE+59RvArwL5CdgXC+Ar5Sz+KrifLBfli25zaL1ilBeXobi0DKWVFahpqsed+y140NqKl0+fou/9e3zq6cGnzk5Md3dhZXwUB8uLcO4fwOn0IuCPIukLIUqL7vs2bL17icjSrACvT2AvoQKzncWTyB6dIjo0DFebQO9oL7IHq0hG3AjrYegpHedRAfaFWThf3IOPQL65rDwAEokUUiJG20+tTOPk/WPVjz658RXnYT9SekKtz4RC0FYW4G1/KmD9DMmtJSMgXyYjx0/J9XBovBEcvL0PR8cLZNZmcRY7QkjfFKAXGF9/hMBYHTyvqxDqfSHXu4KsAv5xOF3PEN64h8hIPRzv6+CebEfauYxEZA0+9wSC+x0Izz3CaWc9XB2PkVyeQSp4KkB+JPdnHuH9Afg/voSv6zGiX0aQ8p0gkYkglvIhGTpAZvkTIp0v4Rl4L9uuyHEN4I8K8HPM/WCc7vxBpZDMB5knwM8I/tG4fKdOHegfGFSBGS+BPx9lAvx37lThxYv76Oxsk+/iZymHnly5MiHfKrNEUpeJ5fXCOi8Tflb5beV9D4ciqtuKz+eD1yvlIRBQDZHJZPLi+3vTd4l51nwr/P/ZZAP/n5GCe0MTsjxhzo9NXAA/p6M52ffNli1btmzZsvXf0N8P+BmF//taEeBfF2gk7FPcZ3mJbv2Ey00c7AuohMIX1jNTdvpxMm8R7xWDh9EF2fCi+NeAn+K45JxauwiYbv1sDCCDmEOQnZsglBOXKBP6DRyTZ5qDsGwmgaODTQz1d6Lt5WO8fi7Q/7gVD5ob0Vhr9OcvV/35Cfq3BOzz1Bj9pYUC9GqM/nwU5rExIE8BYWV5KWoqy1FfXYG7jbV4+OAOWh/ex5MXT9U4/QNDQ1Lfn8T8l1mB+zU4VlaxKxy1OTGK47lZxE6OkI3EBLYzyCTkF4Ti0BcXcfj2NU463wmsrwjAB5QrviZAnuWQd3u78PV8gOPVE8Q/DQGuHaQ0H6I6o7XHcRaQ+S+TcL28B78AfXpvXYBSh5bKIM3Ah24nkl9GlXX+tOsFkrvLQCws6wT2tRTOvEEkFufh7Xgu52lDam8TCY3B/M7kGHInA17oc2M4evsQ3r4PyMrx0/FjBPQNeD198G88gG+kSs5fgVDfS5wdryObOEA4NgG36ymCK80I9tfh5F0TPFN9yPi35fir8LoHENx7LsDfiNPucri6W5Fan0IqsgdveAkudz+820/gHGuE60MzotMDSPsPoSc9AvP7iLiXkJgfEOB/Dv9QO6IHq0jEBPgjYcTkHtOiH4yH4Av74A/5EIwEBfaNPvwcgz+mJXB4dILe3j7U1dWitLhQYJ+jLeShojQPd5ur8fy5Afzz81M5C3+WpUqVsqsySyR1mYzx+i/zrJ8ajkLB76ypm75DZv6PvlG/t/5nkg38f0ajBuRPjE6IJjEpLz5f/olxAj+Vu1/KvX9U7qd932zZsmXLli1b/3mZdTdOWb+bnZ39w8BvrWxyXtM0BfxrAvzsl3od8P4VEQDXri+busjnsgCniFZoguMGhy+Tyr1h2b/5t/0VFeefSjyFVb9gun4fzEWWCwYRI+gTyq/Afg74DbEB5ueAn/uxcYCwr6KYy7GNxgJj2L/trW15buGLMslrUeI8r8kypUu/ce1qSUmLh7E4P432dy/R9uKx6AmeCaTfb25AQ00FqgX6q8qKBfKKVPT9MgE/wn1FWSkqK8pRW1ODpoYGtN5/gOdPn+LVyxd497YNPd0dGB7ux8THcczOz2J9awv7h0c4OXbA7xTw9IWge3wI7O/DvbmB4OE+0sEgzhMppJNnAv0Cer4gwl9nsNfRBsdQr+qLfy4wntRi0GNRnAmkJjaXcdz+CoevHyE+PwmEnTjPxpFIxZHWwsie7CEw3A3ny/tqaDwOqacnk4imU+D48Wdc7u+EW+DV0/cOqYMNZDgGf5LAn4SQNfTZKXjfP4W/T4BfrkEX4I8kzpBIyP30eZGcHsHpu8fwDQ+o86X0QwS0Ofh83QjstsI9VgnH6zKEh17hzLmBNIE/Mg6fQ465cAeebgH+9/cQ+DqGsxADBq7C7+lDeOcpItOy7kMJnL2tSG5/EWjfgScyJ+WsA57Nu3AMl8Pxrg6RL71IevcQiR3C6/sK3/4Awp9eIdTxAKGRDuiH60jHAtBiQdkmjJDcG3/MD4/fCa/nVK7VDV9A4D8cUhb+mPzGo+NT9PYJ8NfmgL+sSAF/perDX4dXuT78Kytzqg8/AZ6jQJhxIq4ms0R+P5ll90fp+nfoZ75Jssd3/3GtNZk5VtnA/0d1Yc3ndELB/uQ4YZ/TCQX9hoWf90wk+4yN2/fNli1btmzZsvWf1cTExMX8XwX8TBfAv/ZXAr8R2MoQ3b/pTk4LsJlnbmNuZ6xn0EC6n3P86ljsegC4/1Ky1rR/heu5IZnP9PqzZaRw3ksVcGzZfDYm2H9P5nZ/XCb8s7FGE0BjUmWO/aLVEpdzM5I4a6wxgZ/bZuFwHGN0ZBDv2l6g7blAv+jZw3u4U1+N2soy1NdUoq66UlnvqwTya6qr0NhYj9bWB3j58hXa2t4IGPZjfOIjvnyZUVHW1xlFfW8fDqcb/lAE0XgCcT0pICmKCTDTrdwfQiQYQVzmE3EdSVmf4Po4t0lA8/sQXF/C4eQwnLOfkTo9xrkmIK/rSEfDOA+4EF2dwfa7R9hpf4rY2hzOIn5kMimkkgmchX1IbS3A0fkcJy/uKQ+AtNsBLZVCRLZJJGM4P9hCsr0NoccPBMh7kBZgZ6C+SDqBjB7D2dEuwuN9cLfdR6DvNdLHO0gnU4inzpHS5F46nUhO9sH55jG8YyPIuI4E6LcFnEfh876H/+AxTieq4HxXjvjHtzj3b0NP7iMQGEHg+CkCc81yffVwdj1GbHkK58F9uQcrCHgGEN16ifBEPY7elsHR9xT67gziAvzu6BzcBP7VJjj6S+F5V4v4dD9S3gOB+T14PMNwbz2FZ7QJ3nd3EBn9gMzhJs7iAvyaH0FRQA/BI/fH6TyC+2gPrpNDOF2n8PCeRyIK+E+dLgwODaGhvk6NyFBeVoyykgJUlBUI8Dfg7ZvnGGEwxc1VxONyL6WwMeCn0R3o22/k9fflP5Xo0ULPA7m63JRiHmW8ETfJfEts4P8zygE/XfgnRw3oV/MK+A3QN7fj1L5vtmzZsmXLlq3/lEzQtwI/xfoIXfo9Hs+/BPzKpf/kGKt/KfCvq8BWBuzzuLQEc1grHl+Wc3kG8BP2VwTKFrG5ycBvHiQSif9aZfwiWWvalMGjv3S6fs9M4DfGDDf63d8M+VZ9+yx/WjnPgc2NLfh9AWQzP1cur9/oeDwqx1hFX/cHvH72SOnJgxZl4S8vKURlaRGqy0sV7FeWl+WAvxH379/Ho8dP8PT5CwwOj2JtcwtOt1cN+RYWqFeQn0gLWGeQSGWhpzLQkmnEEgLcWuJivSbr1TqZZ4NAOKojFI4iGvAh5jxE8HALsdNDpIN+gWwNqUQS5wkNZyE3Qmuz2O5+hf3B94jsrCIVYgT+tGyTxnnIj8TaDA47nuD43VMkFr4gK8fQMlkD+FNRnO9vIPHmNcKPWhEdG0bW7UAypSOWTSKrRZDZXoG/7y1cL+4gPPgWWee+QC2H/AMyuty/o2MkhzvhFuD3T44j4z1GNrGJQLAfXlcbfDuPcDpeDU9nLVKzXUBoX37zPny+IQH+xwL8d+HsbICrW4B+bVpF+NfiS/C7+xHZYFyCepy8rYJn+A1SR0uybg/u8Cxcp+/hXb4DR28J3G9roH3pR0KAPxzZhtvVDed6M1xDct43jQiPdArwbyEbC8j9DSAg4O9PROCJCvR7nPA7juFznMDldsIT8CMUjd4M/KUG8JeXcli+OrS9forhoT75jqzJdRH45Z7IvSXw/+w38j+TCPaE/Uvgv8R5vgNGMt8IylzLLW3g/6Oywrxy36dLv4C+cum/7tZv3Df24//mOLZs2bJly5YtW/8GEfRN2LfW3Tg/Nzf3h4H/eiLws95oWtlvBLk/qPV1I5L1BeBb4N5c5pTLHNqK87u7uyoYFoNg/RLJWtu26hdO1gYdThhI7vj4JDdWuPl8boJ8qy6f458RGxbYLUMN0xfXoYba/91k3lwDeBhsLRQKYnbqI9pfv8DLJ61ovduEuqpylBZxeL48mXLc/UIUFhQgPz/PGHe/iGPwl6ChsQnDo+MCiG4F7snsuQHworgAPqE+LveGsM88LX25TkuZyqiGgKieRER+B/uRR6IRxCIBJGIhgeu4wL6AOBsSNA6Xp0ELehEUYPfMf0Jw5StSLifSEQ1JPYt0QiAvJPuvz2O/9y2O+9uV+/9ZJCqwfo6YgGkyEUN6ex3BtlfwPnkMfZoW9gDSqaRAfxLn0TBS60vwfHgtwH8X2ng3zj1Hap2ePBOATuF8ZwvxrldwvbyP4KcJZL2HyOqrCPl7BOhfwL96H04B70B3M84Wh3EeOZXfeACXtx/e41YE5pvg6qyHt/c5UttzQOwA0fgcvO5uBNefIDBci9P2OgQmOnHmYPwAAf7ANFxH7+BdEODvKYf3XSMSsyNI+Y8F1rfgcnTBsSLrBqoE+O8gPNqL1NE+Uioafxg+DseX0GWqwR8II+ILIOz3w+f3wSvlQAG/fKcYpX9wcAj19fVqNIay0qIc8OfjTmM1Xjx/iIGBbtVYROBnYpcgWvl/NeD/Vjd/XMw3w3w7qD8M/P/rugzKZ4igT5d+5dY/kQN+JQP41XT82+PYsmXLli1btmz91WK9Y3KSdZJL4DfzOf0jwG+FQWsiYJ+enhrA/5eMwy9Qr+Be5lcvwd4czsoK/UtLS2r+8JCR+MOqYs5r5O/5r1fQrTVtq/4midHGdT0h9/YIi4tLCsRvfl4C+Uo3rftjojs/z0MXesZhcLk8cg1GAL8fJ5ZNeebnhsWTKZtN4+hgB2ODvXj97KEKukfgrywrVtBflH8bBbdvIS/vttKt337D//3f/ynV1tXj09Q0AgLYiXRWgT0Bn4olkgriOSXQawR/AXzCvpF3uS5OqXzZT7aLJhKICOjHZZqQ90aX/IiWQjCehC8SE1j1I+pzIe09wVnADcR1ZOIZpPRzEZAKxhHd3cbplwk4ZyaRFOjNxuVYcot0gf5kPIro+gocbW1wtr1Gen1NDdlHL4K0CBznfW0Zrvcv4WprRVqgGgGHXIcGTX5TNhxHZnURAVnnfN6C8PQkznz7cg2LiHi7ED54htDcXbi6KxHsvofz5QkD+ON7cHh74T6+D/9cA9wfahHsf4XswTLOtQMB7i9wudvhX2+Ff6gazg+NCH/ux7mbAQl34A18gufwLTzsDtBTicCHe8gufUQ26kAkvgOPswuu1Wa4Bmvge9+C2OQQUqcnSMTiCMXj8Aro+xJp+HkvI3HEwjFE5bcG5Jvgj0YQYtA+KctGlP5+NJjAX2IE7isryUNjfSWePX2Avt5O+c4sQ9NM4M9euPXf9P37OyYb+P+MzLH2GYxv1LDm06pvWPctoC/bjNuwb8uWLVu2bNn6D4n1DxP4uWyt03HZjNJvDln3o2QFfus8I6o7HI6ctf0vAv7Vq5Z8c9zq67DPKeMHxGKxK4DPees1/tcTL+Nvxgr/DeBXyln5qd2dPQQCYWVlvSnx+RrPnTeXbs6me7OxrMXCWF+ew5sXT9FQXWH035dpVVmJisR/WyD/tkB/gcxTeXn5yM/Px73797GwtCy8nUAqkwN+Qv11sQFAgXxSifNKQuDf5MkxorJPWBThvKyjy388eYaQloU3qgucxgU048gmpDwnOE0LxGehC3vGY2eIEfjdLgSPdhA53kUm6ENWzyCV5Ht4jrhArm9V3onuLniGBpGVd+NcYDgpx00J9CISRkKA/uj9C5y2P0OWLvcxH/S0bnSDkfXppa/wv3oAT9sDaEtfZJ8DZLR5RD0diO8+QWSqAc73ZQh0tuBsZRJnoWOEY9twuHvgOrwH/0ydQHktooNvcX68iXP9UH7XR1n/GoHN+wiMVMPReQehL4M482wjFV+D3z8K/9FreL42CvBXIdL7CNicxpnuRFjflG9UB9zrd+Aerob/QwviUyNIuxxI6DpCIp+WQEBPIyjAH45p6nsQi3HsfQ7XF1Nj8PNZMmhfn4rSXyfAz4CNDNxYiNKSfDTUV+DJ4/vo6f4g35kVxONyvySZFv5fCvjN78mP9IP0h4H/ev7/mtR9MIHfqtEc6JvAn4N+tY9lf1u2bNmyZcuWrX+nTJd+1k+uA//MzIyyzrNC+3vJCtDWefb/dblcUkk2oqz/FW7dZpA+Aj1lgj7d903Q39raUtfOyv330i9TQf/F0033iVkJgdKjo2NlcecICMaz4fP9ka4/yz8gAX5a+dc54sKSlCVZPj1xquswk1n2TF0CP8V5U8ay23GEvs73Cviry4vRWFuF2qoKlBYVIv/2bdy+ZUA/Qb+goAAlJSV4/uIltrZ3kBQ4J/DTUn8J7hbJeup6QwDXEegjIhP8o7TmpzIIZ84RSQu8y7LR319APQUBWwH/xJlsw0aAOHQ9LkCbhK5locVln6isD+mqW4CuRZDSI8gIpKf1LJIakJR9Y+EofLs78M3OIL62iqzPL7AuMC/Qn6GFPxRCdHEO2+9f4bj/HbL7q/KQwwL8CaQ4xn84gOTitLLwBz48Q2p7EefakUD5LGLu90hsP0Z0og6nbUXwdd3D2dpHnIX3EY6uwenuhmuvBb5PtQi8q4c21IHz022cJQ7hC4/B4XqG4EYL/AL8p13NCEwP4cy7hWRsEQF/H4JHz+GZbcSpAH944AnOd2eRTZ4IyK/A6XoL13o93EMV8HXchTYzgoxfykUyIcCfgF+AP6inEJJpREA9Go/INIyIlgN++f0clu/g8Bhd3T2oralVwM9+/LTyl1mAv1uAf3V1+eK78ssC//Wifl0/SDbw/0EZcM97MfoN+BvrjW1o2af7v8qz7G/Lli1btmzZsvXv1E3u/Mxj/W5qakqA7gjpdDpXFfx+MgHr+jwrw/QS+CuB3wB8IxifVaYLv7W/vmnNNxPnrdZ+O/1+st4/a2LAMqfTLffccLU3ns91wL+ub5/nHxGBn8MuEvgZO2Bnm1b+kLoWJj5bq4xrN/UtBemxMOZnPuNJawvqqssvgJ9D8RUV5KGQln0BfkL/7du3UVpaio6ODhyfnCLNfvHsoy8Ar/rpy3sST12Ffi5fh/0Yh8mzwL65rQJ+gf2oSHkH6LqI3QJy0C/TUCKFcEJHVCg+LsdJJM9EQCwuwB9jI4IOLZuELtLSKYH/jPzGcyQE/OMxgV2PB0nHKc4DfqSiMWgCupocM5lIIMv+7GtL2B3phWtmDCnXPtJ6RM6jK7f+dNCD2MIneN49gr/vDZKHq8jqR9DiM4i43iGx9RiR8VocC/B7+x/hbP8LzqK7CEUW4XJ3wr19F96xagTf1EEf+QAI8HPIPl9kRMrRIwTWGuEbqsRJ910E5saRDWzLtc/A7/uA4OHTHPDXIDT4DGe7M0glDuGNz+HU8QLOtVq4B8vga7+D+OwwMuyKIPcoLPcwQEt/DvZjGgP0hWReJPOheAxRxkqQ9XsHR/JsO1FTVWNY+DksowL+AjQ2VOPpkwfo6RLgX1lCNBqVsmUC/y/QRciabi7qhm5M1g3ObeD/w8rdh0sZ+RdD7xH41bb2vbJly5YtW7Zs/ed1HfjN5ZGREXz8+BH7+1Lp/0ngNxPnzWVavgj8dLtXLv1/AfQxaB8bEKywbwbn29sjAAZUVwImXocJf+Yyr+kSBu30e+l794lu/YFAEFtb2xfu9t8C/nVdfZZ/Rhzzn+BP6FcB/PYPEY9ruati2bPCvpGn8unSf2669Ys4fvpZGu7TIwz2duFec6MAfw2qK8pUwL7iwnwUFRagoICu/HTpz0NZWRk6OztVVxEODagLbScE9hMC/7pSLkifRQr0rzUEmDIbBNR2omgyK/myHwPlpRJqDH09weVzxNLnuUaBJKIZAn0ayTQbHbLQBOjpJRCWfcIZUVoAV/aNS74eP5NrFfAXqNVjMWQEcrOMEyDb81zqmALF8UgQkZN9eLYWET7eQiLkVn3Vo7yGlPzWsBuBReHAD8/hGemE7hRgTzsQjc0i6GhHbOMJ/CO12H9XCt/kS5y7F+U8uwiGZuBxdsC72Qy3AL2fwD/ahTPHNpL6vgD/ENzOVviX6uDuK8NRzz0Elj8jG9mV5/oZHncbgnuP4J+5g9PeegSGXiKzN4uE7OuKfsHp6TO4VmtywN8kwD+EdOAUWjImvysusK8J3NOVPyq/J4y4FhDgFwnwh9kIoMu9FO3sHeDduw5UVVbL8y9GeQmj9Bv9+Jsba/H82SPl0r+8vIhIJCJlyQB+6pcH/ivp+gZXZQP/H5Rhwb+8H78nG/xt2bJly5YtW/8NGfWQSxd/E/gJ0CY8/5FkVoA5ZeA/WuWXlgjlPwF9Ao9mP22KFl0l7qssyWvfBOjj8sHBAfx+/40NFLwOa6XcbAiw088nA6AJ1OYyoMV1NS4+nxvd+hmt39Ta2qaSeua5ZW5nfbZcvni+5jM2y8E1Gc9fziOQT7d+zi/ML0r+upQxr5RTPnfj4q40Usg8QZ9B+87ORDIl2JzLPKeppIb1lSW8fvEMjXU1qCwrMWBfQL+4SMBfVFJcJNMilJeX4/nz5/JufJLrX8XO7p6K1u8JBBCIRhDVEwreE1kBcSlfVOrsXE11yWeDAKeEdV2BPiP2pyRPljNnAv1nAtgpxAXaaaXXBe41AW41lJ8Af1y2iWbSAv9yHtUokFLgnlCeAOz/n0QwqSOQ0AX+5bhJOXeC8Ray0BI8jo6ESBPg19Icru8cAQF+H63g8Qi0iB9ayIMEx7CPhxGT7eJsUJDzxaMehLYX4f04iMDCZ+hBBxJnfoRjy/A7ehHaeAXnaDN2Ouvgmf2AbHAd2eQegoEpeE/b4Vm/C8dAObxv6xGf7EbavSPXvgd/ZBDek1b45uvg6q7AcS+t/TPIxvYRi3+Cx/kaoZ1HCE7dhbOnCcGRt8gczAmk7wjwT8F5+hze9Xp4hyvg72hG/OsokgL8MT0mv4kjIBijHcRjMYH9iOQHEYoFBfajKmBfVOOQibqw7b4B/BUC/MrCbwA/Lfx3BPhfPH+Mvt4uKYvLqusEG7zO2GYk0+81iv1XEy9JxJEs2AhGsbyrsp+LZ2E0fuXy1Xrbpf8Py7wPPyvDtf/mY9myZcuWLVu2bP27xHqINWI/ReBnfe97Q9mxkmut6F5fZiJUB4NBBeRLi0s/BDolBYsCg4RHBZAG8K+vG/C4IpBleApcQj+n7HpgDc73S1bA/0GJ99e0bgaDIRU1n8CvoF90YdFnwD6Z8rmvr2+pKbt2ENqN7dYVvP8M8CuxfFyc47LxYFfA2+8PqC4kVxPL5FXYuRSt/JwC0XAQE6PDaG5qEMAz3PlLigqUa7cakk8Ny1eIiory3Jj8D/DkyRO8e/8e/UODmPj0CXNLS9jeP8CJywmX16caAYKRiHIZJ5zTE0A1AGSzSMh1cppUDQAC7AL8CbmXmgB9TPKiWYHQrCbzmgC3wLnAPIfG01OyjWwbTxseAOynnpL3M51MyXsqx0ox+F8SIVFUNSrI+VLnSBDalTdBMqcUYukzhNMC/DL1y7ZsKIglBIoFlLWEnFtgP6Y8DrLKUh6OepHwneDMeYCs1wGNfeHTYQTj2wj6PiO41w/nl9c4mHglcD+GdGhHuewHfNPwHn+Aa+UejgYq4ehoQuzrkKw/lN+yD29wAO6DVvhnOT5/DY56n8K3OY9k7ECA/zP87reIbD6Ff6IFjs4WBEc/CPAvQo9twRP6BPfxc9UdwCPH9rS3QJubEOB3K+s9uzmEYylEo/LbBeqj8ZgsyzXHQgr4w3FNBfILhuPY2trDu7fvUVFWgeLCIpmWoqy4EKXFBWisr8azp60Y6O/Bxua6fGvi8q25KD6/VsqBvpnOzrLIZFPInqel1GcupMbpV41fOeg/k51kYgP/H5V5H9Q0d18E6i90ZX0O+JVuOJYtW7Zs2bJly9a/SayHmNZ9s35C4Gfwu38V+EMhAuGGsvD/HtBZIZCQbzYAXAIhIZ/brmJxcVHm11RwPkbNNs/N6a9ovTfvD/9ZE5fOeM256/87JF5qNmtcM13bj49OsCFAT7jns9vY2Jbnto7FBXa5WFfrTKu82aDDeXOZjQAXeZbycKO4j2zLsqTKk+zPbh4nJ6dyLdpFOTAS7/m31k1zXplomZNJY393G22vXijgz7/9GwoF+q0u/VRpaQlqampQW1urork3Nzej5d493HvwAM9evsT7jg709PVhYGgII3yHPk9h+utXrG1s4tTpgi8QRCgSVVHhVdA/Wv3l/UrIfJIxAaTcanJN0fMkIucC4GcC+xk2CGRl23MkBc7VMH+0/IsSAu/0wElLXlqgPiViw0JMAJ5R/9XY/7ooweEBRfI7dTkHxS4C4eRZDvgzCMr6SFIgX4E+YwvIcWR9NJFFKMGI9yGB7ADOokFkolE1/GAopck6J6KRLURdCwjufIJv+wsirm1kdTcySRcigVX4T4fgXn+B43GB9sFnCK98QiJ6Iufbh8szCOfOI7i/3MFJZx32+17Au7WARPxQwPoLAq73iKw9g3+kBacdAvxjXcgeLSMZ3ZL7OQnP4TN4l+px2lMB1/t7iC98RjLoVcH4wrG0KItIVO5HXO6plNWgQH+AsK9c/ROIaklZlxC2PUDb67fyzItRVFCIqkojlgOBv6GuGk8eP0B/Xze2tzahy3F+1XSuPA/MIIKGzqTME/KzkHIiZUtKinoPlNjNhd9LvhLC/zbw/1Hl7oNVBHrrVM1fn950LFu2bNmyZcuWrX+TrPUP1u0owj9BnUNyXU8X8GqBq+vLTFzmGPhsOFheWlHAfiPE5aRAbmVDWYw3N7cV5CvgJ9zJPLehhZ+iZZ+wT8gzz0XQp65fx38zmdXuM4FOyly2Kiv5FOd/tXTTvWSWcmkWZQVUo5E4Dg+PL56hCfimm79y58/BvQn6pri9KZVnKQ/fVW5fsxGIHh/b29sqWOPVYSQN4DdoxtAV4Gc/fjUPaLEopqc+CdzV4vb//R/y824J/LEff76C//z82ygRAKyqqhTgrxHwr0Z1dRVqqmvU2PwNDU1outOMO813le623MOD1od4/OQpXre9QU9vH0ZGxzD1ZRoLi0sq0v/R8QlcbjcCwRDiHDOfQC/3M3aWQvRMoFumWjaj8pO01AuAxxMZAfmMbGeI3gJsEEgks9BF5jCBjBvA4H9xuvIT+EUM9BehdZ/5sm08Ie9n6gwh2T+sAF+OKcc3jsNznSOS4Po0QhldjqkhqetICCSH9XMEZftIMoq45kE8fALNfwQ95EJSiyCttg0iFjpE2DUP394QXAtd8MwNIXKwJvv4EEgc49Q9DsfOazi/PMRR9z0cDL+Hf0+AXjsQ4J+C//QdQotP4BlsxvH7uwiOd+P8dBWZ6CaC/kk5rgD/XB2OOsvgeP8A8aVpAX6fAL+OkAB/SICf07AAf1Cu2y/5flr/4xqCUXoBMGhfEvsHJ+ho70J5aQXyb+ejoqwMVRVlyq2/uqoMj1rvYWR4EIcHB0jK/WOxIif/aonvq+rCcsZuLIR6lnn59ki5t1r4jS4uuYYBWvdzxn4b+P+grvbhlzxOFehf3iOrVCPADcf5WRnnuDznTdsYur7ue9v+kWP8jP7M8a7nXy5f/b2XsuYZjShX8y+nN6+z5l/m/Xgfc93FfO76rPPqOLlrt2XrvyHz+3JjGeU6a76Zl9OVfcy831tnyTfzfmYflWfZ52Jfyz4XeaLv5uWm6pjX8yzzN+XdtP5H66y6Ke/39Gf2sWXrr5RZb+DUBH6KlvTrwG9UKG+CwJuAHyqi9d7ergAd+9tboO26CHA5sDe1vrp54fLN9QR9egowUBz7bZv99Xlec3isXy3JXTH+5erVvENWkRmyMsN1v2K6+VkbIvAzsZElGAgLdO9haVGekUg9v5zV33T1Z2OO+awvoF3WK48ONgpcLxM3yNr4Y5YTdvWgDg4YwO/S24PpJuBXQJRNG5ZNrlfbnMPjcqL93VuUFBYI9N1CsUzN/vwci5/u/WVlpaisrEAlYbC0BBXl5aiqqhbVCBhWi9gYQA8ANgI04k7THVEz7ja34MGDVjx69ATPnj1HW9sbfPjQif6+fnn3JjA3t6jcyvePjnHi9cAXDQuE64jTNZ8wrwvUJ7IQnkdCCozh/p9FLJ1BNMXggLJN+hwJyVdeACkBfVr12ZVAeQhwPfv/G8DPYIAcrk8T4I+K6Lqvy3KCYvcBjg4gr35UphE5T+QsjajcMwYXjMn24SQQEuiPsqFAZ1C8CLR4TPbn6AEZOZZsG4sjHvYjHjxC1LWG0OESwgcbiPtdcpw4/CkPXP55+I6G4FnowMloG06/DCN8si3XdizHnBHg70Rw6Tncw/cF6lsR+NyPc9cGsrEthHwC/Lsv4JptwEFnJRwfnkBb/YpkWIBf0xDSBPjjGQQE9gN6Cv5ECj49CW9MQyASU8AfEeCPinZ3D/Gho1ueX60882JjaL6iQtW9o66mUspFm5S5ZYSCIeXdot4BFptfMhnlnFB/FfjZAMBvZO7iTdDn75BpKpT+48D/vy4DAA3dtP66fna774kwbIwAQPFZXJ03KpTfrru5omlu97P51I/W/Xl9e33meay/91LWvMvfLPPX75l1nWVqzb/MM+dv3sdcdzGfex7WeXUc6/lt2foPy/zG3FhGuc6ab+bldGUfM+/31lnyrdtfybthH5V3bR9Orftc5Im+m5ebqmNez7PM35R30/ofrbPqprzf05/Zx5atv0rqb61lyrodg/ZRjH5vWtDNRJi6yYrO5ZvgkABGEFtTQ+l9a+G1SgGcAB2HXKObt4JGgX7CIvt905rL/to+n+8K7BP0KfMabrqOf2vi+X7nnFxLsW6dlW0vdFkFV/rV0s/cT65OC3QGBPr39w7V81piFH15pmzkUQ09AvsK1i1SEM/nbi6r7X5fZjlR5UmOQdhnQ9Dm5iZcLte1QJPmXb8qBvBTjQEiWjq5XUZgeHlxAfdamlGYf1vJgP4CBf0cpo9u/hyjvZR9/dU6un2XoETEaXlpOaoqKlFLy39NjcBiHepq61BfV4+mxkY0NjSiob4BDbLcKNM7jU2433IPzx4/w9tXb/HhfSf6+wcwPvkRX+cXsL65hYPDEzgcHvj9YcTitM4z8N8Z4gKecYG2mEiTnyJsjpRIxQaghV+Bf1oBeIqAL9BPjwEGD0zJ80pLfkLgnaMAqAB/+pmSnqD1n40AbAwQ4BfID2fSShE5RkTyI4R9Eb0ANHoLpLKIUfQMkGPEOBRgPK1GB0jGw0hEvNACVBB6PKEaK4KpqID3PiLeJUT2ZxFc/YLQ7ioSQadcnwvR+AJ8jn54V9/idOIZDodeI7jwEef+fWTiOwh6P8Gz9xqns83Y7arDSc9LxDYWkIj6EUnEEdaSAv1J+HUdvmQCvkQSPrkenwC/P0LrvibXmVLu/lvb+3j7tgOVFdXKrb8wn8/7NuprqtDR/gbra8uIRsK574wUl180Ge8ry7hR7mVJ/kkZP88iI2U+m7Pq07nlnK+JTM/kGfoPQlib2P61gP+/cc7ruqjwWSuTuXklc95aETXnc1PrvHmMK3kyVTLnreuubyfT6/teqTxfzJv37dttrq4jwJrLVv143R/fx9AfOt71326Zv5wa1gljvewzwejDlqnkcVtuZ9332+P8ybwb1nN603O6mLess663rrP199SVZ2uZv7LOmpebmvPmum/2seZZ1n2z3bX57233XTi+vp1l3lxnnVfrru3zveNZ9zfX3bjPd6Zq3no8S77STx7Pqpu2u0k/Wmdq9Ia878v4HlE/c2xbtv4VmX8Hr0/5t9OE/oWFBWWhtyYTAK9DoDXPuo4eAuxfva4ssb8P/JyqoG45mOP8wgLH2F/H4eGRChKXFgBh4nlMN34zmXn/0cTfa/nN1xPXsL873fbTUuFOCjglGKwtk0JSACwl+bTFff8I/71kfa43Ja4ybzeD+MUEok5PXMpiv7CwLM+Pz1yefa7RxnTdt0I/n7WZ/zNS+7I8cR/Zn3EdzNgOZBTGjTDKAK9b3f1vJfecYEQZrs2EfiAcDmF4sB9V5WXIu/V/ysLLAH4K8otp8c1XVn/mGY0BhSgR6Ge/76J8WZZpaVGxgH+ZqPRiWllegdrqatRV1yjV19ahrqZWgLIWjQL/d+o5LGA9mmobcLfhDh4038eTh0/w+lUbOj90obd3QN7LSczNLWFtfQd7hw44fSEFr8FkSkE5rf6JzDlSMmVQQNVfX54J+/6nBcCTtLpLuaP1n40imWTa6PcvUJ8U4E8LwCcJ6rJdVNZFZb9oOjccoGwfEgU5T8CX7XRNJHCvyb4xuX1hUUiOFZW8uBxLT8r7L+sSbGyQhYSWkn3YJYGNCLJtkl0DfIhFT6EHjpFwnSDp8yCtReS6BNrjW/B5puDbG4Z7oU/AfgThnVVkI07osX34vNNw7rXj6Gsrdnrv4bD/PSKbK7IumAN+HUGRT4/Bm4wK8Avoy3KA7v6ioEB/JJZAOJqQsrONp09eCuQT9gtRU1WF508e4eP4KE6O6MbPfvvGeyBFRoV/MC39v1JS7+tF2Wcy3oEr30oWdX5C5fnoviSOlhz40j6PgdaxX8Oln8fl8Cts2bVqamrqxu3/Lcr9PkNcZr5lXv32q7/fWHd1H6MybL1fuWW1b247yzEuJety08v5XL7ah3k3rLuY5zms81ev1Srrdtf1vXV/Zh/qXzve1d/Kcvnp0ycsLy/B4XDIH5+YCjpEd7+0fOh0XV72QECNL/z161cVmZj78Bjf3jvzPEb+9XNZ11n3UXnW52nJv/6cjHPktjPLiVov+bl5td3FvHksW5fifZNp7l1Sy7n86+uM+ct1Kt9cx33M53Mln9PLfa4c74ZrsL7T1/cxn+31413s8wePd7FPbl7p+j5cVvMWmefI7aO2v9guV/Yulq3zRnm9kq90WV4p8xou9rmYv67vrfvONVjX/Wifv0R/9fF+pJvPZZQFW7b+Pbpezqxlj8A/Nzen4Mmafg8AmazrCfwOhxMbG4yyTyj7ga5BHae09hMIDw+OEYlEcyBnnIPz16/FzP+PJl7Dtesw0wXoSx0kmRbQF2jSkoy8ziHPODxaEnoO/P9OgfusiQBk5QsOE+dx+7C7e4DNjR2REcRvaXFVufvTe0M943W6/ef695vAf1O5uCYT+M3tCfuM6UDgN2M70LPEsNznLuoK8HOZ5SSb24Zl2igzLD8He7t4+fwZigXq8279hoI8w9JP4Cfom9DPPMP1uxglBUUoFlAsFuhnAwDzTJWwEUDyyotLUEYvAFFVeQVqKipFVairqkFDTQ3qq6rRUF2D5pp63CX41zWiuaEJd5qa0NDYiDt3mvGIjQAv29DZ0Y3BoTFMfP6CmflFLK9tYnNnH4dHp/D4/AgxsJ7UffUzKX/y02jNZcT+eDaNWIYB/xjhPyFTlsmszBvAn9DZlz+FsNSXlSt/RgA+zb76DNJH4Ofwf7KPPOMUAT6eQkz2iWTOEJQTcZi/qCxruhkHQKZsHFCeA0ZcAHYTCCWzCCeSCszjHB8/FoIWjkKPxpVXgJ6IIaI75XfsIurbQOR0DYGDbUSdbqRiEQF1J7zeFbgOhuBYfoej8Xdwjg8jurMtwC+/PaGroHwch9+nRwX4IwjIudgAEIwR+AX06WmgpREIxjD1ZQ5NTS3yjMvx+OFjjI+MYn97G7Fo+KJsqIKu3nUCP7sR/XrAbxTt3EVxQrd96zVyUUA/GUrBux/AyvgWRl5+Qt+9MQzf//zrAD/HhL2epqen/23n/FasyJpT85xm3k3KrVPbmtsbYgXv8jhy35ify7sKBOb89eWr88Y9EFmPd8N2l/M3LX9HOav4T+dTP7uPdflHx7ui7/2mMakcLKogQT+T2AjgdDoxM2MtQz+6J98/7+X8j9bxuXBZdFEmLucvnqFVZjn5RteP/b8my72Q+3a9/Ktpbv7Kfb2+3XfyvjmeZf7m5/ST12BOLfNq3fX1Mr2+jyo75ry5zjpvybuy3bV5676/t515TnMflWeZN4+h5k3dtB2XrfO5ddb5i7yf2e7avHXdj+av66bt1PGs85Z11+fN7W5c/p3tLs73o+1EN5d/W7b+NbFsqcZuSxmzznPd/Py8aiC/3jfeCtnXgZuJeWZ+KpVUbtabG1sK3K/Dm1WEPm6jYC63zH7gJ8cORCOxK9dx03n/a4mXcu1yeH0ZWu8F8pOE/ITAvUgXyOL46hyOTVNKIibwxcjrbBj4Wyb57SYLqXkRXcYj4Rh8vqDUszw42D/C5uaOeqaLC8uqIYfPWA25mGvcsZaF78l05+c8gwMaZYVlxhiikYZBuvZ7PB5l5DESL4z31iK5YGXZl2fE9aaln0nXNUzPfBEAbMDt337D7Vu3FPSbAfzo6k3Lv2HpJ8wL2NPSL9Cv4F6mBHxTzDemhSjKk2PczlPzZbIfpRoDSopRWV6CqrJS1JWWo6G0Ag0VVWhgY0BtDeobatEgaqqrx936RtxvuosHd+7hQcsDPG59jJcvXuLdm/fo7e7FxMQkpr/OYWljE9tHpzg99cHvDMm7HIFfiwq4C1RndKT+P3tvwSA3jnUN//Tv3Wd3dhiSCSdN6XSYOWlmhuqqZqhmZsac7x7J15Zdrk6HJpnZUnJa0r1iyy4dSZYPhfBzskmIPZvqSMDdABviWD3ew5q0xzrPC+D7/0L0N0n2JeDWwS4OdrdxvL0lpF/67q6El36+dHiAFX72j319hyf+7wnx5oSAxN3hyr7dMcAdAmsiWxcdJyXWJfzGDifCjuUe4esAx0LWufovxH53GZtbi9haW8QGX2lYk/wlreXNNSysjGFhph3Lo3VY7m7EencKO5NzQvi5VV/yFjK/xkP6pM6Lu+tY4ecFubq/wQP9diQM78tDLCyuoam5A/fuPcLzZ68wIM+qzbUNHAtH0L7x7phnPkh/8fo5bTOvyK71DRnzXFSSz7LK9fPLKP79rUMsTq6ir2UY1Y8b8aa4CqWFtSjPb0RNQds/k/Cz/PqeGhFXH8IPU15uYfy01W23v1URGeVw/dbtp5cFlZW2LCbNE+ulOtrS7uLmllCbjpbN4qR0dIs7YdqE+XvxTFnUFlgZy2XbqiYjDQ4ggrhMi3mbcBLGzUvd1DGMCevHqYxJ+2QwjUQikfUTQieZ9fV1tLa2mjTCafJ6hfsJy3eiX5CZjl0tiYe9Vra9otfcXlu6K/1ra8HwoXASz8a1btr02z6R2R8U5po7uspKLw0vfig9x23jlaNc7gmG43XSa2/7hxeX5dOJLE3Hz9MtF93hckbBdE0amo5vB+mxvzJP3y9lYlltWYK4vp1VFrRrIFPb04VkjtyN6+ppR90CM/kXDSd20P6Z+fk6R+bbxu2UwZMF6QWyUHquW3WuOyKLDeche53C5XL71PvqFFf+OJmfnqN3w8XJ/Diu7eo9WUZcx+3blJ8inEX26+SWP7jXc8jh84B9y/6eB/3LdVPHXXCWOMlg17A5a7K5XaNyxuXp6SRhyaR9L18Jm4VOAgS2+Va7oE/I4NTUNLa2hFxwEBtjmE+0PNnKFDUa6sTQnjJbmpJbKB36zIq+EMldIfFcyd/cFXLB75zv78B8Zu3owGBHQP+GyNf3trF3bFf5bTrvNxouCHuaWJ/fhNrfIUKUHx8dY39PyN36pjlocUyIP68rD3HklxvMJ/m8Q/eipD/Yqu8RfQEnCJLsKxLWfA2AfsYVGT/PR5vv84+O8pT3zch1Y99g4UjghNyzoOK3Mrvib8LIv7n5WTx79tQc0vfv//uXOcRPT+3/D8n/dyT735st/d//5z/4Qfw/cReA+H82q/4k+ZwE4Ir/d55M/Nz2L7CTAdwRIGmayYR/44cfRP79f/CrxPntP//Fb999j99++AG/mYMCf8Yfv/2Cs7/9igt//GF2AVw+ex6X/jxvXwU4dx5XL1zCtUtXkHctD4XXb6Dkzj3cf/xMSOxbVLypRn19M1oTXegZHsDswixWVpeF/K4LMd7BrhDwfSHSe/uH2BZyuwkh6NJ229J8PAjQvP/PA/v4aT/psyT8h0Kg92XMvc0dAVz9F90G+7eQ/l2R86sAGyLfEP3GrqS5dyiEn2cAiC0yfkmAhw6uSf9Y2z8ykwGb+++wtn2Mla19rO7IfSH3hrl3trexsSlpSIH45YClzS0srS9iRUj/+sIQtiZHsStkf29pQ54X/NyepC1pcBV/ZXsLK7ubZov/hhD9dSH8a5sMs4t1vs+/vC78dhZjY5Pm8El+eSIw0hu4+0buTcug2W1Exi7zRU2437qWa6TXyjMjeCGIn+V7Z7Z0GKVvjnnuwswG0olJtLxJoPRWDV4XVuJNvoyXCxpRXdiKmrx/IOFneM4Csj4Et/9wdpCfoYmGHRsb88PFYwLj42MYGhw0P44nlYXftY1PI8DExATS6bQ8tFJma3pcO2cD2yIuvZYQmc2sI1FXXyd1TUtbBHGjbi0bP9XDVykssZP0hOxxcNrS2iJtMW7aU+OSSJOsMpwh72xjB3otpuVHfVLiTE1PmT5WWxsp5wnEnySCbRV915CGD3tOAnB7F7cWxm31449CY1NT6NrR3SQy1pf10XZgGX13jJ9hOcvsXjdORITSiAHbbXh4yKyo2HhuWSrlR7HbD8u0hoeH5cas98psoSRLZSxDuA5Tpq9yRwOJPV9n4OeS3LJ1tLcbQm7Tk3Sc9LUstFPe/bO0tITV1TWzq4IrQdwxMTDQb66HhvXTkPIxTd4nfN1C8zwN2Pfa2/X+sqCbYB8bHR0xA9OVlRVTFtr0s+4dnR2mLDaubVMLTUvdrjzOjspcuauP6tSdLfxJbtoK1x91R8PG6aJhXH/Ubf269T+si7o1vMKVxbnj7HBe4R1KYbi6cBzajp/9zdfZOIZEO2ECXTb3+3Uq17w0H1cXuLUMAvbfiM6No/rMfptDDp8Hpo85/Svq5+88n796QN7HGP4G83lsv8WfMDZJnCV6XJnld/dJ6jgZQLsHnZ1dhryRIO7vM++Yke5nMEzVUr0TciBh5EFdHPSbA7tsaLMiLDgUP6kAKQKxL6TRnI6uhEcIP09b3zgUgnEosqN9IUwH2KL/YFcIzy5WBcskJBKOB6oxTS2Tl53jscaKgn+nqMlfZpxi+saQfxl/cTzGk8457hgcHDLXnV9f4DiQbto6AcBxuekf0hdoG8TuBrCTRdp/7Gcb+8yrJDw1Xg3LEJTNLaS6AxnLyrHorVu38OOPPwjp52f5fsD3Qtz/T9zfkeST7AvRt6v9/xZi76348/1+A/GL7AeeA0CdEPqffxA9Xw3g5IHIv//u/4yeYX/6kToJw0kDs1OAZwToqwP2HAF+G/7Xn37A7z/9jD/MawG/4uzvv+PcmTO48OefuHDunNjnzWcCz52/JPYlXDx/GVcv5+F6YTFu3b6Lh48e4/Ubfh2gWsaILejqSqK/dwAjQ6Nyv09jYWnZfLZuV/r7nhBIngtgPv0nRHhXyCRts3NFSPu2tK9ZySepFxlP8d/Zt9gWYs9dAST1m6Jb47WXsLQ3RG5O/Jf+znhWt28mA9Z3D4Xs00/CL/fJvt0FsM6dAtwlsMsdAqKXcf3axgrW15extbqK7dUNbG5sY53b9Unmjc3v7zMut/iLe4sr/1JmkXEXAicm9qQseuhnrPEmhNRkC/Zphom6CdPNfL28PTWLYvPnXc/PeR5g/2hHbCk/pW7hGP5AONDqPmZ7F9BZmkLNvRaUXa9HaX69IfpV+c2oFtTkt6JW7H8k4SeBcA0JCAmQG47+0/zQsX3ZyAzLrWuWDGeWqamp0YtxstEHI983JyGr9SYidNU76iaYHycn4gzJJK+Xv6qu5FlsuhmXZTvN6riWjeSZJKu2rlbKImRe0mN78YfdNXNzc6iTMDZfkv4AzLdZyKdL1Jk+r7P2L5aPaRtb28Erv5XRXWV+GKKGK/ddXV2mAyvYX0iW2bY0R/IjzjAcWGs+TJtl44FFH7NjgH2AK8yaHknnaQzrzocO29CdPGJb8IeQryCoYbhOIbJ2pV/CmbAePDd3pAxK/3EnOdjWbAOmyQmolZVlT2MNV2EsUXfSFNsS5krzY8w0mKYUN9Zo/xgaGjTx/fQEzJcTIh9qmCbjaVq02a+m5JnEHx62XZyhnO1G8t/a2iLxWA6v/5syeX3Jl4XlmTitLps7imy6qPy0aX+tcC6y6T4mDnHa9Fz/Sellw0nxs+myhaOtcP1RtxPH2/1g+6i1zYSAuf/c8Dnk8Hlg+pjTt9Sv4MQtf7/Cp55/mOEzmJOwg4MDhvArqeMkNt2cACDopp6/x/wd4tjBzTfbM/5TDFPUoXwodRUYyB+zRZarwkLyhdCbreASUySW5Av48cJdCbNFAiPjBp6OzkPTNmWMsULSL6R+XQj/plnVJwkS8iFkhrI1If9Le1tC+ncMATqQPP1y+eVQjzVWxHD2r62JIgj3rRh3HMJryfEyF2L428zVeF5zjuNSKfYNOwGgkwDaZ6zfkn79lB9hvvMvct0ZoocADg2NYHmZn1EL8v6QpuH4j3mT9J89exZ/CLEmfvvtN4OffvwR9qR+S9z/+92/PHDFnu/9k8gLPGL/I0k9Cb0Q+x9/ECIvfuopJ6EPIHrPrWTf9QcyO3nw848/4FfuAviF347/FX/89gfO/M7DAXkw4DmcO3sO589ewMULJP7XkHc1D9eu5CH/WoF5HYBfCLh98w4e3X+Et6/eoqGuAV2dCQyPjmFyZg6ziytYXts02+639qT/Cpnne/+7B8JTxN424Jb9APRTvuOR/Y0DOyFA0K8yng1Asr9GQs8Vf3Nv8JwAuT8EDMNPCRo/Xw+Q/A14sCBfCeDWfcoNKJewIiNI+vVdfQMSfwEnKHb39qUP8tR6jmW/gfuFZfDKwb+8q4P7mjrP6XtlbPtOyo8DsfdFTP7A8W5Qn8PtQ0wPzCJR1Yu6R0L0i4Xo59WhIq/REPya/DbU5hF0k/Q35gj/hxoeJkgyEi3XaQl/1PAbtkwrTEosXBlXquMMia+S5TgwbU5SfAy5ZZ8wJFnAwSkPy4s+2PmQNoTahFPCz/CZZJhkkkTULx/jiM3wmo+ps7o9mzstXENCrH3DXgdnICN9t7m5yaxOs0+5g29tTxLKjyX8HKiQ8Gt66fSopzm9Yb4k/bZcXI2vyfg8EicuDCHwy+/Vk5B68h5lWVwzPT2Fyiq7rd8S/vAETYjwa3qenxM87rU9jeEsvrnW3jXgBMXHEn4OCrUsbA8OFD7E8P7gdbdlsdf5ZLjh1J3NjkNU58aJwg0T9UfdGibqj4bLFjYqV2STE6fR0Va4/miYqM4i6Msu3DBuHGvH9X+F1blxrP/9cWgHukAWlmfq4+NkyPgMUkR0ceHUHdQlhxw+D6L9Svucgr8Rg4OD/gT5xxiOAfi7zt8rEnoFCT8JHn9z+JtAokeyTzdfAXAnuJnGlxiU6xiadih1FWgANVIGS/g5vLZqEv49ca0KKSFhXxciQdLP1cutwyNsStg18a8KwV/dF3IihGab+n0hLCQxEm/tUOLu7ZiJgSjhN0Yz8wSB9+9D+Hn9TLtFriPHahzbcDzGcTn7CX/rOW7UfqKkv4fgtn5D8u0Wf4OUBUk/P+Nov/3POL2YGJ/C9pbTfz+wadh3WYbXr1/j3r17uH37tsHNmzeRn5+HSxfP4/y5Mzjzxy9Cun8whN4SeW7/14kAD/zUnzMZYEm7En+BWc0nPGLvEHzK3cMCidBEgBP2x+9/wM8//ozffv4NZ4T8nxXyf/b3s3YC4A+xz/yJC39ewMVzF3H5wiVcOi8Q+8rFK+YTgUUFRbh54xYePX6GV29LUVFdi7rGFrS0dyGR7MXg8CimZhewvLZhCDZX8neEhHMXACcAdIWf2BJsCMG25J2r+tLvhdiT4K+S5Aso00kAMxEgYbm6zzAMS5nGI8G3hN6Sd2MTzIM7DWh7evO+/ta2gSH7ouOBhLtyb5pt+dIXsz1XvsTz5kRj8rPgX97XnFL072krtKAl99LB0b48f+y39lkfuZWM/pifUpzbwnDnGOpftOLNjSq8LqpGWWE9yoTsV1wjuW8TtBvCT/JfXSCyghzh90LYDsAfIpIYhidm52bNAyFq+ONlyQnTsoM2kmrXMD1ug+aDzmB5ycyE8wHoGs5CsZ5B2TJ/pPlgdH8gXcM68OEZvmZeGh4ZiyP8PJ3Xlm3ZlJNli870s9PxoDymR3LLtLjC7ZqNjXWzUqAk3UDCcyt2dAaf27GYhiHykp5rnySL5sm6qC4aJ5Dxegd5ufo4ws+68oeJxDEbOGM9lh4z7/ZrelHCzzT9ay5g2zJe1CxLf2BbkEjw2nE12zW8PrUyIFMSzLBq8132lpYWSTeYBGL/6O3tMZMRjMNJqZNW+DU9rjBypwnr7xr6We4VKT/rwPsg2gd5TYeHhv3XBOIIP+PEtaUL9iFOJvH1EKbBSbDoA5mDUtaHE278dNOO/Fi4YVjG8GsQet2jk2mu3rUtAnIWlocRTUfhholC9a4dlX0IPibOp+Ckcp+k+xCE47hEOYpsuqjc9ce5/fvK84fcovPDqYxujeP3tSyyiM510w7H0bbLIYcvA+1zQd+rNqRcf5/4PI0+d99nGN78Lo6NGeLEsQrHI3Y11125tZ9U4xjL/d39mDxPa3QMnZE6BQoG4AoxP8EVIQn8jv7ukRAa+Q2b297C7MYmVkg4hORw6/IqtzkfHwmOsSLjsBWp17oQ/e1DfrecOwFIcI4l/pHRrchv1scSfhtD4QX8Bk22a8nxBHcGchzB33CO0dkf7GQQD3O0/cS+xz8gMru136zme4dBupMB/ARgV1c3+voGsDC/JOOM8Lj6tIbjcY5BOO5nn+VCDF+VrK+3Y6+3b17j2ZPHeHDvDkqKi5B/7SouX+K39kmwf8Pvv/5sJgJ++ZHv+/8H3/37X+bkf54JYL7r/134EEADn9gH8F8dcEg/zwYg6LZ6hch4gOD3/CrAT4b8W/wk5bDuX3/6xftU4Bmc52cB+TUAs/1fys5XAs5dwKXLV3EtvwAFRcUoKi7B9Rs3UXLrDh4+foI3peWob2xCQtp9YGjE7AaYmJrB3IKMaVfXsSFke1f6+L7cO3xNhYSdE13bbE9xW4LOL1XsY4eTPsJz9L1+ykj6zWsCYm/yvpGw3JZvCb0l+Xwnn7CEnm5r82R+Jfqr4mdY7gownyiUfsZXZk4y7KPR8e5faVg6Jfz+fW2F0iE9L8vIXUcisJOQtk5Hu8dYTK+hs6IH5Xdr8bakFmU36lEqZL+ioAlVBW2oFqJPkPCT+FcL4a8Swl9V2PThhP9LgPllI/zUxcXJBobnNnfXkLzrNnOzlVnArfQu4WcH4I1eWvoWZWX2wDKSD64akky4hulF2ydK+Jk2V/25WsnJhTpBo/j7evtC+dKw7qZskTQJEji+M6+G5WR898HK+uqqcxRMN0r4GZcPNpbLlE3IIfsAH3jR2X7W1RI6SU/SahWiGZ0Y0PJz+795f1/CRlef+UNPue4AsO7AtvKwzrgF7JuuYfk5uLB9I5xOYEtajszVxxF+ujkoYZ8jmfbR6rgFDY0N0g5BelHCz5VpbVfbtnUmXrQOB9KGLc4uBb7f715THu5jDxuUthe9Ega6eWAdr5VrOOiyhNduzz+R8Hvp0c2yue1Awx9mTgK0tjSbdAjeG2wfTgy5hhMT7F9MK47wcwcK47KuPF/Atq/AbWdxMw+2K9s0Osk2Mz0j/bXVhKmpsVtR+Ukpfn6R9wL7LM8ACD+33PvpJLfn1zZ229oPp2FP4/b8J6bnuqN+N7wiWzjXHcX7dGLHljFOpmlpeie5xfbjij9rHm68CCLb3xnXkucgPaMLpWl1Gse1P1YW1b9P5sOVuTrPHavLIYfPDN4T/E0N7rVgHMfxAp+X/B3V560ZZDoDYf09cn+XXLca/l6QMCnBtyTObuHn7yzdXNnlOIoTwJoG84rmF5f+xxqmFJuaKjyYQ7AIDSy2OYyOh5RJ3eaFWMxylXp333wTfWFzB/MbW+IWYnPE1f9DLIl8aWcfa9zufPBOSM0xtvg9cx5UJqR/hXFJTOT3ak/qyHG9Zhc1XrEEpAPfPuHnNeN1jF67bHKSbP5mcyzBcSInizje4JjGvt8vBJ/v8bvv8nt+1XHFn18CIPEfGUmbLwaEtvafwrjl4piWYxmO33hWEfvzxATPXhqU/LrR3taC+roaVJSX4vWrF3j+7AkePbiPO3duofh6Ia5dvYIL58/h999+xc8//YCffvxe8AN+/OG/lrCTvH9v3fZLAAKSe7O9X+QG3kq+52dcA/o94m/xX3wvsu+F9H/PLwOYswbELfaP//1B9J5cYHcD/IRff/kFf/z2O8788QfOnjlrcfZP/HnuPC5cvIxLV67i0uUruHhJ3Jev4uq1fBQW2TMB7j94iEePn+D5y1corxQ+0dyCZE8v0uMTmFtYxNLqGpZlnLe6tSn3y45H8g/NRIDFgZFxqz3PvTCTAwJD/OX+2mBfkHtsXcj7FicFPJD8uxMAOglAos+w1PEVBHPmgFxLLkcRJ/UCXnPF1zDM1XJ63tH8S5/3NKBSCv/uUHTe6ftmZf+QQnHLMH12cAUtL7vxurgGL/IrUHa9ARXXm1CW34gKbtsvFJJf0OGT/moh/FUFragsbEFF0Ue8w/8lwPy+POH3tuF7iCP8JBXhutv0oiRmXh5S4VXDzC39TFsPN3MHdgzLB4prZsVvB682LU2b4XltXALEVWheK5d088FpSVeQhoKyOMJvyGS1LZsZgLKuUlaSKNfYlWieEWAJOdOMhmHaTE/z5CDC/SHnj3y7t4U9IPanA+NEyS0N8+QrA5y4CEi9V3/x2/iWQLpu6lgfQ/jlgaGGgxaSSA6E9FrFIXqd4gh/tM/ST2Lrbtvnjx4HR5VeeixjdCcA7wm/Tt51qpZrxnrwB8k17FOcCGBY5nki4ffTqsq4V9hvOflA8k7YOthJBKbPe5KnKtNwZpy7XUy7SlpxhH91dcXE46QR07BtI/DbyHVXGfK/60w68TrzupSXl5mwzIfhtGy8juxvdOt1Me15CneAoD0ydRYflh5xuvLE+U+D08Vxy5CtblF59jY4HeLiqyxbXq59WmQLnyk3zzj2L9fvuj2dKw/pHdt3O+mFwrEfUufB1YXC0XbC5ZDD5wbvBf0NJVwdf+cIPut1EpfjgihBiw6O49z8fecuPCX63LLNZzKf2yT9JPtc1Y3uEHtfXl/MMAsXHFw7LMGQ/X0h5ty2L/aSjBOWxb0pwTZlAL6yI7ItrvAfCdk/MmR/YWfPI/xczYTEE9LP75SLvSnkf1V0JPzc9vxPJPwcz+i10+tI8BrrdVa/Gvo53uA4grsh7aHAgzLes1v5leCbzzkKXNLP0/u52s/v/pP8T03NmK393KXxMYbl51hDwbEawQWLxYUFGaNPm7HSqIzJeF5FXx8PD+w29w93A7x58xpPnzzBvXt3UVJyA0WFhcjPu4bLly7h/Llzhmj/+usv+OnnHw2ZJ9n/TvBfIfC0FZT/979WTlJvyL8h/t+bQwV9iJ8En+FMWDMJ4NnGbfHf7zy9ScdOQvz040/4+aefpDy/4neeW/DHGZz9808p53mcv3ARFy5cwPnzF8QW98WLuCiw7ku4fOUKCqRud+7cwfNnz1FaXo5a4TlNMv5v6+pCSsaYo1OTmJex55qMZzdlLMdJgG2e7C/X2hx4yQkBzzYTAISMv/k1gG0h8ApD/kn65d4yJ+77q/mMe+gTfUugw8hmtB8SX8MwV0vxeUfzvo4QfsGxEH6SfBbxnajMmYJir05uo/V1P17l1+JNfh3KCoTsFwpHLmhBVaHwoEIh+teE113lO/uW7CvhrxDCX/4xhD8q/xxgutkI/0l5aplImoy7Un7IpOwfTfil04brznR5qFrSC2XNhKTvD7gN2RHC39jkaa1h2mxXk58XVuPwB9A1fNCxbKpXm2Uh2XV/KPnDyXT5kFTjk8cs1y0b4dcwSobjCJsl/BVm5V4HD7wufBC6RutQW1uXsQrMGVxLuk8DO0hRN/NjfaNkWI3OFvMHgxMAJICcaOHqOq+fSYNpefXkyj+vKcO5J7yS8PPhbUll0C7vc0fPKSDhN/3M0xN6DTiDrMZeM7tLwZIBfjUinNb6xoanC8DycXLJbQ+9/rbsNsyJhN+Uj9eqxtTbNayPpmPBOgRulre3r9eE4+6FID3bf/oyCP+qU0eBl7em59pspyjh533Edz/tJwI1HW1bGyecTgD/Hg353fBR90k6urP5o24NE/VHyxDWvd8dxWnj/EXhvJX54BpnS8N1RyE6L769tgI/PcfNvOLyiZTBpOG6PTuativzda5bda47JpyxI3rfdtwMY90sbw45fDmwnylUpoSfE+b87dQBcHQwHOdXo26OnTguUaLPMQttgosD1OkCRTQ9NSqP0312wywUMpg237L2WAIPxtoTssHvzB+ImyeY81Njc5vbmFpew8K6kBhu0xcsCulfECJiSf+BEH4eUBZD+MVe3f7nEv6oyXYt2U84Vom7xtRxkmV1dd1s0Z+emsXw0Kgh9eawvkQqRPr5yb7+/kFD/qkfHBjG/NyijGf2JX0v0fcYt5xaNo61OVbmmJJjI7o5Htne2sbmBl8/3MD62oaUcw3LS8tS1gVMTkyaiYpUMiXjyi4Zw3A3QL3hIq9fvcaTx08MQS4qKkJeXh4uXbqIc+f+xJkzf5jDAflpQBJyl/i7MKv1HmEn2Sdp/4EwMmdCgJMAIuNuAh/0O+Ho5qQCdcz3l59/lnicQPjBTAL8xkMBf//NTFCcOfM7/jx7Vsp6DufPn8OF8+fNLgZjXziPK1cum/oUFhai8Pp1FJeU4O79+3jx6hVqhAd08GscMuYcFL4zNjGB6dlZzEl7rQg/2Ja23Wdb835wQKK/I/2A2Cbkem4J7Hf3d41/X+5LuS3NPaR3RIb7G7tFWBxCy2cRT/hJ8HWFXyu1t3aI3voxlBY34w3f0+eqfYGQeW7X1/f1CzpQc01IvpB+u5X/n0T4hcTZg5QYPygfy55J+GeE4NstwzpQpD9K+LkKW1ZW5v8YEiQ17vZ0PhRIDO2gziuLgNuWXcO0/RV+r2yK6Aq/bffMejKsuxWcDyb+gLKMnMRwDescja9pxBF+1tWUzQlHf5TA8tN01LmknP7+gQGTjhrWlz/wfPCxLdWQmNq8wmmcFvqKQHTi4yTDhzUnGezJ7dKXTToeURc3yxK3ws8dHlxJdq+/+y1+/9UGB6MxhJ990LanBeOyDVguNRwABf3bhmtrbwu1qe2TnJixYZgf68NzFVzDdE1bMR0T5oQVflMHmx/7sWtsv3DvuThb68U6isyEtXozGRAh/Dw4MLin9Fv84W/yu3mwHu5kFg0HjHYmvd6EYxzbxpnX4/0I1yXTH3Urov7TyLPpToIbJxo/m07dUTvqPi0+JQ5tC322nD69cBzrpq1pBrqwHUUQx9wP6mZfZd817kg4/oaoO5ROOBzl4XDhOEE4BWWaXtit+hxy+FJgn9ffI1fOZygnUfm7xPENxzU0/A1wf4NoXH+cmzYn+fn7wslZ+y52jxmrUM6xAcMQ/E1z46lRvSv74oZZyVCFq2h0c/vsLg8oE1JxIISe7kUhoKNTM2gTYllZ14D65jakxc/PgS0LAVniquPhEZZJ+PlZMG9L/7Zu6Reyvyn2yhbD7/zjCf9prp97raPh6eV14Lf911Y3MDs7j7H0BAb7hw35V4JvVvnFT+Kvq/6jo2Mmjr7v/D7DvNnv3fEq3Ybkk5DKGI19lxMRLA/BT9XtSf/gxMKOkNBt6QMb61syzlnD0iInAJYwOzNndhyMpse9SYmUjEW5w7XG3HPcDfD8+XM8fvwYd+/eRXFxMa5du2ZW0vm1AK66//LLL0LCf8R//8uJAO4CsDsBuFpP4v/9DyTzdH+HH38Usv+TBeX/5YGCPFyQBN8LR5ndOSA68evrAnyFgGcCcAKAEwj8NKD7OgInEX7+6UczCXDu7Bmc+/OswZ9/nsGFc3/i0oULuHz5Ei5d5qsAdgfAVakLdwGU3LyJe/fv4ZHU8/mLF/ZTgTK+65Cx90h61Dx3zDlXMkbkpxzXNzaF2O8KwZd2lfYlSPz3Do6wfyjXRe6zgyOuiwd3gboVZu7udJf/LzUskpZXKX6Y8ItGA7iBxX4nNHW6fxk1jzrxMq8e5XlC8gs7US0wq/pC+isvN6PySjPqhPTXU86D+jxUFbSYLf3lgr8n4Sd5q6MtpFBlHLBJWJZ9fDx8aN+MkGOf8HthuQLsEn7e/CTNfJeIJ9cSXInnu+dqGJ5y7g4wK8YO4gg/y8/tPiQqfL+aq5dM382XD5Zmiat1M+lJ/VgXhucqrxo+iLhNjnXk6rD+SNNw5pFliLYX/XGEn+mwXAZy/VkGztDvyA2nhuVs5+SGKZNDwsXPeLxZXcNVf3fbOg2vK8vgxv9Y9PQGBwydxmxLWLvynTlhYVf4w3U1158zkoMDXj8QiK19ghMCpl3Z/0ybZG7pZ3/x21XAe4urKNEJGm6BdK8V3Qwb3R1hV9yDcCx/dDs//UEYe59mP6Vfwglos16uYduyzG5+2cEw4XDsl9EVfvYH5su8omDbUmd3Y9g0OCERPXSThj++3G3C9+oGBvrNVtEm6dccuLK8vB6M79pxspNJ1sfo/qo4xLeaHmUqF9sj05lhXH+c3EnDt6OybMimj6bl+t0w75O7OpXH+M29o3I3Tlw4leeQw+cHn4sEn8vRMR39fHZyzMDfj+gKPKHG9WeT87eD40f+rnJbP3/3OT6ITiS48V3yTxPV/2VGsiRJ3CNBF9K+vSvk7hBYWtlAsqcPpRVVuPfwMfILinAtrwAvX73ByNi4OXSMJ/Wv8rdJxk2cAIgj/BtiL29R/88m/CddP9WpPi4srwG5t4rpP5L23RViTUI9PT2L9CjHaEOG4BN9PTzgrxddndxZ0oe52XlD0E9j3LKoYX/lvcDxMm0S+90da+9JvyDUb2zHzQmAHfYfrkTL9d7Y2BYiu47lpVUzccFxDSfBOJbULxVwHM6xGu/FF0KK79+/bz4TaCcB8swkwJkzZ/Drr7/hl19+NqvyPwoB/15IOUn8d//9tyXz/AqAWcEX8u6S/h8t6dewBP2cJLAn//McAfvZQPr1oEDjF1u/HPCzhP9F8uUnAukm+JnAM7//hj/NRMCfOH/hPC5eEtLvkf9LnpvnG3BCg8jPz8etmzfNZMfbN2/M84ljTi7O9XKSMD2OsYkpzMxxJ4DwCWlbkn2SeF4l9y5woTrawdX8doyWT+k9Ed7SL1oJ5G/h99wUH20eI1UzgjfFTXibT/LegZqihJD5DlTxFH7x13IL/7UWsVuF9HNlv8WC2/3/7oTfkH2i1pJPs2rilY9lj9vSHyb83M4cJvzvM3wo2FcD7JZw3datxCJK+Bme5G1tbdVsa6bNlUt3NpGEM9ndbdPx0lM365GSB4L7MOL70DpQjPuUG0lQtL3ojxJ+GpLzVZbNlHENG1I2dwX98PDAECsOTlkelzDbNuBn+rpPbEOmy75l6xSO/35E49jrzBUJ9lOS2dOs+HPbvvkWv7lmXjrijm7pP40ZHhk27c80TPuKzQe4a/gjweutYBu4K/s0HAjxmgTXidfM9t/ofcD4Vm/Dst+6ExU0wasINhzTed87/LS5C8I1bFO7TT/chyxUZssallvEvRLyPsP+zckwlwCxbaKr/K5hHPa7DenD/GSjOY/Ce2a5pD5M9AM7HtE6WbebnrWjcOO4srAuXAY3jHWH5Ro2m07dQbqZukx3XBm0L/t9OgNeOMcdpw/bcXDDKFx5NEw2XdR/Upww3NX36Eq8u4IfyOlWRHWME/jtPRPYUbft3ypz080hhy+LuD5HGcHBNn9P3d8oPl9JfNyxx/sMxyL8LdR39vm7xd9npqGImg9J/2OMSf6ELIxa/hxy674QdX57fGtXCLuH0bFp+Y2vx7NnL1BSXIJrFy/jAg86++MsXr18jeWVVeweHZvvi/ME/pVdIfTi5vfJ+a1ynhy+Je5NwaqQQUv4hThKphzLZyuaFltazVCCvwvh/1TDa6GIGpJ/9qf9PRlfCYnm5/gGB4fR3zdoVvp5Yj9J/9AgJ5pWsC/jAzcd9rXoBFOcoZ75cHzB1fxdruqT6JvVfW73F3jE358AiPgtgrDUcyGNk2Ic15ixt4wNuXORu305DuM9w10xHN+SS+i4ubS0VPrfMzx48AC3b9/C9evXhThfxcWL53HmLHcC/OSTervi/99MPycC6Hdk9jBAkntL9kngaX//H34p4N/4iToFJwUYLvKlAY3HHQB8NeC3X38zkxPn/jyHP//80+xW+FPulwvn+BrABYOLFy7g0sWLuHrlKgryC8xZBwbXi3D7zm08ffoMFRXCfXr6sLS84j2H5Lrw2thL5BuVReVf08Q+5+Sf3rlK7y2XZ1iV0rYWCb9JhX+EXu3MH6C9dABvippQbrbyC7k3B/OR2LeiRgg+QbJvvrefx8/yWVQTSvol7t+P8HNgWi/kvdZze/ErK6V8J7zDH97SL8QpsqX/fYYXkuF5o5ot/WYgZ/MnooT/JMNOzF0HrVwxlrIoEeWWH02PZw642/lp+K102x41pr7RVWPO1DMtt1wMH0f4sxk+FOcX5tHe0WYGtAHhzgTTj57Gr4Z1JPlj/nFx3wdTfrZJRK79gX2WRI+rCZw55XVhnnGG2+xtfFsfphFd4T+NMbsVItd9dDS8pf8kw0EVdw1kW0UnYebkhDuRwQmEzk4Senv/Ue8a/oiQpGsa3JrMvsGJgejXJUj47b1t04qupHMiwk3LhymrQuVMw9MZvX1ufBzhbzDl0bTpbm5uySh/NsN37Dg77KbxZfFX5fN3hLbNt9BGbhmkv9KWPsJ72JL1iM6EP6ncmemxz5n05F4wfi8NlWs4N461T8onhxy+PNhH+XvI39Dol1HchYnTGP62kbyQ9JPIZPst/ksNB8yC6BicNSP4HrBwcWztHGJtaxebQsw2xc3V+bXNfQyOTqKlrRPV5VV4ePsOCoXwXz17Dr989z2KC4vM63w7QuC3jyX+nhD+nW37nf59SUcIItPj5/k2D/gZP67wb/8tV/j5Gx1HZL6W4cF83FbP7fuLC8syDp4Twpz2v9U/MjKKtXW7td8t92nqQT37vplc4HZyJfwfBY/0G4hf+gbHc+QRdvfArpko473H8SvHX9z5yXE9x/LkMToRQM7RJHyoRsZ19pWAp3j48D5u3rqB/IJruHLlEi5cFGJ94RzOnTuLX3/7GT/+zHf+LTgJYGwh+tzW/52Q9++VuIv9szcBQLKvRP4nkRlCr5MD9At+4g4BiWMgfjOJ8D2J/8/mQMAfvv8B/+UXAn740UwC/P7bH+ZMgHNnzxrCzzMAOClgDgkU0M0dAvl5+Xj2/AW6Et2G7LONeLnMTo+j90/WfC2j/Yr9JmNSieUXBq93Lu97wt7FDKcaIjAmBfnzbv8dFkfX0fKqRwh/I0r5eT0h7ubdfSHxJPP8xn51QVMGamgbwk/iz/B/R8IvqKkj4RdS6BB+E06QnfBLeE1L7Lgt/ZyVJslwwZsxOjFgt9a3BekJPpTwcys4f2w5+OPqWXiFrcqk58668wFEGa8NwS1AHR3tntYaPkAsYWO5bNnYLvwcYJTwZ7t52GHZF7hCzEGpJcoO+Lk7aXv1853vuIkTPryYfyhuHJheSKZxvDbx/XYSwMidduLkB3Xc8cBPKHLQEa0bH6r8SoBd5bdtEiX8jKMP4mzgNvToQD26wn+SYTmYb9z9ZYiIgKvd0a343NbP68140Ume8fExiR9cb5vO+w/to824rgkIv9bRsSVO4FedK7e7a6KEn/0pri0VvAZxEyD08x7lYJQDSIbjPZCt3zItu9NB0wmnF0DL6/rj3FF48Zz6huQZ4VVn3UGfDcsz4cRh/z+VLpqe63fcMelpuULpee5wmRXRvLLJs5QhA9nCnSI9Tjj5MgV1gqzXSeDrwnFs33F1jjtLHIU+F4I0wvFVHrY1rRxy+OvBPshnNn+TOPZRw2dstudsNsPnL1cuOV6i+0PjfzEjxWBRWBoF3/PdlT9bB0dmBX51U8i4gAfrbexSJmPGxXUkeofR2dWDxuo6PCXhP38BBecu4Pwvv6Lw2jX5bUpiZ3+Pi3BY35c0hPCviX/TEH6mtS/uQyH5h2YHwN+V8LtE5mP6xhczUgwSQRLz9fVNzM8vmZX/dHpMxu52B+jHlJV15RhdST9X6H0IcY+DJfTZYd/53zXjGHMOgBn/2PGm3Ulgzw1gGAXHi+vrG0J+lzE7N48pGfuNyZiNO297epJCjDvR2taMuvoalJWX4eWrF3j67AkePnqA4hvXcS3vKi5d9g4IPPsH/jjzO3797Rf8+NMPQtK5Ui9EnaRfQHL/0/dC0r3t/PRTb+QCQ/gFv3hb+s1kgHm/3ztE0Dsw8Lv//Bv/+fe/zZkD9NsDAb83OwD4VQAeDKj46Ue7M4BnADx9/AQdbR0yvp0x7UDDa8frS+jkzbfS9aKGZdN7JGQoJ8QZvYN5Z4elgTmS+vLgPn53f6xnFvVPuvC2qAllQt65PZ8n85vT+c0EAEl9o4cI8XcJv+BvSfhr6zwC6A1M/ZUWAcvO93xdYwi/kIdQGhHCz4vFb8yTWHGnAAkRwfT4DjZn4FyjhFYRJfx8YExOTJiT1zkBwXe7+QBxDevsktugTlXm/R7XkPzzsLbu7oTZNkcwTJRs6zvrWi66497h5wwitxKxbFyl54PHNVz9tWV7P9KRreGsu90FYev0KQhW+O01i+pdMD8SXffcBRq+nuC+y087uqWf7cMwPAGfEwfsexZNaPIQt/o9GnmHnyvubFeC91S03/A6sj+518gF+1/04EROPGkd+SOghteR9fAP4jPkwvbd7ITf5ssw0a9FcNDHOgZli9oK+839sCye8HMQyOcL748oeG4E+6aZ8HLSihJNpstJAfZ97nJZWJg37Rg1nOyJ3udEPHG1yJZvfBy3HaJtkon3p2fxYWWwOEmXDXFxVBaX78fkcXq8v/0+HNnSpPwknXW7K/FEMLlHd1Qej0AXTSucDsNlhs0hh78OfK7qwX0cz9DwN+VjVuc5fuL4hraa2AHwVzAydvYG2DI2EezJQHpDyNvKlpB8fmJPyP6KkP01IfsbB++EvL/D6PQiGttTaGzqQENVDV4/eIg7eQW4dS0Pl/84g4KrV5Ho6sTW7g52jvke/y6WdrbE3jPb+tdlPLEm44t1klFD+Lmln4T/77eln9cwiq9pTPaRInAb9OHBsSHKJMmbm1tmbJytrCfVQevI/nsg1+4kon9q8D1/gmRe+gLHnruG6DsQmd0FcIB9yfeAh9SJTRnrtSljS756u7a+Zl7HXZLx3fzCHCanJszrpjzjihyhrb0V9Q38SkA5Xrx8gQcPH+DW7VsovlGMgsICXPUmAv48+wd+++Un/PqzEG8h7krkDfEX/Jfb+7mKL247MSA6LwzJPycEOEGghN9+HlBk4v/ppx+NTf9/+VUASYPu//z7//B///p/4AGBPOn/wf17Mg5slLHbNA4cDsJdHDy/wZxW75iv3ffeZ7L2txhYQ1f4nqbrkM/TI8HeEcZ7p1H3pBOl15tQXtjsfYrPokpIvUWjA5URAeEnPpjwfwkwv2yEn7po+PBKlSP3CPrESSv83jZkrghHCb//WT6zchQMxiqFhHULwXZ/zEgQ3QkJEhjXMO06IR+6Mss8eViH2yE4k8VPeOi2frNaLWBZuQ3dNfYhxB9QD+bHlAjSo9FT4rV9WL44ws+y62npDJ/qSYV+6OkmMWUaSjbjQD3JvWtISk8m51K2iJ2pC9y8DiS23O5k3teWOgXhbTh1s05Rwsy6cKXYtos9g4HpRU/pZz1sGHtNtQ+Y/uXLwoiu8HPyhIMotitBoqqDKTXsjyxrkI7Nh2D+nMxxJ2BYNh6e2NnVFbpGPBeiobHBxDFl9EB/rRD+5RPf4c+cVGKf5Q4D6rQ8xu2la2RiczKho6PNyzdor7h3+DnhwXZg/GzQvIL2sP3W3K8q88Jqf42bhGM72fJrmVy47RzkE4ari4uj7jidGyfOHxdH3SfpouFc2WnjRHUfg5PSc91xiA8XT5yjcVzEh3PJtEvMA53KXF1UFujcOFrGwA7KrX2XfndLv/Zd4/Z0TC+kMxCZ784hh78e/K3i+IC/W3aMYQk/7U8l7ExH0/pahjkrTeYvp3B581m9JSH7i4KV3UMsC+lf5gTA3jHW9t6J7BhTS5voHhhHU2sCjTXym/LyFV7eu497Rdfx5y+/oig/D739fdgUor95LPH3drC0uy1pCNGX3+5VGVus7NB9iLUDnuLP7/TvCPkXQsc29soWZyi3+DYI/zdlWHVpAu1SZuWXTeIY9ttDkkVnvK59+0PNofRfknGzSu8Rd0PYlaQbOIQ+FgxvSfwedww4MDsAaMvYi1v/TXjx+4TfkP4jG4/En2WR/rUv/WhX7J29XWxtb2FtYw2Ly4uYm5/DtJDnyelJjI6NmkmAVo7jZbz5trTUnJb/5OlTPHz0ECWcAMi7hrxrVwyuXrmMSxcv4Dx3BPzxO379mavwfLffknVzgJ+QfZJ1Q+SFvH8nIKEn6ee7/Ib8c4JAYIn/D+ZVgn9LuH/96/8zxJ8n/N+9e8fsDp6dnca+1EH7tOE1uqLvzdTRPuZzhP6/gdG+5uJEYzqwDcPdAHw2HIltqi+epfE1ND3rQmmRjPWLSPiFyAvpt4fxBeQ/QLADwO4C0K3/H3Fo35cA8/sgwi8Dp3DZxPbkDB99Nzkg/EGcuBV+kojYuouMRFO3mtAwLokZJxm4EhZH+PlDyviG3An4/g1XPF3Dk8otYRUwrKBRrodbtg8xJPa8nn7ZpV24ah0l/PodfrOK55HPxcXwyjhXqZVIZwPbnOTZNVx9fd9q/GnBcrFt9R1DbnfnioQpux8ucFMe3fbOh2N3otu0BcPQtiv8wfVUwm/DuGnbNClzbXVHT+nnhAvbRMMxPfYr96Z3+0YcmGeUzPYP9Gf0a3uCv70/zD1BW0BZ3Ao/v0Bgw9p82E/cCQQaTowEYbw06VbSIn6G4TXmirq7W4H3Trbv8GvfZrg4t+tnnjy9ltedsrhwvCd5/7ntynuY7eq3hxdW47huN604W90BtB003bDtho+mF3VbhMsX6MNy15+pc+Xx4Vzd+8oQJ89ENt2HxHH9J8XLhg/J631ygjrVq9uD9iXT/+XeCsk8W+WM7/Q9S/T1N0v8nttH1J9DDn8x+Gzm7wB/W3QHohIl2u8drDqGYaPPY03raxgWhbkT/JXbkxH0ppCnlZ19LGztCITw7wsZ3z/GAlf6d0nM3wn5fydE/R1m17bQ0d2Pumoh/G/eovTZc9wsKMSvP/6Iu3fuYHpuDjuSycbxIZaE+C8I4V+ScdaqkLhlIW7Lks+qEP5VSX9J3OYTfjnC/3kMr+0RD9iTljlFk0T75mkNiach6oJdGbdZkr1niLeCsm2RnQRL1Hkw5IG4A+yatO1n5/aF3PMzdLsmnM3T5OvHC/JmnvyOvYITBjYMv1VvsbWzjdX1DcwtLAr5H0NPXx86urrQKmOrlrZWs+hZXvrWnAnw4sVzPHn8CPfv3TWHA5aU3EBhYQEuXeJOgDPms3y///Yrfhf7119+Niv4XNHnFn4Sfv2EH9/n/+93IuOOAG9i4D///pe4v8PFC+fw4IFd0Z+e5pdByEn0mvBZI88L7hKSdiDpt4Rfrhu39Uv9OBnwLZpsfUvlVqdwnJ7Xt8WQ8B9IPd3nw/7KITpKU3hbWItykn0h9STxFjzE7ySEyf8HE/6o/HOA6cYR/kxiFw972J0daDGteMIf3urL1ffTEn6u8JOAuOHpTvD090rbJtkIPwfSQTkzV4RJYF1yzDBciXWN23GyQQ3rYYidVw+2R1bCb4itBcP29KS8ENbYlfpwW0fBeB9D+HUVX+1sYDrc0u4aps+VZOqi+fCbp9wC5ZrNrc1ggkPCsE1OJvyanrSL2DZeuE8o4gg/01A93dwmH53oMecB+OGc8AL2t+j79ewn7jZ2Ds74lQRdPTd9X5GF8Ltb+hXR3Qfc1q9t5JaLoIzt4F4PthvbkvcN0dcXT/gZP5NwBu2qOubBe439lW0ZfsXAhmMcyni93L6v91wQPlx+jR+1o7LscNPLTFuRPZ3s5QoQ1UXzjPpPsj8VcelF0z5NXm462RCN82nIXNn/EATlskQ+sLPJ4nTGLX3R9sewm7bvps4griw55PBloH2Qz1iO/fT3RUk6bff5+j6jY5EPifOlDEtAvsAdwQeCXakL36fn1vqlbSHn2/L7IvaikK4lIf3zO4fiPhbyD0P412Wot7C5g9ZEL0pLK/DmxUs8f/QI+Zev4szvf6BMfnfXhFBtS07LQuLnhWjNCRbkd8t8k58Ef4e7BrjdX9LdzRH+z2m4KHqkZN81WZrmY/sl4/B96oOjI498K/EOyL4h/NKv3gc3XgBL1JXkW8Jv/Ur4LWz+hCX5nCQIIwjL+JwQODL9/1DKz7zWNjaxtLJqvi7BMw7m5uYxlk6bMVunjKUa6utkrFZhxp/2N6oSb9++wbPnT/Ho4QPcvXM7NBFw5swf+PXXn/HLzz+Zlf/v/vN/Yn9nvhxA4v///t//MxMCXNF/9OgBuro6JN9Fs1ofGI/oHwvRp9x2fEv46WcFPNm3ak73nHTuXa2PC88Ywi/tcShPCLqNTJ5Lwy1jqL7ZhPJ8Gd962/PN4X0Fwll9tHtwZIVC+g2E8Bc2f9uEn8SCB3bFYWnJswVccTQrK14Z4wg/SYzZOu/lGUf4ucWkvKxMSJSQFwO7fZhhowcBkuiQSPPGYJqnIfx0k3jqDyoN3dzJoAST5Y8SXL5vz+3XrGcUlEdPymebGMLvpXfSCj+h+bL+bjiWjaTShlESHAZ1X3KFn+V0r5NrduQHd35+zlxvguQ1umJNMzM749TB1tUS/qCuvJ4kmuG+rwNxC8Yz11vSsOnFEP6F8Aq/Itq/eY3t1nPNR8PaB210gilqSKT5nhbDarloW5yG8Nuw/PRj1PDVCbsDgVvo+XpCuZdmnZmIcPsvPzPDiTm2GxFd4V+RHxczKcE6euVzy6puvX9bnN0cNLymbAtOPJkfI4NK07+iOzl4fkLwSoK2p1wnr76BO2zba2XvYytTt6ZDOx5+HOd6R9MzMmNrPNdtw4XzC+sDuLpomLAuLj2VnaQLywN92I7qovFOcp+EaHg33klu2haW6Ks/6o7GCezQVn3Pdt2+TPpWbDjT5yIytVXHuBG48qCMOeTw14D9jr+L/J3Xg/vcwevHkKRvxfBXypAdIT78Zr7dZs937fewIAR8XvzzuwdYEMK/KKR8cf8dVg7lN0fcc1uHGF/cEMLfhxcv3+Dhg4coyi/E77/9jivX8tCRTGFHSMmWjNaXZMwxJwRrlulJPou7h1jcFtK/zQmGYyH83DVA/64Q/oO/HeG3XYDloPvjiPNnN7aBQobFMhwx8t43zaeU204cHRvSb8k4ybsF3YSuqmcHJwaUzFtCHyAsD4i7knnm/c70ZULJv0v2bRgL+jU/+jUe5dxRQJhdC1L+7e3gU4HkU/p1AE4EcMzK15D5lQCOlznOI1fk+OvVq1dC4h+ZrfnFxddx9dplnL/wJ86fP4tzgj/O/Ga+FkCi39OblPRX/R1EgZH74OhA5PsypuQBi9K32dhWZUDib2Se+Fs0cf0qvr/R79UlCs/QeSj3uCH8vNetAOtjm+h80YsKru7nkfC3G1TmdwQoIDolTAcqCts9tAlaBS2Cb5zwn9YwrpaNduwKvxAEN0/6XULFi8N0SKJ7enpNJye4EsuVxujF48Fwbjtl39JPkmlXoklaGuobMrZrc9WfA26CBNd9f5s3CW82XbEPQwhZeYUps0vCSLhbW+1Wa4LliCf80mYesWZ6JHQke66Zmpo29VQCrnDjfQzhf9/KvoLpk6hGDxU8rdmRh22HEEYO1EnEmCbbxBL+8CsafNjxky68HnHgFvq+vj5zHfW93Oh5AdEVfoLtx9Vo9xrxO7HN8gA1YQX++79eHMqjuwJcw4cy379kuCA/62ZfOc0KP921tXUZE0Y0JM+sG3dS8JN3POCP/TZ6H9jXCmyarGd0hZ99gfdVqC2N35WNmO35rA/DRvPgtWe/HBgYNOXRe9JtT5oJaRPtM9oeYTuAJbiZ7veDaZ0uvXC6mXHej5PifEx6nxsfWgaGj8b5FurhIrgHfTfvKeMWyH3vE3k/jHWrzoZzQbm93zLkBuKWOJllySGHLws+swnubuSAn89eBU30WXwawziceOfz+WPify7D92D5nfwNIeKr8nu2Qshv/rKQchL+hb0DLAtRWjywZH9u58iQ/aW9Y4wt72B4bh296VmU1TTi3sMnOHv2Av79nx+Qf70EXX0DZiV/VerI0dyiEKg5k6ZNd2FbiL9gefcIq+Y1ARL+vRDhD/96hY1cAfPPEv7gHzWfzzAtlsJNk35SDaEc7/awf7SJ7cNVbB+tYfd4AwfvtqTsexLjQHAk0HJ9JSNZs4u5MKeiC3l8986Wj4GiZYzvlxJK5FEdfebdarnW+4ck5Zbku4Sf40wS+6gdltlVfr7Pbwi7rtqT5HvEP9ZmeM+t8QzJ9ycELDQtc6aAgc3L5Mn41HvxeTYAuQXHvbR5v9LN8Rp39qrNxRfuLuV4izyKPJFjNI6D+Ylo8giONSuryuU5Uo6ysreCUiGWdejr7zULswHR13ZlH7NTXrxGZnX/mGd9eM8LEnyO7Ric/ii+QcNy89wIcgq2GcfuPDySbbi3t2va1+9XtFx4hk5790la5v6TdvOER9tHGGkZR1UJV/mbUCVk36LDQ6dH+IXsC8qF7AcISP//DOHn+/PU6yA8usL/IYYEhATOpOcR06wr/KKzZL/W5Ek77nR0s3Ve0ksLAXIfOLzZ+P1N6nXSgOcRaL4ccHJl3l0VZXxey4pKu927KRvhNwTYggScYfvlRnYNZ/948JxbVxeUfwzh/xAwD05qbGxkJ8BxhqTVPZ1fQX+U8J/WrK+vmZuGA3S2W5Tw8wT56hqrY7kJ5se+4E708Bqw34bvNR34816rNEQ4zrBvme38cn1DcYxt8+PkDfuOa3gOAHVBfgxbaXaYuJ9lOq3h6nt9ffANfdalN0L4T2t4j3InAO+j6A6X0xheS3ueQNCeccQ7KovTBbDtGpa5usCfGTcu7fg4Qbi4vFR2ks4iM70wwmV4f3rZ5NnSz0S2vOjPltdJyBbnpPROE8faSuAVel9Zd6Bz5VEYHe8Hgb0vPNvzn4Rw+XLI4a8BJ1r5G6AH930Ow3Q+V1rWMC1v9EtwNVBBeWQVkO9ecyVzU0jWGg8129o0WN3hwXpCxr1V/hXhHXO7h5hY2cbI/BrSS5sYnt9A58gMkmOLQvz30Nqbxu0nb/D7n9dwRlB89zFe1TRImDQmNzaxLAP91UNu2z/AiriXJd/5nV0sCBb5Hv/ekTkccGXnAOs8mE3y5GsGXHV1iuwZSlxYkyn5HIaki2RMbCFYZoJG/McQ0nI4i6mNHgwsNKN7ugap2ToMLbUY2cr+OLaPF7GPLaH9exKb8TzjFJSX3/A2lWUYVTC+/adStdXthg0jCOEamxrTVQTpn96Ew5vcpTJHQk4PhMTu8eA8kn4hdAYyBjHw3CT6O/yKg4yH6Taf3xPuYL7vL7Yl8eo/MLyC6ZoD+wwx92B0HmTsp7pQGAG38gdp86BBLR9h8+F5VpoWx5HEoWcTLINOAOgkAGXkD6ZOUheOq0loOU7jwif5Fr9Gxvfy+QxZXl6ScNty3Xl91LD13PZUd9QWY4K6Yb+MYX+PLhplNVmKwz7FtlyX58CC+SzkJIaHuDNiWHgeF7XGTPssLCwK+d8J5ydp8pyCuMMIOeVmCL8JJP8P32FlYg3NL/h5vjpUXm8V4t+Cynwh89eEywnJrxZ3tdnKL+Se2/2vd6Asn+FkXFzUKfY3/lm+05qA8LOMmYf2zTgr/DpY/VjCzw5PEsm87DfkJU0hkU1NzV4Ia3jTkLxQp2SfYP5dXZ1Gr4Y3XJcQ0Pq6WqxGSBpvJOZTX69pMD0lr9p+leYANdfwRmS+bBdu6edNq8Yn/F5baB0YltunOSulhuXkTodKycPmGQbjn0j4taxR+wOh9eDqLoksH0bZDB9M/DSjqaPEy0zLntLvbuk/rSEx1u/GZyX8HPR7batg+GhYPjCt3vZd23/F9sBBWNwDiZM72iZ+HI3v5ZWd8PPeZvpBvpSxr3IW97SGBzxyEsN9VhjCH9nSf1rD5w/jE42NDWYC4LQP4z253nw1QeujCAguEXarLti+r3o33GkRTju77nMjnG9QX9e2YD2DsAo3/kkIpxe01/sQTScOGi7OjiIuXNQdlWULF45Doq5EPnQ/6T3m+UOyuHBiG7dnnxa2PDnk8NeCvyMk/BwDcofbSb+rX9dwUEzwN0EIHLcAG0h5SQ5UTeeR3b68LdgQorIh5GNjZ0vI/xa2hIxtCjla3T/C3Pa+EPoN9E8vojs9jbaBNFr60mjuHUNDUtwD00hNr6O5fxIlj8vwx4Vi5Bc+wO1Hb1D85BUeVMhYrDuFpAzqx+aWsLi+jXXJc13KsyTjrQUZBy3JbxM/y2c+zbdNwn+EPakCR38yhrdFpi1/uNopFTL18zQCa9QXSD6H4bXmuJAricyfNENo/OE80qsdaBl/htrRO6gZvYXakVuoG7mL5vRTJKbLhfy3YmprAEsH09g83pCUgn6j5TQ1EUe0zLa+BOmSdz0NbEgNTzuQaLsQzEuhocOGaWUS/veYIMPAZInEsQnHxhxXk1ArqaftE/8IGPYkKOm2sKvvB4eO+wPA9EjSo3lkQ1waBOsYlTE801bYHQHbRndqAv0NGPY/lldtdccZnVdUw3C8Lltb25idmTfEfqB/SLhhr/C7biS6kkh29yCV4m7xPuEtQ5icmMba6rq0aXCvuH3OzV/PNWDfNQHkRjrcOcRgxyjKbtej9HqDPcCvUAi+2eIvZD+/BdXeu/p8Z5+En2S/nNv9C7uM+5sg/AQJCsvxMWBcTYdlJLHSzskfME4A8IfNzY+ElDdnXId2wc7NcCRnbJ+mRntyuJJkBQmTG49xSIi4Gs+8CG59od0iRI7b59wZtNGRYbNrgLNnLBPBNFKppEm/Xuqo8YN62Ouhn0PjzadxSQr1EEJ+uk3T1fz0QESztd7YFkyfkwfsfAzLODytv0LSceurYBqcJNC0Cc7+MZ248J8C7X+83mxvbgPnBMCItB0nfehmG/I9bm2nbOkwHHcvuOV+H3i97Kq29564tBd3a+h1ZFpsO9OuIQSf29M+R+g1IuF2yYaC6euWKLcc7N/+p+68OMzHpmHvAX6Wj5M+blz2ESX83EpsbBNHbF5ficvPTy5KPPYR1ksfhFpHTiIwHftag82P8Wmzjpwc0r7zIeDElj53WEZep46OdtOebDPmHy0P+zTvbU6M2LK45Yn6abvuuDBxus+Jk8rwMYimF+ePc9P+EGh8N40osskJ1WVLz9W7cnWfpHPjuu7ThAv8ZqJM3d42e3VbvcazbgMJY+C6PxJBeXLI4a8Dn7P8LaHN8Q2ftd+m0ZGxhd2ybaHGHK52wBW3Y2wLsd4UUr91KG4ZmG/Lb8yOYFsI1PrBEVYkzNT6LrrHZtDYO4z61CBquvpQ1tKNivZeNPVPoFEIf12P2P1TuP2iWgj/DVy/+QzPShtw900lbrx4jTuv3uJJWQUqG1qQ7B/GxOIyViSPDSkXP8XH3QQbnASQMqxJmbaPuBneI/wssx3LSz0IqYupj7ILIjCZkk81JB4e4ffM4bsdzG4MoX3sDSr6i1ExUojqccFYAarEXTlYhOr+EtQPPUDrxGsk5+swstKNpZ1xaetFqduGlHFfwO30nEBgmnyH3Kun+IP60m8k8pfvcLMc9FtDV6YvDpnGEnz3X0zIaBJxgbSgEeOSRI5feN/EkXwXHFNFER0HfS4w7Q8h/NmgY1W6o3WhnPXPRpL/Lsa9lm5drFz6jt6OnjmSzryxsWWJ/siYIfTd3SkZ3ycFKeNOJj2yn+pDKtlrJgKoGxoaxeqq3CO8CRyjZdD8+Sw4Muca8B71CiD/V2Y20PQ6gVeF1ai4Llz0ehtqCztQdU34nBD+GvOZvibvkD7hFkL0iQrzjn+n4cvfBOF3Bz8fg5PScnUkNXZl3JsAMHovjBnceVC3KxPY+CSOajuIhCHpVJjVeSFhBFfySeAN6sVdz8kOgRBJnpTpgjoNq2nolv5avwzMV+sa2FbOMMEAVvWqU722C9NTuQubT3aEwnvpGJx2hf+klX9f55XPL7t33bx6+W6zpV7De/B3Y9g07LXSeBZsl2gbqkwH9ZQxDa0nbT+M0Xu6EDw5iYSbpgmvOmu7cuu2q96Eus0EQSRckI/n9vQmvBMnml/Q/4P8GJ59loSbE06E2YEi/VPzz0jHh5eGSctNV9wR24Wfnth6bazOPos4QZVIdJmy8OsYra2csLJ6hguup9qZ6YV1FnblOyL3yxMji9O9D6E4meXLCj9eZvmy15d93SLQue5oHMGp6hSXhov3yV2duuPkJ+lcedSfLU4Urs4Jw+e8toPbHsbt6ATaX4N+m112Epim7/bLlUMOfy3094UT0iedG/N1DQfCFvzLITDB4TBXyg/Ew8/u7YhjR0j/hhD6le1DbIh7UwJsCcnfEt2G2Nx6P7dziIk1IfwT86jvGUZtcsCQ/srOHlR2COEfmEDDwCSqU2m0pxdw73Udfv4jDwU3HqO8oRNvmztxv7waN5+/xs2nz3D/+Uu85op/WzuG5+awJQN3Ev1VbvfdZzmOTJm2hSzsS3kN2SfEzfpY49aM7kBDkyn5VMN8pCT6rrCY/eN1jC0lUD/4CBUDRahK56E8fRmVY1dRI6S/Nl2I2pEi1A4Vo3b4FupHHthV/6nXGFqsxfRWQuqcxtbRPPbebUCoJw6kLaTq9jUGyUNrFxgSnQOBav8iow2qhXHdniEBc0lgnFHSryDRVmLMiQCdDHCJtMKNF13Y+RTE5fUxiKZH9/uI/vva61sxJ5fTXncSfjVcZNre2sX83CJGhtOGzJPcG4Lf3WNX9IXY66q+QbLPkn+Rd3R0oTvRg6nJGekPe5K+l7AYnXAIDPNnG3PizE6e0RztvMNQ2zjeltSitKgRVUL464o6UXlVyH4BV/ibhdw3CsTmtv7ChEF5XgeqirgY+oGE/++IaF1OgjtYDgbNYX3IVgIZgVnZJ1zC7xF2JfyG4JPoN9SjUdDQaG0X1BuyT6Jv0vLIqkdeo+X6FLhpxKbH/Lx8Td5qi876LRlXN9vBysJto3LXPj2cfI1tZQrKVB+VR+0QonX9JLh9zg7+w/LA5gSA2nF990Q4cf00ojIvrE8uHJmr07AazvotuQ9g5QHc+sWB+tMgLl5Ypvm75YmG+Shk1MlDVJ4tHOHqTgr3PjCuILOdPxRxbfq5ke3a/XXQPh7nz3CzXV2/K/Pa3LS7Y/tuxonITgs3vaguhxy+NngP0y4rKzOvwHHnoWu+pcE7S0IYkm+GwZbs8xC8XbH5gh4hY2JsinJNlJsyTl4Xor+2dygy6+f79jygLy2Ev2dmRcj9mJD+IbQOjaFlcAzVQv6re0ZQaTCKttF53HlZje9+uYSr+fdQ0diFqs4UntY24N6bMtx7+RqPX701eCDulr4+bBwfgScEbTHPIyH6Qhy2OfEgbH9XZD7h5wqi2NbQxYE9QXegocmUfKqR1AypEBg+IWU7XkN6uQsNQw9RNSrEfroQVZNXUDVxGdVC+qvT11AzmiekPx+1o0L+0zdQN3oDNcPX0TByC23jj9A9W4qB5SZMbfVh5XAWO+ZdfyGKkr5Seq2hNXSFJZ/FMLnTQk1Ezv5/mnvAkkNL2pS4K/FXwk+/IkqoPwQa92MRLUMUceVknXSHZZzRdtJ2UPe3bLScUROVcUV/a3Mbc3MLGB0dR1/vgCH33Ul+Kc0j+EL+Q/AIv+p6e/pNeO4CGBwYxtISX0sO2jKcJ90KlvEQx877/CsT62h6kcBrfpe/oAk1he2G8NcWtqKmqEXIfYOgEeazfHmdqMz3VviL2v/HCH9ktT4OlugKiTSI6oWgqt6QRNpxsKvw/PZ/cNieJfuW8NuVeyX6IZD0G+LfYPz1Qvi5hZ2TBQHh13J8XmidApnnNqSY+Xq2+FnPEGn3dCGZZ6vbRTTc+2DDsUy2PFqGEERn3TG6bND6eXE17aANPB3tLLpMOH2OCMWRPum5fQLCfurblHvhnD5M2Diqs/FtvCA9ozfpaNqROCYdL5yJo7pImT8Ip4tr2jAL4nTx4d281G3rFMijiMYReO1g7YhcdVGE5E6cDJ2DjDgxZfB1jvwkXUiuOidMnM6P58oF701PZadFXFxXFk1TZVFdVK46zx0qN2F1ph8L9J4x8MJEdbrjRnUu7G+Ful2dvYc+HDYvc6/SH5NnDjl8LfA9fr6CGD0L6KsM2nWsG8maXg6RSRxJ8rk1njDEWgbv6zIwXxOsHLzDihDrdZJtibQsZH+ZB+YdHInsCKvCtGd3jzC0vIXk9DJaRibRMjyGxMQMEpOzaBLSX9kzhNLuQVT1psU/bbb0f//7VVwruo/K5gSqu3rwTAj/g7JyPHpTiqeCB89f4Majx6hqb8fi9raQfBJ9KRfz3T80uwxWt3axtXtg68E6HPL0bpIPJUhR/JXm2BD+8bUEmsYeo1IIffVUHqqmr6Ji4hIqRi8KLgnpv4LasWuoGy9AraDGQ3U632z7rxouNu/7t06+RO9iA8Y3U1jcm5BrtIZ9bJtV/yO5ikKP42v6sVV3E/tQfEbD60hy7K7Yu4T6JLjEPhvi4sXhJFIfRVw+Cl3R/6cae+95Hs/Ye/IIOzx4c3HZvKPfmxLS3p0yBJ6knySeq/cKQ/65wu+AYSmnnuEp606kMDY2YVb5o4btzHwJ3o9hWHO4Lc+utgmUFtehLL9BCH0zqq9xhd8S/sr8JvP5vpqiTlQJ4a8g6S/oRNm38lm+Lw4zeLMgiYgSCVdmyCKJvCHzgd6Qe8/tbw83dgCf5NMmOXcIf2hLv7dVP0r43RV+6gzq6208l/Brft5qvylLiFRG/I7br1MWmU4mGLfkYd1BnhauzMYJ6z8QTp1CW/9duUFcWQReOLa7sZ142dwnguG03hn1p99pLweUGch94spCOo9gaDglHHSrzt5nwWDMwOgcgu6Gc3S+O6ILuY2Oshi4ZQ2VO+J33H49VefKxDaIyrLpXLmni6ZHOySjPyZ8Rlzjtu1Cv7WdtvB1Ebmns+nZa6vyzPTUDiNaViPzwobTszIb1tqBTv0aNyx301N9kHY4H4PYcIHbtRnOICZcKOwJOotwnYJ+RLmri7rV77i9Pp4ZTuDrArd/T2TTZZM7flemcfRe9BEXLiTT8uaQw9cF+yPHe3yPnwsLPAuHg3yar0L2aZSEhbKXQbn81aEvt4kv7+xgdG4OydE0OodGBKPoGEyjTQh7a/8o2ofG0J2eEHka7f3DaO0bRNvAMHpnFjG2vo+BxU0h+9NoGEijIz2J1PQ8UjPz6BifQd3AKMp7hlHTP4aa1AhuPCnFf3+7jKtF91DdmkRdss8Q/ruv3uDWk2e48/gpbj54iMK7d/GorAzNyRS6B4bQOzyKnpE0klK+rt5+NLa2Y3xy2tSFq/u6yve1CL97iblteO/dGiY3k2iZfILy4TyUCbkvnxCMX0HF2BVUjV1F3WQ+6qcKjF2ZvmpQPSmEf0rI/kQhKseLUDVajJqRm6hL30dD+gk6J8swstqBGR70t0/yv2zI/5HQ/2P5S+rPlvikmruRMyB/XISUMeYE1WkNr6eCEwBRIv0lEbdKfxqCT3Kvq/mEW4dshrpsq+V/B+Nu26dhvUn0l5dXMJYeN4fxkbST7JOwk+z39VnCr1v6KadfoURfyT4P8jM6eQZ0dXajv38Qq6tr3n3vZSyGbXh0xGvAAxCjpF8MwwqWucr/LIGKoiaUX2tEdT5P6m9GlTnIrxnVRW2ovZ4Qwt+FSqKwA6/zyTn/Fwi/wA5EPQIXklk7TOq8lV6jt3HMarcvY/ggjk80DZSYh2FX9p3VfbOdPyD3IZKv8N7fDxF+Ly9bZi2DdQeD5/fACecOxk3dJD1frjqxta4uTrs6//lgyxWvC+C3UQTxcjc9dYdtv30iMrpVF4X2kzgoATDEwL+nAplPINRWGJ0Na8m9l574g7iuLLCDfD4vTD+MyPQ+MXDaSMNltJuGp+3BDe/ClfnpOW5X5+oDnbaDbbOw2/XHhaGt6cWFVTsqC5chXJ5s6bnhAlmmLhPZdKeNY9zeNXHDuDrfnQXZdO+PE20H13YRJ4tHcH+cFCebLrMMcekFMmsHejdd9eeQw7cDjvcI/q7Zz98Gn/j9KsYb1NqRsIKU0JJCms29XXT09eLu82e4UnIT127fQYEQ7rz7D3Dlzj1cLLmFi8U3cfXWXcEdXLl5CxeKS5B/75F5/753dgU9gqruQbxu6ULzwAh6p+eE9M+aVf7mkQlU9Qrh70ujrL0XBfee4z+/nMeVwjuo6+xBU98gntfU49azFyh59Bi3Hz/B9bv3pCwluHKrBAVSnrwbkn/hdVwuKsalgiL8eekyfvvjLOoamgzZp7F/WdWTSdWXMMyOC7e0jVv+7XqEv3nyqRD+ApSNX0OlkPsKIfSV40LohczXCGqF2NcYv+gEZWMMK2R/sgiVEwIJUzkm/tEiVI/wff8S1A/fQcvYUyRnKjG60oG57RGsHc5h5926kH9+3i8g/gq2iIsTTSgw/zAF8+KEgFuiXUTJVCR1TeczGrt6a6GEWgm2Io6EfyhI6PUMgSjp1zDRvDR/lskt52mMJak23t+J9Gu/V0M3P2W4srKKqalp81k9Q9y5Wu+Qd31f32zVFwJPm9v3OQlg0DsQ2s5vVvW5M0BkDG8mCEQ3MTGJrS1+qi987/MVG13lDw7t8+4ML9jB5iGGW6dQc7sVZXn1QvZbUJXfiMr8BiH7LYbwVwvJr87vEl2X+Rb/y/xq4ZX/dMJvtlAGfg4qddDp2oZo+DIhdp4uPEkQuC0xIQEMYAm/kn7PrYRfYMi+wD+UT0g9t+8HBN+SfPewPpJ9m0aQvs3PLYN1m7p4tougLo6McWh7bjecX79o3aP5euF0u73Vx4TL0EfDngbh9IJ2CBC3mv8+WeYuAoXm5doBtA39tvTcPhlyZSHofWRt121WCwlH5yIaV1cdfbLhhLMI8rR6txzxiC9zdrj1dOO6sqjet0+QubqQPptMEEovqleZgG6LYJU9Hgzvur04XnrG7emDdIJwLsJlCYejLJAHOl3hd9PTcFamOs/t5OG7s+j/CpnvdnSuXnUZ4YytbfGJcO4T347qxQ7fNwF8uauPiaPu+HRsvXLI4VsEV/eV9Ot7/F914M6sDXyHQKkgsH90gMn5KdS1NeHhq2e4++IpHrx5hXuvXuDms6e4/fKFuF+ayYDbz8X/9DHuPH9uD9d7U4b6pAzK55bRMTaD0tZuPCyXMUFXEn1Ts+ifmUNSCH/r6CSq+4ZR3TuCl42duHL7Mf7z63nkldxHQ6IPdTKIf1hWIWm/wN1nz1F87z4uXy/GVSH8BffuoujuHVzJL8JPv53Bv374Gf/vvz/i//u/f+Nf//oXysorbNU8o+TqazQ58wxa+FjI9xrGNrrROP4Y5SPXUS7EvmyiAOWGyJcIwS8RIl+MirSQeSH0VePXRV6M0rHreCtEv3ziOiokbIXEqRi/hnKzAyDPbPevGS1EzbCQ/6HbaBh+jPaxUvTONmN8rQcLe+NYP1rA3rttoeN2yz8nADgFYI8sE1JpymjLeqIxDakkX1/8iEJJf5ZUvUYx7SN/XHwOo2nptSdIml0S/rFQwu+eHeAS/rjJBfqDfvhh9dTwHxrvWzEsMz+xxxX3yckpDA4OmS9RGdLuEXxD+En8PfKvW/iN7ckYXgm+TgyYSQFv1V/DGrfo+vv5ifFV0+ZajsCwLcOEnxCpyMQp4pWxDTQ8akdpfh34Kb7y/HoDEv7KghaUXWlCjRD+mqIE3uY34mVR5f8G4a/xB2HBoDIKK7fEzhJ7wg2jK/xc3fUIoLHlx8IQQkvM/ff3PaJPcmkIv0fe7eo+QZKvnxYMCD9PQvfJfoTo23RtnpnQstny6iDawHObMK7cyGx9NJw/6GY4DcswXlyts8qtjDq3LAHidwE4cTN0p4TTDj6R96Bu1b9Plyk7qVy2vn4b0Va/4w7D9r0QKfDuJxeVVXbgFZUrQulR5qSr7wZbMhLOS1ciNY1ga7iE83TupFiAIByh9Y26jf8DbHW7flfutmtI7tkusoVxr5MPk67WibYi6neRTefK6Q4QlD9TZ5FNHonjtEOgD+ssYsqgbme7v8p822sjV+eGDYFhI+EJP3yMjtB83HTVrTp1x9U3Hm59s7dloKMdjnO61fdsckJ1Nr6m599Pnj+HHL5l8DeBhJ9uvsfPccr09LQ/CP2rjTk8jkfXG48Mbk057KCXB1ft7e9gWsh+R7ID9W0NqGutRy3t9iZUtzaiqqUBNe3NaOhqRV1Hs/jrRF6HqtYGlDfJWCspxH56FgMk/COTKG9N4GFpJV7XNqBzcBgD03MYmF1AYmIWNT3DKOvsxcuGDlwqeYj/+/lPFN99Ylb4XzU04+7rN0L4n+Hmw0e4KmT/fF4eCm7fxu1nT3HnyRPkF93AL3/8iX//8Av+74ef8J/vvse///1veeZVmeqpia7w/dWGWVs6YQn/+EYSzRPPhaiXCHEXMj9eJKS/WIj9TSHxt0R+U3ADFUL8K8dvGMJfTkxe9yDEf7IA5eN5hvRXiF01LoR/ogi1Y9fNin/VYAlqBu+gfvgRWsZeomO6DKm5WoytdWN+dwRrx7PYxZrQ8l2BEFLpAwdCdsz6PMsb21ysRZTUK8J+cwKE/1UAIpIgvR7YPh9LZjXeaeK6YXUHQNwkAIm7rtzHreCrnoTffiN/x/ipc4m+S+6Jv4PRtnlfeaVGniswfLaEool7f28fa2vrmJqaEf47bEg7V+CThJL6lPeOvpB1Xc0nlNQb2wvrk31HZiYBqPP0Gjcl6ZJ38/qoCepFm9D+acGpryM+E0W1u7qPnpphVN1sQhlJf1GjEH95BvLTfPnNKL/SjJrCBCoK2s12/rqnH3FoX1T+z4IldXQHg05LdlV3EnzS6JN9C31/36zwm9V7S+zNCn+I7HNSwEMoDaZtv2uvZwS4+VpoeTPxvgG00fsDbyX3YbIeR9xVFrXfD5t+POJ0Kgt08W1gkU13UpxsCOIwbw/abuJWO9TGTlhfJjAEXe8jzw5DT6CP0ymxCGx3ZT9DFrEDsCwx/lBZVW4RrYcLt+4mnBdW6+/HpdsNp+6IfaJM02B8J724OCfpLNw6alu4iMpPihPWhfMJy7LpPiaO2qeN+8EybWcP6vbbn3DCZ8RRmWOfVkY7Hu41cGVxctW5tivPpssmyyGHfxZ0ZZ+/IST8lI2OjhrS8FWMjnPNWFf+ON+h3j/YxsLiNHoHutHUJmOntjo0dgjhb6lBXVstGjoa0NjZKHYj6kXe2NmA6uZK1DRXobKxCqX1VWjtTRlS3zs5i+70FBqTA3heUYsnb8rRlEhieGoWw3OLSIm+oS+NqsQAXjd24GLxXfzrxz9w4/4zVLcn8KiiCjd5SN+DR8gvuYmL+QW4UJCPwrt3cPPJY1y/excXL1/Dz7+ewfe//I4ffv0dP/78M777z39QW13pTWTQkGxZ4vW1jN/c8nf33QYmN3vQOvkaVelbQtaLDdkvnxCCPy6Ef0wIv8Cs9JPsCximYoK7AbjCX2hQ4aByokDA3QD6TX8h/eli1KRvoGb0BqpHS1A1XIJq85m/h2ibfIO+5QZMbKWwsD+GtaMFbGMT+0LUSfqV+GsLaukDYs++K26ukPJb5kcSw3zTnGE8+O5v17BPKMEl3JV5Jfhx0EkAru4r4aecaZDk6yTC1+xzH2tY5uhERWw9RMRv3R8dSLsdSHidITJy6SH7B1hdXce0PAuGhkYMAecJ+krSDXHnyr7YPln/WHiTALoDwLhFTntwcBDLy8vmmqixdWLfZJm1n1qQ8Jv6i/fdHrA4vIbmp50oLaxF5fUGIf0Cfoe/oAUVedza34mygma8LqpFT/1IjvArooNM128GsY6bOisTImjcUXIobl119ki7kn6SeV3lt6RfJwECoh96Z9+QfZueb2vaAs3PLaNbVmOr37Ndnet29VGd6/5omcAtayALI37iQPXWr3WvdWVeu2RDXLuF25AI5xP4w4jWM7vMvWfo1vvI2rGQAUHgDuQmjpOGL3PsOBltF5mTAERQvkxE6yF1UztSd3M/OPKoTMNlpOPZrj4U7j2yqF7zVHegC9cjXE/VRWUnyYmwzuYX1mVuzw/CUKdyN1xmnCCelWm4wG3sbO0RkflhXdvRG1lUf4IuJPdgZBFdSObJwzKtp0Lr7iJTHtf//Qk2R+aGC+eTQw7/W+B9oISfK/20uZ2V3+PPOpj+KwzzNXnbge7x8T5W1xYwPMoVtzZ0djejVQh9U7uQ/eYKNIrd0lUvEFlHnfirxV2LBrGpq2+XMVVbAzoH+pBKj6FJBt61HUlUtXTiRVk1Hr54hbdV1ahv7UCzDPQ7eNDfyBQa+0bxqqFNCP8d/N8vf+L6vScoa2rD3delKLj/ENdKbuFyQRHOXLqMy0VFKH5wHyWPH6Hw5i2c+/Mifv/9T/xy9hx+/uMMfvn1F/zw33+jouwtDoSQWRMQmPcbhvky18O29DvsCbGe2u5H6/RrVI4KwdeVe7ErDLknyS+2W/k9VIxzCz8RJvpRkPQb8F1/8/6/ogDVfD0gLfkMSTpDN1E3+hDN48/ROVOBvqVWTG4NYHl/BhtHK0Lnd9kjzD8SIG725xSAha7kkxFJ/5W2PRYyZSZYnDbOaO4v06yfzei9SLC/KHGPmwTQFX9d5Sfxdwm+xj9dn/t2jbZFbD1ERJJ/KISfn9UzIpHt7x9ifW3TEH1zGJ+QcZ6an+hKeu/W2y34/qr8ZyD8/q4ApinpBTsEmB9X+afMtbJl1OvMMrNe9vlHHHMCy+x2YuXEEuceV/lrB1Fxsx5vC6tRXlBnCX++JfyVhW0ov96M8tuNmOidyxH+04Mr2ByMOkTQuDlgVVkAQ869bf6GxNeS0JPMC7n3SL+u9FuQ7NdJeMIj+85qfpik1ppdBOp3t/KfjLhwlGWPf/q0FbZMlrRbv6/TsnoDfBdW7sVhfMqMPxuietefLW6M3M8nLj7taBzxa7nFbcvu+U+A3j8Gjix+pT8eJo5DYkK6GJkvN8Qm0x+Uj3LPjsp9d3awTYzt+G27era6Hb8fN2K7iIaLhg3HCZc1rIuRsS2MO6a+RhdOz/h9uavz3NninOgO7KBsmeHCunDcuHpSp/KMa+O63euj8sh1stctvv9bvcjMPe/5PZ3Vu8+BqC5wRxGvy2wXa7tyAa+Dgjq3XxuZEzaHHP7H4f5W6Go/3+Ofm5v7aqTA5GlA3zEOjvawur6I8akR9PR3IdnbJnYHulLNaE/Uo1kIfXt3Pbp6mpHobUWnyNsSdaKrRVt3LTp6mtDZ04rEQDf6xkeRGBpBRXO7Wdl/XlqFp69KcefBI5Tcvo2iGzdx+9FTVDS1o21wHE29oyht6kD+3cf48c8rKLj3CE8ra3D9yTNcJtkvvI6L1/Lx89mzuFJcjDvPnuLe8+e4fvsOzp+/jAvnr+CPcxfxw6+/4ceff8TPP/4HZW9eYGdznTU18AkYq5vV2LBeo3x2w1SlFEL4tzC7M4yO6VKP8HOLfqHZpm9IPQ/j80i6XbkvELkiQvIlXIbMQMPne8iTdAgh/hPFqB6/JeT/JiqHBUO3UTP8EC0TL9E9W43B5TbMSfnW9mexebRkJihYauklAn7qL/y5P5qMFhOBz6dosgYOeb45w/uE/YbEX1ftlfSrW8k/9V/jXv4aRh8fruGkyMbGFmZmuKI/ash3dzdX9VOG8NNtyLgh50L4XdL/iWA6Oongr/R7hD+RSKC/vx9ra2vm+ihs3yNcws8JLW/HE3csiPN4/xjzQ4tofNqGN4WVqCis97b0C+EXlBU2ofRGI5pfJ7A2u/nhhP9rIVqer41ggKuDXdo6+A0T/oD0e1DC79lmZd+s6tsVfruab8l+dFXaJf4Gmr83qP6q0DJ4tlumUPki4Xzbcds6Reuqchde/UM6TxayPwTRdDKhZQzK6rkFrs7CIxxRN/u257d9PNznXWTEp0zlxvbSC8kUXjwNF5KrP5tcyKOpi9oWQX0DOW17Tzju98ii6bluo1d3JG4oHG3VOzrf7djh1WOt7+eEpq15Wbj52vKoP6qzbltWN7zVZcpiwsW1kcoVrszVRWXZdK48KnPs2DJ4cl/muFVu2ic0CeXB7d/Rvh4ji95HOeSQQ3ZwlZ/jlXQ6bQbJf7Xh+6kHJCee//BoH8uri0hPDKNvKIneARkgD3djcDQpdgI9Ax1C8luQ7G9D71An+kdEP9It8nZ09zaJrhGdqSa0JZqRHOzB6OwMhqbn0DEwisauXlTUt+Lx89coLC7Btbx8XBXkifvx63LUd/cbwl/ekkDJ01c4k1eEa7fv4ebT57hy5y4uFt/AlaLruFJYhF/PnUfBrdu4//IFHr16hTsPH+PalQJBIS5cysMvZ87il19+xrk/fkVtRakQ/jWpnR3I2y39HNDbIX68oUbxuYyTnlhCNYQ272BxfwydM+WoGCkxBN8e2pdniDnfx6/kyf3ExDUrI2k3p/ULmedqv7EVlHvwCX5A9C2uodzYBaiauI6qSXs4YBXPCEhfR8VwsdnyXztyBw2jD9E6/hLJmSoMr7RhdmcI60dz2D1ex8E7+74/CT8pv9rsTdZP2Fb3CaE2gev3BSYkBd+0UZLokn+dRFK3JZF/f6P1dI3WP1pH+nkY38a6XdEn0Sfxtqv2QuZDxN6uviepU+Jv5Nb/SZA0TL5im1cGPFlPD0/vTwrp78bUVLDKTxN6/cSDkv13PL2fbeBVd3/9AMmaXpQWV6GyqB7VhfwWfysqClrwKq8Wb27WYaBtHPtbh38fwq+IluvrwSWHUWJoSTsPlrPEvwZ1tOn3Sb2Sf+u2Oo/kcwVf05S8rNvNQ9xGLuVQXahsGi9wG7m0n7rd8H44Y3ur647+kyBls25dtffSdsps/QK9vqZOGtZze2FsXQOZgbiDdiCszMKT+/54XfBqgLXt9ZV0TbnV7cYV+GWiTsqutgtTJ/bdQGf7sdjqN5B7TuSmnxu33WZp9Y7b2OJ34oXTCeQaPtB7OwQ8ucax1ycqs3I9hCwof0wdPblpBw+2bbx2M/AmBqjz/L7bSSOUnvoZzrg1XSecr7NuNw1fbqDuqMzzS91N+FA9HV1c/TVOCJ4uFDaqs26NG1dOygLyb3VWFvg1bniSIAhrbQHbJdqGhHN9Apnndq+d9n/qjG39BhLWyJw4UZ2bnnV7NvUe3HJlyqRO2v6mj4rb+DN1pr/nkEMOHwz+7nHsR3dfX5/ZCvxXmyMZ6B6a9/ZJ/o+wurGK0XGu7HcjZch+EgOjPRhIp8ROoV+If3KgE939HegWOzWUQK+E6RnqMhMAqYE2dCab0dLVjNRwPyaXljGztoWplS0MTswL4W/D7QdPcPVaPi5fvoJ8Ie8ld+7jWWkVKloTKBO8qm/B7ZeluFB8C5dLbuPqnXu4wM/vCfJvlKDo5i1czNP39x/h4auXePriFW4W30b+1eu4KMT/3MUrOPPHb8i/fA5tTbXY3fJW+A1JsSN3OtVnJa6hRAf/n8uQNLCtvYzFHGEfq4fTSMxVo1xINgl8+WS+gOT+qpB84ooQc3VzEqAAlWNFQtC5vZ9b/71t/oboczJAib0HX8ZJAJ0MkHw4uZAuFPCLANdRPVWMmkmxJ/jeP7f9F6BqpAjVw8WoG7mNprEn6JgqRc9cI0ZWUpjdHpeyL2H7mO/77wj55wQAT/w/8P7x7P/g/X9TZf6Jwnf4of4y45JXxaeYbPE/Nd2vbVh+ndRw60InD8Hc2zvE2tqGEP1ZDA3az+txFZ+E3pB5Q8Adoi866rnabw/iIym3us8Fkn0XfX2ccOhFZ2dnaJXf1oN181bzQxDDQ01ZfzNRKH3k8B2mB2ZRc78RpXkyZheiX13QhvLCZrzIq0LZ/XosjK9KHOS29H8K7MBUBrLGT9uDGdxmwl2ltyTfkn6f8Ht6Az+tIA+r8wbBtAVajmjZvnn4A/YwAgKq0AkDIlv/y5Rrm5h2i5HF6dT9cdAyyH1i3ALeM/R79877YQdbme44//vkFloGU644HW0tqyMP6uTp1O3K6TZhrdttSxsugCvL5g6g+bwPGi4oQ1jnwpFpHaP1zNBFbHUbxKTnyyM6dYd0TpgTdSr3ZKdKLyrTcBbhNo8Llz1O3PXKdj39OJ/0nMpWvswy5pBDDh8GfeYTHF/Q5ip/V1cXVlZW/AHoX2mYI0n/xvYGJmYm0DMoA+T+hNjd6BvpQe9I0hD7nuFu9Ii7s68D7T1taE22ok3s9t4OdPS0I9HXhu7ednSKuz3Vib70KCYWVzG5vIWJpW0kh6dx7+lbXCsU4p5fhIL8QhQVF+PWvYd49LoMj8qqced1Oe6/rcSt569x+eZtXBCCf5EEX3Dt9i0h+7dx8849XCkqwpXi6yi4cxsPXr5EWUU1nj18gaK8Gzh34Rr+PH8Jf/z+K4rzr6CzuR5ba0tSSxnQm5PivUF+BGGj0s9JQiUt5s/VRC9JkuP14wWk5upQPshD+viZPSHoQvgtwb9qyL6F3YZv38nn+/w8tZ+g2279t9v+8yPQ1wEYj+GCuOVjRZInCX8RqiaF6E9ym3++5HUNVeN5qB7PR93EddSNl6B69Caqhm6jauAeaoefoWWiAsn5JgytJDCzO4y1oylsvVsQyr8mtdLP/fGfvzE63JLaxL7jc7b16YwhcDH4nOZLpPlXG5Y/Svbp39nZ9b6jP4Ph4TT6egcteU9yW/2AAcm3IfcCQ8aV9HtQgm4nBGh/OnRln5MNSvj5WT6Sfm7r7+7uNl9H4esXNLZ+MYTf28ovAURvX1+h2Vs9QKKiB6X5NajMazKEv6ygCa+v16K5tBtbq/ZLADnC/4ngINYf2LrwiLtL4sOEX22u6geEXxFMHGh6tFVGvZWZcnhh3HKpPENm8De4jlVab1tXK/dWK42cYXTgr9BwQdv4tucO2RFZXFzqjFxl6g+5o+UIYO4Z794JuT1dVaVnR6H6GFkoPZVJOcwKvuc25XPqFITTNgyHc+sclQWw8X14eYXiuu6IbeC448J9kMyzo27rD8qZcZ28drBw5I7OjW9kThw3PRMuIz1H5yGz/GGZgaNXmRvH6AXq9sNFZZ7t6kPh3PQcvR9H7bg4kbiuTN2+znWrznEb20OoPeg2Miu37av+HHLI4XNBf0fc3w2O/5qamjAxMfF1tvULAV3f2cTU/DQG0oPoGepF73CPR/ZlsDycRPdQN5JC9pPi7xzsRkd/Au19XWjro51AR2+nEH6u8HchNZhC90Av+sfGMTK7hOHZNYzMbaGtZwyFtx7h7PmrKLpegvv3H+De/fsoucvv6N/H9cfPcfP5W0P4bwvh58r+JSH43M5/7d495N2+jeu3buPO/Ye4mJeHc9euGcL/+PUr1NQ2oLai3pD+vLxinPnzAs6e+Q33bxYJ4a/D6uKMVHTfnCBvXyi3hvRFETYqZdhM7ccZTjgwf7G9ZI9FtvVuBT1CnMsGbptP71UI8Sbpt+/Z8xN7ChJ2JflRKOkX4i7hwqCMuO6BhwB6BwFyEkAIvn1NgJ/0s5/1o8ys9AvZr0xLeQSVUrYqfjqQrx4M3xT7JipHbqNm5AFaJ16id64a6ZU2zO8OYF3I/867ZUP8OalB0q8tmtGaJJEGn7Otc+ZzGZ2wULJPm9vhedo9t8bz1H1/BV+IvkGKW/ctVGb8PQOebcEJgdA2/xjy/jEgwTc7CzzCT1lvb59BTw8nH7oN/15dXfGIPusXEH7zYoq5T6XOIuK2/qN3dgLLGLFmehfRdK8DlflNqCloR1l+A8rvNmE0NYPDfaaTI/yfBTo4DQavHlE3UJJu/WYQLDCkXhAi+Y7MX+E3aapt49o8/kFg3/L6nKmb8UcG+pEwRBDGhQ0ftJEj89reXAdfH+gCv8ZxiYerk7I4YQxYPgcmTERm5BmySlR6iHMzjNpuHHWHyuDlad2ZdXJ1YQQyjWPrreHdeJIO3X7+lqgFYB923Z7fTzOM8HWyeRiZl4YbNkBQlrCtboFf1wi03BG9ynydwtGp30ecLFbnlCsD2gbW7drhtlFb4eo8ePkF6SmsP1s+tMN5RcO418KRhexArrIgzbA8LAvHyyGHHP468NmmcGU8V2hgYCD0XulfYTiE39rfxczSHAbHhoXkC1EfJfrQJzYJf4qEfzBhSf9wCl2D4h+WgfVIP5Kj/ege6UPXQDe6+4XsDyTQM5RCol8wOCThxpAYnhBMoSkxgOdvq3D/8QuUV0rda+vw6m0pHr98hXsvXuHOq1I8LK/Bs+p63HtThoL7j5F39wEKHjxC0cNHyL99x6zw3330BGevXMG5/Dzcef4cz0rLUFlTj672brS3JPDiVRnyCq+jMP8aSl88Qm9XsxD+aRm0K9lnrT3yEvLFmeyaDzfCEjII/7FQ4jX0zjcL4b8lhJ/f2ecqvyXiBL+pz0P7SNr103zZSb+Segck6gZ0e34JbyYBzMq/JfrlBnwFwO4GMO/386sB6SKzE8CkLX5OKlSMFYg8H2WCilEJO3gDdQN30DzyCB0Tr5Caq8LIcjvmtgawdjiDvXcbUvt9qTIJk14DGq/1DeFX2UnGC58zX8VwQpJb4clf+Yk7fmGEn7yzK/Yk1xYhku8Rfa7+06Y8Gia0nf8zEH9D+J2T+nt7mQdX+lPm9SmS/mQyaSYseOAiTXBSvyX/JPmG7B+8w/HBoXB/rvBz6soG21s5QH/lCMoLG1FR1IzX+bWoftKC1YUt+5gR+ISfs7lsMD7wo4Q/+qPg+r91mEGwIYZSJyVQMsgkSFzUbcJkgHWV9nDgpyt6m37QTu7A1w546bb+0ODfixMa/PKdZk+mclcfCkt46RnSS79XnlDZstghWTTdvxosh/S3ygpeH5ZL2lhk7IOW0MeHUZm5rmwHUxcPrjsOMXolsb7Oc+u79VGdaUfv3XqW05LwAIaks8ysR1Ru4lsd/WqbMF7dVV5VZT+VZOO7+dAdLk+lymhTriSNMvHb8NKXQkQ6i45pmDJYO5qX3y4iixJ630+yX+vJNb4XxoTzJrLs/aBlCMKFy2nDGHhl8OM4bkXgj7aX+j1o27vXIApzHeJh07NlsLLAnbV8Thyrs/5oevq8cnVBHA0TcQv02oTK4NTBpitgPL2+oTJ4cQgvbf/+UB1tR2bz89yqM9fW87s6L2wOOXxthJ8v/3tgG/B3xvUTfHZzqykH02rsNlOOHDON0h4z+AwZlXojTkOwiMzQXLza3NnDzMIiRibGhez3C/jOfrcQ/hT66Ray3ydkv3ewCwMj3QIZKPclkBRC3zMsA3kh/KmRXnRzZb+/Ez18r1/CJ4T8d/V3o6sviY7eJNpT3WhLdKGtqxOdMtDuGx5B7/AoWmUg3iAD8tpEL6q6elHWmcSrpnY8r29G4cOnuFRyFwV3HyL/1j1cK76FgpLbKL5zH2evXsM1bucvLcUtIf1PXpeiS4jDyPiMlG0Y9Y1NaKyrQmdjBQYSTUL4p8wgnm3AFT07uHdNZvt8fsP0JV8SW2YvFiW72MTgYgsqh26i0hD+G+Dn+ezqOw/WU9LP1fpgO74SfAuVKZl34BN+hRB3kndD+G0eZnKBRF/yCG/9t2kbou+T/UJD+AnGrZ4oQnX6BqqHb6Ja6lAlqBF3Y/o+2iefC/kvl/o1Ynq9F2v7U0L+V6XenNiS60ESdXQoTraL1ya0M4z2ZT0RgKuw/Gej5cyXNdz6zmcTt8EPDw8LeU4ZwkyQYBvS7hF5JfNmNd9f0Q/cyW4J0y2knLYX1sYVsv6ZCD/TIeFXvz2l3xJ+u8rfi66uBIYGh7C5uWnqaHcw2N7Ecwn0oL53PNSUfdTrc+aRTNXeO0ylFlD9sA1PC8vx5HoZOmt7sbfFST3Gcwj/+Pi4IfzcYh79MbTEw/4IuD8Kf3coQfokmAGzhSE4oZX5ALpF3R0g046GsfLA9uUh28n/E2HS+1qIKc/nBNP325xw2l1llgBF5GrLtTVheI15D3BgpH7axs17wyNL6vbC+sgSxxD78grzzqRBZYWZ1DDyWIhe3RLewNEz3ZAteZnyevDDOTIfqnP0bAcrZz4uGMYN77WLwmnfUFt76fmgTNvOC+OHNfB0Xh4az9bDq7tprwor99xBu3huyo3Mk6tbbJum9ds0PLcbh7amreG89N041vbCqVtspq9xbH6UB26DSP2y6QIZ28W2kWkv9lVC3FEYnYZz5b47i86L58pNn3D8vjsiV10OOXzLiP1d+h8C24C/PXYnlj20j6COn+ebnZ01J33bQac99dvdSquGLm/cadxhiUeM+L64WdX2BqtctZI0TEj5s7W7j8m5RSH5JPsj6Bvts0R/NIkhwSBP5x9KYGCwA0NDHUiPdmNkRIh+Tyd6hcj3D/VJvB4h7t1C8jvQN9iOvqF29EpYIiXu5GCrEPBWpHpb0J0S9HRgMD2I9OwMRhaWMDi/hN7ZZSSmFtCankFt/yjKulJ425bAlTuPcOZaMfJu3sflopu4lC/u4tuG+J8ruo4bT5/h7tu3uHr/Hm48e4a2vkFMLq5idnkdM3PzmB4bRH9nLZJtVVicTUvdD039D02bSiOYhnPbjKBbjOpNmM9sImnuYxvDy22oFZJMQl4xflPAA/yEbBtCTrLPLf1K+qNb9D8Vmt6HpOnGKRYI2R/j5/1KBMWoHC1AlaCaGC5E7dANtI49Ru9cFSbXEljdm8T+MSe39qXJpY8aciVkiv3TOp1rRJvXhSuxFvZbALYv+8F8jy/JmfcY3g98zkTfz6ehn6vfJPozMzOGr5Lgc2KSNlfJCa6cW2LNVfSPBcn5ZyD674Xm0YNEl9RB3PPzi/4zl02g3ce2Bv96z1KjlP/6mBDR2vwuWmv7cP/GS7x+WoPp9KJ0Zy+ytGlohZ9b+l3Czx+AqD/6g5FDdoQP4hPy7q1YGhJKtwvKHbdv5/CFYclKAF4He73UrwRWv5+vcqsLJsDMBBIHTEKS7MDJkj6SMju55BE1J3yFkCob3hLyChPfCyP5+KgK8jH5qt7Es2lomdy+Y8oudujeNenYNOzp6UE/5aSS1pP913xxgnKjs+3gpyPwJ6S8+Hxe1DlnUpg0DYIyMI6JZxAuH+0A9AfhtP6mTaXOtq09v9fGpt1NexJCtNnmvkwJuedWnV4n1XFXhbGdcF5Yew0J2/a+25Vn2C5cWaY7IMrxOrfvGXhye52tTtvS1xu3DUe3SUv1Gi8kc3Vx7hxyyOGfAj7zaPO5ETwfK1FfXy+EeiR0Wr87CA+5BRxzElbqSjzCf+yRKfqFMOmgniEPjo4xK+Q4OZBGW3II7T0D6OznSj1P3E+hd5Ar+4KBbvQPCEkfbMPAQDv6+9tlkN+BgcEUBod7heCT7LcJqW9BLzHQip6BNqQGWiTtZpE3IdnbIAPsOiS665EQ0j8yMYzJ5UWkV9YwuLiG/qUNJOdX0TgyiXIZ/FcJcX/V2ok/hdz/frUIRXceo0BI/5XCm7h6/TaultzGxZJbuP70KW6/eYv8x4/FfoPWgSGML61ibnULcwsLQvj70NtWjo7615gZ75f6sy1sO5qxu/0jEm0zHcmLoVjxGY2fpWN4wn16rQP1aRJmnrhPwn9LwFV1JfwKbu1X0h9HxL8GSPhvCPh5Pykzt/9z9X8sD1WC6rRgTEj/6A3UjdxBS/oJktNVGF/pxuruFHaOVqW37krL20PRtBeznTgPEFwDe5147r/QVEGO8H+q0WcCbTV089UiXdEnT+XWfSX7fP89IPtc6U/ZVXqftH8KogT9y8Bu9edOgx555qaxtblt6q59LrhH6eGzVCelrMg8Kmjtv8Po4CxqyluR6hrCzpZ3CKB5998h/PoOvw4y+fBXN6E/AtEfixxy+EdByGuN93qFIX1mZVfuAd+tJJIkyRIx3hcV5eUoN6v15cbNVZNyscvKylBeVmrclNuVX+9+opsrwCYdphmkp0Rd7z9DknlPKkEzZQ3khuSRHHv3rYbhpyGpM+Rb3EbmxSE5p11nyLlH0om6WkvgJVyVIdx8HvDcCUv+7ecmvXy99AzR5ycmnXRtevwSRZ2xrY5u5snw4pY4/qcpvfTccDWsf6T92WYVfltbu9JrcyMro7zMXgcNZ+JYuV4LvR5uHKtjHmKrzpNZt9XZMjBMoDPX07uubr5WTlt1jlxgdhhQ5+dr61lldF6dqTP9w67G85qYSRv2JaYpcRjW9Am2o8DfEZRDDjnkkAV8rtDmM8M+Y+yqP20Opt1t/a45mfDTuKNRknxvZcoLpWSfY9GN3X2kpxbQlhpFfecQajv6Bd2CdvG3oznRiY6eJLr7ezzy34lUXyuSPS2GtPf2d5mt/qn+VnQLoU/21AspaERPX7OEE6Iv6O5rFB1JvpB9QWd3HbpI+KfSmF1fw+T6FgaXN5GaX0Pr+JwQ/RGUdfehrn8Eb1q7cPb6Lfx44Rrybj9Cyf1nZlv/1ZI75tv8F27cRNGTp3hcXYMn8tv1trUNXTJwH5lbxOT8ink3d3xIyEnjazRWPML4cELG3yT8TmuZ9lR8XcI/vpFA0/jdLISfJF/J/rdI+ItQLTZhymUIv5TbwCszt/2LvGpUwo0Uo3r4DupHnqB9ogyDS+2Y3xszhxfuC/HnwWjat81Of49cGcM+/I5k314aF8YYT0iSM1mMeR44nZFEf3t72xzGR37KT9fZLftC6B2Y9/Y9sk/8XQk/3+vv7mbZezEvz40jdjYxR0dsF+MUY3qhNBYhQspFxEeJ6Zfi39ncw9z0CtaXt+RxKwJ5wB4fMtC7MOHnIS180OvDn2Tl9evXlrTIILW0tNS4c8jhfwLs74LyqOytlVVWCKkUomh19t4offtW7pO3fljeM8Zf6sVlOLHfvHmDt2/fePG8CQFJj/Hevnkr990rc+8xXJnErxB5ucR7K/43b16LbXWlXnrM463krfDzMmUSvRfOlpsEscL4mZ7JR0B3OYmykE5jS5nKxGYa9PtkVeDrnfyZBsv95pUtO9Nj2W37sY5ePQV2dZyTG5b0kugyHNMhDPk2cdhutl2ZlknHS8/UkToj13wY3iuT1DscR+MF6TEPP46XptFF44idmZ7GYXymZ+VhncZhXwmnp3mG43hhPF3Qvzy9yO1kRpmZEDDtY8JrnZw0csghhxOhxPZ/FRzrqc0xn7pJ/Pms5mn93D6rW0xdEyX8isDQxwFqAB48Zd5F9Qx3m67t7GNqcR1DU4tIjs6jbXAO9T0TqOrsQ2lLJ0qb21DV2onGRAqdff1IeVv3+0a60SfEOdnfht4BbuHvNCv6fQNN6DdoFjdX+VvQI+6e/iak+hvMCj+RSAqE8A9NjmBqbRXjQvj7FtbQnJ5Bec8w3ib6USNkv210CmXt3fiz6Bb+9ctZ/H6pAAW3HuL6vSe4/uApbj57iZsvXuNZXT3qhZS0jY6ha2wC/VMzGJ0Vwj+3jOmpaQylWtFW9Rg1r+5gpL8dx0dcfQtazTan+rXNrM4Xe97PZQxniKR5ICR3ersXLVOPUDnKQ/JKUO5t6a/gO/Xe6j5t+549V89Jqr8NVAmxr5ZyGtAtsKS/yJTf1GGiAOVj1wR59vR/qVulEP+KwVuoHX2KzrkaDK8nsXAwiR1sSJvwZH+72m94mHbhU12TUwXKGTF8pvBZQ6K/sLCAsbExw0tJ6Lmaz8+FchLSJf66uq/wt/TrO/h/B5D0e+/1d3elMDKcxvaW/ZSee4+asz78PfxWSB1X9o/2PBXDc17VC3YkZP/oQDwu4eeWfjasPvQJrsBxWxdthiFUlkMO/6toaKhHY0OjoCFW/17IPWTuI95XjfVobmpEa2sL2tta0dzSjAYJwxV0DrwYvk3k7W1taGyy9x9Xx2vr7Ao63c3NTWgSNNTXobGxAa1tklZ7m4nXJGkzH6JNZJ2dnfLAtNug2iRNpsd7nqvqTY1SjpYWtEhazTLQa2uRfCVOe3s7ujo7JG6HScOGaZayNhk382kRN9ul1ju/wpRN0qyX8tVLuUwZauskXLMJz7Q6OtrE32LqTzR6ZeWOg/q6WtMODfUf2cb/YLDfNQlo85kcFyaHHHJ4P9zxzv8ilPATbAvzWyDPbPo5GcLfBx6K5W7rV/PhhP+dIftm2674juTP8tYeRqYW0DM6jYHJJfROraFzbBVNQvqrkyMobevBq6YEXjd2oaw5gcrWLtTJoL+jP4nedC8GxvuQGugUMt+Ovn5u7W/D0HArBodaMNAvhF/Q299kyX5fI1K99Wb1P9lDwt+Irp52DE6MIr20hP75ZXSMz6NucAJlqWFU9A6jdWwGXRNzeF7Xgl+uFOL/ff8rvvv1HC4W3caDVxUoa+pAXbIPzYMj6BaCP7iyguGVNQzwLIJJ8U8I6Z+cQzqdRndzFepf30LV8xIM97QI4edBcc7A3fyloYsIdL7I834uY8gEs3EMCf/83iA6Zp4Zwl/BT9+N3/AIvxBns6r/jRP+sQJBviX8UmYSfq72G8JPsj+Rh/LxKyibuILyyasi49cAePhfMarSdyTOA9SNPUfXXB0mNwewcbxo2oWnopP4k/R7X087xTX5AhfuH2j4XNja2sL8/Lx5lUi37btwST710dV9S/pjCPU3DkP0u7lbod/4ueLPd/l5WJ8xagmjf3cc7JJSQ6JPsbmXo93N+K0wRPi5pZ8PeK4Q8sHP9yU408ItXQRPDyQ2NjZyyCGHzwTeU1vbW3KvbZkH3sZmWLezs2OQ7d7b3tk28ene3GL4bezs7lg50/PCcdBG+e7ergHTVB2xJXF5v28xn/V1e7+LjH6mxbg2n3WsU8/wkr7JS+Kd5tnAcATzZpomD6mv5hUXJ4cccsjhc4LPGz7DOEDUXY3/q3DJvxJ+Jf2UcaC9IkTWfa/2/UZHnYxjYbfsWumROFa394QQz6O1ZwRtvWmkxhbQPbmK1tFFNA3PoX5wCrU9Y6hMjArx78erhm48r2nFi9pGIf4t6BwQ0j/GFf+EIf39g11C9jswOtKB4SEh/YNC+gda0DcgpF9X+Psa0NNLNKK7h+/0d2F4egLDcwvoSM+gcWgSjelZNI3No3lsFonpJXSNz+L2q3L8crkAv10qwNm8Gyh+8By17T0Yml/B2No2Rte2MCIYErLfv7CMnulZ9IxPo39MMDyOZHc3Giqeo+JxIcoFg111ONrnadzeMlys0Tb0Gk3xGQ2vh7msTrqH2MPyQRqJuTeoGr6BSh56x+38BiTOlvB/y1v6qwzh9yDl4yq+/QIAv/FPsn8NVVPXUDF9TUj/ZZSmL6Fs7JroJe5ECSrHbqFi5Baqhx+gbbIU6Y0E1o5mpG22pKkOcMxt/CRjHpHKBE2cLGeyGY4JuZuIE4x8LivJ1xV9Jflqu2Rfw1rYbfHxW/Q/FEznL4CUtzuRQn/fIPr7B417dHRM2mTPdjEasc0kq2H1AtMHaTt9y6g5sUpHIDPP3+OjgPBzSz9nVfiA53ZcPvBXV1dN+JzJmZzJmZzJmZzJmX+S4cort/Yruf1fhBJ+tw1I/Glzaz93YXHxhydkW9LuDDCzGoYhvMGpGYkGku2DY4zNraAlNYTq9j40CbFPCOHvHF9E84gQ7pFpIf2EkPCBGVQnx/G2tR9PazvxoLwOT6ukfB1taO9PokNIe3dfAr19XULwhewPtGGwv0XQLIPnJrvCb1b3uZU/WOHv7mlB73AP0vOz5nT+NiH8TaOz6JhZFbK7js7pZSRnltA6OI4bT1/j8s0HKHnyBg/eVKG8KYG+yUXMbB1gUpBe38Xw6hZ6JJ3uqVmkJmfQNzGLPiH87Yk+88WTN09u4c3dK3hz/xoS9aXYXVuQluBqHVvF/nUR9bnOz2V4Kc0qopMuv0+/fjyJnoUKIfxCfoXw+5/UM4SaBN8SfrO6TyL9TRH+66hOC8lP8z39QtQYwi/EX4g+v/FfOXEVFeNc1Rf3ZL6F6M0nAM0OAUGaaVxH5bCkN3RTSP9LjK61Yf1wSq4YJ2p4/oLum3ah/Z3mC1ywf7Dh84WTsEtLS+brINzOz5P4SehJ+nUVn25u79cD+0jyVWeQ9Lb0/83AVX6u8Pf1DZjD+2gvLizjkO/fhwz7lO1n+qWTwPD5LDpPRLf97KdFiPBzhZ8PeM54k/CzIdnglHPWxXXnkEMOOeSQQw45/F3B15pyK/wB4ef4j1Ad3+PnWJATI/z29ScRfu8v39tf2twTMjyLus4+VAnhb+mfQve4EGwh2V1T82hNT6FpaAINAxOo75uwhL9tEM/qEnhY0YTHVQ0ok2vXxO/p9/Jk/hT6BpIYENI/1N+Job42cTfLoLkhIPo8rK+nFolULbqS9sC+3tE+pBfmMbwoJF/y7pxdQ/f8BjrE3T61iK7JBZS1dqP40UuUPH4tZL8abxs70DM+j+mNA0ys72FoaRNDK1sYXNlEao6Ef84j/DNIDY+jpqENTx8/wZNbhXh5+zJeCBrLnmJlZkwaJNiea8i310bhFrMu1/m5DK9lJuE/wMaxlH9R+ga/Yx8i/MQ3TvjHSNaF7I/ag/ks4c8XXEOVkP2qiStSXtpSBx7eN1GMmokbqJa6keRzsqBGUDsm4A6GkXxUDlxH29hzjK91Yft4QZqL71eT9PO0NCX/OgHg9vnPfMH+wUafLdxJdHh4aFb8OQHAQ/vm5uYMRx0dHTWvnnN1313VJ9HX1X5L+uNJtUGcjjJFVPcXwBza18PPAfYa23yzX8oyNjaB3R2++mONbZ8jgX1uiE9kwVODn4cM+qAl/wzLT4BSFiL8JPR86Ou7XPwh5KFj9kAxe+p4DjnkkEMOOeSQw98dLrn9X4dL+OmmjG6O/Tio5uDbvH9PZnoqYweh1raGrp2DI0wvrRvC35QaRYUQ/truNNpHF5GaWRLMoWt8Ci2D46jvGUFV1xAqO4aF4A/iZX03ntd34nVzJ962tKMuIYS/rwfJQX6SrweD/d1C+LsxMtAp7jZ7cJ+u8vcL+e+rN6v9yT4e4NeBgfFhpBcXMby8geTcGjpn1oTsr6BFCH3XrJD+sRnce1OJ/DuPUfLkNW6/kLFwaxIji5uY2T7G6Mou+hbW0TvPz/ltir2ChBD+5PgMukcn0ZLoRVl1PcrKyvHm6T08KbmIuwVnUP70DmbSg9IgHJxbksPXHIKhu7Ya/wrY5p7zcxpDIDRtz/BzdNvvFjG43ICaodvmJHtLph3Cbz7N9+0S/poxIfFpEngh+9zW75B92iT8lWNC5MeKUCkk30xqmPCMW2TJvsRrnL6O+skilPfloXbgLgbmG7FxOC1ttCUttS/t5kHJfwbhz5nTGiX8cYZyfpqPr2Lx9XKdBDBfvxgfN5O3OhFgiT9fCbDgu/Hc5m+2+pNQ9/ZZQm3Ido8h2z2UOXLGMSfme2TchI2ZFDBxPagsK06YTDBp8NC+blte+uke6B/C8tKqeT5oO9CthJ99TEk+bfOJSCH3XM23fdHtjzGf5SPRd38EozO/6s8hhxxyyCGHHHL4u0LHOTnEg23EVx44RuTgOnpaf7YBujXUKfQvsL1/iMmFVfSmZ9HcM4bSlh6UtvajsX8KnUKwu8cn0D02gY4hIfzdg6gQfYXoa7qE/HcOCQZR1t6DpzVNeNPUiqZUCgkS/mEZIA8mMdiXwMhgAoMD7eJvEdLfgr5BIf6DQvwFdPPzfb3DEm52HBNCILgdv3NmFW1TQvKF8LdNLqBjcg7lnSlcvfMIl2/ex/VHLw3hr+nsF8K/hfTqPgYXttA7t4bU7Cp6xE7OLiMxMYeuUanL4Biau3rR0JZASgbzrQ1VeHrrGkquncGLByUYHUh5A3Pg8PDIEG+2kQ7Ptb38NmRbn9jeH2781NTBLIQk7GEVI6ttqB+5b1bKDckXEl09xu/b0+9tgzfgiv+3QviLzCF9teM3hLDfMFv6zXf3x6+hejIAy18xmofyUSk/dwRI+OqJEiH7YqeLUCPymnQ+6oTs10ndK/oL0TD8CCNLbdg8mpc24gq/En2Sr2yE//Ner5yxRokvdx3xTCi+fs7D/ngGgN0JkMbw8AgGBgbR18cVc+4IIIlPIinPCzMBYCYC7OQA9YSdDCAJt2EsmQ9W3BU9SY/oi9wH/ZTzk4ASRiccTB4u2XfSUWgYM9GQ8MpFnYQfH58MrfIH/Ur7GaG7S2ir24UNl0H4+ZB3Cb/74M/9QOaQQw455JBDDjn8b4DjQS4E8TvYHFzT2FWmYLU/ntbowDQIQ+wdHWN2dRPJkUnUdPTjTWO3kP4+1KbSaB8m2R9H9+gYOgZGUd/Rh9L6LpQ1dKO+axhtA9No6pvE6+Ykbr+pxoMyKWNnp6Q1iIF0P/qF8A/0d2FosEsG+kLqe3lYnz2wr6e/0Rzal+xtRFeqEcmBLowtTGNqg4ftbQnJX0Jjeg4t4wtC7ibxqrUTeQ+f4kzBDVzlt/efluL+2xrUJgYxOL9pyH7PzLoQ/nUh++vokvjtY7PoFHSMTCEh9eOhhOmZRUzOzKO3J4HSlw9w5/oVPLxVjJ5EO44PSRK9hvEsHcJ7IjFey30hwm9S1GSNLUQKGxhbS6Bx9JGQX26LFwLsEX4S6upvlvAT3MovJH5M7HSBPcBPSHvNpJD/KSmr2BVSn3JBBd/Xn5Swk1KvyWKzO6BKCH+VOQOA7/AXobxfSP/QfaRmqjG/PYz9d+vSRpbom63S/jfQlFi5janunPlcJm6Skc8iTkbyVYC9vX3/UNbl5RXMzy9gamraTAIMDg45pJ5k3E4CJBI8F6DbuClnGIKr7IRZhY+Qe0PUqY8SewcqYxxu1Tfb9c0kgpeGTgIwfZXrZIIgkeDzbAgry2tSR1tvbtO32/hdaP/LTvaJHOHPIYcccsghhxxyyCEW3Nbf2tqKxcVFM+AmOLj+IMIvFl0ckq5s7SMlpLiyJSmEP4G3zT2o7BxE68A4UmNTSI1OoLMvjfr2PpTVdqCsrgO17f1o6RlHVcegEP1m3HheiZsvy/C2qRmdQ73mM329A51C9NtksN4qxL4Fyb5mD02CBnT31gvZr0dbt9h9HRidm0J6hSvzK6gZmMALye9pUxce1jSh6OlL/J5faAh/8eNXeFhaZ74S0NQ3hv65DfRMr6F7alUIP1f5N82Bg23DM0L2p9EtpH9wZglzG3tY3N7HwtoGJibH0Vhfhbu3rqO4MA/NDfU4OmBrWMO2cYfwhNdyAWLIzqcYTdm/OMZzLHR2C1ObfWgbf45aEv6xfG+LfIkl09864ReCz638VWkpp6BCCHyFEHkSfH5asEx05RKmXMpeLnXgp/ooK0sLRkVmtvjzlP57qB9+iuRMPWa2hrD9bsW0jmkoabPsJ/XTxMly5lMMnzck9iT47zO8LCTJ3D3DSYCtLX5xLpgEmJiYRDo95u8EcCcCFN1CuBNdSZ/YR8l8BuF3iXuE5Lvk3g/nTSDoe/tRf1cXJyFSmJq0h6bS8AsR5isRoSeFhW7rj8oVH0z4c8ghhxxyyCGHHHL454PjP553wFV+HppFok/DgXfcaltgXLJjw5Efcei5dXCEoYl51Hb0oqxJCH9TN0qbU2jqSaMnPYOekSkh/GNoEAJeWd+BCiH8Vc3dqGhK4mFZE4qfVuH2qzrcfl2NF3WNaO7pljgp9A8n0D/Qjp6+VqSE+Cf725AaELcBP8PXiERvI9qTYg90YXR+BoMLS2gfn0V5agT369px/XUl8h4/x6U7d/FHQRHOFt5AybO3eFrZhNeNXWgemDBkPzGxjK7xZfQJ4e+Z3RQ3T/SfRvvQFPpnljGzuY/l/XdY2BLSv7mNhdU1KVcP3rx9g/v376OlpRVHQkaMYbuYXRNx2/r518OJ7f3hhhTB5Mh0vSwoPcQ25ndH0DX9Wgi/3RZfMypEf1QIPw+2I+Hntniukgtxdr+D/7XB1w9qhMhzVwK/xV85KuR+tEhQbIh8+dgNKfMNIfzXhegXocKs+JPkFwrZv46yYdGN3Ebl8AO0TJZhaDmB+Z1x7LxbFzp1IE3EK+MZv81OMqcKlDOnNCc9c6g7jZ73Gl8H2NnZxebmFlbl3lxYWMTMzCzGxycwMjIqfHgYfb0DIcIeJfc+OAmgtjshcAI0rk/8aXv50Ga+JPudHQkMDY5IOe3uKnvHso6ZpJ+EX54iIZmLHOHPIYcccsghhxxyyCEDHA9yhZ9ufgqLW2XVnLzSpkRHIeHFIsXdF8fsipDkwXHUCOl/09CF14K6xCC6hDCnRmaFkE+jqXMQlQ2dqGhoR2VjB15Vt+D2y1rcfFGPR5WduF/WjKfVjahPdCE50oOh8V6MjKXQN9SFnkGB2L3DnYIO9A61iaxFSH8LOnvEHk4hvTSPvtl5NA1PorR7CI/qO1DyRgj/wye4UHIDf+Tl4derBSh6/BKPqxrxtiWJdilb78wGOtOL4l5AampD/FKXsWU0906iY2QGY8s7WBKyT8xtCuHfOcDy7j4mF5elLCNo5SB+eNS0H3fnHh1ZIuK2FlvWttqXMTYPS/kl8yBjkR1hFysHE+iZr0Q9V/jT1/4+hJ+f4hPCXztRIDZJ/3WR3UBV+iYqxm6icuIWqiaF0I+XCMm/jnJD8sUeKkHVyD00TLxA+2wFUgvNmNgawvrRCvakPY4MmfKMaafTGr9hc+YLGyX0xGmNnQCwOwe4ir67u2deXdrY2MTSEncDLGJmeg4T41MYGUmbLfb8fJ4SfJ/Eu6v9dAtI2OkPkXpvFT8DJPuSHl8rYDzmQRl3GNCeX1j0J1t5z/If71+9h9XPv+qP/vtgwh+V55BDDjnkkEMOOeTwzwLHfEr2iaamJnMwlg6o3VX+TFpDn11ZUvqqEg5bN/btt/hbe0dQKmT/VW0Hqtp70TYwjuTovBDyebQkRlAhJLy0tgXlDW14VdOK59WdeNM0iNdNQ3hQ0Y5HFY2oaGtHe383UkMJIfadSA10INFPdAraPDSjq69JyH4T2pJNSAwmkV5cQP/cEhqGJvC6ox/3a9qE8Fch/8ETnLtehN+uXsEvV/KQ//A5HlbWo6KzD8nJFfTNbgnZX0RdcgINPZNITayja3QJLX1T6BH99MYR5neOMb97hLmdQ8zvCXYPsSDuhc09TC2sYGF5zbad/D/mLIjXeLS0nWyrfRlDckASa66KVw6bGSX72DyaxdBKnRD+64bw16Z58v0tQbClv0KINVfJKzO21X9N8B1+vrdPSNnNJ/eE8AvprxwtQYWgUupRMXITFcM3UTV8F7Ujj9Ay/grJ2VqMbnRjYX9MiP4Cdt5tSl899K+DaZ6Mi2L7dRTGGE9IkjNfyfBei0M2Q5WZCDg8xsH+oTk4b2tzB6urG2YiYGF+CbMz8xgdSWNwYAgDgv4+vhrg7QggeU+mzHv4/kSAQHcA6Aq/C04SMDwJP9PgDgONN5oew+bWpi2b94/U3v26B+G6A9h/OcKfw2eF7SNeX6miTN3af6y8KqJz46jOpqfhbPp+OE/nulXnurOFC/IRhHRfA1pWLX+4rFbmhrO6IE6WcPS7btqhfHPIIYcPgb3HTkZljEzxsbqPQbb0TluGbO4oTgp32vQ+KlwlbfvlICt3vyQUuEPhPHel5/8YxPWLfzLYjtzOT7d7eF900KyDy8DQx+GnB3PQVCDlG6lLW/voGZlGRXPCkPnSliTqUqNoG5xBYmQerT1pVDV34W1tI97WNeFtfTvKmvtQ0T6Olw3DuPe2E7df1+N5bRMauzvR1d+FpJD81EAXEgMJAWXtQvRbBS3o6m1GZ28L2nta0D3EFf4FDC6uoWlkCi/benCrrB4FT1/j8u17uFJyA3l3buNMYRGuPXiKe2W1qEzIYH5mDb3TG2jsm8aLuiQeV3SgITmJzqFFdA0vYGRhB3PbwMzWoWDfYHx9G+mVbUxvHmN++x1mV/ewsrlvdjzQKLmgV6Et5wX57IaEn2TW5MoCaMZGcoAdLGF0vQn1PLU+fQW1o0L4R/8ehL9yTMolMKv+4uc7/OUjhLhHhPyP3EZd+iFaJ18iOVeDkdUuuWYjWNufxc7xCo6wLa2zZ1pIr4O5Vk4bWSknTAhdVY0EMfAlOfNXG+/5FEfs3eeXi/cZczWP7K6cg/0jczbA+voG1tY2zCf05mYXMDU5g7H0BEaG02Y7PlfwleQbAq+7AbydAIQh/RJGdXTr6j9P7ucZAwuLCzg8OpC+GKzi5wh/Dn89pG9wEBUdoCmxVthJgMDtyo2tOtoRt8lH5QTjqMyJG42j4TSOm0bI7YXTOH5cuh2dK1edH8eXs/6eLaRb47kweurcsBrfEHUnnNuWnk7lgdsitgwRRMti88mu+1I4Kb+gTtHyu3JXr3JXFtWp+zQ6lcfpT5JFddnccXFdmSuPylxdVBany+amrdB2P7kPqD5bOE0vTpcNbvgPjUtonNPGDbeDrXu8O4zw8+1j4nwOxOd1Uj4fU4aPSe9jy+DqsrlP0qmbtnELsXdlceFU9n7Et3dcv/ongfWmTZKvhJ+ytrY28w1sHRzrGFkHl4Ghz6dLEo67AegONFv7x+Zd/prWJF7XtOBVQwdK23rNt/ebeyfQ1jeOxq5eVDS14o0Q/jf1bXjdkJRwQ3hZP4LHVb24+aIRD8rqUNfZhe7BXvQKke8dSSE5nBRSHyb9CSH9yQGu9rejJ92H9PIS+ueXUdc/hhctKdwRwp//+CUu3ijB9ft38LjsDa4I+b/28BnuldehqnsQvTywb2oDDalJPCprQ+H9cgnXhpbeGfRPbmBseV/I4zss7B1jducQo8vr6Jnh1v9lIf37mN44xszaPpY2D7B7QNpt25BNo23IwTmH9EYn+BImlvCby0MJP823jvHNNiH83Mp/1Vvhv4kacwK+JfzmG/yxhJ/v0schGs6D2XZP9wlhTgUvPlfz01zRL0Y5T9ofKkCF2LWjt9A8+Rhds28xtNqMme1+rBxMYufdqtSZnz7TU82lrx7zUEpeBZGQVJHx02MMw3DKyn6az5J+05I+Ao/80ZskZ/5ycxKRV52LkDHXzzp9W01MkozOQwL39w6wvb1jzgdwXw2YnZ3H1NSM+dTe6MgYhgaH0W9eERjwVvjtt/8JHthnDgwU8t/Z2S1IYHxiHFs7Wzg8tgf4sQimb3pu43fcYeQIfw6fAA4C7CqKHQhUiTs6kDJk2Awc6A/i+m7X9tzZwvmE2wmn+lC4iMzY6maYSDhXZ2VBWWlrPVQX6J06em5dUQ9IuYan7aWptqe3oNxxe/JwONdt/X5ZHLnGUV0Q/gRo3n4ZTg+tl8037I/Ko3FqHL0f5iPKkMOXQnBtvh4+dxlOmZ5ZDY5x/68hW91PahNPF0usRZdNTtvXueFcXUa44HcnfjWfYTx9KNwnwntO6bPsn4OA3NNdW1Mnv/W1xl9RUYna2jqMjIxgb89+Gzo6Rg4MFRx+CoQ4HR+TRHkEysP+0TGmF1bR2t2HtzXNeFnbgmd17XhS04HytgG09k8JkR5FZXMXXgvhf1XXglf1nShtGURl5wRK28Zx920bbj6vxJv6FnT0poT0d6NbCD0P7Ev0tqIzJfJkEzqTDUik7Cn9nakGpIZTQsaFiM8uoro3jZctPULq61Fw/wkuFRXi7pN7qGqux+0Xr1Hw+BVuvq5GeUc/+mb5zv4G6lNjeFTejIJ7b5B35yVq2oeQXtwRQn8oZJ/v7wOT63tITS6gdXACzf2T6J/dxOwmD/I7xuLGAda2D3DIAbs0ijYjB+bBv0D+uQ1T50qh57GgV8pDCsGT+qe3e9A4dhdVI/nmc3X2hH6eyi/+cX7yLu6Efvopj4E5OV9s8+k7CcuT/4Wc14zfFJRImGKBl45OApiJANpMV/Oy7kpJs5LnCEi6tDkBwW38VcOSzsBN1A3eQdPIA7RPPJPrXIrhlUZMbiawsDuMreN5HGJTakrSru9UCNihFZ6xXv4xPgEbii+mWLC93OtlgtH4Al/yeYwml5G2uHmuhpFbiW/o9y43jXrNJfdwGqNhNd5Jxg3nxiNOa9y4RKaJhrCh4qQfAmNcgRbclZ3WSFhOGJnJgP0D7OzsYGNjC2ur61hZXsXi4rKZCBhLj5tDA9NiDw4Ooq9Xnjd9PC/AbvUfGh7C0soS9g/ZZ63Rfmfd4SLSBHaO8OfwAdCZfr8vcOAsgx4dRDGMGQTR9mTqt7ogLcrDstOGE7cZiFidkZu8Ap2NY/MOVs+DOJpXIHPS03J78LfCO7LT6LIhVIYY/Uk4KZ/TlOFjtrH6g2oXZpIne3pBHLax544O0mPA506cPr4M1j5Jlw0fk97HluGD0vNwki4bPlsZPnedTpFeNvlfWYas6cX19b+6DFnktON1WuZ43fvjhO/roO60A53KrR2nY14CL21X5+rDccJxozpX7tfD1CkaJypz48TJwohtowjc5z+f639PkNwTtQGqaIvMsau8cBUV0jaV1WbwuSwD1WBFjLaQJu51NSRSh5wCCXMsxN6uoMmA1IvDv4cSdH1rF32DQurrm/GquhEPyhtR8rIGT6o60ZgSwt8zKYQ/hbeNHXjT2I7XgvL2XlR3jwkBH8ODsg4UPSrHo7c1aOxOoEsIf6K3Gd09QvCT9ehIEHVIdNehO1mDrkQ1OrtrkBxKYHhxHj1zy6gbmMTrtn5z6v+Vktu4WpSH5y8forWrFc+r6nD9WRmKnpXjdXNSCPwqkpPLqO4axMPSehQ9fI1LJY9Q1daD6bV9IZPvML/zDlPrB+idWkHLwBRquoZRkxhBd3oRU2sHWNyWMJsHWN7eNwcYBlxC/1kC+cUNs4hCLiEPEzzErtRlBG2TL4TwF6OCn7cbz0PVRD6qeRiekH5+575GiLch2T4RJ7kXYh8HEv5RIeajQtRHJax3EGDN2C3BTQnjEX7vAL4AhagYlfwJyZNE3+ZDnRB+ls3TVUuajcN30THyDH0T5RhbbMHCZh82Diaw927ZI/l7UlWSda20a1TGK3KS0XDR+F/W8FOA744kT/6nW66V3lO8wd4d8QKKX29DGtpGJuB/senkNAdh+h/lAuvJAsdJaFwaRnXhhxGPutXPeG442q7R1fYgHq+WfcEic2olCBXA3kEnIz6mwphsySvcYhAfaEw0r648kG93d9f7coD9hODS0jIWFhYwOzuH6ekZTExMGBnPTok17ylDjvDncGq4158rJJz1r62tRXlFBcrLg4N9iPgBE9PQvuSQwVi/Kz9Jl02eLV42ueqs+6QBn6sLuU8YhIdlQRlUHrWj7iiy6aJloG0hg1ySB29wHNbLwJc6R2ZtJ47RBwPkcHpW5utEHk7HcUd0oXAmjwCqs/nEyP0yxOnC8pBO43j6jDhOvGxxQojoPia9U8VRnePPSC8qV53jD8fRaxuByLRPEJ+lDB+qe18cx58RJ6KP08WWQdvDhHHcnt9tE5VrOnHlc3XG7cXRcKG4MXFMOOYR0fluL71oHF/n+V2dxsmQf6xO5Z4uI47jf38ZIu1/Kp3KPVv8mXEY3o3j6BwZbdftyqI6i+BZ7v5W/m1Q5RH7E1BTXSf9j7v5WE9rNzW1yOBzyqxYeaNWAd0CnkAXIv2OxWBqe+59SWNqZhYNLR14WVmHu0LcC5+W486rRlS0DKO5ZxoN3aOo7epHeWsXXjS04FVTJ0rb+4WAC+mu6MLNZ7V48Ebq0t6GxGACyYEWIfd1SApI9DsFSUEqRVkNEslapIa7MLQwi+QMV/jH8bwxhZvPy3HlegkKivNlTPMMncl2vKipQ9HTMhS/qDKvGyQmltA5Nofa5BCeVDbh+qNXuP2iHO2D45jdOMTMxgEmVvcxNL+JjuE51CXTqGgbkPKPomNwBiNzm5jfOBISeoiV7QND+Ek9OYS3VMb+s63zhY2fjfzhBfGIjFmNxD5WD6eRmpd+MnrLkOmKiWsCkn6upBeiJl2IOo/o62q7tQPo6n41JwYm+E1/vhLAlX1+118I/mix2XpfIUTdfis/HN9C0pX8g90BkpbEqTLv45egeuQW6tL30DD+EG1TzzG63ISlrV6s74xi53BG6rIiFdsRcCu00D2/I0Zg/rAReDV4Vej+howUj59y5ARaYIS8cgcN7znvHjSvIkgdSWxZE4ZWQm/I/oFoGNzEzmJcZZZAJl0BW4oty70OfLnB9mVrolGV4Nqt6Arb4pqepqF+1bsfnQuKF9wz/JeZYxD2Q0Bj3PInDl/S2DykXY6PDblXcGcAJwXUmH78ASZH+HM4FXjt7YDKDpo4219f32DAbX5lZWXmW73+oEtsu2LuDYa8/qP+D8PHxInBR6yqfwjiBofvw0lxYnXStkbn2VGdL3f0VmavndXZa+jqArfYns6N46fhuv10wulpOn5ZPbmN4+lcaDixVf/B6Z1Yp0DnxokN5+mi4TLawcjiwgXu7OHCcaiLxqH/c9YpGsfKMtNz4/jhnDjZ0wvHoS4ah/5o2p8SznWr7nNep4w44g/iBLZxq21kNpzbX637pPQ8neoZR8N5sg/t/0HcQBctA/3ROKcN57pV99HtH4ljdVbuhovGoT+adkY4T+fGccOFoOlE5YSfTnbE/XZ+03gf4a8Wwi+El4Sfq/su+ed7pjy1OhgVyzA8G+EX4w5OST4IGlrrG1vo7unHm5pG3BfCX/SkDCVPa/C6rscQ/vaBGTSmhlHW0mEO6HvZ2CFkP4VntUmzwn/7RS3uPK/A69patPW0obu/BUkh9z099WI3oitZj25D+GsN4e/srkX3IAn/HLqmFlDaNYQHla0oEvJ+seA6im8WobGxAsn+Lryqa0TBk1JD+Cu7h5CaXjWf5qtJDArhb5a8K1DZxgMAt8y7++Mrexia20ByfAmNveOo6hw0rydUdwyhsXsUvWMLmOVOgI0DLG/u+Sv8JDRh0uI10Bc09pLwj0ejPIurxkdC+DfeLWBwpRk1I3fNt+y5Zb7cHNhnt9bzE321E0K6+S6/d5Cffa+ffk4CXBdw1V5IvRB8ooon5ou/mqfnT3gr+iZckaRdiDIh9+UC+8k/TiAUmImCWglbJ3Fq0iVSnluoGbqLusGHaBx+jo7xcgzwM3qbvVg6GMPOu3kpP9/L3xBsCfj6iRJ4Eimte9TwKih95bZpur/8dTitMVdKCh4+qE2u1fGBEEIpL9/tfncoYXiwm/0Gg9aE/czME+jltpFtlQ/EQewL/d4TUr0j1Hpb0jEQt/gpp96Ec5qF0UlB2cLaYnpv+3mYG17iGkgMwbEpJ9fsSeOPJB7LasvLNJgui0n4yThu9RMMq6DcGDdgHE5hmDbLonDz0bw/MMnPZnRC4EPMBxP+HP53oYN6DlQrTB8R0i99p66uzgyQKHMHSm6/Oc2W878EX5j0f21EB6r0q8zVqVxJh6tXXVQWFy5O5sqjMlcXlcWFO60sqv/csqj+JJmFRzo8nBSH9peWRfUsX6YsLpyLD6tTnM6VR2WuLiqL00XdUVlcuJPCG7d5voXd70svqj+tLKr/K2RR/afI3P4QyOLCfT5ZVJ9NRjtbOFcX1f/vga/oZQdJvyH54q6s4FjQTgSUlpYLIW7G/NyCDDp1qEtbBqAk/aGhsDVK+GmZE+nFVu3B4RHGpmZQI4T+/ptqFDx8g6KHZXhe1Ynm1CS6hufQ0jeGqvYkXta34Hl9K17UdwrZb8GdVw24+awKN5+8wfPKCrQkW9Az2Ia+/iYMDrSgf6ANqd5mIfsNZgKAq/yW8HNL/wI6p+bxsrXHvEZw7fZjnL+Wj1t3S9CVaETvUI+Q+QRuvKoWSHt0j6Bvdh2tQ1NSjg7cflmJB29r0Tk8bbbxE6NLO0hNLJl39is7BlHW1o+y1j6Ut/SitD6BJkljZGYNk4sbmFnewK6wsCh5cF1fyjB1rq7anD0a43l5rY6Eeu1gBemNTtQM30f5iJById7lfF9+Uki6EPBKrrRPkLCTnHPLP+1CQZHgOiqE4FfwAL2xEmNbUM50CgX5gjwh+EQ+ysRfKnb5hD3936TDLf1813+0BLWjt1ErRL9p9CkSU5UYWWrH7OYAVvamsHW4gr1321LufakCt+wTdAeH6vkmtmkpJK3zKbLnjw38VQxLwitlSTFrxb7Dqyj1E5KvGougXxlIZOHXlplvSmtsSLxlSWVa2mxkBft9c9hNSjt2jmGtZQTLjYNYbhjEauMQ1ltHsNmRxnb3JA7653E8toZ3c9K+TGNfiKcUykyiECZ7yczdy893d7gbSAm/qYWWk9fn0NSFdaJEQ7C+RJxRnUleoLWn3xgNkA3vMQzipuu2rJaPYH6KUyR7ouF954KE3gVlalz3aU2O8Odwaph+4K1yVIitpJ9yM4iizukz+h59NJ0cApw02DxpUJpNlz2cOxnjkj0O2r2Bu7m2dlLHhlF3oAviqMzVU2ehbtVlyBy3Ii6c6/btmHxdd6YsqIfrVt3J4az9YSuX0bjvl52mDPHhKAviZMqs7bqDssbUKZSvhlOZQGxDhE1cN1w4DnV+fCdcNG03nKuLD0eZwNNF41hZZnoGoXDq9vRi2zq56Wl+Gkdl6g7sTFlmGWy4cHphvbXDMjdcWOe6rS6cjrUrze6rSiFBaseFC8eJkwlC5fdsI3dlEbenC8XJCBfY2WWBLtoO9LvuUDjV0Va9kWW6/3cRT/R9VFrbJf21NfWoKJf2E/dA3yD29kiMaDgAjUPYcJyqJ567IVY3ttDVN4wnFfW4dvc5Lt98hoevm4QgjyExOo/2wQnUJvrwtqUTLxva8aKuE/feNgnZFzL+qBQlj17iaflbNHY1mhX+nr4mDIjd19+KVE8zkikh+yT6gvauOiQGujG0sIiOiTk8a0yg8EkZLt+4J4Q/D/ce3kGyR+INJIWodxiyf/1FFd60pNA1toD6nlHcFaJf9Og1nlVLHtMrmN+FObBvYHYd7UOzqOkaxJumFF41pvC2qQcvaztx+1ml1KkWrSmS/iVML61j2zupXwmDbQ9tlS9nmANztmvFHn2xQks2xM+T+ie2UqgbfoTyYSHuQuJJ1Csniw3hL0/rSj5JvhL9MNkPQL/EN3q+HpAnuCq4LLgiJJ/ufAFX+q+jLF2EsmFJZ7hEyP59NKafon3yLQaWmzG51YuF3TFsHi8JLd+Ssu5L0YOWo5s1CP7y3/uMtgMp3bdN+C0RDRN+qyEtpW0uYlClPan/qoSc2sVhr5D75hlslo5g/XEvVu4msHSjFYuFTVjKJxqweLUec5dqMH+lFvOX68Suw9xVwbV6LEi45VvtWHvYg41XgzhsnMK7vmW8G9vCu3nJbEMy3ZW82XxeUUxZDEHVK0GhrYUNqJMyto4a0s4g0A4pLDxDp1bTzy4LPtQwDtNTRNOLw6cYJfrZoCbqP635YMIflefwvwPbBwK7UgaR2i+ywZxgT2h8k5ano9vTWX1EZ9xhXThcOE7oFYJIeq5bdZnhwu7McLRj0hZ/NG3j9+L45XLChXR+XE9nwnpuX2aRMUiN6BWnGdiGwsg978r8AXSM7nPDphvfl7Ll+cll8cnCB+CkOI5Oy2bsCNEISErg/tS6+PG/UHpGdkK5aceVwZepW3QqC9lZ0ovqgjIEJM7Ynt633TgRv7HVT9t1u2Fct6dzYSYJ6I7EC9zvfza6ceL8nwKmxfNVGpuEMAkaG4lGc+iqW3Y/zxPqHw3n66J1d3S2zcLXydUZuQeVu351R5FN96FxMmTuczT6TD1J5/0+RMHfgb8FhMSHtvBHYEh+JQ/srZPwtYbo11bXG39ZWQVaWtqwtLzCEag3pNRhL8EVKYWn9waqXOjzvDjyyP/h0TEm5pZR2tiOq7ee4I+rd3D9QSkqW3rROTQjhH8S9ckBlLd1C4nuwKv6LjyuaMWdF0LGH7xG8YMnePzmJerbapHoaRKS34DeXtrc3k/C34BUss5s7e9KNSE53Iv+2Tm0pqfxpL4TBY/e4NKNO7hcUIAnzx+gO9mMjlQHSps7cK+yBbfLmvCiMYGmgQlD+J9WNeNpZRNa+8eRXt7B1MaR2LtITaygqW8CFW39eNXQjRf1grou3HlZhbPXbuHPayV4U9OC9Owyljb3sHNo6ZrXQp4J+76UURJj/wpcViN/DrCJme0BNKdfonLoFiqFuJOMk/BXTgkhT3OFnqv6un1fCLrAHr6n2/ftqn65EHg7QVBoXgGomiwQ5AmuopJkf/waykbzzGf0KkdvoiZ9Fw3jj9E+8xZ9y02Y2OzBwk5a+OQSdqVcB/KXG8FJd1lW9iXTzby+FTJ+nU4yDKCUkWSUiEvs6xpOlrFUpMes/eE7of3cym+280v52QgMQB69JqGmtrGXXMB6dRpLT1JYKG7FwuUGLJ2px/IvdVj8sQYL31dh+YcarP1Yh82fBT/WY+PHWmz9VG+wIfLVH2qx/H01FiXs4o/VWJVwa3/UY+1iA9YKm7F+rwubLwexXTeBvc45HA+tArN7wLoUhnv+HUZurxPLKR7CEHu9CzyYeoiMB9TxXQT5by+yE8wxKmIwE/TUiP6zPco3Ic/pzUdGe6+JI/7R1f9sJkf4czgVgoFN1A76BQeY+r1eP16GW8IyjucO9IHbD+fbns7k48YN5NZt/bTD4cLl0DxcvZV5bq9ONh03PU9udF441alcdVnk1o7R/QU4aVBMnDQwPtWg2cPHxCHel14cTtJlg8aJi/u+MpwUx9UFMo/0OKA/Lo6rz6bLJn9feqeN48q07NFwJ9UpqgvHCZPgQBe4M+Ux6fkEMjM9SyaDODacF8esLFudq3cJqZuer3fsqEzLcFK4qD62Tp7tyqMyVxeVRXXcfdXS2oqVlRVsb29ja2vL2H39/aiosAesnpSei7hwrjsuritz5VGZq4vKXJ0iTubKPyTOFwGf6+b5/zfBewg/wVV+2lzZN26+119bh/JyjhNrMTw8Yg6TsoNPDrXV2MGowkgcNw3dhu8T4l/Z2kFjVx8K7jzDb5du4GLRAzx6U4/aDn6ibwyNPTJG7ezB26YuvGnk+/VduP+yFnm3HuNK8S3cfHQf5XWl5mR+Evzu7nokuhsFQvCTjebgvq6EkP7edvSmB5GamkHz8CSe1LSh4OErXL5+E/nFRXj55omk0YC2ZDvqkv3mBP9njUm8bEqhMsFPAvbhZV0bajr7MbqwaVb2x1f30T+7jo5RHtQ3irKWXrysT+BpdTvuSR0u3XiEf/9yAd/9eh53nrxGz/AEphZWsLq5g0OdATnBsH2Clvs8RomRMZqBIzwSpra0N47kTA1qR+6javT/Z+89HNrI9fXvv/y99/7OOZvQ0huQ0AKE3nsxYBsDpvdA6L333vK830ca2fJgCMlm92R3reRhZtRH0oz1kTQzuQL9AvVcbr+kn+fnMnzO7uuZfv25PPNcvnrOn9t5sXPEN+7zBXytsxnhN++L2may4J/OR/dCJUY2WjB9EMTy8Si2LmaFGTckJ4cCuOfCsZci/Xw6s2qyKy1L/5VNaGJYW0Wau+yVMQ53evjvGsmSekO/XDTMnVrWLyfLT14qcCYzE653LnEze4Cz4CL2qoax+bETa++8WH/eis2kVuwQ2AXi9xM6cBDXIYDfiZOEIM4Se3Cu1I2z+C5cxHfjIqEb53ST7alsj5W6cCTbg8RObEtcGwktWH/aivUXPmy8bcdWWhd28wdwWD2B49Y5nPes4Xp8B5g7BDY4CCC5P5F8mlcrMN9yXl9v5IzUPYRnx5MVkCXMyvl9/WrX+APkRBFSyPCAfmgI95H/9JoJ/uPR7WjukttEs/sRY+6Z9n3TNnyZH4H/ISYG/DE9SBGdGkshPz7Kp2GW+yaccee+8h+GXbVVx3S37EL+wmEiwqpj03nntkW/P8CInXArDLcmHZMf7e6kq9wcf6EwYTc7Hm7t/d9rpxTFn9vt1r5b97nZuuUvEljcitaRdkOOLTfMhO0jt9FEt2j+vhXmtn0YBO+LL9LOPqfI87PPyfbnLodv+wtv3f4i3fVxaIbUcovuL7wfaRf253an2207bX+3Pzu++/zprbEP290O893+5Po25RIOE966w5h7Qrgs9bG20+7avxXG2YbD2Ha2P32s9kPx2GFtf5H7dHOHicyDE6/yG95/qD+zP/llEtfqmUltDg4O0NHZ6bxvRcdhwuitPo60M/7sPFvurY5/Feft+Nxx8/hh/iL3uXW7f6+d0n331LvczL7bv8i+X9v3cP279ovrIcDvLOVv93cocV+9sZ8v8hPo7+3tw/bWtoIOdj7v6pjSKMB3Oqe2P9Whle3Z1Q0m51dQVteKd5mFeJGai+TsUhTV+9AcHFaw39Y/KjA9hHp+j79zCMU1rXj1PhtJr98iOeM9qhpnEyWEAAD6GElEQVTK0Dvgx/BIAAODfvT1+2VL+O/AQL8PPX0+9I/2YmyOL+BbR/eMpNcWRFphFd6kZyEjOxONzdXoG5Dw40MC8ItoHJhCefsgKnz9qPT1oKjRh7yaZni6hzGzdYRlAX6+lX9gdgN+gf3G4Bhq2jXs59f5kZpXhSfJH/H4eTIePX2Ld+k5KK1uQIPHh7GJKZyek3zuNyyfu0v2+w3j4p0hFKdJgNXjWHKp/NHNJqb3+tAxW4m2qU/qeXrO6nv4gr5l5yV+nLV3YF+9jV8pEz6Be59APuVfyIZv7iNap7LgmchEy8RH+CS+joUS9K5UYXi9CTO7Qawej2Hval64dVPQ/kB48ER0IdLz+frFbnpVBLOqpVFNLwsXWJP8m4GkaOaeJvprG+ZbnbC+XlT9mULgBP/2Bc4+b+HQN4W98kFspgew+qwZ6/GNAvktOE3040og/zKhU6C9E/uJAvxJQRwlCsRbIvyfJHYpwOe+Bvwu7f6kW+lQwu0J8O8mdWLnieipQL5stxPbsRnXJmlycMGLrec+7CRLOlk9OCoewUnDNI4DSzgZ3MTZl31cLZ9KviXzR3ISXOHvqhse8mz1QIBbaqTAkVmVIeI9xjSCiMZgxLBmG5ZuQ7odGeiP9HFbJsY/0qj7Y5RGa+yNm3nW/y4TA/6YvqnI2Xyzb+y1zLP87jYSAfzc0r/qFDn76tjYh92MvQlv3FSnUtTe7kcwGERPT490OHpl24vu7m50BbvQHuDzhuYdA058Vjyh+MTeTtdOR+eBW3d+jJ3bzW3vuKl0otgrRemMKt3npnWX20PDuP1FdtZte9k6M6AhO9fWbed2j7AzcGDZGUX4c7b2vr0N7TNvVpwRWyfftn87jG0f2t7l5rKPcL8rjHJje73tdn+Yb7g5x8YuIozj/q0wamv5v+Wu3HSbCNkZ3RGfDhPFPuT2g/G53CPcnONvh3HqwdSH24/rWMd32294NYAdn+XPHY7H0fbVseMvWhjR7yoH5aaf4f/y5UtEJ0DP8kt6UcM4su2+5eayvy++u87J2KvtHWG4jfBn21n+3e62vbFzu9tb9/79su/vkfd6/p788noA8FPmDf3t7fwqj/y2enh+fjXLz+X9c3MLOBdoZTuL1jE1xu6c2v64z7eP02bn6BTBoQkUVXsEwPOR8DoDL9I+IbOkFiWNXlR5u1Dt7UZVaxca/H0oqfHg2bs0PHryFKkC/M1tdRgeC6oX9Q2PdGBwiN/j5wx/FwYF4gnyQxODGF9cwNDiGgKf51HcFEBybglepn5Adq6Aq69ezfAPTgyjd3oRVZ2jyBZwz61tw8eKRrzMzMOL9FzU+roF9A8wv3OK4YUttI8K7HePobp9EOWtfKGgDx8Ka/H8Qx6S3mZIPtOR8DIZcc9eI+HFGzx7nYyKmnrs7h3ogrjHsGzuLtnvN4xLAaM6EmMSMBSjjKD21wOsHE+id7ERrV/y0TKdoz6f17b4Ed5l2efsvoC915EBfJ/48c1kwj/zEf5pgf2pHPglfGCqBMHZSgxIfJ832zF/OID180nsXS/g9Ou2pHgoWTiRLJzJ9lzyqOfzo8GXyTJbjnnbO99Or1vS39Q48KqW9kshKA4++Yqr2QMctE1jJT+I+eRWLL9owfaTNhzEe3Ec58NJnB/nce24eizAH9chMN+JI4H1wySBeQH3owTO9Itky8GAU7GjH+7T/lC5ybH4PxawZ1jO8O+J3X5iN46e9OLkaR9OkgTsE4LK/yEfDZD49uL92E70YvOZF2sv/Vh5F8BqRhBb+YPYr5rEcfMcTrtXcT6xjcv5PdysnwB7Qv9yXqFVAKbCQ4YHuiVEvupPxHtLNKkwlA4XqXB4PXCkB4/YluyQbv3Zxr6Huo26j8aAP6bvkbvjcqtTYwGxAepwWLELuWm/PNb7xp+OK+Sffqx94+b2x3ZJyGc73draUt+jtBs3Zxdot7W9henpaTUAwNn/cF6tPCg7vW+nq+1MusZOFMXurv1bx3ft3+fm9neXHupPdHcnVnf+CTNut1CY+9xcctvbx+yY37J37JSb2Tduxp77t9w0JBm3yPj0bOF9Yey8mDBhO6dMHDe2PTuMcnOF4dadB2Vn9kNukWFCblYYE4c7vlthlG7HZ4eh3a0wyu5b52SHteII2YXjY1xuf+4wPA6Fv8efjtPsc0s/snX82bDtjo/SdsbNuJt9284Jc0d8Zj8iPidMOG4rHdvNDhMRn+XmDsNjK4wpF3s/FJ+1Hw7r9mf8tmJ2djZ0rzw8PIS/3a/slT933LINhTd5UP60XWR6rq07jMtfyE3ZmW04TDg+Hmt77msxbSusZe+Oz943bpFhwvvu7S19xz02JAmjf8N+cT0Q+DnLr/YF8rlvjs1M/+DgsEDrnmpfdqfT7N/VQY1mztWz/LvwB4eRXVyDxLfp+L+kN/jtRSrefCxUn84rrG1FRXM76tqCKK9vRUpGNl4lJ6O8pgxDY734/KUfY5+7MSLgz2fxh/kMP4F/sBMDw934PDuBL6ur6JlZQnP/ZwXmydmFeJ38HvlFnxDo8KB3sB3dI/0C8ZOo6hpBRlUrUotq8CanGI/fvMdrgX5f/ygWdo8xu32MvqkVtPRPoK5zGBVtvcipbkHKpwq8TC/As5QcPH2XgaRXKQr2f0t6jkei3+KT8C41DUsrq87Z323+CMBgLYXiNAlEWBK1T3FwtY7Z3QEEF2oF+vPgEXhvm8tF64JoTmB+Pht+Av6sQP+0lm/qI9qnckX56JwuRu9cFYYXPZja6MLywRh2zhdwdL2pXgx4KYDPVwRqcDMZ4FZjPhU2JqNa5p/xyX9uP2HpOCPt/kJGsquXuN/opdxc3n8hpTa9j+3KYSyl+LH8vA0bT3wC4e04Eei+eNyJi7hOnIlO46kOZX+SKGCfGBBwb5etyHle/yRBwt0S7elOvzoMn/U/ljjUzH9Cj8RJCfSrbQ+O44OibnELqgGAo8QuHBD+JZ4diWdHwu8mBbDH1QHPO7CV3IGNjAA2P4m/yiGct83iom8dF+O7uJw/xvXGGb5yEOBY6o/vJ3CaBGtQz8brGfnwP7ehTVhqxYB6bwAjMrDvGjgIiX7csuO7bXjLM/pVTAz4YwpJ13G4riPlttfHGmx1eB9n+Z192is3bl3+wvvc2u5hKTuz77iNjAzj6OjIabrfNnxudXJyUqUZjkenyzbOZ1n1G6zDW1ut3LrsNRCFpeyjhI0mpmmHjYjjAf7cMucQDidSbuzk0s0DT4S7dgt3grU/247HDOPxeNQ+y07ZybGOI5y3aB1p+rHTdB97POGtbW/HYe+btCkTf3OzPi91vnYenH1zbuHzDLsZO1U2Tl5MfsJ2PFeThhOHE6cdn943dtyG60OXl47PpBPehtPRW12m7vgi05N9OXbHrfNpx6fdVD5UXek4dL1FxsdtOF86jkh/3Gq5072VB+ec1HXkxBFOJxyfiTNUDk5ew+k5+bPC6Dis/MiW15ydB16ryi0ijD7W9npfh9NhGSfbN+tZ50XicMJEywMV9qvTZfq3yiFkF+lGhfNl2ooTRmTcTL7D6Yb3TX2ZMOE6DvujncqD7U/a2ODgoNxDR5ToT9trcT8iLRVnZB64NefPfJh7Q7OJx3X/scPZ8XmcOjDphtt/pD8dlvttIf/m/I27XU86PnG3/EXWE4+5r92MXTgevXXv/6j0b90vrgcCv5ECfYF+JWMnwN/R2YW5uXlcXLAnHjaqO/w90C9e2L0+OLnAyJcF1Hja8f5TKRLepONfT98h7m0GknNKkF/ZhCoB/vq2LlQ1tiK/pBSlVWXo7GkX2B/C6OceNcvPmX1+Xm9INDzQgf4+zvB3YXRqAp+XV9EpaVR1DiKvpgWZ+WVIz/qIsooidAXb0D/cieBwrwL+hr4J5DW240NRNV5n5auX+9W0BjA6s4SZ9V2JawvBz3MC/J9RGxhETlULngvoJ7z7qJbyc3Y//mUK4p+/UTP7cc9eIv7pC/z7UTyevniFkdFxXPLTZfcYVZZ696cZgy0RxkqICM1l/VxWf3yzicWjEfWmfO+XIngmBPwn89A2nY/22QIEZvLg//IJPlH7l0J0z5RjcKkBoyteTG92Y+NkEnuXiwL5AnFfOYtPwGdthxKLLmVCO2Js4LrP0N34NbIhzughcf0qxjknrmIgsHJ39RSHDV+wliKw/NSPnfh2HApgnwp0Xz7uwdVv3bLtlmMN35yxNzoRAKc4CGB0Zm3Nvm1PhcN14jQuiLO4HqVTpW4H+pme1kmiHHNQgPvxXTiJ68Lpo06cKXWpLQcbdpO8WEtswuqTZqy9asVqSjvWMjqxWdSHvdpxnPhmcTGwhqvJPVytnOBm7wJfjwTST6VczFcBolUl7YxoZHtzdaWkVkwoB7YDtzgAcP8gAOuB97bvGdT8b5kY8Mck9WrEOo6277aL5ha2NzP8VHgmPRwmvK/93D+DotvjwMDArc7EQwxHQT9//qw6diZdn8+PiYkJrK6uYmVl5UGi3/n5ebS368cFKL/sR/Nra3l5GQsLCxgbG0MgEFD5MOF5XnyDNuO189Lf3687oo4/t4w9BzPW1tZUGIYfHR2RjqzuuDMOO87JyS9OeAcQrLh0h1lDVG9fL+YkP1xBwed9ORvI7fb2NublPHr7+pRfJScOFY8cs2x4ribNh4p1ofMRPjdCC8uL57i+vo69vb1QXnZ2dlS4zxOf4ff7lF87rN6X8yQwWHZ6q+9tvN+582Fk6mxmegbDw8PqvDQYuMtNx6dhoxWdXZ236vJbot/x8XEFInZ8NoRQPEe+FJMrV74V/+LionqRFtuAqlfJm4rTxO2kwzinp8LxrYr6+voVJOk86LB8ZOa+8qKWV5ZV+2BddnZy2a8AlZVWKD4RwZNlzHBMm2H4/g/t53YYbWeOpVzkOub1ZJfDyMho+DxvheF5aLAj7PJc2IbYnqj9/X1sbGyo3z++yV7HY2TCS/0K1MzPL3yz/KOJYVh3vPcwL4FAh5p1pz3FOuO9QKVtnWtYut0yj3b6fbweVZiwX94ro+WR5810Fhej1yVXT4XOOyIPenCA7jyHzc1NVWb29ci4h4aGpM16nfKTcHYczj5XWI1K3Zn7FsVw+rzdYbR43mxbxj/bDlcohK97py1PT4X8PEQsI9YBryt9zjo9+37xe8R8//L6TuCPJgJ/q9R7f/+AemO/6j+Lsfu/tzvDPHZL/sqGuhD4XVzfRqBvBGUNbcgqqcFbAf1XGQVIyS1Dblk9SgTSa5p8qG5oQW1TEwJBAfDxflEvBviivtEuAX6B/qEuuY93YYSz+/0d6BvsEVCfxtjSKjwDAvIN/LxeHXJLK1FUVgpPc63cowIYGutG7/ggemcW0DI0jeKWLnwsr8O7j/nIKiqDJxBEe98QvL1DaO0eQq2/B1XeHlT6e5FV3oREgX0OVLx4n4Onb9Px6Mkr0QvEO7Af/+Q5/hOXgCfPX0h7FoA64dvW7jbhUvp55nacBnS0C/9dC1zym/z8Kv/R13Usn4xjfEPKcVHuCXON6JypQcdUJYIzVeibb8DIchu+bAaxdDCC7fNZcHXA6c2exCGAJlTGJ/B1Go5hUsJPaml6KDMmZ7YcE83JLWW4Y87HVnRwCysikl/MfJXr60a9l0XNYUv2jwflXv/ej/XEVrXk/vSxAPjjXgHwflw86sfloz7Z78WxQDhn2gncp45O4jkwEKkzBfC35fZnRLdzAXit7pBfxq0HGMx7AJz9eEK/Dnch/o3OE3rUOwL2Bfz3EvzYTWzHdpIfG0ltWH/Sho3Xco7JAax9CGA9pxtbJUPYr5/AmXcO173r+DpxiK+L0r62pVBOBML5aUA+DkBsYJNzs7t5rt9V1TzU4l/TXkzbkH21KiBsR+C/kfrgIxa/Ovh/N/DH9E+XtIWo8P7z2ojd2WJbZIeMnUq3ubq6Up1Owql5GzUB3za0Mx1Z5tvER4j8XsPHBXitqLgkbwSbhxreBPiMI5+nNc/1m7yw82wbwmZ4tl7kdH5NmRAYgt3dOLZWO5iBDY+nWcVLULYNgV2Hd4Bf/OjOtYahYLBbQQ/jue+GRXd2+BUYOeWg8iT7tPuRQRnGp/Ojz5PiuZg3P99l6Mb6JTAzD6E41Nacpz5n241fkmDb+ZZh/JyZ4jmtrq2qR0Q0ODrxOelwS0gmfLGNfK9Zk7ibm3W9mfjC+ee+rvNAh/wQOstmv2VM3nnddPfofN+qd2lj7vhYls1OG6I/gt74+Nit6+ouw3RZXgQpQrwqL5WerlceExrtemX9+/3t4kdDuaonV15V3p364+8Roc82BFk9UOGEc8KqWWfZ5yAD4dQsNY5mmKfLy0s1aMPr0oTV5dAi9SudqB+oX2OYPt8vwvJlW2LbNYbpEtR5Du72asTBAvd9cJyDmeJmHhOheI/5EcP0Q+3byQNBPCB5Zvkyj3a9uQ3Llu0pPGAZzrs5J977lqWvYQzjm52dU+Wr657+9D3FtAW2I/u+wjChgRmnrTC9Pdd99CGGq8A6AvqezrjM/eyfI+d7+79TrD9ew9Mzszhz6opN5Z67dxTJX2eXm4PjMwxNTKPO24FSAfuiei8yS+oU8KdklyA1qxCZn4pQWFYJj7SBgaFeAfxu9PW3o1+AvY+S/b4+Oe4PYFDU1xdA70APRuQeNL68Af/4HEpau5FdXo+PBSUoKS+Ft61e/PvRN9SBntF+9EzNobFvAmWtXSis9eB9biE+Fpag1uNFeX0zSmsbUVjTJPkqxpPUbLzILMTLrCI8//AJr9JE77MR9/wN/hX/BI+SnuG3hCf4T3wS4hKf4lF8IpKePkdVVQ32du9vv+FS+llGx6jBhrKgRm11avxLvOS78S9wKNi+LRC/iq3zeSwcTmJ6ewgzW4NY2BvF+skUds+XcXK9jfOvfKv+mYTkb62OK2RMkkah5MyBnQfloI05NKKXaAoFucsT4zdp3KdfzbC29OJ1ZY6/Yrd1GgvPPNh93CaA34WrRz04f9yPUwH+s0cDej++V2BfgFqA+zSuU8G5BnM9G69n5r9TDKfAnaDPODtwrh4Z6JQ4uXrArCTgkn/90j8OOCjoZ9pqcCAsxnkk2yNx46MAp4m9OE1ivruwHxfQAwFJHATwYeupD+tP27D2vA3rr33qM4M7WX3YLhjGTs1n7AfmcDywgsvP2/i6KG1wU8prX9rCsZQZf3b5M85BANMMTHsyxt4Xo6GeAy1X0he6kn0TiEYH1tdRpOFv1X2/mX+2iQF/TPIDF93+bhnA//F2YTpXtzpZTiePHUQeszPLF/O5DSGZM4+hDqojQhdnj9TFKZCiZ4/Y+dTxM76fAfzsZHL/R8zM7IzEoTvEHgG9+YV5x0UbnlunxK2XyDrnpspDbwn1o6OjETcSwoPuBOvyuAv4TTkZcVkrO/qE6+8xTI+f/TIrCpjXjk654T/gbcNuQ+Az58r8M+/fc5NkXevBDhfw3SECxEOA320IPMxbtHJk2j8K/GyLIeC/QywXrnh4KPDbhqDJtuouH64qiAr8Vl4YhrPpDwV+2xD67fRMfG7g50CTAmyn7X5L/D2KCvyu8zPxEYC/N/8cQLSvJ8bN1S1nP9C+jeHgJOuQ5Xsn8LvOwRYHqm4Bv9SXu9x+CvCLuM9VB+4ByW8ZljWvRztPJj5eO3bdsR3Mzs065+1cV7y+1L1O/xZEA377SwMqbtHe/vdfGwR+rrbQcTF9/gYxTjsv+rfD3pr9v76iA/z3im/ub25pQ//AILZ39tS39XmFa0Xr9IZdIxXeXMh9fWZpDfW+DhTUNqO4wYfcSgHuTxV4JTD9+OlbPH7yEqnpGfC0NmFkdADDw91qNn/8cx8GR4Jqpn9gkEv6uzAiGhzsErsBjM3NYXJ9Fz0z66gLjuJTZSPeZ+WipKRQfntb5FpoR+9wB3o/D6FrYgqtg1/Q1D2MimYfUj9+Qk5RCTz+dpTX6IGCNxk5ePQyGf/z+Dn+99EL/PvpO8S/ScPz5Ew8ffMecU9f4ZEAfvyzF4h7IqCf+ATxSU/xWIA/IeEJcnLy5HdgU5/4HcYqoZ9kGJsNt7xHmmlQC9Jlo11vxPZStqeiY9k/xqlA/dH1Pk6vD3Dx9Ujs+Cz+hfjkEAGDmn9W3s2BW+oPPzSn38Ov88OUlaM2tn/Kzr6tUBB3ACpagBtxiZS2p/9fy5jyVH/2rrFdP4alJ00C0n5cCShfPRZQftyHo/h+HD+Wvl1cnwC4nuEnoF897sTVIwK6mYnnTP9tHTuK5mbE8AR8s/z/LD4gx3q5/zHFZ/z5QkAlvhzQedt/aLZfz/irgQc1INGDQ4H+Q8kb4V8/GqD9nSWKvySG65R4O3GQ1KFWAWwl+LARL/Cf0Kr1rBXr78TuQzu2szqxWziAg+rPOGmdx1X3Or4O7+Dr5AG+Lkqfd13a+Z4UJAcC+BPDZh+l6rmrWgXBX8lyvM+Iv+/py/7RJgb8MUXoIR0ZPUCg28T3DxZ8n9gW2Xm0DS8gs1zZ7d90KtnpZXt2++FxNOAnqBKM7pJZScAOu4nTPcNP8CRYE2CNCA5uuORxd3dQ4tCd1f6BftXhN4bxDA5ytk/PyrIDqvPPrX40gderbXg+Niw8aIZfIJv5ODnh3S5sWL4cACBcmHOIBrK0Z1mq57YlrwQkN/CrJdNSfhTLUe3vh4/pzhlVhqd6e3tuxcHO/s7OrgJD5ofhbICj/8GhwVB5mTIwMGDszNYN/Dzfo+MjFa/JE2HsKgok0i+BVc9GO+mIos3wsx75zgkCkzpfnrfIpEN7psUBILMyIyTm1co3y8YN/MyLftRiHgsLi2plCNsF64Vp22ZmRtJwZsBNOXwT+MUf25R7hp/lvby8opZZL3CJuKTNQTb3oNHZ2bm0r/CgkIpP8nAL+Dcd4HfKNFodchuqP/k9uhf4HX8sMw5WuK8/lg1Xx7DseE2zHuzrzxi2NTMQwbi5Uoj+WWemDqnj45OI82FZsd7DfvSjA1xCzvgY130z/OocRBHlIIoK/J8F+F1t0Q38jJv5sK870w7N9cg89vb06LicdPkoC9uS25xfnKt2w7JgfgjNbsMy4GBrZJsz9y4X8M8a4A+fs97q+zXrO/oMv77X0y9n+/ddwM/yNXVgzts+Zp2sr6+p82Q6Wjq+SLiX/DAv3Np2zr7Jg9pXK97+SooO8N8tbzua+Mb+QAdm5uZxfGrfB6WjbNb5hwyPKdO7dnrYUrdfr6RDfaWBcffoWC2b/1RZJ7DfKODvRV5lCzLyKpH06j3+9TgRL9+8lrQbpN2Pym/+iPz2Dcg9ZgSfJwcxNtGHMX5zX/R5rA+jI30YGhvG58UlAf49dE2tor57VOJsQEp6FqqqyjE6FMToWBD9Y13onxhGx/ikevu+b3ACJQ0evBV/RRUVCPYPoLHVi8xP+XjyJhXxr1Lxn2fJAvxP8T//eYL/l/gKcc/fIeHZG4H8F3pW/4mA/tNnSHii9TguAb89ikNKyge5p93/4j5dYvz7s4y7/HmP533QiHaqSkJbDZuX4sLn77k834ZyLQ1GYqv8a9EIJ7mW7RtDKGJ9E/Zt2fE6xhwa0Us0hYLYnmlCDmJsN55XJPCH0/+1jK4DtSMdrBvsNE5gKbFBQNiPr0k9uHhEWO7BQSJnxwX2FfDzJXqcSe/CtcA+xRf5cSbefqafCgN6WARstz/O4GtpuNcv9ePL/fTxkYJ9IxNXGPrVi/xC6pY0KD520I0jAXw++3+awEEKDghwRUCXevb/mFsOOPDzgRwAEPFLAwdGiQEcxrfh4LEHe6KdOA+2k0QvvdhN6cRuRjd2PvVjr3IM+03TOOQnAgc2cfZ5F5ezh7hZ5kCA/N7sSttml4bdBzbzcFPR7dhRRLs2W+oXNN8N/G77mP66ivzhjybjh1sJY7bWMn6zH45P2ys9tPNzlz+xZ8fKDa/s8PX08A387HSF09F50WIHkM8Q23HTnWHcwM/4CAy8DjijdZfYybTjcwM/O9aMg368Pr4rwKcgjbPxdoeVhgCm86/jYifUNnNzcyE3WwzDvNidbAIMwcaOz93pJ9yE64j+tF9CtG1YFgRHrp5gR9icA1dZ0N4GP+4TEE1nneVjnyfzRYjpZNmZMlTl6GwdO8bPvPDlXzxv27BTTnDg+xLoh+XK2T0+i23AlvctM0Onzy8sdwee++4l/dfXzOegqk/mratLf+5xUNI1S5ltw2MFMx4zwKAHmtzATzDmOwDYJvh8vzpvde5mX2+5zFtBhMmr2oqsc2J7Zjx7e+HZVpb/6OgYGhoa0CSQTlCn2L7XXANarGeeN8tJlwvTuQ38n8edx0KcdFm3buBnGC7fbWxsDKUb7fxphoaGxY3tw5zHN5b0M11XOZhy4T7LhO04GvAzbuOX+6xP90s+WSeTkxMC712qnPii0Y6OgGqnBFi34bsvGCfLi+maOuty6pB1wmvAbiO8NvkIgb6f0F+naudMR5fBXcA/qNz0uZt6Civakv7ImXTtb+rLlOOqDcPo9ma3Paf9Wcc8P4Znuqz3+fnIa5GGAzv9/X3q3Nie2qUM+TgQr0H3PY7XLmfP9blI/kRMwx6sZDuYlWteD9bpujNtT52PbKMv6dez8jqMlKnsu1ci8B6oz1HfZ8z9x97yPEKPWDlx2TLlEVY4f5H7YfEc/zISWI/2XP73qI3ytcMj8OuR3+P+gSGsb27rN4iLUZ/bs653qUFLTq851HsWzLq4wvWFvp6ueH9fXkN1aweyyxoE+NtQ3tSJEtmm5xTj6cs3eJeaLL8dDXKtDmNagH9srEeAvUdgvx+jAvzcHx2V4+EeDA32oH94EKNzC/i8tofg9DpqOobxsbQWKWkZqKupwMRot1zTQQwI8PdJnJzhbx+dRlNwADnlVUjN+ohaufcNyG+QV367PuYV4GVqOj7kFSO3sgEfS2rwQfL2LvOT2Gcg8flr/CcuEf/v0WP8+3EcfotPwOOERMSLCPv/71//xis5j7mZyJV+bqNLzC7Hn2XsumC581rj1rnnixMfW76Rn0xuCefanRYCxrfInn60nD+ysRT6p7wqcYm6+We7Rxo7hCPG77JSUn94Pswrt8ryXhMOHkb+X9Gos1LlKEaq6qRrCRsvWwVwW3Ej8MsX4B0KEB8kCThz1lxgnxB9oEBbL72/eMzZeA38Zvl9eAl+dIUB35E9WKBgnqAf3e9xvLgp/3p2X728j2Av4vERAV78nUoez8QPPwd4JvvnPB8Be/V5QMnzkcjEEVolYOJQx3pwgIMZVzxPrjqIC0jafuzHe7GjVgK0YCXRg5XnbVh948VqajtWM7qwntOD7cJBHFZO4LxpFhf+ZZz1bOJ8eAfXU9I/VysCpN3vSMmzW8F5KTYvo1vNjG3ItKRfoy3x9y4G/P9AherT2YYVdqPCs/kSzt6qOFx2SuGwP0Nsi4Q7t+FLl4y7ETtgtLtv1QH9RQN+e5bpPtlxsTNpG0KkesGbNUtmwrgBhbN9xo1wcht0D6SzrGee7DR5PChwYhtCls/PmZawv/uBX8fDVRKRHTE9EEF/Gp7C58A3fnO7uLSo/PFcZ6TM7Nkxlocb+NmpNu73iXkiOLJcbMN6aWpqUn7US+DUVs9O875F2CJ4qHjMuTlbW7abG/h1PoOq/vVAkQZGAyFsf26YIUDb8dK/G3i5z4ET064Yr9qKX/X8sWVnx2WLdhT98XxtqFEDLs6jDLZ/AjvzbEM6YVa3zXBafLP9rRl+V3wsA5axHRfzwEGXiDKXfYZzDyBxsEu1Jccf96MCv2lHjj9bth33WX93Ar/lb2oq8hrgOQwNcwBCryYx5U8x77wvuGe0DwRa26VTb/Km/Ku603XIcIR7G/gPj47QFexS9aD9WdcS45BjBfzWoJ0CfomHbvY5c2vkk/zdCfyWvy/yO24b1n0ofVGo7Vn5ol0oPTnmtexescFrk3lgmzBxUDxW7UTycmO1E15Xk3IfMu2JcfPechfw053+jMz53PkMv6Rt59kN/BwE5TnSn8mrLWNvp/kzZH5j/xL6CcDPOFpl2+YLKOj3+gOYmpnF+TlnaXUfOPJnJmTriD1lSwKQX6+lqyzthzYH55foGZ9GXlWzwLRAf1Uriqo8yC+tQXpWLvLyP0m79GCEy/mHuuSe60OPqLs/gJ6+djn2o7+P4sB1AF39veifnMH46h7653dQ4e1Del4Zkj+kobqyBAM9fAFhm/jzIjDUjaAAf+f4LGrbu5GeX4T03Fw0cdCutwdN0rbfZ2TiVWoaPhaVo6mjDwNfFjEo8nYPobK+BfklFfiYl4+U9HQ8efkKvwnoK/CPS1DP8P/r37/h+fNXmPgced26jS4t/v0jDa9f3ssolr7efCXbO8CvK1N2OK2p6kqOKXpX4j4D8YABKP7ecqsBSP/jnhVMxJgZPbe3jR2fkQnlbIzUnyh+XCYiiLN12/1qhmdkSpOn9nXmCMe5A9h+1IjTx161rJ6z6ZztNs/ME/b3nlD87r5As8C5gnGBcPMCP/0SP0cKqsNbs6/k9m/5udMfVxOoFQVyLPk548y9ksB6PJ/bJ+h34CohIJDeLpDul3PxybnIvuT1LEnCqlUGZrWAWSVAMQ45T0q9G4AvEST06y1XNejPEeo4ODBxGHoxoA87SV5sJbRiI176LwnN2HrSir1X7dh/16U+FbidLvnLG8Z5+STO6+dw5lvGWe82zsb2cD57gOuVE3zdFPo/kFrhIACbm2O4e3fr+/NNDPj/qbI6KG7ZbuF9htHtQNtFwv1d8dmdOHu25PbMSXSxLbJ9upflstNHWGGHl0ttOUvMDjvDmI6sOy6K9tGAn8BtOtsPlXuGn3lkPqKlTcixjQ38FM+BHRzbEBbdcXGVAuHGNqtra44/6cCKH+rLlyhL+qXe9aCI7uwur6w4rtpwlYENhe4ZLNoT4DnTT2AxHW3jFg34eV4mPGXH51Y04GdaagZZ4jdpmXPksZ2H++I2bvQbDfiZTw0xkWHon8DCgQfbEOb7+vskjMC8+GPbiQb8tDPtKpQHNRgUma/w/u08cMtBJF4H7hl+A+jhuDWkc2WBfY4sV173YX+SjviLDvwEVe1PgdwDgJ/55ooHzgDbpj/0XLj2x/2HAn+0MqIIgHfP8OvyYx27z415M2mE4lZbpw1L/bO+3Nchv1xggNgOwy3T5CoGG/i5qoCz3qF6d9Kyw+gZ/jDwX1xcCmSYZ/jDQM2tkdd7e0l/eIZflxMVDfhN3u38hPNl9nU8zANXVdnlwJURLJtma1UL043c92JjI3JlCetWu4skHbbBbwG/vVVhvgH8FPfdwM92a+rb+LN1lz1lu7n9hY/1uXNr3CJ+Y/8K+lnAL23T1y6/fbLf1MzHm/r1G/sJfxHGoJQt0y0WOWtjb26ucSH3ryupa955ljZ3Ue1pR0pWIVKzCpCRU4Tc/BLkfMpHVVUFgl0+DPQL3Pe0ibzo6Zbf5y6P/F41o6ujEcHOJvR08ferDYGeLvR8/iLAv4vhpV2UtXThQ24h3guQ11QXo1vCBINNaOtsRHOnF53iNzA2g2pvB9IkvYzsLNQ31iDQ4UVNbSVevHyBuKcv8OTte6TmlqBC4vP2jqMtOASPP4jW9g60iSrqm5BZVIrXaR+R+DoFT16l4IWESXr2Gq9k29M/LO1c37NNyYSNXV5/pGH5Mw8U952NrhYnef4RC97DjZ3xo+Bfdvh7oV5sdlvRgJ8u3KrorGjDhkcmDpM/yg7pbJTkD9uS055sY7yE0nMU3dg+wj6j2VKRcep/IRtuLMND2/9DjRpPke0ltwx48BUXgWVsvWvDdnyjwLwPR0kB9Yy7el4+kUveg9gXaN4TuwMusVfL7m8Dvy0D7rdg3nE/M/7U8vuwzDP3lH7GXy/HV1LhCPzOcn3ZqvDKrUMgvR3njzXsh4G/0wF+Dftcwq+AX/J+KOKWsM+4OJDAt/1T6qWEIj4GwMGG08cSR1yHowCOHrdLuABOJc5TDoDwc4ZxPhw+9oq9X+L1Yy/eqwYFdp+0Y/d5O7ZftmPzTTs2UjuwkRnE1qc+7FeP47h5CmftC7gYWMcFPxm4dIybdekLbku/YFfa6aHUGLuG/Bmj2GytijftQBvjYHn4SSYG/P9Qmfrk53TM/m3RLYrUsnZzbPZ1mFudI6ej53bTHaXb/qPZMb92J9Ft2AHk8lh2bDlDbZbTGgCw4+JxNOBnOM4ks7MbTabzbosvqbMNAUsBs5MuZfZXVyNBiB1qO288R3eHlbBrp0cx7/ZSYBqer45Ld24pzqzZJgz82p3+3cudCWLG3aRn9kNbnpOTb9ufAf5zF/CzHrhU35Sje1+BvBOHWtI/H7mskaChPvXWpZccm/DR8uDOazQ7bqMCvwCYyYvtl2IdcvDFPeNpwzb9RAN+vtiw0WlXzLvJv9k37SpauhF5kLwp4LfaCCGcnzjj0no7Xl6PNhDzXDnj74aq+2b4TbrRgJ9hCOhqOT/TlC3DcNDkxCojzpYHJM9sMyY+nq8b+DfuAn7X1uzfC/z0I/FwVt7OM83g4FBEXtxpmH33daFePui4ucMwTa4auAX80p5YdrZ/O0y0Gf6xsXE1kGKWnLvFON33iIfM8BO6WT9GdlsxdiaP3NLePRjIlRssd/sascWwDPdF7mt23erBj2AonPteTr+zfxDws82zbdrnae/b156d3kPsuHXv89z+cvoZwO98l5/31TbZ6ked+Bs0pe7fxrDeeK+lzLerHRclZcfPW0lvWP0V90uxY2f47PIaPYOjSE3PxtMXb/H2bSrev/+AD2nvUVZWhI6AB30C+f29bRge8KGvx4Pe7mYM9Ip9sAF9nfXo7/agOyj3UQX8kxhf28aYQH9lWwdSP2bhfVoyqqoKEBTg7+mVfkLQA39/EP0zS2gb+ILi+mak5+Yg42Ma6mpL0d3ZAk9TFd68fYHHiYl4KtD+NDkL8W+z8CQlBy/TcvFG4P5DVrZ6zj+jqAJ5ta0oqONnABuQXlyLrKIaJH8sQHJWPmo80i/Z0fdjNWEevozE6DJyo8EfY0xaTjpRk3NZ8pBZC0ksVP1GV/hfpIsdhW0f6er2aduLmG40J2fDXwXerdWQgVhQ9BIy9OSE+8pBT7Wsge1VWqW0T+baxEEZhrPFuHUUzrAGy8OMTyh7l191bYgfpk1FGMfSuDm7BH7Vi2Gca+e4aJnC7rtWbCc2Yj/Ri8MEAVpCPZ+NV8v7uwSQBXQJu7LlMnu95F7Du37bvg3yYdBXM+kC2Qb6Fbhb/s3ggBkQcIv+TZzhfQ4KGD/cF7AXGKf09/45GCFbySOlHg1w8qvzRdCnTHhCvxYHFUKDDSY9550FIXEQgGk48YdWAbBcLLGcWF4HSu3YT/BjL8mPHdH203bsvAxg61UA6y/l+n3djo2ULuxm9eOkYBw3lbP42riI68A6rkb2cTV1huv5c9xsSM0dSyuQDetStQGRHgJjhWrxWF8lYpzN7zEx4P+HytTnw0T/YYWX71PR/IscoL+1/y03a7bEiO2RHTw3nNxl2KGgX/V9bzlXhrfjcgM/DYHYvOgvmrg02c4TxTzZhp12dm4J/Zzpp9ixZ7w2YBIcec2542M6tuGzwLY7885l+LZhXKqjpfyEz/O+Jf2Mh3mzO2M0HDgwneDvlakjd8ecL+Rzl6URwY8gbeJg2jw/Ow4a1ifBYW1tXcEXAdSE+5H8clmyG/jVigWrnUSTe7k382LS59YN/EyDIHpfu7LP/z4xb2wzNtQw32zHjIdlSc3MTCs4M7DLPHAwK9xGwiIkuT9lRoAkDIX8yHm5gZ/naOrVpMvBKT6zbQz3o71Yk/HRf7izr4HUPBpi+71LPJe7gJ/ujKe3t89x0YZlxTbvjsvIBjf3KgWWse3XiGGYJldTRAN+k59oYdje7PdwsDx4bL9YLprsdktjgN9Og/ViG8Zr2ls08T5pyp/5433C/T4DvqCRsHz7fh0uu2hlwXuMefu/ef/CklV3PO9vra5ifUcDfvu8ue8GfnNtRBPbIAdqvvlbeOu36u42yrj+cvopwM97i47PJ+JgPuuT9zbWgbl32Nc8d82nrow9O7aE/Sv5d/n1SnV3Cb5XAkL0sbm1g7r6RoH9FCQnpyAlJRlv37zAp9wM+NrqMdDnx5DA/lB/mwB/M/p6mwX+pU32NWKktwFDfR70CPC3d3ega3QcQwsr6J9bRlF9E16lvkPqh9eoqytSM/xd3c3o6PGie2wYvdML8PSNqxcHvk5NQWraW9TXFaMv2ILOQCOKiwXsJS9Z+SUoqGpGck4Z4l6l4z9P3+I3fnf/6TM8fvocicmZyCj3oMzbj7LWPpQ0d6Gw3o9MAf+UnGLkl9dhblX3S3jePGcyoC4jgoARXX4xozLrbG19hzFR2Gfp1v3G8cX2pFYZULJvIhPDXbZG3kUvxd+FFPCl+GE5h4zl6evVtUTD4SeNYvx+AD/vviv2a+eXWDqW38KjUyyenGPx7BzLp2dYkd/HjfMz8XOBY6k33g1V/Gp0QeKUiHRcAvySB8bJY513vYk0jqVx055VFinl/Vz+zh3irGYUm6882IxvEsgP4DRJIF8An1B9/qRHPSPPme0TgVe9RJ6A6wA//RDgDcSLDOwfSjiK+wbqCdF6ubwB+D9KFqQrWW5Wfn5MUeK24lPn6Micp5EebGAZspykbybluvebH7uivUd+tYri5Ek3jl72YPtdNzYyerGaKffETwPYb5zGWf8GrpZO8VXqzrkFimHlsnVqxYA/pt8tu3Pr1n1uZtn+Xcv3KRNed8akAyk//mE740/bmzBhu3CYSDeG1Uua2U75A/gQw44En/Un4IfjiQ783zL7B/uq7FQ8zov73Ev6mR5Bx+6gs7Ntd3QI6OEZeef8JD4eEwLcIMoXZBm/3C4vR650IOjYS/VZ1lyufd+SfpZlT09vRMecnTKz/NxuA/e1B9uN8OgG/ocY3nPc8REm7zMsF5Yjz4kwqsLa5RlFdl4JEO5ytmf4o4Uh7LifT2dbNP5Ybm7gf4gheDDvd6Vr9umH7f97vzXOPBN0DVDZcdPOPYhmgN/4ox838H/L0G8IRJ16seO7D/ijnbt7/yEz/Bygsw3rhQM9yt2RHa9t525/HOgxbu4wTPOuGX662f7tMO4Z/h81D5nh/5YhlJv88hpge3G3C9YZrwFzLiYt+/wYvk8gzz3oNWytLuE99K4ZfruM7DR+dIb/W4bXBu8Fqp1a6UXLg9q/w5/92/qX008Cfv2brV9US7FsGD9XWbhXpNmG917eLzi7qe8JnD3l59+uBYQEtsTuQsCNW/qdmZlFcVEpUpJT8frVSzx/lois9GS0eWoE7gMK+PsE1jm739frEfhvwWh/M8YHZL+3BcFOj4B8p4D8Z3RPzKKlbxjZ5ZV4/SEZHySehoZS9HSLP1Fnrx8dg31o5rP4/l7kVtTgzYdUpGcmo7GuBMGORvT3eqU/0Yzc/DwUVtShsb0XFc0dyCysxvPUj4h/8UZg/ykePXmOhLfpSCtpQGlLj6gbBQL7/Mxguvh9k5GnXvQ3Masf12MPh7O+fKGsKRdlq8A/fO/8ZYzJolvfbSIjiDy6rVvGsVSDSSK9kkRDE/+ZmXR+NlKak7ixDYrk541Fa2SKmo+UcM0a79T8jPvKhfy2HRyja3UTLfPLqJ9ZRM3UPKqn51E3M4+G6Tk0Tc/COzOHntVVfJE+4Lq0b64Zu2BaIjOYY+QkFzpWhhmzpP85hjsO6Ss7c3wk5zWxh/2SAWw8a8ZRkhfnAvwnjwM45mz2UwF+0bGA+4kzWx9txj40a0+odfxEQL8jFY8T3gDy302qXJztXeLjCeqTgYl8waDeskw4GHAk5X4QF8BOgh9bSW1YjWvCSkIT1t/6sfaxW31h4XruEDiRSlRdLFOZRqZl/Bzz3cAf019fprPi3r8tu97dbYDH2s7u/CjAp4yddWynFbJXIhiE3WlnZlbsMKqDJ22RnWV2ygnU7CzY8OA2dGMnwXQoGccPAb90Jt3XAa+bhxrmk9cYl+saEKDC56w/g0WItY09c8n0T08jO0/8pB+f77bj4zlO3gP89M/ZVxt6rwRYOCNjL6018dkydm43pslOuL2k/yGG95yI+CQenidnpd2zmdEMO4FmUEe1Dyee+/LOt53fB/zRwhCC3e8XUC8xc4BBwc6PAL+c54PyLX5+BPj5aUG+RI4zr4wjIo2WVgG7yPjc7wRgexj7TuDnNUcA5jUWetbfudYZnxv4Nzb0W/pN+TNdk8dQXq39hwA/Qdg2HHi7F/id+w/FtmcbXvt3heHy5fuA3w4XCiP2vzLw8zrmvdUY1hUfETLAb8suD4blZxhPTsKPdfDa4uCLDuvM8Ls/y/cDS/rZrsx1Y9L+UeA37c4oWh5MOn8/Ec5/v9iu2R9g/bJMueWjRvxN4/3Zvj5Yf/b1zzZCKXv5Z4D/gkuoeUxAc7yfqk999uJD6nskJsbj2ZNE5GSnqRn+4YEODPbr5fz9Avd9PS0Y4Cy/aLRP7IJN6OxoRvdADwYmpxH8rN+8X1zXhOzCPOQX5cj1XKXeA9Dd40V7l/xeBjvFTz9KmtuRVlCM1+9T8TEnHY0Npehsb0C/+Ovq9KG8qgol1fWoavajrNGPTxWNSM0uwrM3qUh8/gJJr97g+fuPSCuqQV6NFzkC+h8KKpHMt/ln5eNZcgZepKSjf2xSde9DEBgqJgHUaykVkZ7t/2cZFoNdLka3jFNeXErPlSLOwyHKRjmyQPmfA0xm9p/G2aVP9gzMdvf6BnMnF5g8OsPQ3hF8q1uonl1C/tgUcka+IHtsGlmy/3F8Bp8mZpFPyXHR6CQqJqbQPL+IjvVNfDk+Ae9OXFPJeCU5/UftSHqSn0tJS2fHcVB51dLXhZNdWl3JHkcPeEh3+qPj4Q0uBzexm92N3adtAvbtuBQwPxUA3efS9CcCpM969XPwXBJPMBWF4NWSgl7HnTLAb6Q/gafd3KD8d5EpE1M+tkL+WH78kgCVJOVLEfpFRyKCP1dUnCUGpB7apez92BX4X0qox+K7Fhy1SH9oTe6PvEWyHqUidW1b7fYnmRjwx6SlfrC/Jd0O7M/yKXsTVrb6h99sdUf/Nrw79iF/juwwIb+26CYSUDF2nI0aHR1RHX52+KJBIjvg3eY5UlE04Ge409MzBWxnru25iJ1D93XgnuGnMTdfdQO2DIGJS1d9Pn192fEY0d79CULm3bjxU3A2ePEN4pFLW+X86Ff0rSX9hFO7E8bz7+u9e4Y/Wp0ot1A9Rp/hJ0yosowi+iWw2PExHXM+fHP+/PyCOk/6vQ86OQBk4rEVameWHTukbuAngOkXpVlhrTDNzZ5bbYbQyTJlmGjAzzZw3/lTXE4drj8n3VCZ2na3gZ/xE8zYNvkcPGfKKc5IcwWE3QYvL68U9IchSQ9SRJ/ht17aJ6Dm/izf5eUFtra2FaibdLkEnN9yt9sUDfPS3i6g7aTLNKPN8Ed8ls/JX2Q5hPPNMr8T+CUdim9ot41+9IX50GUZSseJ29hz3/2CRpaRyYM7f0yT1+Ut4A+9tC96GAX81kv72AZZVuusS0sRx1JObE+2CQE/8y9pUPwdtw3rLlrboxgf75u81pgvXgNsZ254/vJlSg8EWeUQ2ldbfV78nCXL2himrd4fEQH8D5zhd87pR2f4L6ROop0zxfjYhsyAnXqJpZNmZJ3pY5Of225/dUUH+O8T+4h6yzhZptzy/QksW953+LJJtnEa1p8BfGO4ryT/dHdXwEXAlvv0pdjM8b62toHKikq8evkCb9+8lP0i+X33YmSoE8ODAYF+v8irgL8v2IzB7iYM85n+rkYBfg/6hvoxODWNrvEvaOkdQlmTB7nFBSivLEagvRHdXS0IdDQL8LehvTeI5p5BZFfW40nyezx9/Qp5BdnweeslPo96jt/na0ZtQwNKq+rxqbQW6YWVSP1UincZn/Ay+QOSXrxE/LPnAvVpSM4uQnpBFdLyK/A6Iw9P32Ug8fV7/PbkFR4/eSFp9uL8kmfvdPVDRSTlwKXlnIpWJfI3NDwttyzDQ1MuofKxpIyzw5bDxfTE/jDCSwgWqBNAQT+tHB+8w1C8e21L+5w9OEbv+jZalzZQv7COqpkVFE8sCNQvIGd8HjkTi8j5soJsUc70KvLm1pE/v4GC2VXkTy2iYGIOhV9mUTI5g6aFZYzsH2Lp7BIHkqbqfTBhyRZfEaBXHWjg1y2eGQyL/8xZqDbBi4Fb7tJNXSvqANi5xmX7MvbSurGTKNAvkMnl+7tx7QLoAqPP+zS0C/Bz5t4GdgOyIaClmyPO6tuwv++I9ib8300sh4cAv1Fomb+z1F+/ULAT57J/KVt+NvHmSVDA34fdx01YjK/GSlY7LsZ39Ev9xPAOyEEqBf2qgToV/RNMDPhjCunupfq6/iM/vaf371ve/7PFdhnNjmJnk1t29E+tGSYadi44y6Q7rLeBnx0NPoPM2QheC0ad1j4/kcf0eL7mnNnptA07twRPzhASGvgssHsAgm52/u3y40vUCI12p54gQaDgCwXtjjJNtJf6GX0L+PmuATech561dcXllilr7oc757dn+FnuPB+7TN1SHW4Th7M14rHKj8RNQOLsM8GOAGY6j8awE0/YUHlzxeGO81sz/LZ/E4bxbm9HviGddc3zNu5u4Gc9su44KOU+b77Mzpy/nY69tcW80b8NNWxvbO9sG0zfiO2cdUGQtg3LzV46/9AZfveSfuaB58RZ21Ca3Eq8nO0+c0Ep26JpL/QbFfjvWdLvtnvIDD8fm7ENryOVhhOHidPemn133Oqzdo6bOwzT/NaS/mhh3DP8hFN+0UB9kULcjVS5OuIKnfs+y2fScs/w89qP1vZCx1KXevWPbme8P7rTmRUo/9aSfuaV9xD3/WtQrgED9LwHuYHfPMNvn4MdL6+RaMBv2pTKi+y7gX9iclKdm/t8jdge7HT+mTLQ/vvEATvz+2K25t7G9sTfPbsOec/lPcXcB7jV+xr4TZeXS6p5pyffXDm3ILapyckvKC0pQm52Fpoba9DX24GhwS4MD3EbwIAAf39PmwC/ntkfEuDnPgcGeof6EBwZQUNHEHnVDUjJ/oQ3H1JQUpYv7cKDoAP8Xb3t8Pd0obCuGa+z8vDbs1dIfP5U/BWgt8eP/m4fAu3Ncn4taJL2V1hehRTx9ywlC0lv0gTkU5H44jXikp7gPwnxiJPwnMl/m/EJqdkFeJueg5epmXgn26xPRSiprMXoxBROLwiqcs4iUz4sF3b+Cf1q/+9oeFrmxEMF4Mjatb3ZdpGGrvIb/1Xuy9eiG9nnM/1sSE5Ablia7AnwTrx2eY2Zw2OM7e6he2MbjXNLqPgyj+JJDfn5k4uiZRTPbqJ4bhtFczvIm97Cp+lN5M3KdmYLeTObsl0Xu1XRslLe9CKKp+dRPTMP/+IaJnePsX+l53CZCQI/uY5Gn4s5Iyejjg39UzwFZWTLlwpeSwQX4petRkXDn6KVC5x7ZrH1rh3rcR7sJfpxIKDJt/UfJooEQCkD/LYUvNpAayT2Bvr/ScB/J+g74uMSbtBX5ejM8p8mduNSdP64E5fi9zKuQ+TH5RM/tuLrMf+6ESe90uc40bXNdzrwcSa1MoUNwxrc+b2Gv3uxZ/j/gTL1GQb48HEYQu/39+39b7k9RDoM88w3b7Ozb2Zc6KZXG2hxn53S6ZnIT+DRcObc43xCjdDjBv7Z2bnQgICa7VGdSb1VHUKmE0pL58kN/IRIv98n8ei3lnO2jB3y8I+2BlP9bXoTZ7hMmC47R25QM7PX9jJbdpY4c8J0opXrfcBPcd+eiaMx8GDH4xbdCbYsQwUhlj3Lw92p+9Z3+O247bjcbjxWACTnqzqQs7NqRNw2HNSx83SXfBI+2gz/ffnhuRHkbMMy1uWvIc4N/NzvFbtQu4oid1p3iX55n3YDv56RD4OY7Z9lbw+MsB1y5tmkS7j7kZf2MQ8GuOx0uU//0WbI7fiiAb89EGHHF22fIHEX8Cu/Eg/zZ6dBwy8mqHN3Zo7teNX1KOJ14X45I+M2K1ncYZjmcLTP8rE9mfw4/o0Yhu3NfmmfAuM7XprJ8FQ0EI92zbpn+NWABcs2iqINcjEP7hcXuj8jqvLklIkJz3bjbit8fpuPCjFO+mP5ugcuCfxmQMCOz4j1bZcv2zTrl3k3frjvBv5x5zv87nO2ZafD8zHnxHz+IySwHvW5/O+ST91T7cFLitc002C74CNk7ll+3oPNNcqt2VfPrjszlpcCuFfXGngUqzm3M/52DQz0o7a2Ci2eBvR0t6O/r0PULvDvU5/l4/P1Az3yeyWgPyhbDgD0dPvR2dOJJn87sgpLEf/yLf6d+ARJL5+jqLRA2hX9+OS+3Y7u3g7UeprwIa8YLz5k45EA+28C7vkFOQr4+0Ttvia5Lwv4S3vMK61A0qtU/OfpGzVj/6+EZ/h3XKIAfxKev36F1IwsZBeUory2CU2+DrS2d6Et0I1g/zCm5haxvbuPo9NzOefI3zVjCHc31iDJ386oShYpqrVEe1sPMSwjBUtSXiwzB/ZpzSh5N2Hvh8/lr51d4PPuAdoXV1H3ZQ6VEzMC+rMonZpDkcB6wdQS8iaXkP9lWbSCUoH9srldlM7uovjLFgpFxTM7KJzaRuH0FgoE+gs42y/Km1sTraBgdgnFkxLn6CSapxYxsXuiZvp5qqo6bckf/U+vb1FWylaLy//1vlxD15fSXvjoAoFfz/SrSM/FffYYh1WfsfK6DZtPfTh92aOW8h8IdKrv8wuEEvjt5/Op0Ky/iIAbWuYfpwH3SKQGDAT2uaSf/s0M999N34J95U8gP+RfAb4l2sv2jF8PkHI/lzAX4v8ivl2AP4DdJx6spnlxNix9fqkzXXVfRcR9qcsQ8JtW8PtMDPj/oQrVp7N1S9uLXwWT2r/ZN25hf3+s2B7ZaeQL8aItgbbFzsXnz7efOeaMAL+ZTj/RgT/8xnUziMCtOmdTbjx3B9K5z06nbdgp5bVkx0G5O6IcfDBuKg0rPQ5KTE9FDlgQ1tmRtmGa8M/0zeCHnR47zN8Cfpahe2CBy4ZtP24xDMvu4GBfpc9y5iMKxo35cQM/VxK44/mWGE+0N7wb0Z6y3wpPY88k3yd2TL8H+A3I2PDMuubsvWkz3EYDftoZP79HzNt9wB8tDGXnh8Z+YSTzFX1J/8OB3/gzoh0HomzDzrlxZ3z3Ab8d1136FvBThGMbqGnsa/wu8VObdtugGRkduTNvjI/n6wZ+tqe70qL99wC/0e8Bftv9W2L9uwdteK253z/iFt8NsrikXzpmjH6kI1y33HJw1TZ8xvu+Nsx2b197vMfQzj5v7t8Cfmm37rK5T2agwfxG/iP0s4Dfp4GfcdplyPJnm6Eb78/2C/xYp+Y+wK3Z58vW2NnV4M+lzoI+lOybvi/Dbm9voacnKOk3ozuogb+vVwN/b7fAvkD7QI/sd8q9uatFgF8gXSDe39GOkqoaPEt+j//7LQ7/+5/fkPjsCcorSiQevxoUUP4CrcgvLcG7LH5iLxuPn7/E//37/6nP8DXUV6Iz0IKOdv7utaNXfq8qauuRnJGD1Ox8ZBWUIbe4HEXllaiuq0Ob34d++b34MjuP9a1dHAtknl9cKl3I/YbnScO/RtHMXfa/gvlpebML4S59y9APbxnh24ba5a/hzuWVerv+3Mkpxg6O0LawjIrxLyganUCxwH7J9IIA/CIKZxdRLLBePLuKopkVFE2toHByGSVf1lE6uY6yyQ2UTWyg5DOPN1D6ZRPlM1som91G6fyWhN0Q8F9F/uwyCiV8yfQyisZnUDY2jebZFYzuHGH7iqCu80a2M+fGXf7iUqFTcM5dn5rAvfy9lL/EfQ4OqDUxChCVBzWicT15gL3yMay99mNPAPOYb+ZXsKo/Y0ew57P8CvYF4JUUxGuItYE/9Mk+B/yp0Gz231XOed4p8WPg3g7HpfxHcR1a3Bc7DrDQ35mU7WliO/YTpQ/+vAUH5UO4npe+gDQEDfyUA/yU3TB+p+HvZgz4/6FS8G6BYjR4f6idrZ85CMC2yPZpZrfZMWZHjm7sSNDdVrTOKg3DtKhOpUCrdJzdwH/Xp6HUuRDK7WNHbuAnKKjlsZIP+lN+ZX/a1QFnJ5ifL3LHx33OChJ2bVDjEll2uG1I4vVqd5LteKiHAD9hwTaMf2hIQwfd7fhM2TJeu/PNxwpM2f9e4Gcc7BgSUHjOBvrd9WLs3DPu0eAnmjgb9S3g5z7FcybouGGCoMy6NmGYn18J+OnffZ40zE8oz7L9vTP8xp8R7biU2jasJ+PO+P4M4Gdbp51tWB/qZW9R6oNpU+7ZZ7ZDN1zaYlx/N+BnHnjt2dcyzZTUmykn2z+PGcbd/mm4OsluT9znoK1teG9j/Uc7d9q572XGv50P7v9e4Kfs38d/hH4G8PMt/VJ2buBn2bO+ac965G8BV4rY14oxvB8oEV2kg6uW9atjbQj9V1ca+Hkv4rPsV1eXWFyYE+jvQm8PYT8gwM7Zfb+age/tlv3ONnT5mxEMeNDT5ZNr2Yv6xgakZWfjP0lP8b+P4vA//+9feBwfh7LyEomrA12dXnR28HprRUl5Gd6lf8TbzFykZGbjTfI7vP+QgqqKUnRLfOMjA3INjmJa+g+DY+PoHhzB6NQc5te2sCUweXp+gYvLC1xKXtUz2tY5uY2x59a6Pf5lzDez/C0P4q7OXR9pYyyMDPu4FcXQmr9+fDv+sTSc7ctrzB2eon91E20z82icnkOtqGxyRmB9DuVzyyibF6gX4M+fWhDgX9bAP72kYL10ZhUlAv1lU2somVxF2Zc1VEwR/Kk1lMt++fSG+F3TgwMSrmBmCUWMY0bi+iLxC/iXTi0K+E+jVtLsW9/B+tml+qqe6VWx7rkfAfw8GUfcXKpl/PyEJa8V7fvrV56tjkV55a50kS5Gd7HxqR8riS3Yi/fjPEl/p159l94BVEL7YWIY/PkGfi5PJ9Qa6Ddv8A+BP4GXcuL4W8qc431y/IYA3xHLTw8GyG+96CSpV9kdxbVLGfuxkdiMzQ8BXAZXpYMulSWVbQM/65YDOZGN/veZGPD/g6Xq1IJZW8Yu2oBANP9/lJjPzc3Ib0LTcFaIHUyCBzt/FAGMy7rdnU522vlsKV8KpoC//Tbwqzf5S+eEbd8otKTf3petKRM38PPFaB0d/Na39qP9taIrGLm0mvt8SZY+P+PP3rbe6tjbhhBnlq+7wxrdCfyWv2izoCy7gcEB3UmT8uAjEiwXhnWXLc+DnXdTbhr4w8/v6vOMsqTfKlcj5odp2MDFemP8BqyZDkW/fHbdDbPfAiajqM/wOy9ZM0t6ef68LzJON0jQP8vX5IVi2GjAr7584JTPfTLx3CX6iQb8LAe+DduUjRHz737bPPNtgzofOXE/w/8Q4DfvAuDz5naa9BttcIRtz47PDfxcWcK2qMs/evlQJg6e27eAn/sse3cb4XVF2GZbs/PN8+Hvn32eNIxXXTdOvG4x7K8O/BxQcZflXTJxcJ8vCbQN88j0WFbMpyk/rnhiWbsfhWD77xF7O16G43nagwlsC+YdKna8LHf34CcN695dJ0zD3e54bTA+c253ycTBOP9x+knArycPtExZmnrhvilrroqy68m+D2ijgdgWDb0Zr2pgwDk4PzuRa1Rge7BH7j0+ub9x5Z1AvijIbUCuNYH3fg4CdLejtaUJ+YUFePn2LR4/eYonL1/j+es3eJeagrqGWvmNG8KoQPzIcB8mJ0bRx6/gBLrgDfYKzA9hcGRE2tUIZqcnsbm+jJOjffmdOsW5XBun0qb5/P35tXr69pvGnNvfxdx3PnRTL8mz6tuuR9lRj3Fc3PDrDJy9VgirBkmur7gn/uiV37I3DGRxkImGVgx7LhZ7Ug/LJ9eY2T/D+I7ck9e24ZlZRPXkNCqn5lAxPS9wLhK7EoH90vlVlM6tCpwT8gnpcjy7IhC/jHIB9nKxLxf7smmBfaOZNaVSgXwlhuHAAAcI1CCBQP4sQZ/+1yWtNRRLnEWSJpf4V03OoHNpTfJ5hjM5EbYbvoDffEDArHBR56nOWZ8oZ38JhGHgF/FlAGqf7nK/phULY/8GZ8ENbLzvwEZ8i8Bnh1pifvIooMD9Monf5w/iUCD1kJDPN/mLzDPphFnCvQ38t8DfAPI/UTx/JV1eqsyUpGzE/ZRlnSBlmtCDs7hOnMYFsJ/oxcarNhxVjePr0ikJX1Uda49Vph7PUO3BDf2/z8SA/x8uXa9258m9b2TsbLe79u9zM/sPE/NIYIhm2DnnzD9nsCjO/BBq3IYdXkKC7nSw4xy5pJ9mVyBmdm4Oc/PzalZKbee4nVPHFFcOcJaC8TBv7rf0Ey7sWV9zvv722x11wpjy5wJ1hmEnle72j6NtCBTmJWfhdERWXN+a4acYnhDvLjOeB8uH9wMCN+PisXtmJuIlcCIN/JEdeXbOTfndJQIgz5kv3XN/s5lxsINIf3wUguK9yj37aJYch8vELaeMZJ/gZIMg0+DME9MgeCwuLMrxioLhaO1JAypf+GXKU9eZG/iZBuPl6hHTrtxiehMTk2oQIjKvkfnmebmBn3lj/ASbz58nFIxRLKO1tfVbeWcb0G/D13HfP8Ov88DzcgM/64htg/Y63Qk5h89q0Mx+z4QxGkqdNCW+6enItk3wJVizjIxYNqEykzLiZ+EC7frauh/4Tdnp3zCWr9uwjpYkPONk++b7IHj9u8uL+eL1ruO16yO8T7eHAb8Jp8N8G/h1vdthvw38Oowb+Flf0crV2BlxUFTHo+8NhHgOutmG9cZ2xLo294YVaYPR/KnrOpQ3nT+2A9Yf79e2oX8OGPC+x+tBxbuycus6ZzsMP0oTLiPG6wZ+3vfta899vqptidSqLInD/Cb+o/STgF8rSvyOWL68r7CsWebmPsl6t+8FDzcmzFecHB/KfXBJrvVp0ZTEL5qdxMLsF8xPT2BR9leX5rC6Ir81M5MC8X1o45dDRMG+fvQNDWJgeAALi3M4OtzD0cGu0tnpsVzLhziQ6/Tw5BQnZ+e4uLzCFSXt8uuVtE1X3nlE8U5ipM2PnOPfx6hycZeVqvvQgfy/UTPX54I6ZzcXAv6XahCAqyK0HxFJmD9F3BdxwzLmrznvFCdqJv8GU/un6F3fg39xC63z62ieW0cNZ+onZlAkkF3G2fwFAfO5FRG3AvqzshWVzgq4z64LqK+hQgC/UqC9IiQBfkr50/5LxJ+JgwMEVBkHCpScwQLxUz63ieKZDRRJXkoW1lE8t6TyUjM1h+DKOuYOpZ1J/nkeofbDE7RPVB3rDWEwAgjVlL72pAYOGIyHbKarUq6tS9hO7cRmXAuOONMv8HnxuFO2QfUWeQXufL5fxBl/DgLYy/W5lJ/P8bu/1x8D/vvF8jmVMmb5XXDlRCJn9z3Y/dSP6+E9gF0mdh9YV2JMVRP4taxBnd9pYsD/D9ddy9Vv24XbwJ+trq7Oe2e87zPsWHCWiB1EngvbNjvObuB/iGFn08waMV93Ab9Z0h86BzkmhNmGYOT2p/YJ7WJP0OBSwGiGsKMfTwiHseN5yDP8yp+kwy0HMqKB7X2GHXH3W/0J3O4O+kMMwzA888d7kHuW9VuGHQfChYnjW3ID//cYwj4HNtxpsSyjzUY+xLAt8B58X/7pxnTdUPNQQ6AkKNlpcN8dHwFSXSuOH54X7b63Toxhu+OgkEmX8d03mHWXIRwTks31Gw346WbybdLi9Ujw+15DgCXI31cnFNO4C/jd+bHDuAe3DPDfFYZiOUYDfnce3cD/UMPBETsu5iXaSppvGdYtoY5gb+fLjpf3jh+5V7DeWf/uc+bxj14brKtv1fPfVn8S8FOsd4oDSXwppLmn8Lfne+8H2r/uGn8VSLy+vpB2eqZ0eXkqbesElxenuDw7xoWA+9Xlmfi5FHc+O3+G49MTHJ+d4lzaNp+hP784x/WNfY/7Rn5U8vzN1P50TjSLGkW66r1/slGlIPWm3sUgR6ZUjAg1lzdcISF1+JXvndfPpnMggG3FvMOBYvny7sE76J4U9Nr5DWYPzzC6fYDg6jY8AvnV06so5zL6L0tqZr5UQL1E4Juz+OVLGyhb3BDoFlifdyQgXmqkgH9dg7pAvRYBfhVlEqb0ASqTdMLaELtNFBH4Jd5SAf6yBfqT/E3PoXpqFm0LS5jYPVQrE3jHZZcs1MTCjUmMtmAJ2qWoS5UedZkpNx4yMr6hcPECZw0zWH/Vhm2B/tMEwr7oUQcu44O4SujG2eNOHP7WjuPHHTh3vifP5/ntF/lRCmIdRYPcv4Wcc+V52zL2IbnC2WVjxIGREz67/6QDO0lebL7z48K3KB0kackckGGDDtWvNqxB/cZ+XbOuRvBD5ruBP6aY/ljdnqFle+Rn8diJ/B7wICTopfzhOLn/o8DPjq/9Jvhvz/Br0T87OTYUXMl+v/U8tVu0jzbIwc7RgIABBwXoz4C+DfyUG/gZV7TrmOnQfnJy4sEdcIKKgRM7HgKpfY4PNYRkhjfxETIeCs4sDwMXdn7u048AP/PDQQWzosEdJ+v4R4GfoHJXvEZ04336R6CGeWK7dcfP42jAr2f4tR+e148C/7bAvr0ixsT3I8BPiDaz7axrN/Dz94tuJh0jps2y5YDAQ9NkWu72fZeY5o8s6b8L+O8KQ7HdupfNs27c+fxR4OdsuDsuHnOgyF6NcJ+hP16/3+ozmHgfer2w7jjjf9d1Qrtoq0seYtxt9J8l/Vm93yfWtVG0NMLivYVlzdVBXJVFw7pVIPgdg868lPkc/81XvfDVsXWkoUftk5gsMH+QUfcJI/03ImeRzsoYPxRzY1LUXlye/8GG4GK+wOAuL+UmwH99cyF7V6pur2+u1Jvnr6Rt8Bebd1muJVLL9Y/PMLl3hH41k7+JJgH6+ullAX0Bcy6rF7CmigXai7lPkJ8nbBP2N9W2dD4sQnmkBMqVCO+codcqmw/vRxPdTRgjpltM4J/dQPGMHlAolzxUcOBhngMRcyifmIZnZgGTO4c4vNboziX5N5dyfThfqtDiX3FlO1WSQ2VDF+1DjRYoySELmJKfm5svhzgqH1XLyXcTfTgTYL2M78ZVYreCfn467lRgn0vPzwX2DfCG3uDPGWrHzoZbN/T+LeScp1sRsE+5wtmgfxov5Smgf/akGydPu7CV2CZl78VR1QQw6yzlZ/WwyvRuqD65YZvnHS4G/DH9I2TenGw6ZOycsWPKzh0BleBGGKG4z44z3Qhn7CC7O3I8JjCwvdMvZ/IeIqbFDnp4OWkbAh2BCD/s6EfrkPKYAwFmWTz9sqPL6+2uDj6fc/888TkifubB/sSZ0q1HArTYoaJ/E44zKqHr+I4wBHbCM8+D+TRla8qV9lwNEG1Qg8e8j7ATZ9J9iOiX0Gni45ZiObJ8eL70xzzYYvmxPAlJJpydn/vE+mdduvNixLgJLkybkMGyNOd8VzqsRw7qmHYZLd5oYrlyefNDgN/MVn+r3Zr8M16WIeslWty0c8fHgQE38NOO5fWt8+Lb+Hn+fMyAEMz25k6X8XG1C/MYLY5oYv44YMUVJAzPeNlO7XyzXd55LTl54CMXzBvPxbQj0755boRp5s3cN6KVmVtMk4OKvDYYh8nrfRBJe7qzfTEMxfAcMLovTbZbtnm7HgjX7jBcam/7eYjon20lWvq0Y9vjICKvVZ6jbVh+LFe2k+8pOxMv7+fmvmHqxYjthG3UrE65K17a09/3njfjv/9RoL+7ogH89+phwG/uB7xmWOa8hllfNN8P/PTP3/1LtWVnmDP9WhKPkYIewSDxTza6FlC8EYikP92BdvzZhn1q5Vm7qbSc8NrNkmO468QWknY2LuEjvffPM6YkrqQgrdIPQY1+Ut/8E8CXOrqQ8ufdhn44Sc232s8eHmNwfQeBhXW0zK4K5K+g4ssSSicX9bPyAvIlAuwl84T6LYHtTQ38olIH5ksFussEvssF9G2V3ZL4c1TuqGJuHZWOqowkbm6NPf3ZYdUgg+SlbJ5v8Zd9Sb9C8lG1uCXQz3wK9E8J9H+eRvv8CpaP5LdEzpdN85ovq5StKS+Wjtpjg3QalClbbpXhMogrKWUGpLvE8ZVvBjyQuMb3sF80iLXnAv0JfHM/Px8nsC+AehHHAYCgEqGfAEvIJezz2/s29BN2Y8AvssJEwj7FdyB04lhgf/tZO+afNmPjU5/UwQH4QkU1oCPVxfbNa0IZpxK5oZu5Llw1/EMmBvwx/WK6r+OlO5JG7Cyyk0y4GBkZUR1vvdza7nDeHZ8d1/coehy332x/W5HxEOptd3uWnvtqsMPyb/YjwjjwHjWsKz3jfhfwU8YfgYQwzbJluT60U2yn9z2KFhfFziHrmbDGTj/zRLCONpjzPXKn/y1FiyOaooV9iKLFFU3Rwn5L0eIxeohft5+HKlpcVDS/D9G34nG7RxP9EZw5w872ZNo329j3xOOWCfs9cfyRYdz+HqJo8diiH16PXL3AwR1jCG0sS/YTOFhkDxg9RCZ93rtZFz96nZt4vlfR4vrnKBrAf68eBvwUrz2K5c57OlcBEahpNJQ/tENLv4RxIz0AQCngZ8eYcZk+shMtrfSAQHiQQO+7DGH/UrrhnFkVeFLAz2B2fE6cxvCQzhKr+mfbGM/G9m9pvnFyLAXCy6XsmXUZFGGHy5a5iJ/7+hjqE3rCp9g4u8Di0Qm+7B9hYGsXvnmB/KkFVItqBPhrBJorFzYFpgXkBaoJ+gR+gn257FeI9PJ8wviGUvnMGioI6RKm0lGFSEE/Z/4dcZ+iPd3pr0rCV4tqJLxRrbOtFpinO2XiU2IcKp87kqZA/owcK+jfFDcC/5p67r9qdhnNosGNPWyeXakvDLDcTJmwvHTbElvVmGVX2YWljHrugW1bt70bgf/rC4mFEUmhXgxsYv1jH1aS/FiP82M7rl3B6yVn+uOCuHhM+Ofb/DXkGuAPQb8DuwZsbej920jOzw37ttzAHwn6Wrr8OrGV6MPCk2Yspwdw0rEM7Eq9sDqknviCSQ57RtyFIurV3E90Xf4e893A77aP6e8n/nAbgAyDJN3CWxswjaLZ/dGyO25G0fz9qO47p9tlJPssI1WOZv+2XYSbCeNsQ/Zq65T5HfFp+0i3yDD2vm33MJlzCp9bdH9/tNz5+G/mJaa/h2Jt6veJs7O24UoJvt9CvSRPZJ61jxb2LsXq5L8gAfaoz+V/j77jGX7CPtsFv/DB+mWfk6uRvmd2n0YPDLg7v+wWm06xKJoXZWhJfxS72VE60mqGVBQ1vBjaO1JZCR3qF2zpfNjSnpwgES5/C2NOzC3HcJdvnFfL8+WIpW5Knlsu4j8RN35od0vgdOnkHLNHZ/gskN+9soHW6QU0fJlD3dQ86udWBbj5Mr0lgfc1DesCzhUC+xWLOwLYshXIr3JUTRlIF781tCecq2PHnXYiDhxUWOJxpcB6FSXuDF/NOBjWaF5gX0kf050DCVoSt8TBfQ4wVEo+qyV/VbOSx1mBfa4ycMSVA4ynXs6tZU6gf3MX6wLpHFrl4AehULckXWoaAi1jGhSt1VZfD3wXwvVXDoaJpaoI2Wxd47h1BRsfBrCQ6MdKnFfB/HlSD84edeDst4B6pv8iIajeOh8N+Am0XBUQenHf300O2N+l+4CfZWJ0nNiJ9YRWLL1sxWHDFLB8ritT6oJt/1z+Xop41wgZ7oYOzYGp3B83MeCP6bulwNKM6Kv9v5KcfN/p9j32VPQyiimmmGL6O4r3Pc7G3/fMPDuXnMGl32hxxPSL6E8EftMWzAw/V4Jw5RhfFsnHK0ImorMbzdidX4EaC/6Vi4Cjghs1yyl23HWkjdirmf0rLfHEAasb8R+Kin6NrPjVxpZjwlYa9m8Dv3Z324bDaf1ljX1yUU7ItqIXNYMvFXMmlXIiZb99eoSF/T1MH52if/MAbbMraJpeQuPsEupml1ElcF8h4lvvKxbWRALPAsdVhGlRjUB03cIO6uZ3UDOtZ9zrBLK5VfsC4rWUc1wr4F0rMF4rfgj93Oc2PACgwV2FETEuPVgg9moAgGmLFsOq5FbcaignLNOtl7TqBOhrZsRd0lYrAAj989sC+VuonNlC9ey2iNs1ycsaamYX5dzn0bu5haWLCzUQwpaqV4/o9kVYNMWtduhBN2dlSdS/cv5JCxcrysFKAc6v81c4a17H6vsBzD/xY/NJB46SguoZ/guB/pt4AX5+r1+An4BP0FewLyLoEmb50j++tf/vDvw8f/PiQs7Yh4Bf+e2MgH0t2knZyP5hQkDKthUHeUP4On4I8HU4vP1IRXAA7JJfo1B1w3+W4YGR+qNr//eYGPDH9FNl2skfo19h+aXOQ7RzjymmmGL6J4j3QD4WwfcQRDOEML4PIXav/MX1M4CfigB+sx85CEDQ5wC5nunXX1poadFfbNje3lHP198yt/q3pgesZS/pN0Yv75e4CPyyUcAvu2EvPHADv0DRlcTDLNBfaCtpSFz6MQBtp3YdGeM4idgp1wpHEjZhf26XP9K4U3XrdxpGYU7XltibFMigHNI5k4NjqYjti0ssHR1jbv8A0zs7GFpahO/LNFqmBXRnVlE7vSJgvirgvCaALQC8vIHKJS7bF9hflP1lAf1lAWTZEsAJ7E1LO/AI9DcKWDfMraNewtXOSVyE7oVN1Isfgnu9HDcubqFBpKGf9luOtJ86gfk6SSssHq+jVuwV8EseKEJ+5ZIWob9GhdPpNyptyP4mGiTuhgWmpwcLKiVstaRP8Cfo187uoG5uWw8SyHnWLW0o6K+fmUH3+jpWzs9xKiVpfbtAMN4MAjh/jIUzEqDegSAW+hEKIiVnkRlSKoH+T6Rupi9wUDuLheQAlp54sZsUAL8dz+X8F3HdAvNBAVdCP1/gp1/iZ0DXzGAbyI2A5b+D5DwN7IcAX2DfSEO9XuXATxTys3s8VgMCiY6/+AD2En3YTO3AWccqsC1l7yzVYD1c3PDllE6FsV5sw0MjZX4v7seAP6aYYooppphi+gFxeTZfEshnsfkyRL4Ej+JL+Piyy1if4RfXzwJ+xmNm+nkc2jppyLGCfQF8bgn8VGsL24cPoyNj0mY4jynG6tUS3A3Mc2uDfdjc0Q2m9R1O2oGdbN3RvhW3CausjN8o7o4xh5Tx6Zb+a9I00i4hExkg8ti2/6axA9jpES5shfMQ9hk5XKFcWTbmIGTpbO2oKLMv5lLczyTs0c1XrJ5eY3rvDGM7R+jb2EW7AHnL7BJa55bVtmFqAfVTywK5q2pmvE4gvZaz9wT6RQ32hOUageUagWLCfhVBW4CcS+EbxL1JgLpxbk1gXuB8UWB/UWBdwprZecZZJyDeIHYNSwLYhPAF2c7vCGxvC6xzMEC0xHBLkvaipLUsaa6IvzUH+PWqAg38WtWSH+aznvmYXVNfDGieXZX8bKJxYUfS29aDDpLnmuU1lC8sS/g1VEveudqgcWlP8i/QL3lhfnm+TKtOyqZJwL9rZRkzR/s4FDg0z/LzvQfke4WBHH3igBkfQ3Fe+U57Dg7ocQB7fp+Ojr9TOZo6wG7lCBZet2JdoP+AwPpYYP5xt0Bsj0Bsj4B9D84TenCRQDsBX87sJ/UI1OoVAOHZ7r+RHNAn8PPYzNqfJHQoncZ34ELsb6RsLh9JeT0i4PPxh04cPOnEEVdMxLVh95UfJy0zuFk70yNerDzHqHeDqDoxsozLyuX6QyYG/DHFFFNMMcUU0w+J/QI9a+tTS/3tL05E8x/TL6SfBvwiryOzr7YG/P1oaw3vUz5fu9p6mlvREejEogCW+QIEl9i7IdwcR4D5n2JMz9tWpLFdyLq2wvxrjmzRzorTjojGPrbtv2nsAHZOzDSwNRUsInTwL6FQKxxKxaKWSJgDR85GOdEj90UKMqWOjgU+Vw8v8GXrEGOb++hZ2YV/cQsthGDOlgvYVwrgVwsY1xLqxU7NvovMbHwd7Qnpsk+Y5nGdAHbtEiGbM+USx8KqQPiquAnoE/bnVlEvMF2zKFAt9rWSZp0Ad8PSjoA1Z9NXUTO7ouNRwE/Q3pM0BMwl3Waxb15eFf+LEnYe1SsC/gL9dZJWPSFc8lM7vyWAv6Xgn6qReOslnSbZb5E8tkk+WkWNXM4/zwEF2S6uo2FF0lxZkXwvqkEEvouAjxg0cNCBjxnwfCV9NUDB8+bx9BLqp2bQsbyI2aMDnEjZsn70N9qvpaxlT6RWrfCLFVzdYtePJW1Nd6mlawlH/ycSz9gmtgp6sfzci63EgEBuN04c4L9I6MN5XLcoiKtEgX8B/mMFt0EBWgFiDgD8bYFfzlHEmfszgfkzgfxTwn5CQO1fxnXi5nEQ14/4SUMpi0cd2Bf33WcBbCa2YvdJK86KhoDZA/0cCy8WMbyHqVVIIeNU2B9sYsAfU0wxxRRTTDH9bsX6CH8x/Uzg/4Z83nb4fQG1bW2VtsIBgFYBfk+r2u/vH8Dm5pZa2s9PMhoTDfr/PMO0jGxsipR9ZHwRyoxMqLAvIxoN3MYuMrZI6bl3muju0WVyRNnAr+006nOxt17wTWA3vhmahkWu33Ggc2di4hvG+UI56kS0dXGJ+f1DTO3sYXRjF10C4d7pZbRytptgP7MsYCtwzll3AVvO2HN2vJoAL34JuIRuNRseEpfkiz23HBQgdHP5vAB/9fIaqpYE+AXG6+ZXBbC1msSPWtLP5ficQRegblZALvHMLqN+TiB6QaBfLdeXeOcE2AXiCejNYqe0QOgXIGfcogaxa1LL9PUS/XoB/joOGHDgQM5H5V3SbZI8epR4zBn7XeWvfn5Fwsj5LyyhWvbVgMOshJveQgOX889wpYKktSRblgsHOFgWHAThioHpeXTNL2N2awe7/Kyw1IeC/q9cFk7gv5L/YiPSn5SUCrllaMkWKWFuLqQipRZ5uH+N8wGB/twBrD5vx26iwG1CDy7je3EV14szgdnjx7TrVjoi8D/qwiklbn/bJf0c1FCPM4SB/yw+IOcrwK9m+cU+jkv69ZcNzh93SJgAdhLasJrYjN3MIG76NoEDFrI2BvbNoOafab4b+GOKKaaYYooppphi+qvL/rzeHysD/dy2tHBVCPuW/OyiFy2EfvEzPv5ZLe1nZ5jGdI5t82d3kjUkUTYGR8o+Mr4oA/vRQ2kZN439NnzzmWsjATSRXqB9X2zRZHJwt8JpmhyEQ9OoWOQPz4fiZCVnmg++XmP98gKT+3sY2dtD78YWfPOLaJtdQAtfPCeQ2ji9KBC8JvDLJfEEWoHxFQFdEZ/Nr1nlrDeX4Iu9QHCDQH4jAVkAvZ5L7+VY24mbuBP+Ccs1Swwn22UJK5BcL7DcJLDvmVtDi2xbBc5bBc5bZjfQKjDtmVmGR/LSNr8E7+IyWheX4BH4bhbwb2YYAXQVZnYNXpFf0vFKOoT3Fsl/q8TZNruq3Nroj/YC5h7JY9MSVwaso1nlYVnik7Q4aLC4jealPbQsb4l/sZuV8phdEj8S38K25G1XtAfvwq4aIGicE7eFRTnfJdTNraBR7FoWdiRtCT+1At/nWfRMTGFubQ3HAvaqLr5KC3GeA1ez9hwsU8suxCrCqFp0pGvyqwD/10s5ZoXu3eC8exPrGd1YjW/DaVI3rhN7cc3l/AK9x5zZ58x/Yo/sB3H+qBs3cb24FPe/JfAr6fcX6Gf4zYv49JZ2x4kUVzp0quf4bxKkXOLbsZvgwc77Dpx6F/B10xlUcYwaNItyX/szTAz4Y4oppphiiimmmP5xig7nf4RaW5xZfQF+bg3w85hunOnv6OjE7OwcLi74ZivdOf7vG+bhftn/wtBsK4xa94t+o/3TwE+FfUfPy/fJnao5i0jDYzILU2fNHN9cY+3kCDN7WxjcFJiem0PD/IIjAX2B6KbFNQFWLoNfRaNAftOyQLtAfr1Afr1AOlVHrQisr+rl7o0CzoT9JoF9vlSPahSgppoEvilCP4GfAwd1EoZiXA2SDmfmfQtr6JF4xtb2MLFxgM8b+7K/i2FJe2RlHZ83NzC+tYFRyffw1jqG5HhoYwvDmzsY3djD6NoOxla2MbG+j3HRyOqO0qiEH5O0xiX/47IdW90Sv9sY3pC4Nynxt7kt2sKIxDe6LvvrexiWOEY39yRNHm9geI3uks76IYZXDzGydijpHki4HZWfQVH/5ib6N3YwIPbDG0cSTvzIOYzLeU4sLGF5axMnAvesPf69FOBXz4M7A2WqwtS141a43bDOOVCgZpr5sgVC/+Y1TtoWsPGuA1sJXgFZfp6vB1dP+nGW1KuW+ivoj+/G5eMefCXwq+f83aD895B5YaGCe/USPvOyPg38R4T9pz04iO/AyWOWlfiJa8PBKx8u674Ay2e6XE3x32H+rPtcDPhjiimmmGKKKaaY/nGKDud/hBTwy5bP7vu9AQX65nl+5Ycz/S2t6O7uxtraWmiWn8bMiv13jOmtR5OB7zDa24r8Z/s2c6xu2c/RR48pMpa7FC2v0RSZX436VKShDfPH7+Vz+f7O1Tm+7Kyja3YSnukJAfFFAfY1NCwLvIsaBIobBfAblgjo6wLyGtS55VJ7DgLUc5n8kmyXViTsKpoEojlT3qSAf1u9SZ8i/GsR+gX+GQdh31kp0LAqUsC/pp6f7xI/EwLiywLuy6sbWFheVVqUNrW8vi7bFcyuzGNmZRaza7LdWMTU2iKmV1cwL+4LK+uYk/wtSnxLkta85GtOzm1heRmLSwtYWqQWZX9ZxTsv5zu7LHGuLmOOcUj8TGNxbRVLqxKHhF2U7by4zQhnzYvfxdV1zC6uYVrSmJE4psV+RvI0t7kg+VnA1LrYrW9ianUbX6RMpuRcmcb8yrLEsyT5WcDq9gb2T49xceO0CtleXUktmepT14vTHrivjo0jbflPvw9ATTZzh5W7dIGTpjmsvPJi/VEzjvis+tN+0QBOBP6P1Jv7u3HxWKBfPbuun3GPBsx/dRH4KQ38YkfRjbAvOhTgP0wS9yRxj2vH/n882E304LRgEBjf4zMvugac+9dd97BfFvjd9jHFFFNMMcUUU0wx/cUkoK3A+09Qm1dgn8/x+wNo93co8Cfoh/yIu8fToqQ/1bcd6ggT/v8bS2C1MaAUTQ5QWYoEaC0DV/ShAOs75E4xvBfNt5EdgrrLuONx+ZddUwd05Qw/P6/HpfyLx/voX51H2+yUgPiSQLszSy8Q3rgisC5qWhYtObC+sAmP7LfIPpe/ewRiWyRMkwB/4+Ky+F0TO7pxGfy22Gtxv1nC0U25c6WAA/0NTGuV6WyoOP3L2+jnbP6XefR0BuHzNKOloR4tjfXwt7Yg4BOWEbtWT6O0uWa0B1rgF3m8jWhubZQ26UWHz48Ovkiy0YN2j2aeVm8LWtua4G2ReJrr4Pc0iJokfmGlNn0ttbZ60CJxNIufZo+kKX58LY3oaG1Ce0sTWpsb0SIKSD46WoWnGpvR1uyB3ytx+JoljgZ4/XVo9UlYv8Tll+tBrguPRzOZT/z4fBKPvwkNrfVoDbSif3QQm7s7uJY64ip+tZJf/WGdqQNHxi5sCKEmDNukevEiK/hUjmdPsFc1jtVXPmwktKo3z1886cN5Qi9O4wT2E/pEPbIvQBzHGe8wJP+dZIBfv8AvLPVdfs7uq/1OnD/txmGCH+uPG7CX1ombID/Bd6XKlBP8qnxFNLyeeC+juG/0Z5gY8McUU0wxxRRTTDH90/QnAr+Rgnyvfp5fz+w7qwD4Ij+BJwI/+5qfP3/G0ZH+VJ/pJP9ZHeNIwzTdIh3dJXbvI0XU5+y58REtRurHjAlt58FO5T7jDnd3GNrybLikX5gQu9eXmD7cQffqErwOrDcJiKvP2qkX2BHCt9C6tINWgXg+s+5b3hUo34FX/LYtb8ErsO6RsM2Lq7JdFxHst9Ei4pYDBEYtRitbCvobHOBvXt2UcJvitoEuLp/fOkSgdxCFuTnISH6DjBRR6jukpyQj5c1rvEx6gvev3yAvKxPFn7KRl5OO5OQXeP4iCcninvPhPQpT36MoJQVZb9/izZvneP72CZ6/TsKLF/F4+SwOr6jnT/Di2Qu8ef0WqSmpSElNxtuUV3j59imev3mKl2+eSXxPkPYmCelil5b8Epkpr5H3Phmfkt/h/fPnyJD4C7OzUJyXicK8D5KXd8jNSUZ2zgdkZaUjPT0NOZninp+N4qJM5Oe/R05+GjI/fUB2gdhXFGNofBR7xyc4veDift3GdA06dctrxqpS7prDm2teV2yZYujP0D8/1zdzhP2aCSy/8Qv0e9X3+a/ie3DxKIhLAf6zJ704TOxW0Ktmvv9uCkE/X9jnzPSL+NZ+wr7204nTxwGcJnVg56kXG+/bceqbAzblKlGP7n8V4Nd1YhsD/H/2PS0G/DHFFFNMMcUUU0z/NP2JwE+o58v6+Kw+t3xDv+3OZ/r19/nprwWBQACzs7M4P+ecMnmEcOLuOv8Zhh1yt5iPuxQJ+1pEsegxfbeJGoiW0fLyrRTc4Xh8dxieCWcsCf1c/b11eY7R7W34lwT4BfQVkBPaFbgL7BPuV/YE8HfROi/Av7gj2kbb/AbaFjfhWybc8zN462gR+G9Z0bDPcB5xM1IvvVPxicQPAZ+z/I3LG/AI9LfItk2OezYO8XnnCIG+AeR+zERm6hsUZKcJ2GchNyMNb188R+K//4P3L1+hWEC7nMCf+V7gPRHxj/+Fl0lxyHrzCkVvX6Pk7Rt8fP0cr18m4dmrJDx9kYAnzx7j2ZPfRI/w9EmC6BlevHiJ12/e4F3KW6SkJeN99gd8+JSJtNxMfMxKxae0V8h5/1zy8gzZqc9RkPISOS+e4l3cY6S9fI6ij+koy89CSUG6QH8y8kWfPr1HZlYK0tJSkJudgfLSTygvz0JeYSqyBPqzxG924Ud8zM+GP9iF+bUNbOwf4pIQ6dSTrkU5cgG/qelQVVNqql9C8eV/xj8/1/d5F5vFQ1h54cNBYof6Dj+/OX8R143jpG4cJHFZu7Xc/W8qvon/TD3KwOX9WoT9swQqgL24Vqy9acNBwwS+Lp8q2GcRmldu2sMwtvmzBzBjwB9TTDHFFFNMMcX0T9OfCPyUeVmfmdWPcOMsf5sXfj+X/fvR3NysOqh8nt+AvpkRs/VHG50O0zWddlsGn9wicjkSiPpKqX+WLzmgaHfb0NYtCSV5uOFL1hiQRjnpmG/4xnUCWyh9bh1/YkwsRsqw/NR5GUW4howuA+1iYud73o7Fcu7wCH6+gX5+Vc3aE8oJ6C0C6q3LAvoC73qWf0egfBdebgn9CuwF3gXgmznTvypgvyL+6J/gb4lxeo14vMJBhU0JI3KA37e0iV6+pG/7AO19/SjIy0ZOZgoKcj6gVOC4qbYCDZVlqMj/hOaKMnjKi1GT/xHVRTmoKM5FZUkeqopEOZloyHiPxg/vUJP5AbXFBaivqUQVw5YVo666FPWiirJSVFfVoL6+AaWyn50rQF4s4ZvrUev3olZ4qa6+Bo1leagvzUR16XvUlXxAS2EGmnMzUJstdvm5KP30EXkf36MgNxX5n96hoCAFpVU5KKsuQEVVMcoqClFY8hH5ZRnIFWUUpSOtMAuZxZ+QU1qkznVmZR3zm9s4vLxWAzLhZeRSW6xfXj9OY2MdUspwR1Wo7BD4nXYTcj+5wfnwFjZzB7CW5MVBXDuuBPrP4zpxKPtHTwT2n3DmuzMqKP+VpQYx1GBGJ44f83N8XbhM7MU5X1r4qAOnYneRFMRhvA+bT1twUDqMm+l9VfgsxQspR+K+85YEVZx/hjErB2xj7pMx4I8ppphiiimmmGL6p+lPBn4l58380ewJ/Jzhpzwej5rpHxoawu7urgOdtxXN3GX/Y4Zx3Sc9GKCgPgKejbQ9n5lWXBXFh4Z/xmUMbQ0oGBC7ksNL4TeJTyJSbK+Tly3LQuchMmw4Tu7ZUoZpRuQ5wjVsVAZl6zhxw/xeyM7ayTmCS6toEehvXVoTON8QINfL7PWz95yhF8gX+G9b1rP9XrW/qwDfI2pa3RHo18DfpoDfiHC/LXbbEo7aUqsCCP1tAv2tq5zx5+MBG/BLer0b+xjf3EOgfwDFRZ8EpAWis5NRlp+BzrY6DAe9GO5oxWS3HwMt1fCWZaOpOAs1BZmoKvyImvxs1OWkw5+dis6PKegqycOw34fxwSH0S5w9fb0YHR3C+NgQ+vr70D88gpHPY/B3+lBYVoDc0nyUeRpRFQii2t8lwF6LUgH78uy3qC1+i/aadAw35OOLpxLTHR6MBFrQVFmEfJXPFMnvW+Tlp6C8rgCVjaWobqxASXURsorSkFnyHllVWUiryEFq2SekVxQjr7YWwbEJfJFyGF1cw/zuIXYvr9TqC0K/Qne2CYoQyHbiAKFqbhSbChumagf604/8S2vlzm/0d29gI70Ha/EtOEkKCPQK8D/24SihQ44Fiv+mwM+X8R3GBxTwnycEcRUfxEVcF65k/0LO+SDei40kD/ZyenE9uAUcSflKkemXW+rPaeIrX4zAsv1zzH33xRjwxxRTTDHFFFNMMf3T9N8A/jtF0Jet5It9UM7ym/3x8XEcHx873db7zX0d3h8zjOs+yV8ClKO7DF+sdiXeyVYaqPRCX0KZGgyQPTMj+FUggXJoLCxD+dxlZIyAWVAz/jxvhqUfHbORdo2UMiyn7wF+40Xtc1UBsHdxjfGdPbQL9LcuLMO7ugbvuoC+euv+umy30La2J4CuId+7tC/Avy/7++AKgJbVXXiUNOR7Bfh9Iq+APUFfwb7IR9h3gN8vcXoJ/IxbgN+7tCHpb6JvfV99hq93eBTVpUUozU1DRe57VOe9R6CuCCP+Gkx01Als12KsuRD9VZloL/6AsvfPkPs6AUXJL9CckYyBT6kYzn2HwcoCjPV0YmziM3rHP6NrfAyDs18wsjCF3hmxm5vE4MJn+AYDKGgoQXp5HrIb65Df3o0ifx9yS2uQ9vYtsl7HozwzCYGSt5ioycSypxCbPfVY6G1EoCEflfkfUJ6XjuKcVBTlZ6CiphSldRUorS1HkQB/dkUWPtZk4GNjLtIaipFaX4nMhjoUtrSh+8scxqV8e2aWMCDQP7Wzj93ra/WeBUJ/qOJYz2wf/JzfNduXWJu6VMDPdmOA/1rtqaZB6+0rnHWsYj0tiPXEFhwm+nGWyFluP04et6vn+6NB819WfH5ftgT+fQJ/ggb+i8eduHzUia9JPTiX81+Na8R6urh1rgJbUlAck1NFxqtYX8e6XGn73zffDfwxxRRTTDHFFFNMMf3V5bww7xcRgZ/54sw+gZ8z/U1NTWp/bm4OZ2dn0okmpUSanwv4bmOoyBbtCEmU7NrGcYqQ2hDw9TO9BCr9bC//Od4krvBKAYEERVtOYMuo2X2zZtvJjoZ/QbXrC1yLtKPGDqaqUw7nntIx82/YVueRcqXMA0ZpxiCsSM5ku3x6LrC9Cd/CEvwC/H7Z5xv4m0UtazsC/AL6q3vwrezBL6BP+UQK/FcE/FepPYH4XYF5+hXgF/molR2x20H7sqMVAv+22POlfwL7K1zOv4EOAf6BjT1Mbu5jaOQzGsvKUJ2TgYb8dDTkpcBfnomx1hLMB8ow15qHscoUfK5KwVBFGhrSnqPoZTwq3z1H4GMKpgreYyr/HXpLM+Brq0NLXxCVPT0oCnahfCCIquFulA11oWKkE9XDfpQF65HtKUZafTE+ej3I7xtHce8Ucqpb8T7lAz6+eYaazOfoLXqDL8VvsViZjK1APha6itBR8wG1klZdYSaq8rJRXlCA2rp6VDU2obKxQcC/HJ9qcpHblI2PbQVIba1Ccksj0ltaUdTehe65VYxvHqptcG4Z/VLmX/b2sX5xjlO2Kakm1ZZuSKPScL5K+1CDSVYNq3ZsKpUtU+GqrmJpV1/5Go2tKxz7l7Cc7Md6kgfnTwO4TGjHGYGfM/zOS+7+FiLsJ3TiKLETh0kdeiWDnOOluF3FdeIsvh37SV5spLTjuHUONxv6JX28hvVKHV7LUo5yLeoBOKus/wSj7yWSF9cAZAz4Y4oppphiiimmmP5xig7e/z2xr6n7m+yHEvjZ/+Ty/vb2diwsLCjodxvzbP/PN4zTgJAt3ak3mwhzl3f5Q4TS/6IFdBmG4/PAQtTnR5c42TvHweYJtgWQj/c5f+v4sdJQM7cEO0XlBvg1utleHe/O37CtziHlyh0P3MBPOxEP965vMLl3gG6B/c6VNYHydQHxdQH9LfjWBeQF+n2ru2K/h45lo30ERLTzCfD7BPgJ+xT9Un4lQv4OAiFtO9AvcQvwcym/X4C/U4B/cGMfXwR+B4cmUF9cjpqcHLQW5aKlIB0d5RmY9pdhp78Gq/58TFa+xmx1Mr5UZ8KT/hLFLxJQ/uop2jPeYqYwGYtl79BVkoLymk/I8zYIaLfguUD4s6Z6vPDU4ZmnFq/bagW+y5HSVIi05hJktNQgtzOIopElFA+uIrumA+nvP6q38tdnJWOoOA3zpe+wVvUWB915WOsrQFdNMury36CxOAe1BYWoyC9FbW0L6lraUdviRVlDNXJqc5HtyUamvxjJ7fV4421FWpsfRZ096F5Yx8TOCXrl/LulHIJLawjML2Jidxf7cl0o3OS1oV7KxwrkgJAGfqcKHWOOdFtgO7iScJdSt1/5wga2xbULHHpmsJbiw3ZSM84S/bhI1DAcFZz/qlLA34HDhACOn3bhKEngPz6gntk/j+/A5m/N2Hzjw2nTLL4un2vYl1LTg3gsZylDDtzxWvwvAb/7nsj9GPDHFFNMMcUUU0wx/eMUDbr/m2J/U0M+Z/m55dv62SflTH9PTw9WV1dxdUVgCRt2bt2zWT/HGARmp12DkO68GzmGu8aJW3qnmE3qvj4/7ckF5wJXJ1c4P7zAye459ldOsD69h/nhNUx0z2PIP4luzwiCLYNYnl2PTIdxhOLnjnYIA38IRUJicO2Xe3TVkKf/WcZ4sQPSzvHEwzPZXz+9wOetPfQsC/AvrgiQryOwIYC+wZl9QvsuOgTuuwT2tfbRKaJd+4qAvwB/OwcFCPlrYRm7DonDiODfvirQv7ol6WyifXkDXQK8Q+v7mNo8wuDwF9SVVKE6Jw8tRfnw5GfAX5yOKV8pdgX413yfMFnxCnMC2xNVmWhOf4OS189R/u4V/B+T8aXoNaaLn6Cj9AXK6j4ip60G7wSyk1q9iG9pQ7y0x0RfK152tAn01+BNfSHSPRXIamsW4O9H4dA6Cvu3kFXRibTkLOS+SUFN+nsMFGZiviQVW7UpOB0oxsZQMbrqklGb/xb1hdmoys1HcbZAf1UTqpt9qJG0ShqqkF2Ti48tucgIlOFtoAGvJO33Xj8Ku3oQXFzH551j9C1vISjqWF6Hd3YR/eubWD67AB+E0XVNwwq8FPjjEhHWtu1mjK5YtoJLAVa++V9xI9uxsO3N8gUOGiax/MqDrUQPjpPaBZL/ZsAvOhawJ/CfCPCfPAnKfgcOEtqxFd+GtedtOKj8jK+zp6pMWDz8/B6vMgX4vBdRLDgLuv8sQ7h3wz7vj98N/G77mGKKKaaYYoopppj+YhLIjv48/X9DBH29rN/M7Js+J7e6X9qGkZER9RK/iwvOVIaN3cH9eYZxEols0c6Vlu1sjPFGkbMI9ZLl6/MbXJ5d4vz4HGe7ZzheO8XW7B6WxzbwpWcOI95JDHjG0VUzBH9ZL1oLg2j61ImG7HbUZLWhOq8FIz1TuDyVxJx4Q9lSJpwgn8fWGKIfIdDor10pg/nhf7dwP/LcjMTQlzlkFo6vvmJp/xRDAuCd88sC5uvo2hRQF3EJvoJ2gfouQr+lTlFA7G21r4UVkHBU5+pOSB2igAA/ob99ZQuB5U0EBfiHBfinNw8xMDKJ+vJqVOV9QlNRLprz0+At/iDAX4zdgSpsdnzCXO0bLNanYLzyA+pSn6H49TOUpbxGID8FM5UvMV32G7qrElDreY/s1iK8aWtAUpsXj1v9eCRtNU7a6LMuP175G5DsKUN6a5VAfwMyfT341L+K/L5NAf52fHj3AblvX6MmMwW9RWmYLXqHjapknPQXY62fS/pTUKeW9Geh+tNHFOd8RGV1GWo8NahqrkRRTQGyqzKR1ZiD920leOGtxTNvM1LkWijq6kZwYUV9maBfyqFzZUPKQ7S6ia7VLQyL/er5pXqe39Q3W4KpOdahLWVCB9I2vjqPoHB7LWFY0ScScvoYe9XjWHrdis3ENpwkdKrv1UcD57+mOIAh58TP7j3pwsXTbvVyws24Nqw+8+KwZAw34wfS6KWUpKw4fKLfyi9lxFn9Sy6HEAf+5/svVHn+ecYN/Ga2Pwb8McUUU0wxxRRTTP80/WrA78A++5pmy/4ot3yOn1vO+E9MTmJnZ0cghPCijbuT+/MM4yQgcWvLZcSKK6avLwSQLq6VLk+vBOwvcMrl+MsC9l/2sTi0hs+BaQx6xtBbN4SuqgG0C9h7i7rRmt8FT3YHmrICaExvR0OaH41pATRndMKTIeCf2YGabCmb+l6sL+3qbFFSDOGVwxrrwsB/JTZ8a8Bt4Ddz/2Hp9Qwhw12ThpEYWusUtHjM1whsn1xhXOC+e35FYF7Af12AfG0b/rUdtK8L3FMC8V0C9Z0UgZ5gv76rxP2OtX0ExJ9Rh7KTMGsC/ZSC/m2B/m0F/QEB3Q4B/u7lLYxsHGB66wB9w6OoryxHVUEWGosy0FyYivby95gJFGJnsBzb3TnYaHuP3faPmKrLQO37J8h7GY/i1KcC+WIfTMNRz0usDLxF/9BHlHXmCWBX4rm3BYmEfkqunyftbXjlq0OqpxTpTaX40FgtwN+JvMElFA2s4GNVCzJSXuNTSiKqs1+gp+QdZkpeY0sg/2ygAmt95eisTkN9Ppf1p6I2Lxk1xcloactBS0cemvyfUNuSi/LmTyhuK0ZmWwVetdUI9Dci1etBSXcXeuYX8HlrFwOrG1Ku61LeUh5be6rMO5a3MbJ1iJXTa5zItUEwZX2x7nQt678RhlYha2kf0qivvnL+WiwZmM/zC+hezRxjp2ocay/b1YvtCPy3of+vOvPvwH5iJ84TOnCR2IWjxAA2nvqwmzuEm8E94FDKQwqS4yAXX/UVpq4oltWVlDTvReaaCZXnn2Pc90KzHwP+mGKKKaaYYooppn+afingFzmf5mtpIeTrT/SZ5/o5889v9LN/Svifnp7GyYnzLLsY9XIx1dENd3B/ijGddvbn2Y+nuLT5XOBYkr8+EQY6uMLh5ik2F/awOLGG6eEFTPTPYKhzAt2tw+ioH0Bn1RA6SwfhK+hBS04HmrPaRQLzmQ7cf/CjSeDekyHQn9aFFlFbRjd8Wb3wZ/XDn9mH1sygmumvy/NivG8KN5eSMZ5qBFiwAEyGw0h/P/Bzq2FfgZ0xKm7G5+w7hrETHrnGgo93q0eWZXsgYPlFoLxvcQ3dqwKefMZetlzW3yEKCNQraHfUQTmwHwb+21KDBOI3uLorUKuhXwH/GsF/C50u4O8dHkJDdTHqSzLRVp4Of1U6epuysdBXib3xOuwNlmGpNRNLbR/xpTkPLXnvUfVRYFuAe8T7CedTxbiezsTxfC7m5ySerk9Iby7Ga089XkrbfNbqw3Npj2/avXjvrcfH1nLkt1Wj2O9BVd8gGiZXUT+2hOKGJuRmvkTJxwQ0lbzAQHUyZqvfY8uTi8vxFmyPeDDYVCj5+4i2ijS0lr9DR1MqxkcL8WW2HF+mazE124bpxW5MrgzDN9WNnK4GpPsa8CngQW1PJ/rnZzG5sYnBlTUpnw0F/H4p63YpC777oHNhC0Or+wL9F5yc13UmClVntGvFsdKfk7wSsbWwomXDwAR/iexq6hBbBcNYS2zDQWIHjgWQ+QK/EPyrZ+H1lqsAlJzZc31sAJsKWvu/T9EHH4yYTljHCZSVT/Gjw/PlfB0C/gH1+b3NxFZsp/fiIrAObMrVImVA2OdEvr6GdDmFriiWqxld+ZONvgc6B5aJAX9MMcUUU0wxxRTTP02/GvCLzLP83Jol/tzy2OcMCDQ3e9DZ2YWFhcXQ0n4F+yTR7zR6kCCyd8zjG+nNX55eYn/tELvzh9iZ2cf65x0sj2xivn8dU12LGPfPYLTtC4Y8n9FbP4Su6n74yrrRWtiJ5rwA6nL8qM70oupDG+qc2XpCfXN6J1oF7Nsyu0U9AvLdaEkPip0cZ/SE5M3shU/kzdBqTe+G52MXaiXOLknvcONEnzOzb7aKQMz5EN/1UmOiCPnDMAhFwNfSQU2oCHOHA8PoOJw/4ufi6itWD84wKnDevbSpZ+Id2CfYd6zvCLgbGfCn274jvQpA++WWx/vidx9B8UfpcAL8lMTXKdDP1QQ9K1sY3dzHzNYeBkYG4W0sQ7enAJ87SjDdW4m5kSYsT3ix/SWAo5luzHXVoq82FwON5Rhvb8PcQDe+9LVhsqcGS4MlWB3Ow+p4MSaHS9HUlofsqgIkl5UjpboJyTUevG/0IL2pER8bq1EhAO4fCKJ3bBxDX+YwNr+BkZkldPUE4GsuQGdzluQlQ+A+A188n7DV04Dz+UEczAxgrqcZE/5KjPmK0d+WheHOTMyO5WNpqhSLU41YnuvC+voIVjZHMTwj7aq3Dk3dDWjt8aC9P4DxhWlMbawL8K8K8K/Dv7wBvuywY/0AgZV9BBY2ERRN7Bxh+/JafaOfbeCGAznmOXMap57VoWMVsgzJ2ZgGw0fYhzax9akf68+92Enw4kxAnt+qvxCYPk/qxVFiUIC5U70E78QSj/kmfA3ZhO9uBdu/Rwb0zxSsWwMPIVmgLzqSfB4n9uDkSQ+Okwj+EkbyeyZ5Oo3jp/j4hn4f1pNasZEm4fzLwPqlfjRHCjH8ZUxiPkE/PKhmXxd/tuGXAq6u5MpWmdCG97QY8McUU0wx/WJS91tv7J4bU0wx/YH6BYGfs/xK6tjJH1/k5xwT/Fta+Om+NvT29EnfdQUX55x2Z6eWPVvTwdXbb5nowC9dd4Ghk91TjAem0Fnej0BRHwKFAwgUDMKX24+2rB540rvQkCog/96Lpg+iNFGGX9SO5owONGUG0ZTVC09WH1oI9gL0Gur1Nqww5LtFNx3GOZZ4mjICaCsMYm5oRb0TQBluKNJGmESUIdQra0cGSOhs9LuMswqAcR5J5DNSbr18gdzSlkC/nsWnOhXwC6CLggLsQYH3LjWDfyDa10v+xY/xbwYAogG/gn7Gty5xrW6hRzS6JcC/vYe+wX7UleeioTAZbSWpaK34AE9dFhqrc9BU/gntNeXwlBehOCsVRRkf0FRSgo6GWrRWF6G6MBUVeS9RmfcCVQWvUPbpFXIzX+F92ju8TvmA1+m5eJn+Ca+zPuFt9kckZ6XjU0EuaqqrUF9VI+lWSzq1aK6pQm1ZLiqLUlFT/Ba1hS9RnfsMtTmv0FKcBX9NCbzVJWq/tTAFbaXJaCx9idqiZ5Lvp/CUPEdj0RvUFn9AXWUWqqrSUCJ+SgrfoaI4FdVlGWjzVGJyZhzTG2sYkOugl8/uS/nwXQmdqwdSXiLZ5+qH4Y09zB2cYv+Sy8+lutjm7wL+hxr6PbrB5dAGNrODWElqwn5cm8A+P2EXxGmCQHVSNw7VkniuAAgI4Gv9ccCvZ+Zt4NfQb9LQOkroxoHk7zBJYP9Zn+SvCwcSjvk5V9DPN/N7sZngwfqHThy3LuDrqtxneKuRYlOz+04RaOlVMvb19d8yHMzhgKUN/GdnFzHgjymmmGL6ryt0f9VbtW9vxZ5uUcPGFFNMMf2IfkXg/4baWn3SR5U+qWxbPG0IBnuwsryGqyt2s6XjLb1vcoyawXQZN9jTGOC33dS+/L8Uep0fXIa3sAuVqc2oT5M0BeK55L41rRu+jF60pQXhlWOfwL9XpGbuMzhbH1SQ78nsU2qlXwfaf49aOMsvaTRm+dHbNIKTnTNNF8w+i8DQhrFTm+jA/9OMU3aMk494r59eY2xDIH5hXT1fHxTY7DLAT0B3YN8Af5eAKaHe+OkMAT+PDfBr6QECB/o3JLyKT4B/bdMB/n10Dw4iPzsd75/8Cx/i/z+kPv0/vHv7CG/eJuDV0zi8SXyMd7J9nfQfvEn4t7g/xvvncXj3/Dekvo5D2pt4JD/7F94++V8kv/hfpLySeJITkZL8DK/fvsSrt6/x4vVLPH/1DM+eJeLVsyR8ePUcH549wYcnCch6+QRZr5OQ+uI3JL/8t8T3GzLf/Ac57x7jo8Sf+uwxXiY8wsukx5LGb0hJ+j8JK3r9L0lXtkn/g6yn/4O0xP/F24R/4Y24v335v3jHvDyVPCX+f/ggcVcX5+DL1AQWtrYxsEjg30L/1iG61wn7++iROujbkK2Uae/KFkZku7h3hoPzazVGo9qH00aUUcfyx7oWbhsTyPHDxrR7hbOuJaxndGA5sVlA2o9zzpI/FujmknkF/Z0iQr4G/lMBfgPl4Zn3SID/funHBU65FP8W8EfC/pGA/uETEbcC+IcC+IfxARxLuDOB/+OkDmzEe7D21oej+hnczEnLPpWzlkZuLi+K1xb/mpUy9iX43zCq6pyqMeb66gZbmzvfD/wxxRRTTDH9qO66l8busTHFFNOfLT1j/leSAf/WFi8aG5rR1ORB/8Cg6tCqN4mLYafXDfyEePO26miAbx8rw0PpuV8d3mBhaA3+sh40fPSpF+px9l49Yy/w7UvvhT+9B/40La/st4k4M9+SKXCexa0+jgbw3yM105/ZixbZ1nxoQ0uhANbnDdxc8IQlv0LzXyOW9IeNgRFujX6KYVJOWfMvBxSkyDB/eIb+ZX4qbhN9mwLhm3sC/gL5lEB8UECUUnBqpOwE4jlAoKT9UD3iTnWv81i7d27SLwcPttAnGhPYn905RO/IBPJyPwkcxyPnxWPkfXiG7NwPyPqUiaws2b5/LXD9GB9e/gs5KY9RnPUSRbkpEiYVeXnpKPiUgbzMZBRkv0JxwTOUFj5DbUUyaspSUZQn9p9SkJb6Ei+fxuFl4mOkPIlH7uunKEl+jsr0l6jNeYvK7NcozHqO4ry3KMt7hyJJo1rC1RWkozDjHVLePsObd8/xLvkFXj2Px9OEf+PF08dIfRWPgpQElL9PQuE7yfeb58h+9xSf0hKRl5aA/PeJyE1OQm7KSzRUlGBudhYru4cYXt5QjzX0Shn1bUoZEPjXdgX498RuFz2r2+rTfWMru1jcOcaZ00ZYdVwCzuav3oPBa4TXkboe7pJj2Ij4Egc+VbN9hdPORaxldmLtWatAdEBB/9ljfuIuiIMkijP9hPIuXMR14uJxJ85lSzi/De8/Iq4Y6MSxGljQ0H8W1yVpBHEa1yPuPQL7PThI7MGe6Ohpn4B9Lw4lD0dcFSD5O0sS8E/wq68PrL3146BmEtdTQvr8vqFcQCw2tvHI64dH2iailCIO/jwTqjoxvA/u7x1hZnouBvwxxRRTTH+4rJn7H5d+W3VMMcUU089RdKj+laVm+WXLJf2c6ecsP2f7h4dGsbO9dwvcCfmUMXQ34G9MVOA3RqwvD27U9/C9ZV2oTm9CQ4akK2Cjgb9PQN+oX4C/T6Rn8/lsvierS60KsJfl/6g4aOD72C/x9qI+zY+GbD/6WkZwtn+uYER9AvzqGtfOagfb8OyMwnjyE4yKUP7o/2pQgbP8W5dX+CwA3rciwC/A2atgX0Bf4D+4QbgXeN84tMRjDgwIxHNwQA0QyLGyP1AgS3HWuscZBOAgQrcAf/e6Bv5xB/h7Rj7j06d8ZCe/QlNeGrzVhaitr0RVQzVqayvQWJ2PBoH3ppKXaK1MRlt9Duobi1FYW4TsqhIU1dWiyduC9vZGtDbni/8P8NRkoKU6Ew3lmWitK0F1ST5yM9KRl56O4ow0VGUmozHzNdrz36Kn8j26qlLRVpEMX30W/PXZaC5Nha8yAz31n9BWlYnigmRkF6QgIy8V79Je48nLJDx98QS5mQyXjWBVNrxFmWgsyERLaSa8lWnwlKWgtSwdreW5aCrNk3zXYOrLNJbkvMdWd9C3SrDfw4CUZz/LamVHjkWq/PeUe//SjoL+nbPLiNUelLoEKPXnPjmGu3xxJB8r4VL37UucdCxindCf1IqD+HaBfi7t5yw6Z/m7BcS7BcK7cfWoC5cC/GcC2wrSubz/FsB/r3Q86vEBF/CfCfAfq3z0Yk/ysMsVBU/6BfD7cCL5OIkLKNg/fhLAtsD+6ss27Fd+xvW0kD4/vyfnxy/uXcmpauA3ZWFKj9I2oRIyByGLP8lY6Z6enGFhfgkjw2Mx4I8ppphi+qMVWpbvso8ppphi+u8pOlT/yjLAT/n9Afh9ATQ3tyj78bEJ7O0dWDP9X9Wn+6g7gV7MncBPK4eILg+vMTu4iNbSAOqzW+H5GBAA70LbB4H+D4T9ASVfCPoJ6EG0ZHWKuhT8R4P47xEfC/B9HJC4+JhAEI1ZkoeiLmzN7CngYn5vbq5FZg7y9jnRxuinGScyblhczMrRzVcsH59idH1bQHNTAX/PpoD+5qFS9+aRUo/Aaa+SAKpZCbClBwa6xT/FcHRX4uy1snOAf1PilTT617YF+A8wuyvxD40gLzcbpZnv0F9XiLHOJgQ6pc4CrWjzNcLfUo4BXyEmuvIxHChAZ6AcNf4aZLTU4W1jPT75OuAfm0T38BCaGipQkpOCooxXKEp/ibKsFHhrq9Ep7a3L341ufxCBhmZ4S/IRyEvBsED5nCcT894MfG79gBFfFkb92RhuzsBocxq+yPFgaxoaat6gsPItcqvSRDn4VFmAgrJCSa8MI/5yfPEXor/+I4I1WRhu/YTJwCeMtGZjoCkXw23l6GmuQKC5Fp/HxzC7toWRlW0MrO2jjzP8awcK+PvX99C7RuDfkTLbU8v96TawvIMpKavt80ucSaUZ6I9oE+oBcFt0NbJ26aSmvUWE/vULHPvmsJLajpW4ZjWjf8aX98UL7MfrWfZzge/LR0FcPOZye0J6hzPz/3uhPxL4+cjAuTXDf5zQiwMCv+iAeUnsw4XY8SWDpwL8+3FebCe0YfttAAdl47j+fCANWc5PLif1eX3Rudwn9NXllAvLyUiMKRZlIg7+ZCPpnp9dYm1tE2NyXxwaGo09wx9TdNmdgmjufwf9lc7v71wX6tz+Zs+nm9n4VqfeQnrATP+tMErRZ/djz/XHFFNMPywHoP9qIuz7vO2hfS7vJ/T7BP4/j09gf/9Az1aKMTP89wH/XYZBrgVkzOMBF0eXWBxdQaCyGw1ZLWhMk7QF6gn4PgX7g3qbTujnLH9Q4LxDxLfyB+X4J0C/pNWa0Ye2rH6B/i40fQxg1DeN8wNithjJqn6i2GCcY5zT58bopxkTt2yvFBB9VdC/f3WN+YNjjG7sKPjUkG7BviMuQe8j1It7j8B+95b4o3is7MV9w5HjX0G/+OkRkO0VoB1Y38KEQOycAH//yBhK8j+hLO01uspz0OOpRKO3CTUBHxq7/Ghtb0BfRyUmeisw3FsNf3cDKoKtSAt24LXwUHpnD2qHxtDS04vKijLkvH+HnLcvkfPqBT6+eo3ij59QXV6PhgZpf54A2uoa0Vach56CVMxUfcCe9yMOOjKxHviA5a4MLAc/Ys6XjgX/B2wEMzETeA9f02uU1r9FQWMWyttr0DLYic6hXvT1+jA3UIf1gVJM+3Mw4snArMD+am8BFrpyMdtVgPm+akx01WJAzuPLl3HMrm9iaGlTgF+gnmW6IlvZH946wCDLSMonKHXAMuvfOkb/BqF/E9O7B9iVOuKKfLaWcJtgm7+U+jRtyMhUtMg6VDvq4XbZSmRfV89x1DqLlfcC/YmtAtgBgXHO7Pfi/LEAthKPBdIdQFfA/7tn+XUcbuA/c4D/SOB+X2D/UED/NGkAp2rwIYirhKCEC2DjsQfrL7w4LpvAzfghcKDPh7DPU+OYBsuK7ZvXGG6kfLh6yBkcEecIhXf+fMNBz63NXUxMTKnZfQ6G/mOA3+4k24rwZ47bnDDOvto6x/a+8nuH3V9d/P4tv3VLRXP/EUUrf6Uofv9o/azzY/6/x/5HZfLLbTT3kJy269Z97VVtQ3XBLfNPOXYi3hMo2y5Skf4j5bhFgd2WFi6bk46buEXGf3eYu9N6QB4ebE89wM3JX6hsXWEi4f2++MKyw0SHfyMdn0k7pphiium79BcEfjPLT+Dnkn7CPt/qz31Pcyva/QGBoCkcHh6GIN+Gfe7bS/y/ZeiVLwTkc840V8fXWBxZRqCiS6C/Dc0EesJ4+gC8BvjVLL8G/jZxb+Py/58E/C1pvZKexJ/Jmf5eNGd1wF/Si+3ZfT21rgxxhO8Md87TgIdTDHrXOfgJhmXK4uEz4CzbawEg4g+X9u8JeMwfnqq3xPdv7KNvS2BfoLPHUa8F/H0Cp5QCeSWBfRHd+40kPNW3JdC/vS/hdwX4tzHoAP+CAP/QyGdU5Oej4sM7BIpz4G+sQbnPj4LufhT2DKBI+lIVnio0tZag3luFUl8Tsrs6kDIwhNd9A0jrCqK8pwf1nQGUlJci630qct8lI+9NCj6+TkVWchby8spRUduMmvpm1FVUorUoB/0F77FQnoKd2mTs1b/EZtMzbPrfYtWXjBk5Xmp5h52OdMy2vYOv7gVKa98htz4bhf56NAx0w9PTJVDWhIWhGhxNVmCtTwC/PQNbfQU4Gi7FZncu1vrzsDVeibn+Kox21WF2dgzzW5sYXt1U5Uug71Uz/PsYkrIbYjlu7qB7YxtcEdG3fYQBkVoRsbWH5dNzHEi9semErwqpTwF+9bF5ZetaA8AND0XqbfDGH8GXu1LxX9fOceidxdKHAFafeAW2uYS/F9eP+nD1qFcvsY8PCnx34jBJID2Jb8j/OcBP2Oen/wj8HFQg8J9IeocC/BRn9i+fDOBCgF+9RyC+A/tJPmy9acdR8RhuhvYAuZx4WlcX17i84tWkS4Gwr2b3ORjCb/MR+i3g13taysIpsj/TqOf29w/Vc/vDAvtjo5/x+fOXfwbwE5Q6OztvqSMQUO6trS36/JR/bnmeWmrfnLsjsx8qkyh2EW5WnCFAsN2trdvOtnfb2W5uu7vcbPto7twSwubm5rC3t4f19XX0dHdHwJgdR7T90DZ0zrpc2c46HXHfyC8Qa+JX/t3xmK2Ki/sSn2MXtpc2arbGztqqfbMVu8nJSXV+OztyI5Tzc7eZX0XML9vq8vKyyu/q6mrIPprfcDuj3e1zt/fd29C+E65V2gHbAgcZ2uVa4Zb1RLtIOH+Y7HQoxsF7zsHBgTovnuf3xOuO7x8hVbdy7tbW3Q5iiimmmB6kv+IMv/oWv089t89jn48DxmLnHPPZfr+/XUH/ycmJ0wWWfrcD7BpOw4pmaE/AvyG4yvbaAVnCDXv9l4dXWP68js7qPtR/9KJRoL5F4Jsg3pYuStNL+r3pQfgyOuFVMsD/+8Rl/S1p/WjlAEPWAJrTu9D8MYCJznlcHGri15xBAJH8GugggajTNQcKSX6ykbilzL7eXOmyExtC/+b5FcYF+AfVDLQA6daJo2O1zLxfoNRWHyE/JLofYkBgnxoU2B9U0Cr2Avz9Aq39GzsC/NuYFOBf3BE/g6Oo/JSHmrRUBMsK0N7SjLKuAXwanEb24BQyO/qQ62lCSXMVCptqkeVpRWpnH14PTeC5QH9qsBOVAuCNPR0orCxF+vv3yElORX5yOvJTspCV8hF5heWobGxFTVMz6qsr4S3JxXBBGlZKUrFf8RaHlc+wV5uI3ZbnWG1+junqp1gV4N/v+IAZzyt461+g0pOGPE8hctrqURxoR6Vck+2BRqxPNOJyvhrrvRmY8yXjYKgQ15NVOOjPxfbARxxMlmN5pAIjXRWYnh7AwvYGxrZ2FchzBcTg9gkGpaz61nfQJ6Dft72LXhFXT3AApV/KaUA0KOU2IWW4dnKBE6ksg/fh9kHpL8urtqQbkN44zYiDPAp+lVj3Ij7oLk3xZuUMBy3TWHvfgR2+uZ+z6Y+4nF8v7T9I7BYFRV3qLfnqE32/Sxr4CfuRb+rnFwD0IwUUZ/v5WMEF3ycgfvbi2rD+vBUHxSMa9vck/1ypcPkVV9ciOcVLOeEQ7FMG9CnHjn/FVon7/y1zenouDLeg3msyytl9gf3x8clfD/gjOrffoWhxUTyXz58/SwGc4uzsLFJid3x8jLX1NfT09OjzDsVnxx3ev08R4HRPmF8dVDweD7a3t1XDubi4wMDAgIK8aH6/JVMOnMXljy/L/NRVD7QneI+MjNwK/z16cLlKnhYXF9X50fT19Ym9GzTZfsLHkfsGuN1u4TDc2mHc8Rmodoext3RjmwwGg2q2goblpd3uVmS63ykHuHt6ulUZEcbNtcMtj1dWVuQHdVDljboVxwPEcLzv8PqjYWdqYmJCtb1o/n+mfk++f7esurmvnpSb4277M/v2fcp9z4sppphiepD+isAvavNq4OcsP4FfDQCI9L4XTQJh7e0BzMzMqN8tY/gsv3t23w395jgM/V8N5kgfX8CH0C8W1yfXWPuyhd7mUTTk+tHA5+mz+Qb9PgHyboH9bvgze+An6H8IoE3APBrAf6+4pL8tYwheEQcXWtJ70JDejkBFHzbnBVac02OuvxK6CV98xpr23AiohGZkf7phSbF8NAAyD4Qffpt//uAUo5zhX9tH7wZn6I8VnKrZe4K+esZ8X0BU9gVGQyLsiwiwQ+J/ePsYQwR+Ba7a/6CA7MjmLr7sHmKRb6wfGUNFXh4q378T4C9EoKUVpR0DyB+aQ97wIrICQ8hrbkOFpxHFzU0C/D68Dw7j5cgUkgSS3vYEUTHaj4aBIPIE+NPS3uNjSgoK36ej4L0Af3IaCgpLUd3kQX1TE5prKtBenINxAf714lScVabislqgv+opdhufYb3pJWZqn2OtLRl7namYbnkOf9NzVPsykOctQpa3FoWdAvwBPzqCzdieacL1YiXWelMx538rwJ+HG4H808Fc7A1+xPFUGdbHqjAarMDniW7Mba1hYlfKYecYfERiYOdEykfKVoC+b3NHymkX/TtS9hQHUDhYwvKTMhsWP1/keOv8KrS0X7cM/jWwr+syZJxqDjchsQjBr2Ax18Bz/1y8rJ7gqGkKmy/92HnUpj7Vd5XQp8D7gJ/He8JZ9y4cxOlv4P8+aeA/5Zbf1I8L4PhxACePuwTsu3EuaRL0zx4F9VL/pC7sJ7UL7Huxlz+EqwHhnh3JNy8PKYgbuW702dOKQM/zc+QMcJhjDgXQnxFtf7bhPcm+P5l9GnNfOz+7UJ8p/SyAT+Dn7P4oNTL+awE/ZxAJN5xxfajov6urK2p8FM+F52UXjLugaAg0CvoV+PF8RapzHT73+yHhPn9hN7e+FzxaW7m9O767FT1MtPQJXVtbW6pc3MAf9n9XHqLbE/gjyjxKHfCY0BeZp8j47nOLZn9X+drA3yvAr5dO6/YSUe+hffcxt1ZZuNpK9DjsfXNshQlJ7Bx/zA/btwF+Do6E/Nj+Q/tuhd3uLztJS34UWU+8F1xz9NIxrJdoHaXNzU25/rruLGNb0fx4pdNmBpbYKYscWHLlT7V7I8fNXea3zim6uOJHP0bwLf93uN9K19bD8mBL33NsOyeO+9Ixbs45uO97McUUU0zf1F8U+G2ZJf4hqeX9eqUi+7YG+u3fMbvvYR9z6/6dCxvxIx38r+q5Xe7LfyGkncVD9LaMoS7Hi5o0L5qzgvAJ+Ldxdl/ULpDu/8Bv9P+kGf70XviyBPjTB9HynisJ+tGU1oGmnHZMBOdw7szy06gl9lGA/0aAn4Dy840koOLV2ENI5BFztHP5FTO7xxhcFbBfPxAgPVZQOrTDGWlC/Z5IoFVBvJ6B1uKsvkC8gOwQ/XOGn9DqzFQP7RxgWMKMSvipHQL/AQZHhlHyKRMlKc/RUfoJHa0tKAv0o7B/FgX9C/jkH0FRgw/VjY0oa2pGjieAtJ5RvBydQsLwGF70dqN4rB+1g13IrylBRmayAP9L5CW/wae3b5D55jWKCgoE9pvR2NQIT1UZOotyMFmYho0iAf6KFFxUvcFB+VMcNr7GlucdpmqeY1mAf6czBVMtT+BtTERF61vktGYL8FejuFuAv0P6JsEmbMw04mKxAusD6ZgT//uDObgeL8apgP+BQP/xZCXWR2swFqwW4O/F7NYqxgj1UlY928dq2T73WZaDO4R9KXOB/X4pK66QYLmrgRTxw2X/oxt7mN8/Vu9cMF94ZN1p3NUwG9FeTDVrj47kjwJgaV9qLpzL3eVYrpHr+VMcVU9i46UXG49acZIUxCk/iZfAF+dpHfN7/VEh/ntkZvg7cayAvwOn/PwfVxYI8F8/7sbloy6cP+7EaWKnekHf6os27BYO44oz+7tyDs6ohzlF05JZAroMHPFc7wB+2jC8+qN2fo7h/cl9r7KPLy+vsLG+qWCf4qz+iMA+n+H/pYCfaXKmlYbwvb+/ryDnPnG2kTdw+r/rWWzGawP/7i5fYjCBL1++qB8CpmPM6soqfBIm1KkW8UeDAGzKhMdUNIAxbvTHY4bjsdufcaO+x6997PbL/Bh/dLOPKdsv3WlnzsGEMe48toG/v78fzc3Nyo9dBsb/Q2QD/9HRMaanZ9SyetYNwdH8yPKHmQM/dljms4V5FJk6tfPvVouAq8fTHHF+lO0nAvh7e0PnpOPX5aP8KrAKy6Qd9hs9L8beuJljU462Xx7TzQ5n/PDYDfzGD7f0Y/t3K+TXya9Jy4S1/fE+wJUWNKwPXl/z8/Ny0xjH0NCQWoFh6uvyUncq6IeDbu74KHda0fLJdjE8PKziiHYODKPi8EoZChhHi+M+mfDcZz5Y/nw8gveBsbGxiLjobsdvwt46N1ebsMWwdnqh+EwYZ6vcWrSbqpdQm9Np6Zn7yDDRxJl+JYkjpphiium79DcA/tuSc+IKALkv8p4aCETO9LMfYr+132xpuG8fh4yy4h/2U0yXXoxYXZ19xdbiAbqbh1Gd1YL6LEn/E5+370Lb+w4F/B0ZPfDxGfz06BD/cEkcmX1qOX/rh36Jv1/ilW1WD5o+tqO9shfrM9uasCVvnIQ02f7KdcmKRMIg9/ONXUY6cdpw70R2Vo8v8HnzECOb+wLwAvEC+6MCmiN7hPo9EYFfQ74RBwOGBE5HBFKHZTu0KdAqGhK4H5ZwwwL4wwK7Ixs7mBagXZLf9v6hLtSUpqGZn8irJvA3oapzSIBfYD+4gDz/JIo8QZQ2NCO/vhEZLe340CfAP/ZFA39fD4pGBfj7/Sio+IiM9wn4+ObfyHn9b2S//E32E1Gcl4OG+gZ4JA5PZRU6inLxufADVkve4bDyNU4rn+GgIgknAvs7LamYqhbgb3mH3c5kTHsS4K39DyqaniHPk4HctnKUdLShio9OdrZicaIFhzN1WOzNxVR7JraHSnE+XoXdviLs9BfjcKIRayPNGA7UC88MYW5rE0PrW+q9B/17J+jfFaAn3AvoE/gHlPZFLMtj0YmU9YmUL/d1fUxI+S8dHGPv4lK9iV63kDDsR7QXU6mUalMiZejvSqwvZY8v/ZOGyAEnftZu7hTH1RNYEehfS2jF8dNunD/pFSiXbWIfzpM468+X50UD+e9RJ44SOnAsQH8qxxeJAvoJ3bgh8AvsXzziCwTbsZvkw/LzVmzl9+NySPq9e3ISBvZll6fGiX492a9n93UZOLJg34jFECoKGuMUYfnzjL6XMQFJ5uYrtrflGpia1sD/WYB/bELN8I8I7P8Q8P9RYsfXAP/R0ZHKC5/pJey4RXvOxjPP5+fnIeC/K17CvbmJE/QaGxtDHXPCng0vNmzSnSDC8IQEPmdMACIoeMVfiwIB00H3iv0oFhYWlD/6n56eVvFrYNDSYdoU5PA5efrlEmn67XYeK6A/zjgzjzyvUUlvnvGKP/qdnZ2VeLVf+iMIeX1eNZDBOJk/ghSBmvmxZ80Js319/eoHUJ2TxMcwzI9yFxGWDfCzfDnz2i9i2TG/jJNLujWQ6DwwrHs/fKxnjk0dcFaX58XyZVp04/PpNFdXV2rlhskvy4vufCzDlC3rnefW0dGpysjkW23FP9sGy9OuM8Iq68iUvw389M9BjYWFeayurSk3XR5OmYXi1nDGuBinqWe2VRt6TR5YTyxnng/bNsuZ4Xhsx8e0aM+6XRYxjGk3PD+2eQP8XALPNkoIX+L5SX5n52ZVnPQbLn/dfnitsKxM3XHLsCx/nV9dR8wH39dAw84Q80M/vFYIyc1NTaq+mmRLMc+mA8Vw5vl+Ex8BlmX6/7d3Hv5t3Vja/ue/30ySSWanbHYyiSXLJe5yl2X13ovVu6wuq4uUSFHNPt95gHtI8IpqjrObSQj7FXCBg457iRfVtbOVZZe3sJ1ZOY2MjLi68vXZHoXh3axs5ub9e0I4VjbxusmHpiHwn3snl1xctGnaIm3K2o8vZy0rfdeXlmg3K9myov2ZXDwedNLg42uUwcGBbF3au0o5WL4AYdFeyDNt+YPWobXptjaWpMbjATn/+eYiiiiiiM+FXwr/+wN9Vga4/W8ov4N8i88j/abCZ8zuQLJoNt913LMde/z6jjbqoxKFrWUlWC3jUn2/Rd6UaLy32qTlVpe0lCqUrDeHpP0XoKGkT+pv6G+guw1gQBp+6pGmW/7wvsqyehlumZDMriaIZBshU52ZfpcXVZy+7k9gz+X3y6iooLKznz58TPSyd45OZSGRlomNXSXoStKZmWcJvpL2d5s7Su53lcgzKw2U7LvZ/323hB/CP6IYxgyU1A4n9p3fwY1tGVrbclfNLW1vydBwq3TW35PRpgcy1vBYWmor5EVbn5S/W5T7nQtyq2FU7tV2yv3qGimteC0/1NTKD9098g/9/f62v0/+2dMpjwe6pPZdvVRVl8qrB19J1cOvpPrh1/L2/jdS8eC/5VX5Pal8XSnVFdo/evFGGh/dk/77P8jck3/INmS/4jvZef2N7Nb8Q9ar/yUzL/8hyzX/Izut38tCwzfSXfsnaWz5p1S1/ywvWl7Ii+Y6edPaLh3at1+e7Zfkco+sjNTJXO8b2Z1plcxSj+yM1sv2cL0czA/I9vSADLc3KbkblQUl9pSn25ufSMm73X1555b4a5k6QPyV7LtyPHAY2spoWadlaDul5ZqU4Q+bMrG2KSv7adn/yBy9kV2rRf4G7UWNrj1F1Yzm5/UZKsCn1jiEX98zOVaBlL5P00nZrRiXpe+bZf3rRuEKvaO/9Lrl9mlO7D9zCN/1wSqBfXeffpdk1HzwVbsj+R//3CGfOLX/6xbZ+rpOVv7RIDvPhuVkWMl+QlNv74oqjFEOHPLfFEyKnEVORU4OhGVhFpL9AorPlf+WMUG3p/3j9zI8Muqu4RsdHXdk38Cy/t8U4adjDLGhUw/5psNtxNBkjIQzy8hsJGScWU/k4mGanzjhD8MjLAYMUMz6OeISuUFGbI9xqPihgEA40kTnW8sH4gdZjSt+YAinTsNDlvDxe54sM6mQUgBphBwXWmKGLCSynqVrKtuqRCGd8gfUUIbk0xRlSX7I8/T0lCM8cUV6IEbUda2WT0j4Sa8Niphi5h8yRdxGushfaHbEy5nzZ/ipNw6Bo50BymQjio90QOSdP3WDyFIvhcoA+zjRHR8f0/rM7dkzRZ1RR7YEOiwfCFq8TMgfAyUWNmlpbW1x5JawQkW+aCcMjCBH+eHX1PzCfLaNoQYHtdw0XMrkvHZDesbGPCENCT/h8K7Gy4M6pr3YgAbp6H+nPxrqz8rdFH55f4gfOdombdTSQTsgXsqW9FFftIGhoWHXaYKguhl/9WPpsD39xE1Hy4h1XNGOKG/kKCfqEIUsg0rEixsDahDmwmWTcYNaLp8uPmtzOTPtmAGGQnVFabhvXfZdb3BEnYHGeFnxTFl1dOYfKJiLy7+rtGEGjE5O8t8TlLUl88MgQqHvCnFtbW2e+y0roogiiviyKESWfw+g38pMv9fJK/1cfr/st9i+9e43IUJO+U70qZHkvE4783yncvqJXb3R7wtuKpPaTMtI26TU3GuWqpv6O1HW5g7say7rVh3C/ssJf/2Nbmm40SOttwakRVH7Y6fUl2o/6FaXVJbob1F5l6xNb+XIvv4kuUPUXPqjhGbx5VS2eFA85Fn42OgR7BxpXzOZkikl92NbOzKq5H6EmXrVh7aVeLJEn9l7NxCghF5J/zCkdMtj1OnqBpTsD0N2NzUcBXfwL+/uKOHvkPb6B+7++hHVO2qfS5X2Od/2j8nr7hF50dopb9sbpab9jbxqeS7PO97Kk3fNUtbfKv/ubJY7PUr2xwZkYqFH5idfyNxgmWxM3lM8kMXhhzLR+0zaml5J1du3Ul2pfZa3yiXevpaJmkey0nxXdptvyF7j95Ks/29JtZZIsuW2fKgtka3mEkl1/yRbPf+UuXffy8zUzzI+UyFdQzVS16l9kc4uGdO+ycH+mnw82pDEhwlZm+qT1IZymOMPcryr7XdlQj7ubcrh5ppM9va52dwlLa9JysMNkiRlgEEQVj7s7KoOEoo9Lau0lpP2nzYPZXTnSJ+V/O9omVLea9tK+jfkfXJfdrTt85YY2fUtxSo1hP5VDSB3pHbM7fPP2dAIAf24I9XT+l69T0miYkJW/t4o63+qV4Le7mbi01+x7x6cJfHXwf43HZLUMPe/VbL/F7X7c5sc/L9mOfyqRQ6/bZXd7xrkwz/rZbt8UE7GEkqYNKl0MzXJ5OhUM8PVkuQH68gpyu0lCiGAh6gIru75chV+p8LvFaum5+bmZVT7liPDo9kZfUj+b5bwQ5hYYg8RgbxANJj5hZxBcCE9kAU6y9ixVAsydB3CTz7JHx10wOCCKfKPHwgQZNpGgyE1kBzihhSgCA9Sw+wnM75GLCyNbA/Ajh+Xvv7+iMg0ODJlirBs9vGU6x0iO2b5SCOEBUVclANpDwcA1tfXVM6Tu7bWNkmlPYlA3oDsysqyS6cndT6duFHWlLGRKsgYJJ4Z3M3NDWfn1SdXFgwCWJmgPGn0M8W0EcoTEuV0fmybc+0GOeJEEWd7R0e2bQ2PDDtSZG6WJ/wYIcQvbpSJ7ftGUS/E52aUleBaXpCHBCNrYaOGtK4IOyT8yEI4yR9tyRT+SYORaMivKdzm5+fcAIDVB3ZugErLmtljU+ZOe6CMbTUAnQ9T2Ft7t7ZE2yFvnvAnnR1p5RAh2gl5Cwkm7Q4STdi800YqiX99Y92Vna2kQDEQgSztknJEuS0DmlfIvrV1U5SjlS9+mzWvW9FADW3Tv291jtBaHoibOKnHsJ0xYEA7s7qk/MP3hLyYCsvGypK8tbe3ZesGP9bWSMPAwDv15+OjndP2SfNJ9J4RPnHRbsir1TvlS77jbZ3vhE+bjysk/LRXvh2myGe8Lik7vlfUi9UBcuvr665dWVkTP23H1cuZpfy5POabiyiiiCI+B3Gi/PuAJ/usOvODv/yO8k3lt5RvfzgAzzeX7zR6qNwj4CeHzzh6VkT7V2rhl/nS13JWTuZg+1Bmeual6WGbVN6o83f1l9mBfYVJ/HXQUKLhlPZIc1mfNCk4ILC+pFMalPDX32p3S/tHGqcls6X9Hk23m2Rl4OKTppa9+9mZ/WxmvogqGJpFEzmiZfTPZuZI5hNJmdjalpFNJZpKSEcSe262f9ghmsEHSvYBRN+TfZb2s6zfbwHA77iS26ndPVlIpGRF9b7BPnlVfkcqf/4f6XpZJkMtL6Sru1ba+5qku1+5Rn+lzE68kZX3L+T91FMZn3wlPaOVUt1fJRU99dI5NS7ryS3J7E/J7uJz2Z65KamVu7K3cl825h/L8myljAzVaZhwkG7p73knSxOjcrA6Ksc7g3K8UCsHgw8l2XlL0r0PFeWy3X5fdrt/VvsySQ7+W9bGS2RtQcNafCtj49WargbpGuiWyZlx2d2ak8zeomwpuV+eGZLE+qwc7S1IYmVcEktTcprYkj3lDaMa79jYtCxt7smMEv5xJe4ju5RbMkJChnaV7O8mFRB+LcPNtIxvZWRCCf+oEv4RtRvbSWu5qvzmjkxpPawcHMr20bEcaH/LWotXVpm0+1zbZ0yMnhU9bU6zxyW7yoM+mzM7b/qCqDadkuTLcVn5m/Y9/1Qr+991yNFftR/G/vsCJP6qYOBg/2vtY/25VZIQ/b90SEaR+rpJtv9cJxvf1cnaD82y/UzJ/qhyC5bxH2rSTuBK5EbfFU3rCbdM6BN5J18kO08hWEhhb/k0nCf7GYpvVPw7daT1tLr6QXnoiJuUGx0dc3v2Hen/pYQ/bv+lQJzMEtI5p2NsaQgJOYrOfzibyMAAHXMGCeJhAuQg/EYU6GTzsQeEZXZ0um3GExgxp2ghMKwKgDS3qYwRgR1HThuyaeRHg846crYSIVzOSzkb6aHTTz5ra/1SaZbzmnKz/EouICKQasgKz4TL0jSIJcrIGeETVjhrCJHix40yaFViRt5s1j4kFYCBFvzyQ+gIq6bHZFGEhX/IFfEfHvmZW8qBZ+Kg/ZAewgGYGfxgAIHw8G8NlXKC4FEHECHssYMkdXd3ubIiv6TRCBODIoQDcKNcUIRhy98htaampqey4XAoH2lhxri5hQ5B/gw/5dnR4ZeTU45Wv4TtVlFoGJSltaFNLQ/Kyeo5bKPI18QIP3lghpdOB+FTXq4coxlwi8fqg/ZKGY5PnJ3hR9E2IYPI0jYsXZSJdWxCAoqZdEKwqQcbRCFeZGmnFr4LW8nk0pIvH+rGBruMFKOYzSZMG5TivaVcyZ+ReNLFu8PJ/8TDe0sYhEU94D8k/Lwr5Dd8T6iLvn5WsniyzXtCGC5cfS4E9sZPTuVWWFi4lJm1a8s7aQjbgmsjURmSF8qKcqUOsAvj8Sta/JYTwkORD/s+AdoBdUmd4od0YLe+Tpgd2XoZGR3JDkbwLrn0BnFdBPvWFVFEEUVcC5Djgvvg/5ORI/zk0b7F9r3kt5ffLfv9RcU70XkKpwjM9oeyUBvr1btZdA7H0/+HO8cy17ckbc84Qb9JKn9qktrSDmksK0zir4qGm91K8nulmav5bnRKnaL5Nqf2K+nX8Jtv92g82sd40CXLI+uO7JM8kkxaTz4eKzmLKNxFef4MRWhnQjRLACvU/8SeOjmWD/q7OLuzq4R/UwaVaDLLD1kdUZJvYPZ5hBloxdi2/u4zQ80AALPZLENXgjuW2JdJJamc0D+nfha3EkqeB+T+3dty919/ldoH/5K+usfS3vRMmpvKpbPxofTWlcpw608y1f1vmej+UUa7yqSv4560tJdLfctr6exul/fTY7I83SyTPSUy0vadjHf9lwx3/l0Gu/4tY4NPtW9bL0PDffp7PyT9ve9kanRI5d/J6nSHTHU+kXdv/kf6nv9dhit+lKFXP0n34+9l4OX3Ml79Dxmp+U4GGv9LBjt/lMHee9Lf/VT7A5XS0dsq/cM9MjvTL8vv+2ViuFMG+zpkZuKdrMwNyuxol0wOdsr7sSEZ135NX7s+T8zK4vqOTHPF3uauloUSei3H0e2klltSy1TLiRUUlK1iTMtvQon+5M6hmjN+1QSE3w2uJNyKi0nFe/WXOGaBfrxePRVmKMANeGk7cn14FaK50Ytx8vwB1LsasnYEqF3Jj5P7kng2Kst/VSL+df0Xuodf8Q3nAGiflhP6FZlvO2T3L8pRvnorS9/XS+K19rXGtQ+c1BfDLWPQRPGOkD7966/i9HkjqWfyz4MhrkK382S+oII/ra2ta794Kkv4h6MZfiP8IX6ThJ/00OGFVEGmwg8sJB0SaX6uS/gLKWbZiAtZQPw2C3eq/lg+zCw+gIzTgUcxKwdRjM/wM/NPGiHsFiaA9FleIBHk18IM8zk941caAIhOS2uLI7VDKkc9WVxpzXchwm/kiZUKLgzVKafDiJRAcC188w+hgdDzDAkxYkRcY5p/7HCjnCDmKOJxgwpKkLa3c7PupsgPecZvSPgLKcrNSJVLg5Jmm1Gn7iBlg1qmVg/hfnMGLMiLDeB4Ap+/BJs69SP+3i4keZBHsyetIQmljrALCTT75t2S9qjuILCmJicn3EBASPjXta6tLgBx4dcU/s0NUMbUJ+VAnYSEnzxSlrghi9nIsQ3MEL7lATfaI+lkdQPxWv1RrpBbZtYPo1UQrLagrGxQaXc34d4j8gQptfeIgQHsbKAKwkt6aKfWkeJdJp2WVtIVEud4Wbs2q3YTE+PZtkI9GfnFX7ZsojAKAcI/ofVgivZBWnEL4yMMBh5sAISytXfWwqIsbADA7LIz/GrHOQyEb4o2S3mZrKU359eDPBE2eeb7YnWCWlpWwh8NcFwF4feuiCKKKOLK+D0Sfv2dtyX9fHvR+V2x7yXfXn6HIP0MHhfql2Dn7EMnHvn5y+tKIhBZcno/pJ+fY+2KHCdOZG10R3rejErtnXapval9kl86y89Vf7f63ex+7U8a5o12aeFGgLIeJf8d0lKm5pudUl3SJP1VI7K3pswqysMp/+x0fvIS5u0LKIIzZFVoSd8hKsAT1fe17/Yho8RT+xgsyx9NKklV8g7xH91Vou8AEVWirxhXsu+wc6CEVu1A8sAR/jG2B2xsy8xmQhaV6I7PLmhbaJbqF4+kreKh9DS8lJaGCv3NfiPNVS+ktvyuVD35UWpf/OBQWf5vefOsRN6+uS8vX92Xp08fyqvnj6X61c9S/ewHefvkb6r/Xd4+/6fK/Y9Uv7kjVW+eqHyFoloqK6rlzcsKefO8XOpeP5HKJzfl9b1/ydsH/5KaRz/K2/s/yas7P0nVw1Kpe/KDVD3+u1RomK+f/rdUPFP357flbUW5vK6qkJdvX0pVdbk01D6VhpoKadE229fVIQM9rarXS6+ip0v7Ui11MjLQ5yYpVrd3ZHZ9S0ZWN2R8Q0n/9r7DuJL4UWb2QYJy3XOrIXCb0nKcUMLvVk1ouY4k0iqTclsrBje2ZEKxkT6UQ66my2sskOET94825dtTrk25cZ0IVvesLvGDY5E9xn0NaWxP9p+Oyfp/ad/szw1K2H8p4e+QQw7p+1b7tF91SepPLZL4ulk2vmuS1R9aZOflsJJ97WvtayJ4T93tFVEi3e0bWPo2Snq9yWfD/YkjrvLcCMHj11DH2reHp42PTziizxZgttli9gT/P4Tw00mGOJAZOsIQIuwxswwa8kPHmo85s5PXIfyEAcHDjjBRuIUzcIRp5PkihQwz0sTDoEGoCBN3iFGbli/hcrhaNM51oZpTOYge5QChIs0QFH6ACNfyQr5JM3mkLMKBiJAUETfEwgYKPihZjl8HZ7KAH0cj/IwgQWgIAzfIj7mRJsoKewgubQiCZiDv1CN+Q8JP+mhrDAYwOmX2kHirM/zEy/Q8xf7rlpZc+AymtETE1/IUmkFI+LOz62pPvLZ6ABJMm2SZfCh/kSJfccLPYE5eWhThAAKyVr45Iunl0UPCT52HYVFeRvgZdDHCb0vEL1K0IwaTqF8Lg7Lo0PhsNp8fE+IgfbjZTLYRfuoQZTPmhGXtk5UB2Tw55PIFziP8tH9TMzOsTvBk3cLKhZELy9zQSWt/f58LE5VI6g+cvkd8MyyftDXkyKuVLXkgr3lhalxhmvPcgLqNR2WAol6tLi19oX/OC6A+F5cW3aCKpYcys/ZLOl0YZ5b0BzA31UlzEUUUUcS18buc4Ve42f3c9kK+lT7PDN76bzLfYfqT4co1+wY7pWYO7XN375t9vnP0W6e9OiUKn06PVYf0qxVzD0fqnvokOwtKuprnpOHnbqnhPn5IPzP9ioYsmfd7/JvQS1WPYES/4SZEvtfJs4wf+Fn9TqlXgo/OUv+mEj/7X1faLk33NX99i3LKGnpNo5+1VKgeHjh4ufL+cyisCkrlWeqfiPDTD6aYElpu89pXGVPCPwbRh7w7PZWFI/a7kHwl90r8meEf203JOGQ/CVlVgrq6LsPLazK3uSubqUPZ3svI+/lFGezpkHettTLQ2STdSprbWjukubZVal/VyOvy50q2n0nVq5dqfiIvnjxQ4v5MXr18ooT/gTx7/khePXssr548VPeHUvnisbxVt1fPHslrJfYvy8ul/FG5vHj6SipevpVnT17J4wdP1PxaKl48V/mnUqPhVamfiqdK5p+91rjeyNsX5RrvfZV7IK9ePJCXT36W108eyRtNx7NXr+Xh08fy9Nk9dbsnbyteSXNDi3S2dUhXW4t0dWi7VcLf0VUrnR11Mr8wJXv7CdnRMlxhW8TCigwufJAplvjvpByxH2O2n+0S2t8AY7sJmdxNKuFX952MG0Rxqyi0PEf3DtxKAK45ZMXEUiIt20r6M8f0T7TCnILEQvXtDAug9cq7oASaKoZDR7au6vHMu8HsOUMELizekYSax1Oy93hENv/WJIlvWt1Bfu60fSXwB0rgD5yeI/Up4Ny7IuTcWNLvruH7c6ccq9v+N22y/k2DrP3QJntvpuR0KqkEhHRq3KqRDHeA5Ym+uydsgdH3WNP56ROtk9RHygkqsLJMgQsUrZzhNZffyO5LKb47Ozu72t9kcnnYTeaNuMP6xmRsdNydzm8n9I8MAyX/it8U4Ycs0AnmIwxhgVQwU0u86EZiIR6QMmbhbYnvZYTfPtiEWVVV5cgKs3kQWhSdfuKoq4Pwd2YJE7N++GHQwcDIMDqzuZBy4iD+sbFRly4jGqbwD5GZfZ9b+m2DF4XChSST9vcqb+mmXHAfGRmWnV0/I+nIn5YN8YeEn7w0R+mi7DwByhF+DsgjfKtTgKyDms8j/LgVIvwMToRhFUJI+CF5hGNLzDmozBREjXQQH4MBKBo3S/rDsrLygkxTb2H4mxoehxha/oHlz55DAk95mxvxxgk/5cESdlPk3+oqTAtgJQXyIeHnvQrjBjYzjsJcKK2GkPDT1sNwqMeLCD/1B2kP02tppf0hS/3a6gjaCeVpnaC1dT8Iw/uCnL0v3BpB/fFuoWifFtZHOj2qKMcwrUb4Ac+UUyHCH26RwBwSfhCGEdqFz4CBPctXqBjoI4/UNbqtZiANvM9hGBaXDSZkEcWHG/GYsjINZbNhKIiPd98UbYn6n5qa1LL1340s4Q/CKAhH9ouEv4giivhM/F4JP4jIPXv6m5tbHGwggO8ng68dHZD+3PJ+uhAc1hd1JVzfwxF+yEy0JD2reMxOZ6oMZMGItJF+5PXncH8tI2PNC9J8r1+qSzoU7VJX5ok6M/Ic6teIuUTNpZD+iPiXQfJ7VU77FRD/sn6HxptK+JX0N5SxhL9TCX6X+u9VqD3Q8KpLm6Xz1TtJLGm/kPSQTKUhxx+P5FSBOU+R1kIobHnmEVXAKlDmAhXys6dc/7aVyci8ktDprR0lnwkl9kkZhaRGcOQesm+z+m6J/75MQPY3d6RvYVmGl1ZkSf0mDo7kWMt7W/0NDo1IQ021NFQxS+6vQ66srJbKV9XyVvHqaYUn668q3ez86xcv5c3rl0r4n8oLJfQVan798qW8fPbSkfg3rypUfyUvnj2XV89VTuVfPH2u/iukqrJG/b+RZ0/Vz+s38hK5Fy/k9asX6q66+n/1olL1Sg3vhTxnAOAlfp/L62dPpeK5yqmfpxruE31+8bLcDTwQf+WbKqlSVL+tlNqaSqms1nRWPZMq1QcGe2Q3sSVH2kaTmUOZW9uU4bllGZn/INObkHYGU7Q8WTmxp+XJ4Mo+1yBqOav9JGXrVgGkZEzJ/ZgSfmb6KfOZxIG8V7clxe7BsXCroymIu2/rETDzHkTviK9lrwOnIj/YO0U3kXdEu7YnE0nZez4mW/9odcvv979ukQwn+HPC/p87JKPk/YC7+hX73yrQIfSc7K/IfNMtmb+wlJ8VAm1K+lsl+VWjbPy1Ubb0fUtVz8jpjL4HdGujBPk0kiYIv77/NruP7vqw2ZTmq2yGLlaIWShX9HKhMn6Dvq91OT+/oHyQpfvcsc8q9FE3y891fOG+fSP7vznCT4cfBZGlEw2JhcCEupnpOEOkIbF8rLE7L9yQ8EP0IBWWFzusDMWyZz4KxGFL1Am/vaPdkVrrtFNexG9lgh1+LEzI7MDgQJYcQTA4iI/l1H5EONep92H669kgdjaAQBxG4CEkPCNPPm0JMuVk6SL+iwg/V/4hj2IrAGlkmbmlYV4JIMtBWJ4fntLvCb/fA/05hN+IEum2OoDw2Cn9hGuzxCjKBXvqiDaJwh91SHpxA6TDrS6gjjV80m0/2pBVBnMI20Hladuc4N9SYA//uYRfwzPCzzJzU1wT58pD/RA2aaHuKHPCoPwuIvz4IVxTDGZQ/yzjJo+0LYg5A1vIxwk/+bVyxV9I+G1lg+UBNw6wIw/ES7o57M7aLwfckX9rG76MOO/Bt3/qH3cOL7R9/SjqiTq0eHgXCZvrIm0VQDqd8vlSe0B85Iv3wLU/TVNI+NlagB1L3K2trH5Y9eUchUFZcFhiX592bhp93RMW6SMu4uB9or3RfgiH94X3nGfOPLB3DODHCLgvqwEXj4+zwaVlRuuPcvVh+5U31o545owIU7Y9iHIlHMqawRUGQpBlNYopyoz462rr3PfCBifOzPCbHpjtjv4i4S+iiCI+G79nwg+azEw+IfuRWfWGev2truUbrb8pc4uSOTh0BP7jqUJ14zBOQWTAdZV5UT2zdSLvu9el6VG/VNxolOqb2l+4rSS/rEMaStqlkeX5StxbldhD+pmpb7nliT1kv1ZRd8sT/oZSxU3QJ/XqDjA3Yq+Ev6G0R6p+apX6Ox0y3b4gR1v62xLxlxMl+8cfM0pGmHsMFA8AOWMprgDMInSINMOVFbO7uTD4e6J94j3tf6xC+pnp30ko4dxT3ZN9R/KVhEJKRyGjSZ4hsrsyvPJBBhcWZXFrR0mvDzOTzsj46IQS5tdy7+5defLwobx8/lyePH4i9+/dl0cPH0v546fy5FG5Mz9+xPMTeVpeLk+fPFHzY5V9pMDtkTxW/enTZ4qn7vnBgwfySHXCe/RQ9Sfl8lwJe/mTp+4Zt4ca5kON95GG8xQCr+T/aflz9V+u8T6Rx+pW/kTDVbi4NYzyxz49D13Y4KHKavwaFnBmtXv4+J7ce3hH7j24K89fPpOxyTE5Oj5y5HIvcyRLGzsy8n5RRhdX3E0IU27VhBL+pCJ1IEOKAbe8PykTHJyo+riTsdUUnAHAHv8DmdnJyPutlHzYO5QUS/s1DlflbiZfTa59RLqZI5X/VEDhqAF+Yg+9dhlPp/Zk79mYbP6zWTa+qlEy3yTH7kq9djn4sxL7byD7fZL8rk/2vu2VPSX5jvCrGwMCmW+V8H/boTLKkb6pl7XvqmTzZpscNc9rp0q5Ad1SbXq8237IyYadADkzeh7iwhxcqi4tg2so+rKUeTp9IMtLq+52Bkf2WbofEXpI/tjIhLcrgN8U4YdY0OmF3DB7DyDLhWDuEBXk6WSfF+55hB+3cC81d2/TgYZ0MVNnik48BJKT5bu7/e0BEBTIACQNYgYRW15ekU4loZCNkLCTXp5Jo5FSiBSkEOIFOKANOwgUy6wZZDDilNCXkpHoJk0zyzaOImKAPEuSyeeFhJ/6VFIUDm5ANkgr/rl7nIEII9Y11dXZa/I84b/6DL8R0fjzRYQf8maEE520Yk/dGJllxppr26gDT/rm3WAM9USaiAeiZIq71Lu0zijbsfEJlw8U+9mJ9yzhJ62enJ4h/GpH/VlaqBeII2kBU1PTrt1SvtQdhH/sHMJPOikv6stm4ckHbYF8UR+k3expd9cl/IQfzjpDqskjeaC+SCflQV2TLtJig0hs92CVC/uCrL5oG+SP9Bgpxc7STznZAAt74lkVYIp6Ik7yQHz4A8xqn3dKP2Ta2j7xTUxMunokHBsEIs88s12G9oh/6pbysEEDFHlgII9yJQ0clGerPwCy+AvbJmVFfO/eDWTTsbyy4gaXeNfJN+8a7ZMweNdslQCrG2gPPi7fTgkbEC5pMYUbbReE7ZHvDe+LvUPng+8y37ki6S+iiCI+A793wn8JGhsYeG6Q1pZ2mZqckdS+9kP0pwAuw8n2X0zx86J84nDnkywNbUrX60Gpuat9hdttSuYVJW3urv42Je6tEP3SXiX9zNj7pfz1Zb0q1yu1bqbfz/obQsJvqC/pUdLf7VYRdDx9J+vjO/KJnzJNB8uVT+VI+JtHaTCEPIffRPe7aJahY6QZrqH4/Y+rU/09388cytJeyp22PwGUhE4ouR9XsLR/RJ8xj6uZfehDSvbHFR/29iUd9YFOj09kbmZW6qpr5NGDh3Lv53uesJd7sv7IEe0nSqaVeEPuFbjjBsGH9D979kyelT9Tgu3tkXmOnRJ+ZCwMBgfcgAAy6g83SLkNFnizEvpytgg8y6bBkXf1SzwMIjBw4NNkuo/XDyow+KBhPCl3aXuiYT16dF8ePLwn9x/+LD/fuyuVbyvd6mHrm6WPTuQDh/W9X5Cx5Q8yt5eWqWRKCf6eDKs+qOU4rHZjWm7j2m9xpJ+yplwTlK+S/URGJnczMrXNLP+BLOnzRupI0iztd7GocoRf69K1kRCFlfWDfLuKLFVx6xSn5HMX/uloQkn/qKz+s0HWvqn1M/1ftSmpVyIPvu6WlJL9tLu7v0cO9fnwqw4nk/qmVfa+a5WNb+tk8a9vZftel5x0al96Rfv+0AsGFzTNDDAdu+0tnvL7Nv3rEP4vobLlpip9kJEVrdPJyWkZGhqRocERT/YjQv8fQ/gBnVw6xNcFKwMKhQfIy0WEH9JgZBPS4K5hU9KBvXXiUbxMe9rRt5cK5Zbq19e5GVpTEARIg5EhFGVLXMw8snTX0sKHDwKXSuUOjsE/RBwSYcQaRZjsOyat4QeTNJJ/BhPyCD8kWOP09abERvMEcSePKOLjvnqu8rPwCJsl6Zwyb9fyQQwJnzKBFJ8l/P6wP4vHiKjXc8+Uq+XRLT2PCD9obm5Sku3DZPnc8BD31DNIkb8CA5JHuVp9oSCMrJ4gf5BOytMUZUmZWP7IC/kjzkIz/KSVcDai0/7Jn5sdVzvyMDObI4ZWd8DsMEMU43v4p6c9sY6XETKQaFP4N4KJos6R84Tft0Vk/OnwPgzIXiHCT3swMo1y7VfbhdU/irIlDGajacso5IiPd4eVDKSHNFJ2EFTeN9JFnNgTJttMfN4I62w7o75It9UD5p6ebi2nfMKfa2f+gEuTt7IO6502yMAAcZsi7XzL2AIwNDSo6fP+SSf5IIz9/T2Xfn4gkeWdbGtrzw54oAiHdmZ1g84AAt+N8FwJP5vv3zMGgKweUPH0MuhHmdLWbPCJeHinSc/hYUbz6eOjzPimMHhEXVvZ5iGa4TeE37wiiiiiiCvhj0z4m1qkuUl/L+sapbaGgeY2mZyYlsRu0s3y09e33/ZCyrud756nEOPnSD/xHzOfZHdB+201o1J5q1Helmr/+rbf09+oRL3pZr80l/RL4w0l8z91S0NJl5J41RV1JR1+v/5N7CKov/oy3BkAgPD72f/GW71SXdomb282y3DDlBxsat/C/SRCdI41KTHCj7IsOegfl0ekQkQCkeZwDXVemXL3+dbBkSwoqZ/Z3VfC6Un/OGQ1qboS1Kl9yKuS080dmVhZkyUltgecs6D+uYZ3eWlZapXs3y67JaWlpXL37h25p6QY/fbt22r+WR4+fCD3799zZtPv3Lmt7rec+bES9kePHsrPP991KwQeP3jgVgmgP/j5ZwfM9nzvzh25r3IP7t2Th4oHPwONJ3q+j58oLuIBFg9pIW13NAxL24MH96N0qf+HrEh4KA81Lux+vqeyt2/K3Ttl8uD+Xbl966bculkqNdVVLu+nJ1qnWrypwxNZXN+WsfllmVzbkjktQ8qTlRPje+zVh9xrGSf3HNgeweCKx4GW+6Ej/JPbaZlVfX4nLfObSdlUv8dEoIoDzS96P0KFXBym9MmvFoBaJT/KyXhCdl6OyvK/GuXDX+ok+W2rHHzbISmu2ftzuxz/pVuOvuqUkz91ysdvOuX0L+zdb5Hdrxtk/S/1svzfqj/ulUzPinbSNFC61No1o3tFl5IBBt6AHNkH9L3CZ3C1vP0aKiwfFM/0L9fXNpQ3TDqiPzgw7Mh+uF8/t5T/CxH+Xxt0+D8HhcICuIWEn1lgCBlu5BMCGxL2Ue24Y48/yCGzvUY8TNFRZ083AxTIQjTpuBtBMEWcLEmmfH0aIbiNLj0hGUAhC3lnRtmlW8OFOMXlIKPM3kIoUDQCW6acziP80bJlVw5e55nwWRkRVxAcyBwEqLY2t9QacpJd0h8R/u3IjXIICb+Lw8VHXJEeIT7Dz6yypc/Nsgb7tilLSDbuDAxAzo0kmSIsCFdnZ5emLZc/SCPhW1ymKEebkSVdhQi/K3eNN8w7S6193XlSxWxwSMpRxEWZ9vXpj2yUn3CbwrT6yQ2KWPnoO9bY5OSsLkNFHhh0Im50m+EnbitTS1OO8G9n22SD25/Y4dp2vF0iz3vAQAlhkLZwywfklxUmDGb19Pa4dsHMNnXP7QnMkDMQMqD2xEGbsfS4vCnwA8mNK/LhylT9UE5GtB3hj1aSWDisAij0nlA/Vjaky9oG9rwHDGB0dHbIbuJsOw8VZxu4slIQHgMgJ7Gyoo3zXWR2n3Li3TXFUn0rP3TO8EilcgN9pmgbNtBkbSisE74vHE5IeCw3QyW1nHzZatgxcl9EEUUU8WXA1qQ/LtwS/2jZP8S/ob5Jf7uGZWdr90wfAoVd3L6Q3BmFCJ98ZjLpTupPdmJFfwsbJ6ThUbfU3umSKvb2/6QEvvSdkv4BaVK9QUl/441oPz8H9rk9/+1uG0Bjmde547/BEX4O92M5f780lelvrJqrbnjC3/y0WxaGVuQkHf3uKPth77InPiTP/3Vw+bkCkDN8AUXK9o8/ynpaSX+CA+cSbnn/uBLS8X19TqVlUonqxOa2jK+uy0piTw5OyAF9mo9+daL2CUqU6H///fdy46efHIkvLS2Rf//7B/nxx3/LTSXH2KFjjw5u3PjJuZeU3MiS/9LSG1Kqz7fLyuRO2U25reHeLCmRMtXvOLsyuXnjhpT8+KOUaFy31B6Uqd1NnlWW51IN+6aGVaZh/PTTjy4e4iaeW7fKnB3pIx0MNLiBgEcPnP6EJf/lT/zAwM935JaS/bKyn+Tu3TIpf/pQ3R7Jvbu33TYEeMg2WxuOT+VICzOl+ryS/uG5JZlc35JZLa/ZvbRM7x8o2feDKVOsqEgq8Vf7SSXzHkr09w5lSkn/1O6BzCQyMruTkpn1XVne2Zc9DZxV+PQ6o+7KtdS57wvWNIKUktvJhGy/HpWVH5vlw3/Vy+ZfGmTn60Y345/+plXSf26Wgz81S0af975pks2v62RN5dZ+bJPdlyNyzB37WxoY8076vkH2T6ItCVlFfG57ST54F5yT4v9K0ScMy4n+MVyUQ/pYxg/hHxoecUTf7dkfjUh+tLT/PPzmCP+vAcglpA5kO9GBO/mHOOCO2cgLhIIZU+yZ4bO7DlkqbuWUlVOiQace8k05QuQgS+6+8YiQIouOv/bOTke+kQOQe0eCTSYC6SVMiAYkymZwmYXFP8ugbX8x6WI/MbrtbY+DtBIPxJjTxQmXcFiajpuTi8In3xBBVhtgTxyA5dE95sZKgsje4jBz3A4/hEnYdkuAuZMHyo/0s8KBNGBPXilr8gRhJ70MeCDnyJ26h/HxTFiQb2bQqQtOsbR6NznqmTBID3kIw7C8kx7iMHurb9ypCwgpS9/7+99lVyyYHMTbhaGwesXNuZtOehSUvQtP8zahYVI3+Le8kT5XtxoWH/UwDEA90H4pt7Bc8Y9f1y5HaUPTrh3zzLYJS6+TVzPt0Aa3GAAif55A+7MFkCF+CCt+sMPN4suFBXLtjHBdO1OibwMEFme8rC2M0J2BBfyHZROmnTS594d3N/LDYAMfTAaFyDuHmUxOTcrC4kJ2gISBFsqMciIfVla0L9oN7x0DARBuiw8Z0kudu7YR2aMD2hXvkz+Ib8qlKzsIE8nRnnt7+1RG332Vo+6ws7C5frKnmzqiLg25csnhPPsiiiiiiKvgLAn+owCSzww/JJ+l/TzXVHP2Clsnx9xWyrjiN+VKBP+Mwg+deCXZpxzwp8/KPg52DmVucF3aXg7Jm7I2eXOD6/t6pPGW/r7cHpCWMtWVuLPM36NLmpXwN5Vpn89B+xaO9PuZ/twM/zupK+mVmlL9fbvTKdV39Lft7YAkljRPsJ4oC9AbW9qcm/HEMY5Qhfahn1+mCOFIg9o70t/tVEbeu/3luzKxn5TJNMv7kzK6sSmjKx9kTons3uGxT4X6OT46cQcJV9fWSrk79O6FvH1bKTU11VJR8VqeP38mr169lKqqt1Jd/VbevKmQ169fOR27yso3zh3gDzuTqVCg4/ZSw32tOmFiz/OLF8+dnrXT5xdRfNjh9qaiQuOtktcVPhyL901lRTYM0sCKQVbDsuoVnT4UEzOs5GRF5NuqN1JZUyF1jdXS2d0q3b2d2n9s1T46VyJ3uwmeo+MTN67ENEhCy2jmw7oMzi3KzNaOLKQOZFrJ/lRyT2b2UzLNqglIf5bwR2Q/eahuRyqjSCrh303J3O6+LOzuyQeVT2p5azU50h80p89W+CccR8h52FdyPrsnB43vZf1Ol8z9rVqW/lorG39rlI3vGAColy3F+nd1svRttcz9o0ZW73ZKqn5WPk4n3KCBJYxBCcrDDVAQPgpL3mODb0kO4dP/pjrv28KkE5NZ9Cfhn0bs3fL9MT+7b3b+AL8cwY+D/ulvZkn/rwXSTZ4coVU992PnYW6F3OP+0A2hHKQhtEc3f66j7+S82cmHYQIlQUbwDNgzE2r2Yfh1zuzdzM7y4O/wPhtWo5t113RFfrLxq84seZg+7IzQOdnIHuDfuTn/+W4GbxfzZ+kjzHj6XBpw84edhW5Zd80X4bn0RPDuZ8MK3dHjYZrduXGd4wawt7ApU8zZ5whhGHG3OOL+48/AwrIyL+R2XjxheIXCtvCw53DCcDUFAwCMLnJQCEvmTA0PDxUI52x4YXxuJUDMTzZf56Q/bh+GF7czez6MpiDfrOhhNQFAxrbqsHqAwQLzFw8n/my4alkXeg7ts+agvCxs/w7n+7kIhb57RRRRRBEXIiK+f1Q0N3vCz5J+dHeYXwODr62uE729vZNddYWyTvn1ST+zi8dKOJSkOtJPGN7lRMnNykRCemumpPpep7wpaZUartq72e3u23eEv1TJfmmPoluflfBz4F9I+N3yfiP8kP1+qeO0/jv9Svi75W2Z5vF+k0x0zkhmN9rWp/FDby4j/GbKV9iYvPm5WF1Wbi4e/QM52z/9KGva75hL7ct0SgnqXkJGtzZlaHlFZtc3JXFwKMcnH+XkkBPWtWyPT2V7a1vmlPQvLC/JyuqKfPiwqlhRbsM10QtKhldkfX1NPqytyrLKYL+6uuzswMrKsrNDR9ZkuEJ3YUnD1TDmF+fd8+Jyzt7Z6fPSisqrzvPcwpxzW9IwkCNMVq6ir6gcYa9q2ixOi5d0rK19cPGTfsw5O5VdXpDF1XlZ3VySjR112/4gm9vqvqHuGt5uMuH3qGtZZrQwWYu6lVECr6R/fHVNprWMZneTMq/E//1+2hH+aSXw00r2p5TsO+yrvJL9aSX7s6ljmU4wy5+WRbVfSCrx39qRtVRa0hoPPUUj0q7+FFdV2faArs/cG5FRuF4mAbK488OxHPWvye6bUdl80i9b93tl41a7rJe2yYa+B5t3OmWrvE8SNWNy8G5VPq6qpwPC9GmhLVEWYRqdwhDF7RAo5+SN/+sq/o6wEhSyzyQbZJ99+5D6LLEPiH7WHrtz8Icg/CFcHqK8fAnEya4jpIE5tC+kx+1C+0LuF9nF3c4zF/Ib2oX2cbvQLW53nltoX8j9Iru4W9x8kV2Iy9zjuEj+PLfP8fO5+Jw0XAW8++yvZ7k7s/yQfz46EH9GGiHJbB2ASIek9bcC0sRNA6ZYTs8z6R0aGnLfOVtOTz7sm5AXRuz5/xoXfa/8gX3/+d/lIooo4v8Af3DCD9i7z6x+TU2dm/HnrnY/68/y/iHtcHPGitKRqCNunfIQlymVUsJ/IoenGTn+6GemWUzHT9EnZSRqLQklK2Pts9JU3i01d9rkbWmz1HJ6P1fuccf+DSX8Jb1K+LuU8Lc5su+W9juyHyzpd4Tfz/Q33nnnZvmry1qV9DdKy9NOWRlbl4+QKU0E6QoJfw727zw6j63NyRaWiCv6ELaC8CJFSCwZT2m5bhwfydz+nkxsbci4kt7pjQ3ZVLIJgeOMnuPMSfbE+COto+NTjiLUHHzSPLj4bEVFkEYNFztnH9Sdyy9+IreTEw1P+zxHp4qTCBr+Mc+GE33+eKIk+9TpxI+Mlz12zyekSd2tH0WcLg5No78NIkzrR7cP/0T9n2jcHGaInbvOjjC07ZwApbHHnw7l4CSt8RxqDRC/pjdKyxHQeA403LTqO1o202vrMrK0LO93dmVBif57JfozDhD/gPAzw6+E3+lK+qcSGZlJHsh86lDmkVXCP7+blK2jYw3bE+qrt4Kcorxz1/v5O+sh/a53xgqYQ7WnnSZU/3AgJ7NJORrfkczwphz0r0qmd0UOhzfkZC4pnzb0BUqpnDYMF5wqNAi/X4lAqw4UCaXu0X+jirbCSlVP9odldHREMab9WCX2EdwAgOrhLH4hom/4wxF+EHaYCyMnU6jzb3ahnjVr2RV0j8hRnp2ZA7fQHZ37vs/YYY6FF5rNLc8O/RppiLtlzYEeT4OzM3MsvFDus/IUzGrn7Py2hdDOg/rDrVAafN3ilu/Hu10c3lk3H56FmbP3+Dw/Zs53i/wUKKOcW6HwcshPwwVuGgczzSwngyizDYBl7nx0WHJuMufF5e1z9fXlkSujOEgXS+DY73RRR4wPKUvpyaf3W6hcDefn9do4bz9+3J5nZ3fONyvmFn7fiiiiiCKuhD8w4WdZv83m2+F9PDPL707vr+U3oclt3+LMm3DlmxF9w1WUUhtPEiFl+nSizIR9xSfKbl0QynTS2xmZH1mRrsp3Un2nyR3oV3ez3R/cp4S/ubRfWsrYz89efiP74ey+/qZB9G8OOMJf607qV/c7XVJzq0Wqb2t+Kkdkj7v5lQFBuvw/UpcDf0kSgCgVziEu16d6l5UXroQKqd9XsryQ2JGx1WWZ2ViX7UxGeeBHR6qPIcMa9Udm+o8xe1J3rJanEElHpjU0/uPmiLOPO3TDHriInexHOVYymznIuCusU5kDSSsOMkqwWe2o5v2DtKQUB4cZyWi7wD6FrAIzdmlNK8/oGezUv20nZADCDVSQniheS4cfACB9uTxYO/P32LOHnlsWjrQsDrQ9HarNqbM//aRE/4SBBgj/R8monlH/rOnYSqdlamVFxrUtzyppn0vuK5FPyTRQwp8j/Ycy6Wb5D2UikXaYwl3lkJ9J7Mn0zq4sptKSpKw0bJtBP68lkHY/2OMzyz/0kPC7Z/LBPfiabre/g5Efa2Ju2UIEluwn1dJGHHBHQ1zNHMyH4q87pI943BMWKkCc0SMKY/BYwOLXV9Y2UQwOMVnFuU70vdleyhlRbE11B/RFe/aN7GMHhkcunuX/QxJ+Q7bzXEQRvwvESbYnqv4ARTU7PR9GznNuOXLLoAhX9EGK3ZJ41d12kAJ+wvDCwZnQLQz76rjIT2E3vl/sf2NElMMZOeiSZVEMArDEbmx8zJ0lkCP7hvPS/eVx/XIAhdNU6NtWRBFFFHEp/uAz/G4/P/v3oxP73SAAs/uuXLgemMFvVr31uD5y/BDZqyq68nAS4Misdu4h/EZ8QnZxnD6V1ekNGawflYYHbVJd1qykn0P6eqXpFmS+V+pLu6ROAdF3dlzNV9ortTd6VO9Tu3eO/Nfc6FS/3Ur4lfjf7pTqUs3f3U6Z6VyUowRMCUJEqnwaTj8xGMF8KOSL2dZcCs8q/EH1yFFhiesqYnPkUM2EevjxVDZT+7K4tSGruzuSOlaiq+4HSqjtempm+iH8KFLB6fGO/CuhdlsnNDCI9MmxEuITzZFz82QaOfyaPQFgTqcOZFdJLbcBcYMU11Rvbm7L5pZCzeval8B+c3NL+xY7zs09b2y5lYNsBcEtK6Pu2KWVJHPdo5F7SwcgH87OPWtSsjr2UX6Y5dc6Yjb/5NOxmo88lCSzVQTynF2RyUCI+mGWWzXlzp9km337i8sysbQis9tJmds/kBlIPqQ+yYF+Svb1eSLJXv6MuwJxMslAAFf1ccCf+tcwphJJJf9J+ZA5lD1WE2jBxVuCI7AgMjtg1n++5XuT94Gutpq3T5o30bz4Z5PzUi40M3gv2Uh9aB5aAGqBpSHyA6hngJlHBUFk086fEP/Livpj2ylkH6LvZ/ch8X6Gn/v3Q9LvTuZXc97BfQHJD/GHJvwhbIaN5bHZ2TWHnFvWzsznzjSeYx8Pz+xCt7id0yM/IUI/cbusW4A8u1gaDOZm5jzd/MT8OvvI7ozfwD7UXRhxN+ztOW5nCP2EcjEzfvJQyO4ie/A5bp/hJ5vemE5e4nZ5KGRXGHFyGT6fZ/5PB98wCD3vNofrcXAeOgfhubMg1L2Qv/8UuGX+2kaKy/mLKKKIz8YfnPBfDAYCPPi9oJ9MH5mbZq6yNB3lSE+k4jzCkxP+Qqs95fik5AnHT8efJLWmRKt7Tlqf9UrNbYh/u9/bz538SvBrSnqkVtF4a0Cabw9K481+qS9hMMDfz88gQOOtHncWQP2tbmm8o/I3O6ROw+h8MiTLI+tyeqjxR+SHtJ6csmSc9Qc+VbYUmvSeVbh8WcLPbOypgpANx1omB0r09w5SkkjtObNbsq7ECPJPzMhB9Lllx83oapJOleVeBKrwVPPOCf/AEW0NDHM6lZHtrV3ZWFeyv+axGdNDbKrc5vpWBGQiPQLhMCiQTLJNEkJO3Jo3jev4mCX8StQ1/kLpzAdybBE41jyy3D+HT5p3t3LAMXytEdXhzeRJnTzP1XJKKMmfXlyVsZV1mVESPwOZ5xpEzKkjJfUHMrbLNX3a/vY98QeQfg7345A/9v1P7bFCYE9WWdmgBc7wS7Yl6J9PmifXtgLFkxHz/FoG+KY9+TaluXX/2ADDgEJ4XoBTBGZeyaQasmFSwMCNmJCYCDgjCiKNWA04O2UykdyvocJvgym+K5B9+DiHjrMNFcLviP8I1/BxaN/51+5dhiLh/4IIO+RXhiN218RFfj4nvC+Nz0nf5+bpt5DfL4r8dvRLz5uAxHtyG87IB4jscmQ/nDWPz6AbSY7CO2PvzefP8H/OoEI8DfkonIZ8kH9DIfccLsqTmUMgc9X0Xc3+2tD2X+hbVEQRRRRxKYqE/wJ4ss8Vx3xrWeXGoDGdb2Z57SyY8xQdejrwhQYHPJcw6uOpNXTm9PRIyZuGi4B6O947kdWJTempGpaqOy1SUdIo1bc4eX9A6m6xZB/iD8F/Jy13hqRV4Wf8WQ3QJ823+/zp/bf1+S7L/bul5icl/WVd8q5mXHaWk9m43BJz/ccgBP885cLGi5xV5OvLEX6XDC0zCL+F5lKkZPJESX6GpfTpfUkqEg5p2ctkZP8w4/RkSp/305JKZ+Qgw5J6j5TTjyOY/bHK6PPBkewruU8qCd5Xf+lDtVfspw8lqeR2N7Evu0qGE5dB5S5FMuXicumwODTevZQSZjWTFnTScRFSmm/ALUN50HAYqDhQmQPCSvkwDzInzpxKH8nh0Uf3vLyxI+/eL8rg6qZMJ9JK+LmnH/LPUv6MjO+ylN9O7QeYAYTfk35H/JXwzyvx39H6YdtAlpD7yowecsq3Lw/+egED7ci/B5g92f+o4Ro+OfJPm3QRQJgd4uEo/NKIACbrvTpEWn6sWafA8GWUfQ/yBgHVbM/oqVTKcXGW8UP2mdmH+HMO1UiR8BdRxNWQJUiOUBsCOzdwENmHgwjOb4Csm5nj9he5xezPuBWyj8nnuZk5dDc3D4ilkcuQZBYinBfJXccutA/d/ugoVA5hucXdLrK3ei/U1osooogiroQi4b8AuRl+rkzlu8uNL/SPOduGU9c51M1U2Hk3xfNFqwGgPUaBICrOTBgE463kNPNJEsspmeiak6YXPVJxS4l/abvUKJn3xP+dO5GfpfyN4CbokSYl+o1l3erGif9d0qTyDALU3eiS6hsdUn+/Uya638vxvuaBuCK2k0tRLmX5uTJlnvJo0mcrn2UIHX958jaihP8Ts9gchHecke3Etiytrcrc6pLMLitWlmVuRZ8V88ursrCy5jB/CRZW11VuXeaXPsj7xVWZXVxR//hVe9wUPM8vqd1FMD+XYB49CPf9ksapmNP4sVtc3fDuMX/50LhWkf+g8jGom2Fh+YPMufyorPqb0/yRR+JY2diWGbXrnp6Xd5p+CD9L+id29pXAZ2SG/ftuGb8d4udn90PSP7nvMc05ALu7spral31t58zC0yqcsioEkcpvW9a6cmDg66MCss/fI32C9GNLu+BfVj4k9KG9g7VLe44SUiBNSBnhB0j/WsoIf6HvBIM2XKsI2ec6Z67qhuxzxbPt4x8ZufgU/stwbcJfRBH/ici1ZcyGwM6Rp8g+JFLOb4Csm5nj9he5xezPuBWyv8jNzIGb2p/Jv5vFv2x2+/eLi1ZJ/NIVFL8OtA61LrPPcXOhOi6iiCKKuDZy99IXUQh8aznYz28N4/cV0s92MQ595TC/TIZTxC5Q8Awj8YY8FTrkBNx1c5xUHnGXo+SJrExtSlfNqLy91yVvbndIZVmH1NxiBr9fCX+PI/MNJd3SWNLlTvfnQL+aG+1S81ObMzcr4fdnAHRL9c1WaXraJQsjK/IxrfFotG7rtOof1cABcBA0n5pCysgUOF/qOgrK5/9F4cZIHfvUD44ysrm7o2R/UQYnJ6QfgjQ+KQMTk/JubFL6Rsalb3RS+senpO88jE2p+7T6M2CnftXe6eq/d3QisrsKfJjXAel7N+HjH1B9YGIm+3w+1N+E+leg5wG3COSxZ1TLQdM2MDnj8urzM6XPs9I//V7655dlfDPh9vBz1/7EDnvz/Z5+SD938Bcm/BHpd/ZpmeIAv2RCdqNZfmrKKZqEIVK+ZnPkPZ/wY+uJ/rGDJ/sFZcN2EbUNYP+Q9UNHOZu8FhqkC82TftvCEsaV5+uLKL4F4eogBgEg+3xLbBk/ZB+CD9Fnlt/28DviHp7If00UCX8RRRTx5RGS1PhzYGaQ4jz3rFvornqWpAdyJhv6idud5xbaZ+3MHLOP231xWFqCNGXTR7oC+yKKKKKIX4ZCJLcIQ7ikP+wXs7wf0t/V1eWuzeIK21DRqc9bvus0/hgKqyx/QQSzrTPGTvWPR59kZzUt491L0vC8T17ebJDXN5qk/na3tNzpl5Zb/dJc1qtkv1uabirxdzP8HUr626SupEMa9BnC38Q5ALc6pbKsUdpf9cvOwp6f3oySB+H/6CKPpTVy9woDCbMEfwnlI8gjd3nwwwGZkyNZ39mW6cUFGeHastlZGZlbkNG5RRl+vyDD80syooR2+AIMqezQ3JIML6jswrKMLq6ovT4rcBvEXd2ugsFLMES4qlv4Fh8YWfDxIuPTdD5I04CmeUBl3xXEorwjvqVVGdA4kBtW8/Dyqgwu6rO6DajM4NKKTGwlPblXcNe+I/vM8CumkwcyC+lXco/Z79838u8x6Zb/q/tuQuaV8G+FhN/aiSFSRsNzJJ7GbfC1jsnIN/BUXeEGzRRsFTBz5OZDCv348InHrxnwMSGdVcGDb13eFyH4l+GMjy+i+CbYdwHiz5kgXIMNuYfo261Y6LZ/Pwu7f/8zcW3CH7cvoogiftsotNTfI3JzJDIuF7c3t7jZ5AO3LCkN3c2+gB/SaG6h+Yyf4PmMXITAjdUPeX7MTfUzboH/HKE3mUjP2oVuoV1gn2cXd4vbB2556QnNHoXqt4giiijiswCpLbicvYjsHv4WT/jtVhcOgGWJP/1kZvspR2bmOJ3drl1DZcl+VvEMPHEtqNQab+wCyB54hqbcgz32TqlbZvdEFkbXpLtqWGrvt0nVzWZH7Jtu9kiLkvlm1UHLbfbxs8e/0xH++tJON9PfyGDA7W6p4SDAO60y0jwj6fWM5zhOGYWK4kRhNGQVDxfk59rKR+ApXGF4909yeHIsO6l9WdZyn9vYlNlN1XcS8j6xJ+9392R2N+n08zCzo4R3O+H0WX2eRQ+BjIbFwXTn6pF5+hIg815liZd0EXbWrHFZWmZ3sIvDyxumd/c1TI+pAJMOezLFMnuW3OvzhPp1dnsqo/ZTap5UO+TfpyD0fmZ/UjGrBB44gp9gub4n+4Ys2U8a6T90J/iTv/m9hGweH3rCr1UYTLp7RIoazBF+2hcNzuBrF+RsAuWahv5BIHq3+MujUXTgo/NtxRN+Pwhghwpm1ZnAferESQILLU/ws5UNAoaKA/oWFhYcwbcD+jCHzzbDj3nY7eFX8v6ZKBL+Ior4A8G9x45IBuDZ7EK3LOEMn0O7SM/aG2LuZl/ILi6fZ1bdpRm7UI/5wc7cQ7e4Xxde4Mfksn68nSun0I/TrfxCN8yx8BzMLuc3Z1bd4ozrcbvAPqzDIooooogvgiLhvwCe8BtY0h/e+BKSfmb8+/v7ZX19Pe++/qxyBCWOc5Q6uZl+9YO3rO6YFLo6stz/4JMkV5SodS9JR3m/1N5okZp/t0rjjS5pLu2RptJuN9vfwoF9Su4bytjL3+HIf2NZlzTdUvs7vVJ7u13qH7XLTC9X9SnJ0Ti8gpwEBAV7Q6Q89Y5Z/mLlw/OUkH9GEP0/Twu94qq55OGxfNhLy4IS2vcR2XXY4xA6dJape31W9Sz2mcX2btwxDwmeTnAQnYYR+Z0G7FU/A66nC8wcYOegz2d0byZNzo64IN8Ki2tW3VxaojTlI5dWD7/k3s3AQ9odMjIdYCqtUNkJjWtc45iA8Gs4gDQjTxgTu2kZ32YQwAg/s/vs6dd0OtIPItKfJfz+jn4H57Yvc/vJaxN+atYTbIi1p/fWkgxZFXeIHAk6DIFn7+Qj5p+f+fcU3scSqTxDGBLvLzgzRPCLFGSfGX3/Pvs9+/BuyPzg4JAScr+EH2Bmtj8cAMgR/uKhfUUUUcSvAE9WjahijkioM0fPWfdz3LL2cbcIeW5x3cOlJdDjdnH3z7ejc3dWzuzz7QrJXWYX5hUE+dVy8O5evogiiijiV0WR8J+PJn9Pv91uA8G3cnO/We577Q/0g/DTb+7t7XUzdul0Sjv4WUbhOvieWIQooAJnR/L1j10XZ4q72D+ykgBL1Y62TmR9ZEtG3k5JC1fvKemv/7FdGkq7pL4Ekq8E/1aXNNzuVNLPff6dSvYVHOx3k6X9XW6Wv/11r6xM+av6fERRQiytBR/9vy+msuF7wh/u584/uM3HSRIz+pg8OZXNo2NZUKI7qQQU+JPkowPm1BzHVErJqhJfc5/AH24QY5NTwuxg5rieNfs4vV1c92bIt5dNOzPxTTArz4CApSUbfphmM6MrlGRPJphd5858f28+mFCMRxgl/D2V0zDH1a8n/WpHXhXTXLfnTufXvO5GhF7hiL6mb5al/W6Jf1oRuWu4WcKvmFbMJJBLymxiVzYPM44iu9qxKspVlVOXEX4nH/PjzCEiZaL4jHx7hcEvkcGgj2diiSnnQWFSIeHH/pcryL7N7qOzBWhpaVkmJibcdXuAO/ZzM/l+Zn9szPbvq86Sfmf+YoR/Rj90EH4+avwQ8IHzus1UhXZOd2b74eD5PBl0c7umTIiLZMx8XRnDZTKYP0fGISZjbqHMVcsxWw8XyGTdrikTyv0aMg5qvkwG81Vk8twMV5Ax98tksm7XlAlxkYyZrytjuEwG81Vk8twMV5D5td/9C2QcUTY7dbc9l+475ey8TOjm7AqYs4Q+62Z2kR7Ym525h255fojbucXSFz3nhxnJmry5hTLmfplM1u2aMiEukjHzdWUMl8lgvopMnpvhCjK/dpsNcZGMma8rY7hURs2XyWCOyzjEZMwtlLlqOV5FJut2TZkQF8mY+boyDmq+TAbzVWTy3AxXkDH3y2SybleQcShAdIuIwU+C1dfb9a7s52eJPwfhNkcz/q3SUO+X/Xd0dMjk5JTsbO/mLfE39UmJiMdZ6mGK2fzz3dXeXTSvBAIOoVF8Ovgk+8sZmetake6XQ1J/r0Oqb7ZIJdf43WyVeiX7jbc5xE8Jv6KZU/tLe6ThhoJr++52SvXdZumrGZadxaR8sjvWSIJLRpgWbzan0OUXqyBAND87a/uwPU0MFTJREQhHJya0TFYzhzK3x1L6hBJYv6QdwszsNoQXjBn5VaJthD87Aw753mcJO8QfvRBCN8yG0C1nD1GfUPKM7kizhu/sNF5nR3zO7kDtkI10M7sBAnSVUUwp0XaEX4m5YUIx7nAgo9yjr6R+On0kU24gQeN2Aw0+DncKP4Rew3m/dyjv1R/L+Jnp56R+v3/fz+BPqT/gSL/K+OX+qu+mleinZGk/JWupfUkeMzQTtAery6yF1ReDOdBwb/I1CAKj+QnDMEQKMYsvsPYPLoycrVmFQecrk9AQPynRB/m5+WzFe8zMvg3cpdMHsrTIzP6YDDliP+a2BOWTfbOD3I+onZJ/Nbtn9uMXIPNXQYzwz+rHjRFN/UHI/jjwwfOdVddhdXbRD0X4I1LILS6Tp19DJsRFMtkw7Tlmf56MwxVkKItLZQKEYbrnCKFbXrwBfqlMnn4NmdD8a8g4XEHG3C+TyboFYV5FxtwvlDG7+PMVZEJcJJN1u6aMwxVkCrbZuEwBN8NlMpivIuP0+PMXkslz+xVkHK4gY+5xt7hM3L+Dmi+TwXwVGafHn68gE+IimazbNWUcriDzn95mQ1wkk3W7pozDF5Ix99At+xwhdIuH+aVknB5/voJMiItksm7XlHG4goy5XyYTd3NQ82UymK8i4/T4cyEZ1Yu4OrTMwsFgs/PfKhsoxtwidXUMBDTJ0OCIbKxvyPFxPum3pb0243dtZdwk4CjGZo5TH2VrKSXDHTNS/7RdKu82uIP5am+1+dn9m53SXNolLTe7paW0T5pKFGV9Un+7S6pKm6X2bruMNcxKalHpc94JbOSBiCyy/z1F7OAiFRYFVG0nk5HFxK7MbG3J9PaO22fuCL2S3wkl9KNKtIHNeGfvlVdiDLIz225WW0mvg5lDu/jzeTKXuRkKyYR2ASDpcbsrwpF6JfzvHdSsz/6wPnXPrhw4FFYJMFDBgMMUKw9292RyO+nOJJjeSchicl8SJ6dua8XpuQNUvw119dRFL9M1fIQKgm8I1enpJ9nfP5CV5Q9K5idlYGBYhoZGHIkfG5uIyH1hov6lUIDwt3jCn/3QeT1H+CP7IooooogiiiiiiCKK+CND+8nNzcz0t0lzU6vU1zVKQ32TdHf3ysL8kqTTF1/dd/5sfgGFqPERQ6BOjz/J7mZa5kZXpK9hVOoft0tVWZNUlTRJfWl7RPZBr7TefCeNJb1Sx/V96lZd0iptD/tlvuODHK0pyYc9uwgg/LbUGVr921Wk9vDjqZJ+JVfJPVlIJJXUcmBdtCx+PyPjSvrHlXzFCb8n+p7sQ4IhwNml7L8j5BN+lu7nyL47jG/vSMm+bRfQcqLs2H6gJB+iv6Bltbi3L5uZjGQgt77o/7AqJPmGUJ2cfJS9ZEqWl1ZlYmIqO0vvyP7oxBli/muhvb1d/j8ziiT8fHj2WAAAAABJRU5ErkJggg=="""
-
+    Returns:
+        tuple: (docx bytes, file name)
+    """
     logging.info("DOC being made.")
-    doc = Document()
-    section = doc.sections[0]
-    section.different_first_page_header_footer = True
-    logging.info("Adding Image Header.")
-
-    # Add header to the first page
-    header = section.first_page_header
-
-    # Set the header margins to minimal
-    section.top_margin = Inches(0.5)
-    section.header_distance = Inches(0.3)
-    logging.info("Decoding Base64 image.")
-    try:
-        # Decode the Base64 image
-        image_data = base64.b64decode(base64_image)
-        image_stream = BytesIO(image_data)
-
-        # Add header to the first page
-        header = section.first_page_header
-        paragraph = header.paragraphs[0]
-        run = paragraph.add_run()
-        # Set width to span close to the entire page width (standard 8.5 inches - left & right margins)
-        run.add_picture(image_stream, width=Inches(7.5))  
-        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-        logging.info("Header image added successfully.")
-    except Exception as e:
-        logging.warning(f"Failed to add header image: {e}")
+    doc = template.load_document()
+    render_knowledge_scan(doc, scan_data)
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    # Named after the scan, so a change-feed batch delivered again overwrites rather than duplicates
+    file_name = f"knowledge_scan_{scan_data.get('id') or uuid.uuid4()}.docx"
+    return buffer.getvalue(), file_name
+
+def render_knowledge_scan(doc, scan_data):
+    """
+    Adds the knowledge scan's sections to `doc`, below the template's header.
+    """
+    # python-docx is imported with the first scan rendered, not when the worker loads the function
+    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.shared import RGBColor, Pt
 
     # Add content to the DOCX file
     logging.info("Adding Header Paragraph")
@@ -169,40 +162,113 @@ def generate_docx_from_knowledge_scan(scan_data):
     else:
         doc.add_paragraph('No summaries available.')
 
-    # Save the document to a file in the temp directory
-    file_name = f"knowledge_scan_{uuid.uuid4()}.docx"
-    doc_path = os.path.join('/tmp', file_name)
-    doc.save(doc_path)
-
-    return doc_path, file_name
+    return doc
 
-def main(inputDocument: func.DocumentList, outputDocument: func.Out[func.Document], outputBlob: func.Out[str]):
-    logging.info("GenerateDocx function triggered.")
-
-    for doc in inputDocument:
-        scan_data = fetch_scan_data_from_cosmos(doc)
-
-        # Generate DOCX from the scan data
-        doc_path, file_name = generate_docx_from_knowledge_scan(scan_data)
+def get_render_pool():
+    """
+    Process pool for rendering, created once per worker. python-docx rendering is
+    CPU-bound, so threads would serialize on the GIL.
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=int(os.getenv("DOCX_RENDER_PROCESSES", str(os.cpu_count() or 1))))
+        return _render_pool
 
-        # Read the content of the DOCX file
-        with open(doc_path, 'rb') as file:
-            doc_content = file.read()
+def get_container_client():
+    return clients.get_container_client(os.getenv("DOCX_CONTAINER", "curated"))
 
-        # Create a fixed filename for the outputBlob binding
-        fixed_blob_path = f"curated/{file_name}"
+def render_scans(scans):
+    """
+    Renders a batch of knowledge scans, in parallel when there is more than one.
 
-        # Save the document content to the Blob using a fixed path
-        outputBlob.set(doc_content)
+    Returns:
+        list: (scan, docx bytes, file name) or (scan, None, error) per scan, in input order.
+    """
+    with telemetry.span(telemetry.DOCX_RENDER, documents=len(scans)) as span:
+        if len(scans) == 1 or os.getenv("DOCX_RENDER_PROCESSES") == "1":
+            futures = None
+        else:
+            futures = [get_render_pool().submit(generate_docx_from_knowledge_scan, scan) for scan in scans]
+
+        results = []
+        for i, scan in enumerate(scans):
+            try:
+                if futures is None:
+                    doc_content, file_name = generate_docx_from_knowledge_scan(scan)
+                else:
+                    doc_content, file_name = futures[i].result()
+                results.append((scan, doc_content, file_name))
+                span.add("bytes", len(doc_content))
+            except Exception as e:
+                logging.error(f"Failed to render knowledge scan {scan.get('id')}: {e}")
+                results.append((scan, None, str(e)))
+    return results
+
+def upload_documents(container_client, rendered, max_workers=8):
+    """
+    Uploads rendered documents concurrently, one blob per scan.
 
-        # Prepare the output document item for Cosmos DB
-        doc_item = func.Document.from_dict({
-            "id": str(uuid.uuid4()),
+    Returns:
+        list: (file name, error) for every upload that failed.
+    """
+    from azure.storage.blob import ContentSettings
+
+    def upload(item):
+        doc_content, file_name = item
+        try:
+            with telemetry.span(telemetry.BLOB_WRITE, blob=file_name, bytes=len(doc_content)):
+                container_client.upload_blob(
+                    name=file_name,
+                    data=doc_content,
+                    overwrite=True,
+                    content_settings=ContentSettings(content_type=DOCX_CONTENT_TYPE)
+                )
+            return None
+        except Exception as e:
+            logging.error(f"Failed to upload {file_name}: {e}")
+            return file_name, str(e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [failure for failure in executor.map(upload, rendered) if failure is not None]
+
+def main(inputDocument: func.DocumentList, outputDocument: func.Out[func.DocumentList]):
+    logging.info(f"GenerateDocx function triggered for {len(inputDocument)} knowledge scans.")
+
+    # Incremental scans are written while they run; only finished ones are rendered.
+    # Scans written before the status field existed are complete.
+    scans = [dict(fetch_scan_data_from_cosmos(doc)) for doc in inputDocument]
+    scans = [scan for scan in scans if scan.get('status', 'done') == 'done']
+    if not scans:
+        return
+    rendered = render_scans(scans)
+    failures = [(scan.get('id'), error) for scan, doc_content, error in rendered if doc_content is None]
+
+    container_client = get_container_client()
+    to_upload = [(doc_content, file_name) for _, doc_content, file_name in rendered if doc_content is not None]
+    failed_uploads = upload_documents(container_client, to_upload, int(os.getenv("DOCX_UPLOAD_CONCURRENCY", "8")))
+    failures.extend(failed_uploads)
+    failed_names = {file_name for file_name, _ in failed_uploads}
+
+    # Prepare the output document items for Cosmos DB, written together in one output
+    doc_items = func.DocumentList()
+    for scan, doc_content, file_name in rendered:
+        if doc_content is None or file_name in failed_names:
+            continue
+        doc_items.append(func.Document.from_dict({
+            "id": os.path.splitext(file_name)[0],
+            "scan_id": scan.get('id'),
             "file_name": file_name,
-            "blob_location": fixed_blob_path  # Store the Blob storage location in Cosmos DB
-        })
-
-        # Output to Cosmos DB docxContainer
-        outputDocument.set(doc_item)
-
-    logging.info("DOCX file generated, uploaded to Blob storage, and location saved to Cosmos DB successfully.")
\ No newline at end of file
+            "blob_location": f"{container_client.container_name}/{file_name}"  # Store the Blob storage location in Cosmos DB
+        }))
+    if doc_items:
+        # The output binding writes the documents after the function returns; this span
+        # covers handing them over
+        with telemetry.span(telemetry.COSMOS_WRITE, documents=len(doc_items), bytes=sum(len(item.to_json()) for item in doc_items)):
+            outputDocument.set(doc_items)
+
+    logging.info(f"{len(doc_items)} DOCX files generated, uploaded to Blob storage, and locations saved to Cosmos DB.")
+    if failures:
+        # Failing the invocation lets the change feed deliver the batch again; names are
+        # derived from the scan ids, so documents that succeeded are simply overwritten
+        raise RuntimeError(f"{len(failures)} knowledge scans could not be turned into DOCX files: {failures}")
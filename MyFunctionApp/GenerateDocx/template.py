@@ -0,0 +1,84 @@
+"""
+Prebuilt DOCX template for knowledge scans: page setup and the first-page header image.
+
+`template.docx` is generated from `base64.txt` by running this module:
+
+    python MyFunctionApp/GenerateDocx/template.py
+"""
+import base64
+import logging
+import os
+import threading
+from io import BytesIO
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "template.docx")
+HEADER_IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "base64.txt")
+
+_template_bytes = None
+_template_lock = threading.Lock()
+
+
+def new_document():
+    """
+    Builds the header and page setup from scratch, decoding the header image.
+    """
+    from docx import Document
+    from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+    from docx.shared import Inches
+
+    doc = Document()
+    section = doc.sections[0]
+    section.different_first_page_header_footer = True
+
+    # Set the header margins to minimal
+    section.top_margin = Inches(0.5)
+    section.header_distance = Inches(0.3)
+    try:
+        with open(HEADER_IMAGE_PATH, "r") as file:
+            image_data = base64.b64decode(file.read())
+
+        # Add header to the first page
+        paragraph = section.first_page_header.paragraphs[0]
+        run = paragraph.add_run()
+        # Set width to span close to the entire page width (standard 8.5 inches - left & right margins)
+        run.add_picture(BytesIO(image_data), width=Inches(7.5))
+        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    except Exception as e:
+        logging.warning(f"Failed to add header image: {e}")
+    return doc
+
+
+def build_template(path=TEMPLATE_PATH):
+    new_document().save(path)
+    return path
+
+
+def template_bytes():
+    """
+    The template's bytes, read once per worker. Falls back to building the template in
+    memory if `template.docx` is missing.
+    """
+    global _template_bytes
+    with _template_lock:
+        if _template_bytes is None:
+            try:
+                with open(TEMPLATE_PATH, "rb") as file:
+                    _template_bytes = file.read()
+            except FileNotFoundError:
+                logging.warning(f"{TEMPLATE_PATH} not found; building the template in memory.")
+                buffer = BytesIO()
+                new_document().save(buffer)
+                _template_bytes = buffer.getvalue()
+        return _template_bytes
+
+
+def load_document():
+    """
+    Returns a new Document opened from the template.
+    """
+    from docx import Document
+    return Document(BytesIO(template_bytes()))
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build_template()}")
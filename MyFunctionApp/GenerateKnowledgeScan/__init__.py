@@ -2,15 +2,83 @@ import logging
 import os
 import uuid
 import json
+import threading
 import requests
 import azure.functions as func
-from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
-from azure.cosmos import CosmosClient
-from collections import defaultdict
-from common import summary
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from common import clients, dedup, lookup, mapreduce, ratelimit, search_backend, summary, telemetry
 
-def generate_knowledge_scan(query, doc_ids):
+# Incremental scans are handed to RunKnowledgeScan through this queue; the frontend
+# polls GetKnowledgeScan for the partial results it writes to Cosmos DB
+SCAN_QUEUE = "knowledge-scans"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+def fetch_bibliographies(bibliography_url, doc_ids):
+    logging.info("Calling Bibliography function via HTTP.")
+    bibliography_response = requests.post(bibliography_url, json={"documents": doc_ids})
+
+    if bibliography_response.status_code != 200:
+        logging.error(f"Failed to get bibliographies. Status Code: {bibliography_response.status_code}")
+        raise ValueError("Failed to retrieve bibliographies.")
+
+    # Ensure bibliographies is a list of strings
+    bibliographies = bibliography_response.json().get("bibliographies", [])
+    logging.info(f"Received Bibliographies: {bibliographies}")
+    return bibliographies
+
+def combine_with_bibliographies(pdf_names, pdf_summaries, bibliographies):
+    """
+    Pairs each PDF's summary with its bibliography, in reference order.
+    """
+    combined_summaries = []
+    for i, (pdf_name, combined_summary) in enumerate(zip(pdf_names, pdf_summaries)):
+        # Retrieve the correct bibliography for each main PDF, ensuring it's treated as a string
+        bibliography_entry = str(bibliographies[i]) if i < len(bibliographies) else "No bibliography available"
+
+        # Add combined summary with bibliography
+        combined_summaries.append({
+            "pdf_name": pdf_name,
+            "summary": combined_summary,
+            "bibliography": bibliography_entry
+        })
+    return combined_summaries
+
+def referenced_summaries(combined_summaries):
+    return [f"{summary_info['summary']} [{i}]" for i, summary_info in enumerate(combined_summaries, 1)]
+
+def build_overall_summary_prompt(summaries):
+    overall_summary_prompt = "Please generate a comprehensive and cohesive overall summary based on the following document summaries. As you synthesize the information, incorporate superscript reference numbers corresponding to each source document using the format exampleTextⁿ, where n represents the unique reference number for each document.\n\n"
+    for referenced_summary in summaries:
+        overall_summary_prompt += f"{referenced_summary}\n"
+    return overall_summary_prompt
+
+def general_notes(query):
+    return f"Generated based on query: {query}. The Library Services AI Agent has conducted a search for journal articles, books and papers or reports from GcDocs repository. Following is an AI generated knowledge scan report."
+
+def scan_record(scan_id, query, status, combined_summaries=None, **fields):
+    """
+    A knowledge scan document in its Cosmos DB shape; GenerateDocx only renders those
+    whose status is 'done'.
+    """
+    return {
+        "id": scan_id,
+        "query": query,
+        "status": status,
+        "combined_summaries": combined_summaries or [],
+        "overall_summary": "",
+        "general_notes": general_notes(query),
+        "keywords": "",
+        **fields
+    }
+
+def generate_knowledge_scan(query, doc_ids, scan_id=None, incremental=False):
+    """
+    Builds the knowledge scan for the selected chunks and saves it to Cosmos DB. With
+    `incremental`, the scan document `scan_id` is updated as each PDF's summary
+    finishes, so a client polling it sees results before the overall summary is done.
+    """
 
     overall_summary_system_prompt = """
 You are an advanced AI assistant specialized in producing comprehensive, structured, and well-integrated overall summaries of multiple academic or informational document summaries. Your summaries should emulate the style and depth of scholarly abstracts, seamlessly combining information from various sources into a unified narrative. The summaries should include the following elements:
@@ -42,9 +110,6 @@ You are an advanced AI assistant specialized in producing comprehensive, structu
 """
     try:
         # Fetch environment variables
-        search_endpoint = os.getenv('SEARCH_SERVICE_ENDPOINT')
-        search_key = os.getenv('SEARCH_SERVICE_ADMIN_KEY')
-        index_name = os.getenv('SEARCH_INDEX_NAME')
         cosmos_db_connection_string = os.getenv('COSMOS_DB_CONNECTION_STRING')
         cosmos_db_name = os.getenv('COSMOS_DB_DATABASE_NAME')
         cosmos_container_name = os.getenv('COSMOS_DB_CONTAINER_NAME')
@@ -55,76 +120,104 @@ You are an advanced AI assistant specialized in producing comprehensive, structu
         bibliography_url = os.getenv('BIBLIOGRAPHY_FUNCTION_URL')  # URL for Bibliography function
 
         # Validate environment variables
-        if not all([search_endpoint, search_key, index_name, cosmos_db_connection_string, cosmos_db_name, cosmos_container_name, aoai_url, aoai_key, model, aoai_version_completion, bibliography_url]):
+        if not all([cosmos_db_connection_string, cosmos_db_name, cosmos_container_name, aoai_url, aoai_key, model, aoai_version_completion, bibliography_url]):
             logging.error("One or more required environment variables are missing.")
             raise ValueError("One or more required environment variables are missing.")
 
+        # Per-PDF summaries and the bibliography lookup are independent; run them concurrently
+        max_workers = int(os.getenv('KNOWLEDGE_SCAN_MAX_WORKERS', '8'))
+        # Token budget for the summaries placed in one prompt; larger selections are reduced hierarchically
+        context_tokens = int(os.getenv('KNOWLEDGE_SCAN_CONTEXT_TOKENS', '12000'))
+        # Reductions run inside per-PDF tasks; this keeps the scan's model calls at
+        # max_workers in total rather than per pool
+        model_calls = threading.BoundedSemaphore(max_workers)
+
+        def generate(prompt, system_message):
+            # Knowledge scans are interactive; the rate limiter serves them ahead of ingestion
+            with model_calls, ratelimit.priority(ratelimit.INTERACTIVE):
+                return summary.generate_prompt(prompt, system_message, aoai_key, aoai_url, model, aoai_version_completion)
+
         # Initialize clients
         logging.info("Initializing Search and Cosmos clients.")
-        search_client = SearchClient(endpoint=search_endpoint, index_name=index_name, credential=AzureKeyCredential(search_key))
-        cosmos_client = CosmosClient.from_connection_string(cosmos_db_connection_string)
-        database = cosmos_client.get_database_client(cosmos_db_name)
-        container = database.get_container_client(cosmos_container_name)
-
-        # Call the Bibliography function via HTTP to get the bibliographies
-        logging.info("Calling Bibliography function via HTTP.")
-        bibliography_response = requests.post(bibliography_url, json={"documents": doc_ids})
-        
-        if bibliography_response.status_code != 200:
-            logging.error(f"Failed to get bibliographies. Status Code: {bibliography_response.status_code}")
-            raise ValueError("Failed to retrieve bibliographies.")
-        
-        # Ensure bibliographies is a list of strings
-        bibliographies = bibliography_response.json().get("bibliographies", [])
-        logging.info(f"Received Bibliographies: {bibliographies}")
-
-        # Group documents by their source PDF (using file_name field)
-        doc_groups = defaultdict(list)
-        for doc_id in doc_ids:
-            result = search_client.get_document(key=doc_id)
-            pdf_name = result['file_name'].split('_chunk_')[0]
-            doc_groups[pdf_name].append(result)
-
-        combined_summaries = []
-        for i, (pdf_name, docs) in enumerate(doc_groups.items()):
-            # Combine summaries for each PDF
-            pdf_summaries = [doc['summary'] for doc in docs]
-            combined_summary_prompt = f"Can you summarize these documents based on the user query: '{query}'? " + " ".join(pdf_summaries)
-            combined_summary = summary.generate_prompt(combined_summary_prompt, "You are an AI assistant that summarizes texts.", aoai_key, aoai_url, model, aoai_version_completion)
-
-            # Retrieve the correct bibliography for each main PDF, ensuring it's treated as a string
-            bibliography_entry = str(bibliographies[i]) if i < len(bibliographies) else "No bibliography available"
-
-            # Add combined summary with bibliography
-            combined_summaries.append({
-                "pdf_name": pdf_name,
-                "summary": combined_summary,
-                "bibliography": bibliography_entry
-            })
-
-        overall_summary_prompt = "Please generate a comprehensive and cohesive overall summary based on the following document summaries. As you synthesize the information, incorporate superscript reference numbers corresponding to each source document using the format exampleTextⁿ, where n represents the unique reference number for each document.\n\n"
-        for i, summary_info in enumerate(combined_summaries, 1):
-            overall_summary_prompt += f"{summary_info['summary']} [{i}]\n"
-
-        overall_summary = summary.generate_prompt(overall_summary_prompt, overall_summary_system_prompt, aoai_key, aoai_url, model, aoai_version_completion)
+        backend = search_backend.get_search_backend()
+        container = clients.get_cosmos_container(cosmos_db_connection_string, cosmos_db_name, cosmos_container_name)
+
+        def save(record):
+            with telemetry.span(telemetry.COSMOS_WRITE, container=cosmos_container_name, bytes=len(json.dumps(record, ensure_ascii=False).encode("utf-8"))):
+                return container.upsert_item(body=record)
+
+        # The per-PDF reductions share one pool instead of each starting its own
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, ThreadPoolExecutor(max_workers=max_workers) as reducer:
+            # Group documents by their source PDF (using file_name field), fetching only the fields used here.
+            # Near-duplicates of another selected chunk (reissued or translated reports) are left out.
+            collapse = dedup.dedup_settings()[0] != "off"
+            doc_groups = lookup.get_document_groups(backend, doc_ids, ["file_name", "summary"], collapse_near_duplicates=collapse)
+
+            # Call the Bibliography function via HTTP to get the bibliographies, for the same PDFs in the same order
+            if collapse:
+                doc_ids = [doc["id"] for docs in doc_groups.values() for doc in docs]
+            bibliographies_future = executor.submit(fetch_bibliographies, bibliography_url, doc_ids)
+
+            def combine_summaries(summaries):
+                combined_summary_prompt = f"Can you summarize these documents based on the user query: '{query}'? " + " ".join(summaries)
+                return generate(combined_summary_prompt, "You are an AI assistant that summarizes texts.")
+
+            def summarize_pdf(docs):
+                # Combine summaries for each PDF
+                pdf_summaries = [doc['summary'] for doc in docs]
+                pdf_summaries = mapreduce.reduce_texts(pdf_summaries, combine_summaries, context_tokens, executor=reducer)
+                return combine_summaries(pdf_summaries)
+
+            # Results are collected in submission order, so numbering stays deterministic
+            pdf_names = list(doc_groups.keys())
+            pdf_futures = [executor.submit(summarize_pdf, docs) for docs in doc_groups.values()]
+            if incremental:
+                for _ in as_completed(pdf_futures):
+                    finished = [
+                        {"pdf_name": pdf_name, "summary": future.result(), "bibliography": ""}
+                        for pdf_name, future in zip(pdf_names, pdf_futures) if future.done() and future.exception() is None
+                    ]
+                    save(scan_record(scan_id, query, RUNNING, finished))
+            pdf_combined_summaries = [future.result() for future in pdf_futures]
+            bibliographies = bibliographies_future.result()
+
+        combined_summaries = combine_with_bibliographies(pdf_names, pdf_combined_summaries, bibliographies)
+        if incremental:
+            save(scan_record(scan_id, query, RUNNING, combined_summaries))
+
+        def condense_referenced_summaries(summaries):
+            # Intermediate level of the reduction: the bracketed numbers must survive so the
+            # final summary can still cite every source document
+            condense_prompt = (
+                f"Condense the following document summaries into one summary relevant to the user query: '{query}'. "
+                "Each summary carries bracketed reference numbers such as [3]. Keep every reference number, in brackets, "
+                "next to the information it supports, and do not add or renumber references.\n\n" + "\n".join(summaries)
+            )
+            return generate(condense_prompt, "You are an AI assistant that summarizes texts and preserves source references.")
+
+        overall_summary_prompt = build_overall_summary_prompt(
+            mapreduce.reduce_texts(referenced_summaries(combined_summaries), condense_referenced_summaries, context_tokens, max_workers)
+        )
+
+        overall_summary = generate(overall_summary_prompt, overall_summary_system_prompt)
  
         #Extract Keywords
         keyword_prompt = "Extract the keywords from the following text: " + overall_summary
-        keywords = summary.generate_prompt(keyword_prompt,"You are an AI Assistant that extracts keywords and themes. Do not provide any other statements other than the keywords and themes only. Extract a max of 8 key words. Ensure they make sense and aren't dates like years. For example do not ever add years like 'xxxx-xxxx' where x are numbers",aoai_key, aoai_url, model, aoai_version_completion)
+        keywords = generate(keyword_prompt,"You are an AI Assistant that extracts keywords and themes. Do not provide any other statements other than the keywords and themes only. Extract a max of 8 key words. Ensure they make sense and aren't dates like years. For example do not ever add years like 'xxxx-xxxx' where x are numbers")
 
         # Build the final knowledge scan response
-        knowledge_scan = {
-            "id": str(uuid.uuid4()),
-            "query": query,
-            "combined_summaries": combined_summaries,
-            "overall_summary": overall_summary,
-            "general_notes": f"Generated based on query: {query}. The Library Services AI Agent has conducted a search for journal articles, books and papers or reports from GcDocs repository. Following is an AI generated knowledge scan report.",
-            "keywords":keywords
-        }
+        knowledge_scan = scan_record(
+            scan_id or str(uuid.uuid4()), query, DONE, combined_summaries,
+            overall_summary=overall_summary, keywords=keywords
+        )
 
         # Save the knowledge scan to Cosmos DB
         try:
-            response = container.create_item(body=knowledge_scan)
+            if incremental:
+                response = save(knowledge_scan)
+            else:
+                with telemetry.span(telemetry.COSMOS_WRITE, container=cosmos_container_name, bytes=len(json.dumps(knowledge_scan, ensure_ascii=False).encode("utf-8"))):
+                    response = container.create_item(body=knowledge_scan)
             logging.info(f"Knowledge scan saved to Cosmos DB. Response: {response}")
         except Exception as e:
             logging.error(f"Error saving knowledge scan to Cosmos DB: {e}")
@@ -136,6 +229,56 @@ You are an advanced AI assistant specialized in producing comprehensive, structu
         logging.error(f"Error in generate_knowledge_scan: {e}")
         raise
 
+_scan_queue = None
+_scan_queue_lock = threading.Lock()
+
+def get_scan_queue():
+    """
+    Returns the worker's client for the knowledge scan queue, creating the queue on
+    first use.
+    """
+    global _scan_queue
+    with _scan_queue_lock:
+        if _scan_queue is None:
+            from azure.core.exceptions import ResourceExistsError
+            queue_client = clients.get_queue_client(SCAN_QUEUE)
+            try:
+                queue_client.create_queue()
+            except ResourceExistsError:
+                pass
+            _scan_queue = queue_client
+        return _scan_queue
+
+def get_scans_container():
+    return clients.get_cosmos_container(
+        os.getenv('COSMOS_DB_CONNECTION_STRING'), os.getenv('COSMOS_DB_DATABASE_NAME'), os.getenv('COSMOS_DB_CONTAINER_NAME')
+    )
+
+def start_knowledge_scan(query, doc_ids):
+    """
+    Records a running scan and queues it for RunKnowledgeScan.
+
+    Returns:
+        dict: The scan document as first written, with no summaries yet.
+    """
+    record = scan_record(str(uuid.uuid4()), query, RUNNING)
+    get_scans_container().upsert_item(body=record)
+    get_scan_queue().send_message(json.dumps({"id": record["id"], "query": query, "documents": doc_ids}))
+    logging.info(f"Queued knowledge scan {record['id']} for {len(doc_ids)} documents")
+    return record
+
+def run_queued_scan(item):
+    """
+    Runs a scan queued by start_knowledge_scan. A failure is recorded on the scan
+    document for the polling client rather than retried, since a retry would repeat
+    every model call.
+    """
+    try:
+        generate_knowledge_scan(item["query"], item["documents"], scan_id=item["id"], incremental=True)
+    except Exception as e:
+        logging.error(f"Knowledge scan {item['id']} failed: {e}")
+        get_scans_container().upsert_item(body=scan_record(item["id"], item["query"], FAILED, error=str(e)))
+
 def main(req: func.HttpRequest) -> func.HttpResponse:
     try:
         data = req.get_json()
@@ -148,6 +291,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 status_code=400
             )
 
+        # "incremental": true returns 202 with the scan's id straight away; the summaries
+        # are filled in by RunKnowledgeScan and read through GetKnowledgeScan
+        if data.get("incremental"):
+            record = start_knowledge_scan(query, doc_ids)
+            return func.HttpResponse(
+                json.dumps({"id": record["id"], "status": record["status"]}),
+                status_code=202,
+                mimetype="application/json"
+            )
+
         knowledge_scan = generate_knowledge_scan(query, doc_ids)
         knowledge_scan_json = json.dumps(knowledge_scan, ensure_ascii=False)
 
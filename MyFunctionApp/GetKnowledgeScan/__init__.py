@@ -0,0 +1,23 @@
+import json
+import logging
+import azure.functions as func
+import GenerateKnowledgeScan
+
+def main(req: func.HttpRequest) -> func.HttpResponse:
+    scan_id = req.params.get("id")
+    if not scan_id:
+        return func.HttpResponse("Please pass the scan's 'id' in the query string.", status_code=400)
+
+    from azure.cosmos.exceptions import CosmosResourceNotFoundError
+    try:
+        # Scans are partitioned by id
+        scan = GenerateKnowledgeScan.get_scans_container().read_item(item=scan_id, partition_key=scan_id)
+    except CosmosResourceNotFoundError:
+        return func.HttpResponse(f"No knowledge scan with id {scan_id}.", status_code=404)
+    except Exception as e:
+        logging.error(f"Error reading knowledge scan {scan_id}: {e}")
+        return func.HttpResponse(f"Error: {e}", status_code=500)
+
+    # Drop Cosmos DB's system properties (_rid, _etag, ...)
+    scan = {key: value for key, value in scan.items() if not key.startswith("_")}
+    return func.HttpResponse(json.dumps(scan, ensure_ascii=False), status_code=200, mimetype="application/json")
@@ -0,0 +1,8 @@
+import logging
+import azure.functions as func
+import GenerateKnowledgeScan
+
+def main(msg: func.QueueMessage):
+    item = msg.get_json()
+    logging.info(f"Running knowledge scan {item['id']} for {len(item['documents'])} documents")
+    GenerateKnowledgeScan.run_queued_scan(item)
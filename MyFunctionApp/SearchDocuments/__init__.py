@@ -0,0 +1,115 @@
+import logging
+import os
+import json
+import threading
+import azure.functions as func
+from common import cache as aoai_cache, ratelimit, search_backend
+
+SEARCH_FIELDS = ["id", "file_name", "summary"]
+# Request parameters callers may filter on, and the index field each one matches. The
+# filter expression is built here, so no other field can be queried through the function.
+FILTER_FIELDS = {"doc_ids": "id", "source_files": "source_file"}
+
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+def get_query_cache():
+    """
+    Per-worker LRU/TTL cache of query embeddings, sized by QUERY_CACHE_MAX_ENTRIES and
+    QUERY_CACHE_TTL_SECONDS. Popular and suggested queries are embedded once per worker.
+    """
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = aoai_cache.MemoryCache(
+                max_entries=int(os.getenv('QUERY_CACHE_MAX_ENTRIES', '1024')),
+                ttl=float(os.getenv('QUERY_CACHE_TTL_SECONDS', '3600'))
+            )
+        return _query_cache
+
+def build_filter(data):
+    """
+    OData filter for the structured filters in a request body: lists of values for the
+    parameters in FILTER_FIELDS, each matched with search.in and combined with 'and'.
+
+    Raises:
+        ValueError: If a filter is not a non-empty list of strings.
+    """
+    clauses = []
+    for parameter, field in FILTER_FIELDS.items():
+        values = data.get(parameter)
+        if values is None:
+            continue
+        if not isinstance(values, list) or not values or not all(isinstance(value, str) and value and "|" not in value for value in values):
+            raise ValueError(f"'{parameter}' must be a non-empty list of strings")
+        value_list = "|".join(value.replace("'", "''") for value in values)
+        clauses.append(f"search.in({field}, '{value_list}', '|')")
+    return " and ".join(clauses) or None
+
+def search_documents(query, top=5, filter_expression=None):
+    aoai_url = os.getenv('AOAI_URL')
+    aoai_key = os.getenv('AOAI_KEY')
+    embedding_model = os.getenv('EMBEDDING_MODEL')
+    aoai_version_embedding = os.getenv('AOAI_VERSION_EMBEDDING')
+
+    if not all([aoai_url, aoai_key, embedding_model, aoai_version_embedding]):
+        raise ValueError("One or more required environment variables are missing.")
+
+    # Queries that differ only in whitespace share an embedding
+    normalized_query = " ".join(query.split())
+    query_cache = get_query_cache()
+    with ratelimit.priority(ratelimit.INTERACTIVE):
+        vector = aoai_cache.cached_embedding(query_cache, normalized_query, aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+
+    results = search_backend.get_search_backend().query(
+        search_text=normalized_query,
+        vector=vector,
+        top=top,
+        filter_expression=filter_expression,
+        select=SEARCH_FIELDS
+    )
+    logging.info(f"Query embedding cache: {query_cache.report()}")
+    return {
+        "value": [
+            {
+                "id": result["id"],
+                "file_name": result.get("file_name"),
+                "summary": result.get("summary"),
+                "@search.score": result["@search.score"]
+            }
+            for result in results
+        ]
+    }
+
+def main(req: func.HttpRequest) -> func.HttpResponse:
+    try:
+        data = req.get_json()
+        query = data.get("query")
+
+        if not query or not query.strip():
+            return func.HttpResponse(
+                "Please pass a 'query' in the request body.",
+                status_code=400
+            )
+
+        if "filter" in data:
+            return func.HttpResponse(
+                f"Filter expressions are not accepted; filter with {', '.join(FILTER_FIELDS)} instead.",
+                status_code=400
+            )
+        try:
+            filter_expression = build_filter(data)
+        except ValueError as e:
+            return func.HttpResponse(str(e), status_code=400)
+
+        result = search_documents(query, top=int(data.get("top", 5)), filter_expression=filter_expression)
+
+        return func.HttpResponse(
+            json.dumps(result, ensure_ascii=False),
+            status_code=200,
+            mimetype="application/json"
+        )
+
+    except Exception as e:
+        logging.error(f"Error in SearchDocuments function: {e}")
+        return func.HttpResponse(f"Error: {e}", status_code=500)
@@ -0,0 +1,133 @@
+import json
+import logging
+import re
+from common import summary
+from common.cache import cache_key
+
+# Search index fields holding the bibliography of a chunk's source PDF. They are only
+# set on chunks the bibliography was extracted for; `title` is "" rather than null when
+# the extraction ran but found no title.
+BIBLIOGRAPHY_FIELDS = ["title", "authors", "publication_year", "institution"]
+
+
+def empty_bibliography():
+    return {
+        "title": "",
+        "authors": [],
+        "publication_date": "",
+        "institution": ""
+    }
+
+
+def parse_bibliography_response(bibliography_response):
+    """
+    Parses the model's reply, expected as a JSON object with title, authors, year and
+    institution. Replies in the older 'Authors (Year). Title. Institution.' format are
+    still understood.
+    """
+    bibliography = empty_bibliography()
+
+    match = re.search(r"\{.*\}", bibliography_response, re.DOTALL)
+    if match:
+        try:
+            parsed = json.loads(match.group(0))
+            authors = parsed.get("authors") or []
+            if isinstance(authors, str):
+                authors = [author.strip() for author in authors.split(",")]
+            bibliography["title"] = str(parsed.get("title") or "").strip()
+            bibliography["authors"] = [str(author).strip() for author in authors if str(author).strip()]
+            bibliography["publication_date"] = str(parsed.get("year") or parsed.get("publication_date") or "").strip()
+            bibliography["institution"] = str(parsed.get("institution") or "").strip()
+            return bibliography
+        except (ValueError, AttributeError):
+            pass
+
+    if "(" in bibliography_response and ")" in bibliography_response:
+        authors_section = bibliography_response.split("(", 1)[0].strip()
+        bibliography["authors"] = [author.strip() for author in authors_section.split(",") if author.strip()]
+        bibliography["publication_date"] = bibliography_response.split("(", 1)[1].split(")", 1)[0].strip()
+        remainder = bibliography_response.split(")", 1)[1].strip().lstrip(".").strip().split(". ")
+        if len(remainder) >= 2:
+            bibliography["title"] = remainder[0].strip()
+            bibliography["institution"] = remainder[1].strip().rstrip(".")
+        elif len(remainder) == 1:
+            bibliography["title"] = remainder[0].strip().rstrip(".")
+    return bibliography
+
+
+def extract_bibliography_from_chunk(content_text, aoai_key, aoai_url, model, aoai_version_completion):
+    bibliography_prompt = (
+        "Extract the title, authors, publication year and institution or publisher from the following document content. "
+        "Return only a JSON object with the keys \"title\" (string), \"authors\" (list of strings), "
+        "\"year\" (string) and \"institution\" (string). "
+        "If any information is missing, use an empty string or empty list for that key. "
+        "Content:\n\n"
+        f"{content_text[:1000]}"
+    )
+
+    try:
+        bibliography_response = summary.generate_prompt(
+            bibliography_prompt,
+            "You are an AI assistant that extracts title, authors, and publication date in a structured bibliography format.",
+            aoai_key,
+            aoai_url,
+            model,
+            aoai_version_completion
+        )
+        return parse_bibliography_response(bibliography_response)
+
+    except Exception as e:
+        logging.error(f"Error parsing GPT response: {e}")
+        return empty_bibliography()
+
+
+def cached_bibliography(cache, content_text, aoai_key, aoai_url, model, aoai_version_completion):
+    key = cache_key("bibliography", content_text[:1000], model, aoai_version_completion)
+    bibliography = cache.lookup(key)
+    if bibliography is None:
+        bibliography = extract_bibliography_from_chunk(content_text, aoai_key, aoai_url, model, aoai_version_completion)
+        # An empty result may come from a failed call; do not pin it in the cache
+        if bibliography != empty_bibliography():
+            cache.store(key, bibliography)
+    return bibliography
+
+
+def to_index_fields(bibliography):
+    return {
+        "title": bibliography.get("title", ""),
+        "authors": bibliography.get("authors", []),
+        "publication_year": bibliography.get("publication_date", ""),
+        "institution": bibliography.get("institution", "")
+    }
+
+
+def from_index_fields(document):
+    return {
+        "title": document.get("title") or "",
+        "authors": document.get("authors") or [],
+        "publication_date": document.get("publication_year") or "",
+        "institution": document.get("institution") or ""
+    }
+
+
+def format_bibliography_entry(bibliography):
+    authors = ", ".join(bibliography.get("authors", []))
+    title = bibliography.get("title", "").strip()
+    publication_date = bibliography.get("publication_date", "").strip()
+    institution = bibliography.get("institution", "").strip()
+
+    # Construct the bibliography entry only with available fields
+    formatted_entry_parts = []
+
+    if authors:
+        formatted_entry_parts.append(authors)
+    if publication_date:
+        formatted_entry_parts.append(f"({publication_date})")
+    if title:
+        formatted_entry_parts.append(title)
+    if institution:
+        formatted_entry_parts.append(institution)
+
+    # Join all parts with a period and space
+    formatted_entry = ". ".join(formatted_entry_parts) + "."
+    return formatted_entry
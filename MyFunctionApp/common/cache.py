@@ -0,0 +1,287 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from common import embedding, extractive, summary, tokens
+
+DEFAULT_CACHE_PATH = "/tmp/aoai-cache.sqlite"
+DEFAULT_MAX_MB = 512
+
+
+def cache_key(kind, text, deployment, api_version, prompt_template=""):
+    """
+    Content address for a model call: the same text sent to the same deployment, API
+    version and prompt template always maps to the same key.
+    """
+    digest = hashlib.sha256()
+    for part in (kind, deployment or "", api_version or "", prompt_template or "", text or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _Cache:
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "tokens_saved": 0}
+
+    def lookup(self, key):
+        entry = self._get(key)
+        with self._stats_lock:
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["tokens_saved"] += entry.get("tokens", 0)
+        return entry["value"]
+
+    def store(self, key, value, tokens_used=0):
+        self._set(key, {"value": value, "tokens": tokens_used})
+
+    def hit_rate(self):
+        with self._stats_lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return self.stats["hits"] / total if total else 0.0
+
+    def report(self):
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["hit_rate"] = round(self.hit_rate(), 4)
+        return stats
+
+
+class NullCache(_Cache):
+    def _get(self, key):
+        return None
+
+    def _set(self, key, entry):
+        pass
+
+
+class MemoryCache(_Cache):
+    """
+    In-process LRU cache holding at most `max_entries` entries, each for at most
+    `ttl` seconds (no expiry when ttl is None).
+    """
+
+    def __init__(self, max_entries=1024, ttl=None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def _get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, entry = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key, entry):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SqliteCache(_Cache):
+    """
+    Local disk cache in a single SQLite file, evicting least-recently-used entries
+    once the stored payload exceeds `max_bytes`.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._conn.commit()
+
+    def _get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def _set(self, key, entry):
+        payload = json.dumps(entry)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+
+class BlobCache(_Cache):
+    """
+    Cache shared by all Function instances, one blob per entry under `prefix`.
+
+    Recency is kept in blob metadata; eviction runs every `evict_every` writes and
+    removes least-recently-used blobs until the prefix holds at most `max_bytes`.
+    """
+
+    def __init__(self, container_client, max_bytes=DEFAULT_MAX_MB * 1024 * 1024, prefix="aoai-cache/", evict_every=100):
+        super().__init__()
+        self.container_client = container_client
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self.evict_every = evict_every
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        blob_client = self.container_client.get_blob_client(f"{self.prefix}{key}")
+        try:
+            payload = blob_client.download_blob().readall()
+        except ResourceNotFoundError:
+            return None
+        try:
+            blob_client.set_blob_metadata({"last_access": str(time.time())})
+        except Exception as e:
+            logging.warning(f"Could not update cache recency for {key}: {e}")
+        return json.loads(payload)
+
+    def _set(self, key, entry):
+        self.container_client.upload_blob(
+            name=f"{self.prefix}{key}",
+            data=json.dumps(entry).encode("utf-8"),
+            overwrite=True,
+            metadata={"last_access": str(time.time())}
+        )
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % self.evict_every == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        blobs = list(self.container_client.list_blobs(name_starts_with=self.prefix, include=["metadata"]))
+        total = sum(blob.size for blob in blobs)
+        if total <= self.max_bytes:
+            return
+        blobs.sort(key=lambda blob: float((blob.metadata or {}).get("last_access", 0)))
+        for blob in blobs:
+            if total <= self.max_bytes:
+                break
+            self.container_client.delete_blob(blob.name)
+            total -= blob.size
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    Returns the per-process cache selected by the AOAI_CACHE_BACKEND environment
+    variable: 'sqlite' (default), 'blob' or 'none'.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            return _cache
+
+        backend = os.getenv("AOAI_CACHE_BACKEND", "sqlite").lower()
+        max_bytes = int(float(os.getenv("AOAI_CACHE_MAX_MB", str(DEFAULT_MAX_MB))) * 1024 * 1024)
+        try:
+            if backend == "blob":
+                from common import clients
+
+                container_client = clients.get_container_client(os.getenv("AOAI_CACHE_CONTAINER", "cache"))
+                _cache = BlobCache(container_client, max_bytes=max_bytes)
+            elif backend == "sqlite":
+                _cache = SqliteCache(os.getenv("AOAI_CACHE_PATH", DEFAULT_CACHE_PATH), max_bytes=max_bytes)
+            else:
+                _cache = NullCache()
+        except Exception as e:
+            logging.warning(f"Could not open '{backend}' cache, continuing without one: {e}")
+            _cache = NullCache()
+        return _cache
+
+
+def cached_embeddings(cache, texts, aoai_url, aoai_key, embedding_model, aoai_version_embedding):
+    """
+    Batch embedding through the cache: only texts without a cached vector are sent
+    to Azure OpenAI. Returns vectors in input order.
+    """
+    # Vectors of different sizes must not be served for one another
+    dimensions = str(embedding.embedding_dimensions() or "")
+    keys = [cache_key("embedding", text, embedding_model, aoai_version_embedding, dimensions) for text in texts]
+    vectors = [cache.lookup(key) for key in keys]
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    if missing:
+        fresh = embedding.get_new_embeddings([texts[i] for i in missing], aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+        for i, vector in zip(missing, fresh):
+            vectors[i] = vector
+            cache.store(keys[i], vector, tokens.count_tokens(texts[i]))
+    return vectors
+
+
+def cached_embedding(cache, text, aoai_url, aoai_key, embedding_model, aoai_version_embedding):
+    return cached_embeddings(cache, [text], aoai_url, aoai_key, embedding_model, aoai_version_embedding)[0]
+
+
+def cached_summary(cache, prompt_template, text, system_message, aoai_key, aoai_url, model, aoai_version_completion):
+    key = cache_key("summary", text, model, aoai_version_completion, prompt_template + "\0" + system_message)
+    summary_str = cache.lookup(key)
+    if summary_str is None:
+        summary_str, usage = summary.generate_prompt_with_usage(prompt_template + text, system_message, aoai_key, aoai_url, model, aoai_version_completion)
+        cache.store(key, summary_str, usage.get("total_tokens", 0))
+    return summary_str
+
+
+def tiered_summary(cache, prompt_template, text, system_message, aoai_key, aoai_url, model, aoai_version_completion, settings=None):
+    """
+    Summarizes a chunk with the tier chosen by SUMMARY_TIER (see common.extractive).
+    Extractive summaries are cheap to recompute and are not cached.
+
+    Returns:
+        tuple: (summary, source) where source is 'llm', 'extractive', or 'fallback' for
+        an extractive summary made because the model was throttled.
+    """
+    settings = settings or extractive.summary_settings()
+    if settings["tier"] == extractive.EXTRACTIVE or (settings["tier"] == extractive.HYBRID and extractive.is_summarizable(text)):
+        return extractive.summarize(text, settings["sentences"]), extractive.EXTRACTIVE
+    try:
+        return cached_summary(cache, prompt_template, text, system_message, aoai_key, aoai_url, model, aoai_version_completion), extractive.LLM
+    except summary.AzureOpenAIError as e:
+        if not settings["throttle_fallback"] or e.status_code != 429:
+            raise
+        logging.warning(f"Azure OpenAI is throttled, summarizing the chunk extractively: {e}")
+        return extractive.summarize(text, settings["sentences"]), extractive.FALLBACK
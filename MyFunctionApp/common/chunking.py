@@ -0,0 +1,174 @@
+import json
+import os
+import re
+from common import tokens
+
+CHUNK_NAME_PATTERN = re.compile(r"_chunk_(\d+)_pages_(\d+)_to_(\d+)\.pdf$")
+
+
+def page_windows(num_pages, n):
+    """
+    Splits `num_pages` pages into windows of `n` pages that overlap by half a window.
+
+    Returns:
+        list: (start_page, end_page) tuples, 0-based with an exclusive end.
+    """
+    windows = []
+    overlap = max(n // 2, 1)
+    for start in range(0, num_pages, overlap):
+        end = min(start + n, num_pages)
+        windows.append((start, end))
+    return windows
+
+
+def chunk_blob_name(source_name, chunk_number, start_page, end_page):
+    """
+    Name of a chunk of `source_name`; `start_page` and `end_page` are 1-based and inclusive.
+    """
+    return f"{os.path.basename(source_name)}_chunk_{chunk_number}_pages_{start_page}_to_{end_page}.pdf"
+
+
+def file_name_chunk(chunk_number, start_page, end_page):
+    return f"{chunk_number}_{start_page}-{end_page}"
+
+
+def parse_chunk_name(chunk_name):
+    """
+    Returns (chunk_number, start_page, end_page) for a name built by chunk_blob_name, or None.
+    """
+    match = CHUNK_NAME_PATTERN.search(chunk_name)
+    if not match:
+        return None
+    return tuple(int(group) for group in match.groups())
+
+
+def text_artifact_name(source_name):
+    return f"{os.path.basename(source_name)}.chunks.jsonl"
+
+
+def dump_text_artifact(chunks):
+    """
+    Serializes chunk windows as JSONL, one {"chunk", "start_page", "end_page", "file_name", "text"} object per line.
+    """
+    return "".join(json.dumps(chunk, ensure_ascii=False) + "\n" for chunk in chunks).encode("utf-8")
+
+
+def load_text_artifact(content):
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+# Chunking strategies take the extracted text of every page of a PDF and return chunk
+# dicts with 1-based inclusive "start_page"/"end_page" and the chunk "text".
+
+def page_window_chunks(page_texts, pages_per_chunk=10):
+    return [
+        {"start_page": start + 1, "end_page": end, "text": "".join(page_texts[start:end])}
+        for start, end in page_windows(len(page_texts), pages_per_chunk)
+    ]
+
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_to_budget(text, max_tokens):
+    """
+    Splits text longer than `max_tokens` at sentence breaks, falling back to word breaks.
+    """
+    if tokens.count_tokens(text) <= max_tokens:
+        return [text]
+    pieces = SENTENCE_BREAK.split(text)
+    if len(pieces) == 1:
+        pieces = text.split(" ")
+        if len(pieces) == 1:
+            step = max_tokens * tokens.CHARS_PER_TOKEN
+            return [text[i:i + step] for i in range(0, len(text), step)]
+    parts = []
+    current = ""
+    for piece in pieces:
+        candidate = f"{current} {piece}" if current else piece
+        if current and tokens.count_tokens(candidate) > max_tokens:
+            parts.extend(_split_to_budget(current, max_tokens))
+            current = piece
+        else:
+            current = candidate
+    if current:
+        parts.extend(_split_to_budget(current, max_tokens))
+    return parts
+
+
+def token_budget_chunks(page_texts, target_tokens=2000, overlap_tokens=200):
+    """
+    Packs paragraphs into chunks of at most `target_tokens`, cutting only at paragraph
+    and page breaks (or sentence breaks inside an oversized paragraph). Consecutive
+    chunks share trailing paragraphs worth up to `overlap_tokens`.
+    """
+    units = []
+    for page_number, page_text in enumerate(page_texts, 1):
+        for paragraph in PARAGRAPH_BREAK.split(page_text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            for piece in _split_to_budget(paragraph, target_tokens):
+                units.append((page_number, piece, tokens.count_tokens(piece)))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    def emit():
+        text_parts = []
+        for i, (page_number, text, _) in enumerate(current):
+            if i:
+                text_parts.append("\n\n" if current[i - 1][0] == page_number else "\n")
+            text_parts.append(text)
+        chunks.append({"start_page": current[0][0], "end_page": current[-1][0], "text": "".join(text_parts)})
+
+    for unit in units:
+        if current and current_tokens + unit[2] > target_tokens:
+            emit()
+            overlap = []
+            overlap_total = 0
+            for previous in reversed(current):
+                if overlap_total + previous[2] > overlap_tokens or len(overlap) + 1 >= len(current):
+                    break
+                overlap.insert(0, previous)
+                overlap_total += previous[2]
+            # Drop the overlap if it would push the new chunk over budget on its own
+            if overlap_total + unit[2] > target_tokens:
+                overlap, overlap_total = [], 0
+            current = overlap
+            current_tokens = overlap_total
+        current.append(unit)
+        current_tokens += unit[2]
+    if current:
+        emit()
+    return chunks
+
+
+CHUNK_STRATEGIES = {
+    "pages": page_window_chunks,
+    "tokens": token_budget_chunks,
+}
+
+
+def chunk_strategy_from_env():
+    """
+    Returns (name, params) for the strategy selected by CHUNK_STRATEGY ('pages' or 'tokens'),
+    with CHUNK_PAGES, CHUNK_TARGET_TOKENS and CHUNK_OVERLAP_TOKENS as parameters.
+    """
+    name = os.getenv("CHUNK_STRATEGY", "pages").lower()
+    if name == "tokens":
+        return name, {
+            "target_tokens": int(os.getenv("CHUNK_TARGET_TOKENS", "2000")),
+            "overlap_tokens": int(os.getenv("CHUNK_OVERLAP_TOKENS", "200"))
+        }
+    return "pages", {"pages_per_chunk": int(os.getenv("CHUNK_PAGES", "10"))}
+
+
+def chunk_pages(page_texts, strategy="pages", **params):
+    if strategy not in CHUNK_STRATEGIES:
+        raise ValueError(f"Unknown chunking strategy '{strategy}', expected one of {sorted(CHUNK_STRATEGIES)}")
+    return CHUNK_STRATEGIES[strategy](page_texts, **params)
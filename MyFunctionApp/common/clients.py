@@ -0,0 +1,67 @@
+import os
+import threading
+
+# SDK clients are thread-safe and keep their connection pools, so one instance per
+# worker process serves every warm invocation. The SDKs are imported on first use,
+# which keeps them off the cold-start path of functions that never call them.
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _cached(key, create):
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = create()
+            _clients[key] = client
+        return client
+
+
+def get_blob_service_client(connection_string=None):
+    """
+    Returns the worker's BlobServiceClient for a storage account, by default the one in
+    SECONDARY_STORAGE_ACCOUNT_CONNECTION_STRING.
+    """
+    connection_string = connection_string or os.getenv("SECONDARY_STORAGE_ACCOUNT_CONNECTION_STRING")
+
+    def create():
+        from azure.storage.blob import BlobServiceClient
+        return BlobServiceClient.from_connection_string(connection_string)
+    return _cached(("blob", connection_string), create)
+
+
+def get_container_client(container_name, connection_string=None):
+    return get_blob_service_client(connection_string).get_container_client(container_name)
+
+
+def get_queue_client(queue_name, connection_string=None):
+    """
+    Returns the worker's QueueClient for a storage queue. Messages are base64-encoded,
+    the queue trigger's default encoding.
+    """
+    connection_string = connection_string or os.getenv("SECONDARY_STORAGE_ACCOUNT_CONNECTION_STRING")
+
+    def create():
+        from azure.storage.queue import QueueClient, TextBase64DecodePolicy, TextBase64EncodePolicy
+        return QueueClient.from_connection_string(
+            connection_string, queue_name,
+            message_encode_policy=TextBase64EncodePolicy(), message_decode_policy=TextBase64DecodePolicy()
+        )
+    return _cached(("queue", connection_string, queue_name), create)
+
+
+def get_cosmos_container(connection_string, database_name, container_name):
+    """
+    Returns the worker's Cosmos DB container client; the CosmosClient behind it is
+    shared by all containers of the account.
+    """
+    def create_client():
+        from azure.cosmos import CosmosClient
+        return CosmosClient.from_connection_string(connection_string)
+
+    # Looked up before the container is cached: _clients_lock is not reentrant
+    client = _cached(("cosmos", connection_string), create_client)
+
+    def create():
+        return client.get_database_client(database_name).get_container_client(container_name)
+    return _cached(("cosmos", connection_string, database_name, container_name), create)
@@ -0,0 +1,334 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+# MinHash signatures of NUM_PERM values, split into BANDS bands of ROWS values for the
+# LSH lookup. Two chunks become candidates when any band matches exactly; with 32 bands
+# of 4 rows, pairs above ~0.6 Jaccard similarity are found almost always.
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 5
+# Chunks with fewer shingles (blank or near-blank pages) are never treated as duplicates
+MIN_SHINGLES = 20
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_INDEX_PATH = "/tmp/dedup-signatures.sqlite"
+DEDUP_CONTAINER = "dedup"
+# Concurrent blob requests for the band lookups and writes of one chunk
+BLOB_CONCURRENCY = 16
+
+# Prime just above 2**32, so (a * x + b) % _PRIME of 32-bit shingle hashes fits in uint64
+_PRIME = 4294967311
+_WORD = re.compile(r"\w+")
+# numpy and the permutation coefficients are loaded on first use, off the cold-start path
+_permutations = None
+
+
+def _get_permutations():
+    global _permutations
+    if _permutations is None:
+        import numpy as np
+        rng = np.random.RandomState(1)
+        _permutations = (
+            rng.randint(1, 2 ** 31, size=NUM_PERM).astype(np.uint64),
+            rng.randint(0, 2 ** 31, size=NUM_PERM).astype(np.uint64),
+            np.uint64(_PRIME),
+        )
+    return _permutations
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    """
+    32-bit hashes of the overlapping `size`-word sequences of the normalized text.
+    Case, punctuation and line breaks do not matter.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return set()
+    return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+
+def minhash(text):
+    """
+    Returns:
+        numpy.ndarray: The MinHash signature of the text (NUM_PERM uint32 values), or None
+        if it has too few shingles to compare.
+    """
+    import numpy as np
+
+    hashes = shingles(text)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    a, b, prime = _get_permutations()
+    values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+    signature = np.full(NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+    # Blocks of shingles keep the NUM_PERM x block matrix small for long chunks
+    for start in range(0, len(values), 4096):
+        block = values[start:start + 4096]
+        permuted = (a[:, None] * block[None, :] + b[:, None]) % prime
+        np.minimum(signature, permuted.min(axis=1), out=signature)
+    return signature.astype(np.uint32)
+
+
+def similarity(signature, other):
+    """
+    Estimated Jaccard similarity of the shingle sets behind two signatures.
+    """
+    import numpy as np
+    return float(np.mean(signature == other))
+
+
+def band_keys(signature):
+    return [zlib.crc32(signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+
+class BlobSignatureIndex:
+    """
+    MinHash signatures of indexed chunks in a blob container shared by every instance of
+    the Function App. Each chunk has a `signatures/<chunk_id>` blob holding its signature,
+    with its canonical chunk in the blob's metadata, and an empty marker blob per LSH band
+    under `bands/<band>-<bucket>/<chunk_id>`, so a band lookup is one prefix listing.
+    """
+
+    def __init__(self, container_client):
+        self.container_client = container_client
+        self._pool = ThreadPoolExecutor(max_workers=BLOB_CONCURRENCY)
+
+    @staticmethod
+    def _band_prefix(band, bucket):
+        return f"bands/{band:02d}-{bucket:08x}/"
+
+    def _band_blobs(self, chunk_id, signature):
+        return [self._band_prefix(band, bucket) + chunk_id for band, bucket in enumerate(band_keys(signature))]
+
+    def _read(self, chunk_id):
+        import numpy as np
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            downloader = self.container_client.download_blob(f"signatures/{chunk_id}")
+            signature = np.frombuffer(downloader.readall(), dtype=np.uint32)
+            return signature, downloader.properties.metadata.get("canonical_id", chunk_id)
+        except ResourceNotFoundError:
+            return None, None
+
+    def find(self, signature, threshold=DEFAULT_THRESHOLD, exclude=()):
+        """
+        Returns:
+            tuple: (chunk_id, canonical_id, similarity) of the most similar indexed chunk at
+            or above `threshold`, or None.
+        """
+        def list_band(prefix):
+            return [blob.name[len(prefix):] for blob in self.container_client.list_blobs(name_starts_with=prefix)]
+
+        prefixes = [self._band_prefix(band, bucket) for band, bucket in enumerate(band_keys(signature))]
+        candidates = set()
+        for chunk_ids in self._pool.map(list_band, prefixes):
+            candidates.update(chunk_ids)
+        candidates.difference_update(exclude)
+        best = None
+        for chunk_id, (other, canonical_id) in zip(candidates, self._pool.map(self._read, candidates)):
+            if other is None:
+                continue
+            score = similarity(signature, other)
+            if score >= threshold and (best is None or score > best[2]):
+                best = (chunk_id, canonical_id, score)
+        return best
+
+    def add(self, chunk_id, signature, canonical_id=None):
+        self._forget(chunk_id)
+        # The signature goes first, so a band marker never points at a missing signature
+        self.container_client.upload_blob(
+            name=f"signatures/{chunk_id}", data=signature.astype("uint32").tobytes(), overwrite=True,
+            metadata={"canonical_id": canonical_id or chunk_id}
+        )
+        list(self._pool.map(lambda name: self.container_client.upload_blob(name=name, data=b"", overwrite=True), self._band_blobs(chunk_id, signature)))
+
+    def remove(self, chunk_ids):
+        for chunk_id in chunk_ids:
+            self._forget(chunk_id)
+
+    def _forget(self, chunk_id):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        signature, _ = self._read(chunk_id)
+        if signature is None:
+            return
+
+        def delete(name):
+            try:
+                self.container_client.delete_blob(name)
+            except ResourceNotFoundError:
+                pass
+        list(self._pool.map(delete, self._band_blobs(chunk_id, signature)))
+        delete(f"signatures/{chunk_id}")
+
+
+class SignatureIndex:
+    """
+    Persistent MinHash signatures of indexed chunks in a SQLite file, with an LSH band
+    table for candidate lookup, for main.py runs and tests. Each chunk points at its
+    canonical chunk, which is itself for chunks that were embedded and summarized.
+
+    The file is in WAL mode, which needs shared memory between its users: it must be on
+    a local disk and is only shared by processes on one machine.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS signatures (chunk_id TEXT PRIMARY KEY, canonical_id TEXT NOT NULL, signature BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS bands (band INTEGER NOT NULL, bucket INTEGER NOT NULL, chunk_id TEXT NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS bands_lookup ON bands (band, bucket)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS bands_chunk ON bands (chunk_id)")
+        self._conn.commit()
+
+    def find(self, signature, threshold=DEFAULT_THRESHOLD, exclude=()):
+        """
+        Returns:
+            tuple: (chunk_id, canonical_id, similarity) of the most similar indexed chunk at
+            or above `threshold`, or None.
+        """
+        import numpy as np
+
+        keys = band_keys(signature)
+        with self._lock:
+            candidates = set()
+            for band, bucket in enumerate(keys):
+                candidates.update(
+                    row[0] for row in self._conn.execute("SELECT chunk_id FROM bands WHERE band = ? AND bucket = ?", (band, bucket))
+                )
+            candidates.difference_update(exclude)
+            best = None
+            for chunk_id in candidates:
+                row = self._conn.execute("SELECT canonical_id, signature FROM signatures WHERE chunk_id = ?", (chunk_id,)).fetchone()
+                if row is None:
+                    continue
+                score = similarity(signature, np.frombuffer(row[1], dtype=np.uint32))
+                if score >= threshold and (best is None or score > best[2]):
+                    best = (chunk_id, row[0], score)
+        return best
+
+    def add(self, chunk_id, signature, canonical_id=None):
+        with self._lock:
+            self._forget(chunk_id)
+            self._conn.execute(
+                "INSERT INTO signatures (chunk_id, canonical_id, signature) VALUES (?, ?, ?)",
+                (chunk_id, canonical_id or chunk_id, signature.astype("uint32").tobytes())
+            )
+            self._conn.executemany(
+                "INSERT INTO bands (band, bucket, chunk_id) VALUES (?, ?, ?)",
+                [(band, bucket, chunk_id) for band, bucket in enumerate(band_keys(signature))]
+            )
+            self._conn.commit()
+
+    def remove(self, chunk_ids):
+        with self._lock:
+            for chunk_id in chunk_ids:
+                self._forget(chunk_id)
+            self._conn.commit()
+
+    def _forget(self, chunk_id):
+        self._conn.execute("DELETE FROM signatures WHERE chunk_id = ?", (chunk_id,))
+        self._conn.execute("DELETE FROM bands WHERE chunk_id = ?", (chunk_id,))
+
+
+def match_chunks(signature_index, chunks, threshold=DEFAULT_THRESHOLD):
+    """
+    Looks up each (key, text) chunk in the signature index and among the chunks before
+    it in the same batch.
+
+    Returns:
+        tuple: (signatures by key, {key: (canonical_id, similarity)} for the near-duplicates).
+    """
+    signatures = {}
+    matches = {}
+    batch_canonical = []
+    for key, text in chunks:
+        signature = minhash(text)
+        if signature is None:
+            continue
+        signatures[key] = signature
+        match = signature_index.find(signature, threshold, exclude={key}) if signature_index is not None else None
+        if match is not None:
+            matches[key] = (match[1], match[2])
+            continue
+        for other_key, other in batch_canonical:
+            score = similarity(signature, other)
+            if score >= threshold:
+                matches[key] = (other_key, score)
+                break
+        else:
+            batch_canonical.append((key, signature))
+    return signatures, matches
+
+
+def dedup_settings():
+    """
+    NEAR_DUPLICATE_MODE: 'reuse' indexes near-duplicate chunks with the vector and summary
+    of their canonical chunk, 'skip' leaves them out of the index and only records the
+    link, 'off' (default) disables detection. Both other modes write the `canonical_id`
+    index field, which indexes created before it was added to index.json do not have.
+    NEAR_DUPLICATE_THRESHOLD (default 0.9) is the estimated Jaccard similarity of word
+    5-grams from which chunks count as near-duplicates.
+    """
+    return (
+        os.getenv("NEAR_DUPLICATE_MODE", "off").lower(),
+        float(os.getenv("NEAR_DUPLICATE_THRESHOLD", str(DEFAULT_THRESHOLD)))
+    )
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def is_shared_mount(path):
+    """
+    Whether `path` is on App Service's /home, a network share mounted by every instance.
+    """
+    return bool(os.getenv("WEBSITE_INSTANCE_ID")) and os.path.abspath(path).startswith("/home/")
+
+
+def get_signature_index():
+    """
+    Returns the per-process signature index: a local SQLite index when
+    NEAR_DUPLICATE_INDEX_PATH is set, otherwise the blob index in the
+    NEAR_DUPLICATE_CONTAINER container (default 'dedup') of the secondary storage
+    account, which every instance shares and which survives recycling. Returns None if
+    the index cannot be opened.
+
+    A SQLite path on the shared /home mount is not used, since SQLite's WAL mode is not
+    safe on network filesystems.
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            path = os.getenv("NEAR_DUPLICATE_INDEX_PATH")
+            try:
+                if path:
+                    if is_shared_mount(path):
+                        logging.warning(f"The near-duplicate index cannot be kept on the shared mount ({path}); using {DEFAULT_INDEX_PATH}")
+                        path = DEFAULT_INDEX_PATH
+                    _index = SignatureIndex(path)
+                else:
+                    from azure.core.exceptions import ResourceExistsError
+                    from common import clients
+
+                    container_client = clients.get_container_client(os.getenv("NEAR_DUPLICATE_CONTAINER", DEDUP_CONTAINER))
+                    try:
+                        container_client.create_container()
+                    except ResourceExistsError:
+                        pass
+                    _index = BlobSignatureIndex(container_client)
+            except Exception as e:
+                logging.warning(f"Could not open the near-duplicate index, continuing without it: {e}")
+                return None
+        return _index
@@ -1,16 +1,125 @@
-import requests
 import json
+import logging
+import os
+import re
+from common import tokens
+from common.openai_client import AzureOpenAIError, get_client
 
-def get_new_embedding(text, aoai_url, aoai_key, embedding_model, aoai_version_embedding):
-    base_url = f"{aoai_url}/openai/deployments/{embedding_model}/embeddings?api-version={aoai_version_embedding}"
-    headers = {
-        "Content-Type": "application/json",
-        "api-key": aoai_key
-    }
-    body = {
-        "input": text
-    }
-    result = requests.post(url=base_url, headers=headers, json=body)
-    result.raise_for_status()
-    embedding = json.loads(result.text)
-    return embedding
+def embedding_dimensions():
+    """
+    Vector size requested from the embedding model (EMBEDDING_DIMENSIONS), or None for
+    the model's native size. Only text-embedding-3 models accept a reduced size, and the
+    search index's vector field must be created with the same number of dimensions.
+    """
+    value = os.getenv("EMBEDDING_DIMENSIONS")
+    return int(value) if value else None
+
+def _dimension_params(dimensions):
+    dimensions = dimensions or embedding_dimensions()
+    return {"dimensions": dimensions} if dimensions else {}
+
+# Azure OpenAI accepts up to 2048 inputs per embeddings request; the token cap keeps
+# a single request well inside the service's per-request payload limits. Each input
+# must also fit the embedding models' own context.
+MAX_BATCH_INPUTS = 2048
+MAX_BATCH_TOKENS = 100000
+MAX_INPUT_TOKENS = 8191
+
+
+def fit_input(text, max_tokens=MAX_INPUT_TOKENS):
+    """
+    Truncates an input the service would reject for its length, logging a warning so
+    the cut is visible rather than failing the whole request.
+
+    Returns:
+        tuple: (text, token count of the text sent).
+    """
+    text_tokens = tokens.count_tokens(text)
+    if text_tokens <= max_tokens:
+        return text, text_tokens
+    logging.warning(f"Embedding input of {text_tokens} tokens exceeds the {max_tokens}-token limit; truncating it")
+    text = tokens.truncate_to_tokens(text, max_tokens)
+    return text, tokens.count_tokens(text)
+
+
+def get_new_embedding(text, aoai_url, aoai_key, embedding_model, aoai_version_embedding, dimensions=None):
+    client = get_client(aoai_url, aoai_key)
+    text, _ = fit_input(text)
+    return client.embeddings(embedding_model, aoai_version_embedding, text, **_dimension_params(dimensions))
+
+
+def pack_batches(texts, max_inputs=MAX_BATCH_INPUTS, max_tokens=MAX_BATCH_TOKENS):
+    """
+    Groups texts into requests of at most `max_inputs` inputs and `max_tokens` tokens.
+    An input longer than the per-input limit, or than `max_tokens` itself, is truncated
+    so its batch is never one the service rejects outright.
+    """
+    batch = []
+    batch_tokens = 0
+    for text in texts:
+        text, text_tokens = fit_input(text, min(MAX_INPUT_TOKENS, max_tokens))
+        if batch and (len(batch) >= max_inputs or batch_tokens + text_tokens > max_tokens):
+            yield batch
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += text_tokens
+    if batch:
+        yield batch
+
+
+def get_new_embeddings(texts, aoai_url, aoai_key, embedding_model, aoai_version_embedding,
+                       max_inputs=MAX_BATCH_INPUTS, max_tokens=MAX_BATCH_TOKENS, dimensions=None):
+    """
+    Embeds a list of texts using as few /embeddings requests as possible.
+
+    Returns one vector per input text, in the same order as `texts`.
+    """
+    client = get_client(aoai_url, aoai_key)
+    params = _dimension_params(dimensions)
+    vectors = []
+    for batch in pack_batches(texts, max_inputs, max_tokens):
+        vectors.extend(_embed_batch(client, batch, embedding_model, aoai_version_embedding, params))
+    return vectors
+
+
+# Error codes and messages of 400s that reject a request for its size, as opposed to
+# e.g. an unsupported parameter or an unknown deployment
+_SIZE_ERROR_CODES = {"context_length_exceeded", "string_above_max_length"}
+_SIZE_ERROR_MESSAGE = re.compile(r"maximum context length|too many inputs|max(imum)? number of inputs|too large", re.IGNORECASE)
+
+
+def is_batch_too_large(error):
+    """
+    Whether an embeddings request was rejected for the number or size of its inputs:
+    a 413, or a 400 whose error code or message says so.
+    """
+    if error.status_code == 413:
+        return True
+    if error.status_code != 400:
+        return False
+    try:
+        details = json.loads(error.body or "").get("error")
+    except (ValueError, AttributeError):
+        details = None
+    if not isinstance(details, dict):
+        details = {"message": error.body or ""}
+    return details.get("code") in _SIZE_ERROR_CODES or bool(_SIZE_ERROR_MESSAGE.search(details.get("message") or ""))
+
+
+def _embed_batch(client, batch, embedding_model, aoai_version_embedding, params=None):
+    params = params or {}
+    try:
+        result = client.embeddings(embedding_model, aoai_version_embedding, batch, **params)
+    except AzureOpenAIError as e:
+        # The service rejects batches that exceed its input-count or token limits; halve
+        # the batch and try again rather than failing the whole ingestion. Any other
+        # error would fail every half as well and is raised straight away.
+        if is_batch_too_large(e) and len(batch) > 1:
+            middle = len(batch) // 2
+            return (_embed_batch(client, batch[:middle], embedding_model, aoai_version_embedding, params)
+                    + _embed_batch(client, batch[middle:], embedding_model, aoai_version_embedding, params))
+        raise
+
+    data = sorted(result["data"], key=lambda item: item["index"])
+    return [item["embedding"] for item in data]
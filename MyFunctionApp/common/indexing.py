@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from common import telemetry
+
+# Azure AI Search accepts at most 1000 documents and 16 MB per indexing request.
+MAX_BATCH_DOCUMENTS = 1000
+MAX_BATCH_BYTES = 12 * 1024 * 1024
+
+# Per-item status codes the service documents as transient.
+RETRYABLE_ITEM_STATUS_CODES = {409, 422, 429, 503}
+
+
+def source_file_name(chunk_file_name):
+    """
+    Returns the source PDF a chunk came from, e.g. 'report.pdf' for 'intermediate/report.pdf_chunk_2_pages_6_to_15.pdf'.
+    """
+    return os.path.basename(chunk_file_name.split('_chunk_')[0])
+
+
+def document_key(source_file, file_name_chunk):
+    """
+    Stable search-index key for a chunk, derived from its source file and chunk/page range.
+
+    Re-processing the same chunk (blob-trigger retries, re-uploads) yields the same key, so
+    the upload merges into the existing document instead of creating a duplicate.
+    """
+    return hashlib.sha1(f"{source_file}|{file_name_chunk}".encode("utf-8")).hexdigest()
+
+
+_DOCUMENT_KEY = re.compile(r"[0-9a-f]{40}")
+
+
+def legacy_document_keys(backend):
+    """
+    Keys of documents indexed before keys were derived with document_key(): they have a
+    random uuid key and no source_file. Re-ingesting their PDFs adds new documents next
+    to them rather than replacing them, so they are deleted once after upgrading.
+    """
+    documents = backend.filter("source_file eq null", select=["id"])
+    return [document["id"] for document in documents if not _DOCUMENT_KEY.fullmatch(document["id"])]
+
+
+class BufferedIndexWriter:
+    """
+    Buffers documents and sends them to a search backend (merge-or-upload) in
+    batches bounded by document count and payload bytes.
+
+    A batch is flushed when either bound is reached, when the oldest buffered document
+    is older than `flush_interval` seconds, and on close(). Items the service reports as
+    transiently failed are retried with backoff; the rest are collected in `failed`.
+    If given, `on_result(succeeded_keys, failed)` is called after every indexing request.
+    """
+
+    def __init__(self, backend, max_documents=MAX_BATCH_DOCUMENTS, max_bytes=MAX_BATCH_BYTES,
+                 flush_interval=5.0, max_retries=3, backoff_base=1.0, on_result=None):
+        self.backend = backend
+        self.on_result = on_result
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+
+        self.failed = []
+        self.stats = {"documents": 0, "batches": 0, "retried": 0, "failed": 0}
+
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._oldest = None
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._timer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, document):
+        size = len(json.dumps(document))
+        with self._lock:
+            if self._buffer and (len(self._buffer) >= self.max_documents or self._buffer_bytes + size > self.max_bytes):
+                self.flush()
+            self._buffer.append(document)
+            self._buffer_bytes += size
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            batch = self._buffer
+            batch_bytes = self._buffer_bytes
+            self._buffer = []
+            self._buffer_bytes = 0
+            self._oldest = None
+            if batch:
+                with telemetry.span(telemetry.INDEX_UPLOAD, documents=len(batch), bytes=batch_bytes):
+                    self._send(batch)
+
+    def close(self):
+        self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+        if self.failed:
+            logging.error(f"{len(self.failed)} documents could not be indexed: {[key for key, _ in self.failed]}")
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval / 2):
+            with self._lock:
+                if self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval:
+                    self.flush()
+
+    def _send(self, batch):
+        from azure.core.exceptions import HttpResponseError
+
+        attempt = 0
+        pending = batch
+        while pending:
+            try:
+                results = self.backend.upload(pending)
+            except HttpResponseError as e:
+                # 413: the serialized batch is larger than the service accepts; split it
+                if e.status_code == 413 and len(pending) > 1:
+                    middle = len(pending) // 2
+                    self._send(pending[:middle])
+                    self._send(pending[middle:])
+                    return
+                if attempt >= self.max_retries or e.status_code not in (429, 503):
+                    raise
+                results = None
+
+            self.stats["batches"] += 1
+            if results is None:
+                retry = pending
+            else:
+                by_key = {document["id"]: document for document in pending}
+                retry = []
+                succeeded = []
+                failed = []
+                for result in results:
+                    if result.succeeded:
+                        succeeded.append(result.key)
+                    elif result.status_code in RETRYABLE_ITEM_STATUS_CODES and attempt < self.max_retries:
+                        retry.append(by_key[result.key])
+                    else:
+                        failed.append((result.key, result.error_message))
+                self.stats["documents"] += len(succeeded)
+                self.stats["failed"] += len(failed)
+                self.failed.extend(failed)
+                if self.on_result is not None:
+                    self.on_result(succeeded, failed)
+
+            if retry:
+                attempt += 1
+                self.stats["retried"] += len(retry)
+                time.sleep(self.backoff_base * (2 ** (attempt - 1)))
+            pending = retry
+
+        logging.info(f"Indexed batch of {len(batch)} documents; totals: {self.stats}")
@@ -0,0 +1,117 @@
+import hashlib
+import logging
+import os
+import resource
+import tempfile
+
+# Above this size ChunkPDFs copies the source PDF to a temporary file and splits it in
+# memory-bounded batches instead of parsing it, and every page, from memory. The blob
+# trigger binding still delivers the source bytes to the worker.
+DEFAULT_THRESHOLD_MB = 100
+DEFAULT_MEMORY_BUDGET_MB = 1024
+DEFAULT_RANGE_MB = 8
+DEFAULT_UPLOAD_CONCURRENCY = 4
+# Parsed page objects and the serialized chunk together take a few times the chunk's share of the file
+PARSE_OVERHEAD = 3
+MIN_WINDOW_BYTES = 1024 * 1024
+
+
+def large_pdf_settings():
+    """
+    LARGE_PDF_THRESHOLD_MB (default 100; 0 for every PDF, negative to disable) selects
+    the large-file mode by source size. LARGE_PDF_MEMORY_MB (default 1024) is the RSS
+    budget page batches are sized against, LARGE_PDF_RANGE_MB (default 8) the size of
+    each block copied to the temporary file, LARGE_PDF_PROCESSES (default 0, in-process) the processes
+    that serialize chunks and LARGE_PDF_UPLOAD_CONCURRENCY (default 4) the concurrent
+    chunk uploads.
+    """
+    return {
+        "threshold_mb": float(os.getenv("LARGE_PDF_THRESHOLD_MB", str(DEFAULT_THRESHOLD_MB))),
+        "memory_mb": float(os.getenv("LARGE_PDF_MEMORY_MB", str(DEFAULT_MEMORY_BUDGET_MB))),
+        "range_mb": float(os.getenv("LARGE_PDF_RANGE_MB", str(DEFAULT_RANGE_MB))),
+        "processes": int(os.getenv("LARGE_PDF_PROCESSES", "0")),
+        "upload_concurrency": int(os.getenv("LARGE_PDF_UPLOAD_CONCURRENCY", str(DEFAULT_UPLOAD_CONCURRENCY))),
+    }
+
+
+def is_large(size_bytes, settings):
+    return settings["threshold_mb"] >= 0 and size_bytes >= settings["threshold_mb"] * 1024 * 1024
+
+
+def rss_mb():
+    """
+    Current resident set size of this process in MB, or its peak if /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def reset_peak_rss():
+    """
+    Resets the kernel's peak RSS counter of this process, so peak_rss_mb covers one
+    invocation of a long-lived worker. Returns False where that is not supported.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """
+    Peak RSS in MB of this process since reset_peak_rss, or over its lifetime if the
+    counter cannot be reset.
+    """
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def spool_to_file(stream, block_bytes=DEFAULT_RANGE_MB * 1024 * 1024, directory=None):
+    """
+    Copies the blob trigger's input stream into a temporary file one block at a time,
+    hashing it on the way, so the PDF is parsed from disk rather than from memory.
+
+    Returns:
+        tuple: (path of the temporary file, size in bytes, sha256 hex digest). The caller
+        removes the file.
+    """
+    size = 0
+    digest = hashlib.sha256()
+    handle, path = tempfile.mkstemp(suffix=".pdf", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            while True:
+                data = stream.read(block_bytes)
+                if not data:
+                    break
+                size += len(data)
+                digest.update(data)
+                file.write(data)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, size, digest.hexdigest()
+
+
+def windows_per_batch(file_bytes, num_pages, pages_per_window, budget_mb):
+    """
+    Number of page windows to serialize before their uploads complete, so the estimated
+    memory of a batch fits in what is left of the budget.
+    """
+    window_bytes = max(file_bytes * pages_per_window / max(num_pages, 1) * PARSE_OVERHEAD, MIN_WINDOW_BYTES)
+    available = (budget_mb - rss_mb()) * 1024 * 1024
+    if available <= window_bytes:
+        logging.warning(f"Only {available / (1024 * 1024):.0f} MB of the {budget_mb:.0f} MB budget left; processing one window at a time")
+        return 1
+    return max(1, int(available / window_bytes))
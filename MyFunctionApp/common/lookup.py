@@ -0,0 +1,79 @@
+import logging
+from collections import OrderedDict
+from common import telemetry
+
+# Keeps each filter expression well under the service's filter-size limits.
+MAX_IDS_PER_QUERY = 100
+
+
+def get_documents(backend, doc_ids, select):
+    """
+    Fetches many documents by key with `search.in(id, ...)` filtered queries instead of
+    one get_document call per id, retrieving only the `select` fields.
+
+    Returns:
+        dict: Documents by id. Ids that are not in the index are missing from the result.
+    """
+    select = list(select)
+    if "id" not in select:
+        select.append("id")
+
+    unique_ids = list(dict.fromkeys(doc_ids))
+    documents = {}
+    for start in range(0, len(unique_ids), MAX_IDS_PER_QUERY):
+        batch = unique_ids[start:start + MAX_IDS_PER_QUERY]
+        id_list = ",".join(doc_id.replace("'", "''") for doc_id in batch)
+        with telemetry.span(telemetry.INDEX_QUERY, ids=len(batch)) as span:
+            results = backend.filter(f"search.in(id, '{id_list}', ',')", select=select, top=len(batch))
+            for result in results:
+                documents[result["id"]] = {field: result.get(field) for field in select}
+            span.set(documents=len(results))
+
+    missing = [doc_id for doc_id in unique_ids if doc_id not in documents]
+    if missing:
+        logging.warning(f"{len(missing)} requested documents were not found in the index: {missing}")
+    return documents
+
+
+def group_by_pdf(doc_ids, documents):
+    """
+    Groups documents by their source PDF (the part of `file_name` before '_chunk_').
+
+    Returns:
+        OrderedDict: PDF name -> list of documents, ordered by first appearance in `doc_ids`.
+    """
+    doc_groups = OrderedDict()
+    for doc_id in doc_ids:
+        document = documents.get(doc_id)
+        if document is None:
+            continue
+        pdf_name = document['file_name'].split('_chunk_')[0]
+        doc_groups.setdefault(pdf_name, []).append(document)
+    return doc_groups
+
+
+def distinct_documents(doc_ids, documents):
+    """
+    Drops ids whose document is a near-duplicate (same `canonical_id`) of one listed
+    earlier, so a reissued report does not show up as a second source.
+    """
+    seen = set()
+    distinct = []
+    for doc_id in doc_ids:
+        document = documents.get(doc_id) or {}
+        canonical_id = document.get("canonical_id") or doc_id
+        if canonical_id in seen:
+            continue
+        seen.add(canonical_id)
+        distinct.append(doc_id)
+    return distinct
+
+
+def get_document_groups(backend, doc_ids, select, collapse_near_duplicates=False):
+    select = set(select) | {"file_name"}
+    if collapse_near_duplicates:
+        select.add("canonical_id")
+    documents = get_documents(backend, doc_ids, select)
+    if collapse_near_duplicates:
+        doc_ids = distinct_documents(doc_ids, documents)
+    return group_by_pdf(doc_ids, documents)
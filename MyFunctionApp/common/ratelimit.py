@@ -0,0 +1,320 @@
+import contextvars
+import json
+import logging
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from common.tokens import count_tokens
+
+# Priority classes. Interactive work (knowledge scans, searches) may use the whole
+# quota; batch work (ingestion) leaves a reserve free for it and yields to interactive
+# callers waiting in the same process.
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+DEFAULT_BATCH_RESERVE = 0.2
+# Completion tokens assumed for chat calls that do not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 500
+DEFAULT_STORE_PATH = "/tmp/aoai-rate-limit.sqlite"
+RATE_LIMIT_CONTAINER = "ratelimit"
+# Longest single sleep while waiting, so a waiter notices a refund or a new interactive caller
+MAX_SLEEP = 1.0
+
+_priority = contextvars.ContextVar("aoai_priority", default=BATCH)
+
+
+@contextmanager
+def priority(level):
+    """
+    Runs the enclosed Azure OpenAI calls at the given priority class:
+
+        with ratelimit.priority(ratelimit.INTERACTIVE):
+            summary.generate_prompt(...)
+
+    Calls made outside such a block, including those on worker threads, count as batch work.
+    """
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority():
+    return _priority.get()
+
+
+def estimate_tokens(body):
+    """
+    Tokens a request is expected to count against the TPM quota: its input plus, for
+    chat calls, the completion it may produce.
+    """
+    if "input" in body:
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        return sum(count_tokens(text) for text in inputs)
+    prompt_tokens = sum(count_tokens(message.get("content") or "") + 4 for message in body.get("messages", []))
+    return prompt_tokens + (body.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+
+def _refill(state, now, tpm, rpm):
+    if state is None:
+        return {"tokens": tpm or 0, "requests": rpm or 0, "updated": now, "blocked_until": 0}
+    elapsed = max(0.0, now - state["updated"])
+    if tpm:
+        state["tokens"] = min(tpm, state["tokens"] + elapsed * tpm / 60)
+    if rpm:
+        state["requests"] = min(rpm, state["requests"] + elapsed * rpm / 60)
+    state["updated"] = now
+    return state
+
+
+def take(state, now, tokens, tpm, rpm, reserve=0.0):
+    """
+    Applies one request to a bucket state.
+
+    Returns:
+        tuple: (new state, seconds to wait before trying again; 0 when the request was granted).
+    """
+    state = _refill(state, now, tpm, rpm)
+    if state["blocked_until"] > now:
+        return state, state["blocked_until"] - now
+
+    wait = 0.0
+    costs = []
+    for field, limit, cost in (("tokens", tpm, tokens), ("requests", rpm, 1)):
+        if not limit:
+            continue
+        floor = limit * reserve
+        # A request larger than the bucket would never fit; let it through once the bucket is full
+        cost = min(cost, limit - floor)
+        shortfall = cost + floor - state[field]
+        if shortfall > 0:
+            wait = max(wait, shortfall * 60 / limit)
+        costs.append((field, cost))
+    if wait > 0:
+        return state, wait
+    for field, cost in costs:
+        state[field] -= cost
+    return state, 0.0
+
+
+class MemoryBucketStore:
+    """
+    Bucket state for this process only.
+    """
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def update(self, key, apply):
+        with self._lock:
+            state, result = apply(self._states.get(key))
+            self._states[key] = state
+            return result
+
+
+class SqliteBucketStore:
+    """
+    Bucket state in a SQLite file, shared by every process on the machine that opens
+    the same path (main.py workers, local Functions hosts, tests).
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, state TEXT NOT NULL)")
+
+    def update(self, key, apply):
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so the read-modify-write is atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT state FROM buckets WHERE key = ?", (key,)).fetchone()
+                state, result = apply(json.loads(row[0]) if row else None)
+                self._conn.execute("INSERT OR REPLACE INTO buckets (key, state) VALUES (?, ?)", (key, json.dumps(state)))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return result
+
+
+class BlobBucketStore:
+    """
+    One small JSON blob per bucket, updated with ETag conditions so scaled-out
+    Function App instances share the same quota.
+    """
+
+    def __init__(self, container_client, max_attempts=20):
+        self.container_client = container_client
+        self.max_attempts = max_attempts
+
+    def update(self, key, apply):
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
+
+        blob_name = re.sub(r"[^A-Za-z0-9.-]", "_", key) + ".json"
+        for attempt in range(self.max_attempts):
+            try:
+                downloader = self.container_client.download_blob(blob_name)
+                state, etag = json.loads(downloader.readall()), downloader.properties.etag
+            except ResourceNotFoundError:
+                state, etag = None, None
+            state, result = apply(state)
+            data = json.dumps(state).encode("utf-8")
+            try:
+                if etag is None:
+                    self.container_client.upload_blob(name=blob_name, data=data, overwrite=False)
+                else:
+                    self.container_client.upload_blob(
+                        name=blob_name, data=data, overwrite=True,
+                        etag=etag, match_condition=MatchConditions.IfNotModified
+                    )
+                return result
+            except (ResourceModifiedError, ResourceExistsError):
+                time.sleep(random.uniform(0, 0.05 * (attempt + 1)))
+        raise RuntimeError(f"Could not update rate limit bucket {key} after {self.max_attempts} attempts")
+
+
+class RateLimiter:
+    """
+    Token bucket over the tokens-per-minute and requests-per-minute quota of one
+    deployment, kept in a (possibly shared) bucket store.
+    """
+
+    def __init__(self, store, key, tpm=None, rpm=None, batch_reserve=DEFAULT_BATCH_RESERVE):
+        self.store = store
+        self.key = key
+        self.tpm = tpm
+        self.rpm = rpm
+        self.batch_reserve = batch_reserve
+        self._interactive_waiting = 0
+        self._lock = threading.Lock()
+        self.stats = {"granted": 0, "waits": 0, "wait_seconds": 0.0}
+
+    def acquire(self, tokens, level=None):
+        """
+        Blocks until the bucket can pay for a request of `tokens` estimated tokens.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        level = level or current_priority()
+        reserve = 0.0 if level == INTERACTIVE else self.batch_reserve
+        started = time.monotonic()
+        if level == INTERACTIVE:
+            with self._lock:
+                self._interactive_waiting += 1
+        try:
+            while True:
+                if level != INTERACTIVE and self._interactive_waiting:
+                    wait = MAX_SLEEP / 4
+                else:
+                    now = time.time()
+                    wait = self.store.update(self.key, lambda state: take(state, now, tokens, self.tpm, self.rpm, reserve))
+                if wait <= 0:
+                    break
+                time.sleep(min(wait, MAX_SLEEP) + random.uniform(0, 0.05))
+        finally:
+            if level == INTERACTIVE:
+                with self._lock:
+                    self._interactive_waiting -= 1
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self.stats["granted"] += 1
+            if waited > 0.001:
+                self.stats["waits"] += 1
+                self.stats["wait_seconds"] += waited
+        return waited
+
+    def settle(self, estimated, actual):
+        """
+        Corrects the bucket once the response reports the tokens actually used.
+        """
+        if not self.tpm or actual is None or actual == estimated:
+            return
+
+        def apply(state):
+            state = _refill(state, time.time(), self.tpm, self.rpm)
+            state["tokens"] = min(self.tpm, state["tokens"] + estimated - actual)
+            return state, None
+        self.store.update(self.key, apply)
+
+    def throttled(self, seconds):
+        """
+        Pauses the bucket for every caller sharing it after the service returned 429.
+        """
+        def apply(state):
+            now = time.time()
+            state = _refill(state, now, self.tpm, self.rpm)
+            state["blocked_until"] = max(state["blocked_until"], now + seconds)
+            return state, None
+        self.store.update(self.key, apply)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_bucket_store():
+    """
+    Returns the per-process bucket store selected by AOAI_RATE_LIMIT_STORE: 'memory'
+    (default), 'sqlite' (AOAI_RATE_LIMIT_PATH) or 'blob' (AOAI_RATE_LIMIT_CONTAINER in
+    the secondary storage account, shared across instances).
+    """
+    global _store
+    with _store_lock:
+        if _store is not None:
+            return _store
+
+        backend = os.getenv("AOAI_RATE_LIMIT_STORE", "memory").lower()
+        try:
+            if backend == "blob":
+                from azure.core.exceptions import ResourceExistsError
+                from common import clients
+
+                container_client = clients.get_container_client(os.getenv("AOAI_RATE_LIMIT_CONTAINER", RATE_LIMIT_CONTAINER))
+                try:
+                    container_client.create_container()
+                except ResourceExistsError:
+                    pass
+                _store = BlobBucketStore(container_client)
+            elif backend == "sqlite":
+                _store = SqliteBucketStore(os.getenv("AOAI_RATE_LIMIT_PATH", DEFAULT_STORE_PATH))
+            else:
+                _store = MemoryBucketStore()
+        except Exception as e:
+            logging.warning(f"Could not open '{backend}' rate limit store, limiting this process only: {e}")
+            _store = MemoryBucketStore()
+        return _store
+
+
+def get_rate_limiters(aoai_url):
+    """
+    Builds a limiter per deployment from AOAI_RATE_LIMITS, a JSON object such as
+    {"gpt-4o": {"tpm": 150000, "rpm": 900}, "text-embedding-3-large": {"tpm": 350000}}.
+    Deployments without an entry are not limited.
+    """
+    limits = os.getenv("AOAI_RATE_LIMITS")
+    if not limits:
+        return {}
+    try:
+        limits = json.loads(limits)
+    except ValueError as e:
+        logging.warning(f"Ignoring AOAI_RATE_LIMITS, it is not valid JSON: {e}")
+        return {}
+
+    store = get_bucket_store()
+    batch_reserve = float(os.getenv("AOAI_BATCH_RESERVE", str(DEFAULT_BATCH_RESERVE)))
+    return {
+        deployment: RateLimiter(store, f"{aoai_url.rstrip('/')}/{deployment}", tpm=limit.get("tpm"), rpm=limit.get("rpm"), batch_reserve=batch_reserve)
+        for deployment, limit in limits.items()
+    }
@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Span names used across the functions, so queries over the exported data can rely on them.
+BLOB_READ = "blob_read"
+BLOB_WRITE = "blob_write"
+PDF_PARSE = "pdf_parse"
+EMBEDDING_CALL = "embedding_call"
+CHAT_CALL = "chat_call"
+INDEX_QUERY = "index_query"
+INDEX_UPLOAD = "index_upload"
+COSMOS_WRITE = "cosmos_write"
+DOCX_RENDER = "docx_render"
+
+
+class Span:
+    """
+    One timed step. Attributes set while the span is open (payload bytes, token counts,
+    item counts) are exported with its duration when it closes.
+    """
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.started_at = datetime.now(timezone.utc)
+        self.duration_ms = None
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+
+    def add(self, name, amount):
+        self.attributes[name] = self.attributes.get(name, 0) + (amount or 0)
+
+    def to_dict(self):
+        record = {
+            "name": self.name,
+            "start": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            **self.attributes
+        }
+        if self.error:
+            record["error"] = self.error
+        return record
+
+
+class LogSink:
+    """
+    Writes each span as a JSON log line; the Functions host forwards these to
+    Application Insights as traces.
+    """
+
+    def export(self, span):
+        logging.info(f"span {json.dumps(span.to_dict(), ensure_ascii=False, default=str)}")
+
+
+class JsonSink:
+    """
+    Appends spans to a local JSONL file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(line)
+
+
+class AppInsightsSink:
+    """
+    Exports spans as OpenTelemetry spans through azure-monitor-opentelemetry, to the
+    resource in APPLICATIONINSIGHTS_CONNECTION_STRING.
+    """
+
+    def __init__(self):
+        from azure.monitor.opentelemetry import configure_azure_monitor
+        from opentelemetry import trace
+
+        configure_azure_monitor()
+        self._tracer = trace.get_tracer("gen-ai-accelerator")
+
+    def export(self, span):
+        start_ns = int(span.started_at.timestamp() * 1e9)
+        otel_span = self._tracer.start_span(
+            span.name,
+            start_time=start_ns,
+            attributes={key: value for key, value in span.attributes.items() if isinstance(value, (str, bool, int, float))}
+        )
+        if span.error:
+            otel_span.set_attribute("error", span.error)
+        otel_span.end(end_time=start_ns + int(span.duration_ms * 1e6))
+
+
+class NullSink:
+    def export(self, span):
+        pass
+
+
+_sinks = None
+_sinks_lock = threading.Lock()
+_totals = {}
+_totals_lock = threading.Lock()
+
+
+def get_sinks():
+    """
+    Sinks named in TELEMETRY_SINK (comma-separated): 'log' (default), 'json' (to
+    TELEMETRY_JSON_PATH), 'appinsights' or 'none'.
+    """
+    global _sinks
+    with _sinks_lock:
+        if _sinks is None:
+            sinks = []
+            for name in os.getenv("TELEMETRY_SINK", "log").lower().split(","):
+                name = name.strip()
+                try:
+                    if name == "log":
+                        sinks.append(LogSink())
+                    elif name == "json":
+                        sinks.append(JsonSink(os.getenv("TELEMETRY_JSON_PATH", "/tmp/telemetry.jsonl")))
+                    elif name == "appinsights":
+                        sinks.append(AppInsightsSink())
+                    elif name and name != "none":
+                        logging.warning(f"Unknown telemetry sink '{name}' ignored")
+                except Exception as e:
+                    logging.warning(f"Could not set up telemetry sink '{name}': {e}")
+            _sinks = sinks or [NullSink()]
+        return _sinks
+
+
+def set_sinks(sinks):
+    global _sinks
+    with _sinks_lock:
+        _sinks = list(sinks)
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Times the enclosed block and exports it as a span:
+
+        with telemetry.span(telemetry.BLOB_READ, blob=name) as s:
+            data = blob.read()
+            s.set(bytes=len(data))
+
+    Exceptions are recorded on the span and re-raised.
+    """
+    current = Span(name, attributes)
+    start = time.perf_counter()
+    try:
+        yield current
+    except Exception as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        _record(current)
+        for sink in get_sinks():
+            try:
+                sink.export(current)
+            except Exception as e:
+                logging.warning(f"Telemetry export failed: {e}")
+
+
+def _record(current):
+    with _totals_lock:
+        totals = _totals.setdefault(current.name, {"count": 0, "errors": 0, "duration_ms": 0.0})
+        totals["count"] += 1
+        totals["errors"] += 1 if current.error else 0
+        totals["duration_ms"] += current.duration_ms
+        for key in ("bytes", "prompt_tokens", "completion_tokens", "total_tokens"):
+            if isinstance(current.attributes.get(key), (int, float)):
+                totals[key] = totals.get(key, 0) + current.attributes[key]
+
+
+def totals():
+    """
+    Per-span-name totals (count, errors, duration and the summed bytes/tokens) for this process.
+    """
+    with _totals_lock:
+        return {name: dict(values) for name, values in _totals.items()}
@@ -0,0 +1,46 @@
+import threading
+
+# Rough characters-per-token ratio for English text with cl100k-style tokenizers,
+# used when tiktoken is not installed.
+CHARS_PER_TOKEN = 4
+
+# The encoding is loaded on first use: building it reads (or downloads) the BPE ranks,
+# which would otherwise be paid by every function at cold start.
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                try:
+                    import tiktoken
+                    _encoding = tiktoken.get_encoding("cl100k_base")
+                except ImportError:
+                    _encoding = None
+                _encoding_loaded = True
+    return _encoding
+
+
+def count_tokens(text):
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def truncate_to_tokens(text, max_tokens):
+    """
+    Cuts `text` down to at most `max_tokens` tokens.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+    return text[:max(max_tokens - 1, 0) * CHARS_PER_TOKEN]
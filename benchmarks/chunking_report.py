@@ -0,0 +1,88 @@
+"""
+Compares chunking strategies on a folder of PDFs.
+
+For every strategy it reports how many chunks the corpus produces, how many tokens
+are sent to the embedding and chat models (summary prompts include the prompt
+template), the largest chunk, and how many chunks exceed the embedding input limit.
+
+Usage:
+    python benchmarks/chunking_report.py path/to/pdfs --target-tokens 2000 --overlap-tokens 200
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp"))
+
+import fitz  # noqa: E402  PyMuPDF
+from common import chunking, tokens  # noqa: E402
+
+EMBEDDING_INPUT_LIMIT = 8191
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp", "common", "summary-prompt.txt")
+
+
+def extract_pages(path):
+    with fitz.open(path) as pdf_document:
+        return [page.get_text() for page in pdf_document]
+
+
+def report(corpus, strategies):
+    with open(PROMPT_PATH, "r") as file:
+        prompt_tokens = tokens.count_tokens(file.read())
+
+    documents = [
+        extract_pages(os.path.join(corpus, name))
+        for name in sorted(os.listdir(corpus)) if name.lower().endswith(".pdf")
+    ]
+    source_tokens = sum(tokens.count_tokens(text) for pages in documents for text in pages)
+
+    rows = []
+    for name, params in strategies:
+        chunk_tokens = [
+            tokens.count_tokens(chunk["text"])
+            for pages in documents
+            for chunk in chunking.chunk_pages(pages, name, **params)
+        ]
+        embedding_tokens = sum(chunk_tokens)
+        rows.append({
+            "strategy": name,
+            "params": params,
+            "documents": len(documents),
+            "chunks": len(chunk_tokens),
+            "embedding_tokens": embedding_tokens,
+            "summary_prompt_tokens": embedding_tokens + prompt_tokens * len(chunk_tokens),
+            "tokens_per_source_token": round(embedding_tokens / source_tokens, 3) if source_tokens else 0,
+            "max_chunk_tokens": max(chunk_tokens, default=0),
+            "chunks_over_embedding_limit": sum(1 for n in chunk_tokens if n > EMBEDDING_INPUT_LIMIT),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", help="Folder containing the source PDFs")
+    parser.add_argument("--pages-per-chunk", type=int, default=10)
+    parser.add_argument("--target-tokens", type=int, default=2000)
+    parser.add_argument("--overlap-tokens", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    rows = report(args.corpus, [
+        ("pages", {"pages_per_chunk": args.pages_per_chunk}),
+        ("tokens", {"target_tokens": args.target_tokens, "overlap_tokens": args.overlap_tokens}),
+    ])
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{rows[0]['documents']} PDFs in {args.corpus}")
+    print(f"{'strategy':<10} {'chunks':>8} {'embed tokens':>13} {'summary tokens':>15} {'x source':>9} {'max chunk':>10} {'over limit':>11}")
+    for row in rows:
+        print(f"{row['strategy']:<10} {row['chunks']:>8} {row['embedding_tokens']:>13} {row['summary_prompt_tokens']:>15} "
+              f"{row['tokens_per_source_token']:>9} {row['max_chunk_tokens']:>10} {row['chunks_over_embedding_limit']:>11}")
+
+
+if __name__ == "__main__":
+    main()
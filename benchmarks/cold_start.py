@@ -0,0 +1,106 @@
+"""
+Benchmarks cold-start import time of each function in MyFunctionApp.
+
+Each function module is imported in a fresh interpreter, the way a new Consumption
+plan worker loads it, using the bytecode compiled at deployment; --no-bytecode also
+compiles every module on import. The "(all)" row imports every function into one interpreter, as the Python
+worker does for a function.json app. The packages that took longest to import are
+listed from `python -X importtime`.
+
+Usage:
+    python benchmarks/cold_start.py --runs 5 --top 3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+FUNCTION_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp")
+
+
+def function_names():
+    return sorted(
+        name for name in os.listdir(FUNCTION_APP)
+        if os.path.isfile(os.path.join(FUNCTION_APP, name, "function.json"))
+    )
+
+
+def import_once(modules, bytecode=True):
+    """
+    Imports `modules` in a new interpreter.
+
+    Returns:
+        tuple: (seconds, {top-level package: microseconds spent importing it}) for this run.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        + "; ".join(f"import {module}" for module in modules)
+        + "; print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as pycache:
+        if not bytecode:
+            # An empty cache prefix: nothing precompiled is found and nothing is left behind
+            env["PYTHONPYCACHEPREFIX"] = pycache
+        result = subprocess.run(
+            [sys.executable, "-B", "-X", "importtime", "-c", code],
+            cwd=FUNCTION_APP, env=env, capture_output=True, text=True, check=True
+        )
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        # Self times do not overlap, so summing them per top-level package attributes
+        # each microsecond once; the standard library is left out
+        top = name.split(".")[0]
+        if own.isdigit() and top not in sys.stdlib_module_names and not top.startswith("_"):
+            packages[top] = packages.get(top, 0) + int(own)
+    return float(result.stdout.strip().splitlines()[-1]), packages
+
+
+def measure(modules, runs, bytecode):
+    samples = []
+    packages = {}
+    for _ in range(runs):
+        seconds, packages = import_once(modules, bytecode)
+        samples.append(seconds)
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "heaviest": sorted(packages.items(), key=lambda item: item[1], reverse=True),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per function (median is reported)")
+    parser.add_argument("--top", type=int, default=3, help="Heaviest imports listed per function")
+    parser.add_argument("--no-bytecode", action="store_true", help="Ignore bytecode caches and compile every module")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    names = function_names()
+    bytecode = not args.no_bytecode
+    if bytecode:
+        # Compile once up front, as a deployment would
+        subprocess.run([sys.executable, "-m", "compileall", "-q", FUNCTION_APP], check=False)
+    report = {name: measure([name], args.runs, bytecode) for name in names}
+    report["(all)"] = measure(names, args.runs, bytecode)
+    for row in report.values():
+        row["heaviest"] = [{"module": name, "ms": round(us / 1000, 1)} for name, us in row["heaviest"][:args.top]]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'function':<24}{'p50 (ms)':>10}{'max (ms)':>10}  heaviest imports")
+    for name, row in report.items():
+        heaviest = ", ".join(f"{item['module']} {item['ms']:.0f}ms" for item in row["heaviest"])
+        print(f"{name:<24}{row['p50_ms']:>10.1f}{row['max_ms']:>10.1f}  {heaviest}")
+
+
+if __name__ == "__main__":
+    main()
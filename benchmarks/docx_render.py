@@ -0,0 +1,115 @@
+"""
+Benchmarks GenerateDocx: module import time and knowledge scans rendered per second.
+
+"scratch" is the previous approach: a new Document per scan with the header image
+decoded from base64, saved to /tmp and read back. "template" opens the prebuilt
+template.docx and renders into memory; "pool" renders the same scans as one change-feed
+batch through GenerateDocx.render_scans and its process pool. Import time is measured in fresh interpreters
+without bytecode caches, once for the current module and once for a module that embeds
+the header image as a string literal, as GenerateDocx used to.
+
+Usage:
+    python benchmarks/docx_render.py --scans 50 --imports 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+FUNCTION_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp")
+sys.path.insert(0, FUNCTION_APP)
+
+import GenerateDocx  # noqa: E402
+from GenerateDocx import template  # noqa: E402
+
+
+def sample_scan(sources=8):
+    return {
+        "id": str(uuid.uuid4()),
+        "query": "newcomer settlement outcomes",
+        "general_notes": "Generated based on query: newcomer settlement outcomes.",
+        "keywords": "settlement, employment, language training, housing, health, retention",
+        "overall_summary": "Overall findings across the selected documents. " * 60,
+        "combined_summaries": [
+            {"pdf_name": f"intermediate/report_{i}.pdf", "summary": "Summary of the document. " * 40, "bibliography": f"Author {i}. (2020). Title {i}."}
+            for i in range(1, sources + 1)
+        ],
+    }
+
+
+def render_scratch(scan_data):
+    doc = template.new_document()
+    GenerateDocx.render_knowledge_scan(doc, scan_data)
+    doc_path = os.path.join(tempfile.gettempdir(), f"knowledge_scan_{uuid.uuid4()}.docx")
+    doc.save(doc_path)
+    with open(doc_path, "rb") as file:
+        content = file.read()
+    os.remove(doc_path)
+    return content
+
+
+def render_template(scan_data):
+    content, _ = GenerateDocx.generate_docx_from_knowledge_scan(scan_data)
+    return content
+
+
+def pool_documents_per_second(scans):
+    batch = [dict(sample_scan(), id=str(uuid.uuid4())) for _ in range(scans)]
+    GenerateDocx.render_scans(batch[:2])  # starts the pool
+    start = time.perf_counter()
+    GenerateDocx.render_scans(batch)
+    return scans / (time.perf_counter() - start)
+
+
+def documents_per_second(render, scans):
+    scan_data = sample_scan()
+    render(scan_data)  # warm-up
+    start = time.perf_counter()
+    for _ in range(scans):
+        render(scan_data)
+    return scans / (time.perf_counter() - start)
+
+
+def import_seconds(code, runs, cwd):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-B", "-c", f"import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"],
+            cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return sorted(samples)[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scans", type=int, default=50, help="Knowledge scans rendered per approach")
+    parser.add_argument("--imports", type=int, default=5, help="Fresh interpreters per import measurement (median is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Stand-in for the old module: the same imports plus the header image as a literal
+        with open(template.HEADER_IMAGE_PATH, "r") as file:
+            image_literal = file.read()
+        with open(os.path.join(workdir, "legacy_docx.py"), "w") as file:
+            file.write("import docx\nimport azure.functions\n")
+            file.write(f"def generate():\n    base64_image = \"\"\"{image_literal}\"\"\"\n    return base64_image\n")
+
+        legacy_import = import_seconds("import legacy_docx", args.imports, workdir)
+        current_import = import_seconds(f"import sys; sys.path.insert(0, {FUNCTION_APP!r}); import GenerateDocx", args.imports, workdir)
+
+    scratch_rate = documents_per_second(render_scratch, args.scans)
+    template_rate = documents_per_second(render_template, args.scans)
+    pool_rate = pool_documents_per_second(args.scans)
+
+    print(f"{'':<10}{'import (ms)':>14}{'docs/s':>10}")
+    print(f"{'scratch':<10}{legacy_import * 1000:>14.1f}{scratch_rate:>10.1f}")
+    print(f"{'template':<10}{current_import * 1000:>14.1f}{template_rate:>10.1f}")
+    print(f"{'pool':<10}{'':>14}{pool_rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
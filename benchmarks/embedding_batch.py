@@ -0,0 +1,105 @@
+"""
+Benchmarks batched embedding requests against the per-chunk path.
+
+Starts a local mock of the Azure OpenAI /embeddings endpoint that adds a fixed
+round-trip latency, then embeds the same synthetic chunks with
+`embedding.get_new_embedding` (one request per chunk) and with
+`embedding.get_new_embeddings` (packed batches).
+
+Usage:
+    python benchmarks/embedding_batch.py --chunks 500 --latency-ms 40
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp"))
+
+from common import embedding  # noqa: E402
+
+DIMENSIONS = 1536
+
+
+class MockEmbeddingHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    request_count = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        with MockEmbeddingHandler.lock:
+            MockEmbeddingHandler.request_count += 1
+        time.sleep(self.latency)
+
+        payload = json.dumps({
+            "object": "list",
+            "data": [
+                {"object": "embedding", "index": i, "embedding": [0.001 * (i % 7)] * DIMENSIONS}
+                for i in range(len(inputs))
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0}
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_chunks(count, words_per_chunk):
+    return [" ".join(f"word{(i * 31 + j) % 997}" for j in range(words_per_chunk)) for i in range(count)]
+
+
+def run(label, fn):
+    MockEmbeddingHandler.request_count = 0
+    start = time.perf_counter()
+    chunks_done = fn()
+    elapsed = time.perf_counter() - start
+    requests_made = MockEmbeddingHandler.request_count
+    print(f"{label:<12} {requests_made:>8} {elapsed:>9.2f} {requests_made / elapsed:>12.1f} {chunks_done / elapsed:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=200)
+    parser.add_argument("--words-per-chunk", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--max-inputs", type=int, default=embedding.MAX_BATCH_INPUTS)
+    parser.add_argument("--max-tokens", type=int, default=embedding.MAX_BATCH_TOKENS)
+    args = parser.parse_args()
+
+    MockEmbeddingHandler.latency = args.latency_ms / 1000.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockEmbeddingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    aoai_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    chunks = make_chunks(args.chunks, args.words_per_chunk)
+
+    def per_chunk():
+        for text in chunks:
+            embedding.get_new_embedding(text, aoai_url, "key", "embedding", "2024-02-01")
+        return len(chunks)
+
+    def batched():
+        vectors = embedding.get_new_embeddings(chunks, aoai_url, "key", "embedding", "2024-02-01",
+                                               max_inputs=args.max_inputs, max_tokens=args.max_tokens)
+        assert len(vectors) == len(chunks)
+        return len(vectors)
+
+    print(f"{args.chunks} chunks of {args.words_per_chunk} words, {args.latency_ms:.0f} ms mock latency")
+    print(f"{'path':<12} {'requests':>8} {'seconds':>9} {'requests/s':>12} {'chunks/s':>12}")
+    run("per-chunk", per_chunk)
+    run("batched", batched)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
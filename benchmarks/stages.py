@@ -0,0 +1,247 @@
+"""
+Offline micro-benchmarks for each pipeline stage, on a generated PDF corpus.
+
+Stages:
+- split: ChunkPDFs.split_pdf_into_chunks (page windowing and PDF serialization),
+  uploading to an in-memory container
+- extract: EmbeddingSummaries.read_chunks (PyMuPDF text extraction) on those chunks
+- prompt: GenerateKnowledgeScan prompt assembly (token batching of the summaries,
+  bibliography pairing and the overall summary prompt)
+- bibliography: parsing bibliography replies, in the JSON and the older text format
+- docx: GenerateDocx.generate_docx_from_knowledge_scan
+
+No network access or Azure resources are needed. Every run is appended to a JSONL
+history file with the git commit, so a regression in any stage shows up by comparing
+with the previous entry (--compare), or fails the run (--fail-on-regression).
+
+Usage:
+    python benchmarks/stages.py --pdfs 20 --pages 30 --repeat 5
+    python benchmarks/stages.py --compare --fail-on-regression --threshold 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+import fitz  # PyMuPDF
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "MyFunctionApp"))
+os.environ.setdefault("TELEMETRY_SINK", "none")
+
+import ChunkPDFs  # noqa: E402
+import EmbeddingSummaries  # noqa: E402
+import GenerateDocx  # noqa: E402
+import GenerateKnowledgeScan  # noqa: E402
+from common import bibliography, mapreduce  # noqa: E402
+
+PARAGRAPH = (
+    "Settlement services help newcomers find employment, housing and language training. "
+    "Outcomes vary by region, admission category and the availability of community supports. "
+)
+
+
+class MemoryContainer:
+    """
+    Stands in for a blob ContainerClient; keeps uploaded blobs in a dict.
+    """
+
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_blob(self, name, data, overwrite=False, **kwargs):
+        self.blobs[name] = data.read() if hasattr(data, "read") else data
+
+
+class _Stream:
+    """
+    Stands in for the blob InputStream ChunkPDFs reads from.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+
+def generate_pdf(pages):
+    with fitz.open() as pdf:
+        for page_number in range(pages):
+            page = pdf.new_page()
+            page.insert_textbox(fitz.Rect(50, 50, 550, 800), f"Page {page_number + 1}. " + PARAGRAPH * 12, fontsize=9)
+        return pdf.tobytes()
+
+
+def sample_scan(sources):
+    return {
+        "id": str(uuid.uuid4()),
+        "query": "newcomer settlement outcomes",
+        "general_notes": "Generated based on query: newcomer settlement outcomes.",
+        "keywords": "settlement, employment, language training, housing",
+        "overall_summary": PARAGRAPH * 40,
+        "combined_summaries": [
+            {"pdf_name": f"intermediate/report_{i}.pdf", "summary": PARAGRAPH * 10, "bibliography": f"Author {i}. (2020). Title {i}."}
+            for i in range(1, sources + 1)
+        ],
+    }
+
+
+def bench_split(corpus, window):
+    chunk_blobs = {}
+    for i, pdf_bytes in enumerate(corpus):
+        container = MemoryContainer()
+        ChunkPDFs.split_pdf_into_chunks(_Stream(pdf_bytes), f"report_{i}.pdf", container, window)
+        chunk_blobs.update(container.blobs)
+    return chunk_blobs
+
+
+def bench_extract(chunk_blobs):
+    return [chunk for name, content in chunk_blobs.items() for chunk in EmbeddingSummaries.read_chunks(content, name)]
+
+
+def bench_prompt(summaries, context_tokens):
+    pdf_names = [f"report_{i}.pdf" for i in range(len(summaries))]
+    batches = mapreduce.token_batches(summaries, context_tokens)
+    combined = GenerateKnowledgeScan.combine_with_bibliographies(pdf_names, [" ".join(batch) for batch in batches], pdf_names)
+    return GenerateKnowledgeScan.build_overall_summary_prompt(GenerateKnowledgeScan.referenced_summaries(combined))
+
+
+def bench_bibliography(replies):
+    return [bibliography.parse_bibliography_response(reply) for reply in replies]
+
+
+def bench_docx(scans):
+    return [GenerateDocx.generate_docx_from_knowledge_scan(scan) for scan in scans]
+
+
+def measure(fn, repeat):
+    """
+    Returns the result of the last call and the per-call durations in seconds.
+    """
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, samples
+
+
+def summarize(samples, items):
+    ordered = sorted(samples)
+    mean = sum(ordered) / len(ordered)
+    return {
+        "runs": len(ordered),
+        "items": items,
+        "mean_ms": round(mean * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "items_per_s": round(items / mean, 1) if mean else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last_entry(history_path):
+    if not os.path.exists(history_path):
+        return None
+    entry = None
+    with open(history_path, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+    return entry
+
+
+def regressions(previous, current, threshold):
+    """
+    Stages whose p50 grew by more than `threshold` (a fraction) since the previous entry.
+    """
+    found = {}
+    for stage, result in current["stages"].items():
+        before = previous.get("stages", {}).get(stage)
+        if before and before["p50_ms"] and result["p50_ms"] > before["p50_ms"] * (1 + threshold):
+            found[stage] = round(result["p50_ms"] / before["p50_ms"] - 1, 3)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdfs", type=int, default=10, help="PDFs in the generated corpus")
+    parser.add_argument("--pages", type=int, default=20, help="Pages per PDF")
+    parser.add_argument("--window", type=int, default=10, help="Pages per chunk for the split stage")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per stage")
+    parser.add_argument("--context-tokens", type=int, default=12000, help="Token budget for prompt assembly")
+    parser.add_argument("--history", default=os.path.join(ROOT, "benchmarks", "history.jsonl"), help="JSONL file the results are appended to")
+    parser.add_argument("--compare", action="store_true", help="Compare with the previous entry in the history file")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 if a stage regressed")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown before a stage counts as regressed")
+    args = parser.parse_args()
+
+    corpus = [generate_pdf(args.pages) for _ in range(args.pdfs)]
+    replies = [
+        json.dumps({"title": f"Title {i}", "authors": ["A. Author", "B. Author"], "year": "2021", "institution": "IRCC"})
+        for i in range(50)
+    ] + [f"Author A, Author B (2019). Title {i}. Institution." for i in range(50)]
+    scans = [sample_scan(8) for _ in range(max(1, args.pdfs // 2))]
+
+    stages = {}
+    chunk_blobs, samples = measure(lambda: bench_split(corpus, args.window), args.repeat)
+    stages["split"] = summarize(samples, args.pdfs * args.pages)
+    chunks, samples = measure(lambda: bench_extract(chunk_blobs), args.repeat)
+    stages["extract"] = summarize(samples, len(chunk_blobs))
+    summaries = [text[:2000] for _, _, text in chunks]
+    _, samples = measure(lambda: bench_prompt(summaries, args.context_tokens), args.repeat)
+    stages["prompt"] = summarize(samples, len(summaries))
+    _, samples = measure(lambda: bench_bibliography(replies), args.repeat)
+    stages["bibliography"] = summarize(samples, len(replies))
+    _, samples = measure(lambda: bench_docx(scans), args.repeat)
+    stages["docx"] = summarize(samples, len(scans))
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "corpus": {"pdfs": args.pdfs, "pages": args.pages, "window": args.window, "repeat": args.repeat},
+        "stages": stages,
+    }
+    previous = last_entry(args.history) if args.compare or args.fail_on_regression else None
+    with open(args.history, "a", encoding="utf-8") as file:
+        file.write(json.dumps(entry) + "\n")
+
+    columns = ["items", "mean_ms", "p50_ms", "p95_ms", "items_per_s"]
+    print("".join(f"{column:>14}" for column in ["stage"] + columns + (["vs_prev"] if previous else [])))
+    for stage, result in stages.items():
+        row = [stage] + [result[column] for column in columns]
+        if previous:
+            before = previous.get("stages", {}).get(stage)
+            row.append(f"{result['p50_ms'] / before['p50_ms'] - 1:+.1%}" if before and before["p50_ms"] else "")
+        print("".join(f"{str(value):>14}" for value in row))
+
+    if previous is None:
+        return
+    if previous.get("corpus") != entry["corpus"]:
+        print(f"Previous entry ({previous.get('commit')}) used a different corpus: {previous.get('corpus')}", file=sys.stderr)
+        return
+    regressed = regressions(previous, entry, args.threshold)
+    if regressed:
+        print(f"Regressed against {previous.get('commit')}: " + ", ".join(f"{stage} +{ratio:.0%}" for stage, ratio in regressed.items()), file=sys.stderr)
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Compares the chunk summary tiers: the chat model for every chunk ('llm'), local
+extractive summaries ('extractive'), and the model only for chunks the extractive
+summarizer cannot handle ('hybrid').
+
+Chunks come from a folder of PDFs (cut into page windows as ChunkPDFs does) or, without
+one, from a generated corpus. Model calls go to a local mock of the chat completions
+endpoint that adds a fixed latency, so throughput reflects the round trips without
+spending quota; cost is estimated from the prompt tokens each tier sends and
+--completion-tokens per reply, at the given per-1K-token prices.
+
+Usage:
+    python benchmarks/summary_tiers.py path/to/pdfs --latency-ms 2000 --workers 8
+    python benchmarks/summary_tiers.py --chunks 200
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp"))
+os.environ.setdefault("TELEMETRY_SINK", "none")
+
+from common import cache as aoai_cache, chunking, extractive, tokens  # noqa: E402
+
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp", "common", "summary-prompt.txt")
+SYSTEM_MESSAGE = "You are an advanced AI assistant specialized in producing detailed, comprehensive, and well-structured summaries of academic or informational texts. Your summaries should emulate the style and depth of scholarly abstracts"
+SUBJECTS = ["Settlement services", "Language training", "Employer partnerships", "Community sponsors", "Credential recognition", "Housing supports"]
+FINDINGS = [
+    "improved employment outcomes for recent newcomers", "reduced wait times in larger cities",
+    "increased retention in smaller communities", "had uneven effects across admission categories",
+    "depended on stable provincial funding", "were rated highly by program participants",
+]
+CONTEXTS = [
+    "according to administrative data from 2015 to 2020", "in the regions that were surveyed",
+    "when delivered within the first year after arrival", "compared with the previous program cycle",
+]
+
+
+class MockChatHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    request_count = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with MockChatHandler.lock:
+            MockChatHandler.request_count += 1
+        time.sleep(self.latency)
+
+        payload = json.dumps({
+            "choices": [{"message": {"role": "assistant", "content": "A two sentence summary of the chunk. It is generated by the mock."}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def generated_chunks(count, seed=7):
+    """
+    Report-like chunks: paragraphs of varied sentences, and one chunk in five that is
+    a reference list the extractive summarizer should leave to the model.
+    """
+    rng = random.Random(seed)
+    chunks = []
+    for i in range(count):
+        if i % 5 == 4:
+            chunks.append("\n".join(f"{rng.choice(['Smith', 'Lee', 'Tremblay'])}, J. ({rng.randint(2000, 2023)}). Report {j}. IRCC 4({j}), {j * 3}-{j * 3 + 9}." for j in range(40)))
+            continue
+        paragraphs = [
+            " ".join(f"{rng.choice(SUBJECTS)} {rng.choice(FINDINGS)} {rng.choice(CONTEXTS)}." for _ in range(rng.randint(4, 8)))
+            for _ in range(6)
+        ]
+        chunks.append("\n\n".join(paragraphs))
+    return chunks
+
+
+def pdf_chunks(corpus, pages_per_chunk):
+    import fitz  # PyMuPDF
+
+    chunks = []
+    for name in sorted(os.listdir(corpus)):
+        if name.lower().endswith(".pdf"):
+            with fitz.open(os.path.join(corpus, name)) as pdf_document:
+                pages = [page.get_text() for page in pdf_document]
+            chunks.extend(chunk["text"] for chunk in chunking.chunk_pages(pages, "pages", pages_per_chunk=pages_per_chunk))
+    return chunks
+
+
+def run_tier(tier, chunks, prompt_template, workers, sentences):
+    settings = {"tier": tier, "sentences": sentences, "throttle_fallback": False}
+    cache = aoai_cache.NullCache()
+    before = MockChatHandler.request_count
+
+    def summarize(text):
+        return aoai_cache.tiered_summary(
+            cache, prompt_template, text, SYSTEM_MESSAGE, os.environ["AOAI_KEY"], os.environ["AOAI_URL"], "mock", "2024-02-01", settings
+        )[1]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sources = list(executor.map(summarize, chunks))
+    elapsed = time.perf_counter() - start
+    return sources, elapsed, MockChatHandler.request_count - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", nargs="?", help="Folder of PDFs; a generated corpus is used without one")
+    parser.add_argument("--chunks", type=int, default=100, help="Chunks in the generated corpus")
+    parser.add_argument("--pages-per-chunk", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=1500, help="Simulated chat completion latency")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent summaries, as in main.py")
+    parser.add_argument("--sentences", type=int, default=extractive.DEFAULT_SENTENCES, help="Sentences per extractive summary")
+    parser.add_argument("--completion-tokens", type=int, default=120, help="Assumed tokens per model reply")
+    parser.add_argument("--input-price", type=float, default=0.0025, help="USD per 1K prompt tokens")
+    parser.add_argument("--output-price", type=float, default=0.01, help="USD per 1K completion tokens")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    chunks = pdf_chunks(args.corpus, args.pages_per_chunk) if args.corpus else generated_chunks(args.chunks)
+    with open(PROMPT_PATH, "r") as file:
+        prompt_template = file.read()
+    prompt_tokens = {i: tokens.count_tokens(prompt_template + text) + tokens.count_tokens(SYSTEM_MESSAGE) for i, text in enumerate(chunks)}
+
+    MockChatHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockChatHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["AOAI_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["AOAI_KEY"] = "benchmark"
+
+    rows = []
+    try:
+        for tier in (extractive.LLM, extractive.HYBRID, extractive.EXTRACTIVE):
+            sources, elapsed, calls = run_tier(tier, chunks, prompt_template, args.workers, args.sentences)
+            sent = [i for i, source in enumerate(sources) if source == extractive.LLM]
+            input_tokens = sum(prompt_tokens[i] for i in sent)
+            output_tokens = args.completion_tokens * len(sent)
+            rows.append({
+                "tier": tier,
+                "chunks": len(chunks),
+                "model_calls": calls,
+                "seconds": round(elapsed, 3),
+                "chunks_per_s": round(len(chunks) / elapsed, 1) if elapsed else None,
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "est_cost_usd": round(input_tokens / 1000 * args.input_price + output_tokens / 1000 * args.output_price, 4),
+            })
+    finally:
+        server.shutdown()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{len(chunks)} chunks from {args.corpus or 'the generated corpus'}, {args.latency_ms:.0f} ms per model call, {args.workers} workers")
+    columns = ["model_calls", "seconds", "chunks_per_s", "prompt_tokens", "completion_tokens", "est_cost_usd"]
+    print(f"{'tier':<12}" + "".join(f"{column:>19}" for column in columns))
+    for row in rows:
+        print(f"{row['tier']:<12}" + "".join(f"{str(row[column]):>19}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
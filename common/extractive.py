@@ -0,0 +1,140 @@
+import math
+import os
+import re
+from collections import Counter
+
+# Summary tiers. 'llm' asks the chat model for every chunk; 'extractive' picks the
+# chunk's central sentences locally; 'hybrid' does the latter when the chunk is prose
+# it can summarize and asks the model otherwise (tables, reference lists, OCR noise).
+LLM = "llm"
+EXTRACTIVE = "extractive"
+HYBRID = "hybrid"
+# Source of a summary made locally because Azure OpenAI was throttling, not by choice
+FALLBACK = "fallback"
+
+DEFAULT_SENTENCES = 2
+DAMPING = 0.85
+MIN_SENTENCE_WORDS = 5
+MAX_SENTENCE_WORDS = 80
+# In 'hybrid', chunks with fewer usable sentences, or where they cover less of the
+# text, go to the model
+MIN_SENTENCES = 4
+MIN_COVERAGE = 0.5
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]]*\s+(?=[\"'(\[]?[A-Z0-9])")
+_WORD = re.compile(r"[^\W\d_]{3,}")
+STOP_WORDS = frozenset(
+    "the and for are but not you all any can had her was one our out has have his how its may new now see two who did get "
+    "him let put say she too use that with this from they will would there their what about which when make like than "
+    "then them these some could into also been more other were such only over most very after where while should those "
+    "being both each through during before between under further here does doing same because whom until against".split()
+)
+
+
+def summary_settings():
+    """
+    SUMMARY_TIER: 'llm' (default), 'extractive' or 'hybrid'. SUMMARY_SENTENCES (default
+    2, the length the stock prompt asks for) sentences are kept by the extractive
+    summarizer. SUMMARY_THROTTLE_FALLBACK (default 'false') summarizes extractively
+    when Azure OpenAI is still throttling after its retries, instead of failing the chunk.
+    """
+    return {
+        "tier": os.getenv("SUMMARY_TIER", LLM).lower(),
+        "sentences": int(os.getenv("SUMMARY_SENTENCES", str(DEFAULT_SENTENCES))),
+        "throttle_fallback": os.getenv("SUMMARY_THROTTLE_FALLBACK", "false").lower() == "true",
+    }
+
+
+def split_sentences(text):
+    """
+    Sentences of the text with PDF line breaks and hyphenation undone. Fragments too
+    short or too long to be a sentence (headings, table rows, run-on OCR) are dropped.
+    """
+    text = re.sub(r"-\n(?=[a-z])", "", text)
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = re.sub(r"\s+", " ", paragraph).strip()
+        for sentence in _SENTENCE_END.split(paragraph):
+            words = len(sentence.split())
+            # Mostly words, not numbers, initials or citation fragments
+            prose = len(_WORD.findall(sentence)) >= max(MIN_SENTENCE_WORDS - 1, words * 0.6)
+            if MIN_SENTENCE_WORDS <= words <= MAX_SENTENCE_WORDS and prose and sentence[-1:] in ".!?\"')]":
+                sentences.append(sentence)
+    return sentences
+
+
+def terms(sentence):
+    return [word for word in (match.lower() for match in _WORD.findall(sentence)) if word not in STOP_WORDS]
+
+
+def tfidf_matrix(sentences):
+    """
+    Row-normalized TF-IDF vectors of the sentences, with sublinear term frequencies and
+    sentence-level smoothed IDF.
+
+    Returns:
+        numpy.ndarray: One row per sentence.
+    """
+    import numpy as np
+
+    counts = [Counter(terms(sentence)) for sentence in sentences]
+    vocabulary = {term: i for i, term in enumerate(sorted(set().union(*counts)))}
+    matrix = np.zeros((len(sentences), len(vocabulary)), dtype=np.float32)
+    for row, sentence_counts in enumerate(counts):
+        for term, count in sentence_counts.items():
+            matrix[row, vocabulary[term]] = 1 + math.log(count)
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((1 + len(sentences)) / (1 + document_frequency)) + 1
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def textrank(matrix, damping=DAMPING, iterations=50, tolerance=1e-6):
+    """
+    Centrality of each sentence: PageRank over the cosine-similarity graph of its
+    TF-IDF rows.
+    """
+    import numpy as np
+
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0)
+    totals = similarity.sum(axis=1, keepdims=True)
+    # Sentences sharing no terms with the rest link to every sentence equally
+    transition = np.where(totals > 0, similarity / np.where(totals == 0, 1, totals), 1 / len(matrix))
+    scores = np.full(len(matrix), 1 / len(matrix))
+    for _ in range(iterations):
+        updated = (1 - damping) / len(matrix) + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def coverage(text, sentences):
+    """
+    Share of the text's words that are in usable sentences.
+    """
+    words = len(text.split())
+    return sum(len(sentence.split()) for sentence in sentences) / words if words else 0.0
+
+
+def summarize(text, max_sentences=DEFAULT_SENTENCES):
+    """
+    Extractive summary: the `max_sentences` most central sentences, in document order.
+    Falls back to the leading words of the text when it has no usable sentences.
+    """
+    sentences = split_sentences(text)
+    if len(sentences) <= max_sentences:
+        return " ".join(sentences) if sentences else " ".join(text.split()[:MAX_SENTENCE_WORDS])
+    scores = textrank(tfidf_matrix(sentences))
+    chosen = sorted(sorted(range(len(sentences)), key=lambda i: -scores[i])[:max_sentences])
+    return " ".join(sentences[i] for i in chosen)
+
+
+def is_summarizable(text):
+    """
+    Whether an extractive summary can stand in for the model's: enough sentences, and
+    enough of the text in them.
+    """
+    sentences = split_sentences(text)
+    return len(sentences) >= MIN_SENTENCES and coverage(text, sentences) >= MIN_COVERAGE
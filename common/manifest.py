@@ -0,0 +1,263 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+
+MANIFEST_CONTAINER = "manifests"
+
+# Bumped whenever ingestion starts writing new index fields, so chunks indexed by an
+# older version no longer match their fingerprint and get re-indexed.
+INDEX_SCHEMA_VERSION = 2
+
+
+def content_hash(data):
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def model_settings():
+    settings = {
+        "embedding_model": os.getenv("EMBEDDING_MODEL"),
+        "aoai_version_embedding": os.getenv("AOAI_VERSION_EMBEDDING"),
+        "model": os.getenv("MODEL"),
+        "aoai_version_completion": os.getenv("AOAI_VERSION_COMPLETION"),
+    }
+    # Only recorded when set, so manifests written before it existed still match
+    if os.getenv("EMBEDDING_DIMENSIONS"):
+        settings["embedding_dimensions"] = os.getenv("EMBEDDING_DIMENSIONS")
+    if os.getenv("SUMMARY_TIER", "llm").lower() != "llm":
+        settings["summary_tier"] = os.getenv("SUMMARY_TIER").lower()
+    return settings
+
+
+def ingestion_settings(strategy, params, output_mode):
+    # With the schema version, the models and the chunking, matching settings mean a
+    # chunk recorded in `indexed` has the fingerprint it would get if indexed again
+    return {
+        "chunking": {"strategy": strategy, "params": params, "output_mode": output_mode},
+        "models": model_settings(),
+        "index_schema": INDEX_SCHEMA_VERSION,
+    }
+
+
+def chunk_fingerprint(text, models=None):
+    """
+    Identifies what was indexed for a chunk: its text, the models that embedded and
+    summarized it, and the index schema version.
+    """
+    return content_hash(json.dumps([text, models or model_settings(), INDEX_SCHEMA_VERSION], sort_keys=True))
+
+
+def is_same_source(manifest, source_hash, settings):
+    """
+    Whether the manifest was written for the same PDF content and ingestion settings.
+    """
+    return bool(manifest) and manifest.get("content_hash") == source_hash and manifest.get("settings") == settings
+
+
+def unindexed_chunks(manifest):
+    """
+    Returns {key: file_name} for chunks the manifest lists as emitted that were never
+    recorded as indexed, e.g. because the index rejected them or a model call failed,
+    and for chunks indexed with a fallback summary while the model was throttled.
+    """
+    indexed = (manifest or {}).get("indexed", {})
+    fallback = set((manifest or {}).get("fallback", []))
+    return {
+        key: file_name for key, file_name in (manifest or {}).get("chunks", {}).items()
+        if key not in indexed or key in fallback
+    }
+
+
+def is_unchanged(manifest, source_hash, settings):
+    """
+    Whether the PDF can be skipped: same content and settings as last time, and every
+    chunk emitted then has been indexed.
+    """
+    return is_same_source(manifest, source_hash, settings) and not unindexed_chunks(manifest)
+
+
+def build_manifest(source_name, source_hash, settings, chunks, previous=None):
+    """
+    Manifest for one source PDF.
+
+    `chunks` maps each emitted document key to the chunk's file name. Entries of the
+    previous manifest's `indexed` map (key -> chunk fingerprint, maintained by
+    EmbeddingSummaries) and of its `fallback` keys are carried over for keys that are
+    still emitted.
+    """
+    indexed = (previous or {}).get("indexed", {})
+    manifest = {
+        "source": source_name,
+        "content_hash": source_hash,
+        "settings": settings,
+        "chunks": chunks,
+        "indexed": {key: fingerprint for key, fingerprint in indexed.items() if key in chunks},
+        "updated": datetime.now(timezone.utc).isoformat(),
+    }
+    fallback = [key for key in (previous or {}).get("fallback", []) if key in chunks]
+    if fallback:
+        manifest["fallback"] = fallback
+    return manifest
+
+
+def orphaned_chunks(previous, chunks):
+    """
+    Returns {key: file_name} for chunks the previous manifest recorded that are no longer emitted.
+    """
+    return {key: file_name for key, file_name in (previous or {}).get("chunks", {}).items() if key not in chunks}
+
+
+def delete_documents(backend, keys, batch_size=1000):
+    keys = list(keys)
+    for start in range(0, len(keys), batch_size):
+        backend.delete(keys[start:start + batch_size])
+    return len(keys)
+
+
+class BlobManifestStore:
+    """
+    One JSON blob per source PDF. Updates use ETag conditions so concurrent
+    EmbeddingSummaries invocations for chunks of the same PDF do not lose writes.
+    """
+
+    def __init__(self, container_client):
+        self.container_client = container_client
+
+    def _blob_name(self, source_name):
+        return f"{os.path.basename(source_name)}.json"
+
+    def get(self, source_name):
+        manifest, _ = self._read(source_name)
+        return manifest
+
+    def put(self, source_name, manifest):
+        self.container_client.upload_blob(
+            name=self._blob_name(source_name),
+            data=json.dumps(manifest, ensure_ascii=False).encode("utf-8"),
+            overwrite=True
+        )
+
+    def update(self, source_name, apply, max_attempts=10):
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+        for _ in range(max_attempts):
+            manifest, etag = self._read(source_name)
+            manifest = apply(manifest or {"source": os.path.basename(source_name)})
+            data = json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+            try:
+                if etag is None:
+                    self.container_client.upload_blob(name=self._blob_name(source_name), data=data, overwrite=False)
+                else:
+                    self.container_client.upload_blob(
+                        name=self._blob_name(source_name), data=data, overwrite=True,
+                        etag=etag, match_condition=MatchConditions.IfNotModified
+                    )
+                return manifest
+            except (ResourceModifiedError, ResourceExistsError):
+                continue
+        raise RuntimeError(f"Could not update manifest for {source_name} after {max_attempts} attempts")
+
+    def _read(self, source_name):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            downloader = self.container_client.download_blob(self._blob_name(source_name))
+            return json.loads(downloader.readall()), downloader.properties.etag
+        except ResourceNotFoundError:
+            return None, None
+
+
+class LocalManifestStore:
+    """
+    Manifests as JSON files in a local directory, for main.py runs and tests.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, source_name):
+        return os.path.join(self.directory, f"{os.path.basename(source_name)}.json")
+
+    def get(self, source_name):
+        try:
+            with open(self._path(source_name), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def put(self, source_name, manifest):
+        path = self._path(source_name)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def update(self, source_name, apply):
+        with self._lock:
+            manifest = apply(self.get(source_name) or {"source": os.path.basename(source_name)})
+            self.put(source_name, manifest)
+            return manifest
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_manifest_store(blob_service_client=None):
+    """
+    Returns the worker's manifest store: a local store when MANIFEST_DIR is set,
+    otherwise the blob store in the MANIFEST_CONTAINER container (default 'manifests')
+    of the secondary storage account. The container is created on first use only.
+    """
+    directory = os.getenv("MANIFEST_DIR")
+    if directory:
+        key = ("local", directory)
+    else:
+        from common import clients
+
+        # The worker's shared client, so callers with and without one get the same store
+        blob_service_client = blob_service_client or clients.get_blob_service_client()
+        key = ("blob", os.getenv("MANIFEST_CONTAINER", MANIFEST_CONTAINER), blob_service_client)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = LocalManifestStore(directory) if directory else _create_blob_store(blob_service_client, key[1])
+            _stores[key] = store
+        return store
+
+
+def _create_blob_store(blob_service_client, container_name):
+    from azure.core.exceptions import ResourceExistsError
+
+    container_client = blob_service_client.get_container_client(container_name)
+    try:
+        container_client.create_container()
+    except ResourceExistsError:
+        pass
+    except Exception as e:
+        logging.warning(f"Could not create manifest container: {e}")
+    return BlobManifestStore(container_client)
+
+
+def record_indexed(store, source_name, fingerprints, fallback_keys=()):
+    """
+    Records the fingerprints of chunks that were successfully indexed, and the keys of
+    chunks indexed with a fallback summary, which stay pending until they are indexed
+    with a model summary.
+    """
+    def apply(manifest):
+        manifest.setdefault("indexed", {}).update(fingerprints)
+        fallback = (set(manifest.get("fallback", [])) - set(fingerprints)) | set(fallback_keys)
+        if fallback:
+            manifest["fallback"] = sorted(fallback)
+        else:
+            manifest.pop("fallback", None)
+        return manifest
+
+    return store.update(source_name, apply)
@@ -0,0 +1,67 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from common.tokens import count_tokens, truncate_to_tokens
+
+# Levels after which reduce_texts stops summarizing and truncates instead; with batches
+# of several texts each level shrinks the input geometrically, so this is never reached
+# in practice.
+MAX_LEVELS = 8
+
+
+def token_batches(texts, max_tokens):
+    """
+    Groups consecutive texts into batches of at most `max_tokens` tokens. A text that is
+    larger than the budget on its own forms a batch by itself.
+
+    Returns:
+        list: Lists of texts, in input order.
+    """
+    batches = []
+    batch = []
+    batch_tokens = 0
+    for text in texts:
+        tokens = count_tokens(text)
+        if batch and batch_tokens + tokens > max_tokens:
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def reduce_texts(texts, summarize_batch, max_tokens, max_workers=8, executor=None):
+    """
+    Hierarchical map-reduce: while the texts together exceed `max_tokens`, they are
+    grouped into token-bounded batches, each batch is condensed by
+    `summarize_batch(list_of_texts) -> str` (batches run in parallel), and the results
+    take their place. The number of levels grows with the logarithm of the input size.
+
+    Batches run on `executor` when given, so callers reducing several selections at
+    once share one pool; otherwise on a pool of `max_workers` threads for this call.
+    Must not be called from a task of `executor` itself, which could wait on its own queue.
+
+    Returns:
+        list: Texts, in input order, that together fit in `max_tokens`.
+    """
+    texts = list(texts)
+    level = 0
+    while len(texts) > 1 and sum(count_tokens(text) for text in texts) > max_tokens:
+        if level >= MAX_LEVELS:
+            break
+        level += 1
+        batches = token_batches([truncate_to_tokens(text, max_tokens) for text in texts], max_tokens)
+        logging.info(f"Reducing {len(texts)} summaries in {len(batches)} batches (level {level})")
+        if executor is not None:
+            texts = list(executor.map(summarize_batch, batches))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as level_executor:
+                texts = list(level_executor.map(summarize_batch, batches))
+
+    # A single text, or what remains after MAX_LEVELS, is cut down to the budget
+    per_text = max(max_tokens // max(len(texts), 1), 1)
+    if sum(count_tokens(text) for text in texts) > max_tokens:
+        texts = [truncate_to_tokens(text, per_text) for text in texts]
+    return texts
@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from common import ratelimit, telemetry
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AzureOpenAIError(Exception):
+    def __init__(self, message, status_code=None, body=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = body
+
+
+def parse_duration(value):
+    """
+    Parses the durations Azure OpenAI returns in rate-limit headers, e.g. '20', '1.5s', '250ms' or '1m30s'.
+
+    Returns:
+        float: The duration in seconds, or None if the value cannot be parsed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not parts:
+        return None
+    scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+class AzureOpenAIClient:
+    """
+    Keep-alive HTTP client for one Azure OpenAI endpoint.
+
+    Retries throttled (429) and transient (5xx, connection) failures, honouring the
+    service's retry-after and x-ratelimit-reset-* headers with jittered backoff, and
+    accumulates the `usage` token counts returned by every call.
+
+    Calls to a deployment with a limiter in `rate_limiters` first wait for its token
+    bucket, at the priority set with `ratelimit.priority`; a 429 pauses the bucket for
+    every caller sharing it.
+    """
+
+    def __init__(self, aoai_url, aoai_key, connect_timeout=5.0, read_timeout=120.0,
+                 max_retries=5, backoff_base=1.0, backoff_max=60.0, pool_size=16, rate_limiters=None):
+        self.aoai_url = aoai_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json", "api-key": aoai_key})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self.usage = {"requests": 0, "retries": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        self.rate_limit = {}
+        self.rate_limiters = rate_limiters or {}
+
+    def chat(self, deployment, api_version, messages, **params):
+        body = dict(params, messages=messages)
+        with telemetry.span(telemetry.CHAT_CALL, deployment=deployment) as span:
+            return self.post(f"/openai/deployments/{deployment}/chat/completions?api-version={api_version}", body, span, self.rate_limiters.get(deployment))
+
+    def embeddings(self, deployment, api_version, input, **params):
+        body = dict(params, input=input)
+        with telemetry.span(telemetry.EMBEDDING_CALL, deployment=deployment, inputs=len(input) if isinstance(input, list) else 1) as span:
+            return self.post(f"/openai/deployments/{deployment}/embeddings?api-version={api_version}", body, span, self.rate_limiters.get(deployment))
+
+    def post(self, path, body, span=None, limiter=None):
+        estimated = self._acquire(limiter, body, span)
+        response = self._send(path, body, span, limiter)
+        if span is not None:
+            span.set(response_bytes=len(response.content))
+        result = response.json()
+        self._record_usage(result.get("usage"), span)
+        if limiter is not None:
+            limiter.settle(estimated, (result.get("usage") or {}).get("total_tokens"))
+        return result
+
+    def _acquire(self, limiter, body, span=None):
+        """
+        Waits for the limiter to grant the request's estimated token cost.
+
+        Returns:
+            int: The estimate, to be settled against the reported usage; None without a limiter.
+        """
+        if limiter is None:
+            return None
+        estimated = ratelimit.estimate_tokens(body)
+        waited = limiter.acquire(estimated)
+        if span is not None:
+            span.set(estimated_tokens=estimated, priority=ratelimit.current_priority(), queued_ms=round(waited * 1000, 1))
+        return estimated
+
+    def _send(self, path, body, span=None, limiter=None):
+        url = f"{self.aoai_url}{path}"
+        payload = json.dumps(body).encode("utf-8")
+        if span is not None:
+            span.set(bytes=len(payload))
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(url, data=payload, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise AzureOpenAIError(f"Request to {path} failed after {attempt + 1} attempts: {e}") from e
+                self._sleep_before_retry(attempt, None, f"{type(e).__name__}")
+                attempt += 1
+                continue
+
+            self._record_rate_limit(response)
+            if span is not None:
+                span.set(attempts=attempt + 1, status_code=response.status_code)
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                response.close()
+                if limiter is not None and response.status_code == 429:
+                    limiter.throttled(self.retry_delay(attempt, response))
+                self._sleep_before_retry(attempt, response, f"HTTP {response.status_code}")
+                attempt += 1
+                continue
+
+            if not response.ok:
+                raise AzureOpenAIError(
+                    f"Azure OpenAI returned HTTP {response.status_code} for {path}: {response.text[:500]}",
+                    status_code=response.status_code,
+                    body=response.text
+                )
+            return response
+
+    def usage_totals(self):
+        with self._lock:
+            return dict(self.usage)
+
+    def retry_delay(self, attempt, response):
+        """
+        Seconds to wait before retry number `attempt` (0-based).
+
+        Uses the longest wait the service asked for, if any, otherwise exponential
+        backoff; either way a random jitter spreads out callers throttled together.
+        """
+        hinted = None
+        if response is not None:
+            headers = response.headers
+            retry_after_ms = parse_duration(headers.get("retry-after-ms"))
+            candidates = [
+                retry_after_ms / 1000 if retry_after_ms is not None else None,
+                parse_duration(headers.get("retry-after")),
+                parse_duration(headers.get("x-ratelimit-reset-requests")),
+                parse_duration(headers.get("x-ratelimit-reset-tokens")),
+            ]
+            candidates = [c for c in candidates if c is not None]
+            if candidates:
+                hinted = max(candidates)
+
+        if hinted is not None:
+            return min(self.backoff_max, hinted) + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _sleep_before_retry(self, attempt, response, reason):
+        delay = self.retry_delay(attempt, response)
+        with self._lock:
+            self.usage["retries"] += 1
+        logging.warning(f"Azure OpenAI call throttled or failed ({reason}); retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+        time.sleep(delay)
+
+    def _record_rate_limit(self, response):
+        remaining = {k: v for k, v in response.headers.items() if k.lower().startswith("x-ratelimit-")}
+        with self._lock:
+            self.usage["requests"] += 1
+            if remaining:
+                self.rate_limit = remaining
+
+    def _record_usage(self, usage, span=None):
+        if not usage:
+            return
+        if span is not None:
+            span.set(**{key: usage.get(key) for key in ("prompt_tokens", "completion_tokens", "total_tokens")})
+        with self._lock:
+            for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+                self.usage[key] += usage.get(key, 0) or 0
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(aoai_url, aoai_key):
+    """
+    Returns the shared client for an endpoint, creating it on first use.
+
+    Timeouts and retry limits come from the AOAI_CONNECT_TIMEOUT, AOAI_READ_TIMEOUT
+    and AOAI_MAX_RETRIES environment variables when set, per-deployment quotas from
+    AOAI_RATE_LIMITS (see ratelimit.get_rate_limiters).
+    """
+    key = (aoai_url, aoai_key)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = AzureOpenAIClient(
+                aoai_url,
+                aoai_key,
+                connect_timeout=float(os.getenv("AOAI_CONNECT_TIMEOUT", "5")),
+                read_timeout=float(os.getenv("AOAI_READ_TIMEOUT", "120")),
+                max_retries=int(os.getenv("AOAI_MAX_RETRIES", "5")),
+                rate_limiters=ratelimit.get_rate_limiters(aoai_url)
+            )
+            _clients[key] = client
+        return client
@@ -0,0 +1,620 @@
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter, namedtuple
+
+# numpy is only needed by LocalSearchBackend and is imported when one is created
+np = None
+
+KEY_FIELD = "id"
+VECTOR_FIELD = "vector"
+SEARCHABLE_FIELDS = ("content_text", "summary")
+
+# Same shape as the IndexingResult items SearchClient returns for uploads.
+IndexingResult = namedtuple("IndexingResult", ["key", "succeeded", "status_code", "error_message"])
+
+
+class SearchBackend:
+    """
+    Operations the pipeline needs from a search index. Documents are plain dicts keyed
+    by their "id" field; filters use the OData subset described in compile_filter().
+    """
+
+    def upload(self, documents):
+        """
+        Merges or uploads documents by key.
+
+        Returns:
+            list: One IndexingResult-like item (key, succeeded, status_code, error_message) per document.
+        """
+        raise NotImplementedError
+
+    def delete(self, keys):
+        raise NotImplementedError
+
+    def get(self, key, select=None):
+        """
+        Returns the document with the given key, or None if it is not in the index.
+        """
+        raise NotImplementedError
+
+    def filter(self, filter_expression, select=None, top=None):
+        """
+        Returns the documents matching `filter_expression`, unranked.
+        """
+        raise NotImplementedError
+
+    def query(self, search_text=None, vector=None, top=5, filter_expression=None, select=None):
+        """
+        Text, vector or hybrid query. Each result carries its relevance in "@search.score".
+        """
+        raise NotImplementedError
+
+
+class AzureSearchBackend(SearchBackend):
+    """
+    Azure AI Search through azure-search-documents' SearchClient.
+    """
+
+    def __init__(self, search_client):
+        self.search_client = search_client
+
+    def upload(self, documents):
+        return self.search_client.merge_or_upload_documents(documents=documents)
+
+    def delete(self, keys):
+        return self.search_client.delete_documents(documents=[{KEY_FIELD: key} for key in keys])
+
+    def get(self, key, select=None):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            return self.search_client.get_document(key=key, selected_fields=select)
+        except ResourceNotFoundError:
+            return None
+
+    def filter(self, filter_expression, select=None, top=None):
+        return list(self.search_client.search(search_text="*", filter=filter_expression, select=select, top=top))
+
+    def query(self, search_text=None, vector=None, top=5, filter_expression=None, select=None):
+        vector_queries = None
+        if vector is not None:
+            from azure.search.documents.models import VectorizedQuery
+            vector_queries = [VectorizedQuery(vector=list(vector), k_nearest_neighbors=top, fields=VECTOR_FIELD)]
+        return list(self.search_client.search(
+            search_text=search_text,
+            vector_queries=vector_queries,
+            filter=filter_expression,
+            select=select,
+            top=top
+        ))
+
+
+_CLAUSE = re.compile(
+    r"\s*(?:"
+    r"search\.in\(\s*(?P<in_field>\w+)\s*,\s*'(?P<in_values>(?:[^']|'')*)'\s*(?:,\s*'(?P<in_delimiters>(?:[^']|'')*)'\s*)?\)"
+    r"|(?P<field>\w+)\s+(?P<op>eq|ne)\s+(?P<value>null|true|false|'(?:[^']|'')*'|-?\d+(?:\.\d+)?)"
+    r")\s*"
+)
+
+
+def compile_filter(filter_expression):
+    """
+    Compiles the OData filter subset the pipeline uses into a predicate over documents:
+    `search.in(field, 'a,b', ',')` and `field eq|ne <'string'|number|true|false|null>`
+    clauses, combined with `and`.
+
+    Raises:
+        ValueError: For anything outside that subset.
+    """
+    if not filter_expression:
+        return lambda document: True
+
+    predicates = []
+    position = 0
+    while True:
+        match = _CLAUSE.match(filter_expression, position)
+        if match is None:
+            raise ValueError(f"Unsupported filter expression: {filter_expression!r}")
+        predicates.append(_clause_predicate(match))
+        position = match.end()
+        if position == len(filter_expression):
+            break
+        connective = re.compile(r"and\b", re.IGNORECASE).match(filter_expression, position)
+        if connective is None:
+            raise ValueError(f"Unsupported filter expression: {filter_expression!r}")
+        position = connective.end()
+
+    return lambda document: all(predicate(document) for predicate in predicates)
+
+
+def _clause_predicate(match):
+    if match.group("in_field"):
+        field = match.group("in_field")
+        values = match.group("in_values").replace("''", "'")
+        delimiters = (match.group("in_delimiters") or " ,").replace("''", "'")
+        allowed = {value for value in re.split("|".join(re.escape(d) for d in delimiters), values) if value}
+        return lambda document: document.get(field) in allowed
+
+    field = match.group("field")
+    raw = match.group("value")
+    if raw == "null":
+        value = None
+    elif raw in ("true", "false"):
+        value = raw == "true"
+    elif raw.startswith("'"):
+        value = raw[1:-1].replace("''", "'")
+    else:
+        value = float(raw)
+    if match.group("op") == "eq":
+        return lambda document: document.get(field) == value
+    return lambda document: document.get(field) != value
+
+
+def tokenize(text):
+    return re.findall(r"\w+", (text or "").lower())
+
+
+def _import_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("LocalSearchBackend requires numpy")
+        np = numpy
+
+
+class LocalSearchBackend(SearchBackend):
+    """
+    In-process search engine for offline runs, load tests and as a hot cache.
+
+    Vectors live in a memory-mapped float32 matrix (`vectors.f32`), normalized so a dot
+    product is the cosine similarity the Azure index uses. Documents without their vectors
+    are kept in memory and persisted as an append-only JSONL log (`documents.jsonl`).
+
+    - Vector queries are exact top-k over row blocks with batched NumPy products, or IVF
+      (k-means lists, `nprobe` lists scanned per query) once build_ivf() has been called.
+    - Text queries rank `content_text` and `summary` with BM25 (k1=1.2, b=0.75, as Azure).
+    - Hybrid queries fuse both rankings with Reciprocal Rank Fusion, like Azure AI Search.
+    """
+
+    BLOCK_ROWS = 65536
+    RRF_K = 60
+
+    def __init__(self, directory, dimensions=1536, searchable_fields=SEARCHABLE_FIELDS, nprobe=8):
+        _import_numpy()
+        self.directory = directory
+        self.dimensions = dimensions
+        self.searchable_fields = tuple(searchable_fields)
+        self.nprobe = nprobe
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.documents = {}
+        self.rows = {}
+        self.row_keys = []
+        self.free_rows = []
+        self.matrix = None
+        self.occupied = None
+        self.capacity = 0
+        self.centroids = None
+        self.lists = None
+        self.assignments = None
+
+        self._postings = {}
+        self._lengths = {}
+        self._total_length = 0
+
+        self._vectors_path = os.path.join(directory, "vectors.f32")
+        self._log_path = os.path.join(directory, "documents.jsonl")
+        self._load()
+        self._log = open(self._log_path, "a", encoding="utf-8")
+
+    # Storage
+
+    def _load(self):
+        rows_used = 0
+        if os.path.exists(self._log_path):
+            with open(self._log_path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    key = entry["key"]
+                    if entry.get("deleted"):
+                        self._forget(key)
+                        continue
+                    self._forget(key)
+                    row = entry["row"]
+                    self.documents[key] = entry["document"]
+                    self.rows[key] = row
+                    rows_used = max(rows_used, row + 1)
+                    self._index_text(key, entry["document"])
+
+        self.row_keys = [None] * rows_used
+        for key, row in self.rows.items():
+            self.row_keys[row] = key
+        self.free_rows = [row for row, key in enumerate(self.row_keys) if key is None]
+
+        if os.path.exists(self._vectors_path):
+            self.capacity = os.path.getsize(self._vectors_path) // (4 * self.dimensions)
+        self._ensure_capacity(max(rows_used, 1024))
+
+    def _ensure_capacity(self, rows):
+        if rows <= self.capacity and self.matrix is not None:
+            return
+        capacity = max(rows, self.capacity * 2, 1024)
+        if self.matrix is not None:
+            self.matrix.flush()
+        # Growing the file keeps existing rows; new rows read as zeros
+        with open(self._vectors_path, "ab") as file:
+            file.truncate(capacity * self.dimensions * 4)
+        self.matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimensions))
+        occupied = np.zeros(capacity, dtype=bool)
+        if self.occupied is not None:
+            occupied[:len(self.occupied)] = self.occupied
+        else:
+            occupied[[row for row, key in enumerate(self.row_keys) if key is not None]] = True
+        self.occupied = occupied
+        self.capacity = capacity
+
+    def flush(self):
+        with self._lock:
+            self.matrix.flush()
+            self._log.flush()
+
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._log.close()
+
+    # Writes
+
+    def upload(self, documents):
+        results = []
+        with self._lock:
+            for document in documents:
+                key = document.get(KEY_FIELD)
+                try:
+                    self._upsert(document)
+                    results.append(IndexingResult(key, True, 200, None))
+                except Exception as e:
+                    results.append(IndexingResult(key, False, 400, str(e)))
+            self._log.flush()
+        return results
+
+    def _upsert(self, document):
+        key = document[KEY_FIELD]
+        vector = document.get(VECTOR_FIELD)
+        stored = {name: value for name, value in document.items() if name != VECTOR_FIELD}
+
+        # merge_or_upload semantics: fields not given keep their previous values
+        previous = self.documents.get(key)
+        if previous is not None:
+            stored = dict(previous, **stored)
+            self._unindex_text(key)
+
+        row = self.rows.get(key)
+        if row is None:
+            row = self.free_rows.pop() if self.free_rows else len(self.row_keys)
+            if row == len(self.row_keys):
+                self.row_keys.append(None)
+            self._ensure_capacity(row + 1)
+            self.matrix[row] = 0
+        if vector is not None:
+            vector = np.asarray(vector, dtype=np.float32)
+            if vector.shape != (self.dimensions,):
+                raise ValueError(f"Expected a vector of {self.dimensions} dimensions, got {vector.shape}")
+            norm = np.linalg.norm(vector)
+            self.matrix[row] = vector / norm if norm else vector
+            self._assign_to_list(row)
+
+        self.documents[key] = stored
+        self.rows[key] = row
+        self.row_keys[row] = key
+        self.occupied[row] = True
+        self._index_text(key, stored)
+        self._log.write(json.dumps({"key": key, "row": row, "document": stored}, ensure_ascii=False) + "\n")
+
+    def delete(self, keys):
+        with self._lock:
+            for key in keys:
+                row = self.rows.get(key)
+                if row is None:
+                    continue
+                self._forget(key)
+                self.matrix[row] = 0
+                self.row_keys[row] = None
+                self.occupied[row] = False
+                self.free_rows.append(row)
+                if self.assignments is not None and row < len(self.assignments):
+                    self.assignments[row] = -1
+                    self.lists = None
+                self._log.write(json.dumps({"key": key, "deleted": True}) + "\n")
+            self._log.flush()
+
+    def _forget(self, key):
+        if key in self.documents:
+            self._unindex_text(key)
+            del self.documents[key]
+            self.rows.pop(key, None)
+
+    # Reads
+
+    def get(self, key, select=None):
+        with self._lock:
+            document = self.documents.get(key)
+            if document is None:
+                return None
+            return self._project(key, select)
+
+    def filter(self, filter_expression, select=None, top=None):
+        predicate = compile_filter(filter_expression)
+        with self._lock:
+            keys = [key for key, document in self.documents.items() if predicate(document)]
+            if top is not None:
+                keys = keys[:top]
+            return [self._project(key, select) for key in keys]
+
+    def query(self, search_text=None, vector=None, top=5, filter_expression=None, select=None):
+        predicate = compile_filter(filter_expression)
+        text_query = search_text if search_text and search_text.strip() != "*" else None
+        with self._lock:
+            ranked = []
+            if vector is not None:
+                allowed = None
+                if filter_expression:
+                    allowed = np.array([key is not None and predicate(self.documents[key]) for key in self.row_keys], dtype=bool)
+                rows, similarities = self.vector_search(np.asarray([vector], dtype=np.float32), top, allowed)
+                # Azure reports cosine results as 1 / (1 + cosine distance)
+                ranked.append([(self.row_keys[row], 1.0 / (2.0 - similarity)) for row, similarity in zip(rows[0], similarities[0])])
+            if text_query is not None:
+                # Azure fuses the top 50 text results in hybrid queries
+                ranked.append(self.text_search(text_query, max(top, 50) if vector is not None else top, predicate))
+
+            if not ranked:
+                keys = [key for key, document in self.documents.items() if predicate(document)][:top]
+                return [dict(self._project(key, select), **{"@search.score": 1.0}) for key in keys]
+            if len(ranked) == 1:
+                scored = ranked[0][:top]
+            else:
+                fused = Counter()
+                for results in ranked:
+                    for rank, (key, _) in enumerate(results, 1):
+                        fused[key] += 1.0 / (self.RRF_K + rank)
+                scored = fused.most_common(top)
+            return [dict(self._project(key, select), **{"@search.score": score}) for key, score in scored]
+
+    def _project(self, key, select):
+        document = self.documents[key]
+        if not select:
+            return dict(document)
+        projected = {field: document.get(field) for field in select if field != VECTOR_FIELD}
+        if VECTOR_FIELD in select:
+            projected[VECTOR_FIELD] = self.matrix[self.rows[key]].tolist()
+        return projected
+
+    # Vector search
+
+    def vector_search(self, queries, top, allowed=None):
+        """
+        Top-k rows by cosine similarity for a batch of query vectors (shape m x d).
+
+        Returns:
+            tuple: (rows, similarities), each a list with one list per query, best first.
+        """
+        with self._lock:
+            queries = np.asarray(queries, dtype=np.float32)
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms == 0, 1, norms)
+
+            valid = self.occupied[:len(self.row_keys)].copy()
+            if allowed is not None:
+                valid &= allowed
+            if self.centroids is not None:
+                return self._ivf_search(queries, top, valid)
+            return self._exact_search(queries, top, valid)
+
+    def _exact_search(self, queries, top, valid):
+        count = len(self.row_keys)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, count, self.BLOCK_ROWS):
+            end = min(start + self.BLOCK_ROWS, count)
+            scores = queries @ self.matrix[start:end].T
+            scores[:, ~valid[start:end]] = -np.inf
+            rows = np.broadcast_to(np.arange(start, end), scores.shape)
+            best_rows, best_scores = _merge_top(best_rows, best_scores, rows, scores, top)
+        return _finite_results(best_rows, best_scores)
+
+    def _ivf_search(self, queries, top, valid):
+        if self.lists is None:
+            self._rebuild_lists()
+        probe = min(self.nprobe, len(self.centroids))
+        list_scores = queries @ self.centroids.T
+        probed = np.argpartition(-list_scores, probe - 1, axis=1)[:, :probe]
+
+        all_rows, all_scores = [], []
+        for query, lists in zip(queries, probed):
+            candidates = np.concatenate([self.lists[i] for i in lists]) if len(lists) else np.empty(0, dtype=np.int64)
+            candidates = candidates[valid[candidates]]
+            scores = self.matrix[candidates] @ query
+            rows, scores = _merge_top(np.empty((1, 0), dtype=np.int64), np.empty((1, 0), dtype=np.float32),
+                                      candidates[np.newaxis, :], scores[np.newaxis, :], top)
+            all_rows.append(rows[0])
+            all_scores.append(scores[0])
+        return [list(map(int, rows)) for rows in all_rows], [list(map(float, scores)) for scores in all_scores]
+
+    def build_ivf(self, n_lists, iterations=10, seed=0):
+        """
+        Clusters the stored vectors into `n_lists` inverted lists (spherical k-means) so
+        queries only scan the `nprobe` lists closest to them. Vectors uploaded later are
+        added to their nearest list.
+        """
+        with self._lock:
+            rows = np.array([row for row, key in enumerate(self.row_keys) if key is not None], dtype=np.int64)
+            if len(rows) == 0:
+                return
+            n_lists = min(n_lists, len(rows))
+            rng = np.random.default_rng(seed)
+            centroids = np.array(self.matrix[rng.choice(rows, n_lists, replace=False)])
+            for _ in range(iterations):
+                assignments = _nearest(self.matrix, rows, centroids, self.BLOCK_ROWS)
+                for i in range(n_lists):
+                    members = rows[assignments == i]
+                    if len(members):
+                        centroid = self.matrix[members].sum(axis=0)
+                        norm = np.linalg.norm(centroid)
+                        centroids[i] = centroid / norm if norm else centroid
+            self.centroids = centroids
+            self.assignments = np.full(len(self.row_keys), -1, dtype=np.int64)
+            self.assignments[rows] = _nearest(self.matrix, rows, centroids, self.BLOCK_ROWS)
+            self.lists = None
+            logging.info(f"Built IVF index with {n_lists} lists over {len(rows)} vectors")
+
+    def _assign_to_list(self, row):
+        if self.centroids is None:
+            return
+        if row >= len(self.assignments):
+            self.assignments = np.concatenate([self.assignments, np.full(row + 1 - len(self.assignments), -1, dtype=np.int64)])
+        self.assignments[row] = int(np.argmax(self.centroids @ self.matrix[row]))
+        self.lists = None
+
+    def _rebuild_lists(self):
+        order = np.argsort(self.assignments, kind="stable")
+        sorted_lists = self.assignments[order]
+        self.lists = [order[sorted_lists == i] for i in range(len(self.centroids))]
+
+    # Text search
+
+    def _index_text(self, key, document):
+        terms = Counter(term for field in self.searchable_fields for term in tokenize(document.get(field)))
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[key] = frequency
+        length = sum(terms.values())
+        self._lengths[key] = length
+        self._total_length += length
+
+    def _unindex_text(self, key):
+        document = self.documents.get(key)
+        if document is None or key not in self._lengths:
+            return
+        for term in set(term for field in self.searchable_fields for term in tokenize(document.get(field))):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths.pop(key)
+
+    def text_search(self, search_text, top, predicate=None, k1=1.2, b=0.75):
+        """
+        BM25 ranking of documents for `search_text` over the searchable fields.
+
+        Returns:
+            list: (key, score) pairs, best first.
+        """
+        with self._lock:
+            count = len(self._lengths)
+            if count == 0:
+                return []
+            average_length = self._total_length / count
+            scores = Counter()
+            for term in set(tokenize(search_text)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, frequency in postings.items():
+                    length = self._lengths[key]
+                    scores[key] += idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * length / average_length))
+            ranked = scores.most_common()
+            if predicate is not None:
+                ranked = [(key, score) for key, score in ranked if predicate(self.documents[key])]
+            return ranked[:top]
+
+
+def _merge_top(best_rows, best_scores, rows, scores, top):
+    rows = np.concatenate([best_rows, rows], axis=1)
+    scores = np.concatenate([best_scores, scores], axis=1)
+    if scores.shape[1] > top:
+        keep = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+        rows = np.take_along_axis(rows, keep, axis=1)
+        scores = np.take_along_axis(scores, keep, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return np.take_along_axis(rows, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def _finite_results(rows, scores):
+    results_rows, results_scores = [], []
+    for query_rows, query_scores in zip(rows, scores):
+        finite = np.isfinite(query_scores)
+        results_rows.append([int(row) for row in query_rows[finite]])
+        results_scores.append([float(score) for score in query_scores[finite]])
+    return results_rows, results_scores
+
+
+def _nearest(matrix, rows, centroids, block_rows):
+    assignments = np.empty(len(rows), dtype=np.int64)
+    for start in range(0, len(rows), block_rows):
+        block = rows[start:start + block_rows]
+        assignments[start:start + len(block)] = np.argmax(matrix[block] @ centroids.T, axis=1)
+    return assignments
+
+
+def copy_documents(source, target, filter_expression, select=None, batch_size=1000):
+    """
+    Copies the documents matching `filter_expression` (vectors included, so the source
+    index must return them) from one backend to another, e.g. to warm a local hot cache
+    with a frequently queried subset of the Azure index.
+    """
+    documents = source.filter(filter_expression, select=select)
+    for start in range(0, len(documents), batch_size):
+        target.upload(documents[start:start + batch_size])
+    return len(documents)
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_search_backend():
+    """
+    Returns the backend selected by SEARCH_BACKEND: "azure" (default) for the index named
+    by SEARCH_SERVICE_ENDPOINT, SEARCH_INDEX_NAME and SEARCH_SERVICE_ADMIN_KEY, or
+    "local" for a LocalSearchBackend in SEARCH_LOCAL_DIR. One instance is shared per process.
+    """
+    kind = os.getenv("SEARCH_BACKEND", "azure").lower()
+    with _backends_lock:
+        if kind == "local":
+            directory = os.getenv("SEARCH_LOCAL_DIR", "/tmp/search-index")
+            key = ("local", directory)
+            if key not in _backends:
+                backend = LocalSearchBackend(
+                    directory,
+                    dimensions=int(os.getenv("SEARCH_LOCAL_DIMENSIONS") or os.getenv("EMBEDDING_DIMENSIONS") or "1536"),
+                    nprobe=int(os.getenv("SEARCH_LOCAL_NPROBE", "8"))
+                )
+                ivf_lists = int(os.getenv("SEARCH_LOCAL_IVF_LISTS", "0"))
+                if ivf_lists:
+                    backend.build_ivf(ivf_lists)
+                _backends[key] = backend
+            return _backends[key]
+
+        if kind != "azure":
+            raise ValueError(f"Unknown SEARCH_BACKEND '{kind}'; expected 'azure' or 'local'")
+        endpoint = os.getenv("SEARCH_SERVICE_ENDPOINT")
+        index_name = os.getenv("SEARCH_INDEX_NAME")
+        search_key = os.getenv("SEARCH_SERVICE_ADMIN_KEY")
+        if not all([endpoint, index_name, search_key]):
+            raise ValueError("SEARCH_SERVICE_ENDPOINT, SEARCH_INDEX_NAME and SEARCH_SERVICE_ADMIN_KEY must be set for the Azure search backend.")
+        key = ("azure", endpoint, index_name, search_key)
+        if key not in _backends:
+            from azure.core.credentials import AzureKeyCredential
+            from azure.search.documents import SearchClient
+            _backends[key] = AzureSearchBackend(SearchClient(endpoint=endpoint, index_name=index_name, credential=AzureKeyCredential(search_key)))
+        return _backends[key]
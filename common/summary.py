@@ -1,29 +1,21 @@
-import requests
-import json
-import datetime
-import uuid
-def generate_prompt(prompt, system_message, aoi_key, can_aoai_url, model, aoai_version_completion):
-    
-    # Define the deployment name and base URL for Azure OpenAI service  
-    base_url=f"{can_aoai_url}/openai/deployments/{model}/chat/completions?api-version={aoai_version_completion}"
-    
-    headers = {  
-        "Content-Type": "application/json",  
-        "api-key": aoi_key
-    }
-    body = {
-        "messages": [
-            {
-                "role": "user",
-                "content": prompt
-            },
-    {"role": "system", "content": system_message}
-        ]
-    }
-
-    # Set headers for the HTTP request  
-
-    result = requests.post(url = base_url, headers = headers, json = body)
-    prediction = json.loads(result.text)["choices"][0]["message"]["content"]
+from common.openai_client import AzureOpenAIError, get_client
 
+def generate_prompt(prompt, system_message, aoai_key, aoai_url, model, aoai_version_completion):
+    prediction, _ = generate_prompt_with_usage(prompt, system_message, aoai_key, aoai_url, model, aoai_version_completion)
     return prediction
+
+def generate_prompt_with_usage(prompt, system_message, aoai_key, aoai_url, model, aoai_version_completion):
+    """
+    Same as generate_prompt, but also returns the `usage` block (prompt/completion tokens) of the response.
+    """
+    client = get_client(aoai_url, aoai_key)
+    messages = [
+        {"role": "user", "content": prompt},
+        {"role": "system", "content": system_message}
+    ]
+    result = client.chat(model, aoai_version_completion, messages)
+    try:
+        prediction = result["choices"][0]["message"]["content"]
+    except (KeyError, IndexError) as e:
+        raise AzureOpenAIError(f"Chat completion response has no content: {result}", body=result) from e
+    return prediction, result.get("usage", {})
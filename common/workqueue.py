@@ -0,0 +1,209 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+# Chunk work items from ChunkPDFs to the embedding stage. Failed items go to the
+# "-poison" queue after MAX_DEQUEUE_COUNT deliveries, as the queue trigger does.
+CHUNK_QUEUE = "chunks"
+POISON_SUFFIX = "-poison"
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_VISIBILITY_TIMEOUT = 600
+MAX_DEQUEUE_COUNT = 5
+DEFAULT_QUEUE_PATH = "/tmp/chunk-queue.sqlite"
+
+Message = namedtuple("Message", ["id", "body", "dequeue_count", "receipt"])
+
+
+class StorageWorkQueue:
+    """
+    Work queue on an Azure Storage queue, shared by every instance of the Function App.
+    """
+
+    def __init__(self, queue_client, poison_client):
+        self.queue_client = queue_client
+        self.poison_client = poison_client
+
+    def send(self, body):
+        self.queue_client.send_message(json.dumps(body))
+
+    def receive(self, max_messages, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        if max_messages <= 0:
+            return []
+        messages = self.queue_client.receive_messages(
+            messages_per_page=min(max_messages, 32), visibility_timeout=visibility_timeout, max_messages=max_messages
+        )
+        return [Message(message.id, json.loads(message.content), message.dequeue_count, message.pop_receipt) for message in messages]
+
+    def delete(self, message):
+        self.queue_client.delete_message(message.id, message.receipt)
+
+    def dead_letter(self, message):
+        self.poison_client.send_message(json.dumps(message.body))
+        self.delete(message)
+
+
+class SqliteWorkQueue:
+    """
+    Work queue in a SQLite file with the same visibility-timeout semantics as a Storage
+    queue, for local runs and tests. ':memory:' keeps it in this process only.
+    """
+
+    def __init__(self, path=DEFAULT_QUEUE_PATH, name=CHUNK_QUEUE):
+        self.path = path
+        self.name = name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages (id INTEGER PRIMARY KEY AUTOINCREMENT, queue TEXT NOT NULL, body TEXT NOT NULL, "
+            "visible_at REAL NOT NULL, dequeue_count INTEGER NOT NULL DEFAULT 0, receipt TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS messages_visible ON messages (queue, visible_at)")
+
+    def send(self, body):
+        with self._lock:
+            self._conn.execute("INSERT INTO messages (queue, body, visible_at) VALUES (?, ?, ?)", (self.name, json.dumps(body), time.time()))
+
+    def receive(self, max_messages, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT):
+        if max_messages <= 0:
+            return []
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE, so two consumers never receive the same message
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, body, dequeue_count FROM messages WHERE queue = ? AND visible_at <= ? ORDER BY id LIMIT ?",
+                    (self.name, now, max_messages)
+                ).fetchall()
+                messages = []
+                for message_id, body, dequeue_count in rows:
+                    receipt = uuid.uuid4().hex
+                    self._conn.execute(
+                        "UPDATE messages SET visible_at = ?, dequeue_count = ?, receipt = ? WHERE id = ?",
+                        (now + visibility_timeout, dequeue_count + 1, receipt, message_id)
+                    )
+                    messages.append(Message(message_id, json.loads(body), dequeue_count + 1, receipt))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return messages
+
+    def delete(self, message):
+        with self._lock:
+            self._conn.execute("DELETE FROM messages WHERE id = ? AND receipt = ?", (message.id, message.receipt))
+
+    def dead_letter(self, message):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE messages SET queue = ?, visible_at = ?, receipt = NULL WHERE id = ? AND receipt = ?",
+                (self.name + POISON_SUFFIX, time.time(), message.id, message.receipt)
+            )
+
+    def count(self, poison=False):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE queue = ?", (self.name + POISON_SUFFIX if poison else self.name,)
+            ).fetchone()[0]
+
+
+def settle(work_queue, message, succeeded, max_dequeue_count=MAX_DEQUEUE_COUNT):
+    """
+    Deletes a processed message. A failed one stays hidden until its visibility timeout
+    expires and is retried, or goes to the poison queue after `max_dequeue_count` deliveries.
+    """
+    if succeeded:
+        work_queue.delete(message)
+    elif message.dequeue_count >= max_dequeue_count:
+        logging.error(f"Moving work item {message.body} to the poison queue after {message.dequeue_count} attempts")
+        work_queue.dead_letter(message)
+    else:
+        logging.warning(f"Work item {message.body} failed (attempt {message.dequeue_count}); it will be retried")
+
+
+def drain(work_queue, process_batch, batch_size=DEFAULT_BATCH_SIZE, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT,
+          max_dequeue_count=MAX_DEQUEUE_COUNT, max_seconds=None):
+    """
+    Processes the visible messages in batches until the queue is empty or `max_seconds`
+    have passed. `process_batch` takes a list of message bodies and returns whether each
+    one succeeded.
+
+    Returns:
+        dict: Counts of processed, failed and batches.
+    """
+    started = time.monotonic()
+    stats = {"processed": 0, "failed": 0, "batches": 0}
+    while max_seconds is None or time.monotonic() - started < max_seconds:
+        messages = work_queue.receive(batch_size, visibility_timeout)
+        if not messages:
+            break
+        results = process_batch([message.body for message in messages])
+        for message, succeeded in zip(messages, results):
+            settle(work_queue, message, succeeded, max_dequeue_count)
+            stats["processed" if succeeded else "failed"] += 1
+        stats["batches"] += 1
+    return stats
+
+
+def handoff_mode():
+    """
+    CHUNK_HANDOFF: 'blob' (default) leaves EmbeddingSummaries to its blob trigger,
+    'queue' has ChunkPDFs send a work item per chunk to the chunk queue instead.
+    """
+    return os.getenv("CHUNK_HANDOFF", "blob").lower()
+
+
+def queue_settings():
+    """
+    EMBEDDING_BATCH_SIZE (default 16) work items are embedded and indexed together; a
+    received batch stays hidden from other consumers for EMBEDDING_QUEUE_VISIBILITY_SECONDS
+    (default 600) and an item is poisoned after EMBEDDING_QUEUE_MAX_DEQUEUE (default 5)
+    failed deliveries.
+    """
+    return {
+        "batch_size": int(os.getenv("EMBEDDING_BATCH_SIZE", str(DEFAULT_BATCH_SIZE))),
+        "visibility_timeout": int(os.getenv("EMBEDDING_QUEUE_VISIBILITY_SECONDS", str(DEFAULT_VISIBILITY_TIMEOUT))),
+        "max_dequeue_count": int(os.getenv("EMBEDDING_QUEUE_MAX_DEQUEUE", str(MAX_DEQUEUE_COUNT))),
+    }
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_work_queue():
+    """
+    Returns the per-process chunk queue selected by CHUNK_QUEUE_BACKEND: 'storage'
+    (default, the 'chunks' queue in the secondary storage account), 'sqlite'
+    (CHUNK_QUEUE_PATH) or 'memory'.
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is not None:
+            return _queue
+
+        backend = os.getenv("CHUNK_QUEUE_BACKEND", "storage").lower()
+        if backend == "sqlite":
+            _queue = SqliteWorkQueue(os.getenv("CHUNK_QUEUE_PATH", DEFAULT_QUEUE_PATH))
+        elif backend == "memory":
+            _queue = SqliteWorkQueue(":memory:")
+        else:
+            from azure.core.exceptions import ResourceExistsError
+            from common import clients
+
+            queue_client = clients.get_queue_client(CHUNK_QUEUE)
+            poison_client = clients.get_queue_client(CHUNK_QUEUE + POISON_SUFFIX)
+            for client in (queue_client, poison_client):
+                try:
+                    client.create_queue()
+                except ResourceExistsError:
+                    pass
+            _queue = StorageWorkQueue(queue_client, poison_client)
+        return _queue
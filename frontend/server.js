@@ -50,6 +50,22 @@ app.post('/api/search-documents', async (req, res) => {
   }
 });
 
+// Endpoint to handle server-side query (embedding + hybrid search in one call)
+app.post('/api/search', async (req, res) => {
+  try {
+    const fullUrl = `${process.env.SEARCH_FUNCTION_URL}?code=${process.env.SEARCH_FUNCTION_KEY}`;
+    const response = await axios.post(fullUrl, req.body, {
+      headers: {
+        'Content-Type': 'application/json',
+      },
+    });
+    res.json(response.data);
+  } catch (error) {
+    console.error('Error in /api/search:', error);
+    res.status(500).json({ error: 'Internal Server Error' });
+  }
+});
+
 // Endpoint to handle synthesis API call
 app.post('/api/generate-synthesis', async (req, res) => {
   try {
@@ -66,6 +82,18 @@ app.post('/api/generate-synthesis', async (req, res) => {
   }
 });
 
+// Endpoint polled for the progress of an incremental synthesis
+app.get('/api/knowledge-scan/:id', async (req, res) => {
+  try {
+    const fullUrl = `${process.env.KNOWLEDGE_SCAN_API_URL}?code=${process.env.KNOWLEDGE_SCAN_API_KEY}&id=${encodeURIComponent(req.params.id)}`;
+    const response = await axios.get(fullUrl);
+    res.json(response.data);
+  } catch (error) {
+    console.error('Error in /api/knowledge-scan:', error);
+    res.status(error.response?.status || 500).json({ error: 'Internal Server Error' });
+  }
+});
+
 // Catch-all handler for Angular routing
 app.get('/*', function (req, res) {
   res.sendFile(path.join(__dirname, 'dist', 'frontend', 'browser', 'index.html'));
@@ -142,7 +142,8 @@ export class MainChatComponent {
   
     console.log("testing")
     console.log(this.synthesisResponse)
-    this.isLoading = false
+    // Partial results arrive while the scan is still running
+    this.isLoading = response.status === 'running'
     this.synthesisResponse = response;
     this.showQuerySelection = false;
     this.showQueryResult = true;
@@ -1,7 +1,10 @@
 import { Injectable } from "@angular/core";
 import { HttpClient,HttpHeaders } from "@angular/common/http";
-import { Observable,throwError } from "rxjs";
-import { switchMap, map,tap,catchError } from "rxjs/operators";
+import { Observable,throwError,timer } from "rxjs";
+import { switchMap, exhaustMap, map,tap,takeWhile,catchError } from "rxjs/operators";
+
+// How often a running knowledge scan is polled for new results
+const POLL_INTERVAL_MS = 2000;
 
 @Injectable({
   providedIn: 'root'
@@ -11,9 +14,21 @@ export class GenerateSynthesisService {
   constructor(private http: HttpClient) { }
   
   
+  // Starts an incremental knowledge scan and emits the scan every time it is polled,
+  // so per-document summaries show up before the overall summary is finished
   generateSynthesis(requestBody: any): Observable<any> {
     console.log("API Request Body:", requestBody);
-    return this.http.post<any>('/api/generate-synthesis', requestBody).pipe(
+    return this.http.post<any>('/api/generate-synthesis', { ...requestBody, incremental: true }).pipe(
+      switchMap((scan) => timer(0, POLL_INTERVAL_MS).pipe(
+        exhaustMap(() => this.http.get<any>(`/api/knowledge-scan/${scan.id}`)),
+        takeWhile((response) => response.status === 'running', true)
+      )),
+      map((response) => {
+        if (response.status === 'failed') {
+          throw new Error(response.error);
+        }
+        return response;
+      }),
       tap((response) => {
         console.log("Received synthesis response:", response);
       })
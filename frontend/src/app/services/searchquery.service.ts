@@ -1,7 +1,7 @@
 import { Injectable } from "@angular/core";
 import { HttpClient,HttpHeaders } from "@angular/common/http";
 import { Observable } from "rxjs";
-import { switchMap, map,tap } from "rxjs/operators";
+import { map, tap } from "rxjs/operators";
 
 interface Document {
   id: string;
@@ -31,37 +31,12 @@ export class SearchqueryService {
     }
   }
 
-  // SearchDocument API
+  // SearchDocument API: the search function embeds the query (with a cache) and runs
+  // the hybrid search server-side, so a search is a single round-trip
   searchDocument(query: string): Observable<Document[]> {
-    // Prepare the embedding body
-    const embeddingBody = {
-      input: query,
-    };
-
-    // Call the server endpoint to get embedding
     return this.http
-      .post<any>('/api/get-embedding', embeddingBody)
+      .post<any>('/api/search', { query, top: 5 })
       .pipe(
-        switchMap((embeddingResponse) => {
-          const embeddingVector = embeddingResponse.data[0].embedding;
-
-          // Prepare the search body
-          const searchBody = {
-            search: query,
-            vectorQueries: [
-              {
-                kind: "vector",
-                vector: embeddingVector,
-                k: 5,
-                fields: "vector",
-              },
-            ],
-            select: "file_name,summary,id",
-          };
-
-          // Call the server endpoint to search documents
-          return this.http.post<any>('/api/search-documents', searchBody);
-        }),
         map((searchResponse) => {
           const documents: Document[] = searchResponse.value.map(
             (item: any) => ({
@@ -1,62 +1,339 @@
-from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
-from common import embedding, summary
+"""
+Bulk (backfill) ingestion of chunked PDFs into the search index.
+
+Reads the chunks ChunkPDFs wrote to `intermediate/` (PDF chunks or `.chunks.jsonl`
+text artifacts) from a local folder, embeds and summarizes them through Azure OpenAI
+and uploads them to Azure AI Search.
+
+- Text is extracted in a process pool.
+- Azure OpenAI calls run on a bounded pool of worker threads; index uploads are batched.
+- Every fully indexed file is appended to a checkpoint file, so an interrupted or
+  partly failed run picks up where it stopped when started again. Files with chunks
+  summarized extractively while Azure OpenAI was throttled are checkpointed as
+  'fallback' and ingested again on the next run.
+- Throughput, latency and error counters are printed while the run progresses.
+
+Configuration comes from the same environment variables as the Function App
+(SEARCH_SERVICE_ENDPOINT, SEARCH_SERVICE_ADMIN_KEY, SEARCH_INDEX_NAME, AOAI_URL, AOAI_KEY,
+EMBEDDING_MODEL, AOAI_VERSION_EMBEDDING, MODEL, AOAI_VERSION_COMPLETION). With
+SEARCH_BACKEND=local the documents go to a local index in SEARCH_LOCAL_DIR instead.
+
+Indexes populated before chunk keys were deterministic hold the same chunks under
+random ids; --delete-legacy-documents removes those before ingesting.
+
+Usage:
+    python main.py path/to/intermediate --workers 8 --extract-processes 4
+    python main.py path/to/intermediate --delete-legacy-documents
+"""
+from common import bibliography, cache as aoai_cache, chunking, extractive, indexing, manifest, search_backend
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from itertools import islice
+import argparse
+import json
 import os
+import threading
+import time
 import fitz  # PyMuPDF
 
-# Azure Search and OpenAI details
-search_endpoint = ''
-search_key = ''
-index = ''
-
-# Initialize the Search Client
-search_client = SearchClient(endpoint=search_endpoint, index_name=index, credential=AzureKeyCredential(search_key))
-
-# Azure OpenAI configuration
-aoai_url = ''
-aoai_key = ''
-embedding_model = ''
-aoai_version_embedding = ''
-aoai_version_completion = ''
-model = ''
-
-# Local path to your chunked files
-intermediate_dir = ''
-
-# Iterate through each PDF file in the intermediate directory
-for file_name in os.listdir(intermediate_dir):
-    if file_name.endswith(".pdf"):  # Ensure only PDFs are processed
-        # Read the chunked file
-        file_path = os.path.join(intermediate_dir, file_name)
-        with fitz.open(file_path) as pdf:
-            data = ""
-            for page in pdf:
-                data += page.get_text()
-
-        # Extract chunk number and page range from the file name
-        parts = file_name.split('_')
-        chunk_number = parts[1]
-        page_range = parts[3].split('.')[0]
-
-        # Generate embeddings
-        embedding_vec = embedding.get_new_embedding(data, aoai_url, aoai_key, embedding_model, aoai_version_embedding)
-
-        # Generate summary
-        with open('common/summary-prompt.txt', 'r') as file:
-            prompt_template = file.read()
-
-        prompt = prompt_template + data
-        summary_str = summary.generate_prompt(prompt, "You are an AI assistant that summarizes texts.", aoai_key, aoai_url, model, aoai_version_completion)
-
-        # Create the document for Azure Search
-        document = {
-            "file_name": file_name,
-            "file_name_chunk": f"{chunk_number}_{page_range}",  # Combining chunk number and page range
-            "content_text": data,
-            "summary": summary_str,
-            "vector": embedding_vec['data'][0]['embedding']  # Adjust according to the actual response structure
-        }
-
-        # Upload the document to Azure Search
-        result = search_client.upload_documents(documents=[document])
-        print(f"Uploaded document {file_name} to the search index with result: {result}")
+SUMMARY_SYSTEM_MESSAGE = "You are an AI assistant that summarizes texts."
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common', 'summary-prompt.txt')
+
+
+def extract_chunks(file_path):
+    """
+    Returns (file_name, [(chunk_file_name, file_name_chunk, text), ...], error) for one
+    intermediate file. Runs in a worker process.
+    """
+    file_name = os.path.basename(file_path)
+    try:
+        return file_name, read_chunks(file_path), None
+    except Exception as e:
+        return file_name, None, f"{type(e).__name__}: {e}"
+
+
+def read_chunks(file_path):
+    file_name = os.path.basename(file_path)
+    if file_name.endswith(".jsonl"):
+        with open(file_path, 'rb') as file:
+            chunks = [
+                (chunk['file_name'], chunking.file_name_chunk(chunk['chunk'], chunk['start_page'], chunk['end_page']), chunk['text'])
+                for chunk in chunking.load_text_artifact(file.read())
+            ]
+        return chunks
+
+    with fitz.open(file_path) as pdf:
+        data = "".join(page.get_text() for page in pdf)
+    # Combine the chunk number and page range encoded in the file name
+    parsed = chunking.parse_chunk_name(file_name)
+    if parsed is None:
+        raise ValueError(f"{file_name} is not a chunk name (<source>_chunk_<n>_pages_<start>_to_<end>.pdf)")
+    file_name_chunk = chunking.file_name_chunk(*parsed)
+    return [(file_name, file_name_chunk, data)]
+
+
+class Checkpoint:
+    """
+    Append-only JSONL record of finished files; a file listed as done is skipped on restart.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        if entry.get("status") == "done":
+                            self.done.add(entry["file"])
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, file_name, status, error=None):
+        entry = {"file": file_name, "status": status, "at": datetime.now(timezone.utc).isoformat()}
+        if error:
+            entry["error"] = error
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            if status == "done":
+                self.done.add(file_name)
+
+    def close(self):
+        self._file.close()
+
+
+class Stats:
+    """
+    Thread-safe counters and latency samples, printed periodically by a reporter thread.
+    """
+
+    def __init__(self, total_files):
+        self.total_files = total_files
+        self.started = time.monotonic()
+        self.counters = {"files_done": 0, "files_failed": 0, "chunks": 0, "documents_indexed": 0, "index_failures": 0, "errors": 0}
+        self.latencies = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def timed(self, name, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+    def line(self):
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            counters = dict(self.counters)
+            parts = [
+                f"{counters['files_done'] + counters['files_failed']}/{self.total_files} files",
+                f"{counters['chunks'] / elapsed:.1f} chunks/s",
+                f"{counters['documents_indexed']} indexed",
+                f"{counters['errors']} errors",
+            ]
+            for name, samples in sorted(self.latencies.items()):
+                ordered = sorted(samples)
+                p50 = ordered[len(ordered) // 2]
+                p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+                parts.append(f"{name} p50 {p50 * 1000:.0f}ms p95 {p95 * 1000:.0f}ms")
+        return f"[{elapsed:7.1f}s] " + " | ".join(parts)
+
+
+def report_periodically(stats, interval, stop):
+    while not stop.wait(interval):
+        print(stats.line(), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input_dir", help="Folder with chunk PDFs and/or .chunks.jsonl files")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent Azure OpenAI workers")
+    parser.add_argument("--extract-processes", type=int, default=os.cpu_count() or 1, help="Processes for PDF text extraction")
+    parser.add_argument("--checkpoint", default="ingest-checkpoint.jsonl", help="Checkpoint file used to resume interrupted runs")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="Seconds between progress lines")
+    parser.add_argument("--delete-legacy-documents", action="store_true", help="First delete documents indexed under random (pre-upgrade) keys")
+    args = parser.parse_args()
+
+    backend = search_backend.get_search_backend()
+    if args.delete_legacy_documents:
+        deleted = manifest.delete_documents(backend, indexing.legacy_document_keys(backend))
+        print(f"Deleted {deleted} documents with legacy keys")
+    aoai_url = os.getenv('AOAI_URL')
+    aoai_key = os.getenv('AOAI_KEY')
+    embedding_model = os.getenv('EMBEDDING_MODEL')
+    aoai_version_embedding = os.getenv('AOAI_VERSION_EMBEDDING')
+    model = os.getenv('MODEL')
+    aoai_version_completion = os.getenv('AOAI_VERSION_COMPLETION')
+
+    with open(PROMPT_PATH, 'r') as file:
+        prompt_template = file.read()
+
+    checkpoint = Checkpoint(args.checkpoint)
+    file_names = [
+        name for name in sorted(os.listdir(args.input_dir))
+        if (name.endswith(".pdf") or name.endswith(".jsonl")) and name not in checkpoint.done
+    ]
+    # PDF chunks carry their chunk number and pages in their name; other PDFs are not chunks
+    not_chunks = {name for name in file_names if name.endswith(".pdf") and chunking.parse_chunk_name(name) is None}
+    if not_chunks:
+        print(f"Skipping {len(not_chunks)} PDFs whose names are not chunk names, e.g. {min(not_chunks)}")
+        file_names = [name for name in file_names if name not in not_chunks]
+    print(f"{len(file_names)} files to ingest, {len(checkpoint.done)} already done according to {args.checkpoint}")
+
+    # Chunks already embedded or summarized by an earlier run are served from the cache
+    cache = aoai_cache.get_cache()
+    stats = Stats(len(file_names))
+    # Futures of the files handed to the Azure OpenAI workers, by file name
+    in_flight = {}
+
+    # A file is done once every one of its documents has been indexed
+    pending_keys = {}
+    key_to_file = {}
+    fallback_files = set()
+    pending_lock = threading.Lock()
+
+    def finish(file_name):
+        # Throttle fallback summaries are not final; the next run asks the model again
+        if file_name in fallback_files:
+            checkpoint.record(file_name, "fallback")
+        else:
+            checkpoint.record(file_name, "done")
+        stats.increment("files_done")
+
+    def on_index_result(succeeded, failed):
+        stats.increment("documents_indexed", len(succeeded))
+        stats.increment("index_failures", len(failed))
+        with pending_lock:
+            for key in succeeded:
+                file_name = key_to_file.pop(key, None)
+                if file_name is None:
+                    continue
+                pending_keys[file_name].discard(key)
+                if not pending_keys[file_name]:
+                    del pending_keys[file_name]
+                    finish(file_name)
+            for key, error in failed:
+                file_name = key_to_file.pop(key, None)
+                if file_name is not None and pending_keys.pop(file_name, None) is not None:
+                    checkpoint.record(file_name, "failed", f"indexing {key}: {error}")
+                    stats.increment("files_failed")
+
+    def process_file(writer, file_name, chunks):
+        try:
+            texts = [data for _, _, data in chunks]
+            embedding_vecs = stats.timed("embedding", aoai_cache.cached_embeddings, cache, texts, aoai_url, aoai_key, embedding_model, aoai_version_embedding)
+            # The source PDF's bibliography comes from its first chunk and is stored with it
+            bibliography_fields = {}
+            first_chunk = next((chunk for chunk in chunks if (chunking.parse_chunk_name(chunk[0]) or (None,))[0] == 1), None)
+            if first_chunk is not None:
+                bibliography_entry = stats.timed("bibliography", bibliography.cached_bibliography, cache, first_chunk[2], aoai_key, aoai_url, model, aoai_version_completion)
+                bibliography_fields = bibliography.to_index_fields(bibliography_entry)
+
+            documents = []
+            for (chunk_file_name, file_name_chunk, data), embedding_vec in zip(chunks, embedding_vecs):
+                summary_str, summary_source = stats.timed("summary", aoai_cache.tiered_summary, cache, prompt_template, data, SUMMARY_SYSTEM_MESSAGE, aoai_key, aoai_url, model, aoai_version_completion)
+                if summary_source == extractive.FALLBACK:
+                    with pending_lock:
+                        fallback_files.add(file_name)
+                documents.append({
+                    "id": indexing.document_key(indexing.source_file_name(chunk_file_name), file_name_chunk),
+                    "file_name": chunk_file_name,
+                    "file_name_chunk": file_name_chunk,
+                    "content_text": data,
+                    "summary": summary_str,
+                    "vector": embedding_vec,
+                    "source_file": indexing.source_file_name(chunk_file_name),
+                    **bibliography_fields
+                })
+        except Exception as e:
+            stats.increment("errors")
+            stats.increment("files_failed")
+            checkpoint.record(file_name, "failed", str(e))
+            print(f"Failed to process {file_name}: {e}", flush=True)
+            return
+
+        if not documents:
+            finish(file_name)
+            return
+        with pending_lock:
+            pending_keys[file_name] = {document["id"] for document in documents}
+            for document in documents:
+                key_to_file[document["id"]] = file_name
+        stats.increment("chunks", len(documents))
+        try:
+            for document in documents:
+                writer.add(document)
+        except Exception as e:
+            # A failed upload of the buffered batch; documents of this file that did reach
+            # the index are merged again on the next run
+            with pending_lock:
+                for document in documents:
+                    key_to_file.pop(document["id"], None)
+                failed = pending_keys.pop(file_name, None) is not None
+            if failed:
+                stats.increment("errors")
+                stats.increment("files_failed")
+                checkpoint.record(file_name, "failed", f"indexing: {e}")
+                print(f"Failed to index {file_name}: {e}", flush=True)
+
+    def collect(done):
+        # process_file records its own failures; anything raised here is unexpected
+        for future in done:
+            file_name = in_flight.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                stats.increment("errors")
+                stats.increment("files_failed")
+                checkpoint.record(file_name, "failed", f"{type(e).__name__}: {e}")
+                print(f"Failed to process {file_name}: {e}", flush=True)
+
+    stop_reporting = threading.Event()
+    reporter = threading.Thread(target=report_periodically, args=(stats, args.report_interval, stop_reporting), daemon=True)
+    reporter.start()
+
+    paths = [os.path.join(args.input_dir, name) for name in file_names]
+    try:
+        with indexing.BufferedIndexWriter(backend, on_result=on_index_result) as writer, \
+                ProcessPoolExecutor(max_workers=args.extract_processes) as extractors, \
+                ThreadPoolExecutor(max_workers=args.workers) as workers:
+            # Files are submitted for extraction in a bounded window, so extracted text
+            # does not pile up in memory while the Azure OpenAI workers catch up
+            extraction_window = max(args.workers, args.extract_processes) * 2
+            remaining = iter(paths)
+            extracting = set()
+            while True:
+                for path in islice(remaining, max(extraction_window - len(extracting), 0)):
+                    extracting.add(extractors.submit(extract_chunks, path))
+                if not extracting:
+                    break
+                extracted, extracting = wait(extracting, return_when=FIRST_COMPLETED)
+                for future in extracted:
+                    file_name, chunks, error = future.result()
+                    if error:
+                        stats.increment("errors")
+                        stats.increment("files_failed")
+                        checkpoint.record(file_name, "failed", error)
+                        print(f"Failed to read {file_name}: {error}", flush=True)
+                        continue
+                    # Keep at most two batches of work queued per worker
+                    while len(in_flight) >= args.workers * 2:
+                        collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                    in_flight[workers.submit(process_file, writer, file_name, chunks)] = file_name
+            collect(wait(in_flight).done)
+    finally:
+        stop_reporting.set()
+        checkpoint.close()
+        print(stats.line())
+        print(f"Azure OpenAI cache stats: {cache.report()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Compares a compact search index (quantized and/or reduced-dimension vectors) with the
+full-precision baseline: storage size, vector query latency and recall@k.
+
+Ground truth is an exhaustive (exact) vector query against the baseline index; the
+candidate is queried the normal (HNSW, quantized, rescored) way. Queries are embedded
+once at the baseline's size and, for a candidate with fewer dimensions, shortened the
+way text-embedding-3 models shorten them (truncate, then re-normalize).
+
+--populate copies the baseline's documents into the candidate first, shortening the
+stored vectors the same way, so no re-embedding is needed. This requires the baseline
+to return its vectors (the "full" profile).
+
+Uses SEARCH_SERVICE_ENDPOINT, SEARCH_SERVICE_ADMIN_KEY, AOAI_URL, AOAI_KEY,
+EMBEDDING_MODEL and AOAI_VERSION_EMBEDDING.
+
+Usage:
+    python search/compare_index_profiles.py --baseline ircc-index --candidate ircc-index-compact \
+        --queries queries.txt --top 10 --runs 3
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "MyFunctionApp"))
+
+from azure.core.credentials import AzureKeyCredential  # noqa: E402
+from azure.search.documents import SearchClient  # noqa: E402
+from azure.search.documents.indexes import SearchIndexClient  # noqa: E402
+from azure.search.documents.models import VectorizedQuery  # noqa: E402
+from common import embedding  # noqa: E402
+
+
+def shorten(vector, dimensions):
+    if len(vector) <= dimensions:
+        return vector
+    vector = vector[:dimensions]
+    norm = math.sqrt(sum(value * value for value in vector))
+    return [value / norm for value in vector] if norm else vector
+
+
+def vector_dimensions(index_client, index_name):
+    index = index_client.get_index(index_name)
+    return next(field.vector_search_dimensions for field in index.fields if field.name == "vector")
+
+
+def index_statistics(index_client, index_name):
+    stats = index_client.get_index_statistics(index_name)
+    return {
+        "documents": stats.get("document_count"),
+        "storage_mb": round(stats.get("storage_size", 0) / 1024 / 1024, 2),
+        "vector_index_mb": round((stats.get("vector_index_size") or 0) / 1024 / 1024, 2),
+    }
+
+
+def populate(baseline, candidate, dimensions, batch_size=500):
+    fields = ["id", "file_name", "file_name_chunk", "content_text", "summary", "vector", "source_file",
+              "title", "authors", "publication_year", "institution", "canonical_id"]
+    batch = []
+    copied = 0
+    for document in baseline.search(search_text="*", select=fields):
+        document = {field: document.get(field) for field in fields}
+        if document["vector"] is None:
+            raise ValueError("The baseline index does not return vectors; it must use the full profile.")
+        document["vector"] = shorten(document["vector"], dimensions)
+        batch.append(document)
+        if len(batch) >= batch_size:
+            candidate.merge_or_upload_documents(documents=batch)
+            copied += len(batch)
+            batch = []
+    if batch:
+        candidate.merge_or_upload_documents(documents=batch)
+        copied += len(batch)
+    return copied
+
+
+def run_query(client, vector, top, exhaustive=False):
+    start = time.perf_counter()
+    results = list(client.search(
+        search_text=None,
+        vector_queries=[VectorizedQuery(vector=vector, k_nearest_neighbors=top, fields="vector", exhaustive=exhaustive)],
+        select=["id"],
+        top=top
+    ))
+    return [result["id"] for result in results], time.perf_counter() - start
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", required=True, help="Full-precision index name")
+    parser.add_argument("--candidate", required=True, help="Compact index name")
+    parser.add_argument("--queries", required=True, help="Text file with one query per line")
+    parser.add_argument("--top", type=int, default=10, help="k for recall@k")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per query and index")
+    parser.add_argument("--populate", action="store_true", help="Copy the baseline documents into the candidate first")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    endpoint = os.getenv("SEARCH_SERVICE_ENDPOINT")
+    credential = AzureKeyCredential(os.getenv("SEARCH_SERVICE_ADMIN_KEY"))
+    index_client = SearchIndexClient(endpoint=endpoint, credential=credential)
+    baseline = SearchClient(endpoint=endpoint, index_name=args.baseline, credential=credential)
+    candidate = SearchClient(endpoint=endpoint, index_name=args.candidate, credential=credential)
+    candidate_dimensions = vector_dimensions(index_client, args.candidate)
+
+    if args.populate:
+        print(f"Copied {populate(baseline, candidate, candidate_dimensions)} documents into {args.candidate}", file=sys.stderr)
+
+    with open(args.queries, "r", encoding="utf-8") as file:
+        queries = [line.strip() for line in file if line.strip()]
+    # Native-size vectors for the baseline, regardless of EMBEDDING_DIMENSIONS
+    os.environ.pop("EMBEDDING_DIMENSIONS", None)
+    vectors = embedding.get_new_embeddings(
+        queries, os.getenv("AOAI_URL"), os.getenv("AOAI_KEY"), os.getenv("EMBEDDING_MODEL"), os.getenv("AOAI_VERSION_EMBEDDING")
+    )
+
+    latencies = {"baseline": [], "candidate": []}
+    recalls = []
+    for vector in vectors:
+        expected, _ = run_query(baseline, vector, args.top, exhaustive=True)
+        short_vector = shorten(vector, candidate_dimensions)
+        for _ in range(args.runs):
+            latencies["baseline"].append(run_query(baseline, vector, args.top)[1])
+            found, seconds = run_query(candidate, short_vector, args.top)
+            latencies["candidate"].append(seconds)
+        if expected:
+            recalls.append(len(set(found) & set(expected)) / len(expected))
+
+    report = {}
+    for role, name in (("baseline", args.baseline), ("candidate", args.candidate)):
+        report[role] = dict(
+            index_statistics(index_client, name),
+            index=name,
+            dimensions=vector_dimensions(index_client, name),
+            p50_ms=round(percentile(latencies[role], 0.5) * 1000, 1),
+            p95_ms=round(percentile(latencies[role], 0.95) * 1000, 1),
+        )
+    report["candidate"][f"recall@{args.top}"] = round(sum(recalls) / len(recalls), 4) if recalls else None
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    columns = ["index", "documents", "dimensions", "storage_mb", "vector_index_mb", "p50_ms", "p95_ms", f"recall@{args.top}"]
+    print("".join(f"{column:>18}" for column in ["profile"] + columns))
+    for role, row in report.items():
+        print("".join(f"{str(value):>18}" for value in [role] + [row.get(column, "") for column in columns]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import sys
+import threading
+import types
+
+from common import clients
+
+
+class StubContainer:
+    def __init__(self, database_name, container_name):
+        self.database_name, self.container_name = database_name, container_name
+
+
+class StubDatabase:
+    def __init__(self, database_name):
+        self.database_name = database_name
+
+    def get_container_client(self, container_name):
+        return StubContainer(self.database_name, container_name)
+
+
+class StubCosmosClient:
+    created = 0
+
+    def __init__(self, connection_string):
+        self.connection_string = connection_string
+
+    @classmethod
+    def from_connection_string(cls, connection_string):
+        cls.created += 1
+        return cls(connection_string)
+
+    def get_database_client(self, database_name):
+        return StubDatabase(database_name)
+
+
+def test_get_cosmos_container_is_cached(monkeypatch):
+    cosmos = types.ModuleType("azure.cosmos")
+    cosmos.CosmosClient = StubCosmosClient
+    monkeypatch.setitem(sys.modules, "azure", sys.modules.get("azure") or types.ModuleType("azure"))
+    monkeypatch.setitem(sys.modules, "azure.cosmos", cosmos)
+    monkeypatch.setattr(clients, "_clients", {})
+
+    results = []
+
+    def get_twice():
+        results.append(clients.get_cosmos_container("AccountEndpoint=stub", "db", "items"))
+        results.append(clients.get_cosmos_container("AccountEndpoint=stub", "db", "items"))
+        results.append(clients.get_cosmos_container("AccountEndpoint=stub", "db", "other"))
+
+    # Run in a thread so a deadlock fails the test instead of hanging it
+    thread = threading.Thread(target=get_twice, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive(), "get_cosmos_container deadlocked"
+    assert results[0] is results[1]
+    assert results[2].container_name == "other"
+    assert StubCosmosClient.created == 1